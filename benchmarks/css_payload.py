@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+SnowTelco Dashboard CSS Payload Benchmark
+=========================================
+Measures how many bytes of CSS each rerun sends to the browser, per page.
+
+Every page is rendered headlessly with Streamlit's AppTest twice in the same
+session: the first run is what a presenter sees when opening the app, the
+second is any later rerun (widget change, navigation). For each run the script
+reports the serialized size of all elements and how much of it is CSS
+(``<style>`` blocks in markdown plus the once-per-session stylesheet).
+
+Pass --baseline-root with another checkout (e.g. `git worktree add /tmp/base
+<rev>`) to compare against it.
+
+Usage:
+    python benchmarks/css_payload.py
+    python benchmarks/css_payload.py --baseline-root /tmp/base
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STYLE_RE = re.compile(r"<style[^>]*>.*?</style>", re.S)
+
+
+def walk(node):
+    yield node
+    for child in getattr(node, "children", {}).values():
+        yield from walk(child)
+
+
+def run_payload(at):
+    """Return (total element bytes, CSS bytes) for the last AppTest run."""
+    total = 0
+    css = 0
+    for node in walk(at._tree):
+        proto = getattr(node, "proto", None)
+        if proto is None:
+            continue
+        total += proto.ByteSize()
+        if node.type == "markdown":
+            css += sum(len(block.encode()) for block in STYLE_RE.findall(proto.body))
+        elif node.type == "iframe" and "data-snowtelco-css" in proto.srcdoc:
+            css += len(proto.srcdoc.encode())
+    return total, css
+
+
+def collect(root):
+    """Measure every page of the app checked out at ``root``."""
+    sys.path.insert(0, root)
+    from streamlit.testing.v1 import AppTest
+    from dashboard import registry
+
+    results = {}
+    for page_key in registry.PAGE_RENDERERS:
+        at = AppTest.from_file(os.path.join(root, "demo_dashboard_app.py"), default_timeout=120)
+        at.session_state.selected_page = page_key
+        at.run()
+        first = run_payload(at)
+        at.run()
+        rerun = run_payload(at)
+        results[page_key] = {
+            "first_total": first[0], "first_css": first[1],
+            "rerun_total": rerun[0], "rerun_css": rerun[1],
+        }
+    return results
+
+
+def collect_in_subprocess(root):
+    result = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--collect", root],
+        capture_output=True, text=True, check=False,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def kb(n):
+    return f"{n / 1024:.1f}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--baseline-root", help="Checkout to compare against")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--collect", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.collect:
+        print(json.dumps(collect(args.collect)))
+        return
+
+    current = collect_in_subprocess(REPO_ROOT)
+    baseline = collect_in_subprocess(os.path.abspath(args.baseline_root)) if args.baseline_root else None
+
+    if args.json:
+        print(json.dumps({"current": current, "baseline": baseline}, indent=2))
+        return
+
+    header = f"{'page':<28} {'1st KB':>8} {'1st CSS':>8} {'rerun KB':>9} {'rerun CSS':>10}"
+    if baseline:
+        header += f" {'base rerun CSS':>15} {'saved/rerun':>12}"
+    print(header)
+    totals = {"rerun_css": 0, "base_rerun_css": 0}
+    for page_key, r in current.items():
+        line = (f"{page_key:<28} {kb(r['first_total']):>8} {kb(r['first_css']):>8} "
+                f"{kb(r['rerun_total']):>9} {kb(r['rerun_css']):>10}")
+        totals["rerun_css"] += r["rerun_css"]
+        if baseline and page_key in baseline:
+            base_css = baseline[page_key]["rerun_css"]
+            totals["base_rerun_css"] += base_css
+            line += f" {kb(base_css):>15} {kb(base_css - r['rerun_css']):>12}"
+        print(line)
+    pages = len(current)
+    print(f"\nMean CSS per rerun: {kb(totals['rerun_css'] / pages)} KB", end="")
+    if baseline:
+        print(f" (baseline {kb(totals['base_rerun_css'] / pages)} KB)")
+    else:
+        print()
+
+
+if __name__ == "__main__":
+    main()
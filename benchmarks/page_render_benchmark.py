@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+SnowTelco Dashboard Page Render Benchmark
+=========================================
+Renders every dashboard page headlessly with Streamlit's AppTest and checks
+the results against a stored baseline.
+
+The pages are the sidebar navigation entries (C_SUITE_PAGES, VP_PAGES and
+TOOL_PAGES in dashboard/pages.py). Each page is measured in its own fresh
+interpreter:
+
+- cold:  the first run of main() with selected_page set (app module, page
+         module import, empty caches), as when a presenter opens that page
+- warm:  median of --runs further reruns in the same session
+- elements and delta bytes: element count and serialized protobuf size of a
+         warm run
+- RSS:   peak resident memory of the process after all runs
+
+With a baseline (--baseline, or benchmarks/page_render_baseline.json if it
+exists), a page fails when its cold or warm time exceeds the baseline by more
+than --tolerance (ratio) and --min-delta-ms, or its delta bytes grow by more
+than --bytes-tolerance. The exit status is 1 when any page fails, so the
+script can gate a CI job. Save a baseline on the reference revision with
+--save-baseline.
+
+Usage:
+    python benchmarks/page_render_benchmark.py --save-baseline
+    python benchmarks/page_render_benchmark.py
+    python benchmarks/page_render_benchmark.py --pages 02_CFO_Finance Alert_Center --runs 5
+    python benchmarks/page_render_benchmark.py --baseline /tmp/base.json --tolerance 1.25 --json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(REPO_ROOT, 'demo_dashboard_app.py')
+DEFAULT_BASELINE = os.path.join(REPO_ROOT, 'benchmarks', 'page_render_baseline.json')
+
+# Executed in the child interpreter, one page per process
+CHILD_CODE = r'''
+import json, os, resource, sys, time
+app_path, page, runs, repo_root = sys.argv[1], sys.argv[2], int(sys.argv[3]), sys.argv[4]
+sys.path.insert(0, repo_root)
+from streamlit.testing.v1 import AppTest
+from streamlit.testing.v1.element_tree import Block
+
+def walk(node):
+    yield node
+    for child in getattr(node, "children", {}).values():
+        yield from walk(child)
+
+def measure(at):
+    elements = delta_bytes = 0
+    for node in walk(at._tree):
+        proto = getattr(node, "proto", None)
+        if proto is None:
+            continue
+        delta_bytes += proto.ByteSize()
+        if not isinstance(node, Block):
+            elements += 1
+    return elements, delta_bytes
+
+at = AppTest.from_file(app_path, default_timeout=300)
+at.session_state.selected_page = page
+start = time.perf_counter()
+at.run()
+cold = time.perf_counter() - start
+errors = [e.message for e in at.exception]
+warm = []
+for _ in range(runs):
+    start = time.perf_counter()
+    at.run()
+    warm.append(time.perf_counter() - start)
+    errors += [e.message for e in at.exception]
+elements, delta_bytes = measure(at)
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if sys.platform == "darwin":
+    rss_kb //= 1024
+print(json.dumps({"cold": cold, "warm": warm, "elements": elements, "delta_bytes": delta_bytes,
+                  "rss_kb": rss_kb, "errors": errors}))
+'''
+
+
+def page_keys():
+    sys.path.insert(0, REPO_ROOT)
+    import demo_dashboard_app as app
+
+    return app.C_SUITE_PAGES + app.VP_PAGES + app.TOOL_PAGES
+
+
+def measure_page(page, runs):
+    env = dict(os.environ)
+    env.pop('SNOWTELCO_PROFILE', None)
+    result = subprocess.run(
+        [sys.executable, '-c', CHILD_CODE, APP_PATH, page, str(runs), REPO_ROOT],
+        capture_output=True, text=True, check=False, env=env, cwd=REPO_ROOT,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f'{page} failed:\n{result.stderr}')
+    raw = json.loads(result.stdout.strip().splitlines()[-1])
+    return {
+        'cold_ms': round(raw['cold'] * 1000, 1),
+        'warm_ms': round(statistics.median(raw['warm']) * 1000, 1) if raw['warm'] else None,
+        'elements': raw['elements'],
+        'delta_bytes': raw['delta_bytes'],
+        'rss_mb': round(raw['rss_kb'] / 1024, 1),
+        'errors': raw['errors'],
+    }
+
+
+def find_regressions(current, baseline, tolerance, bytes_tolerance, min_delta_ms):
+    """Return {page: [reasons]} for pages slower or heavier than the baseline allows."""
+    failures = {}
+    for page, result in current.items():
+        reasons = []
+        if result['errors']:
+            reasons.append(f"{len(result['errors'])} exception(s): {result['errors'][0]}")
+        base = baseline.get(page)
+        if base:
+            for metric in ('cold_ms', 'warm_ms'):
+                now, before = result.get(metric), base.get(metric)
+                if now is None or not before:
+                    continue
+                if now > before * tolerance and now - before > min_delta_ms:
+                    reasons.append(f'{metric} {before:.0f} -> {now:.0f} ({now / before:.2f}x)')
+            before = base.get('delta_bytes')
+            if before and result['delta_bytes'] > before * bytes_tolerance:
+                reasons.append(f"delta_bytes {before} -> {result['delta_bytes']} "
+                               f"({result['delta_bytes'] / before:.2f}x)")
+        if reasons:
+            failures[page] = reasons
+    return failures
+
+
+def load_baseline(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)['pages']
+
+
+def save_baseline(path, results, runs):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'python': sys.version.split()[0], 'runs': runs, 'pages': results}, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--pages', nargs='+', help='Page keys to measure (default: every navigation page)')
+    parser.add_argument('--runs', type=int, default=3, help='Warm reruns per page')
+    parser.add_argument('--baseline', help=f'Baseline JSON to compare against (default: {os.path.relpath(DEFAULT_BASELINE, REPO_ROOT)} if present)')
+    parser.add_argument('--save-baseline', nargs='?', const=DEFAULT_BASELINE, help='Write the results as the new baseline')
+    parser.add_argument('--tolerance', type=float, default=1.5, help='Allowed cold/warm time ratio over baseline')
+    parser.add_argument('--bytes-tolerance', type=float, default=1.1, help='Allowed delta bytes ratio over baseline')
+    parser.add_argument('--min-delta-ms', type=float, default=50.0, help='Ignore slowdowns smaller than this')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    pages = args.pages or page_keys()
+    results = {}
+    for page in pages:
+        results[page] = measure_page(page, args.runs)
+        if not args.json:
+            r = results[page]
+            print(f"  {page:<28} cold {r['cold_ms']:>7.0f} ms  warm {r['warm_ms'] or 0:>6.0f} ms  "
+                  f"{r['elements']:>4} elements  {r['delta_bytes'] / 1024:>7.1f} KB  {r['rss_mb']:>6.1f} MB",
+                  flush=True)
+
+    baseline_path = args.baseline or (DEFAULT_BASELINE if os.path.exists(DEFAULT_BASELINE) and not args.save_baseline
+                                      else None)
+    baseline = load_baseline(baseline_path) if baseline_path else {}
+    failures = find_regressions(results, baseline, args.tolerance, args.bytes_tolerance, args.min_delta_ms)
+
+    if args.save_baseline:
+        save_baseline(args.save_baseline, results, args.runs)
+
+    if args.json:
+        print(json.dumps({'pages': results, 'baseline': baseline_path, 'failures': failures}, indent=2))
+    else:
+        cold = [r['cold_ms'] for r in results.values()]
+        warm = [r['warm_ms'] for r in results.values() if r['warm_ms'] is not None]
+        print(f"\n{len(results)} pages: median cold {statistics.median(cold):.0f} ms, "
+              f"median warm {statistics.median(warm) if warm else 0:.0f} ms")
+        if baseline_path:
+            print(f"Compared with {os.path.relpath(baseline_path, REPO_ROOT)}: "
+                  f"{len(failures)} page(s) regressed")
+        elif failures:
+            print(f"{len(failures)} page(s) raised exceptions")
+        for page, reasons in failures.items():
+            print(f"  ✗ {page}: " + '; '.join(reasons))
+        if args.save_baseline:
+            print(f"✓ Baseline saved to {os.path.relpath(args.save_baseline, REPO_ROOT)}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,453 @@
+#!/usr/bin/env python3
+"""
+SnowTelco Dashboard Session Load Benchmark
+==========================================
+Opens N simulated browser sessions against a running demo_dashboard_app.py
+over Streamlit's websocket protocol (/_stcore/stream) and reports rerun
+latency, throughput and server memory as concurrency rises.
+
+Each session connects like a browser tab: it sends the initial rerun, then
+repeats a random presenter action after a think time until the level ends:
+
+- navigate:    pick another page in the sidebar navigation radio
+- search:      type one of the popular sidebar searches, then clear it
+- persona_hub: open the Persona Hub and click one of its persona buttons
+- what_if:     open CFO Finance and move a What-If scenario slider (a
+               fragment rerun)
+
+As in a browser, every rerun carries the session's current widget values,
+values the server sets (e.g. the radio after a Persona Hub click) are taken
+over, and large cacheable messages already received are announced so the
+server sends references instead.
+
+For every session count (1, 10, 25, 50 and 100 by default) the report gives:
+
+- reruns, errors:  completed reruns; failed reruns, exceptions shown by the
+                   app and sessions that could not connect
+- p50/p95/p99:     time from sending a rerun to its script_finished message
+- reruns/s:        completed reruns per second of the level
+- RSS:             server resident memory, peak during the level
+
+Without --url the benchmark starts its own server (`streamlit run`, headless,
+on --port) and stops it at the end; before the first level one session visits
+every page so the levels measure warm caches (--no-warmup to skip). With
+--url, pass --server-pid to get RSS figures.
+
+Requires the websockets package (pip install websockets).
+
+Usage:
+    python benchmarks/session_load_benchmark.py
+    python benchmarks/session_load_benchmark.py --sessions 10 50 100 --duration 120
+    python benchmarks/session_load_benchmark.py --think 0 0 --actions what_if search
+    python benchmarks/session_load_benchmark.py --url http://localhost:8501 --server-pid 12345 --json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.request
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(REPO_ROOT, 'demo_dashboard_app.py')
+sys.path.insert(0, REPO_ROOT)
+
+DEFAULT_SESSIONS = [1, 10, 25, 50, 100]
+DEFAULT_DURATION = 60
+DEFAULT_THINK = [1.0, 3.0]
+DEFAULT_PORT = 8599
+RERUN_TIMEOUT = 120
+SERVER_START_TIMEOUT = 120
+RSS_INTERVAL = 0.5
+
+# Relative weight of each action in a session's random walk
+ACTION_WEIGHTS = {'navigate': 4, 'search': 2, 'persona_hub': 2, 'what_if': 2}
+# The sidebar's "Popular searches"
+SEARCH_TERMS = ['Revenue', 'Churn', 'NPS', 'ARPU', 'Market Share',
+                'Network', '5G', 'SLA', 'Cash Flow', 'Procurement']
+HUB_PAGE = 'Persona_Hub'
+WHAT_IF_PAGE = '02_CFO_Finance'
+NAV_RADIO_KEY = 'nav_unified'
+SEARCH_LABEL = 'Search'
+PERSONA_BUTTON_PREFIX = 'nav_'
+WHAT_IF_SLIDER_PREFIX = 'cfo_whatif_'
+WIDGET_TYPES = ('button', 'radio', 'slider', 'text_input')
+
+
+def page_label(page_key):
+    from dashboard import search
+    from dashboard.pages import PAGES
+    return search.page_label(page_key, PAGES)
+
+
+def widget_key(widget_id):
+    """The user key a widget was created with ($$ID-<hash>-<key>), or 'None'."""
+    return widget_id.rsplit('-', 1)[-1]
+
+
+def server_rss_mb(pid):
+    """Resident memory of ``pid`` in MB, or None when it cannot be read."""
+    if pid is None:
+        return None
+    try:
+        with open(f'/proc/{pid}/status', encoding='utf-8') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    result = subprocess.run(['ps', '-o', 'rss=', '-p', str(pid)], capture_output=True, text=True, check=False)
+    return int(result.stdout) / 1024 if result.stdout.strip() else None
+
+
+class RerunError(Exception):
+    """An action could not find the widget it drives in the session's latest run."""
+
+
+class Session:
+    """One simulated browser tab: a websocket connection plus its widget state."""
+
+    def __init__(self, url, rng, think):
+        self.url = url
+        self.rng = rng
+        self.think = think
+        self.ws = None
+        # widget id -> (element type, proto, fragment id) from the latest run
+        self.widgets = {}
+        # widget id -> WidgetState sent with every rerun
+        self.values = {}
+        self.cached_hashes = set()
+        self.page_script_hash = ''
+        self.samples = []
+
+    async def connect(self):
+        from websockets.asyncio.client import connect
+
+        self.ws = await connect(self.url, subprotocols=['streamlit'], max_size=None, open_timeout=RERUN_TIMEOUT)
+
+    async def close(self):
+        if self.ws is not None:
+            await self.ws.close()
+
+    def _set_value(self, widget_id, **value):
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        self.values[widget_id] = WidgetState(id=widget_id, **value)
+
+    def _take_server_value(self, kind, proto, previous):
+        """Adopt a value the server set on a widget, as the frontend does."""
+        if kind == 'radio' and previous is not None and proto.default != previous.default:
+            # The navigation radio is drawn with the new page as its default after
+            # navigation.go_to (a Persona Hub click) dropped its state
+            self._set_value(proto.id, string_value=proto.options[proto.default])
+        if kind == 'button' or not proto.set_value:
+            return
+        if kind == 'radio':
+            self._set_value(proto.id, string_value=proto.raw_value)
+        elif kind == 'text_input':
+            self._set_value(proto.id, string_value=proto.value)
+        elif kind == 'slider':
+            self._set_value(proto.id, double_array_value={'data': list(proto.value)})
+
+    async def rerun(self, action, fragment_id='', trigger_id=None):
+        """Send one rerun and read the server's messages until it finishes; records the latency."""
+        from streamlit.proto.BackMsg_pb2 import BackMsg
+        from streamlit.proto.ForwardMsg_pb2 import ForwardMsg
+        from streamlit.proto.WidgetStates_pb2 import WidgetState
+
+        back_msg = BackMsg()
+        state = back_msg.rerun_script
+        state.page_script_hash = self.page_script_hash
+        state.fragment_id = fragment_id
+        state.widget_states.widgets.extend(self.values.values())
+        if trigger_id is not None:
+            state.widget_states.widgets.append(WidgetState(id=trigger_id, trigger_value=True))
+        state.cached_message_hashes.extend(self.cached_hashes)
+
+        previous_protos = {widget_id: proto for widget_id, (_, proto, _) in self.widgets.items()}
+        start = time.perf_counter()
+        await self.ws.send(back_msg.SerializeToString())
+        error = None
+        while True:
+            msg = ForwardMsg()
+            msg.ParseFromString(await asyncio.wait_for(self.ws.recv(), RERUN_TIMEOUT))
+            kind = msg.WhichOneof('type')
+            if kind == 'new_session':
+                self.page_script_hash = msg.new_session.page_script_hash
+                if not msg.new_session.fragment_ids_this_run:
+                    self.widgets = {}
+            elif kind == 'delta':
+                if msg.metadata.cacheable:
+                    self.cached_hashes.add(msg.hash)
+                if msg.delta.WhichOneof('type') != 'new_element':
+                    continue
+                element = msg.delta.new_element
+                element_type = element.WhichOneof('type')
+                if element_type in WIDGET_TYPES:
+                    proto = getattr(element, element_type)
+                    self._take_server_value(element_type, proto, previous_protos.get(proto.id))
+                    self.widgets[proto.id] = (element_type, proto, msg.delta.fragment_id)
+                elif element_type == 'exception':
+                    error = f'{element.exception.type}: {element.exception.message}'
+            elif kind == 'script_finished' and msg.script_finished != ForwardMsg.FINISHED_EARLY_FOR_RERUN:
+                # A run that ends early (st.rerun) is followed by the rerun it asked for
+                break
+        if not fragment_id:
+            # The frontend forgets the values of widgets the run did not draw
+            self.values = {key: value for key, value in self.values.items() if key in self.widgets}
+        self.samples.append({'action': action, 'seconds': time.perf_counter() - start, 'error': error})
+
+    def find(self, element_type, key=None, label=None):
+        return [(widget_id, proto, fragment_id)
+                for widget_id, (kind, proto, fragment_id) in self.widgets.items()
+                if kind == element_type
+                and (key is None or widget_key(widget_id).startswith(key))
+                and (label is None or proto.label == label)]
+
+    async def pause(self):
+        await asyncio.sleep(self.rng.uniform(*self.think))
+
+    async def navigate(self, page_key=None):
+        radios = self.find('radio', key=NAV_RADIO_KEY)
+        if not radios:
+            raise RerunError('navigation radio not found')
+        radio_id, proto, _ = radios[0]
+        options = list(proto.options)
+        label = page_label(page_key) if page_key else self.rng.choice(options)
+        if label not in options:
+            raise RerunError(f'{label!r} is not in the navigation')
+        current = self.values.get(radio_id)
+        if current is not None and current.string_value == label:
+            return
+        self._set_value(radio_id, string_value=label)
+        await self.rerun('navigate')
+
+    async def search(self):
+        inputs = self.find('text_input', label=SEARCH_LABEL)
+        if not inputs:
+            raise RerunError('sidebar search not found')
+        input_id = inputs[0][0]
+        self._set_value(input_id, string_value=self.rng.choice(SEARCH_TERMS))
+        await self.rerun('search')
+        await self.pause()
+        self._set_value(input_id, string_value='')
+        await self.rerun('search')
+
+    async def persona_hub(self):
+        await self.navigate(HUB_PAGE)
+        buttons = self.find('button', key=PERSONA_BUTTON_PREFIX)
+        if not buttons:
+            raise RerunError('no persona buttons on the Persona Hub')
+        await self.pause()
+        await self.rerun('persona_hub', trigger_id=self.rng.choice(buttons)[0])
+
+    async def what_if(self):
+        await self.navigate(WHAT_IF_PAGE)
+        sliders = self.find('slider', key=WHAT_IF_SLIDER_PREFIX)
+        if not sliders:
+            raise RerunError('no What-If sliders on the CFO page')
+        slider_id, proto, fragment_id = self.rng.choice(sliders)
+        steps = round((proto.max - proto.min) / proto.step)
+        value = proto.min + self.rng.randint(0, steps) * proto.step
+        self._set_value(slider_id, double_array_value={'data': [round(value, 6)]})
+        await self.rerun('what_if', fragment_id=fragment_id)
+
+
+async def run_session(session, start_delay, deadline, actions):
+    await asyncio.sleep(start_delay)
+    try:
+        await session.connect()
+        await session.rerun('load')
+        while time.monotonic() < deadline:
+            await session.pause()
+            if time.monotonic() >= deadline:
+                break
+            action = session.rng.choices(actions, weights=[ACTION_WEIGHTS[a] for a in actions])[0]
+            try:
+                await getattr(session, action)()
+            except RerunError as exc:  # the widget was not drawn this run; try another action
+                session.samples.append({'action': action, 'seconds': None, 'error': f'RerunError: {exc}'})
+    except Exception as exc:  # a dropped session counts as an error, the others keep going
+        session.samples.append({'action': 'session', 'seconds': None, 'error': f'{type(exc).__name__}: {exc}'})
+    finally:
+        await session.close()
+
+
+async def sample_rss(pid, samples, stop):
+    while not stop.is_set():
+        rss = server_rss_mb(pid)
+        if rss is not None:
+            samples.append(rss)
+        try:
+            await asyncio.wait_for(stop.wait(), RSS_INTERVAL)
+        except asyncio.TimeoutError:
+            pass
+
+
+def percentiles(values):
+    if not values:
+        return {'p50_ms': None, 'p95_ms': None, 'p99_ms': None}
+    if len(values) == 1:
+        cuts = values * 99
+    else:
+        cuts = statistics.quantiles(values, n=100, method='inclusive')
+    return {'p50_ms': round(cuts[49] * 1000, 1), 'p95_ms': round(cuts[94] * 1000, 1),
+            'p99_ms': round(cuts[98] * 1000, 1)}
+
+
+async def run_level(url, sessions, duration, think, ramp, actions, seed, pid):
+    """Run ``sessions`` concurrent sessions for ramp + duration seconds and summarise them."""
+    rss_samples = []
+    stop = asyncio.Event()
+    sampler = asyncio.create_task(sample_rss(pid, rss_samples, stop))
+    start = time.monotonic()
+    deadline = start + ramp + duration
+    clients = [Session(url, random.Random(seed * 1000 + i), think) for i in range(sessions)]
+    await asyncio.gather(*(run_session(client, ramp * i / sessions, deadline, actions)
+                           for i, client in enumerate(clients)))
+    elapsed = time.monotonic() - start
+    stop.set()
+    await sampler
+
+    samples = [s for client in clients for s in client.samples]
+    done = [s for s in samples if s['seconds'] is not None]
+    result = {
+        'sessions': sessions,
+        'reruns': len(done),
+        'errors': sum(1 for s in samples if s['error']),
+        **percentiles([s['seconds'] for s in done]),
+        'reruns_per_s': round(len(done) / elapsed, 2),
+        'rss_mb_peak': round(max(rss_samples), 1) if rss_samples else None,
+        'actions': {},
+    }
+    for action in sorted({s['action'] for s in done}):
+        times = [s['seconds'] for s in done if s['action'] == action]
+        result['actions'][action] = {'reruns': len(times), **percentiles(times)}
+    errors = sorted({s['error'] for s in samples if s['error']})
+    if errors:
+        result['error_samples'] = errors[:5]
+    return result
+
+
+async def warm_up(url):
+    """Visit every page once in one session so the levels measure warm caches."""
+    session = Session(url, random.Random(0), (0, 0))
+    try:
+        await session.connect()
+        await session.rerun('load')
+        radio = session.find('radio', key=NAV_RADIO_KEY)[0][1]
+        for label in list(radio.options):
+            session._set_value(radio.id, string_value=label)
+            await session.rerun('navigate')
+    finally:
+        await session.close()
+
+
+def start_server(port):
+    command = [sys.executable, '-m', 'streamlit', 'run', APP_PATH, '--server.headless', 'true',
+               '--server.port', str(port), '--browser.gatherUsageStats', 'false',
+               '--server.fileWatcherType', 'none']
+    # The server's log goes to a file so a full pipe can never stall it
+    log = tempfile.TemporaryFile(mode='w+')
+    process = subprocess.Popen(command, cwd=REPO_ROOT, stdout=log, stderr=subprocess.STDOUT, text=True)
+    health = f'http://localhost:{port}/_stcore/health'
+    deadline = time.monotonic() + SERVER_START_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            log.seek(0)
+            raise RuntimeError(f'streamlit exited with {process.returncode}:\n{log.read()}')
+        try:
+            with urllib.request.urlopen(health, timeout=2) as response:
+                if response.status == 200:
+                    return process
+        except OSError:
+            time.sleep(0.5)
+    process.terminate()
+    raise RuntimeError(f'streamlit did not answer {health} within {SERVER_START_TIMEOUT}s')
+
+
+def stream_url(url):
+    url = url.rstrip('/')
+    if url.startswith('http'):
+        url = 'ws' + url[len('http'):]
+    return url + '/_stcore/stream'
+
+
+def print_table(results):
+    print(f"{'sessions':>8} {'reruns':>7} {'errors':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+          f"{'reruns/s':>9} {'peak RSS MB':>12}")
+    for r in results:
+        rss = f"{r['rss_mb_peak']:>12.1f}" if r['rss_mb_peak'] is not None else f"{'-':>12}"
+        p = [f"{r[k]:>8.1f}" if r[k] is not None else f"{'-':>8}" for k in ('p50_ms', 'p95_ms', 'p99_ms')]
+        print(f"{r['sessions']:>8} {r['reruns']:>7} {r['errors']:>6} {' '.join(p)} {r['reruns_per_s']:>9.2f} {rss}")
+    print('\np95 ms by action:')
+    actions = sorted({a for r in results for a in r['actions']})
+    print(f"{'sessions':>8} " + ' '.join(f'{a:>12}' for a in actions))
+    for r in results:
+        cells = [r['actions'].get(a, {}).get('p95_ms') for a in actions]
+        print(f"{r['sessions']:>8} " + ' '.join(f'{c:>12.1f}' if c is not None else f"{'-':>12}" for c in cells))
+    for r in results:
+        for error in r.get('error_samples', []):
+            print(f"  ✗ {r['sessions']} sessions: {error}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sessions', type=int, nargs='+', default=DEFAULT_SESSIONS,
+                        help='Concurrent session counts, one level each')
+    parser.add_argument('--duration', type=float, default=DEFAULT_DURATION,
+                        help='Seconds each level runs after its sessions have started')
+    parser.add_argument('--ramp', type=float, help='Seconds over which a level starts its sessions '
+                        '(default: 0.1 per session, at most 10)')
+    parser.add_argument('--think', type=float, nargs=2, default=DEFAULT_THINK, metavar=('MIN', 'MAX'),
+                        help='Think time between actions in seconds (0 0 for back-to-back reruns)')
+    parser.add_argument('--actions', nargs='+', choices=list(ACTION_WEIGHTS), default=list(ACTION_WEIGHTS),
+                        help='Actions the sessions pick from')
+    parser.add_argument('--url', help='Base URL of a running dashboard (default: start one)')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='Port for the started server')
+    parser.add_argument('--server-pid', type=int, help='PID of the --url server, for RSS')
+    parser.add_argument('--no-warmup', action='store_true', help='Skip visiting every page before the first level')
+    parser.add_argument('--seed', type=int, default=42, help='Seed for the sessions\' random walks')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+    try:
+        import websockets  # noqa: F401
+    except ImportError:
+        sys.exit('websockets is required: pip install websockets')
+
+    server = None
+    if args.url:
+        url, pid = stream_url(args.url), args.server_pid
+    else:
+        server = start_server(args.port)
+        url, pid = stream_url(f'http://localhost:{args.port}'), server.pid
+    results = []
+    try:
+        if not args.no_warmup:
+            asyncio.run(warm_up(url))
+        for sessions in args.sessions:
+            ramp = args.ramp if args.ramp is not None else min(0.1 * sessions, 10)
+            results.append(asyncio.run(run_level(url, sessions, args.duration, args.think, ramp,
+                                                 args.actions, args.seed, pid)))
+            if not args.json:
+                r = results[-1]
+                print(f"  {sessions} session(s): {r['reruns']} reruns, p95 {r['p95_ms']} ms", file=sys.stderr)
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print_table(results)
+
+
+if __name__ == '__main__':
+    main()
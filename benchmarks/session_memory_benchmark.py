@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+SnowTelco Dashboard Session Memory Benchmark
+============================================
+Measures how much memory each concurrent presenter session adds to one
+Streamlit server process.
+
+For every session count (1, 10 and 50 by default) a fresh interpreter:
+
+1. renders the pages once in a throw-away session so process-wide state
+   (imported modules, st.cache_resource datasets, chart specs) is built
+2. opens N AppTest sessions and renders the pages in all of them at once,
+   one thread per session, as N presenters clicking at the same moment
+3. keeps the N sessions alive and measures again
+
+Memory is traced Python allocations (tracemalloc) relative to step 1:
+
+- peak/session:     peak during the concurrent renders, divided by N
+- retained/session: what the live sessions still hold afterwards, divided by N.
+                    The element trees AppTest keeps for inspection are
+                    released first (a server sends those to the browser)
+
+As on a server, all sessions share one compiled copy of the app script.
+
+RSS after step 3 is printed for reference. The default pages are the ones
+that read shared datasets through dashboard.data (Alert Center, CNO).
+
+Pass --baseline-root with another checkout (e.g. `git worktree add /tmp/base
+<rev>`) to compare against it.
+
+Usage:
+    python benchmarks/session_memory_benchmark.py
+    python benchmarks/session_memory_benchmark.py --sessions 1 10 50 --pages Alert_Center
+    python benchmarks/session_memory_benchmark.py --baseline-root /tmp/base --json
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_PAGES = ['Alert_Center', '08_CNO_Network_QoE']
+DEFAULT_SESSIONS = [1, 10, 50]
+
+# Executed in the child interpreter, one session count per process
+CHILD_CODE = r'''
+import concurrent.futures, gc, json, resource, sys, tracemalloc
+repo_root, sessions, pages = sys.argv[1], int(sys.argv[2]), sys.argv[3].split(",")
+sys.path.insert(0, repo_root)
+from streamlit.testing.v1 import AppTest, app_test, local_script_runner
+
+# One script cache per process, like the server runtime (AppTest makes one per run)
+shared_script_cache = app_test.ScriptCache()
+app_test.ScriptCache = local_script_runner.ScriptCache = lambda: shared_script_cache
+app_path = repo_root + "/demo_dashboard_app.py"
+
+def render(at):
+    for page in pages:
+        at.session_state.selected_page = page
+        at.run()
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+    return at
+
+render(AppTest.from_file(app_path, default_timeout=1800))
+gc.collect()
+tracemalloc.start()
+base = tracemalloc.get_traced_memory()[0]
+tracemalloc.reset_peak()
+apps = [AppTest.from_file(app_path, default_timeout=1800) for _ in range(sessions)]
+with concurrent.futures.ThreadPoolExecutor(max_workers=sessions) as pool:
+    apps = list(pool.map(render, apps))
+peak = tracemalloc.get_traced_memory()[1]
+for at in apps:
+    at._tree = None
+gc.collect()
+retained = tracemalloc.get_traced_memory()[0]
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if sys.platform == "darwin":
+    rss_kb //= 1024
+print(json.dumps({"peak": peak - base, "retained": retained - base, "rss_kb": rss_kb}))
+'''
+
+
+def measure(root, sessions, pages):
+    result = subprocess.run(
+        [sys.executable, '-c', CHILD_CODE, root, str(sessions), ','.join(pages)],
+        capture_output=True, text=True, check=False, cwd=root,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f'{sessions} sessions failed:\n{result.stderr}')
+    raw = json.loads(result.stdout.strip().splitlines()[-1])
+    return {
+        'sessions': sessions,
+        'peak_kb_per_session': round(raw['peak'] / sessions / 1024, 1),
+        'retained_kb_per_session': round(raw['retained'] / sessions / 1024, 1),
+        'rss_mb': round(raw['rss_kb'] / 1024, 1),
+    }
+
+
+def collect(root, session_counts, pages):
+    return [measure(root, sessions, pages) for sessions in session_counts]
+
+
+def print_table(label, rows):
+    print(f'{label}:')
+    for r in rows:
+        print(f"  {r['sessions']:>3} sessions  peak {r['peak_kb_per_session']:>8.1f} KB/session  "
+              f"retained {r['retained_kb_per_session']:>7.1f} KB/session  RSS {r['rss_mb']:>6.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sessions', type=int, nargs='+', default=DEFAULT_SESSIONS,
+                        help='Concurrent session counts to measure')
+    parser.add_argument('--pages', nargs='+', default=DEFAULT_PAGES, help='Page keys each session renders')
+    parser.add_argument('--baseline-root', help='Another checkout of the repo to measure the same way')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    results = {'current': collect(REPO_ROOT, args.sessions, args.pages)}
+    if args.baseline_root:
+        results['baseline'] = collect(os.path.abspath(args.baseline_root), args.sessions, args.pages)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    if 'baseline' in results:
+        print_table(f'Baseline ({args.baseline_root})', results['baseline'])
+    print_table('Current', results['current'])
+
+
+if __name__ == '__main__':
+    main()
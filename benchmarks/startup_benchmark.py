@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+SnowTelco Dashboard Startup Benchmark
+=====================================
+Measures cold-start time and peak resident memory of demo_dashboard_app.py.
+
+Every run happens in a fresh interpreter with an empty bytecode cache
+(PYTHONPYCACHEPREFIX points at a new temp dir), which is what a presenter host
+sees right after a redeploy. Each run compiles and executes the app module and
+then resolves one page through dashboard.registry.
+
+Modes:
+- lazy:     only the requested page module is imported (current behaviour)
+- eager:    every page module is imported up front (single-module equivalent)
+- baseline: compile and execute a monolithic app file given by --baseline-app,
+            e.g. the pre-split version from git:
+                git show <rev>:demo_dashboard_app.py > /tmp/monolith.py
+
+Usage:
+    python benchmarks/startup_benchmark.py
+    python benchmarks/startup_benchmark.py --page 02_CFO_Finance --runs 10
+    python benchmarks/startup_benchmark.py --baseline-app /tmp/monolith.py --json
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(REPO_ROOT, 'demo_dashboard_app.py')
+
+# Executed in the child interpreter. Interpreter boot is excluded from the
+# timing; everything the app needs (streamlit, pandas, altair, page code) is in.
+CHILD_CODE = r'''
+import json, resource, sys, time
+app_path, mode, page, repo_root = sys.argv[1:5]
+sys.path.insert(0, repo_root)
+t0 = time.perf_counter()
+with open(app_path, encoding="utf-8") as f:
+    code = compile(f.read(), app_path, "exec")
+t_compile = time.perf_counter()
+namespace = {"__name__": "demo_dashboard_app", "__file__": app_path}
+exec(code, namespace)
+if mode != "baseline":
+    from dashboard import registry
+    if mode == "eager":
+        registry.load_all()
+    else:
+        registry.get_renderer(page)
+t_end = time.perf_counter()
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if sys.platform == "darwin":
+    rss_kb //= 1024
+print(json.dumps({
+    "compile_ms": (t_compile - t0) * 1000,
+    "total_ms": (t_end - t0) * 1000,
+    "peak_rss_mb": rss_kb / 1024,
+}))
+'''
+
+
+def run_once(app_path, mode, page):
+    """Run one cold start in a fresh interpreter and return its measurements."""
+    with tempfile.TemporaryDirectory(prefix='snowtelco_pycache_') as pycache:
+        env = dict(os.environ, PYTHONPYCACHEPREFIX=pycache)
+        result = subprocess.run(
+            [sys.executable, '-c', CHILD_CODE, app_path, mode, page, REPO_ROOT],
+            env=env, capture_output=True, text=True, cwd=REPO_ROOT, check=False,
+        )
+    if result.returncode != 0:
+        raise RuntimeError(f"{mode} run failed:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def benchmark(app_path, mode, page, runs):
+    samples = [run_once(app_path, mode, page) for _ in range(runs)]
+    return {
+        'mode': mode,
+        'page': page if mode == 'lazy' else None,
+        'runs': runs,
+        'compile_ms': statistics.median(s['compile_ms'] for s in samples),
+        'total_ms': statistics.median(s['total_ms'] for s in samples),
+        'total_ms_min': min(s['total_ms'] for s in samples),
+        'peak_rss_mb': statistics.median(s['peak_rss_mb'] for s in samples),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--page', default='Executive_Summary', help='Page key resolved in lazy mode')
+    parser.add_argument('--runs', type=int, default=5, help='Cold starts per mode (median is reported)')
+    parser.add_argument('--baseline-app', help='Monolithic app file to compare against')
+    parser.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = parser.parse_args()
+
+    results = [
+        benchmark(APP_PATH, 'lazy', args.page, args.runs),
+        benchmark(APP_PATH, 'eager', args.page, args.runs),
+    ]
+    if args.baseline_app:
+        results.append(benchmark(os.path.abspath(args.baseline_app), 'baseline', args.page, args.runs))
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    print(f"Cold start, median of {args.runs} runs (empty bytecode cache)")
+    print(f"{'mode':<10} {'compile ms':>11} {'total ms':>10} {'min ms':>8} {'peak RSS MB':>12}")
+    for r in results:
+        print(f"{r['mode']:<10} {r['compile_ms']:>11.1f} {r['total_ms']:>10.1f} "
+              f"{r['total_ms_min']:>8.1f} {r['peak_rss_mb']:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
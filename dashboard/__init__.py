@@ -0,0 +1 @@
+"""Supporting package for demo_dashboard_app.py."""
@@ -0,0 +1,207 @@
+"""Compiled Vega-Lite spec cache for the dashboard's Altair charts.
+
+``st.altair_chart`` validates the whole chart against the Vega-Lite JSON
+schema and serializes its data to Arrow on every rerun, even when neither has
+changed. :func:`altair_chart` is a drop-in replacement that keys each chart on
+
+- the chart definition: ``to_dict(validate=False)`` with every dataset replaced
+  by its fingerprint, which skips schema validation and data serialization
+- the fingerprint of each dataset (column names, dtypes and a hash of the
+  values, via ``pd.util.hash_pandas_object``)
+
+and keeps the compiled spec (Arrow-encoded datasets included) in a
+process-wide LRU cache of ``SPEC_CACHE_SIZE`` entries. A cache hit goes
+straight to ``st.vega_lite_chart``; a miss compiles the chart exactly as
+``st.altair_chart`` does. Charts with selections (``on_select``) and
+Streamlit versions without the compile hook fall back to ``st.altair_chart``.
+
+Building the Altair objects is itself expensive (``encode`` resolves every
+shorthand such as ``'Revenue:Q'`` against the schema). Charts moved into a
+builder function decorated with :func:`cached_chart` skip that too: the
+builder only runs when its code or the fingerprint of its arguments changes::
+
+    @charts.cached_chart
+    def revenue_bar(df):
+        return alt.Chart(df).mark_bar().encode(x='Revenue:Q', y='Segment:N')
+
+    charts.altair_chart(revenue_bar(seg_df), use_container_width=True)
+
+Chart data travels as named Arrow datasets. Altair hoists layer data into the
+spec's top-level ``datasets`` and Streamlit names each dataset by a hash of its
+contents, so the layers of one chart (``bars + labels`` over the same frame)
+share a single copy. Before a compiled spec is cached, :func:`compact_dataset`
+re-encodes each dataset: it drops the pandas schema metadata, which is most of
+the bytes of a small chart table, and dictionary-encodes repetitive string
+columns of large ones.
+"""
+
+import collections
+import functools
+import hashlib
+import json
+import threading
+
+import pandas as pd
+import streamlit as st
+
+try:  # Streamlit's own Altair -> Vega-Lite conversion (theme handling, Arrow datasets)
+    from streamlit.elements.vega_charts import _altair_globals_lock, _convert_altair_to_vega_lite_spec
+except ImportError:  # pragma: no cover - older/newer Streamlit layouts
+    _altair_globals_lock = _convert_altair_to_vega_lite_spec = None
+
+SPEC_CACHE_SIZE = 512
+# Tables with at least this many rows get low-cardinality string columns dictionary-encoded
+DICTIONARY_MIN_ROWS = 1000
+
+_FINGERPRINT_TRANSFORMER = "snowtelco_fingerprint"
+
+
+def data_fingerprint(data):
+    """Stable content hash of a chart dataset."""
+    digest = hashlib.sha1()
+    if isinstance(data, pd.DataFrame):
+        digest.update(repr([(str(c), str(t)) for c, t in data.dtypes.items()]).encode())
+        digest.update(pd.util.hash_pandas_object(data, index=False).to_numpy().tobytes())
+    else:
+        digest.update(json.dumps(data, sort_keys=True, default=str).encode())
+    return "fp-" + digest.hexdigest()
+
+
+def _value_fingerprint(value):
+    if isinstance(value, pd.DataFrame):
+        return data_fingerprint(value)
+    if isinstance(value, pd.Series):
+        return data_fingerprint(value.to_frame())
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def _fingerprint_transformer(data, fingerprints=None):
+    return {"name": data_fingerprint(data)}
+
+
+def compact_dataset(data_bytes):
+    """Smaller Arrow IPC encoding of a chart dataset (the input is returned if it is not smaller)."""
+    import pyarrow as pa
+
+    try:
+        table = pa.ipc.open_stream(data_bytes).read_all()
+    except pa.ArrowInvalid:
+        return data_bytes
+    # Vega-Lite reads columns by name; the pandas index and its metadata are never used
+    table = table.drop_columns([name for name in table.column_names if name.startswith("__index_level_")])
+    table = table.replace_schema_metadata(None)
+    if table.num_rows >= DICTIONARY_MIN_ROWS:
+        for i, field in enumerate(table.schema):
+            column = table.column(i)
+            if pa.types.is_string(field.type) and len(column.unique()) * 4 <= table.num_rows:
+                table = table.set_column(i, field.name, column.dictionary_encode())
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    compact = sink.getvalue().to_pybytes()
+    return compact if len(compact) < len(data_bytes) else data_bytes
+
+
+def _compile(chart):
+    spec = _convert_altair_to_vega_lite_spec(chart)
+    datasets = spec.get("datasets")
+    if isinstance(datasets, dict):
+        spec["datasets"] = {name: compact_dataset(value) if isinstance(value, bytes) else value
+                            for name, value in datasets.items()}
+    return spec
+
+
+class SpecCache:
+    """Thread-safe LRU of compiled Vega-Lite specs keyed by chart fingerprint."""
+
+    def __init__(self, maxsize=SPEC_CACHE_SIZE):
+        self.maxsize = maxsize
+        self._specs = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            spec = self._specs.get(key)
+            if spec is None:
+                self.misses += 1
+                return None
+            self._specs.move_to_end(key)
+            self.hits += 1
+            return spec
+
+    def put(self, key, spec):
+        with self._lock:
+            self._specs[key] = spec
+            self._specs.move_to_end(key)
+            while len(self._specs) > self.maxsize:
+                self._specs.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._specs.clear()
+            self.hits = self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            return {"entries": len(self._specs), "maxsize": self.maxsize, "hits": self.hits, "misses": self.misses}
+
+
+_cache = SpecCache()
+
+
+def spec_cache():
+    return _cache
+
+
+def chart_key(chart):
+    """Fingerprint of ``chart``: its unvalidated definition with datasets replaced by content hashes."""
+    import altair as alt
+
+    alt.data_transformers.register(_FINGERPRINT_TRANSFORMER, _fingerprint_transformer)
+    # Altair's data transformer and theme registries are process-global
+    with _altair_globals_lock:
+        with alt.data_transformers.enable(_FINGERPRINT_TRANSFORMER):
+            definition = chart.to_dict(validate=False)
+    return hashlib.sha1(json.dumps(definition, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def compiled_spec(chart):
+    """Validated Vega-Lite spec for ``chart``, from the cache when the chart is unchanged."""
+    key = chart_key(chart)
+    spec = _cache.get(key)
+    if spec is None:
+        spec = _compile(chart)
+        _cache.put(key, spec)
+    return spec
+
+
+def cached_chart(builder):
+    """Decorator: ``builder(*args)`` returns a compiled spec, built only for new code or arguments."""
+    code = builder.__code__
+    identity = "{}.{}:{}".format(builder.__module__, builder.__qualname__,
+                                 hashlib.sha1(code.co_code + repr(code.co_consts).encode()).hexdigest())
+
+    @functools.wraps(builder)
+    def wrapper(*args, **kwargs):
+        if _convert_altair_to_vega_lite_spec is None:
+            return builder(*args, **kwargs)
+        parts = [identity] + [_value_fingerprint(a) for a in args]
+        parts += [f"{name}={_value_fingerprint(value)}" for name, value in sorted(kwargs.items())]
+        key = hashlib.sha1("\x1f".join(parts).encode()).hexdigest()
+        spec = _cache.get(key)
+        if spec is None:
+            spec = _compile(builder(*args, **kwargs))
+            _cache.put(key, spec)
+        return spec
+
+    return wrapper
+
+
+def altair_chart(chart, **kwargs):
+    """Drop-in for ``st.altair_chart``; also accepts a spec returned by a :func:`cached_chart` builder."""
+    if isinstance(chart, dict):
+        return st.vega_lite_chart(spec=chart, **kwargs)
+    if _convert_altair_to_vega_lite_spec is None or kwargs.get("on_select", "ignore") != "ignore":
+        return st.altair_chart(chart, **kwargs)
+    return st.vega_lite_chart(spec=compiled_spec(chart), **kwargs)
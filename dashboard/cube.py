@@ -0,0 +1,444 @@
+"""Materialized KPI cube behind the Executive Showcase.
+
+The cube aggregates four facts to month × region × segment × plan. Every
+measure is additive (a sum or a count), so any roll-up is a plain sum and
+ratios such as ARPU or churn rate are taken from rolled-up numerators and
+denominators:
+
+- invoice_fact: ``revenue`` (amount ex. tax), ``invoices``; segment is the
+  invoice's customer_type, region the customer's county (customer_dim)
+- mobile_usage_fact: ``subscriber_months``, ``mobile_bill``, ``nps_responses``,
+  ``nps_promoters``, ``nps_detractors``
+- mobile_churn_fact: ``churned``, ``churned_ltv``
+- sales_fact: ``sales``, ``sales_units``; region from region_dim, segment from
+  the customer's vertical (customer_dim)
+
+Subscriber facts take region, segment and plan type from mobile_subscriber_dim
+and mobile_plan_dim (segment is the consumer segment for consumers, otherwise
+the customer type). Regions are those of :mod:`dashboard.geo`; a dimension a
+fact cannot resolve is ``Other``.
+
+The cube is persisted per backend as ``demo_data/kpi_cube/<backend>.parquet``.
+:func:`refresh` reads it back and re-aggregates each fact only from its latest
+stored month onwards (facts are appended a month at a time), so a new month
+costs one month of fact rows instead of a rebuild. A fact the backend does not
+have keeps the rows already in the cube. ``scripts/build_kpi_cube.py`` builds
+or refreshes it ahead of a demo, and the dashboard refreshes it whenever the
+process-wide copy (:func:`kpi_cube`) expires.
+
+Showcase tiles are computed once per cube (:attr:`KpiCube.tiles`). A tile is
+``None`` when no fact on the backend has its measures, and the page keeps its
+illustrative figures for it.
+"""
+
+import functools
+import os
+
+import pandas as pd
+import streamlit as st
+
+from dashboard import data, geo
+from dashboard.data.backends import DEMO_DATA_PATH
+from dashboard.data.datasets import DEFAULT_TTL
+
+CUBE_PATH = os.path.join(DEMO_DATA_PATH, "kpi_cube")
+CUBE_TTL = DEFAULT_TTL
+
+DIMENSIONS = ("month", "region", "segment", "plan")
+MEASURES = ("revenue", "invoices", "subscriber_months", "mobile_bill", "nps_responses", "nps_promoters",
+            "nps_detractors", "churned", "churned_ltv", "sales", "sales_units")
+COUNT_MEASURES = ("invoices", "subscriber_months", "nps_responses", "nps_promoters", "nps_detractors", "churned",
+                  "sales_units")
+OTHER = geo.OTHER_REGION
+
+# Months per comparison window (this year vs the year before) and for ARPU
+WINDOW_MONTHS = 12
+ARPU_MONTHS = 3
+
+# (amount, volume) pairs the revenue bridge uses, first one with two years of data
+REVENUE_MEASURES = (("revenue", "invoices"), ("sales", "sales_units"))
+
+TILES = ("revenue_bridge", "arpu_by_segment", "plan_mix", "regional_heatmap", "churn_waterfall")
+
+_COUNTY_REGION = {county: region for region, counties in geo.REGIONS.items() for county in counties}
+# region_dim names -> geo regions
+_REGION_NAMES = {
+    "London": "London & South East",
+    "South East": "London & South East",
+    "South West": "South West",
+    "East Midlands": "Midlands",
+    "West Midlands": "Midlands",
+    "North West": "North West",
+    "North East": "North East",
+    "Yorkshire and Humber": "Yorkshire",
+    "East of England": "East of England",
+    "Scotland": "Scotland",
+    "Wales": "Wales",
+    "Northern Ireland": "Northern Ireland",
+}
+
+
+def _month(values):
+    """'YYYY-MM' for dates, timestamps or month strings."""
+    return values.astype(str).str[:7]
+
+
+class _Dimensions:
+    """Dimension lookups for one refresh, read at most once each (None if the backend lacks the table)."""
+
+    def __init__(self, backend):
+        self.backend = backend
+        self._tables = {}
+
+    def table(self, name, columns):
+        if name not in self._tables:
+            try:
+                self._tables[name] = self.backend.read_table(name, columns)
+            except data.TableNotFound:
+                self._tables[name] = None
+        return self._tables[name]
+
+    @functools.cached_property
+    def subscribers(self):
+        """region, segment and plan per subscriber_key."""
+        subs = self.table("mobile_subscriber_dim",
+                          ["subscriber_key", "county", "plan_key", "customer_type", "customer_segment"])
+        if subs is None or subs.empty:
+            return None
+        subs = subs.drop_duplicates("subscriber_key").set_index("subscriber_key")
+        plans = self.table("mobile_plan_dim", ["plan_key", "plan_type"])
+        consumer = subs["customer_type"].isna() | (subs["customer_type"] == "Consumer")
+        return pd.DataFrame({
+            "region": subs["county"].map(_COUNTY_REGION),
+            "segment": subs["customer_segment"].where(consumer, subs["customer_type"]),
+            "plan": subs["plan_key"].map(plans.set_index("plan_key")["plan_type"]) if plans is not None else None,
+        }, index=subs.index).fillna(OTHER)
+
+    @functools.cached_property
+    def customers(self):
+        """region and vertical per customer_key."""
+        customers = self.table("customer_dim", ["customer_key", "county", "vertical"])
+        if customers is None or customers.empty:
+            return None
+        customers = customers.drop_duplicates("customer_key").set_index("customer_key")
+        return pd.DataFrame({"region": customers["county"].map(_COUNTY_REGION),
+                             "vertical": customers["vertical"]}, index=customers.index)
+
+    @functools.cached_property
+    def regions(self):
+        regions = self.table("region_dim", ["region_key", "region_name"])
+        if regions is None or regions.empty:
+            return None
+        return regions.set_index("region_key")["region_name"].map(_REGION_NAMES)
+
+    def subscriber_attributes(self, subscriber_keys):
+        """region, segment and plan for each of ``subscriber_keys``, aligned to its index."""
+        if self.subscribers is None:
+            return pd.DataFrame({"region": OTHER, "segment": OTHER, "plan": OTHER}, index=subscriber_keys.index)
+        attributes = self.subscribers.reindex(subscriber_keys.to_numpy()).fillna(OTHER)
+        attributes.index = subscriber_keys.index
+        return attributes
+
+
+def _lookup(keys, mapping):
+    return keys.map(mapping) if mapping is not None else pd.Series(OTHER, index=keys.index)
+
+
+def _rollup(frame, measures):
+    """Sum ``measures`` of ``frame`` (one row per fact row) over the cube grain."""
+    frame[list(DIMENSIONS)] = frame[list(DIMENSIONS)].fillna(OTHER)
+    return frame.groupby(list(DIMENSIONS), sort=False)[list(measures)].sum().reset_index()
+
+
+def _invoices(rows, dims):
+    customers = dims.customers
+    return _rollup(pd.DataFrame({
+        "month": _month(rows["invoice_date"]),
+        "region": _lookup(rows["customer_key"], customers["region"] if customers is not None else None),
+        "segment": rows["customer_type"],
+        "plan": OTHER,
+        "revenue": rows["amount"].astype(float),
+        "invoices": 1,
+    }), ("revenue", "invoices"))
+
+
+def _usage(rows, dims):
+    nps = pd.to_numeric(rows["nps_score"], errors="coerce")
+    frame = dims.subscriber_attributes(rows["subscriber_key"]).assign(
+        month=_month(rows["usage_month"]),
+        subscriber_months=1,
+        mobile_bill=rows["bill_amount"].astype(float),
+        nps_responses=nps.notna().astype(int),
+        nps_promoters=(nps >= 9).astype(int),
+        nps_detractors=(nps <= 6).astype(int),
+    )
+    return _rollup(frame, ("subscriber_months", "mobile_bill", "nps_responses", "nps_promoters", "nps_detractors"))
+
+
+def _churn(rows, dims):
+    frame = dims.subscriber_attributes(rows["subscriber_key"]).assign(
+        month=_month(rows["churn_date"]),
+        churned=1,
+        churned_ltv=rows["lifetime_value"].astype(float),
+    )
+    return _rollup(frame, ("churned", "churned_ltv"))
+
+
+def _sales(rows, dims):
+    customers = dims.customers
+    return _rollup(pd.DataFrame({
+        "month": _month(rows["date"]),
+        "region": _lookup(rows["region_key"], dims.regions),
+        "segment": _lookup(rows["customer_key"], customers["vertical"] if customers is not None else None),
+        "plan": OTHER,
+        "sales": rows["amount"].astype(float),
+        "sales_units": rows["units"],
+    }), ("sales", "sales_units"))
+
+
+class Fact:
+    """A source fact: the columns the cube needs, its month column and its aggregation to the cube grain."""
+
+    def __init__(self, table, columns, month_column, since_filter, aggregate):
+        self.table = table
+        self.columns = columns
+        self.month_column = month_column
+        # SQL predicate selecting rows from month {since} ('YYYY-MM') onwards
+        self.since_filter = since_filter
+        self.aggregate = aggregate
+
+    def read(self, backend, since=None):
+        """Fact rows from month ``since`` onwards (all rows when ``since`` is None)."""
+        if since and backend.supports_sql:
+            return backend.query(f"SELECT {', '.join(self.columns)} FROM {self.table} "
+                                 f"WHERE {self.since_filter.format(since=since)}")
+        rows = backend.read_table(self.table, self.columns)
+        return rows[_month(rows[self.month_column]) >= since] if since else rows
+
+
+FACTS = (
+    Fact("invoice_fact", ["customer_key", "customer_type", "invoice_date", "amount"],
+         "invoice_date", "invoice_date >= '{since}-01'", _invoices),
+    Fact("mobile_usage_fact", ["subscriber_key", "usage_month", "bill_amount", "nps_score"],
+         "usage_month", "usage_month >= '{since}'", _usage),
+    Fact("mobile_churn_fact", ["subscriber_key", "churn_date", "lifetime_value"],
+         "churn_date", "churn_date >= '{since}-01'", _churn),
+    Fact("sales_fact", ["date", "customer_key", "region_key", "amount", "units"],
+         "date", "date >= '{since}-01'", _sales),
+)
+
+
+def empty_cube():
+    return pd.DataFrame({column: pd.Series(dtype=float if column in MEASURES else object)
+                         for column in ("source",) + DIMENSIONS + MEASURES})
+
+
+def cube_file(backend_name, root=CUBE_PATH):
+    return os.path.join(root, f"{backend_name}.parquet")
+
+
+def read_cube(path):
+    """The persisted cube at ``path``, or None if there is none (or it cannot be read)."""
+    try:
+        return pd.read_parquet(path)
+    except (OSError, ImportError, ValueError):
+        return None
+
+
+def write_cube(cube, path):
+    """Persist ``cube``; returns False where the file system or pyarrow does not allow it."""
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.tmp{os.getpid()}"
+        cube.to_parquet(tmp, index=False)
+        os.replace(tmp, path)
+    except (OSError, ImportError):
+        return False
+    return True
+
+
+def refresh(backend, root=CUBE_PATH, full=False):
+    """Bring ``backend``'s persisted cube up to date.
+
+    Returns (cube, {fact: months re-aggregated}, whether the cube was written).
+    """
+    path = cube_file(backend.name, root)
+    cube = None if full else read_cube(path)
+    if cube is None:
+        cube = empty_cube()
+    dims = _Dimensions(backend)
+    parts, refreshed = [], {}
+    for fact in FACTS:
+        stored = cube[cube["source"] == fact.table]
+        # The latest stored month may have been partial, so it is aggregated again
+        since = stored["month"].max() if len(stored) else None
+        try:
+            rows = fact.read(backend, since)
+        except data.TableNotFound:
+            parts.append(stored)
+            continue
+        fresh = fact.aggregate(rows, dims).assign(source=fact.table)
+        parts += [stored[stored["month"] < since] if since else stored.iloc[:0], fresh]
+        refreshed[fact.table] = sorted(fresh["month"].unique())
+    cube = pd.concat([empty_cube()] + [part for part in parts if len(part)], ignore_index=True)
+    cube[list(MEASURES)] = cube[list(MEASURES)].fillna(0)
+    cube[list(COUNT_MEASURES)] = cube[list(COUNT_MEASURES)].astype("int64")
+    cube = cube.sort_values(["source", *DIMENSIONS], ignore_index=True)
+    return cube, refreshed, write_cube(cube, path)
+
+
+def _shift(month, months):
+    return str(pd.Period(month, freq="M") + months)
+
+
+class KpiCube:
+    """The cube (read-only) and the showcase tiles answered from it."""
+
+    def __init__(self, frame):
+        self.frame = data.freeze(frame.reset_index(drop=True))
+
+    def months(self, measure):
+        """Months with data for ``measure``, oldest first."""
+        frame = self.frame
+        return sorted(frame.loc[frame[measure] != 0, "month"].unique())
+
+    def windows(self, measure):
+        """(this year's months, last year's months) ending at ``measure``'s latest month."""
+        months = self.months(measure)
+        if not months:
+            return [], []
+        last = months[-1]
+        current = [m for m in months if m > _shift(last, -WINDOW_MONTHS)]
+        prior = [m for m in months if _shift(last, -2 * WINDOW_MONTHS) < m <= _shift(last, -WINDOW_MONTHS)]
+        return current, prior
+
+    def total(self, measures, by, months):
+        """``measures`` summed over ``months`` per ``by`` (a dimension name)."""
+        frame = self.frame
+        rows = frame[frame["month"].isin(months)]
+        return rows.groupby(by)[list(measures)].sum()
+
+    def revenue_bridge(self):
+        """Last year's revenue to this year's in £M: volume, mix (by segment) and price effects."""
+        for amount, volume in REVENUE_MEASURES:
+            current, prior = self.windows(amount)
+            if current and prior:
+                break
+        else:
+            return None
+        now = self.total((amount, volume), "segment", current)
+        before = self.total((amount, volume), "segment", prior)
+        segments = now.index.union(before.index)
+        now, before = now.reindex(segments, fill_value=0), before.reindex(segments, fill_value=0)
+        r0, n0, r1, n1 = before[amount].sum(), before[volume].sum(), now[amount].sum(), now[volume].sum()
+        if not (r0 and n0 and n1):
+            return None
+        price0 = r0 / n0
+        segment_price0 = (before[amount] / before[volume].where(before[volume] > 0)).fillna(price0)
+        at_last_year_prices = (now[volume] * segment_price0).sum()
+        steps = [
+            ("Base", r0, "Total"),
+            ("Volume", (n1 - n0) * price0, None),
+            ("Mix", at_last_year_prices - n1 * price0, None),
+            ("Price", r1 - at_last_year_prices, None),
+            ("Current", r1, "Total"),
+        ]
+        bridge = pd.DataFrame({
+            "Driver": [driver for driver, _, _ in steps],
+            "Impact": [round(value / 1e6, 2) for _, value, _ in steps],
+            "Type": [kind or ("Up" if value >= 0 else "Down") for _, value, kind in steps],
+        })
+        bridge["Label"] = [f"{v:.1f}M" if kind == "Total" else f"{v:+.1f}M"
+                           for v, kind in zip(bridge["Impact"], bridge["Type"])]
+        return bridge
+
+    def arpu_by_segment(self):
+        """Monthly mobile bill per subscriber and segment over the last ``ARPU_MONTHS`` months."""
+        months = self.months("subscriber_months")[-ARPU_MONTHS:]
+        if not months:
+            return None
+        totals = self.total(("mobile_bill", "subscriber_months"), "segment", months).drop(OTHER, errors="ignore")
+        totals = totals[totals["subscriber_months"] > 0]
+        if totals.empty:
+            return None
+        arpu = (totals["mobile_bill"] / totals["subscriber_months"]).round(0)
+        return pd.DataFrame({"Segment": arpu.index, "ARPU": arpu.to_numpy()}).sort_values(
+            "ARPU", ascending=False, ignore_index=True)
+
+    def plan_mix(self):
+        """Share of subscribers by plan type in the latest month."""
+        months = self.months("subscriber_months")[-1:]
+        if not months:
+            return None
+        subscribers = self.total(("subscriber_months",), "plan", months)["subscriber_months"].drop(
+            OTHER, errors="ignore")
+        if not subscribers.sum():
+            return None
+        share = (100 * subscribers / subscribers.sum()).round(1)
+        return pd.DataFrame({"Plan": share.index, "Share": share.to_numpy()}).sort_values(
+            "Share", ascending=False, ignore_index=True)
+
+    def regional_heatmap(self):
+        """Per region: sales growth % (year on year), NPS and monthly churn %; metrics without data are left out."""
+        metrics = {}
+        current, prior = self.windows("sales")
+        if current and prior:
+            now = self.total(("sales",), "region", current)["sales"]
+            before = self.total(("sales",), "region", prior)["sales"]
+            metrics["Sales Growth %"] = 100 * (now / before.where(before > 0) - 1)
+        current, _ = self.windows("nps_responses")
+        if current:
+            nps = self.total(("nps_responses", "nps_promoters", "nps_detractors"), "region", current)
+            metrics["NPS"] = 100 * (nps["nps_promoters"] - nps["nps_detractors"]) / nps["nps_responses"].where(
+                nps["nps_responses"] > 0)
+        current, _ = self.windows("subscriber_months")
+        if current and self.months("churned"):
+            churn = self.total(("churned", "subscriber_months"), "region", current)
+            metrics["Churn %"] = 100 * churn["churned"] / churn["subscriber_months"].where(
+                churn["subscriber_months"] > 0)
+        if not metrics:
+            return None
+        heat = pd.DataFrame(metrics).drop(OTHER, errors="ignore").dropna(how="all").round(1)
+        if heat.empty:
+            return None
+        return heat.rename_axis("Region").reset_index()
+
+    def churn_waterfall(self):
+        """Subscribers at the start of the last ``WINDOW_MONTHS`` months, gross adds, churn and the end base."""
+        months = self.months("subscriber_months")[-WINDOW_MONTHS:]
+        if len(months) < 2 or not self.months("churned"):
+            return None
+        subscribers = self.total(("subscriber_months",), "month", months)["subscriber_months"]
+        base, end = float(subscribers.iloc[0]), float(subscribers.iloc[-1])
+        churned = float(self.total(("churned",), "month", months[1:])["churned"].sum())
+        gross_adds = end - base + churned
+        return waterfall_frame([("Base", 0.0, base), ("Gross Adds", base, base + gross_adds),
+                                ("Churn", base + gross_adds, end), ("End", 0.0, end)])
+
+    @functools.cached_property
+    def tiles(self):
+        """{tile: frame or None} for :data:`TILES`."""
+        tiles = {}
+        for name in TILES:
+            frame = getattr(self, name)()
+            tiles[name] = data.freeze(frame) if frame is not None else None
+        return tiles
+
+
+def waterfall_frame(stages):
+    """Chart frame for (stage, start, end) subscriber counts; the first and last stage are totals."""
+    frame = pd.DataFrame(stages, columns=["Stage", "Start", "End"])
+    change = frame["End"] - frame["Start"]
+    frame["Type"] = ["Increase" if c >= 0 else "Decrease" for c in change]
+    frame.loc[[0, len(frame) - 1], "Type"] = "Total"
+    scale, unit = (1e6, "M") if frame["End"].abs().max() >= 1e6 else (1e3, "K")
+    frame["Label"] = [f"{end / scale:.1f}{unit}" if kind == "Total" else f"{c / scale:+.1f}{unit}"
+                      for end, c, kind in zip(frame["End"], change, frame["Type"])]
+    return frame
+
+
+@st.cache_resource(show_spinner=False, ttl=CUBE_TTL)
+def kpi_cube(backend_name):
+    """The process-wide :class:`KpiCube` for ``backend_name``, refreshed (incrementally) when it expires."""
+    cube, _, _ = refresh(data.get_backend(backend_name))
+    return KpiCube(cube)
@@ -0,0 +1,99 @@
+"""Data provider layer for the dashboard pages.
+
+Pages ask for a named dataset and get a DataFrame::
+
+    from dashboard import data
+    sites = data.load("ran_sites")
+
+The backend is chosen with the SNOWTELCO_DATA_BACKEND environment variable
+(``csv`` by default, or ``parquet``, ``duckdb``, ``snowpark``). Results are
+cached with ``st.cache_resource`` using each dataset's TTL, keyed by backend,
+and can be dropped explicitly with :func:`invalidate`.
+
+The cache holds one copy of each dataset per process, shared by every
+session. Its numeric columns are read-only numpy arrays and its string columns
+are immutable Arrow arrays (pandas' default string storage), so a session can
+never change the data another session sees. :func:`load` returns a shallow
+copy: it shares the cached buffers, and pandas' copy-on-write reference
+tracking copies a column only when that session's frame is modified. A loaded
+dataset costs a session a few hundred bytes of frame metadata, not a
+deserialized copy of the data as with ``st.cache_data``. Buffers stay alive as
+long as any frame references them, so an entry expiring or being invalidated
+mid-render is safe.
+"""
+
+import os
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from dashboard.data.backends import BACKENDS, TableNotFound
+from dashboard.data.datasets import DATASETS, Dataset, dataset, register
+
+BACKEND_ENV = "SNOWTELCO_DATA_BACKEND"
+DEFAULT_BACKEND = "csv"
+
+_backends = {}
+_loaders = {}
+
+
+def get_backend(name=None):
+    """Return the (process-wide) backend instance called ``name``."""
+    name = name or os.environ.get(BACKEND_ENV, DEFAULT_BACKEND)
+    if name not in _backends:
+        if name not in BACKENDS:
+            raise ValueError(f"Unknown data backend {name!r}; choose from {sorted(BACKENDS)}")
+        _backends[name] = BACKENDS[name]()
+    return _backends[name]
+
+
+def freeze(frame):
+    """``frame`` rebuilt on read-only views of its numpy columns (no data is copied)."""
+    columns = {}
+    for column, series in frame.items():
+        if isinstance(series.dtype, np.dtype):
+            values = series.to_numpy()
+            values.flags.writeable = False
+            series = pd.Series(values, index=frame.index, name=column, copy=False)
+        columns[column] = series
+    return pd.DataFrame(columns, index=frame.index, copy=False)
+
+
+def _loader(dataset_name):
+    """One st.cache_resource function per dataset, so TTL and invalidation are per dataset."""
+    if dataset_name not in _loaders:
+        definition = DATASETS[dataset_name]
+
+        def load_dataset(name, backend_name):
+            return freeze(DATASETS[name].load(get_backend(backend_name)))
+
+        load_dataset.__qualname__ = f"load_dataset_{dataset_name}"
+        _loaders[dataset_name] = st.cache_resource(ttl=definition.ttl, show_spinner=False)(load_dataset)
+    return _loaders[dataset_name]
+
+
+def load(name, backend=None):
+    """Load dataset ``name`` from ``backend`` (default: SNOWTELCO_DATA_BACKEND).
+
+    The frame shares its buffers with the process-wide cache; modifying it
+    copies the affected columns for the caller only.
+    """
+    if name not in DATASETS:
+        raise KeyError(f"Unknown dataset {name!r}")
+    backend_name = get_backend(backend).name
+    return _loader(name)(name, backend_name).copy(deep=False)
+
+
+def invalidate(name=None):
+    """Drop cached results for dataset ``name``, or for every dataset."""
+    names = [name] if name else list(_loaders)
+    for dataset_name in names:
+        if dataset_name in _loaders:
+            _loaders[dataset_name].clear()
+
+
+__all__ = [
+    "BACKENDS", "DATASETS", "Dataset", "TableNotFound",
+    "dataset", "freeze", "get_backend", "invalidate", "load", "register",
+]
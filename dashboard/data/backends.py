@@ -0,0 +1,152 @@
+"""Storage backends for the dashboard data layer.
+
+Every backend can read a table by name (optionally a subset of columns) and
+returns a pandas DataFrame with lower-case column names, matching the CSV
+headers in demo_data/ and the DDL in sql_scripts/03_create_tables.sql. SQL
+backends can also run a dataset's query directly so aggregation happens in the
+engine instead of in pandas.
+
+Parquet, DuckDB and Snowpark need optional packages (pyarrow, duckdb,
+snowflake-snowpark-python); they are imported only when that backend is used.
+"""
+
+import glob
+import os
+
+import pandas as pd
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEMO_DATA_PATH = os.path.join(REPO_ROOT, "demo_data")
+
+
+class TableNotFound(LookupError):
+    """Raised when a backend has no data for a requested table."""
+
+
+class Backend:
+    name = None
+    supports_sql = False
+
+    def read_table(self, table, columns=None):
+        raise NotImplementedError
+
+    def query(self, sql):
+        raise NotImplementedError(f"{self.name} backend cannot run SQL")
+
+
+def table_files(root, table, extension):
+    """Return the file(s) holding ``table``: ``<table>.<ext>`` or split parts ``<table>_1.<ext>``, ..."""
+    single = os.path.join(root, f"{table}.{extension}")
+    if os.path.exists(single):
+        return [single]
+    parts = glob.glob(os.path.join(root, f"{table}_[0-9]*.{extension}"))
+    return sorted(parts, key=lambda p: int(p.rsplit("_", 1)[1].split(".")[0]))
+
+
+class CsvBackend(Backend):
+    """Reads demo_data/*.csv (including split files such as ``foo_1.csv``/``foo_2.csv``)."""
+
+    name = "csv"
+
+    def __init__(self, root=DEMO_DATA_PATH):
+        self.root = root
+
+    def read_table(self, table, columns=None):
+        files = table_files(self.root, table, "csv")
+        if not files:
+            raise TableNotFound(f"No CSV for table {table!r} in {self.root}")
+        frames = [pd.read_csv(path, usecols=columns, low_memory=False) for path in files]
+        frame = frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+        # usecols keeps file order; other backends return columns as requested
+        return frame[columns] if columns else frame
+
+
+class ParquetBackend(Backend):
+    """Reads ``<table>.parquet`` files (one file or split parts per table)."""
+
+    name = "parquet"
+
+    def __init__(self, root=os.path.join(DEMO_DATA_PATH, "parquet")):
+        self.root = root
+
+    def read_table(self, table, columns=None):
+        files = table_files(self.root, table, "parquet")
+        if not files:
+            raise TableNotFound(f"No Parquet for table {table!r} in {self.root}")
+        frames = [pd.read_parquet(path, columns=columns) for path in files]
+        return frames[0] if len(frames) == 1 else pd.concat(frames, ignore_index=True)
+
+
+class DuckDBBackend(Backend):
+    """Queries a local DuckDB database file mirroring the SnowTelco_V2 schema."""
+
+    name = "duckdb"
+    supports_sql = True
+
+    def __init__(self, path=os.path.join(DEMO_DATA_PATH, "snowtelco.duckdb")):
+        self.path = path
+        self._connection = None
+
+    @property
+    def connection(self):
+        if self._connection is None:
+            import duckdb
+            if not os.path.exists(self.path):
+                raise TableNotFound(f"DuckDB database {self.path} does not exist")
+            self._connection = duckdb.connect(self.path, read_only=True)
+        return self._connection
+
+    def read_table(self, table, columns=None):
+        select = ", ".join(columns) if columns else "*"
+        return self.query(f"SELECT {select} FROM {table}")
+
+    def query(self, sql):
+        # DuckDB connections are not thread-safe; give each call its own cursor
+        return self.connection.cursor().execute(sql).df()
+
+
+class SnowparkBackend(Backend):
+    """Runs against the SnowTelco_V2 schema through a Snowpark session.
+
+    Uses the active session inside Streamlit in Snowflake, otherwise the
+    ``snowflake`` connection from ``.streamlit/secrets.toml``.
+    """
+
+    name = "snowpark"
+    supports_sql = True
+
+    def __init__(self, session=None):
+        self._session = session
+
+    @property
+    def session(self):
+        if self._session is None:
+            try:
+                from snowflake.snowpark.context import get_active_session
+                self._session = get_active_session()
+            except Exception:
+                import streamlit as st
+                self._session = st.connection("snowflake").session()
+        return self._session
+
+    def read_table(self, table, columns=None):
+        frame = self.session.table(table)
+        if columns:
+            frame = frame.select(*columns)
+        return _lower_columns(frame.to_pandas())
+
+    def query(self, sql):
+        return _lower_columns(self.session.sql(sql).to_pandas())
+
+
+def _lower_columns(df):
+    df.columns = [c.lower() for c in df.columns]
+    return df
+
+
+BACKENDS = {
+    CsvBackend.name: CsvBackend,
+    ParquetBackend.name: ParquetBackend,
+    DuckDBBackend.name: DuckDBBackend,
+    SnowparkBackend.name: SnowparkBackend,
+}
@@ -0,0 +1,246 @@
+"""Named dataset definitions.
+
+A dataset names the source tables (and columns) it needs and an aggregation.
+The aggregation is always given as a pandas function over the source frames,
+so it runs on any backend. A dataset may also carry an equivalent SQL query,
+which SQL backends (DuckDB, Snowpark) run instead so only the aggregate leaves
+the engine.
+"""
+
+import pandas as pd
+
+DATASETS = {}
+
+# Seconds a loaded dataset stays cached; demo data only changes on redeploy
+DEFAULT_TTL = 3600
+
+
+class Dataset:
+    def __init__(self, name, tables, aggregate=None, query=None, ttl=DEFAULT_TTL, description=""):
+        self.name = name
+        # table name -> list of columns (None for all columns)
+        self.tables = tables
+        self.aggregate = aggregate
+        self.query = query
+        self.ttl = ttl
+        self.description = description
+
+    def load(self, backend):
+        if self.query and backend.supports_sql:
+            return backend.query(self.query)
+        frames = {table: backend.read_table(table, columns) for table, columns in self.tables.items()}
+        if self.aggregate is None:
+            return next(iter(frames.values()))
+        return self.aggregate(**frames)
+
+
+def register(dataset):
+    if dataset.name in DATASETS:
+        raise ValueError(f"Dataset {dataset.name!r} is already registered")
+    DATASETS[dataset.name] = dataset
+    return dataset
+
+
+def dataset(name, tables, query=None, ttl=DEFAULT_TTL):
+    """Decorator registering a pandas aggregation function as a dataset."""
+    def decorator(func):
+        register(Dataset(name, tables, aggregate=func, query=query, ttl=ttl,
+                         description=(func.__doc__ or "").strip()))
+        return func
+    return decorator
+
+
+# ---------------------------------------------------------------------------
+# Network
+# ---------------------------------------------------------------------------
+
+register(Dataset(
+    "ran_sites",
+    {"ran_site_dim": ["site_id", "site_code", "site_name", "site_type", "city", "county",
+                      "latitude", "longitude", "area_type", "technology", "primary_vendor",
+                      "coverage_radius_km", "num_sectors", "status"]},
+    description="RAN sites with coordinates, technology and status",
+))
+
+register(Dataset(
+    "network_elements",
+    {"network_element_dim": ["element_id", "element_type", "category", "site_key", "vendor",
+                             "city", "county", "status", "criticality", "capacity_gbps"]},
+    description="Core/transport network elements with status and criticality",
+))
+
+
+@dataset(
+    "cells_per_site",
+    {"ran_cell_dim": ["site_id", "technology", "max_connected_users", "status"]},
+    query="""
+        SELECT site_id,
+               COUNT(*) AS cells,
+               CAST(SUM(CASE WHEN technology = '5G NR' THEN 1 ELSE 0 END) AS BIGINT) AS cells_5g,
+               CAST(SUM(max_connected_users) AS BIGINT) AS max_connected_users,
+               CAST(SUM(CASE WHEN status = 'Active' THEN 0 ELSE 1 END) AS BIGINT) AS cells_not_active
+        FROM ran_cell_dim
+        GROUP BY site_id
+        ORDER BY site_id
+    """,
+)
+def cells_per_site(ran_cell_dim):
+    """Cell counts, 5G cells and user capacity per RAN site"""
+    cells = ran_cell_dim.assign(
+        is_5g=(ran_cell_dim["technology"] == "5G NR").astype(int),
+        not_active=(ran_cell_dim["status"] != "Active").astype(int),
+    )
+    out = cells.groupby("site_id", as_index=False).agg(
+        cells=("technology", "size"),
+        cells_5g=("is_5g", "sum"),
+        max_connected_users=("max_connected_users", "sum"),
+        cells_not_active=("not_active", "sum"),
+    )
+    return out.sort_values("site_id", ignore_index=True)
+
+
+@dataset(
+    "site_network_status",
+    {
+        "ran_site_dim": ["site_id", "site_name", "site_type", "city", "latitude", "longitude", "technology", "status"],
+        "ran_cell_dim": ["site_id", "technology", "max_connected_users", "status"],
+        "network_element_dim": ["site_key", "status"],
+    },
+    query="""
+        WITH cells AS (
+            SELECT site_id,
+                   COUNT(*) AS cells,
+                   CAST(SUM(CASE WHEN technology = '5G NR' THEN 1 ELSE 0 END) AS BIGINT) AS cells_5g,
+                   CAST(SUM(max_connected_users) AS BIGINT) AS max_connected_users,
+                   CAST(SUM(CASE WHEN status = 'Active' THEN 0 ELSE 1 END) AS BIGINT) AS cells_not_active
+            FROM ran_cell_dim
+            GROUP BY site_id
+        ), elements AS (
+            SELECT site_key AS site_id,
+                   COUNT(*) AS elements,
+                   CAST(SUM(CASE WHEN status = 'Active' THEN 0 ELSE 1 END) AS BIGINT) AS open_alarms,
+                   CAST(SUM(CASE WHEN status = 'Offline' THEN 1 ELSE 0 END) AS BIGINT) AS critical_alarms,
+                   MAX(CASE status WHEN 'Offline' THEN 3 WHEN 'Degraded' THEN 2 WHEN 'Maintenance' THEN 1 ELSE 0 END)
+                       AS element_rank
+            FROM network_element_dim
+            GROUP BY site_key
+        )
+        SELECT s.site_id, s.site_name, s.site_type, s.city, s.latitude, s.longitude, s.technology,
+               s.status,
+               COALESCE(c.cells, 0) AS cells,
+               COALESCE(c.cells_5g, 0) AS cells_5g,
+               COALESCE(c.max_connected_users, 0) AS max_connected_users,
+               COALESCE(c.cells_not_active, 0) AS cells_not_active,
+               COALESCE(e.elements, 0) AS elements,
+               COALESCE(e.open_alarms, 0) AS open_alarms,
+               COALESCE(e.critical_alarms, 0) AS critical_alarms,
+               CAST(GREATEST(CASE s.status WHEN 'Offline' THEN 3 WHEN 'Degraded' THEN 2 WHEN 'Maintenance' THEN 1 ELSE 0 END,
+                             COALESCE(e.element_rank, 0)) AS BIGINT) AS status_rank
+        FROM ran_site_dim s
+        LEFT JOIN cells c ON c.site_id = s.site_id
+        LEFT JOIN elements e ON e.site_id = s.site_id
+        WHERE s.latitude IS NOT NULL AND s.longitude IS NOT NULL
+        ORDER BY s.site_id
+    """,
+)
+def site_network_status(ran_site_dim, ran_cell_dim, network_element_dim):
+    """RAN sites with cell capacity, open element alarms and a 0-3 status rank (3 = Offline)"""
+    ranks = {"Offline": 3, "Degraded": 2, "Maintenance": 1}
+    cells = cells_per_site(ran_cell_dim)
+    elements = network_element_dim.assign(
+        open_alarms=(network_element_dim["status"] != "Active").astype(int),
+        critical_alarms=(network_element_dim["status"] == "Offline").astype(int),
+        element_rank=network_element_dim["status"].map(ranks).fillna(0).astype(int),
+    ).groupby("site_key", as_index=False).agg(
+        elements=("status", "size"),
+        open_alarms=("open_alarms", "sum"),
+        critical_alarms=("critical_alarms", "sum"),
+        element_rank=("element_rank", "max"),
+    ).rename(columns={"site_key": "site_id"})
+    out = (ran_site_dim.dropna(subset=["latitude", "longitude"])
+           .merge(cells, on="site_id", how="left")
+           .merge(elements, on="site_id", how="left"))
+    counts = ["cells", "cells_5g", "max_connected_users", "cells_not_active",
+              "elements", "open_alarms", "critical_alarms", "element_rank"]
+    out[counts] = out[counts].fillna(0).astype(int)
+    out["status_rank"] = out["status"].map(ranks).fillna(0).astype(int).combine(out["element_rank"], max)
+    return out.drop(columns="element_rank").sort_values("site_id", ignore_index=True)
+
+
+# ---------------------------------------------------------------------------
+# Customers & sales
+# ---------------------------------------------------------------------------
+
+@dataset(
+    "churn_by_reason",
+    {"mobile_churn_fact": ["churn_reason", "lifetime_value", "port_out"]},
+    query="""
+        SELECT churn_reason,
+               COUNT(*) AS churned,
+               SUM(lifetime_value) AS lifetime_value_lost,
+               AVG(CASE WHEN port_out THEN 1.0 ELSE 0.0 END) AS port_out_rate
+        FROM mobile_churn_fact
+        GROUP BY churn_reason
+        ORDER BY churned DESC, churn_reason
+    """,
+)
+def churn_by_reason(mobile_churn_fact):
+    """Churned subscribers, lost lifetime value and port-out rate by churn reason"""
+    port_out = mobile_churn_fact["port_out"].astype(str).str.lower() == "true"
+    out = mobile_churn_fact.assign(port_out=port_out.astype(float)).groupby("churn_reason", as_index=False).agg(
+        churned=("port_out", "size"),
+        lifetime_value_lost=("lifetime_value", "sum"),
+        port_out_rate=("port_out", "mean"),
+    )
+    return out.sort_values(["churned", "churn_reason"], ascending=[False, True], ignore_index=True)
+
+
+@dataset(
+    "sim_activations_daily",
+    {"sim_activation_fact": ["activation_timestamp", "activation_channel", "activation_status",
+                             "time_to_activate_hours"]},
+    query="""
+        SELECT CAST(activation_timestamp AS DATE) AS activation_date,
+               activation_channel,
+               COUNT(*) AS activations,
+               CAST(SUM(CASE WHEN activation_status = 'Completed' THEN 1 ELSE 0 END) AS BIGINT) AS completed,
+               AVG(time_to_activate_hours) AS avg_hours_to_activate
+        FROM sim_activation_fact
+        WHERE activation_timestamp IS NOT NULL
+        GROUP BY 1, 2
+        ORDER BY 1, 2
+    """,
+)
+def sim_activations_daily(sim_activation_fact):
+    """SIM activations per day and channel with completion count and activation time"""
+    df = sim_activation_fact.dropna(subset=["activation_timestamp"])
+    df = df.assign(
+        activation_date=pd.to_datetime(df["activation_timestamp"]).dt.normalize(),
+        completed=(df["activation_status"] == "Completed").astype(int),
+    )
+    out = df.groupby(["activation_date", "activation_channel"], as_index=False).agg(
+        activations=("completed", "size"),
+        completed=("completed", "sum"),
+        avg_hours_to_activate=("time_to_activate_hours", "mean"),
+    )
+    return out.sort_values(["activation_date", "activation_channel"], ignore_index=True)
+
+
+@dataset(
+    "sales_monthly",
+    {"sales_fact": ["date", "region_key", "amount", "units"]},
+    query="""
+        SELECT DATE_TRUNC('month', CAST(date AS DATE)) AS month,
+               region_key,
+               SUM(amount) AS amount,
+               CAST(SUM(units) AS BIGINT) AS units
+        FROM sales_fact
+        GROUP BY 1, 2
+        ORDER BY 1, 2
+    """,
+)
+def sales_monthly(sales_fact):
+    """Sales amount and units per month and region"""
+    month = pd.to_datetime(sales_fact["date"]).dt.to_period("M").dt.to_timestamp()
+    out = sales_fact.assign(month=month).groupby(["month", "region_key"], as_index=False)[["amount", "units"]].sum()
+    return out.sort_values(["month", "region_key"], ignore_index=True)
@@ -0,0 +1,21 @@
+"""Fragment-scoped reruns for interactive page panels.
+
+A panel function wrapped with :func:`fragment` reruns on its own when one of
+its widgets changes: Streamlit re-executes just that function and sends only
+its elements, instead of rerunning ``main()``, the sidebar and every chart on
+the page. With ``run_every`` it also reruns on a timer. On Streamlit versions
+without ``st.fragment`` (or ``st.experimental_fragment``) the function is
+returned unchanged and widget changes rerun the whole page as before.
+"""
+
+import streamlit as st
+
+
+def fragment(func=None, *, run_every=None):
+    """Decorator: run ``func`` as a Streamlit fragment when the running Streamlit supports it."""
+    if func is None:
+        return lambda f: fragment(f, run_every=run_every)
+    decorator = getattr(st, "fragment", None) or getattr(st, "experimental_fragment", None)
+    if decorator is None:
+        return func
+    return decorator(func, run_every=run_every)
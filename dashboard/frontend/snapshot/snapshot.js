@@ -0,0 +1,116 @@
+// Page switcher for the static snapshot written by dashboard/snapshot.py.
+//
+// Every page is a <template id="page-KEY"> with its chart specs, datasets and
+// Graphviz sources in <script type="application/json" id="data-KEY">. The
+// location hash selects the page; switching clones the template into <main>.
+// Charts are embedded when they first scroll into view (or their tab is
+// opened), so a page switch only pays for what is on screen.
+
+const main = document.getElementById('snap-main');
+const pageData = {};
+const vegaConfig = {
+    font: '"Source Sans Pro", sans-serif',
+    background: 'transparent',
+    view: {stroke: null},
+    axis: {labelColor: '#31333F', titleColor: '#31333F', gridColor: '#E6EAF1', domainColor: '#E6EAF1', tickColor: '#E6EAF1'},
+    legend: {labelColor: '#31333F', titleColor: '#31333F'},
+    title: {color: '#31333F'},
+};
+let vizInstance = null;
+
+function dataFor(key) {
+    if (!(key in pageData)) {
+        const script = document.getElementById('data-' + key);
+        pageData[key] = script ? JSON.parse(script.textContent) : {charts: [], datasets: {}, graphs: []};
+    }
+    return pageData[key];
+}
+
+function embedChart(el, data) {
+    const spec = Object.assign({}, data.charts[Number(el.dataset.chart)]);
+    // Datasets are shared by the page's charts; hand each chart only the ones it names
+    const text = JSON.stringify(spec);
+    spec.datasets = {};
+    Object.keys(data.datasets).forEach(name => {
+        if (text.includes('"' + name + '"')) spec.datasets[name] = data.datasets[name];
+    });
+    spec.config = Object.assign({}, vegaConfig, spec.config);
+    if (typeof vegaEmbed === 'undefined') {
+        el.textContent = 'Charts need vendor/vega-embed.min.js';
+        return;
+    }
+    vegaEmbed(el, spec, {actions: false}).catch(error => { el.textContent = String(error); });
+}
+
+function embedGraph(el, data) {
+    const source = data.graphs[Number(el.dataset.graph)];
+    if (typeof Viz === 'undefined') {
+        el.innerHTML = '<pre></pre>';
+        el.firstChild.textContent = source;
+        return;
+    }
+    vizInstance = vizInstance || Viz.instance();
+    vizInstance.then(viz => el.replaceChildren(viz.renderSVGElement(source)));
+}
+
+const observer = new IntersectionObserver(entries => {
+    entries.forEach(entry => {
+        if (!entry.isIntersecting) return;
+        const el = entry.target;
+        observer.unobserve(el);
+        const data = dataFor(main.dataset.page);
+        if (el.dataset.chart !== undefined) embedChart(el, data);
+        else embedGraph(el, data);
+    });
+}, {rootMargin: '200px'});
+
+function fitIframe(iframe) {
+    try {
+        const body = iframe.contentDocument && iframe.contentDocument.body;
+        if (body) iframe.style.height = Math.max(body.scrollHeight, 20) + 'px';
+    } catch (error) {
+        // Cross-origin src iframes keep their CSS height
+    }
+}
+
+function show(key) {
+    const template = document.getElementById('page-' + key);
+    if (!template) {
+        key = window.SNAPSHOT_DEFAULT_PAGE;
+    }
+    observer.disconnect();
+    main.dataset.page = key;
+    main.replaceChildren(document.getElementById('page-' + key).content.cloneNode(true));
+    main.querySelectorAll('[data-chart], [data-graph]').forEach(el => observer.observe(el));
+    main.querySelectorAll('iframe.snap-iframe').forEach(iframe => {
+        iframe.addEventListener('load', () => fitIframe(iframe));
+    });
+    document.querySelectorAll('.snap-sidebar a[data-page]').forEach(link => {
+        link.classList.toggle('active', link.dataset.page === key);
+    });
+    window.scrollTo(0, 0);
+}
+
+function route() {
+    show(decodeURIComponent(location.hash.slice(1)) || window.SNAPSHOT_DEFAULT_PAGE);
+}
+
+document.addEventListener('click', event => {
+    const tab = event.target.closest('.snap-tab');
+    if (tab) {
+        const tabs = tab.closest('.snap-tabs');
+        const buttons = Array.from(tab.parentElement.children);
+        const panels = Array.from(tabs.children).filter(el => el.classList.contains('snap-tab-panel'));
+        buttons.forEach((button, i) => {
+            button.classList.toggle('active', button === tab);
+            panels[i].classList.toggle('active', button === tab);
+        });
+        return;
+    }
+    // Persona Hub tiles navigate as they do in the app
+    const tile = event.target.closest('.persona-tile[data-key], .persona-tile-featured[data-key]');
+    if (tile) location.hash = tile.dataset.key;
+});
+
+window.addEventListener('hashchange', route);
+route();
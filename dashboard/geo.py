@@ -0,0 +1,233 @@
+"""Site geometry and the aggregated network map layer.
+
+:func:`site_geometry` reads ran_site_dim (the ``ran_sites`` dataset) once per
+process and data backend and keeps the coordinates as read-only numpy arrays,
+together with each site's UK region and, for every map detail level, the index
+of the grid bin it falls in. Everything is computed with vectorized numpy
+operations, and the object is shared by all sessions (``st.cache_resource``),
+so reruns neither rebuild nor copy it. The Alert Center and CNO maps and the
+CNO coverage-by-region panel all read from it.
+
+The map layer (:func:`render_network_map`) aggregates the
+``site_network_status`` dataset (cell counts from ran_cell_dim, open alarms
+from network_element_dim) over those bins on the server. Each bin carries its
+site, cell and alarm totals, the sum of its cells' max connected users and its
+worst status, so the browser only receives one point per bin however many
+sites and cells are behind it. The bins for each level are computed once per
+process and shared, read-only, by every session.
+"""
+
+import math
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from dashboard import data
+from dashboard.fragments import fragment
+
+# Detail level -> grid cell height in degrees of latitude (None: one point per site)
+LEVELS = {"Country": 1.0, "Region": 0.4, "City": 0.1, "Site": None}
+DEFAULT_LEVEL = "Region"
+
+# Grid cells are made roughly square at the UK's latitude
+REFERENCE_LATITUDE = 54.0
+
+# Index = status rank from site_network_status (0 healthy .. 3 offline)
+STATUSES = ("healthy", "minor", "major", "critical")
+STATUS_LABELS = ("Healthy", "Minor", "Major", "Critical")
+STATUS_COLORS = ("#10B981", "#3B82F6", "#F59E0B", "#DC2626")
+_STATUS_RGBA = np.array([[16, 185, 129, 190], [59, 130, 246, 200], [245, 158, 11, 210], [220, 38, 38, 220]])
+
+REGIONS = {
+    "London & South East": ("Greater London", "Berkshire", "Buckinghamshire", "East Sussex", "Hampshire",
+                            "Oxfordshire", "Surrey", "Kent"),
+    "East of England": ("Cambridgeshire", "Essex", "Norfolk", "Suffolk"),
+    "South West": ("Avon", "Devon", "Somerset", "Cornwall", "Dorset"),
+    "Midlands": ("Derbyshire", "Leicestershire", "Nottinghamshire", "West Midlands", "Staffordshire"),
+    "North West": ("Cheshire", "Greater Manchester", "Lancashire", "Merseyside", "Cumbria"),
+    "Yorkshire": ("East Yorkshire", "North Yorkshire", "South Yorkshire", "West Yorkshire"),
+    "North East": ("Tyne and Wear", "Durham", "Northumberland"),
+    "Scotland": ("Scotland",),
+    "Wales": ("Wales",),
+    "Northern Ireland": ("Northern Ireland",),
+}
+OTHER_REGION = "Other"
+_COUNTY_REGION = {county: region for region, counties in REGIONS.items() for county in counties}
+
+TOOLTIP = {
+    "html": "<b>{label}</b><br/>{sites} sites · {cells} cells ({cells_5g} 5G)<br/>"
+            "{open_alarms} open alarms · {critical_alarms} critical<br/>{max_connected_users} max connected users",
+    "style": {"backgroundColor": "#1B2A4E", "color": "white", "fontSize": "0.75rem"},
+}
+
+
+def _frozen(values):
+    values = np.ascontiguousarray(values)
+    values.flags.writeable = False
+    return values
+
+
+class SiteGeometry:
+    """Read-only per-site arrays, sorted by site_id, plus grid bin indices per detail level."""
+
+    def __init__(self, sites):
+        sites = sites.dropna(subset=["latitude", "longitude"]).sort_values("site_id")
+        self.site_id = _frozen(sites["site_id"].to_numpy(dtype=np.int64))
+        self.latitude = _frozen(sites["latitude"].to_numpy(dtype=float))
+        self.longitude = _frozen(sites["longitude"].to_numpy(dtype=float))
+        self.city_names, city = np.unique(sites["city"].astype(str).to_numpy(), return_inverse=True)
+        self.city = _frozen(city)
+        self.site_name = _frozen(sites["site_name"].astype(str).to_numpy())
+        self.region_names = tuple(REGIONS) + (OTHER_REGION,)
+        region = sites["county"].map(_COUNTY_REGION).fillna(OTHER_REGION)
+        self.region = _frozen(region.map(self.region_names.index).to_numpy(dtype=np.int8))
+        self.is_5g = _frozen(sites["technology"].astype(str).str.contains("5G").to_numpy())
+        self.is_active = _frozen((sites["status"] == "Active").to_numpy())
+        # level -> (bin index per site, number of bins)
+        self.bins = {level: self._grid(cell_degrees) for level, cell_degrees in LEVELS.items()}
+
+    def __len__(self):
+        return len(self.site_id)
+
+    def _grid(self, cell_degrees):
+        if cell_degrees is None:
+            return _frozen(np.arange(len(self))), len(self)
+        lon_degrees = cell_degrees / math.cos(math.radians(REFERENCE_LATITUDE))
+        cells = np.stack([np.floor(self.latitude / cell_degrees), np.floor(self.longitude / lon_degrees)], axis=1)
+        keys, index = np.unique(cells, axis=0, return_inverse=True)
+        return _frozen(index.ravel()), len(keys)
+
+    def positions(self, site_ids):
+        """Row of each of ``site_ids`` in the geometry arrays, -1 where the site is unknown."""
+        site_ids = np.asarray(site_ids, dtype=np.int64)
+        if not len(self):
+            return np.full(len(site_ids), -1)
+        pos = np.searchsorted(self.site_id, site_ids).clip(max=len(self) - 1)
+        return np.where(self.site_id[pos] == site_ids, pos, -1)
+
+    def region_summary(self):
+        """Sites, 5G-capable share and active share per region, largest region first."""
+        regions = len(self.region_names)
+        sites = np.bincount(self.region, minlength=regions)
+        sites_5g = np.bincount(self.region, weights=self.is_5g, minlength=regions)
+        active = np.bincount(self.region, weights=self.is_active, minlength=regions)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            summary = pd.DataFrame({
+                "region": self.region_names,
+                "sites": sites,
+                "pct_5g": (100 * sites_5g / sites).round(1),
+                "pct_active": (100 * active / sites).round(1),
+            })
+        return summary[summary["sites"] > 0].sort_values("sites", ascending=False, ignore_index=True)
+
+
+@st.cache_resource(show_spinner=False)
+def site_geometry(backend_name=None):
+    """The process-wide :class:`SiteGeometry` for ``backend_name`` (default backend)."""
+    return SiteGeometry(data.load("ran_sites", backend_name))
+
+
+def bin_sites(geometry, sites, level):
+    """Aggregate ``sites`` (site_network_status rows) into ``geometry``'s bins for ``level``."""
+    pos = geometry.positions(sites["site_id"].to_numpy())
+    known = pos >= 0
+    pos = pos[known]
+    sites = sites[known]
+    index, n_bins = geometry.bins[level]
+    b = index[pos]
+
+    def total(column):
+        return np.bincount(b, weights=sites[column].to_numpy(dtype=float), minlength=n_bins).astype(np.int64)
+
+    count = np.bincount(b, minlength=n_bins)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        lat = np.bincount(b, weights=geometry.latitude[pos], minlength=n_bins) / count
+        lon = np.bincount(b, weights=geometry.longitude[pos], minlength=n_bins) / count
+    rank = np.zeros(n_bins, dtype=np.int64)
+    np.maximum.at(rank, b, sites["status_rank"].to_numpy(dtype=np.int64))
+    # The first site of each bin names it; "+N" counts the other cities in the bin
+    first = np.zeros(n_bins, dtype=np.int64)
+    first[b[::-1]] = pos[::-1]
+    city_pairs = np.unique(np.stack([b, geometry.city[pos]], axis=1), axis=0)
+    cities = np.bincount(city_pairs[:, 0], minlength=n_bins)
+
+    keep = count > 0
+    first, cities, rank = first[keep], cities[keep], rank[keep]
+    if LEVELS[level] is None:
+        label = geometry.site_name[first]
+    else:
+        label = geometry.city_names[geometry.city[first]].astype(object)
+        label = np.where(cities > 1, label + " +" + (cities - 1).astype(str), label)
+    out = pd.DataFrame({
+        "lat": lat[keep],
+        "lon": lon[keep],
+        "label": label.astype(str),
+        "sites": count[keep],
+        "cells": total("cells")[keep],
+        "cells_5g": total("cells_5g")[keep],
+        "max_connected_users": total("max_connected_users")[keep],
+        "open_alarms": total("open_alarms")[keep],
+        "critical_alarms": total("critical_alarms")[keep],
+        "status": np.asarray(STATUSES)[rank],
+        "color": _STATUS_RGBA[rank].tolist(),
+        # Pixels; area grows with the number of sites in the bin
+        "radius": (4 + 3 * np.sqrt(count[keep])).round(1),
+    })
+    # Worst bins last so they are drawn on top
+    return out.iloc[np.lexsort((out["sites"].to_numpy(), rank))].reset_index(drop=True)
+
+
+@st.cache_resource(show_spinner=False, ttl=data.DATASETS["site_network_status"].ttl)
+def site_bins(level, backend_name):
+    """(bins, sites per status, total sites, total cells) for detail ``level``; do not modify."""
+    sites = data.load("site_network_status", backend_name)
+    counts = np.bincount(sites["status_rank"].to_numpy(dtype=int), minlength=len(STATUSES))
+    bins = data.freeze(bin_sites(site_geometry(backend_name), sites, level))
+    return bins, tuple(zip(STATUSES, counts.tolist())), len(sites), int(sites["cells"].sum())
+
+
+def _deck(bins, zoom):
+    import pydeck as pdk
+
+    layer = pdk.Layer(
+        "ScatterplotLayer",
+        data=bins.drop(columns="status"),
+        get_position="[lon, lat]",
+        get_fill_color="color",
+        get_radius="radius",
+        radius_units="pixels",
+        pickable=True,
+        stroked=True,
+        get_line_color=[255, 255, 255, 160],
+        line_width_min_pixels=1,
+    )
+    view = pdk.ViewState(latitude=REFERENCE_LATITUDE, longitude=-2.6, zoom=zoom)
+    return pdk.Deck(layers=[layer], initial_view_state=view, tooltip=TOOLTIP, map_style=None)
+
+
+@fragment
+def render_network_map(key, level=DEFAULT_LEVEL, height=420, zoom=4.6):
+    """Site status map with a detail slider; reruns on its own when the level changes."""
+    level = st.select_slider("Map detail", options=list(LEVELS), value=level, key=f"{key}_level",
+                             label_visibility="collapsed")
+    try:
+        bins, status_counts, total_sites, total_cells = site_bins(level, data.get_backend().name)
+        status_counts = dict(status_counts)
+    except data.TableNotFound as exc:
+        st.info(f"Site map unavailable: {exc}")
+        return
+    st.pydeck_chart(_deck(bins, zoom), height=height, use_container_width=True)
+    legend = "".join(
+        f'<span><span style="color: {color};">●</span> {label} ({status_counts[status]:,})</span>'
+        for status, label, color in reversed(list(zip(STATUSES, STATUS_LABELS, STATUS_COLORS)))
+    )
+    st.markdown(f"""
+    <div style="display: flex; justify-content: center; gap: 1.5rem; margin-top: 0.5rem; font-size: 0.8rem;">
+        {legend}
+    </div>
+    <div style="text-align: center; font-size: 0.75rem; color: #6B7280; margin-top: 0.25rem;">
+        {total_sites:,} sites · {total_cells:,} cells in {len(bins):,} map points · colour = worst site status,
+        size = sites per point
+    </div>
+    """, unsafe_allow_html=True)
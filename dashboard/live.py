@@ -0,0 +1,432 @@
+"""Live Data Simulation behind the "📡 Live Data Simulation" toggle.
+
+While the toggle is on, a background thread generates synthetic events shaped
+like three fact tables:
+
+- ``alarms``: network_alarm_fact (raised on elements from network_element_dim)
+- ``calls``: contact_center_call_fact
+- ``activations``: sim_activation_fact
+
+using the value mixes of the data generators. Each stream is written to a
+:class:`RingBuffer`: preallocated numpy columns, with strings stored as small
+integer codes into a fixed vocabulary, so memory stays constant however long
+the simulation runs and a batch of thousands of events is a handful of slice
+assignments. Readers copy out only the rows they show, decoded to a DataFrame.
+
+One :class:`Simulator` is shared by every session of the process
+(:func:`get_simulator`). Pages call :meth:`Simulator.touch` when they read it;
+the thread stops by itself once nobody has read it for ``IDLE_TIMEOUT``
+seconds and starts again on the next read. The sidebar ticker and the Alert
+Center feed are fragments rerun every ``REFRESH_SECONDS``, so the rest of the
+page is not re-executed while events stream in.
+"""
+
+import collections
+import threading
+import time
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from dashboard.fragments import fragment
+
+WIDGET_KEY = "realtime"
+
+# Events per second across the three streams, and each stream's share
+DEFAULT_RATE = 2000
+STREAM_SHARES = {"alarms": 0.2, "calls": 0.5, "activations": 0.3}
+TICK_SECONDS = 0.1
+# Rows kept per stream
+BUFFER_CAPACITY = 50_000
+IDLE_TIMEOUT = 30
+REFRESH_SECONDS = 2
+
+# Value mixes and rates from scripts/generate_history.py (the 2024/2025 generators)
+ALARM_TYPES = ("Hardware Failure", "Software Error", "Capacity Warning", "Connectivity Loss",
+               "Performance Degradation", "Security Alert", "Configuration Error")
+SEVERITIES = ("Critical", "Major", "Minor", "Warning")
+SEVERITY_WEIGHTS = (0.05, 0.15, 0.40, 0.40)
+# Minutes until an alarm of each severity clears (low, high)
+CLEAR_MINUTES = ((15, 120), (30, 240), (60, 480), (120, 720))
+ROOT_CAUSES = ("Hardware", "Software", "Configuration", "External", "Unknown", "Capacity")
+IMPACTS = ("Service Affecting", "Customer Impacting", "Performance", "None")
+ACKNOWLEDGED_RATE = 0.90
+
+QUEUES = ("Sales", "Support", "Billing", "Technical", "Retention", "Partner")
+CUSTOMER_TYPES = ("Consumer", "SMB", "Enterprise")
+CUSTOMER_TYPE_WEIGHTS = (0.70, 0.20, 0.10)
+DISPOSITIONS = ("Resolved", "Callback", "Transfer", "Escalated", "Abandoned")
+DISPOSITION_WEIGHTS = (0.55, 0.15, 0.10, 0.10, 0.10)
+# Share of resolved calls that count as first-call resolutions (2024 rate)
+FIRST_CALL_RESOLUTION_RATE = 0.65
+
+ACTIVATION_CHANNELS = ("Online", "Retail Store", "Partner", "Telesales", "Self-Service")
+ACTIVATION_CHANNEL_WEIGHTS = (0.30, 0.25, 0.20, 0.15, 0.10)
+ACTIVATION_STATUSES = ("Completed", "Pending", "Failed", "Cancelled")
+ACTIVATION_STATUS_WEIGHTS = (0.85, 0.08, 0.04, 0.03)
+ACTIVATION_TYPES = ("New Activation", "Replacement", "SIM Swap", "Upgrade", "Port-In")
+ACTIVATION_TYPE_WEIGHTS = (0.35, 0.25, 0.20, 0.12, 0.08)
+
+# Used when network_element_dim cannot be loaded
+_FALLBACK_ELEMENTS = pd.DataFrame({
+    "element_id": range(1, 11),
+    "element_type": ["Router", "Switch", "Firewall", "Load Balancer", "Router",
+                     "Switch", "Router", "Firewall", "Switch", "Router"],
+    "city": ["London", "Manchester", "Birmingham", "Leeds", "Glasgow",
+             "Liverpool", "Bristol", "Edinburgh", "Cardiff", "Belfast"],
+})
+
+
+class RingBuffer:
+    """Fixed-capacity columnar buffer; the newest ``capacity`` rows are kept.
+
+    ``schema`` maps column name to numpy dtype. ``total`` counts every row ever
+    appended and doubles as a sequence number for :meth:`tail`.
+    """
+
+    def __init__(self, schema, capacity=BUFFER_CAPACITY):
+        self.capacity = capacity
+        self.columns = {name: np.zeros(capacity, dtype=dtype) for name, dtype in schema.items()}
+        self.total = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return min(self.total, self.capacity)
+
+    @property
+    def nbytes(self):
+        return sum(column.nbytes for column in self.columns.values())
+
+    def append(self, batch):
+        """Append ``batch`` ({column: array}, equal lengths) with at most two slice writes per column."""
+        n = len(next(iter(batch.values())))
+        if n == 0:
+            return
+        skip = max(n - self.capacity, 0)
+        with self._lock:
+            start = (self.total + skip) % self.capacity
+            first = min(n - skip, self.capacity - start)
+            for name, column in self.columns.items():
+                values = batch[name][skip:]
+                column[start:start + first] = values[:first]
+                column[:len(values) - first] = values[first:]
+            self.total += n
+
+    def tail(self, n=None, since=None):
+        """Copy of the newest rows, oldest first: the last ``n``, and only those after sequence ``since``."""
+        with self._lock:
+            count = len(self)
+            if n is not None:
+                count = min(count, n)
+            if since is not None:
+                count = min(count, max(self.total - since, 0))
+            index = np.arange(self.total - count, self.total) % self.capacity
+            return {name: column[index] for name, column in self.columns.items()}, self.total
+
+
+def _choice(rng, n, weights):
+    return rng.choice(len(weights), size=n, p=weights).astype(np.int8)
+
+
+def _decode(codes, values):
+    return pd.Categorical.from_codes(codes, categories=list(values))
+
+
+def _timestamps(seconds):
+    return pd.to_datetime(seconds, unit="s", utc=True).tz_convert(None)
+
+
+class AlarmStream:
+    name = "alarms"
+    schema = {
+        "alarm_id": np.int64, "element": np.int32, "alarm_type": np.int8, "severity": np.int8,
+        "raised_time": np.float64, "alarm_duration_minutes": np.int16, "acknowledged": np.bool_,
+        "root_cause": np.int8, "impact": np.int8,
+    }
+
+    def __init__(self, elements):
+        self.elements = elements.reset_index(drop=True)
+        self._clear_low = np.array([low for low, _ in CLEAR_MINUTES])
+        self._clear_high = np.array([high for _, high in CLEAR_MINUTES])
+
+    def generate(self, rng, n, now, first_id):
+        severity = _choice(rng, n, SEVERITY_WEIGHTS)
+        return {
+            "alarm_id": np.arange(first_id, first_id + n, dtype=np.int64),
+            "element": rng.integers(0, len(self.elements), n, dtype=np.int32),
+            "alarm_type": rng.integers(0, len(ALARM_TYPES), n, dtype=np.int8),
+            "severity": severity,
+            "raised_time": now + rng.random(n) * TICK_SECONDS,
+            "alarm_duration_minutes": rng.integers(self._clear_low[severity], self._clear_high[severity] + 1),
+            "acknowledged": rng.random(n) < ACKNOWLEDGED_RATE,
+            "root_cause": rng.integers(0, len(ROOT_CAUSES), n, dtype=np.int8),
+            "impact": rng.integers(0, len(IMPACTS), n, dtype=np.int8),
+        }
+
+    def decode(self, rows):
+        element = self.elements.iloc[rows["element"]]
+        return pd.DataFrame({
+            "alarm_id": rows["alarm_id"],
+            "element_id": element["element_id"].to_numpy(),
+            "element_type": element["element_type"].to_numpy(),
+            "city": element["city"].to_numpy(),
+            "alarm_type": _decode(rows["alarm_type"], ALARM_TYPES),
+            "severity": _decode(rows["severity"], SEVERITIES),
+            "raised_time": _timestamps(rows["raised_time"]),
+            "alarm_duration_minutes": rows["alarm_duration_minutes"],
+            "acknowledged": rows["acknowledged"],
+            "root_cause": _decode(rows["root_cause"], ROOT_CAUSES),
+            "impact": _decode(rows["impact"], IMPACTS),
+        })
+
+
+class CallStream:
+    name = "calls"
+    schema = {
+        "call_id": np.int64, "customer_key": np.int32, "customer_type": np.int8, "agent_key": np.int16,
+        "queue": np.int8, "start_time": np.float64, "wait_time_secs": np.int16, "handle_time_secs": np.int16,
+        "disposition": np.int8, "transfer_count": np.int8, "csat_score": np.int8,
+        "is_first_call_resolved": np.bool_,
+    }
+
+    def generate(self, rng, n, now, first_id):
+        disposition = _choice(rng, n, DISPOSITION_WEIGHTS)
+        abandoned = disposition == DISPOSITIONS.index("Abandoned")
+        return {
+            "call_id": np.arange(first_id, first_id + n, dtype=np.int64),
+            "customer_key": rng.integers(1, 1_000_001, n, dtype=np.int32),
+            "customer_type": _choice(rng, n, CUSTOMER_TYPE_WEIGHTS),
+            "agent_key": rng.integers(1, 501, n, dtype=np.int16),
+            "queue": rng.integers(0, len(QUEUES), n, dtype=np.int8),
+            "start_time": now + rng.random(n) * TICK_SECONDS,
+            "wait_time_secs": rng.integers(30, 601, n, dtype=np.int16),
+            "handle_time_secs": np.where(abandoned, 0, rng.integers(120, 1801, n)).astype(np.int16),
+            "disposition": disposition,
+            "transfer_count": np.where(disposition == DISPOSITIONS.index("Transfer"),
+                                       rng.integers(1, 4, n), 0).astype(np.int8),
+            # 0 = no survey answered
+            "csat_score": np.where(abandoned | (rng.random(n) < 0.6), 0, rng.integers(1, 6, n)).astype(np.int8),
+            "is_first_call_resolved": (disposition == 0) & (rng.random(n) < FIRST_CALL_RESOLUTION_RATE),
+        }
+
+    def decode(self, rows):
+        return pd.DataFrame({
+            "call_id": rows["call_id"],
+            "customer_key": rows["customer_key"],
+            "customer_type": _decode(rows["customer_type"], CUSTOMER_TYPES),
+            "agent_key": rows["agent_key"],
+            "queue": _decode(rows["queue"], QUEUES),
+            "start_time": _timestamps(rows["start_time"]),
+            "wait_time_secs": rows["wait_time_secs"],
+            "handle_time_secs": rows["handle_time_secs"],
+            "disposition": _decode(rows["disposition"], DISPOSITIONS),
+            "transfer_count": rows["transfer_count"],
+            "csat_score": pd.Series(rows["csat_score"], dtype="Int8").mask(lambda s: s == 0).array,
+            "is_first_call_resolved": rows["is_first_call_resolved"],
+        })
+
+
+class ActivationStream:
+    name = "activations"
+    schema = {
+        "order_id": np.int64, "subscriber_key": np.int32, "sim_iccid": np.int64,
+        "order_timestamp": np.float64, "time_to_activate_hours": np.float32, "activation_channel": np.int8,
+        "activation_status": np.int8, "activation_type": np.int8,
+    }
+
+    def generate(self, rng, n, now, first_id):
+        status = _choice(rng, n, ACTIVATION_STATUS_WEIGHTS)
+        return {
+            "order_id": np.arange(first_id, first_id + n, dtype=np.int64),
+            "subscriber_key": rng.integers(1, 1_000_001, n, dtype=np.int32),
+            "sim_iccid": rng.integers(10 ** 13, 10 ** 14, n, dtype=np.int64),
+            "order_timestamp": now - rng.random(n) * 48 * 3600,
+            "time_to_activate_hours": np.where(status == 0, rng.gamma(1.5, 2.0, n), np.nan).astype(np.float32),
+            "activation_channel": _choice(rng, n, ACTIVATION_CHANNEL_WEIGHTS),
+            "activation_status": status,
+            "activation_type": _choice(rng, n, ACTIVATION_TYPE_WEIGHTS),
+        }
+
+    def decode(self, rows):
+        order_time = _timestamps(rows["order_timestamp"])
+        hours = rows["time_to_activate_hours"].astype(np.float64)
+        return pd.DataFrame({
+            "order_id": [f"ORD-LIVE-{i:09d}" for i in rows["order_id"]],
+            "subscriber_key": rows["subscriber_key"],
+            "sim_iccid": [f"8944{i:014d}" for i in rows["sim_iccid"]],
+            "order_timestamp": order_time,
+            "activation_timestamp": order_time + pd.to_timedelta(hours, unit="h"),
+            "activation_channel": _decode(rows["activation_channel"], ACTIVATION_CHANNELS),
+            "time_to_activate_hours": hours.round(2),
+            "activation_status": _decode(rows["activation_status"], ACTIVATION_STATUSES),
+            "activation_type": _decode(rows["activation_type"], ACTIVATION_TYPES),
+        })
+
+
+class Simulator:
+    """Background generator writing the three event streams into ring buffers."""
+
+    def __init__(self, elements=None, rate=DEFAULT_RATE, capacity=BUFFER_CAPACITY, seed=None):
+        elements = _FALLBACK_ELEMENTS if elements is None or elements.empty else elements
+        self.streams = {stream.name: stream for stream in (AlarmStream(elements), CallStream(), ActivationStream())}
+        self.buffers = {name: RingBuffer(stream.schema, capacity) for name, stream in self.streams.items()}
+        self.rate = rate
+        # (monotonic time, events) of the last ticks, for the measured rate
+        self._ticks = collections.deque(maxlen=50)
+        self._rng = np.random.default_rng(seed)
+        self._thread = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._last_read = time.monotonic()
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def touch(self):
+        """Mark the simulator as read and start the thread if it is not running."""
+        self._last_read = time.monotonic()
+        with self._lock:
+            if not self.running:
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name="snowtelco-live", daemon=True)
+                self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def step(self, seconds=TICK_SECONDS, now=None):
+        """Generate ``seconds`` worth of events at ``rate``; returns the number generated."""
+        now = time.time() if now is None else now
+        generated = 0
+        for name, share in STREAM_SHARES.items():
+            n = int(self._rng.poisson(self.rate * share * seconds))
+            buffer = self.buffers[name]
+            buffer.append(self.streams[name].generate(self._rng, n, now, buffer.total + 1))
+            generated += n
+        self._ticks.append((time.monotonic(), generated))
+        return generated
+
+    def _run(self):
+        next_tick = time.monotonic()
+        while not self._stop.is_set():
+            if time.monotonic() - self._last_read > IDLE_TIMEOUT:
+                return
+            self.step()
+            next_tick += TICK_SECONDS
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                self._stop.wait(delay)
+            else:
+                # Fell behind (e.g. the process was suspended); don't try to catch up
+                next_tick = time.monotonic()
+
+    def recent(self, stream, n=20, since=None):
+        """The newest ``n`` events of ``stream`` (after sequence ``since``), newest first."""
+        rows, _ = self.buffers[stream].tail(n, since)
+        return self.streams[stream].decode(rows).iloc[::-1].reset_index(drop=True)
+
+    def window(self, stream, seconds, time_column):
+        """Raw (undecoded) columns of the events in the last ``seconds``."""
+        rows, _ = self.buffers[stream].tail()
+        keep = rows[time_column] >= time.time() - seconds
+        return {name: values[keep] for name, values in rows.items()}
+
+    def events_per_second(self):
+        """Generation rate measured over the last ticks."""
+        ticks = list(self._ticks)
+        if len(ticks) < 2 or ticks[-1][0] == ticks[0][0]:
+            return 0.0
+        return sum(n for _, n in ticks[1:]) / (ticks[-1][0] - ticks[0][0])
+
+    def stats(self):
+        return {
+            name: {"total": buffer.total, "buffered": len(buffer), "buffer_bytes": buffer.nbytes}
+            for name, buffer in self.buffers.items()
+        }
+
+
+@st.cache_resource(show_spinner=False)
+def get_simulator():
+    """The process-wide simulator, over the network elements of the active data backend."""
+    from dashboard import data
+
+    try:
+        elements = data.load("network_elements")[["element_id", "element_type", "city"]]
+    except (data.TableNotFound, KeyError):
+        elements = None
+    return Simulator(elements)
+
+
+def is_enabled():
+    return bool(st.session_state.get(WIDGET_KEY, False))
+
+
+def _minutes_ago(timestamp, now):
+    seconds = max((now - timestamp).total_seconds(), 0)
+    return "just now" if seconds < 60 else f"{seconds // 60:.0f} min ago"
+
+
+_TICKER_CLASS = {"Critical": "critical", "Major": "warning", "Minor": "info", "Warning": "info"}
+_TICKER_ICON = {"Critical": "🚨", "Major": "⚠️", "Minor": "🔵", "Warning": "🟡"}
+
+
+def ticker_html(simulator, items=6):
+    """Sidebar ticker markup with the newest Critical/Major alarms and the event rates."""
+    alarms = simulator.recent("alarms", 500)
+    alarms = alarms[alarms["severity"].isin(["Critical", "Major"])].head(items)
+    calls = simulator.window("calls", 60, "start_time")
+    activations = simulator.window("activations", 60, "order_timestamp")
+    completed = int((activations["activation_status"] == 0).sum())
+    rows = [
+        f'<span class="ticker-item {_TICKER_CLASS[row.severity]}"><span class="alert-icon">'
+        f'{_TICKER_ICON[row.severity]}</span> {row.severity}: {row.alarm_type} · {row.element_type} {row.city}</span>'
+        for row in alarms.itertuples()
+    ]
+    rows.append(f'<span class="ticker-item success"><span class="alert-icon">📞</span> '
+                f'{len(calls["call_id"]):,} calls in the last minute</span>')
+    rows.append(f'<span class="ticker-item success"><span class="alert-icon">📶</span> '
+                f'{completed:,} SIM activations completed in the last minute</span>')
+    rate = simulator.events_per_second()
+    return f"""
+    <div class="sidebar-ticker">
+        <div class="ticker-header">
+            <span class="ticker-live">● LIVE</span>
+            <span class="ticker-title">Simulated Events · {rate:,.0f}/s</span>
+        </div>
+        <div class="ticker-container ticker-stream">{''.join(rows)}</div>
+    </div>
+    """
+
+
+@fragment(run_every=REFRESH_SECONDS)
+def render_ticker():
+    """Sidebar ticker of simulated events; call only while the simulation is on."""
+    st.markdown(ticker_html(get_simulator().touch()), unsafe_allow_html=True)
+
+
+@fragment(run_every=REFRESH_SECONDS)
+def render_alarm_feed(height=450, items=12):
+    """Alert Center feed: alarm counts for the last minute and the newest alarms, Critical/Major first."""
+    simulator = get_simulator().touch()
+    now = pd.Timestamp.now(tz="UTC").tz_convert(None)
+    window = simulator.window("alarms", 60, "raised_time")
+    counts = np.bincount(window["severity"], minlength=len(SEVERITIES))
+    st.caption(" · ".join(f"**{count:,}** {severity}" for severity, count in zip(SEVERITIES, counts))
+               + " alarms in the last minute")
+    alarms = simulator.recent("alarms", 500)
+    alarms = pd.concat([alarms[alarms["severity"].isin(["Critical", "Major"])], alarms]).drop_duplicates("alarm_id")
+    with st.container(border=True, height=height):
+        for row in alarms.head(items).itertuples():
+            text = (f"**{row.severity.upper()}** — {row.city} - {row.element_type} {row.alarm_type}  \n"
+                    f"{row.impact} • Root cause: {row.root_cause} • *{_minutes_ago(row.raised_time, now)}*")
+            if row.severity == "Critical":
+                st.error("🔴 " + text)
+            elif row.severity == "Major":
+                st.warning("🟠 " + text)
+            else:
+                st.info("🔵 " + text)
@@ -0,0 +1,55 @@
+"""Sidebar navigation component.
+
+A single declared Streamlit component replaces the per-rerun ``components.html``
+iframes that restyled the sidebar on timers and scrolled the page to the top.
+The component iframe stays mounted across reruns, so each rerun only sends it
+the current page and section boundaries. In the other direction it reports
+clicks on Persona Hub tiles as page-change messages.
+"""
+
+import os
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+_FRONTEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend", "navigation")
+_navigation_component = components.declare_component("snowtelco_navigation", path=_FRONTEND_DIR)
+
+NAV_WIDGET_KEY = "nav_unified"
+COMPONENT_KEY = "nav_component"
+HANDLED_NONCE_KEY = "_nav_component_nonce"
+
+SECTION_STYLES = {
+    "exec": {"background": "#E8F4FD", "border": "#29B5E8"},   # Light blue
+    "vp": {"background": "#F3E8FD", "border": "#8B5CF6"},     # Light purple
+    "tools": {"background": "#E8FDF3", "border": "#10B981"},  # Light green
+}
+
+
+def go_to(page_key):
+    """Select ``page_key`` on the next run. Use as a widget ``on_click``/``on_change`` callback."""
+    st.session_state.selected_page = page_key
+    # Drop the radio's own state so it re-initialises from selected_page
+    st.session_state.pop(NAV_WIDGET_KEY, None)
+
+
+def _on_component_change():
+    message = st.session_state.get(COMPONENT_KEY)
+    if not message or message.get("nonce") == st.session_state.get(HANDLED_NONCE_KEY):
+        return
+    st.session_state[HANDLED_NONCE_KEY] = message.get("nonce")
+    go_to(message["page"])
+
+
+def render_navigation(page_key, active_index, exec_end, vp_end):
+    """Send the current page and section boundaries to the navigation component."""
+    _navigation_component(
+        page=page_key,
+        active_index=active_index,
+        exec_end=exec_end,
+        vp_end=vp_end,
+        sections=SECTION_STYLES,
+        key=COMPONENT_KEY,
+        on_change=_on_component_change,
+        default=None,
+    )
@@ -0,0 +1,689 @@
+"""Page metadata and sidebar sections for the demo dashboard.
+
+``PAGES`` maps each persona page key to its title, persona, suggested demo
+duration, focus, semantic views, demo questions and expected insights. It
+lives in an imported module rather than in demo_dashboard_app.py so the
+server holds one copy per process: the app script is re-executed into a fresh
+namespace on every rerun, and each session keeps the namespace of its last
+run alive (widget formatters defined in ``main()`` reference it).
+"""
+
+PAGES = {
+    "Executive_Summary": {
+        "title": "Executive Summary",
+        "persona": "All Executives",
+        "duration": "5 minutes",
+        "focus": "High-level business overview, key metrics at a glance, strategic priorities",
+        "views": ["MOBILE", "FINANCE", "NETWORK_OPS", "SUPPORT", "PROPENSITY"],
+        "questions": [
+            "What is our total subscriber count and how has it changed this quarter?",
+            "Show me our revenue performance - total revenue, ARPU, and growth trends.",
+            "What is our current NPS score across all customer segments?",
+            "How is our network performing? Show me availability and quality metrics.",
+            "What are the top 3 business priorities we should focus on this month?"
+        ],
+        "insights": [
+            "30,000+ total subscribers (70% Consumer, 26% SMB, 4% Enterprise)",
+            "Revenue growth tracking vs targets",
+            "NPS trending by segment",
+            "Network availability: 99.5%+",
+            "Strategic priorities dashboard"
+        ]
+    },
+    "SnowTelco_Website": {
+        "title": "SnowTelco Website",
+        "persona": "Customer / Prospect",
+        "duration": "Browse",
+        "focus": "Customer-facing website showcasing plans, products, and services",
+        "views": [],
+        "questions": [],
+        "insights": []
+    },
+    "Persona_Hub": {
+        "title": "Persona Hub",
+        "persona": "All Users",
+        "duration": "Browse",
+        "focus": "Navigate to any persona dashboard, search by role or topic",
+        "views": [],
+        "questions": [],
+        "insights": []
+    },
+    "00_WOW_Executive_Showcase": {
+        "title": "Executive Showcase",
+        "persona": "CEO / Board Member / Executive Sponsor",
+        "duration": "10-15 minutes",
+        "focus": "Cross-domain analysis, conversational memory, data+document fusion, predictive insights",
+        "views": ["MOBILE", "FINANCE", "NETWORK_OPS", "NETWORK_QOE", "SUPPORT", "PROPENSITY", "MARKET_INTELLIGENCE", "PARTNER", "PORTING", "CUSTOMER_EXPERIENCE", "SLA"],
+        "questions": [
+            "I'm preparing for a board meeting tomorrow. Give me a complete health check of SnowTelco - our subscriber base, revenue performance, customer satisfaction, and network quality. What are the 3 most critical things I need to know?",
+            "Tell me more about our churn situation. What's our current churn rate, which customer segments are most at risk, and how much revenue could we lose?",
+            "Show me the profile of our highest-risk customers. What do they have in common? Are there patterns we should be worried about?",
+            "What retention offers can we make to these at-risk customers? Check our retention policy and tell me what discounts or incentives are available.",
+            "How does our pricing compare to competitors? Are we losing customers because of price?",
+            "Is network quality contributing to our churn? Show me if there's a correlation between network problems and customer satisfaction.",
+            "What about our support experience? Are churned customers calling us more before they leave?",
+            "Based on everything we've discussed, create a prioritized action plan for reducing churn.",
+            "Create an executive summary for my board presentation - 5 bullet points covering business performance, key risks, recommended actions, and expected outcomes."
+        ],
+        "insights": [
+            "Cross-domain analysis spanning multiple semantic views",
+            "Conversational memory building context",
+            "Data + document fusion for policy-aware recommendations",
+            "AI-synthesized strategic recommendations"
+        ]
+    },
+    "01_CEO_Strategic": {
+        "title": "CEO Strategic Overview",
+        "persona": "Chief Executive Officer",
+        "duration": "10 minutes",
+        "focus": "Overall business performance, market position, strategic KPIs, competitive landscape",
+        "views": ["MOBILE", "PORTING", "NETWORK_OPS", "MARKET_INTELLIGENCE"],
+        "questions": [
+            "Give me an executive summary of SnowTelco's current performance - total subscribers, ARPU, and NPS split by B2C consumers versus B2B business customers.",
+            "Show me our port-in versus port-out analysis - which competitors are we winning customers from and losing customers to?",
+            "What are our top network quality issues affecting customer satisfaction? Show me the correlation between network problems and NPS scores by city.",
+            "Compare our performance against our main competitors - how do we rank in terms of market share, customer satisfaction, and service quality?",
+            "Based on all this data, what are the 3 most critical strategic priorities I should focus on this quarter?"
+        ],
+        "insights": [
+            "Total subscribers: ~30,000 (70% Consumer, 26% SMB, 4% Enterprise)",
+            "ARPU and NPS by customer type",
+            "Port-in/port-out competitive analysis",
+            "Network performance correlation with customer satisfaction"
+        ]
+    },
+    "02_CFO_Finance": {
+        "title": "CFO Financial Performance",
+        "persona": "Chief Financial Officer",
+        "duration": "10 minutes",
+        "focus": "Revenue, margins, ARPU trends, billing efficiency, cost management, vendor spend",
+        "views": ["FINANCE", "BILLING", "MOBILE", "SALES"],
+        "questions": [
+            "Show me our revenue breakdown by customer type - Consumer, SMB, and Enterprise - with average bill amounts.",
+            "What's our ARPU by customer type and segment? Show me Consumer vs SMB vs Enterprise, and break down by value tier.",
+            "What's our payment status distribution? Show me Paid vs Pending vs Overdue by customer type.",
+            "What are our top vendor expenses by department and what's the approval status?",
+            "What revenue is at risk from churned customers? Show me lifetime value lost by customer type and segment."
+        ],
+        "insights": [
+            "Revenue split: Consumer (~70%) vs SMB (~26%) vs Enterprise (~4%)",
+            "ARPU by type: Enterprise (~£100-150) > SMB (~£50-80) > Consumer (~£25-40)",
+            "Payment status: ~70% Paid, ~20% Pending, ~10% Overdue",
+            "Vendor spend visibility and approval status"
+        ]
+    },
+    "03_CMO_Marketing": {
+        "title": "CMO Marketing Performance",
+        "persona": "Chief Marketing Officer",
+        "duration": "10 minutes",
+        "focus": "Campaign performance, customer acquisition, brand health, NPS, churn prevention",
+        "views": ["MARKETING", "MOBILE", "PORTING"],
+        "questions": [
+            "Which marketing campaigns have delivered the best ROI? Show me spend, leads generated, and impressions by campaign.",
+            "Where are our customers coming from? Break down by acquisition channel for Consumer vs B2B customers.",
+            "What's our NPS score by customer type and segment? Compare Consumer vs SMB vs Enterprise.",
+            "What are the top reasons customers are churning? Show me churn reasons by customer type and which competitors they're leaving for.",
+            "Show me our port-in versus port-out by competitor. Which carriers are we winning from and losing to?"
+        ],
+        "insights": [
+            "Campaign ROI: spend vs leads generated",
+            "Acquisition channels: Online, Retail, App, Direct Sales, Partner",
+            "NPS by segment: VIP > Premium > Standard > Budget",
+            "Churn reasons: Price, Network Coverage, Competitor Promotion"
+        ]
+    },
+    "04_CTO_Technology": {
+        "title": "CTO Technology & Network",
+        "persona": "Chief Technology Officer",
+        "duration": "10 minutes",
+        "focus": "Network strategy, 5G rollout, IT systems, technology investments, digital transformation",
+        "views": ["NETWORK_OPS", "NETWORK_QOE", "IT_OPS", "SLA", "RAN"],
+        "questions": [
+            "Show me our network performance metrics by city - availability, latency, and throughput. Which cities have the best and worst performance?",
+            "What's our 5G rollout status by region? Show me sites that are live, in progress, and planned.",
+            "Which network elements have the highest utilization? Show me capacity hotspots that may need upgrades.",
+            "What's the status of our critical IT systems? Show me open incidents by severity and resolution times.",
+            "What's the customer experience quality on our network? Show me download speeds, latency, and video quality scores.",
+            "What are the key initiatives in our digital transformation roadmap for 2026?",
+            "Are we meeting our network SLAs? Show me SLA compliance rates and any breaches this month."
+        ],
+        "insights": [
+            "Network availability target: 99%+",
+            "5G deployment status by region",
+            "IT incident MTTR by severity",
+            "QoE metrics: download speeds, video quality (1-5)"
+        ]
+    },
+    "05_COO_Operations": {
+        "title": "COO Operations Excellence",
+        "persona": "Chief Operating Officer",
+        "duration": "10 minutes",
+        "focus": "Operational efficiency, process performance, service quality, supply chain, workforce productivity",
+        "views": ["SUPPORT", "SUPPORT_TICKET", "NETWORK_OPS", "NETWORK_ALARM", "ACTIVATION", "ASSET", "ORDER"],
+        "questions": [
+            "Give me a snapshot of our operational performance - contact centre wait times and CSAT, network availability, and SIM activation times.",
+            "How is our contact centre performing? Show me handle times, first call resolution rates, and CSAT by team.",
+            "What's our SIM activation performance? Show me average activation times by channel and any pending activations.",
+            "What's our inventory position? Show me stock levels by warehouse and items at risk of stock-out.",
+            "What's the health of our network? Show me availability, alarms by severity, MTTR, and any critical issues.",
+            "What are our operational KPI targets and process standards?"
+        ],
+        "insights": [
+            "Contact centre: AHT, FCR, CSAT by queue",
+            "SIM activation times by channel",
+            "Inventory stock status",
+            "Network MTTR by severity"
+        ]
+    },
+    "06_CCO_Commercial": {
+        "title": "CCO Commercial Performance",
+        "persona": "Chief Commercial Officer",
+        "duration": "10 minutes",
+        "focus": "Revenue growth, sales performance, partner channel, pricing strategy, market expansion",
+        "views": ["SALES_PIPELINE", "PARTNER", "MOBILE", "PORTING", "MARKET_INTELLIGENCE"],
+        "questions": [
+            "Show me our revenue performance - total revenue by customer type and ARPU trends.",
+            "What does our B2B sales pipeline look like? Show me opportunities by stage and expected close dates.",
+            "How are our partner channels performing? Show me partner revenue, commissions, and top performers by tier.",
+            "What's our subscriber mix? Show me 5G vs 4G adoption, plan types, and ARPU by network generation.",
+            "How do we compare to competitors? Show me port-in vs port-out by carrier and competitor pricing."
+        ],
+        "insights": [
+            "Revenue by customer type",
+            "B2B pipeline by stage",
+            "Partner performance by tier (Gold, Silver, Bronze)",
+            "5G vs 4G subscriber mix and ARPU"
+        ]
+    },
+    "07_CXO_Customer_Experience": {
+        "title": "CXO Customer Experience",
+        "persona": "Chief Experience Officer",
+        "duration": "10 minutes",
+        "focus": "Customer journey optimization, NPS improvement, experience transformation",
+        "views": ["CUSTOMER_EXPERIENCE", "MOBILE", "SUPPORT"],
+        "questions": [
+            "What's the distribution of customer interactions by journey stage?",
+            "Which channels have the highest customer effort scores?",
+            "Show me the average sentiment score by channel this month.",
+            "What's our conversion rate by channel? Show me conversions vs total interactions.",
+            "Which channels have the highest resolution rates?",
+            "Compare digital vs physical channel performance - sentiment and effort scores.",
+            "What's the average session duration by journey stage?",
+            "Show me customer satisfaction (NPS) by customer segment."
+        ],
+        "insights": [
+            "Journey stages: Awareness, Consideration, Purchase, Support, Usage, Renewal",
+            "Sentiment by channel",
+            "Effort scores (lower is better)",
+            "Conversion metrics by channel"
+        ]
+    },
+    "08_CNO_Network_QoE": {
+        "title": "CNO Network Quality of Experience",
+        "persona": "Chief Networks Officer",
+        "duration": "10 minutes",
+        "focus": "Network performance, RAN operations, customer experience correlation, 5G rollout",
+        "views": ["NETWORK_QOE", "NETWORK_OPS", "RAN"],
+        "questions": [
+            "What's the average download speed by network generation (3G/4G/5G)?",
+            "Show me the cells with the worst latency performance.",
+            "What's our video streaming quality score across the network?",
+            "How does network performance correlate with churn risk?",
+            "Which app categories are most affected by poor network quality?",
+            "Compare 5G vs 4G customer experience metrics.",
+            "Show me QoE metrics by city.",
+            "Which cells need capacity upgrades based on customer experience?"
+        ],
+        "insights": [
+            "5G delivers 5-10x better speeds than 4G",
+            "Video quality correlates with customer satisfaction",
+            "Geographic variations in network experience",
+            "App-specific performance requirements"
+        ]
+    },
+    "09_CDO_Data_Science": {
+        "title": "CDO AI/ML Propensity Analytics",
+        "persona": "Chief Data Officer / Head of Data Science",
+        "duration": "10 minutes",
+        "focus": "Predictive analytics, ML operations, data-driven decision making",
+        "views": ["PROPENSITY", "MOBILE"],
+        "questions": [
+            "How many customers are at high risk of churning?",
+            "Show me the churn risk by customer segment.",
+            "What's the predicted revenue at risk from high-churn customers?",
+            "Which customers have the highest upsell propensity?",
+            "Show me the next best action distribution.",
+            "What's the average predicted CLV by customer type?",
+            "What's the confidence score distribution for our predictions?",
+            "Compare churn risk for 5G vs non-5G customers.",
+            "What are our AI/ML strategic objectives and use cases for 2026?"
+        ],
+        "insights": [
+            "Churn risk distribution by segment",
+            "Predicted CLV and revenue at risk",
+            "Next best action recommendations",
+            "ML model confidence scores"
+        ]
+    },
+    "10_CSO_Sustainability": {
+        "title": "CSO Sustainability & ESG",
+        "persona": "Chief Sustainability Officer",
+        "duration": "10 minutes",
+        "focus": "Carbon reduction, renewable energy, net zero targets, ESG reporting",
+        "views": ["SUSTAINABILITY"],
+        "questions": [
+            "What's our total energy consumption this year?",
+            "What percentage of our energy comes from renewable sources?",
+            "Show me our carbon emissions trend.",
+            "Which sites consume the most energy?",
+            "What's our average PUE (Power Usage Effectiveness) ratio?",
+            "Compare energy consumption by site type (Macro vs Small Cell).",
+            "Which sites have the highest carbon intensity?",
+            "What's our progress toward net zero?",
+            "How many customers are on green tariffs?",
+            "What's our e-waste recycling rate?"
+        ],
+        "insights": [
+            "Renewable energy: 40% -> 65% progress",
+            "Carbon emissions decreasing YoY",
+            "Small cells more energy efficient",
+            "Net zero progress tracking"
+        ]
+    },
+    "11_VP_Customer_Service": {
+        "title": "VP Customer Service",
+        "persona": "VP Customer Service / Director of Customer Experience",
+        "duration": "10 minutes",
+        "focus": "Contact centre operations, ticket management, CSAT, complaint handling",
+        "views": ["SUPPORT", "SUPPORT_TICKET", "COMPLAINT", "MOBILE"],
+        "questions": [
+            "Show me our contact centre performance - average handle time, wait time, and CSAT scores by queue.",
+            "How does our support performance differ between Consumer and B2B customers?",
+            "What are the top support ticket categories? Show me ticket volumes and resolution times.",
+            "Show me our formal complaint volumes and resolution times. What are the main complaint categories?",
+            "Who are our top performing agents by CSAT? Show me agent rankings and team performance."
+        ],
+        "insights": [
+            "AHT, FCR, CSAT by queue",
+            "Ticket categories and resolution times",
+            "Complaint volumes and Ombudsman escalation rate",
+            "Agent CSAT rankings"
+        ]
+    },
+    "12_VP_Network_Operations": {
+        "title": "VP Network Operations",
+        "persona": "VP Network Operations / Head of Network Management Centre",
+        "duration": "10 minutes",
+        "focus": "Network availability, alarm management, capacity planning, RF optimization, incident response, SLA delivery",
+        "views": ["NETWORK_OPS", "NETWORK_ALARM", "SLA", "MOBILE", "RAN"],
+        "questions": [
+            "Show me the current health of our network - average availability, latency, and throughput.",
+            "Show me our network alarms - alarm counts by severity, MTTR, and average alarm duration.",
+            "How is our network performing by region? Show me availability and latency for major cities.",
+            "Which network elements have the highest utilization? Show me elements above 60% utilization.",
+            "Show me RF optimization KPIs - RSRP, RSRQ, SINR, handover success, and call drop rate by site.",
+            "Are we meeting our SLAs? Show me SLA measurements - how many met versus breached."
+        ],
+        "insights": [
+            "Network availability: 99.5-99.9%",
+            "MTTR by severity",
+            "Regional performance comparison",
+            "RF signal quality and handover success trends",
+            "SLA attainment and breach tracking"
+        ]
+    },
+    "Alert_Center": {
+        "title": "Network Alert Center",
+        "persona": "NOC Manager / Network Operations",
+        "duration": "10 minutes",
+        "focus": "Real-time alert monitoring, incident management, SLA tracking, impact analysis",
+        "views": ["NETWORK_ALARM", "NETWORK_OPS", "SLA"],
+        "questions": [
+            "Show me all P1 critical alerts with their MTTR and affected subscribers.",
+            "Which network sites have the most recurring alerts this month?",
+            "What's our SLA compliance rate by region and alert severity?",
+            "Show me the correlation between alerts and customer churn risk."
+        ],
+        "insights": [
+            "Real-time alert feed with severity levels",
+            "UK map with tower status",
+            "MTTR performance vs SLA targets",
+            "SLA credit exposure tracking"
+        ]
+    },
+    "13_Head_of_Partners": {
+        "title": "Head of Partners",
+        "persona": "Head of Partners / Director of Channel Sales",
+        "duration": "10 minutes",
+        "focus": "Partner performance, commission management, recruitment, training, partner experience",
+        "views": ["PARTNER", "ORDER", "SALES"],
+        "questions": [
+            "Give me an overview of our partner channel - total partners, active this month, and revenue contribution.",
+            "Who are our top performing partners this quarter? Show me by revenue, orders, and customer acquisition.",
+            "What commissions have we paid this month and what's accrued for next payment?",
+            "Which partners are underperforming or at risk? Show me activity levels and engagement indicators.",
+            "What does our partner recruitment pipeline look like? How many new partners have we onboarded?"
+        ],
+        "insights": [
+            "Partner revenue by tier (Gold, Silver, Bronze)",
+            "Commission paid and accrued",
+            "Partner health indicators",
+            "Recruitment pipeline status"
+        ]
+    },
+    "14_VP_Billing_Revenue": {
+        "title": "VP Billing & Revenue",
+        "persona": "VP Billing & Revenue / Director of Revenue Management",
+        "duration": "10 minutes",
+        "focus": "Billing accuracy, payment status, revenue assurance, dispute management",
+        "views": ["BILLING", "MOBILE", "REVENUE_ASSURANCE", "DISPUTE"],
+        "questions": [
+            "Show me our billing performance - total invoices, amount billed, and average invoice value.",
+            "What's our payment status distribution? Show me Paid vs Pending vs Overdue by customer type.",
+            "Are there any revenue leakage risks? Show me unbilled usage, credit notes, and adjustments.",
+            "How many credit notes have we issued? Show me amounts by reason and approval status.",
+            "Show me our billing disputes - volumes, categories, and resolution times."
+        ],
+        "insights": [
+            "Invoice generation and billing amounts",
+            "Payment status distribution",
+            "Revenue leakage (unbilled usage)",
+            "Dispute resolution performance"
+        ]
+    },
+    "15_VP_IT_Digital": {
+        "title": "VP IT & Digital",
+        "persona": "VP IT / Director of IT Operations",
+        "duration": "10 minutes",
+        "focus": "IT incident management, SLA compliance, application health, service delivery",
+        "views": ["IT_OPS", "SLA", "CUSTOMER_EXPERIENCE"],
+        "questions": [
+            "Show me our open IT incidents by severity - how many P1, P2, P3, P4 issues do we have?",
+            "What's our Mean Time to Resolve (MTTR) by severity? Are we meeting our SLA targets?",
+            "What are the main root causes of our IT incidents? Show me categories and patterns.",
+            "Which applications have the most incidents? Show me the top affected systems.",
+            "How are we performing against our SLAs? Show me attainment rates and any breaches."
+        ],
+        "insights": [
+            "Open incidents by severity (P1-P4)",
+            "MTTR targets: P1: 4hr, P2: 8hr, P3: 24hr, P4: 72hr",
+            "Root cause categories",
+            "SLA attainment and breach analysis"
+        ]
+    },
+    "16_VP_Field_Operations": {
+        "title": "VP Field Operations",
+        "persona": "VP of Field Operations",
+        "duration": "10 minutes",
+        "focus": "Workforce optimization, SLA compliance, cost management, first-time fix rates",
+        "views": ["FIELD_OPERATIONS"],
+        "questions": [
+            "What's our overall first-time fix rate?",
+            "Show me technician performance rankings.",
+            "Which technicians have the highest customer satisfaction scores?",
+            "What's our SLA compliance rate by region?",
+            "Show me the average delay time by visit type.",
+            "How many visits were rescheduled last month and why?",
+            "What's the average cost per visit by type?",
+            "Which visit types have the highest parts costs?",
+            "What are our field technician KPI targets and safety requirements?"
+        ],
+        "insights": [
+            "First-time fix rate target: 90%",
+            "SLA compliance target: 95%",
+            "Technician CSAT rankings",
+            "Cost per visit analysis"
+        ]
+    },
+    "17_VP_Strategy": {
+        "title": "VP Strategy",
+        "persona": "VP of Strategy / Head of Competitive Intelligence",
+        "duration": "10 minutes",
+        "focus": "Market positioning, competitive analysis, pricing strategy, growth opportunities",
+        "views": ["MARKET_INTELLIGENCE"],
+        "questions": [
+            "What's our current market share vs competitors?",
+            "How has our market share trended over the past year?",
+            "Which regions are we strongest/weakest in?",
+            "How does our ARPU compare to competitors?",
+            "Which competitors are gaining/losing share?",
+            "Compare our pricing to competitors for similar plans.",
+            "What's the total addressable market by region?",
+            "Which competitor's customers are most likely to switch?"
+        ],
+        "insights": [
+            "SnowTelco: ~5% market share (growing challenger)",
+            "Regional strengths/weaknesses",
+            "Competitive pricing analysis",
+            "MVNO vs MNO market dynamics"
+        ]
+    },
+    "18_VP_Communications": {
+        "title": "VP Communications",
+        "persona": "VP of Communications / Head of Brand",
+        "duration": "10 minutes",
+        "focus": "Brand reputation, social media monitoring, crisis management, voice of customer",
+        "views": ["SOCIAL_SENTIMENT"],
+        "questions": [
+            "What's our overall social media sentiment this month?",
+            "Show me the sentiment trend over the past week.",
+            "Which platforms have the most negative mentions?",
+            "What topics are customers talking about most?",
+            "Show me negative mentions about network quality.",
+            "Which topics have the worst sentiment?",
+            "How many mentions require a response that we haven't responded to?",
+            "What's our average response time to negative mentions?",
+            "Show me high-reach negative mentions from influencers.",
+            "What is our crisis response protocol and escalation timeline?"
+        ],
+        "insights": [
+            "Sentiment: 35% positive, 40% negative, 25% neutral",
+            "Platform-specific patterns",
+            "Response backlog tracking",
+            "Crisis playbook protocols"
+        ]
+    },
+    "19_Regulatory_Compliance": {
+        "title": "Regulatory & Compliance",
+        "persona": "Head of Regulatory Affairs / Compliance Director",
+        "duration": "10 minutes",
+        "focus": "Ofcom compliance, SLA management, GDPR, complaint handling, service quality reporting",
+        "views": ["SLA", "COMPLAINT", "NETWORK_OPS", "MOBILE"],
+        "questions": [
+            "Show me our regulatory compliance status - SLA performance, complaint metrics, and any areas of concern.",
+            "How are we performing against our published SLAs? Show me breach rates and credit liability.",
+            "Are we meeting Ofcom complaint handling requirements? Show me resolution times and escalation rates.",
+            "Are we meeting our network quality commitments? Show me coverage, availability, and performance metrics.",
+            "What data do we need for our quarterly Ofcom submission? Summarize key metrics."
+        ],
+        "insights": [
+            "SLA attainment rate",
+            "Complaint-to-subscriber ratio",
+            "Ombudsman escalation rate",
+            "Ofcom reporting requirements"
+        ]
+    },
+    "20_VP_Security": {
+        "title": "VP Security & Fraud Prevention",
+        "persona": "VP Security & Fraud Prevention",
+        "duration": "10 minutes",
+        "focus": "Fraud detection, loss prevention, security analytics",
+        "views": ["FRAUD_DETECTION"],
+        "questions": [
+            "What is our total fraud detection volume by category and what losses have we prevented this year?",
+            "How effective are our different detection methods - ML models vs rule engines vs manual review?",
+            "Show me critical and high severity fraud cases - what types are causing the most damage?",
+            "What's our fraud case resolution rate and average time to resolution?",
+            "Are we seeing repeat offenders and what monthly trends do we have in fraud activity?"
+        ],
+        "insights": [
+            "Fraud categories: Identity, Traffic, Device, Channel, Internal",
+            "ML model effectiveness",
+            "SIM swap and account takeover trends",
+            "Prevention ROI"
+        ]
+    },
+    "21_VP_Enterprise_Sales": {
+        "title": "VP Enterprise Sales",
+        "persona": "VP Enterprise Sales",
+        "duration": "10 minutes",
+        "focus": "B2B contract renewals, enterprise revenue retention, competitive threats",
+        "views": ["B2B_CONTRACT"],
+        "questions": [
+            "What is our total B2B contract portfolio value by product type and renewal status?",
+            "Show me contracts coming up for renewal in the next 90 days with their renewal probability.",
+            "Which contracts have competitive threats and who are we losing deals to?",
+            "What upgrade and expansion opportunities do we have in the renewal pipeline?",
+            "What is our total at-risk contract value and what's driving churn risk?"
+        ],
+        "insights": [
+            "ACV by product type",
+            "Renewal probability analysis",
+            "Competitive threats: BT, Vodafone, Virgin Media O2",
+            "At-risk revenue identification"
+        ]
+    },
+    "22_VP_Wholesale": {
+        "title": "VP Wholesale & MVNO",
+        "persona": "VP Wholesale & MVNO Partnerships",
+        "duration": "10 minutes",
+        "focus": "MVNO traffic, wholesale revenue, partner settlements",
+        "views": ["WHOLESALE_MVNO"],
+        "questions": [
+            "What is our total MVNO partner portfolio and wholesale revenue by partner?",
+            "Show me MVNO traffic trends - voice, SMS, and data volumes by partner.",
+            "What's our wholesale revenue breakdown by voice, SMS, and data?",
+            "Show me overdue MVNO settlements - which partners have overdue payments and how many days overdue?",
+            "Which MVNO partners are growing fastest and which are underperforming their commitments?",
+            "What are our wholesale pricing tiers and minimum commitment terms?"
+        ],
+        "insights": [
+            "Top 3 MVNOs: Tesco Mobile, Lebara, Lycamobile",
+            "Data traffic growing 40% YoY",
+            "Settlement status tracking",
+            "Partner growth analysis"
+        ]
+    },
+    "23_VP_Retail": {
+        "title": "VP Retail Operations",
+        "persona": "VP Retail Operations",
+        "duration": "10 minutes",
+        "focus": "Store performance, sales, footfall, conversion",
+        "views": ["RETAIL"],
+        "questions": [
+            "What is our total retail sales revenue by store type and region?",
+            "What are our top selling product categories and how do contract vs PAYG sales compare?",
+            "What are our footfall trends and conversion rates by store type?",
+            "Which stores are our top and bottom performers by sales per square foot?",
+            "How are retail staff performing in terms of commission and sales per employee?"
+        ],
+        "insights": [
+            "170 stores across UK",
+            "Store types: Flagship, Standard, Express, Kiosk",
+            "Conversion rates: 15-35%",
+            "Sales per square foot analysis"
+        ]
+    },
+    "24_CHRO_People": {
+        "title": "CHRO People & Workforce",
+        "persona": "Chief Human Resources Officer (CHRO)",
+        "duration": "10 minutes",
+        "focus": "Workforce analytics, engagement, talent management",
+        "views": ["WORKFORCE"],
+        "questions": [
+            "What is our current headcount by department and work location?",
+            "What are our employee engagement scores by department and how do they trend?",
+            "What is our employee Net Promoter Score and which teams have the highest/lowest?",
+            "What are our average salaries by job level and how does performance rating correlate?",
+            "What's our tenure distribution and which departments have the highest turnover risk?",
+            "What are our critical skills gaps and hiring priorities for 2026?",
+            "What were the key findings from our latest employee engagement survey?"
+        ],
+        "insights": [
+            "2,000+ employees across retail, contact centres, operations",
+            "Engagement score: 3.8/5",
+            "eNPS: +25",
+            "Skills gaps: 5G Core, AI/ML, Cloud"
+        ]
+    },
+    "25_VP_Legal": {
+        "title": "VP Legal & General Counsel",
+        "persona": "VP Legal / General Counsel",
+        "duration": "10 minutes",
+        "focus": "Contracts, regulatory compliance, disputes, risk management",
+        "views": ["B2B_CONTRACT", "COMPLAINT", "SLA", "FINANCE"],
+        "questions": [
+            "What is our B2B contract portfolio? Show me total contract value, contracts by status, and upcoming renewals.",
+            "Show me our formal complaint trends - how many Ofcom escalations and ombudsman cases do we have?",
+            "What's our SLA compliance rate? Show me any breaches and potential financial exposure.",
+            "What are the key liability and indemnity terms in our strategic vendor contracts?",
+            "What is our GDPR compliance framework? Show me data protection obligations and privacy-related complaints.",
+            "What active legal matters do we have? Show me open disputes, litigation status, and potential financial exposure.",
+            "Which B2B contracts have the highest risk?"
+        ],
+        "insights": [
+            "Contract portfolio: £50M+ ACV",
+            "Ofcom escalations tracking",
+            "SLA breach credits",
+            "Legal matters and exposure"
+        ]
+    },
+    "26_VP_Product": {
+        "title": "VP Product Management",
+        "persona": "VP Product Management",
+        "duration": "10 minutes",
+        "focus": "Product portfolio, plan performance, pricing strategy, feature adoption",
+        "views": ["PLAN", "MOBILE", "MARKET_INTELLIGENCE"],
+        "questions": [
+            "What is our mobile plan portfolio? Show me all plans with pricing, data allowances, and 5G availability.",
+            "Which plans have the most subscribers? Show me subscriber count by plan name and plan type.",
+            "What's our 5G adoption rate? Show me subscribers on 5G vs 4G plans by customer segment.",
+            "How do our plan prices compare to competitors for similar data allowances?",
+            "Which plan features drive the most value? Show me plans with roaming included and family eligibility.",
+            "What's our ARPU by plan type? Compare Pay Monthly, SIM Only, and PAYG."
+        ],
+        "insights": [
+            "Portfolio: £10 PAYG to £80+ premium",
+            "5G in 60% of plans",
+            "Plan type distribution",
+            "ARPU: Pay Monthly 3x SIM Only"
+        ]
+    },
+    "27_VP_Procurement": {
+        "title": "VP Procurement",
+        "persona": "VP Procurement / Head of Vendor Management",
+        "duration": "10 minutes",
+        "focus": "Vendor spend, supplier relationships, contract management, cost optimization",
+        "views": ["FINANCE", "ASSET"],
+        "questions": [
+            "What is our total vendor spend by category? Show me the top spending areas and approval status.",
+            "Who are our top 10 vendors by spend? Show me vendor names, total spend, and transaction counts.",
+            "How is our spend distributed by procurement method? Show me RFP, contract, emergency, and quote-based purchases.",
+            "What's our vendor spend by department? Which departments have the highest expenses?",
+            "What's the status of our purchase approvals? Show me pending, approved, and rejected transactions.",
+            "What are the key terms in our strategic vendor contracts?",
+            "Where can we optimize vendor spend? Show me duplicate vendors, small transactions, and consolidation opportunities."
+        ],
+        "insights": [
+            "£100M+ annual spend",
+            "Technology/Network: 70% of spend",
+            "Top 5 vendors: 60% of spend",
+            "£2M savings opportunity identified"
+        ]
+    }
+}
+
+# Sidebar navigation sections, in display order
+C_SUITE_PAGES = ["Executive_Summary", "SnowTelco_Website", "Persona_Hub", "00_WOW_Executive_Showcase", "01_CEO_Strategic", "02_CFO_Finance", 
+                 "03_CMO_Marketing", "04_CTO_Technology", "05_COO_Operations", 
+                 "06_CCO_Commercial", "07_CXO_Customer_Experience", "08_CNO_Network_QoE",
+                 "09_CDO_Data_Science", "10_CSO_Sustainability"]
+
+VP_PAGES = ["11_VP_Customer_Service", "12_VP_Network_Operations", "Alert_Center", "13_Head_of_Partners",
+            "14_VP_Billing_Revenue", "15_VP_IT_Digital", "16_VP_Field_Operations",
+            "17_VP_Strategy", "18_VP_Communications", "19_Regulatory_Compliance",
+            "20_VP_Security", "21_VP_Enterprise_Sales", "22_VP_Wholesale",
+            "23_VP_Retail", "24_CHRO_People", "25_VP_Legal", "26_VP_Product",
+            "27_VP_Procurement"]
+
+TOOL_PAGES = ["data_monetization", "architecture"]
@@ -0,0 +1,156 @@
+"""Background prefetch of the pages reachable from the Persona Hub.
+
+The first visit to a persona dashboard pays for importing its module, loading
+its datasets and building its charts. While the Persona Hub is shown,
+:func:`prefetch_pages` renders the hub's target pages headlessly on a small
+pool of background threads. That fills the same process-wide caches a real
+render uses (``st.cache_resource`` datasets, ``st.cache_data`` frames, the
+compiled chart specs in :mod:`dashboard.charts`), so the presenter's click is
+a warm render.
+
+A headless render is the page's render function called on a thread without a
+ScriptRunContext. Streamlit commands there have no container to write to,
+widgets return their defaults and ``st.session_state`` is Streamlit's
+throw-away bare-mode state, so nothing reaches any session.
+
+Pages are warmed most-visited first. :func:`record_visit` counts every page
+change, across all sessions of the process, and a worker picks the queued page
+with the most visits each time it starts one (hub order breaks ties). A warmed
+page is queued again once ``REWARM_SECONDS`` (the dataset TTL) have passed.
+Set SNOWTELCO_PREFETCH=0 to turn prefetching off.
+"""
+
+import collections
+import logging
+import os
+import threading
+import time
+
+import streamlit as st
+
+from dashboard import registry
+from dashboard.data.datasets import DEFAULT_TTL
+
+PREFETCH_ENV = "SNOWTELCO_PREFETCH"
+MAX_WORKERS = 2
+REWARM_SECONDS = DEFAULT_TTL
+THREAD_PREFIX = "snowtelco-prefetch"
+LAST_PAGE_KEY = "_prefetch_last_page"
+# Loggers that a headless render would flood: the missing-context warning and the
+# deprecation notices the foreground render of the same page already logs
+HEADLESS_QUIET_LOGGERS = ("streamlit.runtime.scriptrunner_utils.script_run_context", "streamlit.deprecation_util")
+
+
+class _HeadlessThreadFilter(logging.Filter):
+    """Drop records logged on a prefetch thread."""
+
+    def filter(self, record):
+        return not record.threadName.startswith(THREAD_PREFIX)
+
+
+for _name in HEADLESS_QUIET_LOGGERS:
+    logging.getLogger(_name).addFilter(_HeadlessThreadFilter())
+
+
+def is_enabled():
+    return os.environ.get(PREFETCH_ENV, "1").lower() not in ("0", "false", "no")
+
+
+class Prefetcher:
+    """Process-wide visit counts and a priority queue of pages to render headlessly."""
+
+    def __init__(self, max_workers=MAX_WORKERS, rewarm_seconds=REWARM_SECONDS):
+        self.max_workers = max_workers
+        self.rewarm_seconds = rewarm_seconds
+        self.visits = collections.Counter()
+        # page -> (monotonic time warmed, seconds taken, error or None)
+        self.warmed = {}
+        self._queue = []
+        self._running = set()
+        self._workers = 0
+        self._lock = threading.Lock()
+
+    def record(self, page_key):
+        with self._lock:
+            self.visits[page_key] += 1
+
+    def _is_warm(self, page_key, now):
+        warmed = self.warmed.get(page_key)
+        return warmed is not None and now - warmed[0] < self.rewarm_seconds
+
+    def prefetch(self, page_keys):
+        """Queue the pages of ``page_keys`` that are neither warm nor already queued; returns them."""
+        now = time.monotonic()
+        with self._lock:
+            queued = [key for key in dict.fromkeys(page_keys)
+                      if registry.has_page(key) and key not in self._queue
+                      and key not in self._running and not self._is_warm(key, now)]
+            self._queue.extend(queued)
+            while self._workers < min(self.max_workers, len(self._queue)):
+                self._workers += 1
+                threading.Thread(target=self._work, name=f"{THREAD_PREFIX}-{self._workers}", daemon=True).start()
+        return queued
+
+    def _next(self):
+        """Pop the queued page with the most visits (the earliest queued on a tie); None stops the worker."""
+        with self._lock:
+            if not self._queue:
+                self._workers -= 1
+                return None
+            index = max(range(len(self._queue)), key=lambda i: (self.visits[self._queue[i]], -i))
+            page_key = self._queue.pop(index)
+            self._running.add(page_key)
+            return page_key
+
+    def _work(self):
+        while (page_key := self._next()) is not None:
+            error = None
+            start = time.perf_counter()
+            try:
+                registry.render_page(page_key)
+            except Exception as exc:  # a page that fails headlessly is just left cold
+                error = f"{type(exc).__name__}: {exc}"
+            with self._lock:
+                self._running.discard(page_key)
+                self.warmed[page_key] = (time.monotonic(), time.perf_counter() - start, error)
+
+    def wait(self, timeout=None):
+        """Block until the queue is drained (benchmarks and scripts); returns False on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                if not self._queue and not self._running:
+                    return True
+            if deadline is not None and time.monotonic() > deadline:
+                return False
+            time.sleep(0.05)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "visits": dict(self.visits.most_common()),
+                "queued": list(self._queue),
+                "running": sorted(self._running),
+                "warmed": {key: {"seconds": round(seconds, 3), "error": error}
+                           for key, (_, seconds, error) in self.warmed.items()},
+            }
+
+
+@st.cache_resource(show_spinner=False)
+def get_prefetcher():
+    """The process-wide prefetcher shared by every session."""
+    return Prefetcher()
+
+
+def record_visit(page_key):
+    """Count a page change of the current session towards the visit counts."""
+    if st.session_state.get(LAST_PAGE_KEY) != page_key:
+        st.session_state[LAST_PAGE_KEY] = page_key
+        get_prefetcher().record(page_key)
+
+
+def prefetch_pages(page_keys):
+    """Warm ``page_keys`` in the background, most-visited first; call after the page's own output."""
+    if not is_enabled():
+        return []
+    return get_prefetcher().prefetch(page_keys)
@@ -0,0 +1,247 @@
+"""Opt-in render profiler for the demo dashboard.
+
+When the "Render Profiler" toggle in Demo Settings is on (or
+SNOWTELCO_PROFILE=1 is set), ``main()`` wraps the page dispatch in
+:func:`profile_page`. That records, for the page and for each ``altair_chart``,
+``vega_lite_chart`` (what :mod:`dashboard.charts` renders through), ``map``,
+``dataframe`` and ``markdown`` call made while it renders:
+
+- wall time
+- elements sent to the browser and their serialized size (protobuf bytes of
+  the delta messages the script run enqueues)
+- optionally, peak traced Python memory for the whole render (tracemalloc)
+
+The wrappers around the Streamlit commands are installed once per process and
+only record on a thread that is inside :func:`profile_page`, so sessions with
+the profiler off pay one attribute lookup per call. Memory tracing is a separate
+checkbox in the panel because tracemalloc makes a render several times slower;
+it is also process-wide, so its peak includes any session rendering at the same
+time.
+
+Recent profiles are kept in session state and shown by :func:`render_panel`,
+which also exports them as JSON.
+"""
+
+import datetime
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+
+import streamlit as st
+from streamlit.delta_generator import DeltaGenerator
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+PROFILE_ENV = "SNOWTELCO_PROFILE"
+WIDGET_KEY = "profiler"
+MEMORY_WIDGET_KEY = "profiler_memory"
+SESSION_KEY = "_render_profiles"
+MAX_PROFILES = 100
+
+INSTRUMENTED_COMMANDS = ("altair_chart", "vega_lite_chart", "map", "dataframe", "markdown")
+
+_local = threading.local()
+_install_lock = threading.Lock()
+_installed = False
+_tracing_lock = threading.Lock()
+_tracing_sessions = 0
+
+
+def default_enabled():
+    return os.environ.get(PROFILE_ENV, "").lower() in ("1", "true", "yes", "memory")
+
+
+def trace_memory_enabled():
+    """Whether the panel's memory checkbox was on in the previous run (or SNOWTELCO_PROFILE=memory)."""
+    return st.session_state.get(MEMORY_WIDGET_KEY, os.environ.get(PROFILE_ENV, "").lower() == "memory")
+
+
+class _Recorder:
+    def __init__(self, page_key):
+        self.page_key = page_key
+        self.elements = 0
+        self.payload_bytes = 0
+        self.calls = {}
+        self.depth = 0
+
+    def on_message(self, msg):
+        if msg.HasField("delta"):
+            self.payload_bytes += msg.ByteSize()
+            if msg.delta.HasField("new_element"):
+                self.elements += 1
+
+    def add_call(self, command, seconds, elements, payload_bytes):
+        stats = self.calls.setdefault(command, {"calls": 0, "wall_ms": 0.0, "elements": 0, "payload_bytes": 0})
+        stats["calls"] += 1
+        stats["wall_ms"] += seconds * 1000
+        stats["elements"] += elements
+        stats["payload_bytes"] += payload_bytes
+
+
+def _instrument(func, command):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        recorder = getattr(_local, "recorder", None)
+        # Only time the outermost command; st.write -> st.markdown etc. count once
+        if recorder is None or recorder.depth:
+            return func(*args, **kwargs)
+        elements, payload_bytes = recorder.elements, recorder.payload_bytes
+        recorder.depth += 1
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            recorder.depth -= 1
+            recorder.add_call(command, time.perf_counter() - start,
+                              recorder.elements - elements, recorder.payload_bytes - payload_bytes)
+    return wrapper
+
+
+def _install():
+    """Wrap the instrumented commands on ``st`` and on DeltaGenerator (``col.markdown``) once."""
+    global _installed
+    with _install_lock:
+        if _installed:
+            return
+        for command in INSTRUMENTED_COMMANDS:
+            setattr(st, command, _instrument(getattr(st, command), command))
+            setattr(DeltaGenerator, command, _instrument(getattr(DeltaGenerator, command), command))
+        _installed = True
+
+
+def _start_tracing():
+    global _tracing_sessions
+    with _tracing_lock:
+        if _tracing_sessions == 0 and not tracemalloc.is_tracing():
+            tracemalloc.start()
+        _tracing_sessions += 1
+        tracemalloc.reset_peak()
+        return tracemalloc.get_traced_memory()[0]
+
+
+def _stop_tracing():
+    global _tracing_sessions
+    with _tracing_lock:
+        peak = tracemalloc.get_traced_memory()[1]
+        _tracing_sessions -= 1
+        if _tracing_sessions == 0:
+            tracemalloc.stop()
+        return peak
+
+
+class profile_page:
+    """Context manager profiling one page render; a no-op when ``enabled`` is false."""
+
+    def __init__(self, page_key, enabled=True, trace_memory=None):
+        self.page_key = page_key
+        self.enabled = enabled
+        self.trace_memory = trace_memory_enabled() if trace_memory is None and enabled else bool(trace_memory)
+
+    def __enter__(self):
+        if not self.enabled:
+            return None
+        _install()
+        self.recorder = _Recorder(self.page_key)
+        self.ctx = get_script_run_ctx()
+        if self.ctx is not None:
+            # Count every delta this run sends, whichever command produced it
+            self.enqueue = self.ctx._enqueue
+            recorder, enqueue = self.recorder, self.enqueue
+
+            def counting_enqueue(msg):
+                recorder.on_message(msg)
+                enqueue(msg)
+
+            self.ctx._enqueue = counting_enqueue
+        _local.recorder = self.recorder
+        self.started_at = datetime.datetime.now(datetime.timezone.utc)
+        self.baseline_memory = _start_tracing() if self.trace_memory else None
+        self.start = time.perf_counter()
+        return self.recorder
+
+    def __exit__(self, exc_type, exc, tb):
+        if not self.enabled:
+            return False
+        wall = time.perf_counter() - self.start
+        peak = _stop_tracing() if self.trace_memory else None
+        _local.recorder = None
+        if self.ctx is not None:
+            self.ctx._enqueue = self.enqueue
+        recorder = self.recorder
+        profiles = st.session_state.setdefault(SESSION_KEY, [])
+        profiles.append({
+            "page": recorder.page_key,
+            "started_at": self.started_at.isoformat(timespec="seconds"),
+            "wall_ms": round(wall * 1000, 2),
+            "elements": recorder.elements,
+            "payload_bytes": recorder.payload_bytes,
+            "peak_memory_bytes": max(peak - self.baseline_memory, 0) if peak is not None else None,
+            "error": exc_type.__name__ if exc_type else None,
+            "calls": {command: dict(stats, wall_ms=round(stats["wall_ms"], 2))
+                      for command, stats in sorted(recorder.calls.items())},
+        })
+        del profiles[:-MAX_PROFILES]
+        return False
+
+
+def get_profiles():
+    return list(st.session_state.get(SESSION_KEY, []))
+
+
+def page_summary(profiles):
+    """Per page: renders, last/mean/max wall time and last payload, slowest first."""
+    pages = {}
+    for profile in profiles:
+        pages.setdefault(profile["page"], []).append(profile)
+    rows = []
+    for page, runs in pages.items():
+        times = [run["wall_ms"] for run in runs]
+        rows.append({
+            "page": page,
+            "renders": len(runs),
+            "last ms": times[-1],
+            "mean ms": round(sum(times) / len(times), 1),
+            "max ms": max(times),
+            "elements": runs[-1]["elements"],
+            "payload KB": round(runs[-1]["payload_bytes"] / 1024, 1),
+        })
+    return sorted(rows, key=lambda row: row["mean ms"], reverse=True)
+
+
+def export_json(profiles):
+    return json.dumps({"profiles": profiles, "pages": page_summary(profiles)}, indent=2)
+
+
+def render_panel(page_labels=None):
+    """Collapsible sidebar panel with the last render, per-page totals and JSON export."""
+    profiles = get_profiles()
+    page_labels = page_labels or {}
+    with st.expander("⏱️ Render profile", expanded=False):
+        st.checkbox("Trace peak memory (slower renders)", value=trace_memory_enabled(), key=MEMORY_WIDGET_KEY,
+                    help="Applies from the next render")
+        if not profiles:
+            st.caption("No renders profiled yet.")
+            return
+        last = profiles[-1]
+        memory = last["peak_memory_bytes"]
+        st.caption(
+            f"**{page_labels.get(last['page'], last['page'])}** · {last['wall_ms']:.0f} ms · "
+            f"{last['elements']} elements · {last['payload_bytes'] / 1024:.1f} KB"
+            + (f" · peak {memory / 1024 / 1024:.1f} MB" if memory is not None else "")
+        )
+        calls = [{"command": command, "calls": stats["calls"], "ms": stats["wall_ms"],
+                  "KB": round(stats["payload_bytes"] / 1024, 1)}
+                 for command, stats in last["calls"].items()]
+        if calls:
+            st.dataframe(calls, hide_index=True, use_container_width=True)
+        st.caption("Slowest pages this session")
+        st.dataframe(page_summary(profiles), hide_index=True, use_container_width=True)
+        st.download_button(
+            "Export JSON",
+            data=export_json(profiles),
+            file_name="snowtelco_render_profile.json",
+            mime="application/json",
+            use_container_width=True,
+        )
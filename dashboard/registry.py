@@ -0,0 +1,73 @@
+"""Page registry for the demo dashboard.
+
+Each dashboard lives in its own module under ``dashboard.views``. Modules are
+imported the first time ``main()`` dispatches to their page and stay resident
+in ``sys.modules`` afterwards, so a cold start only compiles the page that is
+actually shown.
+"""
+
+import importlib
+
+from dashboard import styles
+
+VIEWS_PACKAGE = "dashboard.views"
+
+# selected_page key -> (module in dashboard.views, render function)
+PAGE_RENDERERS = {
+    "Executive_Summary": ("executive_summary", "render_executive_summary"),
+    "SnowTelco_Website": ("snowtelco_website", "render_snowtelco_website"),
+    "Persona_Hub": ("persona_hub", "render_persona_hub"),
+    "00_WOW_Executive_Showcase": ("executive_showcase", "render_executive_showcase"),
+    "01_CEO_Strategic": ("ceo_strategic", "render_ceo_strategic"),
+    "02_CFO_Finance": ("cfo_financial", "render_cfo_financial"),
+    "03_CMO_Marketing": ("cmo_marketing", "render_cmo_marketing"),
+    "04_CTO_Technology": ("cto_technology", "render_cto_technology"),
+    "05_COO_Operations": ("coo_operations", "render_coo_operations"),
+    "06_CCO_Commercial": ("cco_commercial", "render_cco_commercial"),
+    "07_CXO_Customer_Experience": ("cxo_customer_experience", "render_cxo_customer_experience"),
+    "08_CNO_Network_QoE": ("cno_network", "render_cno_network"),
+    "09_CDO_Data_Science": ("cdo_data_science", "render_cdo_data_science"),
+    "10_CSO_Sustainability": ("cso_sustainability", "render_cso_sustainability"),
+    "11_VP_Customer_Service": ("vp_customer_service", "render_vp_customer_service"),
+    "12_VP_Network_Operations": ("vp_network_operations", "render_vp_network_operations"),
+    "Alert_Center": ("alert_center", "render_alert_center"),
+    "13_Head_of_Partners": ("head_of_partners", "render_head_of_partners"),
+    "14_VP_Billing_Revenue": ("vp_billing_revenue", "render_vp_billing_revenue"),
+    "15_VP_IT_Digital": ("vp_it_digital", "render_vp_it_digital"),
+    "16_VP_Field_Operations": ("vp_field_operations", "render_vp_field_operations"),
+    "17_VP_Strategy": ("vp_strategy", "render_vp_strategy"),
+    "18_VP_Communications": ("vp_communications", "render_vp_communications"),
+    "19_Regulatory_Compliance": ("regulatory_compliance", "render_regulatory_compliance"),
+    "20_VP_Security": ("vp_security", "render_vp_security"),
+    "21_VP_Enterprise_Sales": ("vp_enterprise_sales", "render_vp_enterprise_sales"),
+    "22_VP_Wholesale": ("vp_wholesale", "render_vp_wholesale"),
+    "23_VP_Retail": ("vp_retail", "render_vp_retail"),
+    "24_CHRO_People": ("chro_people", "render_chro_people"),
+    "25_VP_Legal": ("vp_legal", "render_vp_legal"),
+    "26_VP_Product": ("vp_product", "render_vp_product"),
+    "27_VP_Procurement": ("vp_procurement", "render_vp_procurement"),
+    "data_monetization": ("data_monetization", "render_data_monetization"),
+    "architecture": ("architecture", "render_architecture_page"),
+}
+
+
+def has_page(page_key):
+    return page_key in PAGE_RENDERERS
+
+
+def get_renderer(page_key):
+    """Return the render function for ``page_key``, importing its module on first use."""
+    module_name, func_name = PAGE_RENDERERS[page_key]
+    module = importlib.import_module(f"{VIEWS_PACKAGE}.{module_name}")
+    return getattr(module, func_name)
+
+
+def render_page(page_key):
+    styles.inject_page_styles(PAGE_RENDERERS[page_key][0])
+    get_renderer(page_key)()
+
+
+def load_all():
+    """Import every page module up front (used by the startup benchmark)."""
+    for page_key in PAGE_RENDERERS:
+        get_renderer(page_key)
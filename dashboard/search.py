@@ -0,0 +1,435 @@
+"""Sidebar "Search Insights" index.
+
+The searchable entries (visualizations, generic per-dashboard terms and role
+terms) are static, so they are expanded once per process and turned into an
+inverted index over tokens, token prefixes and token trigrams. Queries are
+answered from the index with ranked, typo-tolerant matching instead of a
+substring scan over every entry on every rerun.
+"""
+
+import re
+from collections import defaultdict
+
+import streamlit as st
+
+VISUALIZATION_INDEX = [
+    # Executive Summary
+    {"name": "Company Health Overview", "dashboard": "Executive_Summary", "label": "Executive Summary"},
+    {"name": "Key Performance Indicators", "dashboard": "Executive_Summary", "label": "Executive Summary"},
+
+    # SnowTelco Website
+    {"name": "Homepage Highlights", "dashboard": "SnowTelco_Website", "label": "SnowTelco Website"},
+    {"name": "Plan Comparison", "dashboard": "SnowTelco_Website", "label": "SnowTelco Website"},
+    {"name": "Coverage Map", "dashboard": "SnowTelco_Website", "label": "SnowTelco Website"},
+
+    # Persona Hub
+    {"name": "Persona Explorer", "dashboard": "Persona_Hub", "label": "Persona Hub"},
+    {"name": "Persona Highlights", "dashboard": "Persona_Hub", "label": "Persona Hub"},
+    {"name": "Persona Navigation", "dashboard": "Persona_Hub", "label": "Persona Hub"},
+
+    # Executive Showcase
+    {"name": "Executive Performance Signals", "dashboard": "00_WOW_Executive_Showcase", "label": "Executive Showcase"},
+    {"name": "Revenue Bridge (YoY)", "dashboard": "00_WOW_Executive_Showcase", "label": "Executive Showcase"},
+    {"name": "Revenue & EBITDA Margin Trend", "dashboard": "00_WOW_Executive_Showcase", "label": "Executive Showcase"},
+    {"name": "Cash Flow vs Capex", "dashboard": "00_WOW_Executive_Showcase", "label": "Executive Showcase"},
+    {"name": "Product Mix Momentum", "dashboard": "00_WOW_Executive_Showcase", "label": "Executive Showcase"},
+    {"name": "ARPU by Segment", "dashboard": "00_WOW_Executive_Showcase", "label": "Executive Showcase"},
+    {"name": "Plan Mix by Type", "dashboard": "00_WOW_Executive_Showcase", "label": "Executive Showcase"},
+    {"name": "Regional Performance Heatmap", "dashboard": "00_WOW_Executive_Showcase", "label": "Executive Showcase"},
+    {"name": "Competitive Porting Analysis", "dashboard": "00_WOW_Executive_Showcase", "label": "Executive Showcase"},
+    {"name": "Experience vs NPS", "dashboard": "00_WOW_Executive_Showcase", "label": "Executive Showcase"},
+    {"name": "Churn Cohort Waterfall", "dashboard": "00_WOW_Executive_Showcase", "label": "Executive Showcase"},
+    
+    # CEO Strategic
+    {"name": "Revenue Trend", "dashboard": "01_CEO_Strategic", "label": "CEO Strategic Dashboard"},
+    {"name": "Customer Growth", "dashboard": "01_CEO_Strategic", "label": "CEO Strategic Dashboard"},
+    {"name": "Market Share", "dashboard": "01_CEO_Strategic", "label": "CEO Strategic Dashboard"},
+    {"name": "NPS Score Trend", "dashboard": "01_CEO_Strategic", "label": "CEO Strategic Dashboard"},
+    {"name": "AI Executive Briefing", "dashboard": "01_CEO_Strategic", "label": "CEO Strategic Dashboard"},
+    {"name": "Customer Overview", "dashboard": "01_CEO_Strategic", "label": "CEO Strategic Dashboard"},
+    
+    # CFO Finance
+    {"name": "Revenue by Segment", "dashboard": "02_CFO_Finance", "label": "CFO Finance Dashboard"},
+    {"name": "ARPU Analysis", "dashboard": "02_CFO_Finance", "label": "CFO Finance Dashboard"},
+    {"name": "Cost Structure", "dashboard": "02_CFO_Finance", "label": "CFO Finance Dashboard"},
+    {"name": "EBITDA Margin", "dashboard": "02_CFO_Finance", "label": "CFO Finance Dashboard"},
+    {"name": "What-If Scenario Analysis", "dashboard": "02_CFO_Finance", "label": "CFO Finance Dashboard"},
+    {"name": "Budget vs Actual", "dashboard": "02_CFO_Finance", "label": "CFO Finance Dashboard"},
+    {"name": "Cash Flow", "dashboard": "02_CFO_Finance", "label": "CFO Finance Dashboard"},
+    
+    # CMO Marketing
+    {"name": "Campaign Performance", "dashboard": "03_CMO_Marketing", "label": "CMO Marketing Dashboard"},
+    {"name": "Customer Acquisition Cost", "dashboard": "03_CMO_Marketing", "label": "CMO Marketing Dashboard"},
+    {"name": "Channel ROI", "dashboard": "03_CMO_Marketing", "label": "CMO Marketing Dashboard"},
+    {"name": "Brand Sentiment", "dashboard": "03_CMO_Marketing", "label": "CMO Marketing Dashboard"},
+    {"name": "Social Media Analytics", "dashboard": "03_CMO_Marketing", "label": "CMO Marketing Dashboard"},
+    {"name": "B2C Customer Insights", "dashboard": "03_CMO_Marketing", "label": "CMO Marketing Dashboard"},
+    {"name": "Customer Segmentation", "dashboard": "03_CMO_Marketing", "label": "CMO Marketing Dashboard"},
+    
+    # CTO Technology
+    {"name": "System Availability", "dashboard": "04_CTO_Technology", "label": "CTO Technology Dashboard"},
+    {"name": "IT Incidents", "dashboard": "04_CTO_Technology", "label": "CTO Technology Dashboard"},
+    {"name": "Digital Transformation", "dashboard": "04_CTO_Technology", "label": "CTO Technology Dashboard"},
+    {"name": "Cloud Migration", "dashboard": "04_CTO_Technology", "label": "CTO Technology Dashboard"},
+    
+    # COO Operations
+    {"name": "Operational Efficiency", "dashboard": "05_COO_Operations", "label": "COO Operations Dashboard"},
+    {"name": "SLA Compliance", "dashboard": "05_COO_Operations", "label": "COO Operations Dashboard"},
+    {"name": "Field Operations", "dashboard": "05_COO_Operations", "label": "COO Operations Dashboard"},
+    {"name": "Workforce Productivity", "dashboard": "05_COO_Operations", "label": "COO Operations Dashboard"},
+    
+    # CCO Commercial
+    {"name": "Sales Pipeline", "dashboard": "06_CCO_Commercial", "label": "CCO Commercial Dashboard"},
+    {"name": "Revenue by Product", "dashboard": "06_CCO_Commercial", "label": "CCO Commercial Dashboard"},
+    {"name": "Subscriber Growth", "dashboard": "06_CCO_Commercial", "label": "CCO Commercial Dashboard"},
+    {"name": "Churn Analysis", "dashboard": "06_CCO_Commercial", "label": "CCO Commercial Dashboard"},
+    {"name": "Port-in Port-out", "dashboard": "06_CCO_Commercial", "label": "CCO Commercial Dashboard"},
+    
+    # CXO Customer Experience
+    {"name": "Customer Satisfaction", "dashboard": "07_CXO_Customer_Experience", "label": "CXO Customer Experience"},
+    {"name": "NPS by Segment", "dashboard": "07_CXO_Customer_Experience", "label": "CXO Customer Experience"},
+    {"name": "Customer Journey", "dashboard": "07_CXO_Customer_Experience", "label": "CXO Customer Experience"},
+    {"name": "Support Tickets", "dashboard": "07_CXO_Customer_Experience", "label": "CXO Customer Experience"},
+    
+    # CNO Network
+    {"name": "Network Availability", "dashboard": "08_CNO_Network_QoE", "label": "CNO Network Dashboard"},
+    {"name": "5G Coverage Map", "dashboard": "08_CNO_Network_QoE", "label": "CNO Network Dashboard"},
+    {"name": "UK Coverage Map", "dashboard": "08_CNO_Network_QoE", "label": "CNO Network Dashboard"},
+    {"name": "Network Quality", "dashboard": "08_CNO_Network_QoE", "label": "CNO Network Dashboard"},
+    {"name": "Cell Site Performance", "dashboard": "08_CNO_Network_QoE", "label": "CNO Network Dashboard"},
+    {"name": "Coverage by Region", "dashboard": "08_CNO_Network_QoE", "label": "CNO Network Dashboard"},
+    
+    # CDO Data Science
+    {"name": "Churn Prediction Model", "dashboard": "09_CDO_Data_Science", "label": "CDO AI/ML Dashboard"},
+    {"name": "Propensity Scores", "dashboard": "09_CDO_Data_Science", "label": "CDO AI/ML Dashboard"},
+    {"name": "Customer Lifetime Value", "dashboard": "09_CDO_Data_Science", "label": "CDO AI/ML Dashboard"},
+    {"name": "ML Model Performance", "dashboard": "09_CDO_Data_Science", "label": "CDO AI/ML Dashboard"},
+    {"name": "Customer 360 Deep Dive", "dashboard": "11_VP_Customer_Service", "label": "VP Customer Service"},
+    {"name": "Next Best Action", "dashboard": "09_CDO_Data_Science", "label": "CDO AI/ML Dashboard"},
+    
+    # CSO Sustainability
+    {"name": "Carbon Footprint", "dashboard": "10_CSO_Sustainability", "label": "CSO Sustainability Dashboard"},
+    {"name": "Energy Consumption", "dashboard": "10_CSO_Sustainability", "label": "CSO Sustainability Dashboard"},
+    {"name": "ESG Metrics", "dashboard": "10_CSO_Sustainability", "label": "CSO Sustainability Dashboard"},
+    {"name": "Renewable Energy", "dashboard": "10_CSO_Sustainability", "label": "CSO Sustainability Dashboard"},
+    
+    # VP Customer Service
+    {"name": "Call Center Metrics", "dashboard": "11_VP_Customer_Service", "label": "VP Customer Service"},
+    {"name": "Average Handle Time", "dashboard": "11_VP_Customer_Service", "label": "VP Customer Service"},
+    {"name": "First Contact Resolution", "dashboard": "11_VP_Customer_Service", "label": "VP Customer Service"},
+    {"name": "Customer Effort Score", "dashboard": "11_VP_Customer_Service", "label": "VP Customer Service"},
+    
+    # VP Network Operations
+    {"name": "Network Alarms", "dashboard": "12_VP_Network_Operations", "label": "VP Network Operations"},
+    {"name": "Capacity Utilization", "dashboard": "12_VP_Network_Operations", "label": "VP Network Operations"},
+    {"name": "Fault Management", "dashboard": "12_VP_Network_Operations", "label": "VP Network Operations"},
+    {"name": "RF Optimization", "dashboard": "12_VP_Network_Operations", "label": "VP Network Operations"},
+    {"name": "Signal Quality (RSRP/RSRQ/SINR)", "dashboard": "12_VP_Network_Operations", "label": "VP Network Operations"},
+    {"name": "Handover Success", "dashboard": "12_VP_Network_Operations", "label": "VP Network Operations"},
+    {"name": "Call Drop Rate", "dashboard": "12_VP_Network_Operations", "label": "VP Network Operations"},
+    
+    # Alert Center
+    {"name": "UK Network Map", "dashboard": "Alert_Center", "label": "Network Alert Center"},
+    {"name": "Live Alert Feed", "dashboard": "Alert_Center", "label": "Network Alert Center"},
+    {"name": "Critical Alerts", "dashboard": "Alert_Center", "label": "Network Alert Center"},
+    {"name": "MTTR Analysis", "dashboard": "Alert_Center", "label": "Network Alert Center"},
+    {"name": "SLA Compliance", "dashboard": "Alert_Center", "label": "Network Alert Center"},
+    {"name": "Incident Response", "dashboard": "Alert_Center", "label": "Network Alert Center"},
+    {"name": "Alert Trend", "dashboard": "Alert_Center", "label": "Network Alert Center"},
+    {"name": "Tower Status", "dashboard": "Alert_Center", "label": "Network Alert Center"},
+    
+    # Head of Partners
+    {"name": "Partner Revenue", "dashboard": "13_Head_of_Partners", "label": "Head of Partners"},
+    {"name": "MVNO Performance", "dashboard": "13_Head_of_Partners", "label": "Head of Partners"},
+    {"name": "Partner Pipeline", "dashboard": "13_Head_of_Partners", "label": "Head of Partners"},
+    
+    # VP Billing
+    {"name": "Billing Accuracy", "dashboard": "14_VP_Billing_Revenue", "label": "VP Billing & Revenue"},
+    {"name": "Revenue Assurance", "dashboard": "14_VP_Billing_Revenue", "label": "VP Billing & Revenue"},
+    {"name": "Invoice Status", "dashboard": "14_VP_Billing_Revenue", "label": "VP Billing & Revenue"},
+    
+    # VP IT Digital
+    {"name": "System Health", "dashboard": "15_VP_IT_Digital", "label": "VP IT & Digital"},
+    {"name": "Incident Management", "dashboard": "15_VP_IT_Digital", "label": "VP IT & Digital"},
+    {"name": "Application Performance", "dashboard": "15_VP_IT_Digital", "label": "VP IT & Digital"},
+    
+    # VP Field Operations
+    {"name": "Technician Performance", "dashboard": "16_VP_Field_Operations", "label": "VP Field Operations"},
+    {"name": "First Time Fix Rate", "dashboard": "16_VP_Field_Operations", "label": "VP Field Operations"},
+    {"name": "Work Order Status", "dashboard": "16_VP_Field_Operations", "label": "VP Field Operations"},
+    
+    # VP Strategy
+    {"name": "Competitor Analysis", "dashboard": "17_VP_Strategy", "label": "VP Strategy"},
+    {"name": "Market Share Trend", "dashboard": "17_VP_Strategy", "label": "VP Strategy"},
+    {"name": "ARPU Comparison", "dashboard": "17_VP_Strategy", "label": "VP Strategy"},
+    
+    # VP Communications
+    {"name": "Social Sentiment", "dashboard": "18_VP_Communications", "label": "VP Communications"},
+    {"name": "Media Coverage", "dashboard": "18_VP_Communications", "label": "VP Communications"},
+    {"name": "Brand Mentions", "dashboard": "18_VP_Communications", "label": "VP Communications"},
+    
+    # Regulatory Compliance
+    {"name": "Compliance Status", "dashboard": "19_Regulatory_Compliance", "label": "Regulatory Compliance"},
+    {"name": "Ofcom Metrics", "dashboard": "19_Regulatory_Compliance", "label": "Regulatory Compliance"},
+    {"name": "SLA Performance", "dashboard": "19_Regulatory_Compliance", "label": "Regulatory Compliance"},
+    
+    # VP Security
+    {"name": "Fraud Detection", "dashboard": "20_VP_Security", "label": "VP Security"},
+    {"name": "Security Incidents", "dashboard": "20_VP_Security", "label": "VP Security"},
+    {"name": "Fraud by Category", "dashboard": "20_VP_Security", "label": "VP Security"},
+    
+    # VP Enterprise Sales
+    {"name": "B2B Pipeline", "dashboard": "21_VP_Enterprise_Sales", "label": "VP Enterprise Sales"},
+    {"name": "Contract Portfolio", "dashboard": "21_VP_Enterprise_Sales", "label": "VP Enterprise Sales"},
+    {"name": "Enterprise Revenue", "dashboard": "21_VP_Enterprise_Sales", "label": "VP Enterprise Sales"},
+    {"name": "Account Health", "dashboard": "21_VP_Enterprise_Sales", "label": "VP Enterprise Sales"},
+    
+    # VP Wholesale
+    {"name": "Wholesale Revenue", "dashboard": "22_VP_Wholesale", "label": "VP Wholesale"},
+    {"name": "MVNO Partners", "dashboard": "22_VP_Wholesale", "label": "VP Wholesale"},
+    {"name": "Interconnect Traffic", "dashboard": "22_VP_Wholesale", "label": "VP Wholesale"},
+    
+    # VP Retail
+    {"name": "Store Performance", "dashboard": "23_VP_Retail", "label": "VP Retail"},
+    {"name": "Footfall Analytics", "dashboard": "23_VP_Retail", "label": "VP Retail"},
+    {"name": "Retail Sales", "dashboard": "23_VP_Retail", "label": "VP Retail"},
+    
+    # CHRO People
+    {"name": "Headcount", "dashboard": "24_CHRO_People", "label": "CHRO People"},
+    {"name": "Employee Turnover", "dashboard": "24_CHRO_People", "label": "CHRO People"},
+    {"name": "Training Completion", "dashboard": "24_CHRO_People", "label": "CHRO People"},
+    
+    # VP Legal
+    {"name": "Legal Matters", "dashboard": "25_VP_Legal", "label": "VP Legal"},
+    {"name": "Contract Risk", "dashboard": "25_VP_Legal", "label": "VP Legal"},
+    {"name": "Litigation Status", "dashboard": "25_VP_Legal", "label": "VP Legal"},
+    
+    # VP Product
+    {"name": "Product Performance", "dashboard": "26_VP_Product", "label": "VP Product Management"},
+    {"name": "Plan Subscribers", "dashboard": "26_VP_Product", "label": "VP Product Management"},
+    {"name": "ARPU by Plan", "dashboard": "26_VP_Product", "label": "VP Product Management"},
+    
+    # VP Procurement
+    {"name": "Vendor Spend", "dashboard": "27_VP_Procurement", "label": "VP Procurement"},
+    {"name": "Contract Renewals", "dashboard": "27_VP_Procurement", "label": "VP Procurement"},
+    {"name": "Procurement Pipeline", "dashboard": "27_VP_Procurement", "label": "VP Procurement"},
+    
+    # Data Monetization
+    {"name": "Data Revenue", "dashboard": "data_monetization", "label": "Data Monetization"},
+    {"name": "Data Products", "dashboard": "data_monetization", "label": "Data Monetization"},
+    {"name": "Data Sharing Architecture", "dashboard": "data_monetization", "label": "Data Monetization"},
+    {"name": "Clean Rooms", "dashboard": "data_monetization", "label": "Data Monetization"},
+    {"name": "Marketplace Listings", "dashboard": "data_monetization", "label": "Data Monetization"},
+    {"name": "Partner Data Ecosystem", "dashboard": "data_monetization", "label": "Data Monetization"},
+    {"name": "Cross-Industry Use Cases", "dashboard": "data_monetization", "label": "Data Monetization"},
+    
+    # Architecture
+    {"name": "Platform Architecture", "dashboard": "architecture", "label": "Architecture Overview"},
+    {"name": "Data Engineering", "dashboard": "architecture", "label": "Architecture Overview"},
+    {"name": "Data Flow", "dashboard": "architecture", "label": "Architecture Overview"},
+    {"name": "ML Models", "dashboard": "architecture", "label": "Architecture Overview"},
+    {"name": "Snowflake Intelligence", "dashboard": "architecture", "label": "Architecture Overview"},
+    {"name": "Data Sources Inventory", "dashboard": "architecture", "label": "Architecture Overview"},
+]
+
+LABEL_OVERRIDES = {
+    "Executive_Summary": "Executive Summary",
+    "03_CMO_Marketing": "CMO Marketing Dashboard",
+    "04_CTO_Technology": "CTO Technology Dashboard",
+    "05_COO_Operations": "COO Operations Dashboard",
+    "06_CCO_Commercial": "CCO Commercial Dashboard",
+    "07_CXO_Customer_Experience": "CXO Customer Experience Dashboard",
+    "08_CNO_Network_QoE": "CNO Network Quality Dashboard",
+    "09_CDO_Data_Science": "CDO AI/ML Analytics Dashboard",
+    "10_CSO_Sustainability": "CSO Sustainability Dashboard"
+}
+
+EXTRA_PAGES = {
+    "data_monetization": "Data Monetization",
+    "architecture": "Architecture Overview"
+}
+
+ROLE_TERMS = {
+    "Executive_Summary": ["executive summary", "company health", "kpi", "overview"],
+    "SnowTelco_Website": ["website", "plans", "coverage", "pricing"],
+    "Persona_Hub": ["persona", "role", "dashboard"],
+    "00_WOW_Executive_Showcase": ["executive showcase", "performance", "market", "customers", "revenue", "nps"],
+    "01_CEO_Strategic": ["strategy", "growth", "market share", "revenue", "nps"],
+    "02_CFO_Finance": ["finance", "ebitda", "cash flow", "budget", "capex", "arpu"],
+    "03_CMO_Marketing": ["marketing", "campaign", "cac", "roi", "sentiment", "social"],
+    "04_CTO_Technology": ["technology", "availability", "incidents", "cloud", "digital transformation"],
+    "05_COO_Operations": ["operations", "sla", "efficiency", "workforce", "field operations"],
+    "06_CCO_Commercial": ["commercial", "pipeline", "revenue", "churn", "subscriber growth"],
+    "07_CXO_Customer_Experience": ["customer experience", "nps", "csat", "journey", "tickets"],
+    "08_CNO_Network_QoE": ["network", "5g", "coverage", "qoe", "cell site"],
+    "09_CDO_Data_Science": ["data science", "ml", "churn prediction", "propensity", "clv", "model"],
+    "10_CSO_Sustainability": ["sustainability", "esg", "carbon", "energy", "renewable"],
+    "11_VP_Customer_Service": ["customer service", "call center", "aht", "fcr", "ces"],
+    "12_VP_Network_Operations": ["network ops", "alarms", "capacity", "fault", "handover", "rsrp"],
+    "Alert_Center": ["alerts", "incidents", "mttr", "sla", "network map"],
+    "13_Head_of_Partners": ["partners", "mvno", "pipeline", "partner revenue"],
+    "14_VP_Billing_Revenue": ["billing", "revenue assurance", "invoice", "disputes", "accuracy"],
+    "15_VP_IT_Digital": ["it", "digital", "system health", "application performance", "incident management"],
+    "16_VP_Field_Operations": ["field ops", "technician", "work orders", "first time fix"],
+    "17_VP_Strategy": ["strategy", "competitor", "market share", "arpu", "pricing"],
+    "18_VP_Communications": ["communications", "sentiment", "media", "brand"],
+    "19_Regulatory_Compliance": ["regulatory", "compliance", "ofcom", "sla"],
+    "20_VP_Security": ["security", "fraud", "incidents", "risk"],
+    "21_VP_Enterprise_Sales": ["enterprise sales", "pipeline", "contracts", "account health"],
+    "22_VP_Wholesale": ["wholesale", "mvno", "interconnect", "wholesale revenue"],
+    "23_VP_Retail": ["retail", "stores", "footfall", "retail sales"],
+    "24_CHRO_People": ["people", "headcount", "turnover", "training", "attrition"],
+    "25_VP_Legal": ["legal", "litigation", "contracts", "compliance", "outside counsel"],
+    "26_VP_Product": ["product", "roadmap", "launch", "pricing", "nps", "churn"],
+    "27_VP_Procurement": ["procurement", "spend", "sourcing", "savings", "vendors"],
+    "data_monetization": ["data monetization", "data products", "clean rooms", "marketplace"],
+    "architecture": ["architecture", "data flow", "engineering", "ml models", "snowflake intelligence"]
+}
+
+GENERIC_TERMS = ["Overview", "KPIs", "Insights"]
+
+# Score contribution of a query token by how it matched, scaled by the field it
+# matched in. A visualization name outranks its dashboard label or key.
+EXACT_SCORE = 3.0
+PREFIX_SCORE = 2.0
+FUZZY_SCORE = 1.0
+FIELD_WEIGHTS = {"name": 1.0, "label": 0.6, "dashboard": 0.4}
+
+MIN_PREFIX_LEN = 1
+MIN_FUZZY_LEN = 4
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text):
+    return _TOKEN_RE.findall(text.lower())
+
+
+def trigrams(token):
+    padded = f"  {token} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def edit_distance(a, b, limit):
+    """Levenshtein distance between ``a`` and ``b``, or ``limit + 1`` once it is exceeded."""
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        if min(current) > limit:
+            return limit + 1
+        previous = current
+    return previous[-1]
+
+
+def page_label(key, pages):
+    return EXTRA_PAGES.get(key) or LABEL_OVERRIDES.get(key) or pages[key]["title"]
+
+
+def build_entries(pages):
+    """Expand VISUALIZATION_INDEX with generic and role terms for every dashboard."""
+    entries = list(VISUALIZATION_INDEX)
+    all_keys = set(pages.keys()) | set(LABEL_OVERRIDES.keys()) | set(EXTRA_PAGES.keys())
+    existing = {(v["name"], v["dashboard"]) for v in entries}
+
+    def add(name, key, label):
+        if (name, key) not in existing:
+            entries.append({"name": name, "dashboard": key, "label": label})
+            existing.add((name, key))
+
+    for key in sorted(all_keys):
+        label = page_label(key, pages)
+        for term in GENERIC_TERMS:
+            add(f"{label} {term}", key, label)
+
+    for key, terms in ROLE_TERMS.items():
+        if key not in all_keys:
+            continue
+        label = page_label(key, pages)
+        for term in terms:
+            add(term.title() if term.islower() else term, key, label)
+    return entries
+
+
+class SearchIndex:
+    """Token, prefix and trigram inverted index over search entries."""
+
+    def __init__(self, entries):
+        self.entries = entries
+        # token -> {entry id: best field weight}
+        self.postings = defaultdict(dict)
+        # prefix -> tokens starting with it
+        self.prefixes = defaultdict(set)
+        # trigram -> tokens containing it
+        self.trigram_index = defaultdict(set)
+
+        for entry_id, entry in enumerate(entries):
+            for field, weight in FIELD_WEIGHTS.items():
+                for token in tokenize(entry[field]):
+                    postings = self.postings[token]
+                    if weight > postings.get(entry_id, 0.0):
+                        postings[entry_id] = weight
+
+        for token in self.postings:
+            for i in range(MIN_PREFIX_LEN, len(token)):
+                self.prefixes[token[:i]].add(token)
+            for gram in trigrams(token):
+                self.trigram_index[gram].add(token)
+
+    def _expand(self, query_token):
+        """Return ``{index token: match score}`` for one query token."""
+        if query_token in self.postings:
+            matches = {query_token: EXACT_SCORE}
+        else:
+            matches = {}
+        for token in self.prefixes.get(query_token, ()):
+            matches.setdefault(token, PREFIX_SCORE)
+        if matches or len(query_token) < MIN_FUZZY_LEN:
+            return matches
+
+        limit = 1 if len(query_token) <= 5 else 2
+        query_grams = trigrams(query_token)
+        candidates = defaultdict(int)
+        for gram in query_grams:
+            for token in self.trigram_index.get(gram, ()):
+                candidates[token] += 1
+        for token, shared in candidates.items():
+            if shared * 3 < len(query_grams):
+                continue
+            distance = edit_distance(query_token, token, limit)
+            if distance <= limit:
+                matches[token] = FUZZY_SCORE * (1 - distance / (limit + 1))
+        return matches
+
+    def search(self, query):
+        """Return entries matching every query token, best match first."""
+        query_tokens = tokenize(query)
+        if not query_tokens:
+            return []
+
+        scores = None
+        for query_token in query_tokens:
+            token_scores = defaultdict(float)
+            for token, match_score in self._expand(query_token).items():
+                for entry_id, weight in self.postings[token].items():
+                    score = match_score * weight
+                    if score > token_scores[entry_id]:
+                        token_scores[entry_id] = score
+            if scores is None:
+                scores = dict(token_scores)
+            else:
+                scores = {e: s + token_scores[e] for e, s in scores.items() if e in token_scores}
+            if not scores:
+                return []
+
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return [self.entries[entry_id] for entry_id, _ in ranked]
+
+
+@st.cache_resource(show_spinner=False)
+def get_search_index(_pages):
+    """Build the search index once per server process."""
+    return SearchIndex(build_entries(_pages))
@@ -0,0 +1,630 @@
+"""Static snapshot of the dashboard for offline presentations.
+
+:func:`build_bundle` renders every page in ``registry.PAGE_RENDERERS`` with
+Streamlit's AppTest, converts the element tree of each render to plain HTML and
+writes one self-contained ``index.html``:
+
+- the shared stylesheet (``styles.build_stylesheet``) is inlined once in the
+  document head; a page's own ``<style>`` diff stays in its markup
+- every page is a ``<template>`` shown by ``frontend/snapshot/snapshot.js`` on
+  a hash change, so switching pages needs no request and no Python process
+- charts are the compiled Vega-Lite specs Streamlit would have sent, with their
+  Arrow datasets decoded to JSON once per page and shared by the page's charts.
+  deck.gl maps become Vega-Lite point maps; Graphviz charts are pre-rendered to
+  SVG when ``dot`` is installed and rendered by viz.js otherwise
+- widgets are drawn in their default state and disabled
+
+Vega, Vega-Lite, vega-embed and viz.js are copied into ``vendor/`` next to the
+page (downloaded once, or taken from ``vendor_dir``). Without them the page
+falls back to the CDN URLs, which only helps where there is a connection.
+"""
+
+import datetime
+import html
+import json
+import os
+import re
+import shutil
+import subprocess
+import time
+import urllib.request
+
+from dashboard import navigation, registry, search, styles
+from dashboard.pages import C_SUITE_PAGES, PAGES, TOOL_PAGES, VP_PAGES
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(REPO_ROOT, "demo_dashboard_app.py")
+FRONTEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "frontend", "snapshot")
+SNAPSHOT_PATH = os.path.join(REPO_ROOT, "demo_snapshot")
+DEFAULT_PAGE = "Executive_Summary"
+CAPTURE_TIMEOUT = 300
+# Rows of a st.dataframe written into the page
+MAX_TABLE_ROWS = 500
+MAP_HEIGHT = 450
+
+VENDOR_SCRIPTS = (
+    ("vega.min.js", "https://cdn.jsdelivr.net/npm/vega@6/build/vega.min.js"),
+    ("vega-lite.min.js", "https://cdn.jsdelivr.net/npm/vega-lite@6/build/vega-lite.min.js"),
+    ("vega-embed.min.js", "https://cdn.jsdelivr.net/npm/vega-embed@7/build/vega-embed.min.js"),
+    ("viz-standalone.js", "https://cdn.jsdelivr.net/npm/@viz-js/viz@3/lib/viz-standalone.js"),
+)
+
+NAV_SECTIONS = (
+    ("exec", "Executive", C_SUITE_PAGES),
+    ("vp", "VP & Directors", VP_PAGES),
+    ("tools", "Tools", TOOL_PAGES),
+)
+
+_DOCUMENT_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<title>SnowTelco Demo Dashboard</title>
+<style>%(base_css)s</style>
+<style>%(app_css)s</style>
+</head>
+<body>
+<aside class="snap-sidebar">
+<div class="snap-brand">❄️ SnowTelco</div>
+<div class="snap-built">Static snapshot · %(built)s</div>
+%(nav)s
+</aside>
+<main id="snap-main" class="snap-main"></main>
+%(templates)s
+%(scripts)s
+<script>window.SNAPSHOT_DEFAULT_PAGE = %(default_page)s;</script>
+<script>%(app_js)s</script>
+</body>
+</html>
+"""
+
+# Streamlit's own markdown never runs scripts
+_SCRIPT_RE = re.compile(r"<script\b.*?</script>", re.S | re.I)
+_CODE_RE = re.compile(r"`([^`\n]+)`")
+_BOLD_RE = re.compile(r"\*\*(?=\S)(.+?)(?<=\S)\*\*|__(?=\S)(.+?)(?<=\S)__")
+_ITALIC_RE = re.compile(r"(?<![*\w])\*(?=[^\s*])(.+?)(?<=[^\s*])\*(?![*\w])|(?<![_\w])_(?=\S)(.+?)(?<=\S)_(?![_\w])")
+_LINK_RE = re.compile(r"\[([^\]]+)\]\(([^)\s]+)\)")
+_COLOR_RE = re.compile(r":(red|orange|yellow|green|blue|violet|gray|grey|primary)\[(.+?)\]")
+_HEADING_RE = re.compile(r"^(#{1,6})\s+(.*?)\s*#*$")
+_LIST_RE = re.compile(r"^\s*(?:([-*+])|(\d+)[.)])\s+(.*)$")
+_RULE_RE = re.compile(r"^\s*(?:-{3,}|\*{3,}|_{3,})\s*$")
+_TABLE_SEPARATOR_RE = re.compile(r"^\s*\|?\s*:?-{2,}:?\s*(\|\s*:?-{2,}:?\s*)*\|?\s*$")
+_TOOLTIP_FIELD_RE = re.compile(r"{(\w+)}")
+
+_COLORS = {"red": "#FF4B4B", "orange": "#FFA421", "yellow": "#FACA2B", "green": "#21C354", "blue": "#1C83E1",
+           "violet": "#803DF5", "gray": "#808495", "grey": "#808495", "primary": "#29B5E8"}
+
+
+def inline_markdown(text, allow_html=False):
+    """Bold, italic, code, links and ``:color[...]`` of one line of Streamlit markdown."""
+    codes = []
+
+    def keep_code(match):
+        codes.append(f"<code>{html.escape(match.group(1))}</code>")
+        return f"\x00{len(codes) - 1}\x00"
+
+    text = _CODE_RE.sub(keep_code, text)
+    if not allow_html:
+        text = html.escape(text, quote=False)
+    text = _BOLD_RE.sub(lambda m: f"<strong>{m.group(1) or m.group(2)}</strong>", text)
+    text = _ITALIC_RE.sub(lambda m: f"<em>{m.group(1) or m.group(2)}</em>", text)
+    text = _LINK_RE.sub(lambda m: f'<a href="{html.escape(m.group(2))}" target="_blank">{m.group(1)}</a>', text)
+    text = _COLOR_RE.sub(lambda m: f'<span style="color: {_COLORS[m.group(1)]}">{m.group(2)}</span>', text)
+    return re.sub("\x00(\\d+)\x00", lambda m: codes[int(m.group(1))], text)
+
+
+def _table_cells(line):
+    return [cell.strip() for cell in line.strip().strip("|").split("|")]
+
+
+def markdown_html(body, allow_html=False):
+    """HTML for the subset of Streamlit markdown the dashboard uses.
+
+    Bodies that are an HTML block (``unsafe_allow_html`` markup starting with a
+    tag) are passed through as they are.
+    """
+    body = _SCRIPT_RE.sub("", body) if allow_html else body
+    if allow_html and body.lstrip().startswith("<"):
+        return body
+    out = []
+    paragraph = []
+    list_tag = None
+
+    def close_paragraph():
+        if paragraph:
+            text = "\n".join(paragraph)
+            text = re.sub(r"( {2,}|\\)\n", "<br>\n", text)
+            out.append(f"<p>{text}</p>")
+            paragraph.clear()
+
+    def close_list():
+        nonlocal list_tag
+        if list_tag:
+            out.append(f"</{list_tag}>")
+            list_tag = None
+
+    lines = body.split("\n")
+    i = 0
+    while i < len(lines):
+        line = lines[i]
+        stripped = line.strip()
+        heading = _HEADING_RE.match(stripped)
+        item = _LIST_RE.match(line)
+        if not stripped:
+            close_paragraph()
+            close_list()
+        elif _RULE_RE.match(line) and not paragraph:
+            close_list()
+            out.append("<hr>")
+        elif heading:
+            close_paragraph()
+            close_list()
+            level = len(heading.group(1))
+            out.append(f"<h{level}>{inline_markdown(heading.group(2), allow_html)}</h{level}>")
+        elif stripped.startswith("|") and i + 1 < len(lines) and _TABLE_SEPARATOR_RE.match(lines[i + 1]):
+            close_paragraph()
+            close_list()
+            head = "".join(f"<th>{inline_markdown(cell, allow_html)}</th>" for cell in _table_cells(line))
+            rows = []
+            i += 2
+            while i < len(lines) and lines[i].strip().startswith("|"):
+                rows.append("<tr>" + "".join(f"<td>{inline_markdown(cell, allow_html)}</td>"
+                                             for cell in _table_cells(lines[i])) + "</tr>")
+                i += 1
+            out.append(f'<table class="snap-md-table"><thead><tr>{head}</tr></thead><tbody>{"".join(rows)}</tbody></table>')
+            continue
+        elif item:
+            close_paragraph()
+            tag = "ul" if item.group(1) else "ol"
+            if list_tag != tag:
+                close_list()
+                out.append(f"<{tag}>")
+                list_tag = tag
+            out.append(f"<li>{inline_markdown(item.group(3), allow_html)}</li>")
+        elif allow_html and stripped.startswith("<") and not paragraph:
+            close_list()
+            out.append(line)
+        else:
+            close_list()
+            paragraph.append(inline_markdown(line, allow_html))
+        i += 1
+    close_paragraph()
+    close_list()
+    return "\n".join(out)
+
+
+def arrow_records(data):
+    """Rows of an Arrow IPC stream as JSON-ready dicts (timestamps as epoch milliseconds)."""
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    table = pa.ipc.open_stream(data).read_all()
+    names, columns = [], []
+    for name, column in zip(table.column_names, table.columns):
+        if name.startswith("__index_level_"):
+            continue
+        if pa.types.is_dictionary(column.type):
+            column = column.cast(column.type.value_type)
+        if pa.types.is_timestamp(column.type) or pa.types.is_date(column.type):
+            column = column.cast(pa.timestamp("ms", tz=getattr(column.type, "tz", None))).cast(pa.int64())
+        elif pa.types.is_decimal(column.type):
+            column = column.cast(pa.float64())
+        if pa.types.is_floating(column.type):
+            column = pc.if_else(pc.is_nan(column), pa.scalar(None, column.type), column)
+        elif not (pa.types.is_integer(column.type) or pa.types.is_boolean(column.type)
+                  or pa.types.is_string(column.type) or pa.types.is_large_string(column.type)):
+            column = column.cast(pa.string())
+        names.append(name)
+        columns.append(column.to_pylist())
+    return [dict(zip(names, values)) for values in zip(*columns)]
+
+
+def _deck_value(expression, row):
+    """Evaluate a pydeck accessor: a constant, ``"@@=field"`` or ``"@@=[a, b]"``."""
+    if not (isinstance(expression, str) and expression.startswith("@@=")):
+        return expression
+    expression = expression[3:].strip()
+    if expression.startswith("["):
+        return [row.get(part.strip()) for part in expression.strip("[]").split(",")]
+    return row.get(expression, expression)
+
+
+def _rgba(color):
+    if not isinstance(color, (list, tuple)) or len(color) < 3:
+        return "#29B5E8"
+    alpha = color[3] / 255 if len(color) > 3 else 1
+    return f"rgba({color[0]}, {color[1]}, {color[2]}, {alpha:.2f})"
+
+
+def deck_spec(deck, tooltip=None):
+    """Vega-Lite point map for the ScatterplotLayers of a pydeck chart (None if it has none)."""
+    fields = _TOOLTIP_FIELD_RE.findall((tooltip or {}).get("html") or (tooltip or {}).get("text") or "")
+    layers = []
+    for layer in deck.get("layers", []):
+        if layer.get("@@type") != "ScatterplotLayer" or not layer.get("data"):
+            continue
+        pixels = "pixel" in str(layer.get("radiusUnits", ""))
+        values = []
+        for row in layer["data"]:
+            lon, lat = _deck_value(layer.get("getPosition", "@@=[lon, lat]"), row)[:2]
+            radius = _deck_value(layer.get("getRadius", 5), row)
+            radius = radius if pixels and isinstance(radius, (int, float)) else 5
+            values.append(dict({field: row.get(field) for field in fields},
+                               _lon=lon, _lat=lat, _size=3.1416 * radius ** 2,
+                               _fill=_rgba(_deck_value(layer.get("getFillColor"), row))))
+        stroke = layer.get("getLineColor") if layer.get("stroked") else None
+        layers.append({
+            "data": {"values": values},
+            "mark": {"type": "circle", "opacity": 1, "stroke": _rgba(stroke) if stroke else None,
+                     "strokeWidth": layer.get("lineWidthMinPixels", 0)},
+            "encoding": {
+                "longitude": {"field": "_lon", "type": "quantitative"},
+                "latitude": {"field": "_lat", "type": "quantitative"},
+                "size": {"field": "_size", "type": "quantitative", "scale": None, "legend": None},
+                "color": {"field": "_fill", "type": "nominal", "scale": None, "legend": None},
+                "tooltip": [{"field": field} for field in fields],
+            },
+        })
+    if not layers:
+        return None
+    return {"width": "container", "height": MAP_HEIGHT, "projection": {"type": "mercator"},
+            "layer": layers, "config": {"view": {"stroke": None}}}
+
+
+def graphviz_svg(dot_source):
+    """SVG for a Graphviz chart when ``dot`` is installed, else None (viz.js renders it in the browser)."""
+    dot = shutil.which("dot")
+    if dot is None:
+        return None
+    result = subprocess.run([dot, "-Tsvg"], input=dot_source, capture_output=True, text=True, check=False)
+    if result.returncode != 0:
+        return None
+    return result.stdout[result.stdout.find("<svg"):]
+
+
+class PageRenderer:
+    """Converts one page's AppTest element tree to HTML plus the chart data the loader embeds."""
+
+    def __init__(self):
+        self.charts = []
+        self.datasets = {}
+        self.graphs = []
+
+    @property
+    def data(self):
+        return {"charts": self.charts, "datasets": self.datasets, "graphs": self.graphs}
+
+    def render(self, node):
+        method = getattr(self, "_" + (node.type or "block"), None)
+        if method is None:
+            return f"<!-- {html.escape(node.type)} is not part of the static snapshot -->"
+        return method(node)
+
+    def _children(self, node):
+        return "\n".join(self.render(child) for _, child in sorted(node.children.items()))
+
+    # Layout blocks
+
+    def _main(self, node):
+        return self._children(node)
+
+    _block = _vertical = _transparent = _main
+
+    def _flex_container(self, node):
+        container = node.proto.flex_container
+        direction = "row" if container.direction == container.HORIZONTAL else "stack"
+        border = " snap-border" if container.border else ""
+        return f'<div class="snap-{direction}{border}">{self._children(node)}</div>'
+
+    def _horizontal(self, node):
+        return f'<div class="snap-row">{self._children(node)}</div>'
+
+    def _column(self, node):
+        weight = getattr(node.proto, "weight", 0) or 1
+        return f'<div class="snap-column" style="flex: {weight:.4f} 1 0%;">{self._children(node)}</div>'
+
+    def _tab_container(self, node):
+        tabs = [child for _, child in sorted(node.children.items())]
+        buttons = "".join(f'<button class="snap-tab{" active" if i == 0 else ""}" type="button">'
+                          f"{inline_markdown(tab.label)}</button>" for i, tab in enumerate(tabs))
+        panels = "".join(f'<div class="snap-tab-panel{" active" if i == 0 else ""}">{self._children(tab)}</div>'
+                         for i, tab in enumerate(tabs))
+        return f'<div class="snap-tabs"><div class="snap-tab-list">{buttons}</div>{panels}</div>'
+
+    def _expandable(self, node):
+        expander = getattr(node.proto, "expandable", node.proto)
+        opened = " open" if expander.expanded else ""
+        return (f'<details class="snap-expander"{opened}><summary>{inline_markdown(expander.label)}</summary>'
+                f"{self._children(node)}</details>")
+
+    # Text
+
+    def _markdown(self, node):
+        return f'<div class="snap-markdown">{markdown_html(node.proto.body, node.proto.allow_html)}</div>'
+
+    def _caption(self, node):
+        return f'<div class="snap-caption">{markdown_html(node.proto.body, node.proto.allow_html)}</div>'
+
+    def _divider(self, node):
+        return "<hr>"
+
+    def _heading(self, node):
+        tag = node.proto.tag or "h2"
+        return f'<{tag} class="snap-heading">{inline_markdown(node.proto.body)}</{tag}>'
+
+    _title = _header = _subheader = _heading
+
+    def _alert(self, node):
+        kind = {1: "error", 2: "warning", 3: "info", 4: "success"}.get(node.proto.format, "info")
+        icon = f'<span class="snap-alert-icon">{html.escape(node.proto.icon)}</span>' if node.proto.icon else ""
+        return f'<div class="snap-alert snap-alert-{kind}">{icon}<div>{markdown_html(node.proto.body)}</div></div>'
+
+    _error = _warning = _info = _success = _alert
+
+    def _metric(self, node):
+        proto = node.proto
+        delta = ""
+        if proto.delta:
+            arrow = {proto.UP: "↑ ", proto.DOWN: "↓ "}.get(proto.direction, "")
+            color = proto.MetricColor.Name(proto.color).lower()
+            delta = f'<div class="snap-metric-delta snap-{color}">{arrow}{html.escape(proto.delta)}</div>'
+        return (f'<div class="snap-metric"><div class="snap-metric-label">{inline_markdown(proto.label)}</div>'
+                f'<div class="snap-metric-value">{html.escape(proto.body)}</div>{delta}</div>')
+
+    def _progress(self, node):
+        value = max(0, min(100, node.proto.value))
+        text = f'<div class="snap-caption">{inline_markdown(node.proto.text)}</div>' if node.proto.text else ""
+        return f'{text}<div class="snap-progress"><div style="width: {value}%;"></div></div>'
+
+    # Data and charts
+
+    def _vega_lite_chart(self, node):
+        proto = node.proto
+        spec = json.loads(proto.spec)
+        for dataset in proto.datasets:
+            if dataset.name not in self.datasets:
+                self.datasets[dataset.name] = arrow_records(dataset.data.data)
+        if proto.HasField("data") and proto.data.data:
+            spec["data"] = {"values": arrow_records(proto.data.data)}
+        if proto.use_container_width and "width" not in spec and not any(
+                key in spec for key in ("hconcat", "vconcat", "concat", "facet", "repeat")):
+            spec["width"] = "container"
+        spec.setdefault("autosize", {"type": "fit", "contains": "padding"})
+        self.charts.append(spec)
+        return f'<div class="snap-chart" data-chart="{len(self.charts) - 1}"></div>'
+
+    def _deck_gl_json_chart(self, node):
+        tooltip = json.loads(node.proto.tooltip) if node.proto.tooltip else None
+        spec = deck_spec(json.loads(node.proto.json), tooltip)
+        if spec is None:
+            return '<div class="snap-caption">Map layers are not part of the static snapshot.</div>'
+        self.charts.append(spec)
+        return f'<div class="snap-chart snap-map" data-chart="{len(self.charts) - 1}"></div>'
+
+    def _graphviz_chart(self, node):
+        svg = graphviz_svg(node.proto.spec)
+        if svg is not None:
+            return f'<div class="snap-graphviz">{svg}</div>'
+        self.graphs.append(node.proto.spec)
+        return f'<div class="snap-graphviz" data-graph="{len(self.graphs) - 1}"></div>'
+
+    def _dataframe(self, node):
+        import pyarrow as pa
+        import pandas as pd
+
+        frame = pa.ipc.open_stream(node.proto.arrow_data.data).read_pandas()
+        note = ""
+        if len(frame) > MAX_TABLE_ROWS:
+            note = f'<div class="snap-caption">First {MAX_TABLE_ROWS:,} of {len(frame):,} rows</div>'
+            frame = frame.head(MAX_TABLE_ROWS)
+        table = frame.to_html(classes="snap-table", border=0, na_rep="",
+                              index=not isinstance(frame.index, pd.RangeIndex))
+        return f'<div class="snap-dataframe">{table}</div>{note}'
+
+    _table = _dataframe
+
+    def _iframe(self, node):
+        srcdoc = node.proto.srcdoc
+        # The shared stylesheet injector; the snapshot inlines that stylesheet in <head>
+        if "data-snowtelco-css" in srcdoc:
+            return ""
+        if srcdoc:
+            return f'<iframe class="snap-iframe" srcdoc="{html.escape(srcdoc)}"></iframe>'
+        return f'<iframe class="snap-iframe" src="{html.escape(node.proto.src)}"></iframe>'
+
+    # Widgets, drawn disabled in their default state
+
+    def _label(self, node):
+        label = node.proto.label
+        return f'<div class="snap-widget-label">{inline_markdown(label)}</div>' if label else ""
+
+    def _button(self, node):
+        return f'<button class="snap-button" type="button" disabled>{inline_markdown(node.proto.label)}</button>'
+
+    _download_button = _link_button = _form_submit_button = _button
+
+    def _checkbox(self, node):
+        checked = " checked" if _widget_value(node, node.proto.default) else ""
+        kind = "toggle" if node.proto.type == node.proto.TOGGLE else "checkbox"
+        return (f'<label class="snap-{kind}"><input type="checkbox" disabled{checked}>'
+                f"<span>{inline_markdown(node.proto.label)}</span></label>")
+
+    _toggle = _checkbox
+
+    def _radio(self, node):
+        value = _widget_value(node, None)
+        options = list(node.proto.options)
+        selected = value if value in options else (options[node.proto.default] if options else None)
+        items = "".join(f'<label><input type="radio" disabled{" checked" if option == selected else ""}>'
+                        f"{inline_markdown(option)}</label>" for option in options)
+        layout = " snap-horizontal" if node.proto.horizontal else ""
+        return f'{self._label(node)}<div class="snap-radio{layout}">{items}</div>'
+
+    def _selectbox(self, node):
+        options = list(node.proto.options)
+        value = _widget_value(node, None)
+        selected = value if value in options else (options[node.proto.default] if options else "")
+        return f'{self._label(node)}<div class="snap-input">{html.escape(str(selected))}</div>'
+
+    def _multiselect(self, node):
+        values = _widget_value(node, []) or []
+        chips = "".join(f'<span class="snap-chip">{html.escape(str(value))}</span>' for value in values)
+        return f'{self._label(node)}<div class="snap-input">{chips}</div>'
+
+    def _slider(self, node):
+        value = _widget_value(node, None)
+        value = value if value is not None else (list(node.proto.default) or [node.proto.min])
+        values = value if isinstance(value, (list, tuple)) else [value]
+        text = " – ".join(_format_number(v, node.proto.format) for v in values)
+        span = (node.proto.max - node.proto.min) or 1
+        position = (float(values[-1]) - node.proto.min) / span * 100 if isinstance(values[-1], (int, float)) else 0
+        return (f'{self._label(node)}<div class="snap-slider"><div class="snap-slider-track">'
+                f'<div style="width: {position:.1f}%;"></div></div><span>{html.escape(text)}</span></div>')
+
+    _select_slider = _slider
+
+    def _text_input(self, node):
+        value = _widget_value(node, node.proto.default) or ""
+        placeholder = html.escape(getattr(node.proto, "placeholder", ""))
+        return (f'{self._label(node)}<input class="snap-input" type="text" disabled '
+                f'value="{html.escape(str(value))}" placeholder="{placeholder}">')
+
+    _text_area = _number_input = _date_input = _time_input = _text_input
+
+
+def _widget_value(node, default):
+    try:
+        value = node.value
+    except Exception:  # widgets without registered state in this run
+        return default
+    return default if value is None else value
+
+
+def _format_number(value, fmt):
+    if not isinstance(value, (int, float)):
+        return str(value)
+    try:
+        return fmt % value if fmt else f"{value:g}"
+    except (TypeError, ValueError):
+        return f"{value:g}"
+
+
+def capture_page(page_key, app_path=APP_PATH, timeout=CAPTURE_TIMEOUT):
+    """Run the app headlessly on ``page_key`` and return the element tree of the main area."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(app_path, default_timeout=timeout)
+    at.session_state.selected_page = page_key
+    at.run()
+    if at.exception:
+        raise RuntimeError(f"{page_key} raised: {at.exception[0].message}")
+    return at.main
+
+
+def render_page(page_key, app_path=APP_PATH):
+    """``(html, data)`` of one page: its markup and the chart specs, datasets and graphs it embeds."""
+    renderer = PageRenderer()
+    markup = renderer.render(capture_page(page_key, app_path))
+    return markup, renderer.data
+
+
+def navigation_html():
+    links = []
+    for section, title, keys in NAV_SECTIONS:
+        colors = navigation.SECTION_STYLES[section]
+        links.append(f'<div class="snap-nav-section" style="--section-bg: {colors["background"]}; '
+                     f'--section-border: {colors["border"]};"><div class="snap-nav-title">{title}</div>')
+        links.extend(f'<a href="#{key}" data-page="{key}">{html.escape(search.page_label(key, PAGES))}</a>'
+                     for key in keys if registry.has_page(key))
+        links.append("</div>")
+    return "<nav>" + "\n".join(links) + "</nav>"
+
+
+def _script_json(value):
+    return json.dumps(value, separators=(",", ":"), default=str).replace("</", "<\\/")
+
+
+def vendor_scripts(output_dir, vendor_dir=None, download=True):
+    """``<script>`` tags for the vendored libraries, copying or downloading them into ``output_dir/vendor``.
+
+    Returns ``(tags, missing)``; a library that could not be vendored is loaded from its CDN URL.
+    """
+    target = os.path.join(output_dir, "vendor")
+    os.makedirs(target, exist_ok=True)
+    tags, missing = [], []
+    for name, url in VENDOR_SCRIPTS:
+        path = os.path.join(target, name)
+        source = os.path.join(vendor_dir, name) if vendor_dir else None
+        if source and os.path.exists(source):
+            shutil.copyfile(source, path)
+        elif not os.path.exists(path) and download:
+            try:
+                with urllib.request.urlopen(url, timeout=30) as response, open(path + ".tmp", "wb") as f:
+                    shutil.copyfileobj(response, f)
+                os.replace(path + ".tmp", path)
+            except OSError:
+                if os.path.exists(path + ".tmp"):
+                    os.remove(path + ".tmp")
+        if os.path.exists(path):
+            tags.append(f'<script src="vendor/{name}"></script>')
+        else:
+            missing.append(name)
+            tags.append(f'<script src="{url}"></script>')
+    return tags, missing
+
+
+def _read_frontend(name):
+    with open(os.path.join(FRONTEND_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def build_bundle(output_dir=SNAPSHOT_PATH, page_keys=None, vendor_dir=None, download=True,
+                 app_path=APP_PATH, progress=None):
+    """Render ``page_keys`` (default: every registered page) into ``output_dir/index.html``.
+
+    Returns a summary: pages written, failed pages with their errors, libraries
+    loaded from the CDN instead of ``vendor/``, chart count, bytes and seconds.
+    """
+    start = time.perf_counter()
+    page_keys = list(page_keys or registry.PAGE_RENDERERS)
+    templates, rendered, failed, charts = [], [], {}, 0
+    for key in page_keys:
+        page_start = time.perf_counter()
+        try:
+            markup, page_data = render_page(key, app_path)
+        except Exception as exc:  # keep the rest of the bundle; the page is reported
+            failed[key] = f"{type(exc).__name__}: {exc}"
+            continue
+        charts += len(page_data["charts"])
+        rendered.append(key)
+        templates.append(f'<template id="page-{key}">{markup}</template>\n'
+                         f'<script type="application/json" id="data-{key}">{_script_json(page_data)}</script>')
+        if progress:
+            progress(key, time.perf_counter() - page_start, len(page_data["charts"]))
+
+    os.makedirs(output_dir, exist_ok=True)
+    scripts, missing = vendor_scripts(output_dir, vendor_dir, download)
+    document = _DOCUMENT_TEMPLATE % {
+        "base_css": _read_frontend("snapshot.css"),
+        "app_css": styles.build_stylesheet().css,
+        "built": datetime.date.today().isoformat(),
+        "nav": navigation_html(),
+        "templates": "\n".join(templates),
+        "scripts": "\n".join(scripts),
+        "default_page": json.dumps(DEFAULT_PAGE if DEFAULT_PAGE in rendered or not rendered else rendered[0]),
+        "app_js": _read_frontend("snapshot.js"),
+    }
+    path = os.path.join(output_dir, "index.html")
+    with open(path + ".tmp", "w", encoding="utf-8") as f:
+        f.write(document)
+    os.replace(path + ".tmp", path)
+    return {
+        "path": path,
+        "pages": len(rendered),
+        "failed": failed,
+        "cdn_scripts": missing,
+        "charts": charts,
+        "bytes": len(document.encode()),
+        "seconds": time.perf_counter() - start,
+    }
@@ -0,0 +1,212 @@
+"""Stylesheet pipeline for the demo dashboard.
+
+All static CSS lives in ``dashboard/css``: ``app.css`` for the chrome that is on
+every page (theme, AI chat widget, sidebar ticker, search chips) and one file
+per page module. At first use the files are minified, split into top-level
+rules and deduplicated into a single content-hashed stylesheet that is injected
+into the parent document ``<head>`` once per session, where it survives reruns.
+
+Pages reuse class names and keyframe names (``.kpi-card``, ``pulse``, ...) with
+different declarations. Any rule whose selector or keyframe name is declared
+differently elsewhere, or whose selector is not anchored on the page's own
+markup classes, stays with its page and is sent as a small inline ``<style>``
+diff when that page renders, after the shared sheet, so it still
+wins the cascade exactly as it did when every page shipped its own CSS.
+"""
+
+import hashlib
+import json
+import os
+import re
+
+import streamlit as st
+import streamlit.components.v1 as components
+
+CSS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "css")
+APP_SHEET = "app"
+SESSION_KEY = "_stylesheet_digest"
+
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_STRING_RE = re.compile(r"(\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*')")
+_NESTED_AT_RULES = ("@media", "@supports")
+# A page's own markup class (not a Streamlit one such as .stTabs) at the start of a selector
+_SCOPED_SELECTOR_RE = re.compile(r"^[^ >+~]*\.(?!st[A-Z])[a-z][\w-]*")
+
+_INJECT_TEMPLATE = """
+<script>
+(function() {
+    const doc = window.parent.document;
+    const id = "snowtelco-css-%(digest)s";
+    if (doc.getElementById(id)) return;
+    doc.querySelectorAll("style[data-snowtelco-css]").forEach(el => el.remove());
+    const style = doc.createElement("style");
+    style.id = id;
+    style.setAttribute("data-snowtelco-css", "");
+    style.textContent = %(css)s;
+    doc.head.appendChild(style);
+})();
+</script>
+"""
+
+
+def minify(css):
+    """Strip comments and redundant whitespace, leaving quoted strings intact."""
+    css = _COMMENT_RE.sub("", css)
+    parts = _STRING_RE.split(css)
+    for i in range(0, len(parts), 2):
+        part = re.sub(r"\s+", " ", parts[i])
+        part = re.sub(r"\s*([{};,>])\s*", r"\1", part)
+        part = re.sub(r":\s+", ":", part)
+        parts[i] = part.replace(";}", "}")
+    return "".join(parts).strip()
+
+
+def split_rules(css):
+    """Split minified CSS into top-level rules (``prelude{...}`` or ``@import ...;``)."""
+    rules = []
+    depth = 0
+    start = 0
+    quote = None
+    for i, ch in enumerate(css):
+        if quote:
+            if ch == quote and css[i - 1] != "\\":
+                quote = None
+        elif ch in "\"'":
+            quote = ch
+        elif ch == "{":
+            depth += 1
+        elif ch == "}":
+            depth -= 1
+            if depth == 0:
+                rules.append(css[start:i + 1])
+                start = i + 1
+        elif ch == ";" and depth == 0:
+            rules.append(css[start:i + 1])
+            start = i + 1
+    return [rule for rule in rules if rule.strip()]
+
+
+def split_selectors(prelude):
+    """Split a selector list on commas that are not inside parentheses."""
+    selectors = []
+    depth = 0
+    current = ""
+    for ch in prelude:
+        if ch == "(":
+            depth += 1
+        elif ch == ")":
+            depth -= 1
+        if ch == "," and depth == 0:
+            selectors.append(current)
+            current = ""
+        else:
+            current += ch
+    selectors.append(current)
+    return selectors
+
+
+def rule_keys(rule, context=""):
+    """Yield ``(key, declarations)`` pairs used to detect conflicting definitions."""
+    if not rule.endswith("}"):
+        return
+    prelude, body = rule.split("{", 1)
+    body = body[:-1]
+    if prelude.startswith(_NESTED_AT_RULES):
+        for inner in split_rules(body):
+            yield from rule_keys(inner, context + prelude)
+    elif prelude.startswith("@"):
+        yield context + prelude, body
+    else:
+        for selector in split_selectors(prelude):
+            yield context + selector, body
+
+
+def is_page_scoped(key):
+    """True if a rule key can only match markup the page itself emits."""
+    if "keyframes" in key:
+        return True
+    selector = key.rsplit(")", 1)[-1] if key.startswith(_NESTED_AT_RULES) else key
+    return bool(_SCOPED_SELECTOR_RE.match(selector))
+
+
+def read_sheet(name):
+    with open(os.path.join(CSS_DIR, f"{name}.css"), encoding="utf-8") as f:
+        return f.read()
+
+
+def page_sheet_names():
+    return sorted(
+        name[:-4] for name in os.listdir(CSS_DIR)
+        if name.endswith(".css") and name[:-4] != APP_SHEET
+    )
+
+
+class Stylesheet:
+    """Shared stylesheet plus the per-page rules that could not be shared."""
+
+    def __init__(self, sources):
+        # sources: [(name, raw css)], app sheet first
+        self.raw_bytes = {name: len(css.encode()) for name, css in sources}
+        parsed = [(name, split_rules(minify(css))) for name, css in sources]
+
+        declarations = {}
+        for _, rules in parsed:
+            for rule in rules:
+                for key, body in rule_keys(rule):
+                    declarations.setdefault(key, set()).add(body)
+
+        shared = []
+        seen = set()
+        self.page_diffs = {}
+        for name, rules in parsed:
+            diff = []
+            for rule in rules:
+                keys = [key for key, _ in rule_keys(rule)]
+                page_only = any(len(declarations[key]) > 1 or not is_page_scoped(key) for key in keys)
+                if page_only and name != APP_SHEET:
+                    diff.append(rule)
+                elif rule not in seen:
+                    seen.add(rule)
+                    shared.append(rule)
+            if diff:
+                self.page_diffs[name] = "".join(diff)
+
+        # @import is only honoured at the top of a stylesheet
+        shared.sort(key=lambda rule: not rule.startswith("@import"))
+        self.css = "".join(shared)
+        self.digest = hashlib.sha256(self.css.encode()).hexdigest()[:12]
+
+    def injector_html(self):
+        css = json.dumps(self.css).replace("</", "<\\/")
+        return _INJECT_TEMPLATE % {"digest": self.digest, "css": css}
+
+    def page_diff_html(self, name):
+        diff = self.page_diffs.get(name)
+        return f"<style>{diff}</style>" if diff else ""
+
+
+def build_stylesheet():
+    names = [APP_SHEET] + page_sheet_names()
+    return Stylesheet([(name, read_sheet(name)) for name in names])
+
+
+@st.cache_resource(show_spinner=False)
+def get_stylesheet():
+    """Build the shared stylesheet once per server process."""
+    return build_stylesheet()
+
+
+def inject_stylesheet():
+    """Send the shared stylesheet to the browser once per session."""
+    sheet = get_stylesheet()
+    if st.session_state.get(SESSION_KEY) == sheet.digest:
+        return
+    st.session_state[SESSION_KEY] = sheet.digest
+    components.html(sheet.injector_html(), height=0)
+
+
+def inject_page_styles(name):
+    """Emit the page-specific rules for the page module ``name``, if any."""
+    html = get_stylesheet().page_diff_html(name)
+    if html:
+        st.markdown(html, unsafe_allow_html=True)
@@ -0,0 +1 @@
+"""One module per dashboard page, loaded lazily through dashboard.registry."""
@@ -0,0 +1,647 @@
+"""Network Alert Center dashboard."""
+
+import streamlit as st
+import pandas as pd
+import altair as alt
+
+from dashboard import charts, geo, live
+
+
+def render_alert_center():
+    import pandas as pd
+    import altair as alt
+    
+    # Alert Center Header with Alarm Flash Effect
+    st.markdown("""
+    <div class="alert-header-wrap">
+        <div class="alert-effects">
+            <div class="alert-beacon" style="left: 10%; top: 30%;"></div>
+            <div class="alert-beacon" style="right: 15%; top: 40%; animation-delay: 0.3s;"></div>
+            <div class="alert-beacon" style="left: 40%; bottom: 25%; animation-delay: 0.6s;"></div>
+            <div class="alert-ring-effect" style="left: 10%; top: 25%;"></div>
+            <div class="alert-ring-effect" style="right: 15%; top: 35%; animation-delay: 1s;"></div>
+            <div class="alert-scan-line"></div>
+        </div>
+        <div class="alert-header-content">
+            <h1>🚨 Network Alert Center</h1>
+            <p>Real-Time Network Monitoring, Incident Management & SLA Tracking</p>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Dashboard Tabs
+    tab_overview, tab_ops, tab_strategy = st.tabs(["📊 Overview & Analysis", "🛠️ Incident Response", "❄️ Snowflake Intelligence"])
+
+    with tab_overview:
+        
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['NETWORK_ALARM', 'NETWORK_OPS', 'SLA']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+        
+        if st.session_state.get('sf_highlights', True):
+            st.info("❄️ **Powered by Snowflake** — Real-time alert streaming via Snowpipe Streaming with Cortex Anomaly Detection for predictive alerting")
+        
+        # Animated CSS Styles
+        
+        # Alert Status Banner with Animation
+        st.markdown("""
+        <div class="pulse-critical" style="background: linear-gradient(135deg, #FEE2E2 0%, #FECACA 100%); border: 2px solid #DC2626; border-radius: 12px; padding: 1rem; margin-bottom: 1.5rem;">
+            <div style="display: flex; align-items: center; justify-content: space-between;">
+                <div style="display: flex; align-items: center; gap: 1rem;">
+                    <div class="pulse-dot" style="width: 20px; height: 20px; background: #DC2626; border-radius: 50%;"></div>
+                    <div>
+                        <div style="font-weight: 700; color: #DC2626; font-size: 1.1rem;">🚨 CRITICAL ALERT STATUS</div>
+                        <div style="color: #991B1B; font-size: 0.9rem;">3 P1 Critical Alerts Active • 97,000 subscribers affected • NOC teams engaged</div>
+                    </div>
+                </div>
+                <div style="text-align: right;">
+                    <div style="font-size: 0.75rem; color: #DC2626;">LIVE</div>
+                    <div class="blink" style="font-weight: 600; color: #DC2626;">● Recording</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Live Network Heartbeat Monitor
+        st.markdown("""
+        <div style="background: #F8FAFC; border-radius: 12px; padding: 1rem; margin-bottom: 1.5rem; border: 1px solid #E2E8F0;">
+            <div style="display: flex; align-items: center; justify-content: space-between; margin-bottom: 0.75rem;">
+                <div style="color: #1B2A4E; font-weight: 600;">📡 Live Network Heartbeat</div>
+                <div style="display: flex; gap: 1.5rem; font-size: 0.8rem;">
+                    <span style="color: #10B981;">● 14,847 Active Sites</span>
+                    <span style="color: #F59E0B;">● 62 Degraded</span>
+                    <span style="color: #DC2626;">● 3 Critical</span>
+                </div>
+            </div>
+            <div class="eq-container">
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.00s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.02s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.04s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.06s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.08s;"></div>
+                <div class="eq-bar" style="background: #F59E0B; animation-delay: 0.10s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.12s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.14s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.16s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.18s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.20s;"></div>
+                <div class="eq-bar" style="background: #DC2626; animation-delay: 0.22s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.24s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.26s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.28s;"></div>
+                <div class="eq-bar" style="background: #F59E0B; animation-delay: 0.30s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.32s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.34s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.36s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.38s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.40s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.42s;"></div>
+                <div class="eq-bar" style="background: #DC2626; animation-delay: 0.44s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.46s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.48s;"></div>
+                <div class="eq-bar" style="background: #F59E0B; animation-delay: 0.50s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.52s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.54s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.56s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.58s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.60s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.62s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.64s;"></div>
+                <div class="eq-bar" style="background: #DC2626; animation-delay: 0.66s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.68s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.70s;"></div>
+                <div class="eq-bar" style="background: #F59E0B; animation-delay: 0.72s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.74s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.76s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.78s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.80s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.82s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.84s;"></div>
+                <div class="eq-bar" style="background: #DC2626; animation-delay: 0.86s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.88s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.90s;"></div>
+                <div class="eq-bar" style="background: #F59E0B; animation-delay: 0.92s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.94s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.96s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 0.98s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 1.00s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 1.02s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 1.04s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 1.06s;"></div>
+                <div class="eq-bar" style="background: #F59E0B; animation-delay: 1.08s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 1.10s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 1.12s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 1.14s;"></div>
+                <div class="eq-bar" style="background: #DC2626; animation-delay: 1.16s;"></div>
+                <div class="eq-bar" style="background: #10B981; animation-delay: 1.18s;"></div>
+            </div>
+            <div style="display: flex; justify-content: space-between; margin-top: 0.5rem; font-size: 0.7rem; color: #94A3B8;">
+                <span>Throughput: 142 Gbps</span>
+                <span>Latency: 12ms avg</span>
+                <span>Packets: 2.4B/sec</span>
+                <span>Errors: 0.002%</span>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # AI Anomaly Detection Alerts
+        st.markdown('<div class="section-header">AI-Detected Anomalies</div>', unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="anomaly-grid">
+            <div class="anomaly-card">
+                <div class="anomaly-header">
+                    <div class="anomaly-icon-wrap">
+                        <div class="anomaly-ring"></div>
+                        <div class="anomaly-icon">📡</div>
+                    </div>
+                    <span class="anomaly-badge critical">Critical</span>
+                </div>
+                <div class="anomaly-title">Unusual Traffic Spike Detected</div>
+                <div class="anomaly-desc">AI detected 340% traffic increase on Manchester-Core-01 backbone link. Pattern suggests potential DDoS or major event. Auto-mitigation triggered.</div>
+                <div class="anomaly-stats">
+                    <div class="anomaly-stat">
+                        <div class="anomaly-stat-label">Detected</div>
+                        <div class="anomaly-stat-value">2 min ago</div>
+                    </div>
+                    <div class="anomaly-stat">
+                        <div class="anomaly-stat-label">Impact</div>
+                        <div class="anomaly-stat-value">47K users</div>
+                    </div>
+                    <div class="anomaly-stat">
+                        <div class="anomaly-stat-label">Status</div>
+                        <div class="anomaly-stat-value" style="color: #F59E0B;">Mitigating</div>
+                    </div>
+                </div>
+                <div class="anomaly-confidence">
+                    <div class="confidence-mini-bar"><div class="confidence-mini-fill" style="width: 96%;"></div></div>
+                    <span class="confidence-mini-label">96% AI Confidence</span>
+                </div>
+            </div>
+            <div class="anomaly-card">
+                <div class="anomaly-header">
+                    <div class="anomaly-icon-wrap">
+                        <div class="anomaly-ring" style="animation-delay: 0.5s;"></div>
+                        <div class="anomaly-icon">⚡</div>
+                    </div>
+                    <span class="anomaly-badge warning">Warning</span>
+                </div>
+                <div class="anomaly-title">Latency Pattern Anomaly</div>
+                <div class="anomaly-desc">Predicted latency spike in London-East region within 15 minutes based on historical patterns and current load trajectory.</div>
+                <div class="anomaly-stats">
+                    <div class="anomaly-stat">
+                        <div class="anomaly-stat-label">Predicted</div>
+                        <div class="anomaly-stat-value">+45ms spike</div>
+                    </div>
+                    <div class="anomaly-stat">
+                        <div class="anomaly-stat-label">Risk Level</div>
+                        <div class="anomaly-stat-value" style="color: #F59E0B;">Medium</div>
+                    </div>
+                    <div class="anomaly-stat">
+                        <div class="anomaly-stat-label">Action</div>
+                        <div class="anomaly-stat-value" style="color: #10B981;">Pre-scaling</div>
+                    </div>
+                </div>
+                <div class="anomaly-confidence">
+                    <div class="confidence-mini-bar"><div class="confidence-mini-fill" style="width: 89%;"></div></div>
+                    <span class="confidence-mini-label">89% AI Confidence</span>
+                </div>
+            </div>
+            <div class="anomaly-card">
+                <div class="anomaly-header">
+                    <div class="anomaly-icon-wrap">
+                        <div class="anomaly-ring" style="animation-delay: 1s;"></div>
+                        <div class="anomaly-icon">🔋</div>
+                    </div>
+                    <span class="anomaly-badge warning">Warning</span>
+                </div>
+                <div class="anomaly-title">Equipment Degradation Predicted</div>
+                <div class="anomaly-desc">ML model predicts hardware failure on BTS-4521 (Birmingham) within 72 hours based on temperature and error rate patterns.</div>
+                <div class="anomaly-stats">
+                    <div class="anomaly-stat">
+                        <div class="anomaly-stat-label">Time to Fail</div>
+                        <div class="anomaly-stat-value">~68 hours</div>
+                    </div>
+                    <div class="anomaly-stat">
+                        <div class="anomaly-stat-label">Component</div>
+                        <div class="anomaly-stat-value">Power Amp</div>
+                    </div>
+                    <div class="anomaly-stat">
+                        <div class="anomaly-stat-label">Action</div>
+                        <div class="anomaly-stat-value" style="color: #2563EB;">Scheduled</div>
+                    </div>
+                </div>
+                <div class="anomaly-confidence">
+                    <div class="confidence-mini-bar"><div class="confidence-mini-fill" style="width: 91%;"></div></div>
+                    <span class="confidence-mini-label">91% AI Confidence</span>
+                </div>
+            </div>
+            <div class="anomaly-card">
+                <div class="anomaly-header">
+                    <div class="anomaly-icon-wrap">
+                        <div class="anomaly-ring" style="animation-delay: 1.5s;"></div>
+                        <div class="anomaly-icon">👥</div>
+                    </div>
+                    <span class="anomaly-badge info">Info</span>
+                </div>
+                <div class="anomaly-title">Churn Correlation Detected</div>
+                <div class="anomaly-desc">AI identified correlation: customers experiencing >3 network issues in Leeds area showing 4x higher churn propensity.</div>
+                <div class="anomaly-stats">
+                    <div class="anomaly-stat">
+                        <div class="anomaly-stat-label">At Risk</div>
+                        <div class="anomaly-stat-value">234 customers</div>
+                    </div>
+                    <div class="anomaly-stat">
+                        <div class="anomaly-stat-label">Revenue Risk</div>
+                        <div class="anomaly-stat-value">£89K/mo</div>
+                    </div>
+                    <div class="anomaly-stat">
+                        <div class="anomaly-stat-label">Action</div>
+                        <div class="anomaly-stat-value" style="color: #10B981;">Outreach</div>
+                    </div>
+                </div>
+                <div class="anomaly-confidence">
+                    <div class="confidence-mini-bar"><div class="confidence-mini-fill" style="width: 87%;"></div></div>
+                    <span class="confidence-mini-label">87% AI Confidence</span>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # KPI Cards with animations
+        st.markdown("""
+        <div class="alert-kpi-grid">
+            <div class="alert-kpi critical">
+                <div class="pulse-dot" style="position: absolute; top: 8px; right: 8px; width: 10px; height: 10px; background: #DC2626; border-radius: 50%;"></div>
+                <div class="alert-kpi-value" style="color: #DC2626;">3</div>
+                <div class="alert-kpi-label">P1 Critical</div>
+                <div class="alert-kpi-delta" style="color: #DC2626;">↑ +1 vs yesterday</div>
+            </div>
+            <div class="alert-kpi major">
+                <div class="alert-kpi-value" style="color: #F59E0B;">12</div>
+                <div class="alert-kpi-label">P2 Major</div>
+                <div class="alert-kpi-delta" style="color: #10B981;">↓ -3 vs yesterday</div>
+            </div>
+            <div class="alert-kpi minor">
+                <div class="alert-kpi-value" style="color: #3B82F6;">47</div>
+                <div class="alert-kpi-label">P3 Minor</div>
+                <div class="alert-kpi-delta" style="color: #6B7280;">— stable</div>
+            </div>
+            <div class="alert-kpi warning">
+                <div class="alert-kpi-value" style="color: #6B7280;">128</div>
+                <div class="alert-kpi-label">P4 Warning</div>
+                <div class="alert-kpi-delta" style="color: #10B981;">↓ -8%</div>
+            </div>
+            <div class="alert-kpi cleared">
+                <div class="alert-kpi-value" style="color: #10B981;">1,247</div>
+                <div class="alert-kpi-label">Cleared Today</div>
+                <div class="alert-kpi-delta" style="color: #10B981;">94% auto-resolved</div>
+            </div>
+            <div class="alert-kpi sla">
+                <div class="alert-kpi-value" style="color: #8B5CF6;">98.2%</div>
+                <div class="alert-kpi-label">SLA Compliance</div>
+                <div class="alert-kpi-delta" style="color: #DC2626;">↓ -0.3% (target: 99%)</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Main content - Map and Live Feed
+        map_col, feed_col = st.columns([1.5, 1])
+        
+        with map_col:
+            st.markdown('<div class="section-header">🗺️ UK Network Status Map</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                geo.render_network_map("alert_map")
+        
+        with feed_col:
+            st.markdown('<div class="section-header">⚡ Live Alert Feed</div>', unsafe_allow_html=True)
+            
+            if live.is_enabled():
+                live.render_alarm_feed(height=420)
+            else:
+                with st.container(border=True, height=450):
+                    # P1 Critical Alerts
+                    st.error("🔴 **P1 CRITICAL** — London Central - Core Router Failure  \n42,000 subscribers affected • MTTR: 45 min • *2 min ago*")
+                    st.error("🔴 **P1 CRITICAL** — Canary Wharf - Power Outage  \n38,000 subscribers affected • Backup active • *8 min ago*")
+                    st.error("🔴 **P1 CRITICAL** — Coventry - Fibre Cut Detected  \n17,000 subscribers affected • Field team dispatched • *15 min ago*")
+                
+                    # P2 Major Alerts
+                    st.warning("🟠 **P2 MAJOR** — Manchester - High Latency  \nLatency: 85ms (threshold: 50ms) • *22 min ago*")
+                    st.warning("🟠 **P2 MAJOR** — Liverpool - Capacity Warning  \nCell utilization: 92% (threshold: 85%) • *31 min ago*")
+                    st.warning("🟠 **P2 MAJOR** — Belfast - Backhaul Degradation  \nThroughput: 60% of normal • *45 min ago*")
+                
+                    # P3 Minor Alert
+                    st.info("🔵 **P3 MINOR** — Edinburgh - Antenna Tilt Drift  \nCoverage impact: Minimal • *52 min ago*")
+                
+                    # Cleared Alert
+                    st.success("✅ **CLEARED** — Birmingham - RAN Software Update  \nAuto-resolved after successful patch • *1 hr ago*")
+        
+        # Second row - Charts
+        st.markdown('<div class="section-header">📊 Alert Analytics</div>', unsafe_allow_html=True)
+        
+        chart_col1, chart_col2, chart_col3 = st.columns(3)
+        
+        with chart_col1:
+            st.markdown("**Alert Trend (24 Hours)**")
+            with st.container(border=True):
+                hours = [f'{h:02d}:00' for h in range(24)]
+                trend_data = pd.DataFrame({
+                    'Hour': hours,
+                    'P1': [1,1,0,0,0,0,0,1,1,2,2,3,3,3,2,2,3,3,3,2,2,2,2,3],
+                    'P2': [5,4,4,3,3,4,5,7,9,12,14,15,14,13,12,11,12,13,12,11,10,9,8,12],
+                    'P3': [20,18,15,14,12,15,22,35,42,48,52,55,50,48,45,42,47,50,48,45,40,35,30,47]
+                })
+                
+                trend_melted = trend_data.melt(id_vars=['Hour'], var_name='Severity', value_name='Count')
+                
+                trend_chart = alt.Chart(trend_melted).mark_area(opacity=0.7).encode(
+                    x=alt.X('Hour:N', title=None, axis=alt.Axis(labelAngle=-45, values=[f'{h:02d}:00' for h in range(0, 24, 4)])),
+                    y=alt.Y('Count:Q', stack='zero', title='Alerts'),
+                    color=alt.Color('Severity:N', scale=alt.Scale(
+                        domain=['P1', 'P2', 'P3'],
+                        range=['#DC2626', '#F59E0B', '#3B82F6']
+                    ), legend=alt.Legend(orient='top', title=None)),
+                    tooltip=['Hour:N', 'Severity:N', 'Count:Q']
+                ).properties(height=200)
+                
+                charts.altair_chart(trend_chart, use_container_width=True)
+        
+        with chart_col2:
+            st.markdown("**Alerts by Region**")
+            with st.container(border=True):
+                region_alerts = pd.DataFrame({
+                    'Region': ['London', 'North West', 'Midlands', 'Scotland', 'South East', 'Yorkshire', 'Wales', 'North East'],
+                    'Alerts': [18, 14, 12, 8, 7, 6, 5, 4],
+                    'Resolved': [15, 11, 10, 7, 6, 5, 4, 4]
+                })
+                
+                bars = alt.Chart(region_alerts).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Alerts:Q', title='Active Alerts'),
+                    y=alt.Y('Region:N', sort='-x', title=None),
+                    color=alt.condition(
+                        alt.datum.Alerts > 10,
+                        alt.value('#DC2626'),
+                        alt.value('#29B5E8')
+                    ),
+                    tooltip=['Region:N', 'Alerts:Q', 'Resolved:Q']
+                ).properties(height=200)
+                
+                charts.altair_chart(bars, use_container_width=True)
+        
+        with chart_col3:
+            st.markdown("**MTTR by Severity**")
+            with st.container(border=True):
+                mttr_data = pd.DataFrame({
+                    'Severity': ['P1 Critical', 'P2 Major', 'P3 Minor', 'P4 Warning'],
+                    'Actual': [42, 68, 124, 240],
+                    'Target': [30, 60, 120, 480],
+                    'Status': ['Breached', 'Breached', 'Met', 'Met']
+                })
+                
+                mttr_bars = alt.Chart(mttr_data).mark_bar(cornerRadiusTopRight=6, cornerRadiusTopLeft=6).encode(
+                    x=alt.X('Severity:N', title=None, sort=['P1 Critical', 'P2 Major', 'P3 Minor', 'P4 Warning']),
+                    y=alt.Y('Actual:Q', title='Minutes'),
+                    color=alt.Color('Status:N', scale=alt.Scale(
+                        domain=['Met', 'Breached'],
+                        range=['#10B981', '#DC2626']
+                    ), legend=alt.Legend(orient='top', title=None)),
+                    tooltip=['Severity:N', alt.Tooltip('Actual:Q', title='Actual (min)'), alt.Tooltip('Target:Q', title='Target (min)')]
+                ).properties(height=200)
+                
+                # Target line
+                target_line = alt.Chart(mttr_data).mark_tick(color='#1B2A4E', thickness=3, size=30).encode(
+                    x=alt.X('Severity:N', sort=['P1 Critical', 'P2 Major', 'P3 Minor', 'P4 Warning']),
+                    y=alt.Y('Target:Q')
+                )
+                
+                charts.altair_chart(mttr_bars + target_line, use_container_width=True)
+                st.caption("Black line = SLA Target")
+        
+    with tab_ops:
+        st.markdown("""
+        <div class="alert-ops-pulse">
+            <div class="alert-ops-header">
+                <div class="alert-ops-title">🛠️ Incident Response Pulse</div>
+                <div class="alert-ops-tag">LIVE OPS</div>
+            </div>
+            <div class="alert-ops-grid">
+                <div class="alert-ops-card">
+                    <div class="alert-ops-label">Active Incidents</div>
+                    <div class="alert-ops-value">9</div>
+                    <div class="alert-ops-delta">3 critical • 6 major</div>
+                </div>
+                <div class="alert-ops-card">
+                    <div class="alert-ops-label">Avg MTTR</div>
+                    <div class="alert-ops-value">58 min</div>
+                    <div class="alert-ops-delta">+6 min vs target</div>
+                </div>
+                <div class="alert-ops-card">
+                    <div class="alert-ops-label">SLA Breaches</div>
+                    <div class="alert-ops-value">2</div>
+                    <div class="alert-ops-delta">£48K exposure</div>
+                </div>
+                <div class="alert-ops-card">
+                    <div class="alert-ops-label">Engineers Online</div>
+                    <div class="alert-ops-value">62</div>
+                    <div class="alert-ops-delta">8 field teams active</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+        # Third row - Affected Services and Impact
+        st.markdown('<div class="section-header">🎯 Impact Analysis</div>', unsafe_allow_html=True)
+        
+        impact_col1, impact_col2 = st.columns(2)
+        
+        with impact_col1:
+            st.markdown("**Affected Services**")
+            with st.container(border=True):
+                services_df = pd.DataFrame({
+                    'Service': ['Voice Calls', 'Mobile Data', '5G Services', 'SMS', 'VoLTE', 'Roaming'],
+                    'Status': ['🔴 Degraded', '🟠 Impacted', '🔴 Degraded', '🟢 Normal', '🟠 Impacted', '🟢 Normal'],
+                    'Affected Users': ['42,000', '97,000', '38,000', '-', '24,000', '-'],
+                    'Impact': ['High', 'Medium', 'High', 'None', 'Medium', 'None'],
+                    'ETA': ['45 min', '30 min', '1 hr', '-', '30 min', '-']
+                })
+                st.dataframe(services_df, use_container_width=True, hide_index=True)
+        
+        with impact_col2:
+            st.markdown("**SLA Credit Exposure**")
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 1rem;">
+                    <div style="background: #FEE2E2; padding: 1rem; border-radius: 8px; text-align: center;">
+                        <div style="font-size: 0.8rem; color: #DC2626;">P1 SLA Breaches</div>
+                        <div style="font-size: 1.75rem; font-weight: 700; color: #DC2626;">2</div>
+                        <div style="font-size: 0.75rem; color: #991B1B;">Credit exposure: £48K</div>
+                    </div>
+                    <div style="background: #FEF3C7; padding: 1rem; border-radius: 8px; text-align: center;">
+                        <div style="font-size: 0.8rem; color: #F59E0B;">P2 SLA At Risk</div>
+                        <div style="font-size: 1.75rem; font-weight: 700; color: #F59E0B;">4</div>
+                        <div style="font-size: 0.75rem; color: #92400E;">Potential: £24K</div>
+                    </div>
+                    <div style="background: #DBEAFE; padding: 1rem; border-radius: 8px; text-align: center;">
+                        <div style="font-size: 0.8rem; color: #3B82F6;">Credits YTD</div>
+                        <div style="font-size: 1.75rem; font-weight: 700; color: #3B82F6;">£186K</div>
+                        <div style="font-size: 0.75rem; color: #1D4ED8;">Budget: £250K</div>
+                    </div>
+                    <div style="background: #D1FAE5; padding: 1rem; border-radius: 8px; text-align: center;">
+                        <div style="font-size: 0.8rem; color: #10B981;">Uptime (MTD)</div>
+                        <div style="font-size: 1.75rem; font-weight: 700; color: #10B981;">99.92%</div>
+                        <div style="font-size: 0.75rem; color: #059669;">Target: 99.95%</div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        # Incident Response Teams
+        st.markdown('<div class="section-header">👥 Active Incident Response</div>', unsafe_allow_html=True)
+        
+        team_cols = st.columns(3)
+        
+        with team_cols[0]:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; gap: 0.75rem; margin-bottom: 0.75rem;">
+                    <div style="background: #DC2626; color: white; padding: 0.5rem; border-radius: 8px; font-weight: 700;">INC-4521</div>
+                    <div style="font-weight: 600;">London Central Outage</div>
+                </div>
+                """, unsafe_allow_html=True)
+                st.markdown("**Incident Commander:** Sarah Chen")
+                st.markdown("**Team:** NOC Alpha (8 engineers)")
+                st.progress(0.65, "Resolution Progress: 65%")
+                st.caption("ETA: 45 minutes • Comms: Bridge active")
+        
+        with team_cols[1]:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; gap: 0.75rem; margin-bottom: 0.75rem;">
+                    <div style="background: #DC2626; color: white; padding: 0.5rem; border-radius: 8px; font-weight: 700;">INC-4519</div>
+                    <div style="font-weight: 600;">Canary Wharf Power</div>
+                </div>
+                """, unsafe_allow_html=True)
+                st.markdown("**Incident Commander:** Mike Thompson")
+                st.markdown("**Team:** Field Ops + Facilities")
+                st.progress(0.40, "Resolution Progress: 40%")
+                st.caption("ETA: 1 hour • Generator running")
+        
+        with team_cols[2]:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; gap: 0.75rem; margin-bottom: 0.75rem;">
+                    <div style="background: #DC2626; color: white; padding: 0.5rem; border-radius: 8px; font-weight: 700;">INC-4518</div>
+                    <div style="font-weight: 600;">Coventry Fibre Cut</div>
+                </div>
+                """, unsafe_allow_html=True)
+                st.markdown("**Incident Commander:** James Wilson")
+                st.markdown("**Team:** External contractor")
+                st.progress(0.25, "Resolution Progress: 25%")
+                st.caption("ETA: 2 hours • Excavation required")
+
+    with tab_strategy:
+        st.markdown("""
+        <div class="sf-alert-pulse">
+            <div class="sf-alert-header">
+                <div class="sf-alert-title">❄️ Snowflake Intelligence Pulse</div>
+                <div class="sf-alert-tag">AI LIVE</div>
+            </div>
+            <div class="sf-alert-grid">
+                <div class="sf-alert-card">
+                    <div class="sf-alert-label">Risk Hotspots</div>
+                    <div class="sf-alert-value">6 regions</div>
+                </div>
+                <div class="sf-alert-card">
+                    <div class="sf-alert-label">Predicted Breaches</div>
+                    <div class="sf-alert-value">3 SLA</div>
+                </div>
+                <div class="sf-alert-card">
+                    <div class="sf-alert-label">Auto-Mitigation</div>
+                    <div class="sf-alert-value">92%</div>
+                </div>
+                <div class="sf-alert-card">
+                    <div class="sf-alert-label">Revenue at Risk</div>
+                    <div class="sf-alert-value">£142K</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown('<div class="section-header">AI Executive Summary</div>', unsafe_allow_html=True)
+        if st.session_state.get('sf_highlights', True):
+            st.info("❄️ **Snowflake Intelligence** flags three high-risk incidents likely to breach SLA within 60 minutes, driven by correlated power faults and backhaul congestion. Automated mitigations are containing impact in 92% of cases, but two London sites require manual escalation.")
+
+        st.markdown('<div class="section-header">Signals & Insights</div>', unsafe_allow_html=True)
+        sig_col1, sig_col2, sig_col3 = st.columns(3)
+        with sig_col1:
+            with st.container(border=True):
+                st.markdown("**Escalation Pattern**")
+                st.caption("P1 alerts rising in London + Midlands after 18:00; 4 sites share upstream power dependency.")
+        with sig_col2:
+            with st.container(border=True):
+                st.markdown("**SLA Drift**")
+                st.caption("MTTR for P2 incidents trending 12% above target; staffing gap in field ops coverage window.")
+        with sig_col3:
+            with st.container(border=True):
+                st.markdown("**Customer Impact**")
+                st.caption("High-value enterprise accounts in Manchester show 3x incident exposure vs baseline this week.")
+
+        st.markdown('<div class="section-header">AI-Powered Strategic Recommendations</div>', unsafe_allow_html=True)
+        rec_col1, rec_col2, rec_col3 = st.columns(3)
+        with rec_col1:
+            with st.container(border=True):
+                st.markdown("**Automate Power Failover**")
+                st.caption("Expand smart failover rules across 14 at-risk sites; projected SLA recovery +0.4%.")
+        with rec_col2:
+            with st.container(border=True):
+                st.markdown("**Targeted Field Dispatch**")
+                st.caption("Pre-stage crews in London/Midlands corridors to cut P1 MTTR by ~18 minutes.")
+        with rec_col3:
+            with st.container(border=True):
+                st.markdown("**Alert Noise Reduction**")
+                st.caption("Tune alarm thresholds for 9 low-impact KPIs to lower P3 volume by 22%.")
+
+        st.markdown('<div class="section-header">Strategic Priorities — Q1 2026</div>', unsafe_allow_html=True)
+        pri_col1, pri_col2, pri_col3 = st.columns(3)
+        with pri_col1:
+            with st.container(border=True):
+                st.markdown("**SLA Resilience**")
+                st.caption("Deploy predictive MTTR alerts and auto-remediation playbooks.")
+        with pri_col2:
+            with st.container(border=True):
+                st.markdown("**Critical Site Hardening**")
+                st.caption("Upgrade power redundancy for the top 20 revenue-impacting sites.")
+        with pri_col3:
+            with st.container(border=True):
+                st.markdown("**Customer Impact Lens**")
+                st.caption("Prioritize incident triage using churn risk and revenue weighting.")
+
+        st.markdown('<div class="section-header">Ask Snowflake Intelligence</div>', unsafe_allow_html=True)
+        
+        questions = [
+            "Show me all P1 critical alerts with their MTTR and affected subscribers.",
+            "Which network sites have the most recurring alerts this month?",
+            "What's our SLA compliance rate by region and alert severity?",
+            "Show me the correlation between alerts and customer churn risk.",
+            "Which alerts are impacting our highest-value customers?"
+        ]
+        
+        sf_intel_url = "https://ai.snowflake.com/sfseeurope/pjose_aws3"
+        cols = st.columns(2)
+        for i, q in enumerate(questions):
+            with cols[i % 2]:
+                escaped_q = q.replace('"', '&quot;').replace("'", "&#39;")
+                st.markdown(f"""
+                <a href="{sf_intel_url}" target="_blank" onclick="navigator.clipboard.writeText('{escaped_q}')" style="text-decoration: none; color: inherit; display: block;">
+                    <div class="question-card">
+                        <p style="margin-bottom: 1.5rem;"><strong>Q{i+1}:</strong> "{q}"</p>
+                    </div>
+                </a>
+                """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div style="text-align: center; margin-top: 1rem; padding: 1rem; background: linear-gradient(135deg, #29B5E8 0%, #1A8BC4 100%); border-radius: 8px;">
+            <a href="{sf_intel_url}" target="_blank" style="color: white; text-decoration: none; font-weight: 600; font-size: 1rem;">
+                ❄️ Ask these questions in Snowflake Intelligence →
+            </a>
+        </div>
+        """, unsafe_allow_html=True)
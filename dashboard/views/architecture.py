@@ -0,0 +1,872 @@
+"""Architecture Overview page."""
+
+import streamlit as st
+import pandas as pd
+
+
+def render_architecture_page():
+    st.markdown("""
+    <div class="main-header">
+        <h1>SnowTelco Technical Architecture</h1>
+        <p>Enterprise Data & AI Platform — Powered by Snowflake Intelligence</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Architecture Tabs
+    tab1, tab2, tab3, tab4, tab5, tab6 = st.tabs([
+        "🏗️ Overview", 
+        "⚙️ Data Engineering", 
+        "🧠 Data Science & AI",
+        "🤖 Snowflake Intelligence",
+        "📊 Visualization",
+        "🔒 Security & Governance"
+    ])
+    
+    # ==================== OVERVIEW TAB ====================
+    with tab1:
+        st.markdown('<div class="section-header">Platform Architecture Overview</div>', unsafe_allow_html=True)
+        
+        if st.session_state.get('sf_highlights', True):
+            st.info("❄️ **Snowflake Data Cloud** — Unified platform for data engineering, data science, data sharing, and AI/ML with governance and security built-in")
+        
+        # Architecture Diagram using Graphviz
+        import graphviz
+        
+        arch_diagram = graphviz.Digraph('Architecture', format='svg')
+        arch_diagram.attr(rankdir='TB', bgcolor='#1B2A4E', fontcolor='white', fontname='Arial')
+        arch_diagram.attr('node', shape='box', style='rounded,filled', fontname='Arial', fontsize='11')
+        arch_diagram.attr('edge', color='#29B5E8', penwidth='2')
+        
+        # Data Sources cluster
+        with arch_diagram.subgraph(name='cluster_sources') as c:
+            c.attr(label='DATA SOURCES', style='rounded', color='#3B82F6', fontcolor='white', bgcolor='#2D3E63')
+            c.node('bss', 'BSS/OSS', fillcolor='#3B82F6', fontcolor='white')
+            c.node('crm', 'CRM', fillcolor='#3B82F6', fontcolor='white')
+            c.node('network', 'Network', fillcolor='#3B82F6', fontcolor='white')
+            c.node('finance', 'Finance', fillcolor='#3B82F6', fontcolor='white')
+            c.node('iot', 'IoT', fillcolor='#3B82F6', fontcolor='white')
+            c.node('docs', 'Documents', fillcolor='#3B82F6', fontcolor='white')
+        
+        # Ingestion cluster
+        with arch_diagram.subgraph(name='cluster_ingestion') as c:
+            c.attr(label='INGESTION & TRANSFORMATION', style='rounded', color='#10B981', fontcolor='white', bgcolor='#2D3E63')
+            c.node('snowpipe', 'Snowpipe', fillcolor='#10B981', fontcolor='white')
+            c.node('dynamic', 'Dynamic Tables', fillcolor='#10B981', fontcolor='white')
+            c.node('streams', 'Streams/Tasks', fillcolor='#10B981', fontcolor='white')
+            c.node('dbt', 'dbt', fillcolor='#10B981', fontcolor='white')
+        
+        # Snowflake Platform cluster
+        with arch_diagram.subgraph(name='cluster_snowflake') as c:
+            c.attr(label='SNOWFLAKE DATA CLOUD', style='rounded,bold', color='#29B5E8', fontcolor='#29B5E8', bgcolor='#1E3A5F', penwidth='3')
+            c.node('cortex', 'Cortex AI\\nLLM • ML • Search', fillcolor='#29B5E8', fontcolor='white')
+            c.node('intelligence', 'Intelligence\\nAgents • Analyst', fillcolor='#29B5E8', fontcolor='white')
+            c.node('semantic', 'Semantic Layer\\nViews • Models', fillcolor='#29B5E8', fontcolor='white')
+        
+        # Consumption cluster
+        with arch_diagram.subgraph(name='cluster_consumption') as c:
+            c.attr(label='CONSUMPTION & APPLICATIONS', style='rounded', color='#8B5CF6', fontcolor='white', bgcolor='#2D3E63')
+            c.node('streamlit', 'Streamlit', fillcolor='#8B5CF6', fontcolor='white')
+            c.node('chat', 'AI Chat', fillcolor='#8B5CF6', fontcolor='white')
+            c.node('bi', 'BI Tools', fillcolor='#8B5CF6', fontcolor='white')
+            c.node('api', 'APIs', fillcolor='#8B5CF6', fontcolor='white')
+        
+        # Edges - Sources to Ingestion
+        arch_diagram.edge('bss', 'snowpipe')
+        arch_diagram.edge('crm', 'snowpipe')
+        arch_diagram.edge('network', 'streams')
+        arch_diagram.edge('finance', 'dbt')
+        arch_diagram.edge('iot', 'streams')
+        arch_diagram.edge('docs', 'dynamic')
+        
+        # Edges - Ingestion to Snowflake
+        arch_diagram.edge('snowpipe', 'semantic')
+        arch_diagram.edge('dynamic', 'semantic')
+        arch_diagram.edge('streams', 'semantic')
+        arch_diagram.edge('dbt', 'semantic')
+        
+        # Edges - Internal Snowflake
+        arch_diagram.edge('semantic', 'cortex')
+        arch_diagram.edge('semantic', 'intelligence')
+        arch_diagram.edge('cortex', 'intelligence')
+        
+        # Edges - Snowflake to Consumption
+        arch_diagram.edge('intelligence', 'streamlit')
+        arch_diagram.edge('intelligence', 'chat')
+        arch_diagram.edge('cortex', 'bi')
+        arch_diagram.edge('semantic', 'api')
+        
+        # Display smaller architecture diagram
+        col_arch, col_empty = st.columns([2, 1])
+        with col_arch:
+            st.graphviz_chart(arch_diagram)
+        
+        # Simple Data Flow Stats
+        st.markdown('<div class="section-header">Live Data Pipeline</div>', unsafe_allow_html=True)
+        
+        flow_cols = st.columns(5)
+        flow_data = [
+            ("📥", "Sources", "6", "CRM, Billing, Network..."),
+            ("⚡", "Ingestion", "2.4M/day", "Snowpipe, Streams"),
+            ("❄️", "Processing", "<100ms", "Cortex AI"),
+            ("📊", "Outputs", "32", "Dashboards, APIs"),
+            ("✅", "Uptime", "99.9%", "SLA Compliance")
+        ]
+        for col, (icon, label, value, desc) in zip(flow_cols, flow_data):
+            with col:
+                st.markdown(f"""
+                <div style="background: linear-gradient(135deg, #1B2A4E 0%, #0F172A 100%); border-radius: 12px; padding: 1rem; text-align: center;">
+                    <div style="font-size: 1.5rem; margin-bottom: 0.3rem;">{icon}</div>
+                    <div style="color: rgba(255,255,255,0.6); font-size: 0.7rem; text-transform: uppercase;">{label}</div>
+                    <div style="color: #29B5E8; font-size: 1.3rem; font-weight: 700;">{value}</div>
+                    <div style="color: rgba(255,255,255,0.5); font-size: 0.65rem; margin-top: 0.2rem;">{desc}</div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        # Platform Stats
+        stat_cols = st.columns(6)
+        stats = [
+            ("30K+", "Subscribers", "#29B5E8"),
+            ("34", "Semantic Views", "#10B981"),
+            ("41", "Agent Tools", "#8B5CF6"),
+            ("7", "Search Services", "#F59E0B"),
+            ("32", "Dashboards", "#EC4899"),
+            ("99.9%", "Platform SLA", "#10B981")
+        ]
+        for col, (value, label, color) in zip(stat_cols, stats):
+            with col:
+                st.markdown(f"""
+                <div style="background: white; border: 1px solid #E5E7EB; border-radius: 8px; padding: 1rem; text-align: center;">
+                    <div style="font-size: 1.5rem; font-weight: 700; color: {color};">{value}</div>
+                    <div style="font-size: 0.75rem; color: #6B7280;">{label}</div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        st.markdown("<br>", unsafe_allow_html=True)
+        
+        # Key Capabilities
+        st.markdown('<div class="section-header">Platform Capabilities</div>', unsafe_allow_html=True)
+        
+        cap_cols = st.columns(4)
+        capabilities = [
+            ("Real-Time Analytics", "Sub-second query performance on live operational data", "⚡"),
+            ("AI-Powered Insights", "Natural language queries with Cortex Analyst", "🧠"),
+            ("Unified Data", "Single source of truth across all domains", "🔗"),
+            ("Enterprise Scale", "Elastic compute with automatic scaling", "📈")
+        ]
+        for col, (title, desc, icon) in zip(cap_cols, capabilities):
+            with col:
+                st.markdown(f"""
+                <div style="background: white; border: 1px solid #E5E7EB; border-radius: 8px; padding: 1.25rem; height: 140px;">
+                    <div style="font-size: 1.5rem; margin-bottom: 0.5rem;">{icon}</div>
+                    <div style="font-weight: 600; color: #1B2A4E; margin-bottom: 0.3rem;">{title}</div>
+                    <div style="font-size: 0.8rem; color: #6B7280;">{desc}</div>
+                </div>
+                """, unsafe_allow_html=True)
+    
+    # ==================== DATA ENGINEERING TAB ====================
+    with tab2:
+        st.markdown('<div class="section-header">Data Engineering Architecture</div>', unsafe_allow_html=True)
+        
+        # Data Pipeline Overview
+        pipe_col1, pipe_col2 = st.columns(2)
+        
+        with pipe_col1:
+            st.markdown("**Data Ingestion Pipelines**")
+            with st.container(border=True):
+                st.markdown("**Snowpipe Streaming** &nbsp;&nbsp; <span style='color: #10B981;'>● Active</span>", unsafe_allow_html=True)
+                st.caption("Real-time CDC from BSS/OSS systems • 2.4M events/hour")
+                st.divider()
+                st.markdown("**Batch ETL (dbt)** &nbsp;&nbsp; <span style='color: #10B981;'>● Active</span>", unsafe_allow_html=True)
+                st.caption("Daily transforms • 847 models • 99.8% success rate")
+                st.divider()
+                st.markdown("**Dynamic Tables** &nbsp;&nbsp; <span style='color: #10B981;'>● Active</span>", unsafe_allow_html=True)
+                st.caption("Incremental processing • 5-minute lag • Auto-refresh")
+                st.divider()
+                st.markdown("**File Ingestion** &nbsp;&nbsp; <span style='color: #10B981;'>● Active</span>", unsafe_allow_html=True)
+                st.caption("S3/Azure/GCS stages • CSV, Parquet, JSON • Auto-ingest")
+        
+        with pipe_col2:
+            st.markdown("**Data Quality Framework**")
+            with st.container(border=True):
+                st.markdown("Completeness: **99.2%**")
+                st.progress(0.992)
+                st.markdown("Accuracy: **98.8%**")
+                st.progress(0.988)
+                st.markdown("Timeliness: **99.5%**")
+                st.progress(0.995)
+                st.markdown("Consistency: **97.4%**")
+                st.progress(0.974)
+                st.markdown("Uniqueness: **99.9%**")
+                st.progress(0.999)
+                st.success("Overall DQ Score: **98.9%**")
+        
+        # Data Layers
+        st.markdown('<div class="section-header">Data Lakehouse Layers</div>', unsafe_allow_html=True)
+        
+        layer_cols = st.columns(4)
+        
+        with layer_cols[0]:
+            with st.container(border=True):
+                st.markdown("🥉 **Bronze**")
+                st.subheader("RAW")
+                st.caption("Source system replicas, CDC logs, raw files")
+                st.metric("Tables", "42")
+        
+        with layer_cols[1]:
+            with st.container(border=True):
+                st.markdown("🥈 **Silver**")
+                st.subheader("STAGING")
+                st.caption("Cleansed, deduplicated, standardized")
+                st.metric("Tables", "128")
+        
+        with layer_cols[2]:
+            with st.container(border=True):
+                st.markdown("🥇 **Gold**")
+                st.subheader("CURATED")
+                st.caption("Business entities, aggregations, KPIs")
+                st.metric("Tables", "86")
+        
+        with layer_cols[3]:
+            with st.container(border=True):
+                st.markdown("💎 **Platinum**")
+                st.subheader("SEMANTIC")
+                st.caption("Semantic views, AI-ready datasets")
+                st.metric("Views", "37")
+        
+        # Data Flow Diagram
+        st.markdown('<div class="section-header">Data Flow Architecture</div>', unsafe_allow_html=True)
+        
+        data_flow = graphviz.Digraph('DataFlow', format='svg')
+        data_flow.attr(rankdir='LR', bgcolor='white', fontname='Arial', nodesep='0.5')
+        data_flow.attr('node', shape='box', style='rounded,filled', fontname='Arial', fontsize='9')
+        data_flow.attr('edge', color='#29B5E8', penwidth='1.5')
+        
+        # Bronze layer nodes
+        with data_flow.subgraph(name='cluster_bronze') as c:
+            c.attr(label='BRONZE (RAW)', style='rounded,dashed', color='#9CA3AF', fontcolor='#6B7280')
+            c.node('raw_billing', 'Billing CDC', fillcolor='#E5E7EB', fontcolor='#374151')
+            c.node('raw_network', 'Network Logs', fillcolor='#E5E7EB', fontcolor='#374151')
+            c.node('raw_customer', 'Customer Events', fillcolor='#E5E7EB', fontcolor='#374151')
+        
+        # Silver layer nodes
+        with data_flow.subgraph(name='cluster_silver') as c:
+            c.attr(label='SILVER (STAGING)', style='rounded,dashed', color='#6B7280', fontcolor='#6B7280')
+            c.node('stg_billing', 'STG_BILLING', fillcolor='#D1D5DB', fontcolor='#374151')
+            c.node('stg_network', 'STG_NETWORK', fillcolor='#D1D5DB', fontcolor='#374151')
+            c.node('stg_customer', 'STG_CUSTOMER', fillcolor='#D1D5DB', fontcolor='#374151')
+        
+        # Gold layer nodes
+        with data_flow.subgraph(name='cluster_gold') as c:
+            c.attr(label='GOLD (CURATED)', style='rounded,dashed', color='#F59E0B', fontcolor='#D97706')
+            c.node('dim_customer', 'DIM_CUSTOMER', fillcolor='#FEF3C7', fontcolor='#92400E')
+            c.node('fact_usage', 'FACT_USAGE', fillcolor='#FEF3C7', fontcolor='#92400E')
+            c.node('fact_revenue', 'FACT_REVENUE', fillcolor='#FEF3C7', fontcolor='#92400E')
+        
+        # Platinum layer nodes
+        with data_flow.subgraph(name='cluster_platinum') as c:
+            c.attr(label='PLATINUM (SEMANTIC)', style='rounded,bold', color='#29B5E8', fontcolor='#0369A1', penwidth='2')
+            c.node('sem_mobile', 'MOBILE_VIEW', fillcolor='#E0F2FE', fontcolor='#0369A1')
+            c.node('sem_finance', 'FINANCE_VIEW', fillcolor='#E0F2FE', fontcolor='#0369A1')
+            c.node('sem_propensity', 'PROPENSITY_VIEW', fillcolor='#E0F2FE', fontcolor='#0369A1')
+        
+        # Edges
+        data_flow.edge('raw_billing', 'stg_billing')
+        data_flow.edge('raw_network', 'stg_network')
+        data_flow.edge('raw_customer', 'stg_customer')
+        data_flow.edge('stg_billing', 'fact_revenue')
+        data_flow.edge('stg_network', 'fact_usage')
+        data_flow.edge('stg_customer', 'dim_customer')
+        data_flow.edge('dim_customer', 'sem_mobile')
+        data_flow.edge('fact_usage', 'sem_mobile')
+        data_flow.edge('fact_revenue', 'sem_finance')
+        data_flow.edge('dim_customer', 'sem_propensity')
+        data_flow.edge('fact_usage', 'sem_propensity')
+        
+        st.graphviz_chart(data_flow, use_container_width=True)
+        
+        # Comprehensive Data Sources Inventory
+        st.markdown('<div class="section-header">Data Sources Inventory</div>', unsafe_allow_html=True)
+        
+        # Summary metrics using native Streamlit
+        inv_cols = st.columns(5)
+        with inv_cols[0]:
+            st.metric("Active Sources", "24")
+        with inv_cols[1]:
+            st.metric("Real-time Streams", "18")
+        with inv_cols[2]:
+            st.metric("Events/Hour", "2.4M")
+        with inv_cols[3]:
+            st.metric("Daily Volume", "4.2TB")
+        with inv_cols[4]:
+            st.metric("Availability", "99.7%")
+        
+        st.markdown("<br>", unsafe_allow_html=True)
+        
+        # BSS/OSS Systems
+        st.markdown("**BSS/OSS Systems** — Business & Operations Support")
+        bss_data = pd.DataFrame({
+            'System': ['Amdocs Billing', 'Salesforce CRM', 'Siebel Order Mgmt', 'Cerillion Revenue Mgmt', 'Comverse IN Platform'],
+            'Vendor': ['Amdocs', 'Salesforce', 'Oracle', 'Cerillion', 'Comverse'],
+            'Data Type': ['Invoices, CDRs, Payments', 'Customers, Accounts, Cases', 'Orders, Provisioning, SIMs', 'Rating, Charging, Mediation', 'Prepaid Balance, Top-ups'],
+            'Ingestion': ['Kafka CDC', 'REST API', 'DB Link CDC', 'Kafka CDC', 'SFTP Batch'],
+            'Frequency': ['Real-time', '5 minutes', 'Real-time', 'Real-time', 'Hourly'],
+            'Volume/Day': ['142M records', '2.8M records', '890K records', '48M records', '12M records'],
+            'Status': ['✅ Active', '✅ Active', '✅ Active', '✅ Active', '✅ Active'],
+            'Last Sync': ['2 min ago', '3 min ago', '1 min ago', '30 sec ago', '18 min ago']
+        })
+        st.dataframe(bss_data, use_container_width=True, hide_index=True)
+        
+        # Network Systems
+        st.markdown("**Network OSS** — Network Operations & Performance")
+        network_data = pd.DataFrame({
+            'System': ['Ericsson ENM', 'Nokia NetAct', 'Huawei iManager', 'TEOCO Helix', 'Netcracker Inventory'],
+            'Vendor': ['Ericsson', 'Nokia', 'Huawei', 'TEOCO', 'Netcracker'],
+            'Data Type': ['RAN Performance, KPIs', 'Alarms, Faults, Config', 'Transport, Backhaul KPIs', 'Network Analytics, QoE', 'Network Inventory, Topology'],
+            'Ingestion': ['Kafka Stream', 'SNMP Trap', 'REST API', 'SFTP Batch', 'DB Link CDC'],
+            'Frequency': ['15 seconds', 'Real-time', '5 minutes', '15 minutes', 'Hourly'],
+            'Volume/Day': ['1.8B metrics', '24M events', '420M metrics', '86M records', '2.4M records'],
+            'Status': ['✅ Active', '✅ Active', '✅ Active', '✅ Active', '✅ Active'],
+            'Last Sync': ['15 sec ago', '5 sec ago', '2 min ago', '8 min ago', '42 min ago']
+        })
+        st.dataframe(network_data, use_container_width=True, hide_index=True)
+        
+        # Enterprise Systems
+        st.markdown("**Enterprise Systems** — Finance, HR & Operations")
+        enterprise_data = pd.DataFrame({
+            'System': ['SAP S/4HANA', 'Workday HCM', 'ServiceNow ITSM', 'Coupa Procurement', 'ClickSoftware FSM'],
+            'Vendor': ['SAP', 'Workday', 'ServiceNow', 'Coupa', 'Salesforce'],
+            'Data Type': ['GL, AP, AR, Fixed Assets', 'Employees, Payroll, Absence', 'Incidents, Changes, Assets', 'POs, Invoices, Contracts', 'Work Orders, Technicians, GPS'],
+            'Ingestion': ['SAP CDC', 'REST API', 'REST API', 'REST API', 'Kafka Stream'],
+            'Frequency': ['Daily', 'Daily', '15 minutes', 'Hourly', 'Real-time'],
+            'Volume/Day': ['4.2M records', '48K records', '124K records', '18K records', '890K records'],
+            'Status': ['✅ Active', '✅ Active', '✅ Active', '✅ Active', '✅ Active'],
+            'Last Sync': ['6:00 AM', '5:30 AM', '8 min ago', '24 min ago', '45 sec ago']
+        })
+        st.dataframe(enterprise_data, use_container_width=True, hide_index=True)
+        
+        # Marketing & Digital Systems
+        st.markdown("**Marketing & Digital** — Campaigns, Digital & Analytics")
+        marketing_data = pd.DataFrame({
+            'System': ['Adobe Campaign', 'Google Analytics 4', 'Sprinklr Social', 'Braze', 'Medallia Experience'],
+            'Vendor': ['Adobe', 'Google', 'Sprinklr', 'Braze', 'Medallia'],
+            'Data Type': ['Campaigns, Journeys, Emails', 'Web/App Events, Conversions', 'Social Mentions, Sentiment', 'Push, In-App, User Profiles', 'NPS, CSAT, Surveys'],
+            'Ingestion': ['REST API', 'BigQuery Export', 'Webhook', 'S3 Export', 'REST API'],
+            'Frequency': ['Hourly', 'Daily', 'Real-time', 'Hourly', 'Hourly'],
+            'Volume/Day': ['2.4M events', '48M events', '124K mentions', '8.4M events', '42K responses'],
+            'Status': ['✅ Active', '✅ Active', '✅ Active', '✅ Active', '✅ Active'],
+            'Last Sync': ['18 min ago', '4:00 AM', '2 min ago', '32 min ago', '48 min ago']
+        })
+        st.dataframe(marketing_data, use_container_width=True, hide_index=True)
+        
+        # External & Partner Systems
+        st.markdown("**External & Partner Data** — Third-Party & Reference Data")
+        external_data = pd.DataFrame({
+            'System': ['Experian Consumer', 'Ofcom Porting Hub', 'ONS Statistics', 'Weather API', 'Snowflake Marketplace'],
+            'Provider': ['Experian', 'Ofcom', 'UK Gov', 'Met Office', 'Various'],
+            'Data Type': ['Credit Scores, Demographics', 'Port-in/out, PAC Codes', 'Census, Postcode, Economic', 'Weather, Forecasts, Alerts', 'Market Data, Benchmarks'],
+            'Ingestion': ['SFTP Batch', 'API Gateway', 'S3 Download', 'REST API', 'Data Share'],
+            'Frequency': ['Weekly', 'Real-time', 'Monthly', 'Hourly', 'Live'],
+            'Volume/Day': ['2.4M records', '4.2K records', '86K records', '24K records', '—'],
+            'Status': ['✅ Active', '✅ Active', '✅ Active', '✅ Active', '🔗 Live Share'],
+            'Last Sync': ['Mon 6AM', '12 min ago', 'Jan 15', '28 min ago', 'Always']
+        })
+        st.dataframe(external_data, use_container_width=True, hide_index=True)
+        
+        # Document & Unstructured Sources
+        st.markdown("**Documents & Unstructured** — Content & Knowledge Sources")
+        docs_data = pd.DataFrame({
+            'System': ['SharePoint Online', 'Confluence', 'Contract Repository', 'Email Archive'],
+            'Vendor': ['Microsoft', 'Atlassian', 'DocuSign CLM', 'Mimecast'],
+            'Data Type': ['Policies, Reports, Guides', 'Technical Docs, Runbooks', 'Contracts, Agreements, NDAs', 'Customer Correspondence'],
+            'Ingestion': ['Graph API', 'REST API', 'REST API', 'S3 Archive'],
+            'Frequency': ['Daily', 'Daily', 'On-change', 'Daily'],
+            'Volume': ['2,847 docs', '1,248 pages', '4,820 docs', '124K emails'],
+            'Status': ['✅ Active', '✅ Active', '✅ Active', '⚠️ Partial'],
+            'Last Sync': ['3:00 AM', '4:00 AM', '2 hrs ago', '5:30 AM']
+        })
+        st.dataframe(docs_data, use_container_width=True, hide_index=True)
+    
+    # ==================== DATA SCIENCE & AI TAB ====================
+    with tab3:
+        st.markdown('<div class="section-header">Data Science & AI Platform</div>', unsafe_allow_html=True)
+        
+        # ML Models Overview
+        ml_col1, ml_col2 = st.columns(2)
+        
+        with ml_col1:
+            st.markdown("**Production ML Models**")
+            ml_models_data = pd.DataFrame({
+                'Model': ['Churn Propensity', 'Upsell Propensity', 'CLV Prediction', 'Fraud Detection', 'Network Anomaly', 'Next Best Action'],
+                'Type': ['XGBoost', 'Random Forest', 'Neural Net', 'Isolation Forest', 'LSTM', 'Ensemble'],
+                'Accuracy': ['92.4%', '89.1%', '87.6%', '94.2%', '91.8%', '84.3%'],
+                'Status': ['✅ Live', '✅ Live', '✅ Live', '✅ Live', '✅ Live', '🟡 Beta']
+            })
+            st.dataframe(ml_models_data, use_container_width=True, hide_index=True)
+        
+        with ml_col2:
+            st.markdown("**Snowflake Cortex AI Services**")
+            with st.container(border=True):
+                st.markdown("**Cortex LLM Functions** &nbsp;&nbsp; <span style='color: #10B981;'>● Active</span>", unsafe_allow_html=True)
+                st.caption("COMPLETE, SUMMARIZE, TRANSLATE, SENTIMENT, EXTRACT_ANSWER")
+                st.divider()
+                st.markdown("**Cortex ML Functions** &nbsp;&nbsp; <span style='color: #10B981;'>● Active</span>", unsafe_allow_html=True)
+                st.caption("FORECAST, ANOMALY_DETECTION, CLASSIFICATION, CONTRIBUTION_EXPLORER")
+                st.divider()
+                st.markdown("**Cortex Search** &nbsp;&nbsp; <span style='color: #10B981;'>● Active</span>", unsafe_allow_html=True)
+                st.caption("Vector embeddings, semantic search, RAG pipelines")
+                st.divider()
+                st.markdown("**Snowpark ML** &nbsp;&nbsp; <span style='color: #10B981;'>● Active</span>", unsafe_allow_html=True)
+                st.caption("Feature engineering, model training, ML pipelines")
+        
+        # Feature Store
+        st.markdown('<div class="section-header">ML Feature Store</div>', unsafe_allow_html=True)
+        
+        feat_cols = st.columns(4)
+        
+        with feat_cols[0]:
+            with st.container(border=True):
+                st.metric("Customer Features", "248")
+                st.caption("Demographics, tenure, value, behavior")
+        
+        with feat_cols[1]:
+            with st.container(border=True):
+                st.metric("Usage Features", "186")
+                st.caption("Voice, data, SMS, roaming patterns")
+        
+        with feat_cols[2]:
+            with st.container(border=True):
+                st.metric("Network Features", "124")
+                st.caption("QoE, coverage, device, technology")
+        
+        with feat_cols[3]:
+            with st.container(border=True):
+                st.metric("Financial Features", "92")
+                st.caption("ARPU, payment, billing, disputes")
+        
+        # MLOps Pipeline using Graphviz
+        st.markdown('<div class="section-header">MLOps Pipeline</div>', unsafe_allow_html=True)
+        
+        mlops_diagram = graphviz.Digraph('MLOps', format='svg')
+        mlops_diagram.attr(rankdir='LR', bgcolor='white', fontname='Arial')
+        mlops_diagram.attr('node', shape='box', style='rounded,filled', fontname='Arial', fontsize='10', height='0.8')
+        mlops_diagram.attr('edge', color='#29B5E8', penwidth='2', arrowsize='0.8')
+        
+        mlops_diagram.node('feature', 'Feature Eng\\nSnowpark', fillcolor='#3B82F6', fontcolor='white')
+        mlops_diagram.node('train', 'Training\\nSnowpark ML', fillcolor='#8B5CF6', fontcolor='white')
+        mlops_diagram.node('validate', 'Validation\\nA/B Testing', fillcolor='#EC4899', fontcolor='white')
+        mlops_diagram.node('registry', 'Registry\\nModel Store', fillcolor='#F59E0B', fontcolor='white')
+        mlops_diagram.node('serve', 'Serving\\nUDFs/APIs', fillcolor='#10B981', fontcolor='white')
+        mlops_diagram.node('monitor', 'Monitoring\\nDrift Detection', fillcolor='#29B5E8', fontcolor='white')
+        
+        mlops_diagram.edge('feature', 'train')
+        mlops_diagram.edge('train', 'validate')
+        mlops_diagram.edge('validate', 'registry')
+        mlops_diagram.edge('registry', 'serve')
+        mlops_diagram.edge('serve', 'monitor')
+        mlops_diagram.edge('monitor', 'feature', style='dashed', color='#9CA3AF', label='retrain')
+        
+        st.graphviz_chart(mlops_diagram, use_container_width=True)
+    
+    # ==================== SNOWFLAKE INTELLIGENCE TAB ====================
+    with tab4:
+        st.markdown('<div class="section-header">Snowflake Intelligence Platform</div>', unsafe_allow_html=True)
+        
+        # Agent Configuration
+        st.markdown("**Executive Intelligence Agent**")
+        with st.container(border=True):
+            st.markdown("""
+            <div style="background: #F8FAFC; border-radius: 8px; padding: 1.5rem; border: 1px solid #E2E8F0;">
+                <div style="display: flex; justify-content: space-between; align-items: center; flex-wrap: wrap; gap: 1rem;">
+                    <div>
+                        <div style="font-size: 0.75rem; color: #64748B;">AGENT NAME</div>
+                        <div style="font-size: 1.1rem; font-weight: 600; color: #29B5E8;">SnowTelco_V2_Executive_Agent</div>
+                    </div>
+                    <div>
+                        <div style="font-size: 0.75rem; color: #9CA3AF;">DATABASE</div>
+                        <div style="font-size: 1rem;">SnowTelco_V2</div>
+                    </div>
+                    <div>
+                        <div style="font-size: 0.75rem; color: #9CA3AF;">SCHEMA</div>
+                        <div style="font-size: 1rem;">SnowTelco_V2_SCHEMA</div>
+                    </div>
+                    <div>
+                        <div style="font-size: 0.75rem; color: #9CA3AF;">WAREHOUSE</div>
+                        <div style="font-size: 1rem;">SnowTelco_V2_Demo_WH</div>
+                    </div>
+                    <div>
+                        <div style="font-size: 0.75rem; color: #9CA3AF;">STATUS</div>
+                        <div style="font-size: 1rem; color: #10B981;">● Active</div>
+                    </div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # Semantic Views and Search Tools
+        tool_col1, tool_col2 = st.columns(2)
+        
+        with tool_col1:
+            st.markdown("**Semantic Views (34 Tools)**")
+            with st.container(border=True):
+                semantic_views = [
+                    "FINANCE", "SALES", "HR", "MARKETING", "MOBILE", "PORTING", "ORDER", "BILLING",
+                    "PAYMENT", "NETWORK_OPS", "SUPPORT", "PARTNER", "ASSET", "IT_OPS", "SLA",
+                    "NETWORK_ALARM", "REVENUE_ASSURANCE", "ACTIVATION", "DISPUTE", "SALES_PIPELINE",
+                    "CUSTOMER_EXPERIENCE", "NETWORK_QOE", "PROPENSITY", "FIELD_OPERATIONS",
+                    "MARKET_INTELLIGENCE", "SOCIAL_SENTIMENT", "SUSTAINABILITY", "FRAUD_DETECTION",
+                    "B2B_CONTRACT", "WHOLESALE_MVNO", "RETAIL", "WORKFORCE", "RAN", "COMPLAINT",
+                    "LEGAL_MATTER", "SUPPORT_TICKET", "PLAN"
+                ]
+                views_html = " ".join([f'<span style="background: #E0F2FE; color: #0369A1; padding: 0.25rem 0.5rem; border-radius: 4px; font-size: 0.7rem; margin: 0.1rem; display: inline-block;">{v}</span>' for v in semantic_views])
+                st.markdown(f'<div style="max-height: 250px; overflow-y: auto;">{views_html}</div>', unsafe_allow_html=True)
+        
+        with tool_col2:
+            st.markdown("**Document Search Services (7)**")
+            with st.container(border=True):
+                doc_services = [
+                    ("Search_finance_docs", "Financial reports, budgets, audit docs"),
+                    ("Search_hr_docs", "HR policies, handbooks, procedures"),
+                    ("Search_marketing_docs", "Campaign briefs, brand guidelines"),
+                    ("Search_sales_docs", "Sales playbooks, pricing, proposals"),
+                    ("Search_strategy_docs", "Strategy documents, roadmaps"),
+                    ("Search_demo_docs", "Demo guides, key facts, FAQs"),
+                    ("Search_network_docs", "Technical docs, network specs")
+                ]
+                for name, desc in doc_services:
+                    st.markdown(f"""
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB; font-size: 0.8rem;">
+                        <strong style="color: #8B5CF6;">{name}</strong>
+                        <span style="color: #6B7280;">{desc}</span>
+                    </div>
+                    """, unsafe_allow_html=True)
+        
+        # Agent Architecture Diagram
+        st.markdown('<div class="section-header">Agent Architecture</div>', unsafe_allow_html=True)
+        
+        agent_diagram = graphviz.Digraph('AgentArch', format='svg')
+        agent_diagram.attr(rankdir='LR', bgcolor='white', fontname='Arial')
+        agent_diagram.attr('node', shape='box', style='rounded,filled', fontname='Arial', fontsize='10')
+        agent_diagram.attr('edge', color='#29B5E8', penwidth='1.5')
+        
+        # User Input
+        agent_diagram.node('user', 'User Query', fillcolor='#E0F2FE', fontcolor='#0369A1', shape='ellipse')
+        
+        # Agent Orchestrator
+        with agent_diagram.subgraph(name='cluster_agent') as c:
+            c.attr(label='SNOWFLAKE INTELLIGENCE AGENT', style='rounded,bold', color='#29B5E8', fontcolor='#0369A1', bgcolor='#F0F9FF', penwidth='2')
+            c.node('orchestrator', 'Orchestrator\\nTool Selection', fillcolor='#29B5E8', fontcolor='white')
+            c.node('planner', 'Query Planner', fillcolor='#0EA5E9', fontcolor='white')
+        
+        # Tools
+        with agent_diagram.subgraph(name='cluster_tools') as c:
+            c.attr(label='TOOLS (41)', style='rounded', color='#10B981', fontcolor='#059669')
+            c.node('analyst', 'Cortex Analyst\\nText-to-SQL', fillcolor='#10B981', fontcolor='white')
+            c.node('search', 'Cortex Search\\nRAG', fillcolor='#059669', fontcolor='white')
+            c.node('semantic', 'Semantic Views\\n34 domains', fillcolor='#047857', fontcolor='white')
+        
+        # Output
+        agent_diagram.node('response', 'Response\\n+ Visualization', fillcolor='#8B5CF6', fontcolor='white', shape='ellipse')
+        
+        # Edges
+        agent_diagram.edge('user', 'orchestrator')
+        agent_diagram.edge('orchestrator', 'planner')
+        agent_diagram.edge('planner', 'analyst')
+        agent_diagram.edge('planner', 'search')
+        agent_diagram.edge('planner', 'semantic')
+        agent_diagram.edge('analyst', 'response')
+        agent_diagram.edge('search', 'response')
+        agent_diagram.edge('semantic', 'response')
+        
+        st.graphviz_chart(agent_diagram, use_container_width=True)
+        
+        # Cortex Analyst Configuration
+        st.markdown('<div class="section-header">Cortex Analyst Configuration</div>', unsafe_allow_html=True)
+        
+        analyst_cols = st.columns(3)
+        
+        with analyst_cols[0]:
+            st.markdown("**Text-to-SQL Engine**")
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Model</span><span style="font-weight: 600;">Claude 3.5 Sonnet</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Context Window</span><span style="font-weight: 600;">200K tokens</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>SQL Accuracy</span><span style="font-weight: 600; color: #10B981;">94.2%</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0;">
+                        <span>Avg Response</span><span style="font-weight: 600;">2.4s</span>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with analyst_cols[1]:
+            st.markdown("**RAG Configuration**")
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Embedding Model</span><span style="font-weight: 600;">e5-base-v2</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Vector Dimension</span><span style="font-weight: 600;">768</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Documents Indexed</span><span style="font-weight: 600;">2,847</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0;">
+                        <span>Chunk Size</span><span style="font-weight: 600;">512 tokens</span>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with analyst_cols[2]:
+            st.markdown("**Agent Capabilities**")
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Multi-turn Conv.</span><span style="color: #10B981;">✓ Enabled</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Tool Selection</span><span style="color: #10B981;">✓ Enabled</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Visualization</span><span style="color: #10B981;">✓ Enabled</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0;">
+                        <span>Export Results</span><span style="color: #10B981;">✓ Enabled</span>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+    
+    # ==================== VISUALIZATION TAB ====================
+    with tab5:
+        st.markdown('<div class="section-header">Visualization & Analytics Layer</div>', unsafe_allow_html=True)
+        
+        # Dashboard Overview
+        dash_col1, dash_col2 = st.columns(2)
+        
+        with dash_col1:
+            st.markdown("**Executive Dashboards (28)**")
+            with st.container(border=True):
+                dashboards = [
+                    ("C-Suite", ["CEO", "CFO", "CMO", "CTO", "COO", "CCO", "CXO", "CNO", "CDO", "CSO"]),
+                    ("VP Level", ["Customer Service", "Network Ops", "Partners", "Billing", "IT", "Field Ops", "Strategy", "Communications"]),
+                    ("Specialist", ["Regulatory", "Security", "Enterprise Sales", "Wholesale", "Retail", "CHRO", "Legal", "Product", "Procurement"])
+                ]
+                for category, items in dashboards:
+                    st.markdown(f"""
+                    <div style="margin-bottom: 0.75rem;">
+                        <div style="font-weight: 600; color: #1B2A4E; margin-bottom: 0.3rem;">{category}</div>
+                        <div style="display: flex; flex-wrap: wrap; gap: 0.25rem;">
+                            {"".join([f'<span style="background: #F3F4F6; padding: 0.2rem 0.5rem; border-radius: 4px; font-size: 0.7rem;">{item}</span>' for item in items])}
+                        </div>
+                    </div>
+                    """, unsafe_allow_html=True)
+        
+        with dash_col2:
+            st.markdown("**Visualization Components**")
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span><strong>KPI Cards</strong></span>
+                        <span style="color: #6B7280;">Real-time metrics with trends</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span><strong>Charts (Altair)</strong></span>
+                        <span style="color: #6B7280;">Line, bar, area, scatter plots</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span><strong>HTML Visuals</strong></span>
+                        <span style="color: #6B7280;">Custom progress bars, funnels</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span><strong>Data Tables</strong></span>
+                        <span style="color: #6B7280;">Sortable, filterable grids</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0;">
+                        <span><strong>AI Chat Interface</strong></span>
+                        <span style="color: #6B7280;">Natural language queries</span>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        # Semantic Layer
+        st.markdown('<div class="section-header">Semantic Layer Architecture</div>', unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div style="background: white; border: 1px solid #E5E7EB; border-radius: 8px; padding: 1.5rem;">
+            <div style="display: flex; justify-content: space-between; align-items: stretch; gap: 1rem; flex-wrap: wrap;">
+                <div style="flex: 1; min-width: 150px; background: #F0F9FF; border-radius: 8px; padding: 1rem; text-align: center;">
+                    <div style="font-weight: 600; color: #0369A1; margin-bottom: 0.5rem;">Business Metrics</div>
+                    <div style="font-size: 0.75rem; color: #6B7280;">KPIs, calculations, derived measures</div>
+                    <div style="font-size: 1.2rem; font-weight: 700; color: #29B5E8; margin-top: 0.5rem;">248</div>
+                </div>
+                <div style="flex: 1; min-width: 150px; background: #F0FDF4; border-radius: 8px; padding: 1rem; text-align: center;">
+                    <div style="font-weight: 600; color: #166534; margin-bottom: 0.5rem;">Dimensions</div>
+                    <div style="font-size: 0.75rem; color: #6B7280;">Hierarchies, attributes, lookups</div>
+                    <div style="font-size: 1.2rem; font-weight: 700; color: #10B981; margin-top: 0.5rem;">186</div>
+                </div>
+                <div style="flex: 1; min-width: 150px; background: #FEF3C7; border-radius: 8px; padding: 1rem; text-align: center;">
+                    <div style="font-weight: 600; color: #92400E; margin-bottom: 0.5rem;">Relationships</div>
+                    <div style="font-size: 0.75rem; color: #6B7280;">Joins, foreign keys, mappings</div>
+                    <div style="font-size: 1.2rem; font-weight: 700; color: #F59E0B; margin-top: 0.5rem;">124</div>
+                </div>
+                <div style="flex: 1; min-width: 150px; background: #F5F3FF; border-radius: 8px; padding: 1rem; text-align: center;">
+                    <div style="font-weight: 600; color: #5B21B6; margin-bottom: 0.5rem;">Security Rules</div>
+                    <div style="font-size: 0.75rem; color: #6B7280;">Row-level, column-level policies</div>
+                    <div style="font-size: 1.2rem; font-weight: 700; color: #8B5CF6; margin-top: 0.5rem;">42</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Streamlit App Architecture
+        st.markdown('<div class="section-header">Application Architecture</div>', unsafe_allow_html=True)
+        
+        app_cols = st.columns(4)
+        app_components = [
+            ("Streamlit", "Frontend framework", "Python-based UI", "#FF4B4B"),
+            ("Snowpark", "Data processing", "Server-side Python", "#29B5E8"),
+            ("Altair", "Visualizations", "Declarative charts", "#F59E0B"),
+            ("Cortex", "AI Services", "LLM & ML APIs", "#8B5CF6")
+        ]
+        for col, (name, role, desc, color) in zip(app_cols, app_components):
+            with col:
+                st.markdown(f"""
+                <div style="background: white; border: 2px solid {color}; border-radius: 8px; padding: 1rem; text-align: center;">
+                    <div style="font-weight: 700; color: {color}; font-size: 1.1rem;">{name}</div>
+                    <div style="font-size: 0.8rem; color: #1B2A4E; margin: 0.3rem 0;">{role}</div>
+                    <div style="font-size: 0.7rem; color: #6B7280;">{desc}</div>
+                </div>
+                """, unsafe_allow_html=True)
+    
+    # ==================== SECURITY & GOVERNANCE TAB ====================
+    with tab6:
+        st.markdown('<div class="section-header">Security & Data Governance</div>', unsafe_allow_html=True)
+        
+        sec_col1, sec_col2 = st.columns(2)
+        
+        with sec_col1:
+            st.markdown("**Access Control**")
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <div style="display: flex; justify-content: space-between;">
+                            <strong>Role-Based Access (RBAC)</strong>
+                            <span style="color: #10B981;">● Enabled</span>
+                        </div>
+                        <div style="font-size: 0.75rem; color: #6B7280; margin-top: 0.2rem;">12 functional roles, hierarchy-based inheritance</div>
+                    </div>
+                    <div style="padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <div style="display: flex; justify-content: space-between;">
+                            <strong>Row-Level Security</strong>
+                            <span style="color: #10B981;">● Enabled</span>
+                        </div>
+                        <div style="font-size: 0.75rem; color: #6B7280; margin-top: 0.2rem;">Region, department, customer segment filters</div>
+                    </div>
+                    <div style="padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <div style="display: flex; justify-content: space-between;">
+                            <strong>Column Masking</strong>
+                            <span style="color: #10B981;">● Enabled</span>
+                        </div>
+                        <div style="font-size: 0.75rem; color: #6B7280; margin-top: 0.2rem;">PII, financial data, sensitive fields</div>
+                    </div>
+                    <div style="padding: 0.5rem 0;">
+                        <div style="display: flex; justify-content: space-between;">
+                            <strong>MFA Requirement</strong>
+                            <span style="color: #10B981;">● Enforced</span>
+                        </div>
+                        <div style="font-size: 0.75rem; color: #6B7280; margin-top: 0.2rem;">SSO with Azure AD, Duo MFA</div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with sec_col2:
+            st.markdown("**Data Governance**")
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <div style="display: flex; justify-content: space-between;">
+                            <strong>Data Classification</strong>
+                            <span style="color: #10B981;">● Active</span>
+                        </div>
+                        <div style="font-size: 0.75rem; color: #6B7280; margin-top: 0.2rem;">Public, Internal, Confidential, Restricted</div>
+                    </div>
+                    <div style="padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <div style="display: flex; justify-content: space-between;">
+                            <strong>Lineage Tracking</strong>
+                            <span style="color: #10B981;">● Active</span>
+                        </div>
+                        <div style="font-size: 0.75rem; color: #6B7280; margin-top: 0.2rem;">End-to-end data flow visibility</div>
+                    </div>
+                    <div style="padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <div style="display: flex; justify-content: space-between;">
+                            <strong>Audit Logging</strong>
+                            <span style="color: #10B981;">● Active</span>
+                        </div>
+                        <div style="font-size: 0.75rem; color: #6B7280; margin-top: 0.2rem;">Query history, access logs, 90-day retention</div>
+                    </div>
+                    <div style="padding: 0.5rem 0;">
+                        <div style="display: flex; justify-content: space-between;">
+                            <strong>Data Retention</strong>
+                            <span style="color: #10B981;">● Configured</span>
+                        </div>
+                        <div style="font-size: 0.75rem; color: #6B7280; margin-top: 0.2rem;">Time Travel 14 days, Fail-safe 7 days</div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        # Compliance Frameworks
+        st.markdown('<div class="section-header">Compliance & Certifications</div>', unsafe_allow_html=True)
+        
+        comp_cols = st.columns(6)
+        compliance = [
+            ("GDPR", "EU Data Protection", "#3B82F6"),
+            ("SOC 2", "Type II Certified", "#10B981"),
+            ("ISO 27001", "InfoSec Management", "#8B5CF6"),
+            ("PCI DSS", "Payment Security", "#F59E0B"),
+            ("HIPAA", "Health Data Ready", "#EC4899"),
+            ("Ofcom", "UK Telecom Regs", "#29B5E8")
+        ]
+        for col, (name, desc, color) in zip(comp_cols, compliance):
+            with col:
+                st.markdown(f"""
+                <div style="background: white; border: 2px solid {color}; border-radius: 8px; padding: 0.75rem; text-align: center;">
+                    <div style="font-weight: 700; color: {color}; font-size: 0.9rem;">{name}</div>
+                    <div style="font-size: 0.65rem; color: #6B7280; margin-top: 0.2rem;">{desc}</div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        # Warehouse Configuration
+        st.markdown('<div class="section-header">Compute Resources</div>', unsafe_allow_html=True)
+        
+        wh_cols = st.columns(3)
+        warehouses = [
+            ("SnowTelco_ETL_WH", "X-Large", "Data Engineering", "Multi-cluster auto-scale", "#10B981"),
+            ("SnowTelco_Analytics_WH", "Large", "BI & Analytics", "Auto-suspend 5 min", "#29B5E8"),
+            ("SnowTelco_ML_WH", "2X-Large", "ML Training", "Snowpark optimized", "#8B5CF6")
+        ]
+        for col, (name, size, purpose, config, color) in zip(wh_cols, warehouses):
+            with col:
+                st.markdown(f"""
+                <div style="background: white; border: 1px solid #E5E7EB; border-radius: 8px; padding: 1rem;">
+                    <div style="font-weight: 600; color: #1B2A4E; font-size: 0.9rem;">{name}</div>
+                    <div style="display: flex; justify-content: space-between; margin-top: 0.5rem; font-size: 0.8rem;">
+                        <span style="color: #6B7280;">Size:</span>
+                        <span style="font-weight: 600; color: {color};">{size}</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; font-size: 0.8rem;">
+                        <span style="color: #6B7280;">Purpose:</span>
+                        <span>{purpose}</span>
+                    </div>
+                    <div style="font-size: 0.7rem; color: #6B7280; margin-top: 0.5rem; padding-top: 0.5rem; border-top: 1px solid #E5E7EB;">{config}</div>
+                </div>
+                """, unsafe_allow_html=True)
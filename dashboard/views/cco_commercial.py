@@ -0,0 +1,704 @@
+"""CCO Commercial dashboard."""
+
+import streamlit as st
+
+
+def render_cco_commercial():
+    import pandas as pd
+    import altair as alt
+    
+    # CCO Header with Pipeline Flow Effect
+    st.markdown("""
+    <div class="cco-header-wrap">
+        <div class="cco-pipeline-bg">
+            <div class="cco-pipe" style="top: 30%; left: 5%; width: 90%;"><div class="cco-flow-dot" style="animation-delay: 0s;"></div></div>
+            <div class="cco-pipe" style="top: 50%; left: 10%; width: 80%;"><div class="cco-flow-dot" style="animation-delay: 1s;"></div></div>
+            <div class="cco-pipe" style="top: 70%; left: 5%; width: 90%;"><div class="cco-flow-dot" style="animation-delay: 2s;"></div></div>
+            <div class="cco-node" style="top: 28%; left: 5%;"></div>
+            <div class="cco-node" style="top: 28%; left: 50%; animation-delay: 0.5s;"></div>
+            <div class="cco-node" style="top: 28%; right: 5%; animation-delay: 1s;"></div>
+        </div>
+        <div class="cco-header-content">
+            <h1>CCO Commercial Dashboard</h1>
+            <p>Revenue Growth, Sales Performance & Partner Channel</p>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Dashboard Tabs
+    tab_overview, tab_mlops, tab_strategy = st.tabs(["📊 Overview & Analysis", "🧪 Model Ops & Strategy", "❄️ Snowflake Intelligence"])
+
+    with tab_overview:
+        
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['SALES_PIPELINE', 'PARTNER', 'MOBILE', 'PORTING', 'MARKET_INTELLIGENCE']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+        
+        # CCO COMMERCIAL - REVENUE ENGINE ANIMATION
+        st.markdown("""<div class="revenue-engine"><div class="engine-header"><div class="engine-title">💰 Revenue Engine</div><div class="engine-total"><div class="total-label">Total Revenue MTD</div><div class="total-val">£7.4M</div></div></div><div class="channels-grid"><div class="channel-card"><div class="channel-icon">📱</div><div class="channel-name">Direct Sales</div><div class="channel-rev">£3.2M</div><div class="channel-pct">↑ +12%</div><div class="channel-flow"><span class="flow-dot"></span><span class="flow-dot" style="animation-delay:0.2s"></span><span class="flow-dot" style="animation-delay:0.4s"></span></div></div><div class="channel-card"><div class="channel-icon">🤝</div><div class="channel-name">Partner Channel</div><div class="channel-rev">£2.1M</div><div class="channel-pct">↑ +8%</div><div class="channel-flow"><span class="flow-dot"></span><span class="flow-dot" style="animation-delay:0.2s"></span><span class="flow-dot" style="animation-delay:0.4s"></span></div></div><div class="channel-card"><div class="channel-icon">🏪</div><div class="channel-name">Retail Stores</div><div class="channel-rev">£1.4M</div><div class="channel-pct">↑ +5%</div><div class="channel-flow"><span class="flow-dot"></span><span class="flow-dot" style="animation-delay:0.2s"></span><span class="flow-dot" style="animation-delay:0.4s"></span></div></div><div class="channel-card"><div class="channel-icon">🌐</div><div class="channel-name">Digital</div><div class="channel-rev">£0.7M</div><div class="channel-pct">↑ +23%</div><div class="channel-flow"><span class="flow-dot"></span><span class="flow-dot" style="animation-delay:0.2s"></span><span class="flow-dot" style="animation-delay:0.4s"></span></div></div></div></div>""", unsafe_allow_html=True)
+        
+        
+        st.markdown('<div class="section-header">Commercial Performance Overview</div>', unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #10B981;">
+                <div class="kpi-icon">💰</div>
+                <div class="kpi-label">Total Revenue</div>
+                <div class="kpi-value">£68.2M</div>
+                <div class="kpi-delta positive">↑ +14.2% YoY</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <path d="M0,35 L20,32 L40,28 L60,24 L80,18 L100,12" fill="none" stroke="#10B981" stroke-width="2"/>
+                    <path d="M0,35 L20,32 L40,28 L60,24 L80,18 L100,12 L100,40 L0,40 Z" fill="#10B981"/>
+                </svg>
+            </div>
+            <div class="kpi-card" style="--accent: #8B5CF6;">
+                <div class="kpi-icon">📊</div>
+                <div class="kpi-label">B2B Pipeline</div>
+                <div class="kpi-value">£24.8M</div>
+                <div class="kpi-delta positive">↑ 142 opportunities</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <rect x="5" y="32" width="12" height="8" fill="#8B5CF6"/>
+                    <rect x="22" y="28" width="12" height="12" fill="#8B5CF6"/>
+                    <rect x="39" y="24" width="12" height="16" fill="#8B5CF6"/>
+                    <rect x="56" y="20" width="12" height="20" fill="#8B5CF6"/>
+                    <rect x="73" y="14" width="12" height="26" fill="#8B5CF6"/>
+                </svg>
+            </div>
+            <div class="kpi-card" style="--accent: #29B5E8;">
+                <div class="kpi-icon">🤝</div>
+                <div class="kpi-label">Partner Revenue</div>
+                <div class="kpi-value">£12.4M</div>
+                <div class="kpi-delta positive">↑ +22.1% YoY</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <path d="M0,30 L20,28 L40,32 L60,24 L80,20 L100,14" fill="none" stroke="#29B5E8" stroke-width="2"/>
+                    <path d="M0,30 L20,28 L40,32 L60,24 L80,20 L100,14 L100,40 L0,40 Z" fill="#29B5E8"/>
+                </svg>
+            </div>
+            <div class="kpi-card" style="--accent: #F59E0B;">
+                <div class="kpi-icon">📱</div>
+                <div class="kpi-label">5G Subscribers</div>
+                <div class="kpi-value">42%</div>
+                <div class="kpi-delta positive">↑ +8% vs Q3</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <path d="M0,28 L20,26 L40,24 L60,22 L80,18 L100,16" fill="none" stroke="#F59E0B" stroke-width="2"/>
+                    <path d="M0,28 L20,26 L40,24 L60,22 L80,18 L100,16 L100,40 L0,40 Z" fill="#F59E0B"/>
+                </svg>
+            </div>
+        </div>
+        
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #EC4899;">
+                <div class="kpi-icon">📈</div>
+                <div class="kpi-label">ARPU (Blended)</div>
+                <div class="kpi-value">£38.40</div>
+                <div class="kpi-delta positive">↑ +£3.20 YoY</div>
+            </div>
+            <div class="kpi-card" style="--accent: #14B8A6;">
+                <div class="kpi-icon">🔄</div>
+                <div class="kpi-label">Port-In Rate</div>
+                <div class="kpi-value">1.8:1</div>
+                <div class="kpi-delta positive">↑ Net positive</div>
+            </div>
+            <div class="kpi-card" style="--accent: #6366F1;">
+                <div class="kpi-icon">🏆</div>
+                <div class="kpi-label">Win Rate</div>
+                <div class="kpi-value">34%</div>
+                <div class="kpi-delta positive">↑ +4% vs avg</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EF4444;">
+                <div class="kpi-icon">⚠️</div>
+                <div class="kpi-label">At-Risk Revenue</div>
+                <div class="kpi-value">£2.1M</div>
+                <div class="kpi-delta negative">3.1% of base</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        col_left, col_right = st.columns([1.3, 1])
+        
+        with col_left:
+            st.markdown('<div class="section-header">B2B Sales Pipeline by Stage</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <div style="text-align: center;">
+                    <div style="position: relative; margin: 0.5rem auto;">
+                        <div style="background: linear-gradient(90deg, #8B5CF6 0%, #A78BFA 100%); color: white; padding: 0.75rem; border-radius: 8px 8px 0 0; font-weight: 600; width: 100%;">
+                            <div style="display: flex; justify-content: space-between; align-items: center;">
+                                <span>Lead Qualification</span>
+                                <span>£8.2M (42 opps)</span>
+                            </div>
+                        </div>
+                        <div style="background: linear-gradient(90deg, #29B5E8 0%, #5BC0EB 100%); color: white; padding: 0.75rem; font-weight: 600; width: 85%; margin: 0 auto;">
+                            <div style="display: flex; justify-content: space-between; align-items: center;">
+                                <span>Proposal</span>
+                                <span>£6.8M (35 opps)</span>
+                            </div>
+                        </div>
+                        <div style="background: linear-gradient(90deg, #10B981 0%, #34D399 100%); color: white; padding: 0.75rem; font-weight: 600; width: 65%; margin: 0 auto;">
+                            <div style="display: flex; justify-content: space-between; align-items: center;">
+                                <span>Negotiation</span>
+                                <span>£5.4M (28 opps)</span>
+                            </div>
+                        </div>
+                        <div style="background: linear-gradient(90deg, #F59E0B 0%, #FBBF24 100%); color: white; padding: 0.75rem; font-weight: 600; width: 45%; margin: 0 auto;">
+                            <div style="display: flex; justify-content: space-between; align-items: center;">
+                                <span>Contract</span>
+                                <span>£2.8M (22 opps)</span>
+                            </div>
+                        </div>
+                        <div style="background: linear-gradient(90deg, #EF4444 0%, #F87171 100%); color: white; padding: 0.75rem; border-radius: 0 0 8px 8px; font-weight: 600; width: 30%; margin: 0 auto;">
+                            <div style="display: flex; justify-content: space-between; align-items: center;">
+                                <span>Closed Won</span>
+                                <span>£1.6M (15 opps)</span>
+                            </div>
+                        </div>
+                    </div>
+                </div>
+                <div style="display: flex; justify-content: space-around; margin-top: 1rem; font-size: 0.85rem;">
+                    <div style="text-align: center; padding: 0.5rem; background: #F3F4F6; border-radius: 8px; flex: 1; margin: 0 0.25rem;">
+                        <div style="color: #6B7280;">Avg Deal Size</div>
+                        <div style="font-weight: 700; color: #1B2A4E;">£175K</div>
+                    </div>
+                    <div style="text-align: center; padding: 0.5rem; background: #F3F4F6; border-radius: 8px; flex: 1; margin: 0 0.25rem;">
+                        <div style="color: #6B7280;">Avg Sales Cycle</div>
+                        <div style="font-weight: 700; color: #1B2A4E;">68 days</div>
+                    </div>
+                    <div style="text-align: center; padding: 0.5rem; background: #F3F4F6; border-radius: 8px; flex: 1; margin: 0 0.25rem;">
+                        <div style="color: #6B7280;">Q1 Target</div>
+                        <div style="font-weight: 700; color: #10B981;">82% on track</div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            st.markdown('<div class="section-header">Revenue by Customer Type</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <table style="width: 100%; border-collapse: collapse; font-size: 0.85rem;">
+                    <thead>
+                        <tr style="border-bottom: 2px solid #E5E7EB;">
+                            <th style="text-align: left; padding: 0.5rem; color: #6B7280;">Segment</th>
+                            <th style="text-align: right; padding: 0.5rem; color: #6B7280;">Revenue</th>
+                            <th style="text-align: right; padding: 0.5rem; color: #6B7280;">ARPU</th>
+                            <th style="text-align: right; padding: 0.5rem; color: #6B7280;">Subs</th>
+                            <th style="text-align: right; padding: 0.5rem; color: #6B7280;">YoY</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem;"><span style="color: #29B5E8;">●</span> Consumer</td>
+                            <td style="text-align: right; padding: 0.5rem; font-weight: 600;">£32.8M</td>
+                            <td style="text-align: right; padding: 0.5rem;">£32.40</td>
+                            <td style="text-align: right; padding: 0.5rem;">21,200</td>
+                            <td style="text-align: right; padding: 0.5rem;"><span style="color: #10B981;">+11%</span></td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem;"><span style="color: #10B981;">●</span> SMB</td>
+                            <td style="text-align: right; padding: 0.5rem; font-weight: 600;">£16.2M</td>
+                            <td style="text-align: right; padding: 0.5rem;">£58.50</td>
+                            <td style="text-align: right; padding: 0.5rem;">6,400</td>
+                            <td style="text-align: right; padding: 0.5rem;"><span style="color: #10B981;">+18%</span></td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem;"><span style="color: #8B5CF6;">●</span> Enterprise</td>
+                            <td style="text-align: right; padding: 0.5rem; font-weight: 600;">£19.2M</td>
+                            <td style="text-align: right; padding: 0.5rem;">£142.00</td>
+                            <td style="text-align: right; padding: 0.5rem;">1,400</td>
+                            <td style="text-align: right; padding: 0.5rem;"><span style="color: #10B981;">+16%</span></td>
+                        </tr>
+                    </tbody>
+                </table>
+                """, unsafe_allow_html=True)
+        
+        with col_right:
+            st.markdown('<div class="section-header">Partner Performance</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="padding: 0.6rem; border-left: 4px solid #F59E0B; background: #FEF3C7; border-radius: 0 8px 8px 0; margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <div>
+                                <div style="font-weight: 600; color: #92400E;">Gold Partners (8)</div>
+                                <div style="font-size: 0.75rem; color: #6B7280;">Revenue: £6.2M · Commission: £620K</div>
+                            </div>
+                            <span style="font-weight: 700; color: #F59E0B;">50%</span>
+                        </div>
+                    </div>
+                    <div style="padding: 0.6rem; border-left: 4px solid #9CA3AF; background: #F3F4F6; border-radius: 0 8px 8px 0; margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <div>
+                                <div style="font-weight: 600; color: #4B5563;">Silver Partners (24)</div>
+                                <div style="font-size: 0.75rem; color: #6B7280;">Revenue: £4.1M · Commission: £328K</div>
+                            </div>
+                            <span style="font-weight: 700; color: #6B7280;">33%</span>
+                        </div>
+                    </div>
+                    <div style="padding: 0.6rem; border-left: 4px solid #CD7F32; background: #FDF4E8; border-radius: 0 8px 8px 0;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <div>
+                                <div style="font-weight: 600; color: #8B4513;">Bronze Partners (52)</div>
+                                <div style="font-size: 0.75rem; color: #6B7280;">Revenue: £2.1M · Commission: £126K</div>
+                            </div>
+                            <span style="font-weight: 700; color: #CD7F32;">17%</span>
+                        </div>
+                    </div>
+                </div>
+                <div style="margin-top: 1rem; padding: 0.75rem; background: linear-gradient(135deg, #E0F2FE 0%, #F0F9FF 100%); border-radius: 8px; text-align: center;">
+                    <div style="font-size: 0.75rem; color: #0369A1;">Total Partners: 84 · Active This Month: 72</div>
+                    <div style="font-size: 1.2rem; font-weight: 700; color: #0369A1;">£1.07M commissions paid MTD</div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            st.markdown('<div class="section-header">Porting Activity</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 0.75rem;">
+                    <div style="background: linear-gradient(135deg, #D1FAE5 0%, #ECFDF5 100%); border-radius: 12px; padding: 1rem; text-align: center;">
+                        <div style="font-size: 0.75rem; color: #065F46;">Port-Ins (MTD)</div>
+                        <div style="font-size: 1.5rem; font-weight: 700; color: #065F46;">1,840</div>
+                        <div style="font-size: 0.7rem; color: #10B981;">↑ +12% vs last month</div>
+                    </div>
+                    <div style="background: linear-gradient(135deg, #FEE2E2 0%, #FEF2F2 100%); border-radius: 12px; padding: 1rem; text-align: center;">
+                        <div style="font-size: 0.75rem; color: #DC2626;">Port-Outs (MTD)</div>
+                        <div style="font-size: 1.5rem; font-weight: 700; color: #DC2626;">1,020</div>
+                        <div style="font-size: 0.7rem; color: #DC2626;">↓ -8% vs last month</div>
+                    </div>
+                </div>
+                <div style="margin-top: 0.75rem; font-size: 0.8rem;">
+                    <div style="font-weight: 600; margin-bottom: 0.5rem;">Top Port-In Sources:</div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.25rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Competitor A</span><span style="font-weight: 600;">42%</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.25rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Competitor B</span><span style="font-weight: 600;">28%</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.25rem 0;">
+                        <span>Others</span><span style="font-weight: 600;">30%</span>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.markdown('<div class="section-header">5G Adoption</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="text-align: center;">
+                    <div style="font-size: 2.5rem; font-weight: 700; color: #8B5CF6;">42%</div>
+                    <div style="font-size: 0.85rem; color: #6B7280;">5G Subscriber Share</div>
+                    <div style="background: #E5E7EB; border-radius: 4px; height: 12px; margin: 1rem 0;">
+                        <div style="background: linear-gradient(90deg, #8B5CF6, #29B5E8); width: 42%; height: 100%; border-radius: 4px;"></div>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; font-size: 0.75rem; color: #6B7280;">
+                        <span>Target: 50%</span>
+                        <span>+8% vs Q3</span>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col2:
+            st.markdown('<div class="section-header">Market Position</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Market Share</span><span style="font-weight: 700; color: #10B981;">18.4%</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Market Rank</span><span style="font-weight: 700; color: #29B5E8;">#3</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>NPS vs Market</span><span style="font-weight: 700; color: #10B981;">+8</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0;">
+                        <span>Price Index</span><span style="font-weight: 700; color: #F59E0B;">98</span>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col3:
+            st.markdown('<div class="section-header">Q1 Targets</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <div style="display: flex; justify-content: space-between;">
+                            <span>Revenue</span><span style="font-weight: 700;">82%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 6px; margin-top: 0.25rem;">
+                            <div style="background: #10B981; width: 82%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <div style="display: flex; justify-content: space-between;">
+                            <span>Net Adds</span><span style="font-weight: 700;">78%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 6px; margin-top: 0.25rem;">
+                            <div style="background: #29B5E8; width: 78%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="padding: 0.4rem 0;">
+                        <div style="display: flex; justify-content: space-between;">
+                            <span>B2B Wins</span><span style="font-weight: 700;">65%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 6px; margin-top: 0.25rem;">
+                            <div style="background: #F59E0B; width: 65%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        # Looping bar animation for Revenue Trend
+        
+        st.markdown('<div class="section-header">Monthly Revenue Trend & ARPU</div>', unsafe_allow_html=True)
+        
+        with st.container(border=True):
+            st.markdown("""
+            <div style="display: flex; gap: 2rem;">
+                <div style="flex: 2;">
+                    <div class="rev-bars" style="display: flex; align-items: flex-end; justify-content: space-between; height: 180px; padding: 0 0.5rem;">
+                        <div style="text-align: center; flex: 1;">
+                            <div class="rev-bar" style="background: linear-gradient(180deg, #29B5E8 0%, #0EA5E9 100%); width: 100%; height: 95px;"></div>
+                            <div style="font-size: 0.7rem; color: #6B7280; margin-top: 0.25rem;">Aug</div>
+                            <div style="font-size: 0.75rem; font-weight: 600;">£10.2M</div>
+                        </div>
+                        <div style="text-align: center; flex: 1;">
+                            <div class="rev-bar" style="background: linear-gradient(180deg, #29B5E8 0%, #0EA5E9 100%); width: 100%; height: 102px;"></div>
+                            <div style="font-size: 0.7rem; color: #6B7280; margin-top: 0.25rem;">Sep</div>
+                            <div style="font-size: 0.75rem; font-weight: 600;">£10.8M</div>
+                        </div>
+                        <div style="text-align: center; flex: 1;">
+                            <div class="rev-bar" style="background: linear-gradient(180deg, #29B5E8 0%, #0EA5E9 100%); width: 100%; height: 110px;"></div>
+                            <div style="font-size: 0.7rem; color: #6B7280; margin-top: 0.25rem;">Oct</div>
+                            <div style="font-size: 0.75rem; font-weight: 600;">£11.2M</div>
+                        </div>
+                        <div style="text-align: center; flex: 1;">
+                            <div class="rev-bar" style="background: linear-gradient(180deg, #29B5E8 0%, #0EA5E9 100%); width: 100%; height: 118px;"></div>
+                            <div style="font-size: 0.7rem; color: #6B7280; margin-top: 0.25rem;">Nov</div>
+                            <div style="font-size: 0.75rem; font-weight: 600;">£11.6M</div>
+                        </div>
+                        <div style="text-align: center; flex: 1;">
+                            <div class="rev-bar" style="background: linear-gradient(180deg, #29B5E8 0%, #0EA5E9 100%); width: 100%; height: 130px;"></div>
+                            <div style="font-size: 0.7rem; color: #6B7280; margin-top: 0.25rem;">Dec</div>
+                            <div style="font-size: 0.75rem; font-weight: 600;">£12.2M</div>
+                        </div>
+                        <div style="text-align: center; flex: 1;">
+                            <div class="rev-bar" style="background: linear-gradient(180deg, #10B981 0%, #059669 100%); width: 100%; height: 145px;"></div>
+                            <div style="font-size: 0.7rem; color: #6B7280; margin-top: 0.25rem;">Jan</div>
+                            <div style="font-size: 0.75rem; font-weight: 600; color: #10B981;">£12.8M</div>
+                        </div>
+                    </div>
+                </div>
+                <div style="flex: 1; border-left: 1px solid #E5E7EB; padding-left: 1.5rem;">
+                    <div style="font-size: 0.8rem; color: #6B7280; margin-bottom: 0.5rem;">ARPU Trend</div>
+                    <div style="display: flex; flex-direction: column; gap: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <span style="font-size: 0.75rem;">Consumer</span>
+                            <span style="font-weight: 700; color: #29B5E8;">£32.40 <span style="color: #10B981; font-size: 0.7rem;">↑2.10</span></span>
+                        </div>
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <span style="font-size: 0.75rem;">SMB</span>
+                            <span style="font-weight: 700; color: #10B981;">£58.50 <span style="color: #10B981; font-size: 0.7rem;">↑4.20</span></span>
+                        </div>
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <span style="font-size: 0.75rem;">Enterprise</span>
+                            <span style="font-weight: 700; color: #8B5CF6;">£142.00 <span style="color: #10B981; font-size: 0.7rem;">↑8.50</span></span>
+                        </div>
+                        <div style="display: flex; justify-content: space-between; align-items: center; border-top: 1px solid #E5E7EB; padding-top: 0.5rem; margin-top: 0.25rem;">
+                            <span style="font-size: 0.75rem; font-weight: 600;">Blended</span>
+                            <span style="font-weight: 700; color: #1B2A4E;">£38.40</span>
+                        </div>
+                    </div>
+                    <div style="margin-top: 1rem; padding: 0.5rem; background: #D1FAE5; border-radius: 6px; text-align: center;">
+                        <div style="font-size: 0.7rem; color: #065F46;">6-Month Growth</div>
+                        <div style="font-size: 1.2rem; font-weight: 700; color: #065F46;">+25.5%</div>
+                    </div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        col_comp, col_sales = st.columns(2)
+        
+        with col_comp:
+            st.markdown('<div class="section-header">Competitive Market Share</div>', unsafe_allow_html=True)
+            # Add looping animation for market share bars
+            with st.container(border=True):
+                st.markdown("""
+                <div class="share-rows" style="font-size: 0.85rem;">
+                    <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                        <div style="width: 90px;">Competitor A</div>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 20px; margin: 0 0.5rem;">
+                            <div class="share-bar" style="background: #6B7280; width: 32%; height: 100%; border-radius: 4px; display: flex; align-items: center; justify-content: flex-end; padding-right: 0.5rem;">
+                                <span style="color: white; font-size: 0.7rem; font-weight: 600;">32%</span>
+                            </div>
+                        </div>
+                        <span style="width: 50px; font-size: 0.75rem; color: #EF4444;">-0.8%</span>
+                    </div>
+                    <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                        <div style="width: 90px;">Competitor B</div>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 20px; margin: 0 0.5rem;">
+                            <div class="share-bar" style="background: #6B7280; width: 28%; height: 100%; border-radius: 4px; display: flex; align-items: center; justify-content: flex-end; padding-right: 0.5rem;">
+                                <span style="color: white; font-size: 0.7rem; font-weight: 600;">28%</span>
+                            </div>
+                        </div>
+                        <span style="width: 50px; font-size: 0.75rem; color: #EF4444;">-0.4%</span>
+                    </div>
+                    <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                        <div style="width: 90px; font-weight: 600; color: #29B5E8;">SnowTelco</div>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 20px; margin: 0 0.5rem;">
+                            <div class="share-bar highlight" style="background: linear-gradient(90deg, #29B5E8, #8B5CF6); width: 18.4%; height: 100%; border-radius: 4px; display: flex; align-items: center; justify-content: flex-end; padding-right: 0.5rem;">
+                                <span style="color: white; font-size: 0.7rem; font-weight: 600;">18.4%</span>
+                            </div>
+                        </div>
+                        <span style="width: 50px; font-size: 0.75rem; color: #10B981; font-weight: 600;">+1.2%</span>
+                    </div>
+                    <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                        <div style="width: 90px;">Competitor C</div>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 20px; margin: 0 0.5rem;">
+                            <div class="share-bar" style="background: #6B7280; width: 14%; height: 100%; border-radius: 4px; display: flex; align-items: center; justify-content: flex-end; padding-right: 0.5rem;">
+                                <span style="color: white; font-size: 0.7rem; font-weight: 600;">14%</span>
+                            </div>
+                        </div>
+                        <span style="width: 50px; font-size: 0.75rem; color: #6B7280;">+0.2%</span>
+                    </div>
+                    <div style="display: flex; align-items: center;">
+                        <div style="width: 90px;">Others</div>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 20px; margin: 0 0.5rem;">
+                            <div class="share-bar" style="background: #9CA3AF; width: 7.6%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                        <span style="width: 50px; font-size: 0.75rem; color: #EF4444;">-0.2%</span>
+                    </div>
+                </div>
+                <div style="margin-top: 1rem; padding: 0.5rem; background: #F0F9FF; border-radius: 6px; font-size: 0.75rem; text-align: center;">
+                    <span style="color: #0369A1;">📈 SnowTelco fastest growing — gaining share from top 2 competitors</span>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col_sales:
+            st.markdown('<div class="section-header">Sales Team Leaderboard</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <table style="width: 100%; border-collapse: collapse; font-size: 0.8rem;">
+                    <thead>
+                        <tr style="border-bottom: 2px solid #E5E7EB;">
+                            <th style="text-align: left; padding: 0.4rem; color: #6B7280;">#</th>
+                            <th style="text-align: left; padding: 0.4rem; color: #6B7280;">Rep</th>
+                            <th style="text-align: right; padding: 0.4rem; color: #6B7280;">Quota</th>
+                            <th style="text-align: right; padding: 0.4rem; color: #6B7280;">Closed</th>
+                            <th style="text-align: right; padding: 0.4rem; color: #6B7280;">%</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        <tr style="border-bottom: 1px solid #F3F4F6; background: linear-gradient(90deg, #FEF3C7 0%, white 30%);">
+                            <td style="padding: 0.4rem;">🥇</td>
+                            <td style="padding: 0.4rem; font-weight: 600;">Sarah M.</td>
+                            <td style="text-align: right; padding: 0.4rem;">£420K</td>
+                            <td style="text-align: right; padding: 0.4rem;">£512K</td>
+                            <td style="text-align: right; padding: 0.4rem; color: #10B981; font-weight: 700;">122%</td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.4rem;">🥈</td>
+                            <td style="padding: 0.4rem; font-weight: 600;">James T.</td>
+                            <td style="text-align: right; padding: 0.4rem;">£380K</td>
+                            <td style="text-align: right; padding: 0.4rem;">£425K</td>
+                            <td style="text-align: right; padding: 0.4rem; color: #10B981; font-weight: 700;">112%</td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.4rem;">🥉</td>
+                            <td style="padding: 0.4rem; font-weight: 600;">Emily R.</td>
+                            <td style="text-align: right; padding: 0.4rem;">£350K</td>
+                            <td style="text-align: right; padding: 0.4rem;">£378K</td>
+                            <td style="text-align: right; padding: 0.4rem; color: #10B981; font-weight: 700;">108%</td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.4rem;">4</td>
+                            <td style="padding: 0.4rem;">Michael K.</td>
+                            <td style="text-align: right; padding: 0.4rem;">£320K</td>
+                            <td style="text-align: right; padding: 0.4rem;">£298K</td>
+                            <td style="text-align: right; padding: 0.4rem; color: #F59E0B;">93%</td>
+                        </tr>
+                        <tr>
+                            <td style="padding: 0.4rem;">5</td>
+                            <td style="padding: 0.4rem;">Lisa W.</td>
+                            <td style="text-align: right; padding: 0.4rem;">£300K</td>
+                            <td style="text-align: right; padding: 0.4rem;">£245K</td>
+                            <td style="text-align: right; padding: 0.4rem; color: #F59E0B;">82%</td>
+                        </tr>
+                    </tbody>
+                </table>
+                <div style="margin-top: 0.75rem; display: flex; justify-content: space-around; font-size: 0.75rem;">
+                    <div style="text-align: center; padding: 0.4rem; background: #D1FAE5; border-radius: 6px; flex: 1; margin-right: 0.5rem;">
+                        <div style="color: #065F46;">Above Quota</div>
+                        <div style="font-weight: 700; color: #065F46;">12 reps</div>
+                    </div>
+                    <div style="text-align: center; padding: 0.4rem; background: #FEF3C7; border-radius: 6px; flex: 1; margin-right: 0.5rem;">
+                        <div style="color: #92400E;">80-100%</div>
+                        <div style="font-weight: 700; color: #92400E;">8 reps</div>
+                    </div>
+                    <div style="text-align: center; padding: 0.4rem; background: #FEE2E2; border-radius: 6px; flex: 1;">
+                        <div style="color: #DC2626;">Below 80%</div>
+                        <div style="font-weight: 700; color: #DC2626;">4 reps</div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        # Animated Bar Charts CSS
+        
+        st.markdown('<div class="section-header">Key Commercial Insights</div>', unsafe_allow_html=True)
+        
+        col_ins1, col_ins2, col_ins3, col_ins4 = st.columns(4)
+        
+        with col_ins1:
+            with st.container(border=True):
+                st.markdown("""
+                <div class="insight-card">
+                    <div class="insight-label">Win Rate Trend</div>
+                    <div class="insight-value" style="color: #10B981;">34%</div>
+                    <div class="animated-bars">
+                        <div class="bar" style="height: 20px; background: #D1FAE5;"></div>
+                        <div class="bar" style="height: 25px; background: #A7F3D0;"></div>
+                        <div class="bar" style="height: 28px; background: #6EE7B7;"></div>
+                        <div class="bar" style="height: 32px; background: #34D399;"></div>
+                        <div class="bar" style="height: 38px; background: #10B981;"></div>
+                    </div>
+                    <div class="insight-delta" style="color: #10B981;">↑ +4% vs last quarter</div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col_ins2:
+            with st.container(border=True):
+                st.markdown("""
+                <div class="insight-card">
+                    <div class="insight-label">Avg Deal Size</div>
+                    <div class="insight-value" style="color: #8B5CF6;">£175K</div>
+                    <div class="animated-bars">
+                        <div class="bar" style="height: 22px; background: #EDE9FE;"></div>
+                        <div class="bar" style="height: 26px; background: #DDD6FE;"></div>
+                        <div class="bar" style="height: 30px; background: #C4B5FD;"></div>
+                        <div class="bar" style="height: 35px; background: #A78BFA;"></div>
+                        <div class="bar" style="height: 40px; background: #8B5CF6;"></div>
+                    </div>
+                    <div class="insight-delta" style="color: #8B5CF6;">↑ +£22K vs last year</div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col_ins3:
+            with st.container(border=True):
+                st.markdown("""
+                <div class="insight-card">
+                    <div class="insight-label">Sales Cycle</div>
+                    <div class="insight-value" style="color: #29B5E8;">68d</div>
+                    <div class="animated-bars">
+                        <div class="bar" style="height: 40px; background: #0EA5E9;"></div>
+                        <div class="bar" style="height: 36px; background: #38BDF8;"></div>
+                        <div class="bar" style="height: 32px; background: #7DD3FC;"></div>
+                        <div class="bar" style="height: 28px; background: #BAE6FD;"></div>
+                        <div class="bar" style="height: 25px; background: #E0F2FE;"></div>
+                    </div>
+                    <div class="insight-delta" style="color: #29B5E8;">↓ -12 days improved</div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col_ins4:
+            with st.container(border=True):
+                st.markdown("""
+                <div class="insight-card">
+                    <div class="insight-label">Pipeline Coverage</div>
+                    <div class="insight-value" style="color: #F59E0B;">3.2x</div>
+                    <div class="animated-bars">
+                        <div class="bar" style="height: 25px; background: #FEF3C7;"></div>
+                        <div class="bar" style="height: 30px; background: #FDE68A;"></div>
+                        <div class="bar" style="height: 35px; background: #FCD34D;"></div>
+                        <div class="bar" style="height: 38px; background: #FBBF24;"></div>
+                        <div class="bar" style="height: 42px; background: #F59E0B;"></div>
+                    </div>
+                    <div class="insight-delta" style="color: #F59E0B;">Target: 3.0x minimum</div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+
+    with tab_strategy:
+        st.markdown('<div class="section-header">CCO Strategic Priorities — Q1 2026</div>', unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #DC2626; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 1</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Revenue Growth +15%</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **+14.2%** YoY (target: 15%)
+                - B2B pipeline: **£24.8M** qualified
+                - Enterprise wins: 15 deals Q4
+                - Focus: **SMB expansion**
+                """)
+        
+        with col2:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #F59E0B; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 2</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">5G Migration 50%</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **42%** (target: 50% by Q2)
+                - Trade-in program launched
+                - 5G ARPU premium: **+£8.20**
+                - Churn reduction: **-0.6%**
+                """)
+        
+        with col3:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #10B981; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 3</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Partner Channel +25%</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **+22.1%** YoY (target: 25%)
+                - 12 new Gold partners onboarding
+                - Commission optimization: live
+                - Portal upgrade: **March launch**
+                """)
+        
+        st.markdown('<div class="section-header">Ask Snowflake Intelligence</div>', unsafe_allow_html=True)
+        
+        questions = [
+            "Show me our revenue performance by customer type and ARPU trends.",
+            "What does our B2B sales pipeline look like by stage and expected close dates?",
+            "How are our partner channels performing? Show me by tier and commission status.",
+            "What's our 5G vs 4G subscriber mix and ARPU comparison?",
+            "How do we compare to competitors on port-in vs port-out ratios?"
+        ]
+        
+        sf_intel_url = "https://ai.snowflake.com/sfseeurope/pjose_aws3"
+        
+        cols = st.columns(2)
+        for i, q in enumerate(questions):
+            with cols[i % 2]:
+                escaped_q = q.replace('"', '&quot;').replace("'", "&#39;")
+                st.markdown(f"""
+                <a href="{sf_intel_url}" target="_blank" onclick="navigator.clipboard.writeText('{escaped_q}')" style="text-decoration: none; color: inherit; display: block;">
+                    <div class="question-card">
+                        <p style="margin-bottom: 1.5rem;"><strong>Q{i+1}:</strong> "{q}"</p>
+                    </div>
+                </a>
+                """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div style="text-align: center; margin-top: 1rem; padding: 1rem; background: linear-gradient(135deg, #29B5E8 0%, #1A8BC4 100%); border-radius: 8px;">
+            <a href="{sf_intel_url}" target="_blank" style="color: white; text-decoration: none; font-weight: 600; font-size: 1rem;">
+                ❄️ Ask these questions in Snowflake Intelligence →
+            </a>
+        </div>
+        """, unsafe_allow_html=True)
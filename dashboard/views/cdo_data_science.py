@@ -0,0 +1,1305 @@
+"""CDO AI/ML Analytics dashboard."""
+
+import streamlit as st
+import streamlit.components.v1 as components
+import pandas as pd
+import altair as alt
+
+from dashboard import charts
+
+
+def render_cdo_data_science():
+    import pandas as pd
+    import altair as alt
+    
+    # Matrix Rain Header for CDO - AI themed
+    st.markdown("""
+    <div class="cdo-header-wrapper">
+        <div class="cdo-matrix-bg">
+            <div class="cdo-matrix-col" style="left: 3%; animation-duration: 7s;">AI∞ML</div>
+            <div class="cdo-matrix-col" style="left: 12%; animation-duration: 5s; animation-delay: -2s;">▼△▼△</div>
+            <div class="cdo-matrix-col" style="left: 21%; animation-duration: 8s; animation-delay: -3s;">0.87</div>
+            <div class="cdo-matrix-col" style="left: 30%; animation-duration: 6s; animation-delay: -1s;">⚡⚡⚡</div>
+            <div class="cdo-matrix-col" style="left: 39%; animation-duration: 9s; animation-delay: -4s;">pred</div>
+            <div class="cdo-matrix-col" style="left: 48%; animation-duration: 5s; animation-delay: -2s;">★★★</div>
+            <div class="cdo-matrix-col" style="left: 57%; animation-duration: 7s; animation-delay: -5s;">f(x)</div>
+            <div class="cdo-matrix-col" style="left: 66%; animation-duration: 6s; animation-delay: -1s;">∑∫∂</div>
+            <div class="cdo-matrix-col" style="left: 75%; animation-duration: 8s; animation-delay: -3s;">92%</div>
+            <div class="cdo-matrix-col" style="left: 84%; animation-duration: 5s; animation-delay: -2s;">◉◎◉</div>
+            <div class="cdo-matrix-col" style="left: 93%; animation-duration: 7s; animation-delay: -4s;">∞</div>
+        </div>
+        <div class="cdo-header-content">
+            <h1>CDO AI/ML Analytics Dashboard</h1>
+            <p>Predictive Analytics, Propensity Models & Data-Driven Decisions</p>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Dashboard Tabs
+    tab_overview, tab_mlops, tab_strategy = st.tabs(["📊 Overview & Analysis", "🧪 Model Ops & Strategy", "❄️ Snowflake Intelligence"])
+
+    with tab_overview:
+        
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['PROPENSITY', 'MOBILE']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+        
+        # CDO AI NEURAL NETWORK ANIMATION
+        st.markdown("""<div class="cdo-neural"><div class="neural-viz"><svg class="neural-svg"><line class="neural-line" x1="20" y1="20" x2="70" y2="35"/><line class="neural-line" x1="20" y1="60" x2="70" y2="35" style="animation-delay:0.2s"/><line class="neural-line" x1="20" y1="100" x2="70" y2="85" style="animation-delay:0.4s"/><line class="neural-line" x1="20" y1="60" x2="70" y2="85" style="animation-delay:0.6s"/><line class="neural-line" x1="70" y1="35" x2="120" y2="60" style="animation-delay:0.3s"/><line class="neural-line" x1="70" y1="85" x2="120" y2="60" style="animation-delay:0.5s"/><line class="neural-line" x1="120" y1="60" x2="150" y2="60" style="animation-delay:0.7s"/></svg><div class="layer-input"><div class="neuron" style="left:10px;top:15px"></div><div class="neuron" style="left:10px;top:55px;animation-delay:0.3s"></div><div class="neuron" style="left:10px;top:95px;animation-delay:0.6s"></div></div><div class="layer-hidden"><div class="neuron" style="left:65px;top:30px;animation-delay:0.4s"></div><div class="neuron" style="left:65px;top:80px;animation-delay:0.7s"></div></div><div class="layer-output"><div class="neuron" style="left:115px;top:55px;animation-delay:0.9s"></div></div></div><div class="cdo-models"><div class="cdo-title">🧠 AI Models Performance</div><div class="model-grid"><div class="model-card"><div class="model-name">Churn Prediction</div><div class="model-acc">94.2%</div><div class="model-type">XGBoost</div></div><div class="model-card"><div class="model-name">Upsell Propensity</div><div class="model-acc">87.8%</div><div class="model-type">Neural Net</div></div><div class="model-card"><div class="model-name">CLV Forecast</div><div class="model-acc">91.5%</div><div class="model-type">Gradient Boost</div></div></div></div></div>""", unsafe_allow_html=True)
+        
+        
+        st.markdown('<div class="section-header">AI/ML Analytics Overview</div>', unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #EF4444;">
+                <div class="kpi-icon">⚠️</div>
+                <div class="kpi-label">High Churn Risk</div>
+                <div class="kpi-value">2,840</div>
+                <div class="kpi-delta negative">9.5% of base</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <path d="M0,30 L20,28 L40,24 L60,20 L80,16 L100,14" fill="none" stroke="#EF4444" stroke-width="2"/>
+                    <path d="M0,30 L20,28 L40,24 L60,20 L80,16 L100,14 L100,40 L0,40 Z" fill="#EF4444"/>
+                </svg>
+            </div>
+            <div class="kpi-card" style="--accent: #F59E0B;">
+                <div class="kpi-icon">💰</div>
+                <div class="kpi-label">Revenue at Risk</div>
+                <div class="kpi-value">£1.8M</div>
+                <div class="kpi-delta negative">Monthly impact</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <rect x="5" y="32" width="12" height="8" fill="#F59E0B"/>
+                    <rect x="22" y="28" width="12" height="12" fill="#F59E0B"/>
+                    <rect x="39" y="24" width="12" height="16" fill="#F59E0B"/>
+                    <rect x="56" y="20" width="12" height="20" fill="#F59E0B"/>
+                    <rect x="73" y="14" width="12" height="26" fill="#F59E0B"/>
+                </svg>
+            </div>
+            <div class="kpi-card" style="--accent: #10B981;">
+                <div class="kpi-icon">📈</div>
+                <div class="kpi-label">Upsell Propensity</div>
+                <div class="kpi-value">4,620</div>
+                <div class="kpi-delta positive">High probability</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <path d="M0,35 L20,32 L40,28 L60,24 L80,18 L100,12" fill="none" stroke="#10B981" stroke-width="2"/>
+                    <path d="M0,35 L20,32 L40,28 L60,24 L80,18 L100,12 L100,40 L0,40 Z" fill="#10B981"/>
+                </svg>
+            </div>
+            <div class="kpi-card" style="--accent: #8B5CF6;">
+                <div class="kpi-icon">🎯</div>
+                <div class="kpi-label">Model Accuracy</div>
+                <div class="kpi-value">87%</div>
+                <div class="kpi-delta positive">↑ +3% vs baseline</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <path d="M0,28 L20,26 L40,24 L60,22 L80,18 L100,16" fill="none" stroke="#8B5CF6" stroke-width="2"/>
+                    <path d="M0,28 L20,26 L40,24 L60,22 L80,18 L100,16 L100,40 L0,40 Z" fill="#8B5CF6"/>
+                </svg>
+            </div>
+        </div>
+        
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #29B5E8;">
+                <div class="kpi-icon">💵</div>
+                <div class="kpi-label">Avg Predicted CLV</div>
+                <div class="kpi-value">£1,842</div>
+                <div class="kpi-delta positive">↑ +£124 YoY</div>
+            </div>
+            <div class="kpi-card" style="--accent: #14B8A6;">
+                <div class="kpi-icon">🤖</div>
+                <div class="kpi-label">ML Models Active</div>
+                <div class="kpi-value">12</div>
+                <div class="kpi-delta positive">All healthy</div>
+            </div>
+            <div class="kpi-card" style="--accent: #6366F1;">
+                <div class="kpi-icon">📊</div>
+                <div class="kpi-label">Predictions (MTD)</div>
+                <div class="kpi-value">2.4M</div>
+                <div class="kpi-delta positive">↑ +18% vs avg</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EC4899;">
+                <div class="kpi-icon">✅</div>
+                <div class="kpi-label">Actions Taken</div>
+                <div class="kpi-value">1,240</div>
+                <div class="kpi-delta positive">68% success rate</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        if st.session_state.get('sf_highlights', True):
+            st.info("❄️ **Powered by Snowflake Cortex AI** — Churn and propensity models built with Snowflake ML using CORTEX.ML_PREDICT() for real-time scoring on 30M+ customer records")
+        
+        # Predictive Insights Cards - Real-time AI Predictions
+        st.markdown('<div class="section-header">Live Predictive Insights</div>', unsafe_allow_html=True)
+        
+        components.html("""
+        <!DOCTYPE html>
+        <html>
+        <head>
+        <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; }
+        @keyframes insight-pulse {
+            0%, 100% { box-shadow: 0 4px 15px rgba(139, 92, 246, 0.2); }
+            50% { box-shadow: 0 8px 25px rgba(139, 92, 246, 0.4); }
+        }
+        @keyframes confidence-grow {
+            0% { width: 0%; }
+            100% { width: var(--conf); }
+        }
+        .insights-grid {
+            display: grid;
+            grid-template-columns: repeat(3, 1fr);
+            gap: 1rem;
+            padding: 0.5rem;
+        }
+        .insight-card {
+            background: linear-gradient(135deg, #FAFAFA 0%, #F5F5F5 100%);
+            border-radius: 16px;
+            padding: 1.25rem;
+            border: 1px solid #E5E7EB;
+            position: relative;
+            overflow: hidden;
+            animation: insight-pulse 3s ease-in-out infinite;
+        }
+        .insight-card.card-red { border-left: 4px solid #EF4444; }
+        .insight-card.card-green { border-left: 4px solid #10B981; }
+        .insight-card.card-purple { border-left: 4px solid #8B5CF6; }
+        .insight-badge {
+            display: inline-flex;
+            align-items: center;
+            gap: 4px;
+            padding: 4px 10px;
+            border-radius: 20px;
+            font-size: 0.7rem;
+            font-weight: 600;
+            margin-bottom: 0.75rem;
+        }
+        .badge-critical { background: #FEE2E2; color: #DC2626; }
+        .badge-warning { background: #FEF3C7; color: #D97706; }
+        .badge-opportunity { background: #D1FAE5; color: #059669; }
+        .insight-icon { font-size: 2rem; margin-bottom: 0.5rem; }
+        .insight-title { font-size: 0.9rem; font-weight: 600; color: #1B2A4E; margin-bottom: 0.25rem; }
+        .insight-value { font-size: 1.8rem; font-weight: 700; color: #1B2A4E; }
+        .insight-subtitle { font-size: 0.75rem; color: #6B7280; margin-bottom: 0.75rem; }
+        .confidence-bar { height: 6px; background: #E5E7EB; border-radius: 3px; overflow: hidden; margin-top: 0.5rem; }
+        .confidence-fill { height: 100%; border-radius: 3px; animation: confidence-grow 1.5s ease-out forwards; }
+        .confidence-label { display: flex; justify-content: space-between; font-size: 0.7rem; color: #9CA3AF; margin-top: 0.25rem; }
+        .insight-action {
+            display: inline-flex;
+            align-items: center;
+            gap: 6px;
+            padding: 8px 12px;
+            color: white;
+            border-radius: 8px;
+            font-size: 0.75rem;
+            font-weight: 600;
+            margin-top: 0.75rem;
+            cursor: pointer;
+        }
+        .action-red { background: #EF4444; }
+        .action-green { background: #10B981; }
+        .action-purple { background: #8B5CF6; }
+        </style>
+        </head>
+        <body>
+        <div class="insights-grid">
+            <div class="insight-card card-red">
+                <span class="insight-badge badge-critical">CRITICAL</span>
+                <div class="insight-icon">⚠️</div>
+                <div class="insight-title">Churn Alert</div>
+                <div class="insight-value">847</div>
+                <div class="insight-subtitle">High-value customers at risk this week</div>
+                <div class="confidence-bar">
+                    <div class="confidence-fill" style="--conf: 94%; background: linear-gradient(90deg, #EF4444, #DC2626);"></div>
+                </div>
+                <div class="confidence-label">
+                    <span>Model Confidence</span>
+                    <span style="font-weight: 600; color: #EF4444;">94%</span>
+                </div>
+                <div class="insight-action action-red">Launch Retention Campaign</div>
+            </div>
+            
+            <div class="insight-card card-green">
+                <span class="insight-badge badge-opportunity">OPPORTUNITY</span>
+                <div class="insight-icon">💎</div>
+                <div class="insight-title">Upsell Ready</div>
+                <div class="insight-value">1,234</div>
+                <div class="insight-subtitle">Customers likely to upgrade to 5G</div>
+                <div class="confidence-bar">
+                    <div class="confidence-fill" style="--conf: 87%; background: linear-gradient(90deg, #10B981, #059669);"></div>
+                </div>
+                <div class="confidence-label">
+                    <span>Model Confidence</span>
+                    <span style="font-weight: 600; color: #10B981;">87%</span>
+                </div>
+                <div class="insight-action action-green">Send Personalized Offers</div>
+            </div>
+            
+            <div class="insight-card card-purple">
+                <span class="insight-badge badge-warning">ACTION NEEDED</span>
+                <div class="insight-icon">📞</div>
+                <div class="insight-title">Support Prediction</div>
+                <div class="insight-value">2,156</div>
+                <div class="insight-subtitle">Likely to contact support in 7 days</div>
+                <div class="confidence-bar">
+                    <div class="confidence-fill" style="--conf: 82%; background: linear-gradient(90deg, #8B5CF6, #7C3AED);"></div>
+                </div>
+                <div class="confidence-label">
+                    <span>Model Confidence</span>
+                    <span style="font-weight: 600; color: #8B5CF6;">82%</span>
+                </div>
+                <div class="insight-action action-purple">Proactive Outreach</div>
+            </div>
+        </div>
+        </body>
+        </html>
+        """, height=320, scrolling=False)
+        
+        # AI Model Performance - Animated Circular Progress
+        st.markdown("""
+        <div class="cdo-models-grid">
+            <div class="cdo-model-card">
+                <div class="cdo-model-ring">
+                    <svg viewBox="0 0 100 100">
+                        <circle class="bg" cx="50" cy="50" r="45"/>
+                        <circle class="progress green" cx="50" cy="50" r="45"/>
+                    </svg>
+                </div>
+                <div class="cdo-model-value">87%</div>
+                <div class="cdo-model-name">Churn Model</div>
+                <div class="cdo-model-metric">AUC-ROC Score</div>
+            </div>
+            <div class="cdo-model-card">
+                <div class="cdo-model-ring">
+                    <svg viewBox="0 0 100 100">
+                        <circle class="bg" cx="50" cy="50" r="45"/>
+                        <circle class="progress blue" cx="50" cy="50" r="45"/>
+                    </svg>
+                </div>
+                <div class="cdo-model-value">84%</div>
+                <div class="cdo-model-name">Upsell Model</div>
+                <div class="cdo-model-metric">Precision</div>
+            </div>
+            <div class="cdo-model-card">
+                <div class="cdo-model-ring">
+                    <svg viewBox="0 0 100 100">
+                        <circle class="bg" cx="50" cy="50" r="45"/>
+                        <circle class="progress purple" cx="50" cy="50" r="45"/>
+                    </svg>
+                </div>
+                <div class="cdo-model-value">92%</div>
+                <div class="cdo-model-name">CLV Predictor</div>
+                <div class="cdo-model-metric">R² Score</div>
+            </div>
+            <div class="cdo-model-card">
+                <div class="cdo-model-ring">
+                    <svg viewBox="0 0 100 100">
+                        <circle class="bg" cx="50" cy="50" r="45"/>
+                        <circle class="progress pink" cx="50" cy="50" r="45"/>
+                    </svg>
+                </div>
+                <div class="cdo-model-value">82%</div>
+                <div class="cdo-model-name">NPS Predictor</div>
+                <div class="cdo-model-metric">Accuracy</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        col_left, col_right = st.columns([1.3, 1])
+        
+        with col_left:
+            st.markdown('<div class="section-header">Churn Risk Distribution</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="display: flex; align-items: center; padding: 0.6rem 0; border-bottom: 1px solid #F3F4F6;">
+                        <span style="width: 80px; font-weight: 600; color: #EF4444;">High Risk</span>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 24px; margin: 0 0.75rem; position: relative;">
+                            <div style="background: linear-gradient(90deg, #EF4444, #F87171); width: 28%; height: 100%; border-radius: 4px; display: flex; align-items: center; padding-left: 0.5rem;">
+                                <span style="color: white; font-size: 0.75rem; font-weight: 600;">2,840</span>
+                            </div>
+                        </div>
+                        <span style="width: 60px; text-align: right; font-weight: 600; color: #EF4444;">9.5%</span>
+                    </div>
+                    <div style="display: flex; align-items: center; padding: 0.6rem 0; border-bottom: 1px solid #F3F4F6;">
+                        <span style="width: 80px; font-weight: 600; color: #F59E0B;">Medium</span>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 24px; margin: 0 0.75rem; position: relative;">
+                            <div style="background: linear-gradient(90deg, #F59E0B, #FBBF24); width: 42%; height: 100%; border-radius: 4px; display: flex; align-items: center; padding-left: 0.5rem;">
+                                <span style="color: white; font-size: 0.75rem; font-weight: 600;">5,180</span>
+                            </div>
+                        </div>
+                        <span style="width: 60px; text-align: right; font-weight: 600; color: #F59E0B;">17.3%</span>
+                    </div>
+                    <div style="display: flex; align-items: center; padding: 0.6rem 0;">
+                        <span style="width: 80px; font-weight: 600; color: #10B981;">Low Risk</span>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 24px; margin: 0 0.75rem; position: relative;">
+                            <div style="background: linear-gradient(90deg, #10B981, #34D399); width: 100%; height: 100%; border-radius: 4px; display: flex; align-items: center; padding-left: 0.5rem;">
+                                <span style="color: white; font-size: 0.75rem; font-weight: 600;">21,980</span>
+                            </div>
+                        </div>
+                        <span style="width: 60px; text-align: right; font-weight: 600; color: #10B981;">73.2%</span>
+                    </div>
+                </div>
+                <div style="margin-top: 1rem; padding: 0.75rem; background: #FEF3C7; border-radius: 8px; text-align: center; font-size: 0.85rem;">
+                    <span style="color: #92400E;">⚠️ 2,840 customers need retention intervention — <strong>£1.8M/month</strong> at risk</span>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            st.markdown('<div class="section-header">Next Best Action Distribution</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <table style="width: 100%; border-collapse: collapse; font-size: 0.85rem;">
+                    <thead>
+                        <tr style="border-bottom: 2px solid #E5E7EB;">
+                            <th style="text-align: left; padding: 0.5rem; color: #6B7280;">Action</th>
+                            <th style="text-align: right; padding: 0.5rem; color: #6B7280;">Count</th>
+                            <th style="text-align: right; padding: 0.5rem; color: #6B7280;">Revenue</th>
+                            <th style="text-align: right; padding: 0.5rem; color: #6B7280;">Conf.</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem;"><span style="color: #8B5CF6;">●</span> Upgrade to 5G</td>
+                            <td style="text-align: right; padding: 0.5rem; font-weight: 600;">2,840</td>
+                            <td style="text-align: right; padding: 0.5rem;">+£284K</td>
+                            <td style="text-align: right; padding: 0.5rem;"><span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">92%</span></td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem;"><span style="color: #10B981;">●</span> Add Family Plan</td>
+                            <td style="text-align: right; padding: 0.5rem; font-weight: 600;">1,620</td>
+                            <td style="text-align: right; padding: 0.5rem;">+£194K</td>
+                            <td style="text-align: right; padding: 0.5rem;"><span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">88%</span></td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem;"><span style="color: #EF4444;">●</span> Retention Offer</td>
+                            <td style="text-align: right; padding: 0.5rem; font-weight: 600;">1,480</td>
+                            <td style="text-align: right; padding: 0.5rem;">Save £148K</td>
+                            <td style="text-align: right; padding: 0.5rem;"><span style="background: #FEF3C7; color: #92400E; padding: 0.2rem 0.5rem; border-radius: 12px;">78%</span></td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem;"><span style="color: #29B5E8;">●</span> Data Boost</td>
+                            <td style="text-align: right; padding: 0.5rem; font-weight: 600;">980</td>
+                            <td style="text-align: right; padding: 0.5rem;">+£49K</td>
+                            <td style="text-align: right; padding: 0.5rem;"><span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">85%</span></td>
+                        </tr>
+                        <tr>
+                            <td style="padding: 0.5rem;"><span style="color: #F59E0B;">●</span> International Add-on</td>
+                            <td style="text-align: right; padding: 0.5rem; font-weight: 600;">720</td>
+                            <td style="text-align: right; padding: 0.5rem;">+£36K</td>
+                            <td style="text-align: right; padding: 0.5rem;"><span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">82%</span></td>
+                        </tr>
+                    </tbody>
+                </table>
+                """, unsafe_allow_html=True)
+        
+        with col_right:
+            st.markdown('<div class="section-header">Churn by Segment</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="padding: 0.6rem; border-left: 4px solid #EF4444; background: #FEE2E2; border-radius: 0 8px 8px 0; margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <div>
+                                <div style="font-weight: 600; color: #DC2626;">Budget Segment</div>
+                                <div style="font-size: 0.75rem; color: #6B7280;">5,400 customers</div>
+                            </div>
+                            <span style="font-size: 1.2rem; font-weight: 700; color: #DC2626;">14.2%</span>
+                        </div>
+                    </div>
+                    <div style="padding: 0.6rem; border-left: 4px solid #F59E0B; background: #FEF3C7; border-radius: 0 8px 8px 0; margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <div>
+                                <div style="font-weight: 600; color: #92400E;">Standard Segment</div>
+                                <div style="font-size: 0.75rem; color: #6B7280;">10,500 customers</div>
+                            </div>
+                            <span style="font-size: 1.2rem; font-weight: 700; color: #F59E0B;">8.6%</span>
+                        </div>
+                    </div>
+                    <div style="padding: 0.6rem; border-left: 4px solid #10B981; background: #D1FAE5; border-radius: 0 8px 8px 0; margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <div>
+                                <div style="font-weight: 600; color: #065F46;">Premium Segment</div>
+                                <div style="font-size: 0.75rem; color: #6B7280;">3,200 customers</div>
+                            </div>
+                            <span style="font-size: 1.2rem; font-weight: 700; color: #10B981;">4.2%</span>
+                        </div>
+                    </div>
+                    <div style="padding: 0.6rem; border-left: 4px solid #29B5E8; background: #E0F2FE; border-radius: 0 8px 8px 0;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <div>
+                                <div style="font-weight: 600; color: #0369A1;">5G Adopters</div>
+                                <div style="font-size: 0.75rem; color: #6B7280;">12,600 customers</div>
+                            </div>
+                            <span style="font-size: 1.2rem; font-weight: 700; color: #29B5E8;">3.8%</span>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            st.markdown('<div class="section-header">Model Performance</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Churn Model (XGBoost)</span>
+                        <span style="font-weight: 700; background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">AUC: 0.89</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>CLV Model (Regression)</span>
+                        <span style="font-weight: 700; background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">R²: 0.84</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Upsell Propensity</span>
+                        <span style="font-weight: 700; background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">AUC: 0.86</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0;">
+                        <span>NBA Recommender</span>
+                        <span style="font-weight: 700; background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">Prec: 0.82</span>
+                    </div>
+                </div>
+                <div style="margin-top: 0.75rem; padding: 0.5rem; background: #F3F4F6; border-radius: 8px; font-size: 0.75rem; text-align: center;">
+                    <span style="color: #6B7280;">All models retrained weekly · Last update: 2 days ago</span>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            st.markdown('<div class="section-header">CLV Distribution</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 0.5rem;">
+                    <div style="background: linear-gradient(135deg, #D1FAE5 0%, #ECFDF5 100%); border-radius: 12px; padding: 0.75rem; text-align: center;">
+                        <div style="font-size: 0.7rem; color: #065F46;">High CLV (>£2.5K)</div>
+                        <div style="font-size: 1.3rem; font-weight: 700; color: #065F46;">4,200</div>
+                        <div style="font-size: 0.65rem; color: #6B7280;">14% of base</div>
+                    </div>
+                    <div style="background: linear-gradient(135deg, #E0F2FE 0%, #F0F9FF 100%); border-radius: 12px; padding: 0.75rem; text-align: center;">
+                        <div style="font-size: 0.7rem; color: #0369A1;">Medium CLV</div>
+                        <div style="font-size: 1.3rem; font-weight: 700; color: #0369A1;">18,400</div>
+                        <div style="font-size: 0.65rem; color: #6B7280;">61% of base</div>
+                    </div>
+                    <div style="background: linear-gradient(135deg, #FEF3C7 0%, #FDE68A 100%); border-radius: 12px; padding: 0.75rem; text-align: center;">
+                        <div style="font-size: 0.7rem; color: #92400E;">Low CLV (<£800)</div>
+                        <div style="font-size: 1.3rem; font-weight: 700; color: #92400E;">7,400</div>
+                        <div style="font-size: 0.65rem; color: #6B7280;">25% of base</div>
+                    </div>
+                    <div style="background: linear-gradient(135deg, #EDE9FE 0%, #F5F3FF 100%); border-radius: 12px; padding: 0.75rem; text-align: center;">
+                        <div style="font-size: 0.7rem; color: #5B21B6;">Total Base</div>
+                        <div style="font-size: 1.3rem; font-weight: 700; color: #5B21B6;">30,000</div>
+                        <div style="font-size: 0.65rem; color: #6B7280;">Avg CLV: £1,842</div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Model Performance Over Time</div>', unsafe_allow_html=True)
+        
+        with st.container(border=True):
+            col_chart, col_legend = st.columns([2, 1])
+            
+            with col_chart:
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan', 'Feb']
+                model_perf_data = pd.DataFrame({
+                    'Month': months * 3,
+                    'Model': ['Churn AUC'] * 7 + ['Upsell AUC'] * 7 + ['NBA Precision'] * 7,
+                    'Score': [0.83, 0.84, 0.85, 0.86, 0.87, 0.88, 0.89,
+                             0.80, 0.81, 0.82, 0.83, 0.84, 0.85, 0.86,
+                             0.78, 0.79, 0.80, 0.81, 0.81, 0.82, 0.82]
+                })
+                
+                model_chart = alt.Chart(model_perf_data).mark_line(
+                    strokeWidth=3,
+                    point=alt.OverlayMarkDef(size=60)
+                ).encode(
+                    x=alt.X('Month:N', sort=months, axis=alt.Axis(labelAngle=0, title=None)),
+                    y=alt.Y('Score:Q', scale=alt.Scale(domain=[0.75, 0.92]), axis=alt.Axis(title='Score', format='.2f')),
+                    color=alt.Color('Model:N', scale=alt.Scale(
+                        domain=['Churn AUC', 'Upsell AUC', 'NBA Precision'],
+                        range=['#10B981', '#8B5CF6', '#F59E0B']
+                    ), legend=None),
+                    strokeDash=alt.StrokeDash('Model:N', scale=alt.Scale(
+                        domain=['Churn AUC', 'Upsell AUC', 'NBA Precision'],
+                        range=[[1, 0], [6, 3], [3, 3]]
+                    ), legend=None),
+                    tooltip=['Month:N', 'Model:N', alt.Tooltip('Score:Q', format='.2f')]
+                ).properties(height=180)
+                
+                charts.altair_chart(model_chart, use_container_width=True)
+            
+            with col_legend:
+                st.markdown("""
+                <div style="font-size: 0.75rem; color: #6B7280; margin-bottom: 0.75rem;">Latest Metrics</div>
+                <div style="display: flex; align-items: center; margin-bottom: 0.5rem;">
+                    <div style="width: 20px; height: 3px; background: #10B981; margin-right: 0.5rem;"></div>
+                    <span style="font-size: 0.8rem;">Churn AUC: <strong>0.89</strong></span>
+                </div>
+                <div style="display: flex; align-items: center; margin-bottom: 0.5rem;">
+                    <div style="width: 20px; height: 3px; background: #8B5CF6; margin-right: 0.5rem; border-top: 3px dashed #8B5CF6; height: 0;"></div>
+                    <span style="font-size: 0.8rem;">Upsell AUC: <strong>0.86</strong></span>
+                </div>
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <div style="width: 20px; height: 3px; background: #F59E0B; margin-right: 0.5rem; border-top: 3px dotted #F59E0B; height: 0;"></div>
+                    <span style="font-size: 0.8rem;">NBA Prec: <strong>0.82</strong></span>
+                </div>
+                <div style="padding: 0.5rem; background: #D1FAE5; border-radius: 6px; text-align: center; font-size: 0.75rem;">
+                    <span style="color: #065F46;">↑ All models improving</span>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        col_feat, col_pred = st.columns(2)
+        
+        with col_feat:
+            st.markdown('<div class="section-header">Churn Model Feature Importance</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; font-size: 0.8rem;">
+                            <span>Contract End Date</span>
+                            <span style="font-weight: 600;">24.2%</span>
+                        </div>
+                        <div style="background: #E5E7EB; height: 12px; border-radius: 4px; margin-top: 0.25rem;">
+                            <div style="background: linear-gradient(90deg, #EF4444, #F87171); width: 100%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; font-size: 0.8rem;">
+                            <span>Service Tickets (90d)</span>
+                            <span style="font-weight: 600;">18.6%</span>
+                        </div>
+                        <div style="background: #E5E7EB; height: 12px; border-radius: 4px; margin-top: 0.25rem;">
+                            <div style="background: linear-gradient(90deg, #F59E0B, #FBBF24); width: 77%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; font-size: 0.8rem;">
+                            <span>Data Usage Decline</span>
+                            <span style="font-weight: 600;">14.8%</span>
+                        </div>
+                        <div style="background: #E5E7EB; height: 12px; border-radius: 4px; margin-top: 0.25rem;">
+                            <div style="background: linear-gradient(90deg, #F59E0B, #FBBF24); width: 61%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; font-size: 0.8rem;">
+                            <span>NPS Score</span>
+                            <span style="font-weight: 600;">12.4%</span>
+                        </div>
+                        <div style="background: #E5E7EB; height: 12px; border-radius: 4px; margin-top: 0.25rem;">
+                            <div style="background: linear-gradient(90deg, #29B5E8, #7DD3FC); width: 51%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; font-size: 0.8rem;">
+                            <span>Network QoE Score</span>
+                            <span style="font-weight: 600;">10.2%</span>
+                        </div>
+                        <div style="background: #E5E7EB; height: 12px; border-radius: 4px; margin-top: 0.25rem;">
+                            <div style="background: linear-gradient(90deg, #29B5E8, #7DD3FC); width: 42%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div>
+                        <div style="display: flex; justify-content: space-between; font-size: 0.8rem;">
+                            <span>Other Features</span>
+                            <span style="font-weight: 600;">19.8%</span>
+                        </div>
+                        <div style="background: #E5E7EB; height: 12px; border-radius: 4px; margin-top: 0.25rem;">
+                            <div style="background: linear-gradient(90deg, #9CA3AF, #D1D5DB); width: 82%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col_pred:
+            st.markdown('<div class="section-header">Prediction Accuracy Tracking</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 0.75rem; margin-bottom: 1rem;">
+                        <div style="background: #F0F9FF; border-radius: 8px; padding: 0.75rem; text-align: center;">
+                            <div style="font-size: 0.7rem; color: #0369A1;">True Positives</div>
+                            <div style="font-size: 1.5rem; font-weight: 700; color: #0369A1;">847</div>
+                            <div style="font-size: 0.65rem; color: #10B981;">Correctly predicted churn</div>
+                        </div>
+                        <div style="background: #FEF3C7; border-radius: 8px; padding: 0.75rem; text-align: center;">
+                            <div style="font-size: 0.7rem; color: #92400E;">False Positives</div>
+                            <div style="font-size: 1.5rem; font-weight: 700; color: #F59E0B;">142</div>
+                            <div style="font-size: 0.65rem; color: #92400E;">Predicted but stayed</div>
+                        </div>
+                        <div style="background: #FEE2E2; border-radius: 8px; padding: 0.75rem; text-align: center;">
+                            <div style="font-size: 0.7rem; color: #DC2626;">False Negatives</div>
+                            <div style="font-size: 1.5rem; font-weight: 700; color: #EF4444;">98</div>
+                            <div style="font-size: 0.65rem; color: #DC2626;">Missed churners</div>
+                        </div>
+                        <div style="background: #D1FAE5; border-radius: 8px; padding: 0.75rem; text-align: center;">
+                            <div style="font-size: 0.7rem; color: #065F46;">True Negatives</div>
+                            <div style="font-size: 1.5rem; font-weight: 700; color: #10B981;">28.9K</div>
+                            <div style="font-size: 0.65rem; color: #065F46;">Correctly predicted stay</div>
+                        </div>
+                    </div>
+                    <div style="display: flex; justify-content: space-around; font-size: 0.75rem; padding: 0.5rem; background: #F9FAFB; border-radius: 6px;">
+                        <div style="text-align: center;">
+                            <div style="color: #6B7280;">Precision</div>
+                            <div style="font-weight: 700; color: #10B981;">85.6%</div>
+                        </div>
+                        <div style="text-align: center;">
+                            <div style="color: #6B7280;">Recall</div>
+                            <div style="font-weight: 700; color: #10B981;">89.6%</div>
+                        </div>
+                        <div style="text-align: center;">
+                            <div style="color: #6B7280;">F1 Score</div>
+                            <div style="font-weight: 700; color: #10B981;">87.6%</div>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">AI/ML Campaign Performance</div>', unsafe_allow_html=True)
+        
+        with st.container(border=True):
+            st.markdown("""
+            <table style="width: 100%; border-collapse: collapse; font-size: 0.8rem;">
+                <thead>
+                    <tr style="border-bottom: 2px solid #E5E7EB; background: #F9FAFB;">
+                        <th style="text-align: left; padding: 0.6rem; color: #6B7280;">Campaign</th>
+                        <th style="text-align: center; padding: 0.6rem; color: #6B7280;">Model</th>
+                        <th style="text-align: right; padding: 0.6rem; color: #6B7280;">Targeted</th>
+                        <th style="text-align: right; padding: 0.6rem; color: #6B7280;">Converted</th>
+                        <th style="text-align: right; padding: 0.6rem; color: #6B7280;">Rate</th>
+                        <th style="text-align: right; padding: 0.6rem; color: #6B7280;">Revenue</th>
+                        <th style="text-align: right; padding: 0.6rem; color: #6B7280;">ROI</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    <tr style="border-bottom: 1px solid #F3F4F6;">
+                        <td style="padding: 0.6rem; font-weight: 600;">Churn Prevention</td>
+                        <td style="text-align: center; padding: 0.6rem;"><span style="background: #EDE9FE; color: #5B21B6; padding: 0.2rem 0.5rem; border-radius: 12px; font-size: 0.7rem;">XGBoost</span></td>
+                        <td style="text-align: right; padding: 0.6rem;">2,450</td>
+                        <td style="text-align: right; padding: 0.6rem;">847</td>
+                        <td style="text-align: right; padding: 0.6rem;"><span style="color: #10B981; font-weight: 600;">34.6%</span></td>
+                        <td style="text-align: right; padding: 0.6rem;">£1.2M saved</td>
+                        <td style="text-align: right; padding: 0.6rem;"><span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 8px; font-weight: 600;">8.4x</span></td>
+                    </tr>
+                    <tr style="border-bottom: 1px solid #F3F4F6;">
+                        <td style="padding: 0.6rem; font-weight: 600;">5G Upsell</td>
+                        <td style="text-align: center; padding: 0.6rem;"><span style="background: #E0F2FE; color: #0369A1; padding: 0.2rem 0.5rem; border-radius: 12px; font-size: 0.7rem;">PropModel</span></td>
+                        <td style="text-align: right; padding: 0.6rem;">5,200</td>
+                        <td style="text-align: right; padding: 0.6rem;">1,248</td>
+                        <td style="text-align: right; padding: 0.6rem;"><span style="color: #10B981; font-weight: 600;">24.0%</span></td>
+                        <td style="text-align: right; padding: 0.6rem;">£312K MRR</td>
+                        <td style="text-align: right; padding: 0.6rem;"><span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 8px; font-weight: 600;">5.2x</span></td>
+                    </tr>
+                    <tr style="border-bottom: 1px solid #F3F4F6;">
+                        <td style="padding: 0.6rem; font-weight: 600;">Data Add-On</td>
+                        <td style="text-align: center; padding: 0.6rem;"><span style="background: #FEF3C7; color: #92400E; padding: 0.2rem 0.5rem; border-radius: 12px; font-size: 0.7rem;">NBA</span></td>
+                        <td style="text-align: right; padding: 0.6rem;">8,400</td>
+                        <td style="text-align: right; padding: 0.6rem;">2,856</td>
+                        <td style="text-align: right; padding: 0.6rem;"><span style="color: #10B981; font-weight: 600;">34.0%</span></td>
+                        <td style="text-align: right; padding: 0.6rem;">£142K MRR</td>
+                        <td style="text-align: right; padding: 0.6rem;"><span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 8px; font-weight: 600;">4.8x</span></td>
+                    </tr>
+                    <tr>
+                        <td style="padding: 0.6rem; font-weight: 600;">Device Upgrade</td>
+                        <td style="text-align: center; padding: 0.6rem;"><span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px; font-size: 0.7rem;">Hybrid</span></td>
+                        <td style="text-align: right; padding: 0.6rem;">3,100</td>
+                        <td style="text-align: right; padding: 0.6rem;">682</td>
+                        <td style="text-align: right; padding: 0.6rem;"><span style="color: #F59E0B; font-weight: 600;">22.0%</span></td>
+                        <td style="text-align: right; padding: 0.6rem;">£682K</td>
+                        <td style="text-align: right; padding: 0.6rem;"><span style="background: #FEF3C7; color: #92400E; padding: 0.2rem 0.5rem; border-radius: 8px; font-weight: 600;">3.2x</span></td>
+                    </tr>
+                </tbody>
+            </table>
+            <div style="margin-top: 0.75rem; padding: 0.5rem; background: linear-gradient(135deg, #D1FAE5 0%, #ECFDF5 100%); border-radius: 6px; font-size: 0.8rem; text-align: center;">
+                <span style="color: #065F46;">📈 <strong>Total ML-Driven Revenue Impact:</strong> £2.34M this quarter | Avg ROI: 5.4x</span>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # Customer Intelligence Section
+        st.markdown('<div class="section-header">Customer Intelligence & Analytics</div>', unsafe_allow_html=True)
+        
+        clv_col, churn_seg_col = st.columns(2)
+        
+        with clv_col:
+            st.markdown("**Customer Lifetime Value Distribution**")
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>High Value (£2K+)</span><span style="font-weight: 600;">8,420 <span style="color: #10B981;">£4.2M revenue</span></span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: linear-gradient(90deg, #10B981, #059669); width: 18%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Medium Value (£800-2K)</span><span style="font-weight: 600;">24,680 <span style="color: #29B5E8;">£8.6M revenue</span></span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: linear-gradient(90deg, #29B5E8, #0EA5E9); width: 52%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Low Value (£300-800)</span><span style="font-weight: 600;">38,420 <span style="color: #F59E0B;">£5.8M revenue</span></span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: linear-gradient(90deg, #F59E0B, #D97706); width: 82%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div>
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>At Risk (<£300)</span><span style="font-weight: 600;">14,280 <span style="color: #DC2626;">£1.2M revenue</span></span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: linear-gradient(90deg, #DC2626, #B91C1C); width: 30%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                </div>
+                <div style="text-align: center; margin-top: 0.5rem; font-size: 0.75rem; color: #6B7280;">Total CLV: £19.8M across 85,800 customers</div>
+                """, unsafe_allow_html=True)
+        
+        with churn_seg_col:
+            st.markdown("**Churn Risk by Customer Segment**")
+            with st.container(border=True):
+                st.markdown("""
+                <table style="width: 100%; font-size: 0.8rem; border-collapse: collapse;">
+                    <tr style="border-bottom: 2px solid #E5E7EB; background: #F9FAFB;">
+                        <th style="text-align: left; padding: 0.5rem;">Segment</th>
+                        <th style="text-align: center; padding: 0.5rem;">Customers</th>
+                        <th style="text-align: center; padding: 0.5rem;">High Risk</th>
+                        <th style="text-align: center; padding: 0.5rem;">£ at Risk</th>
+                    </tr>
+                    <tr style="border-bottom: 1px solid #E5E7EB;">
+                        <td style="padding: 0.5rem;">Consumer Post-Pay</td>
+                        <td style="text-align: center; padding: 0.5rem;">62,400</td>
+                        <td style="text-align: center; padding: 0.5rem; color: #DC2626;"><strong>8.2%</strong></td>
+                        <td style="text-align: center; padding: 0.5rem;">£1.84M</td>
+                    </tr>
+                    <tr style="border-bottom: 1px solid #E5E7EB;">
+                        <td style="padding: 0.5rem;">Consumer Pre-Pay</td>
+                        <td style="text-align: center; padding: 0.5rem;">38,200</td>
+                        <td style="text-align: center; padding: 0.5rem; color: #F59E0B;"><strong>12.4%</strong></td>
+                        <td style="text-align: center; padding: 0.5rem;">£0.42M</td>
+                    </tr>
+                    <tr style="border-bottom: 1px solid #E5E7EB;">
+                        <td style="padding: 0.5rem;">B2B Enterprise</td>
+                        <td style="text-align: center; padding: 0.5rem;">524</td>
+                        <td style="text-align: center; padding: 0.5rem; color: #10B981;"><strong>3.2%</strong></td>
+                        <td style="text-align: center; padding: 0.5rem;">£0.86M</td>
+                    </tr>
+                    <tr>
+                        <td style="padding: 0.5rem;">B2B SMB</td>
+                        <td style="text-align: center; padding: 0.5rem;">2,180</td>
+                        <td style="text-align: center; padding: 0.5rem; color: #F59E0B;"><strong>6.8%</strong></td>
+                        <td style="text-align: center; padding: 0.5rem;">£0.34M</td>
+                    </tr>
+                </table>
+                <div style="text-align: center; margin-top: 0.5rem; font-size: 0.75rem; color: #DC2626;">⚠️ Total Revenue at Risk: £3.46M</div>
+                """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Propensity & Churn Signals</div>', unsafe_allow_html=True)
+        signal_col1, signal_col2 = st.columns(2)
+        
+        with signal_col1:
+            st.markdown("**Churn Risk Distribution**")
+            with st.container(border=True):
+                churn_dist = pd.DataFrame({
+                    'Risk Band': ['Low', 'Medium', 'High', 'Critical'],
+                    'Customers': [48200, 26500, 8420, 2940]
+                })
+                churn_chart = alt.Chart(churn_dist).mark_bar(cornerRadiusEnd=6).encode(
+                    x=alt.X('Customers:Q', title='Customers'),
+                    y=alt.Y('Risk Band:N', sort='-x', title=None),
+                    color=alt.Color('Risk Band:N', scale=alt.Scale(
+                        domain=['Low', 'Medium', 'High', 'Critical'],
+                        range=['#10B981', '#F59E0B', '#EF4444', '#7F1D1D']
+                    ), legend=None),
+                    tooltip=['Risk Band:N', 'Customers:Q']
+                ).properties(height=200)
+                charts.altair_chart(churn_chart, use_container_width=True)
+                st.caption("Critical and high-risk cohorts drive 62% of projected churn revenue risk.")
+        
+        with signal_col2:
+            st.markdown("**Upsell Propensity Lift (Deciles)**")
+            with st.container(border=True):
+                lift_df = pd.DataFrame({
+                    'Decile': list(range(1, 11)),
+                    'Lift': [0.9, 1.2, 1.4, 1.7, 2.1, 2.6, 3.0, 3.4, 3.8, 4.2]
+                })
+                lift_line = alt.Chart(lift_df).mark_line(color='#8B5CF6', strokeWidth=2).encode(
+                    x=alt.X('Decile:Q', title='Propensity Decile'),
+                    y=alt.Y('Lift:Q', title='Lift vs Baseline')
+                )
+                lift_points = alt.Chart(lift_df).mark_circle(size=60, color='#6366F1').encode(
+                    x='Decile:Q',
+                    y='Lift:Q',
+                    tooltip=['Decile:Q', alt.Tooltip('Lift:Q', format='.1f')]
+                )
+                charts.altair_chart((lift_line + lift_points).properties(height=200), use_container_width=True)
+                st.caption("Top two deciles deliver 3.8–4.2x response lift.")
+        
+        # Cross-sell and NBA
+        cross_col, nba_col = st.columns(2)
+        
+        with cross_col:
+            st.markdown("**Cross-sell Propensity Matrix**")
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Mobile → Broadband</span><span style="font-weight: 600; color: #10B981;">72% likely (4,280)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 16px;">
+                            <div style="background: #10B981; width: 72%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>4G → 5G Upgrade</span><span style="font-weight: 600; color: #29B5E8;">58% likely (12,640)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 16px;">
+                            <div style="background: #29B5E8; width: 58%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>PAYG → Contract</span><span style="font-weight: 600; color: #8B5CF6;">45% likely (8,420)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 16px;">
+                            <div style="background: #8B5CF6; width: 45%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div>
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Add Family Line</span><span style="font-weight: 600; color: #F59E0B;">34% likely (6,840)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 16px;">
+                            <div style="background: #F59E0B; width: 34%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                </div>
+                <div style="text-align: center; margin-top: 0.5rem; font-size: 0.75rem; color: #10B981;">🎯 Potential Revenue: £2.8M</div>
+                """, unsafe_allow_html=True)
+        
+        with nba_col:
+            st.markdown("**Next Best Action Recommendations**")
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.8rem;">
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB; align-items: center;">
+                        <span style="flex: 2;">Retention Offer</span>
+                        <span style="flex: 1; text-align: center;"><strong>4,820</strong></span>
+                        <span style="flex: 1; text-align: right; background: #DC2626; color: white; padding: 0.15rem 0.4rem; border-radius: 10px; font-size: 0.7rem;">Urgent</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB; align-items: center;">
+                        <span style="flex: 2;">5G Upgrade</span>
+                        <span style="flex: 1; text-align: center;"><strong>12,640</strong></span>
+                        <span style="flex: 1; text-align: right; background: #10B981; color: white; padding: 0.15rem 0.4rem; border-radius: 10px; font-size: 0.7rem;">High Value</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB; align-items: center;">
+                        <span style="flex: 2;">Bundle Offer</span>
+                        <span style="flex: 1; text-align: center;"><strong>8,240</strong></span>
+                        <span style="flex: 1; text-align: right; background: #29B5E8; color: white; padding: 0.15rem 0.4rem; border-radius: 10px; font-size: 0.7rem;">Opportunity</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; align-items: center;">
+                        <span style="flex: 2;">Loyalty Reward</span>
+                        <span style="flex: 1; text-align: center;"><strong>6,420</strong></span>
+                        <span style="flex: 1; text-align: right; background: #8B5CF6; color: white; padding: 0.15rem 0.4rem; border-radius: 10px; font-size: 0.7rem;">Nurture</span>
+                    </div>
+                </div>
+                <div style="text-align: center; margin-top: 0.5rem; font-size: 0.75rem; color: #6B7280;">32,120 customers with active recommendations</div>
+                """, unsafe_allow_html=True)
+        
+
+    with tab_mlops:
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['MLOPS', 'FEATURE_STORE', 'MODEL_MONITOR']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="cdo-ops-pulse">
+            <div class="cdo-ops-title">🧪 Model Ops Pulse</div>
+            <div class="cdo-ops-sub">Real-time model health, drift, and inference latency.</div>
+            <div class="cdo-ops-grid">
+                <div class="cdo-ops-card">
+                    <div class="cdo-ops-label">Accuracy</div>
+                    <div class="cdo-ops-value">92.4%</div>
+                    <div class="cdo-ops-delta">↑ +0.6% WoW</div>
+                </div>
+                <div class="cdo-ops-card">
+                    <div class="cdo-ops-label">Drift Score</div>
+                    <div class="cdo-ops-value">0.07</div>
+                    <div class="cdo-ops-delta">Low risk</div>
+                </div>
+                <div class="cdo-ops-card">
+                    <div class="cdo-ops-label">Latency</div>
+                    <div class="cdo-ops-value">84 ms</div>
+                    <div class="cdo-ops-delta">Target &lt; 100 ms</div>
+                </div>
+                <div class="cdo-ops-card">
+                    <div class="cdo-ops-label">Jobs Healthy</div>
+                    <div class="cdo-ops-value">98%</div>
+                    <div class="cdo-ops-delta">2 retrains pending</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Model Health Trends</div>', unsafe_allow_html=True)
+        mlops_left, mlops_right = st.columns(2)
+        
+        with mlops_left:
+            st.markdown("**Accuracy & AUC (12 Weeks)**")
+            with st.container(border=True):
+                perf_df = pd.DataFrame({
+                    'Week': list(range(1, 13)),
+                    'Accuracy': [90.1, 90.4, 90.6, 90.9, 91.2, 91.6, 91.8, 92.0, 92.2, 92.3, 92.4, 92.4],
+                    'AUC': [0.86, 0.865, 0.868, 0.872, 0.878, 0.882, 0.885, 0.889, 0.892, 0.894, 0.897, 0.898]
+                })
+                acc_line = alt.Chart(perf_df).mark_line(color='#10B981', strokeWidth=2).encode(
+                    x=alt.X('Week:Q', title='Week'),
+                    y=alt.Y('Accuracy:Q', title='Accuracy (%)', scale=alt.Scale(domain=[89, 93]))
+                )
+                auc_line = alt.Chart(perf_df).mark_line(color='#8B5CF6', strokeWidth=2, strokeDash=[4, 3]).encode(
+                    x='Week:Q',
+                    y=alt.Y('AUC:Q', title='AUC', scale=alt.Scale(domain=[0.85, 0.91]))
+                )
+                charts.altair_chart((acc_line + auc_line).properties(height=200), use_container_width=True)
+                st.caption("Accuracy and AUC trending upward after feature refresh.")
+        
+        with mlops_right:
+            st.markdown("**Drift Score by Feature Group**")
+            with st.container(border=True):
+                drift_df = pd.DataFrame({
+                    'Feature Group': ['Usage', 'Device', 'Billing', 'Network', 'Engagement'],
+                    'Drift Score': [0.05, 0.09, 0.03, 0.07, 0.06]
+                })
+                drift_chart = alt.Chart(drift_df).mark_bar(color='#F59E0B', cornerRadiusEnd=6).encode(
+                    x=alt.X('Drift Score:Q', title='PSI / Drift Score', scale=alt.Scale(domain=[0, 0.12])),
+                    y=alt.Y('Feature Group:N', sort='-x', title=None),
+                    tooltip=['Feature Group:N', alt.Tooltip('Drift Score:Q', format='.2f')]
+                ).properties(height=200)
+                charts.altair_chart(drift_chart, use_container_width=True)
+                st.caption("Device features show elevated drift; retrain queued.")
+        
+        st.markdown('<div class="section-header">Operational Throughput & Reliability</div>', unsafe_allow_html=True)
+        ops_left, ops_right = st.columns(2)
+        
+        with ops_left:
+            st.markdown("**Inference Volume by Channel (14 Days)**")
+            with st.container(border=True):
+                vol_df = pd.DataFrame({
+                    'Day': list(range(1, 15)),
+                    'Digital': [42, 44, 45, 47, 49, 46, 48, 50, 52, 54, 53, 55, 56, 58],
+                    'Care': [28, 27, 29, 31, 30, 32, 33, 31, 34, 35, 36, 34, 37, 38]
+                })
+                vol_melt = vol_df.melt('Day', var_name='Channel', value_name='Requests_K')
+                vol_chart = alt.Chart(vol_melt).mark_area(opacity=0.5).encode(
+                    x=alt.X('Day:Q', title='Day'),
+                    y=alt.Y('Requests_K:Q', title='Requests (K)'),
+                    color=alt.Color('Channel:N', scale=alt.Scale(range=['#6366F1', '#22C55E']), legend=None)
+                )
+                charts.altair_chart(vol_chart.properties(height=200), use_container_width=True)
+                st.caption("Digital channels drive ~60% of real-time scoring volume.")
+        
+        with ops_right:
+            st.markdown("**Retraining Pipeline Status**")
+            with st.container(border=True):
+                retrain_df = pd.DataFrame({
+                    'Stage': ['Queued', 'Running', 'Validating', 'Deployed'],
+                    'Models': [6, 3, 4, 18]
+                })
+                retrain_chart = alt.Chart(retrain_df).mark_bar(color='#8B5CF6', cornerRadiusEnd=6).encode(
+                    x=alt.X('Models:Q', title='Models'),
+                    y=alt.Y('Stage:N', sort='-x', title=None),
+                    tooltip=['Stage:N', 'Models:Q']
+                ).properties(height=200)
+                charts.altair_chart(retrain_chart, use_container_width=True)
+                st.caption("Deployment backlog low; 18 models promoted this month.")
+        
+        st.markdown('<div class="section-header">Feature Store Freshness</div>', unsafe_allow_html=True)
+        fresh_col1, fresh_col2 = st.columns(2)
+        
+        with fresh_col1:
+            st.markdown("**Top Feature Groups (SLA %)**")
+            with st.container(border=True):
+                fresh_df = pd.DataFrame({
+                    'feature_group': ['Usage', 'Device', 'Billing', 'Network', 'Engagement'],
+                    'sla_pct': [99.2, 97.8, 98.6, 96.9, 98.1]
+                }).set_index('feature_group')
+                st.bar_chart(fresh_df, height=220, color="#0EA5E9")
+                st.caption("Network features are closest to SLA threshold.")
+        
+        with fresh_col2:
+            st.markdown("**Latency Distribution (p50/p95/p99)**")
+            with st.container(border=True):
+                latency_df = pd.DataFrame({
+                    'Percentile': ['p50', 'p95', 'p99'],
+                    'Latency_ms': [62, 118, 164]
+                })
+                latency_chart = alt.Chart(latency_df).mark_bar(color='#10B981', cornerRadiusEnd=6).encode(
+                    x=alt.X('Latency_ms:Q', title='Latency (ms)'),
+                    y=alt.Y('Percentile:N', sort=['p50', 'p95', 'p99'], title=None),
+                    tooltip=['Percentile:N', 'Latency_ms:Q']
+                ).properties(height=200)
+                charts.altair_chart(latency_chart, use_container_width=True)
+                st.caption("p99 latency remains below 200 ms target.")
+        
+        st.markdown('<div class="section-header">Experimentation & Quality</div>', unsafe_allow_html=True)
+        col_exp1, col_exp2, col_exp3, col_exp4 = st.columns(4)
+        
+        with col_exp1:
+            st.markdown('<div class="section-header">A/B Test Results</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="text-align: center;">
+                    <div style="font-size: 0.75rem; color: #6B7280; margin-bottom: 0.5rem;">Offer Personalization</div>
+                    <div style="display: flex; justify-content: center; gap: 0.5rem;">
+                        <div style="background: #E5E7EB; padding: 0.5rem; border-radius: 8px; flex: 1;">
+                            <div style="font-size: 0.65rem; color: #6B7280;">Control</div>
+                            <div style="font-size: 1.2rem; font-weight: 700;">12.4%</div>
+                        </div>
+                        <div style="background: #D1FAE5; padding: 0.5rem; border-radius: 8px; flex: 1;">
+                            <div style="font-size: 0.65rem; color: #065F46;">Variant</div>
+                            <div style="font-size: 1.2rem; font-weight: 700; color: #10B981;">18.2%</div>
+                        </div>
+                    </div>
+                    <div style="margin-top: 0.5rem; font-size: 0.7rem; color: #10B981; font-weight: 600;">+47% lift ✓</div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col_exp2:
+            st.markdown('<div class="section-header">Data Quality</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="text-align: center;">
+                    <div style="font-size: 2rem; font-weight: 700; color: #10B981;">98.4%</div>
+                    <div style="font-size: 0.75rem; color: #6B7280;">Data Completeness</div>
+                    <div style="margin-top: 0.5rem; font-size: 0.75rem;">
+                        <div style="display: flex; justify-content: space-between;">
+                            <span>Freshness</span>
+                            <span style="color: #10B981;">✓ 2hr</span>
+                        </div>
+                        <div style="display: flex; justify-content: space-between;">
+                            <span>Accuracy</span>
+                            <span style="color: #10B981;">✓ 99.1%</span>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col_exp3:
+            st.markdown('<div class="section-header">Model Drift</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="text-align: center;">
+                    <div style="font-size: 2rem; font-weight: 700; color: #10B981;">Low</div>
+                    <div style="font-size: 0.75rem; color: #6B7280;">Drift Detected</div>
+                    <div style="margin-top: 0.5rem; font-size: 0.75rem;">
+                        <div style="display: flex; justify-content: space-between;">
+                            <span>Feature Drift</span>
+                            <span style="color: #10B981;">2.1%</span>
+                        </div>
+                        <div style="display: flex; justify-content: space-between;">
+                            <span>Target Drift</span>
+                            <span style="color: #10B981;">1.4%</span>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col_exp4:
+            st.markdown('<div class="section-header">Inference Load</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="text-align: center;">
+                    <div style="font-size: 2rem; font-weight: 700; color: #29B5E8;">142K</div>
+                    <div style="font-size: 0.75rem; color: #6B7280;">Daily Predictions</div>
+                    <div style="margin-top: 0.5rem; font-size: 0.75rem;">
+                        <div style="display: flex; justify-content: space-between;">
+                            <span>Avg Latency</span>
+                            <span style="color: #10B981;">12ms</span>
+                        </div>
+                        <div style="display: flex; justify-content: space-between;">
+                            <span>P99 Latency</span>
+                            <span style="color: #F59E0B;">45ms</span>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+    with tab_strategy:
+        st.markdown("""
+        <div class="cdo-ai-pulse">
+            <div class="cdo-ai-header">
+                <div class="cdo-ai-title">❄️ Snowflake Intelligence Pulse</div>
+                <div class="cdo-ai-tag">AI LIVE</div>
+            </div>
+            <div class="cdo-ai-grid">
+                <div class="cdo-ai-card">
+                    <div class="cdo-ai-label">Model Accuracy</div>
+                    <div class="cdo-ai-value">92.4%</div>
+                    <div class="cdo-ai-sub">+0.6% vs last week</div>
+                </div>
+                <div class="cdo-ai-card">
+                    <div class="cdo-ai-label">Feature Freshness</div>
+                    <div class="cdo-ai-value">98.1%</div>
+                    <div class="cdo-ai-sub">Streaming feeds healthy</div>
+                </div>
+                <div class="cdo-ai-card">
+                    <div class="cdo-ai-label">Decision Velocity</div>
+                    <div class="cdo-ai-value">84 ms</div>
+                    <div class="cdo-ai-sub">Target &lt; 100 ms</div>
+                </div>
+                <div class="cdo-ai-card">
+                    <div class="cdo-ai-label">Drift Alerts</div>
+                    <div class="cdo-ai-value">3</div>
+                    <div class="cdo-ai-sub">2 resolved today</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">AI Executive Summary</div>', unsafe_allow_html=True)
+        if st.session_state.get('sf_highlights', True):
+            st.info("❄️ **Powered by Snowflake Cortex AI** — Summary synthesized from model performance, drift, and feature health telemetry.")
+        
+        with st.container(border=True):
+            st.markdown("""
+            **Executive Summary (Q1 2026):**
+            - Churn and upsell models are stable with **92%+ accuracy** across core segments.
+            - Drift signals are concentrated in **prepaid cohorts** and **regional devices**.
+            - Real-time scoring latency is **84 ms**, within the sub-100 ms target.
+            """)
+        
+        st.markdown('<div class="section-header">Signals & Insights</div>', unsafe_allow_html=True)
+        insight_cols = st.columns(3)
+        with insight_cols[0]:
+            st.markdown('<div class="section-header">Top Insights</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                - **Churn risk** elevated in top 3 urban clusters
+                - **Upsell lift** +12% in 5G-eligible segments
+                - **CLV growth** strongest in bundled households
+                """)
+        with insight_cols[1]:
+            st.markdown('<div class="section-header">Risk Signals</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                - **Feature drift** in device age and ARPU
+                - **Cold-start** risk for new prepaid activations
+                - **Data lag** in partner app events
+                """)
+        with insight_cols[2]:
+            st.markdown('<div class="section-header">Growth Signals</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                - **NBA adoption** up to 68% of agents
+                - **Campaign ROI** +1.8x vs baseline
+                - **Real-time scoring** expanding to web
+                """)
+        
+        st.markdown('<div class="section-header">AI-Powered Strategic Recommendations</div>', unsafe_allow_html=True)
+        action_cols = st.columns(3)
+        with action_cols[0]:
+            with st.container(border=True):
+                st.markdown("""
+                - **Reduce drift** with weekly retraining on prepaid cohorts
+                - Prioritize top 20 features by SHAP impact
+                """)
+        with action_cols[1]:
+            with st.container(border=True):
+                st.markdown("""
+                - **Scale NBA** across call center + digital channels
+                - Target 80% adoption by end of quarter
+                """)
+        with action_cols[2]:
+            with st.container(border=True):
+                st.markdown("""
+                - **Boost CLV** via bundle propensity campaigns
+                - Focus on households with 2+ lines
+                """)
+        
+        st.markdown('<div class="section-header">CDO Strategic Priorities — Q1 2026</div>', unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #DC2626; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 1</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Churn Reduction -20%</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - At-risk: **2,840** customers
+                - Intervention rate: **75%** target
+                - Revenue save: **£1.4M** projected
+                - Model accuracy: **87% → 90%**
+                """)
+        
+        with col2:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #F59E0B; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 2</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">NBA Adoption 80%</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **68%** agent adoption
+                - Integration: CRM + app push
+                - Conversion lift: **+12%** target
+                - Upsell revenue: **£480K** Q1
+                """)
+        
+        with col3:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #10B981; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 3</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Real-Time ML</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Batch → streaming inference
+                - Latency: **<100ms** predictions
+                - Use cases: fraud, NBA, pricing
+                - Launch: **March 2026**
+                """)
+        
+        st.markdown('<div class="section-header">Ask Snowflake Intelligence</div>', unsafe_allow_html=True)
+        
+        questions = [
+            "Show churn risk distribution by segment and device type.",
+            "Which features are driving the top 10% churn predictions?",
+            "What is the uplift from NBA recommendations by channel?",
+            "List customers with highest upsell propensity in the last 7 days.",
+            "Compare model accuracy for prepaid vs postpaid cohorts."
+        ]
+        
+        sf_intel_url = "https://ai.snowflake.com/sfseeurope/pjose_aws3"
+        
+        cols = st.columns(2)
+        for i, q in enumerate(questions):
+            with cols[i % 2]:
+                escaped_q = q.replace('"', '&quot;').replace("'", "&#39;")
+                st.markdown(f"""
+                <a href="{sf_intel_url}" target="_blank" onclick="navigator.clipboard.writeText('{escaped_q}')" style="text-decoration: none; color: inherit; display: block;">
+                    <div class="question-card">
+                        <p style="margin-bottom: 1.5rem;"><strong>Q{i+1}:</strong> "{q}"</p>
+                    </div>
+                </a>
+                """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div style="text-align: center; margin-top: 1rem; padding: 1rem; background: linear-gradient(135deg, #29B5E8 0%, #1A8BC4 100%); border-radius: 8px;">
+            <a href="{sf_intel_url}" target="_blank" style="color: white; text-decoration: none; font-weight: 600; font-size: 1rem;">
+                ❄️ Ask these questions in Snowflake Intelligence →
+            </a>
+        </div>
+        """, unsafe_allow_html=True)
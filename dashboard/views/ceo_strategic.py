@@ -0,0 +1,1089 @@
+"""CEO Strategic dashboard."""
+
+import streamlit as st
+import pandas as pd
+import altair as alt
+
+from dashboard import charts
+
+
+def render_ceo_strategic():
+    import pandas as pd
+    import altair as alt
+    
+    # CEO Header with Rising Stars Effect
+    st.markdown("""
+    <div class="ceo-header-wrap">
+        <div class="ceo-stars-bg">
+            <span class="ceo-star" style="left: 8%; bottom: 10%; animation-delay: 0s;">★</span>
+            <span class="ceo-star" style="left: 18%; bottom: 5%; animation-delay: 0.7s;">★</span>
+            <span class="ceo-star" style="left: 28%; bottom: 15%; animation-delay: 1.4s;">★</span>
+            <span class="ceo-star" style="left: 42%; bottom: 8%; animation-delay: 2.1s;">★</span>
+            <span class="ceo-star" style="left: 55%; bottom: 12%; animation-delay: 2.8s;">★</span>
+            <span class="ceo-star" style="left: 68%; bottom: 6%; animation-delay: 0.4s;">★</span>
+            <span class="ceo-star" style="left: 78%; bottom: 18%; animation-delay: 1.1s;">★</span>
+            <span class="ceo-star" style="left: 88%; bottom: 10%; animation-delay: 1.8s;">★</span>
+            <span class="ceo-sparkle" style="left: 15%; top: 25%; animation-delay: 0s;">✦</span>
+            <span class="ceo-sparkle" style="left: 50%; top: 20%; animation-delay: 0.8s;">✦</span>
+            <span class="ceo-sparkle" style="left: 85%; top: 30%; animation-delay: 1.6s;">✦</span>
+        </div>
+        <div class="ceo-header-content">
+            <h1>CEO Strategic Overview</h1>
+            <p>Overall Business Performance, Market Position & Strategic KPIs</p>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Dashboard Tabs
+    tab_performance, tab_market, tab_strategy = st.tabs(["📈 Performance", "🧭 Market & Customers", "🎯 Strategy & AI"])
+
+    with tab_performance:
+        
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['MOBILE', 'PORTING', 'NETWORK_OPS', 'MARKET_INTELLIGENCE']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+        
+        # STRATEGIC MOMENTUM TRACKER - Animated gauges showing progress toward targets
+        # CSS for the momentum tracker
+        
+        # HTML content for the momentum tracker
+        st.markdown("""<div class="momentum-tracker"><div class="tracker-header"><div class="tracker-title">📈 Strategic Momentum Tracker</div><div class="tracker-period">FY 2025-26 Progress</div></div><div class="gauges-container"><div class="gauge-item gauge-1"><div class="gauge-wrapper"><svg class="gauge-svg" viewBox="0 0 100 100"><circle class="gauge-bg" cx="50" cy="50" r="40"></circle><circle class="gauge-fill" cx="50" cy="50" r="40"></circle></svg><div class="gauge-center"><div class="gauge-value">82%</div></div></div><div class="gauge-label">Market Share</div><div class="gauge-target">Target: 7% → Current: 5.2%</div></div><div class="gauge-item gauge-2"><div class="gauge-wrapper"><svg class="gauge-svg" viewBox="0 0 100 100"><circle class="gauge-bg" cx="50" cy="50" r="40"></circle><circle class="gauge-fill" cx="50" cy="50" r="40"></circle></svg><div class="gauge-center"><div class="gauge-value">75%</div></div></div><div class="gauge-label">Revenue Target</div><div class="gauge-target">£89M of £120M goal</div></div><div class="gauge-item gauge-3"><div class="gauge-wrapper"><svg class="gauge-svg" viewBox="0 0 100 100"><circle class="gauge-bg" cx="50" cy="50" r="40"></circle><circle class="gauge-fill" cx="50" cy="50" r="40"></circle></svg><div class="gauge-center"><div class="gauge-value">65%</div></div></div><div class="gauge-label">5G Rollout</div><div class="gauge-target">325 of 500 sites</div></div><div class="gauge-item gauge-4"><div class="gauge-wrapper"><svg class="gauge-svg" viewBox="0 0 100 100"><circle class="gauge-bg" cx="50" cy="50" r="40"></circle><circle class="gauge-fill" cx="50" cy="50" r="40"></circle></svg><div class="gauge-center"><div class="gauge-value">90%</div></div></div><div class="gauge-label">NPS Goal</div><div class="gauge-target">+47 of +52 target</div></div></div></div>""", unsafe_allow_html=True)
+
+
+        st.markdown("""
+        <div class="exec-pulse">
+            <div class="exec-pulse-header">
+                <div class="exec-pulse-title">⚡ Executive Performance Pulse</div>
+                <div class="exec-pulse-badge">Real-time composite index</div>
+            </div>
+            <div class="exec-pulse-line">
+                <svg viewBox="0 0 520 80" preserveAspectRatio="none">
+                    <path class="pulse-line" d="M0,60 L60,58 L120,52 L180,48 L240,44 L300,38 L360,42 L420,30 L480,28 L520,24"></path>
+                    <path class="pulse-area" d="M0,60 L60,58 L120,52 L180,48 L240,44 L300,38 L360,42 L420,30 L480,28 L520,24 L520,80 L0,80 Z"></path>
+                </svg>
+            </div>
+            <div class="exec-pulse-grid">
+                <div class="exec-metric">
+                    <div class="exec-metric-label">Composite Score</div>
+                    <div class="exec-metric-value">86</div>
+                    <div class="exec-metric-delta">▲ +4 vs last month</div>
+                </div>
+                <div class="exec-metric">
+                    <div class="exec-metric-label">Revenue Momentum</div>
+                    <div class="exec-metric-value">+5.6%</div>
+                    <div class="exec-metric-delta">▲ +0.8% QoQ</div>
+                </div>
+                <div class="exec-metric">
+                    <div class="exec-metric-label">Net Adds</div>
+                    <div class="exec-metric-value">+142K</div>
+                    <div class="exec-metric-delta">▲ +12K QoQ</div>
+                </div>
+                <div class="exec-metric">
+                    <div class="exec-metric-label">Network QoE</div>
+                    <div class="exec-metric-value">4.2/5</div>
+                    <div class="exec-metric-delta">▲ +0.1 QoQ</div>
+                </div>
+            </div>
+            <div class="exec-rotator">
+                <div class="rotator-item"><span class="rotator-badge">Focus</span>5G expansion pacing ahead of plan — +12 sites this month</div>
+                <div class="rotator-item"><span class="rotator-badge">Risk</span>Prepaid churn up 0.3% in Yorkshire — target retention action</div>
+                <div class="rotator-item"><span class="rotator-badge">Upside</span>Enterprise pipeline conversion trending +6% QoQ</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # KPI CSS styles
+        
+        # Strategic KPI Cards Row 1
+        st.markdown('<div class="section-header">Strategic Performance Dashboard</div>', unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="ceo-kpi-grid">
+            <div class="ceo-kpi-card" style="--accent: #29B5E8;">
+                <div class="ceo-kpi-icon">📊</div>
+                <div class="ceo-kpi-label">Market Share</div>
+                <div class="ceo-kpi-value">5.2%</div>
+                <div class="ceo-kpi-delta positive">↑ +0.4% YoY</div>
+                <svg class="ceo-kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <path d="M0,35 L20,33 L40,30 L60,26 L80,22 L100,18" fill="none" stroke="#29B5E8" stroke-width="2"/>
+                    <path d="M0,35 L20,33 L40,30 L60,26 L80,22 L100,18 L100,40 L0,40 Z" fill="#29B5E8"/>
+                </svg>
+            </div>
+            <div class="ceo-kpi-card" style="--accent: #10B981;">
+                <div class="ceo-kpi-icon">🎯</div>
+                <div class="ceo-kpi-label">Strategic NPS</div>
+                <div class="ceo-kpi-value">+47</div>
+                <div class="ceo-kpi-delta positive">↑ +5 pts QoQ</div>
+                <svg class="ceo-kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <rect x="5" y="30" width="12" height="10" fill="#10B981"/>
+                    <rect x="22" y="26" width="12" height="14" fill="#10B981"/>
+                    <rect x="39" y="24" width="12" height="16" fill="#10B981"/>
+                    <rect x="56" y="20" width="12" height="20" fill="#10B981"/>
+                    <rect x="73" y="14" width="12" height="26" fill="#10B981"/>
+                </svg>
+            </div>
+            <div class="ceo-kpi-card" style="--accent: #8B5CF6;">
+                <div class="ceo-kpi-icon">⚔️</div>
+                <div class="ceo-kpi-label">Net Port-Ins</div>
+                <div class="ceo-kpi-value">+432</div>
+                <div class="ceo-kpi-delta positive">↑ vs -89 last Q</div>
+                <svg class="ceo-kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <path d="M0,28 L20,32 L40,25 L60,20 L80,15 L100,8" fill="none" stroke="#8B5CF6" stroke-width="2"/>
+                    <path d="M0,28 L20,32 L40,25 L60,20 L80,15 L100,8 L100,40 L0,40 Z" fill="#8B5CF6"/>
+                </svg>
+            </div>
+            <div class="ceo-kpi-card" style="--accent: #F59E0B;">
+                <div class="ceo-kpi-icon">📈</div>
+                <div class="ceo-kpi-label">Revenue Growth</div>
+                <div class="ceo-kpi-value">+8.4%</div>
+                <div class="ceo-kpi-delta positive">↑ vs 6.2% target</div>
+                <svg class="ceo-kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <path d="M0,32 L20,30 L40,26 L60,22 L80,16 L100,10" fill="none" stroke="#F59E0B" stroke-width="2"/>
+                    <path d="M0,32 L20,30 L40,26 L60,22 L80,16 L100,10 L100,40 L0,40 Z" fill="#F59E0B"/>
+                </svg>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown('<div class="section-header">Executive Growth & Margin Signals</div>', unsafe_allow_html=True)
+        perf_col1, perf_col2 = st.columns(2)
+        
+        with perf_col1:
+            st.markdown("**Revenue & EBITDA Margin Trend**")
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                margin_df = pd.DataFrame({
+                    'Month': months,
+                    'Revenue': [4.6, 4.7, 4.8, 5.0, 5.2, 5.4],
+                    'Margin': [20.8, 21.2, 21.6, 22.1, 22.4, 22.8]
+                })
+                base = alt.Chart(margin_df).encode(
+                    x=alt.X('Month:N', sort=months, title=None)
+                )
+                rev_line = base.mark_line(color='#10B981', strokeWidth=2).encode(
+                    y=alt.Y('Revenue:Q', title='Revenue (£M)'),
+                    tooltip=['Month:N', alt.Tooltip('Revenue:Q', format='.2f')]
+                )
+                margin_line = base.mark_line(color='#3B82F6', strokeWidth=2, strokeDash=[4, 3]).encode(
+                    y=alt.Y('Margin:Q', title='EBITDA Margin %'),
+                    tooltip=['Month:N', alt.Tooltip('Margin:Q', format='.1f')]
+                )
+                charts.altair_chart(
+                    alt.layer(rev_line, margin_line).resolve_scale(y='independent').properties(height=200),
+                    use_container_width=True
+                )
+        
+        with perf_col2:
+            st.markdown("**Cash Flow vs Capex**")
+            with st.container(border=True):
+                cash_df = pd.DataFrame({
+                    'Month': months,
+                    'Cash Flow': [0.9, 1.0, 1.1, 1.2, 1.3, 1.35],
+                    'Capex': [0.62, 0.65, 0.7, 0.74, 0.78, 0.82]
+                })
+                cash_long = cash_df.melt('Month', var_name='Type', value_name='Value')
+                cash_area = alt.Chart(cash_long).mark_area(opacity=0.5).encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('Value:Q', title='£M'),
+                    color=alt.Color('Type:N', scale=alt.Scale(range=['#22C55E', '#F59E0B'])),
+                    tooltip=['Month:N', 'Type:N', alt.Tooltip('Value:Q', format='.2f')]
+                ).properties(height=200)
+                charts.altair_chart(cash_area, use_container_width=True)
+
+        st.markdown('<div class="section-header">Product Mix Momentum</div>', unsafe_allow_html=True)
+        with st.container(border=True):
+            mix_df = pd.DataFrame({
+                'Month': months * 3,
+                'Product': ['Mobile'] * 6 + ['Broadband'] * 6 + ['Enterprise'] * 6,
+                'Share': [52, 52, 51, 50, 49, 48, 28, 27, 27, 26, 26, 25, 20, 21, 22, 24, 25, 27]
+            })
+            mix_area = alt.Chart(mix_df).mark_area(opacity=0.6).encode(
+                x=alt.X('Month:N', sort=months, title=None),
+                y=alt.Y('Share:Q', stack='normalize', title='Mix %'),
+                color=alt.Color('Product:N', scale=alt.Scale(range=['#29B5E8', '#10B981', '#8B5CF6'])),
+                tooltip=['Month:N', 'Product:N', alt.Tooltip('Share:Q', format='.0f')]
+            ).properties(height=200)
+            charts.altair_chart(mix_area, use_container_width=True)
+
+    with tab_market:
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['MOBILE', 'PORTING', 'NETWORK_OPS', 'MARKET_INTELLIGENCE']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+
+        st.markdown("""
+        <div class="market-pulse">
+            <div class="market-pulse-title">📊 Market Pulse — FY 2025-26</div>
+            <div class="market-pulse-sub">Share momentum, competitor movement, and customer sentiment in one view</div>
+            <div class="market-pulse-metrics">
+                <span>Market Share: 5.2% ▲</span>
+                <span>Net Port-Ins: +432</span>
+                <span>Overall NPS: +45</span>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown('<div class="section-header">Market Position</div>', unsafe_allow_html=True)
+
+        # Main dashboard layout
+        col_left, col_right = st.columns([1.2, 1])
+        
+        with col_left:
+            # UK Regional Market Share Map
+            st.markdown('<div class="section-header">UK Regional Performance</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                region_data = pd.DataFrame({
+                    'Region': ['London', 'South East', 'South West', 'Midlands', 'North West', 'North East', 'Yorkshire', 'Scotland', 'Wales', 'East'],
+                    'Market Share': [6.2, 5.8, 5.5, 4.8, 5.1, 4.2, 3.9, 4.5, 4.1, 5.3],
+                    'Subscribers': [6240, 4820, 3150, 4100, 3890, 2340, 2180, 1520, 980, 3027],
+                    'NPS': [52, 48, 51, 45, 44, 41, 38, 46, 43, 47],
+                    'Growth': ['+8.2%', '+6.1%', '+7.3%', '+5.2%', '+4.8%', '+3.1%', '+2.4%', '+5.5%', '+4.2%', '+6.8%'],
+                    'Latitude': [51.5, 51.3, 50.7, 52.5, 53.5, 54.9, 53.8, 56.0, 52.1, 52.2],
+                    'Longitude': [-0.1, 0.5, -3.5, -1.5, -2.5, -1.6, -1.5, -4.0, -3.8, 0.9]
+                })
+                
+                # Interactive horizontal bar chart with tooltips
+                bars = alt.Chart(region_data).mark_bar(
+                    cornerRadiusTopRight=6,
+                    cornerRadiusBottomRight=6
+                ).encode(
+                    x=alt.X('Market Share:Q', title='Market Share (%)', scale=alt.Scale(domain=[0, 8])),
+                    y=alt.Y('Region:N', sort='-x', title=None),
+                    color=alt.Color('Market Share:Q', 
+                        scale=alt.Scale(scheme='blues'),
+                        legend=None
+                    ),
+                    tooltip=[
+                        alt.Tooltip('Region:N'),
+                        alt.Tooltip('Market Share:Q', title='Share', format='.1f'),
+                        alt.Tooltip('Subscribers:Q', title='Subscribers', format=','),
+                        alt.Tooltip('NPS:Q', title='NPS'),
+                        alt.Tooltip('Growth:N', title='YoY Growth')
+                    ]
+                ).properties(height=320)
+                
+                # Add text labels
+                text = alt.Chart(region_data).mark_text(
+                    align='left',
+                    dx=5,
+                    fontSize=11,
+                    fontWeight='bold'
+                ).encode(
+                    x=alt.X('Market Share:Q'),
+                    y=alt.Y('Region:N', sort='-x'),
+                    text=alt.Text('Market Share:Q', format='.1f'),
+                    color=alt.value('#1B2A4E')
+                )
+                
+                charts.altair_chart(bars + text, use_container_width=True)
+                
+                # Regional insights
+                col_r1, col_r2 = st.columns(2)
+                with col_r1:
+                    st.markdown("""
+                    <div style="background: #D1FAE5; border-radius: 8px; padding: 0.75rem;">
+                        <strong style="color: #065F46; font-size: 0.85rem;">🏆 Top Regions</strong>
+                        <div style="color: #065F46; font-size: 0.8rem; margin-top: 0.3rem;">
+                            London: 6.2% share<br>
+                            South East: 5.8% share<br>
+                            South West: 5.5% share
+                        </div>
+                    </div>
+                    """, unsafe_allow_html=True)
+                with col_r2:
+                    st.markdown("""
+                    <div style="background: #FEE2E2; border-radius: 8px; padding: 0.75rem;">
+                        <strong style="color: #991B1B; font-size: 0.85rem;">⚠️ Focus Areas</strong>
+                        <div style="color: #991B1B; font-size: 0.8rem; margin-top: 0.3rem;">
+                            Yorkshire: 3.9% (NPS 38)<br>
+                            Wales: 4.1% (low subs)<br>
+                            North East: 4.2% share
+                        </div>
+                    </div>
+                    """, unsafe_allow_html=True)
+        
+        with col_right:
+            # Competitive Position - Market Intelligence
+            st.markdown('<div class="section-header">Competitive Landscape</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                competitor_data = pd.DataFrame({
+                    'Competitor': ['EE', 'O2', 'Vodafone', 'Three', 'SnowTelco', 'Others'],
+                    'Market Share': [28, 26, 22, 14, 5, 5],
+                    'YoY Change': [0.2, -1.1, 0.5, -0.8, 0.4, 0.8],
+                    'Trend': ['→', '↓', '→', '↓', '↑', '→']
+                })
+                
+                # Donut chart for market share
+                donut = alt.Chart(competitor_data).mark_arc(innerRadius=60, outerRadius=100, cornerRadius=3).encode(
+                    theta=alt.Theta('Market Share:Q', stack=True),
+                    color=alt.Color('Competitor:N',
+                        scale=alt.Scale(
+                            domain=['EE', 'O2', 'Vodafone', 'Three', 'SnowTelco', 'Others'],
+                            range=['#8B5CF6', '#3B82F6', '#EF4444', '#F59E0B', '#29B5E8', '#9CA3AF']
+                        ),
+                        legend=None
+                    ),
+                    tooltip=[
+                        alt.Tooltip('Competitor:N'),
+                        alt.Tooltip('Market Share:Q', title='Share (%)', format='d'),
+                        alt.Tooltip('YoY Change:Q', title='YoY Change', format='+.1f')
+                    ],
+                    order=alt.Order('Market Share:Q', sort='descending')
+                ).properties(height=200)
+                
+                charts.altair_chart(donut, use_container_width=True)
+                
+                # Legend with trends
+                st.markdown("""
+                <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 0.5rem; font-size: 0.85rem;">
+                    <div style="display: flex; align-items: center; gap: 0.5rem;">
+                        <span style="width: 12px; height: 12px; background: #8B5CF6; border-radius: 2px;"></span>
+                        <span>EE 28% →</span>
+                    </div>
+                    <div style="display: flex; align-items: center; gap: 0.5rem;">
+                        <span style="width: 12px; height: 12px; background: #3B82F6; border-radius: 2px;"></span>
+                        <span style="color: #DC2626;">O2 26% ↓</span>
+                    </div>
+                    <div style="display: flex; align-items: center; gap: 0.5rem;">
+                        <span style="width: 12px; height: 12px; background: #EF4444; border-radius: 2px;"></span>
+                        <span>Vodafone 22% →</span>
+                    </div>
+                    <div style="display: flex; align-items: center; gap: 0.5rem;">
+                        <span style="width: 12px; height: 12px; background: #F59E0B; border-radius: 2px;"></span>
+                        <span style="color: #DC2626;">Three 14% ↓</span>
+                    </div>
+                    <div style="display: flex; align-items: center; gap: 0.5rem;">
+                        <span style="width: 12px; height: 12px; background: #29B5E8; border-radius: 2px;"></span>
+                        <span style="color: #10B981; font-weight: 600;">SnowTelco 5% ↑</span>
+                    </div>
+                    <div style="display: flex; align-items: center; gap: 0.5rem;">
+                        <span style="width: 12px; height: 12px; background: #9CA3AF; border-radius: 2px;"></span>
+                        <span>Others 5%</span>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                st.markdown("""
+                <div style="background: linear-gradient(135deg, #E0F2FE 0%, #F0F9FF 100%); border-radius: 8px; padding: 0.75rem; margin-top: 1rem; border-left: 4px solid #29B5E8;">
+                    <strong style="color: #0369A1; font-size: 0.85rem;">🎯 Target: 7% by 2027</strong>
+                    <div style="color: #0369A1; font-size: 0.8rem; margin-top: 0.25rem;">+2% growth opportunity • £15M incremental revenue</div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            # Industry Benchmark Comparison
+            st.markdown('<div class="section-header">Industry Benchmark</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <div class="benchmark-legend">
+                    <div class="legend-item"><div class="legend-dot" style="background: linear-gradient(90deg, #29B5E8, #1A8BC4);"></div><span style="font-weight: 600; color: #1B2A4E;">SnowTelco</span></div>
+                    <div class="legend-item"><div class="legend-dot" style="background: #D1D5DB;"></div><span style="color: #6B7280;">Industry Avg</span></div>
+                </div>
+                
+                <div class="benchmark-row">
+                    <div class="benchmark-label">NPS Score</div>
+                    <div class="benchmark-bars">
+                        <div class="benchmark-bar-container">
+                            <div class="benchmark-bar-bg"><div class="benchmark-bar snowtelco" style="--fill-width: 72%;"></div></div>
+                            <div class="benchmark-value" style="color: #29B5E8;">72<span class="better-badge">+17</span></div>
+                        </div>
+                        <div class="benchmark-bar-container">
+                            <div class="benchmark-bar-bg"><div class="benchmark-bar industry" style="--fill-width: 55%;"></div></div>
+                            <div class="benchmark-value" style="color: #9CA3AF;">55</div>
+                        </div>
+                    </div>
+                </div>
+                
+                <div class="benchmark-row">
+                    <div class="benchmark-label">Churn Rate</div>
+                    <div class="benchmark-bars">
+                        <div class="benchmark-bar-container">
+                            <div class="benchmark-bar-bg"><div class="benchmark-bar snowtelco" style="--fill-width: 21%;"></div></div>
+                            <div class="benchmark-value" style="color: #29B5E8;">2.1%<span class="better-badge">Better</span></div>
+                        </div>
+                        <div class="benchmark-bar-container">
+                            <div class="benchmark-bar-bg"><div class="benchmark-bar industry" style="--fill-width: 28%;"></div></div>
+                            <div class="benchmark-value" style="color: #9CA3AF;">2.8%</div>
+                        </div>
+                    </div>
+                </div>
+                
+                <div class="benchmark-row">
+                    <div class="benchmark-label">ARPU</div>
+                    <div class="benchmark-bars">
+                        <div class="benchmark-bar-container">
+                            <div class="benchmark-bar-bg"><div class="benchmark-bar snowtelco" style="--fill-width: 78%;"></div></div>
+                            <div class="benchmark-value" style="color: #29B5E8;">£38<span class="better-badge">+£6</span></div>
+                        </div>
+                        <div class="benchmark-bar-container">
+                            <div class="benchmark-bar-bg"><div class="benchmark-bar industry" style="--fill-width: 64%;"></div></div>
+                            <div class="benchmark-value" style="color: #9CA3AF;">£32</div>
+                        </div>
+                    </div>
+                </div>
+                
+                <div class="benchmark-row">
+                    <div class="benchmark-label">5G Coverage</div>
+                    <div class="benchmark-bars">
+                        <div class="benchmark-bar-container">
+                            <div class="benchmark-bar-bg"><div class="benchmark-bar snowtelco" style="--fill-width: 67%;"></div></div>
+                            <div class="benchmark-value" style="color: #29B5E8;">67%</div>
+                        </div>
+                        <div class="benchmark-bar-container">
+                            <div class="benchmark-bar-bg"><div class="benchmark-bar industry" style="--fill-width: 72%;"></div></div>
+                            <div class="benchmark-value" style="color: #9CA3AF;">72%</div>
+                        </div>
+                    </div>
+                </div>
+                
+                <div class="benchmark-row">
+                    <div class="benchmark-label">Digital Sales</div>
+                    <div class="benchmark-bars">
+                        <div class="benchmark-bar-container">
+                            <div class="benchmark-bar-bg"><div class="benchmark-bar snowtelco" style="--fill-width: 45%;"></div></div>
+                            <div class="benchmark-value" style="color: #29B5E8;">45%<span class="better-badge">+7%</span></div>
+                        </div>
+                        <div class="benchmark-bar-container">
+                            <div class="benchmark-bar-bg"><div class="benchmark-bar industry" style="--fill-width: 38%;"></div></div>
+                            <div class="benchmark-value" style="color: #9CA3AF;">38%</div>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+        
+        st.markdown('<div class="section-header">Competitive Porting Analysis</div>', unsafe_allow_html=True)
+        with st.container(border=True):
+            porting_data = pd.DataFrame({
+                'Competitor': ['Three', 'Vodafone', 'EE', 'O2', 'Virgin', 'Sky'],
+                'Port-In': [245, 156, 98, 112, 67, 45],
+                'Port-Out': [78, 123, 143, 87, 42, 38]
+            })
+            porting_long = porting_data.melt('Competitor', var_name='Flow', value_name='Count')
+            porting_long['Count'] = porting_long.apply(
+                lambda row: row['Count'] if row['Flow'] == 'Port-In' else -row['Count'], axis=1
+            )
+            porting_long['Abs'] = porting_long['Count'].abs()
+            porting_chart = alt.Chart(porting_long).mark_bar(cornerRadius=4).encode(
+                x=alt.X('Count:Q', title='Net Porting', scale=alt.Scale(domain=[-260, 260])),
+                y=alt.Y('Competitor:N', sort=list(porting_data['Competitor']), title=None),
+                color=alt.Color('Flow:N', scale=alt.Scale(range=['#10B981', '#EF4444']), legend=alt.Legend(orient='bottom', title=None)),
+                tooltip=['Competitor:N', 'Flow:N', alt.Tooltip('Abs:Q', title='Customers')]
+            ).properties(height=240)
+            zero_rule = alt.Chart(pd.DataFrame({'x': [0]})).mark_rule(color='#CBD5F5').encode(x='x:Q')
+            charts.altair_chart(porting_chart + zero_rule, use_container_width=True)
+            col_p1, col_p2 = st.columns(2)
+            with col_p1:
+                st.markdown("""
+                <div style="background: #D1FAE5; border-radius: 20px; padding: 0.5rem 1rem; text-align: center;">
+                    <span style="color: #065F46; font-weight: 600;">Net: +432 customers</span>
+                </div>
+                """, unsafe_allow_html=True)
+            with col_p2:
+                st.markdown("""
+                <div style="background: #E0F2FE; border-radius: 20px; padding: 0.5rem 1rem; text-align: center;">
+                    <span style="color: #0369A1; font-weight: 600;">Three: +167 | EE: -45</span>
+                </div>
+                """, unsafe_allow_html=True)
+
+        st.markdown('<div class="section-header">Customer Health & Value</div>', unsafe_allow_html=True)
+
+        cust_left, cust_right = st.columns(2)
+        with cust_left:
+            st.markdown('<div class="section-header">NPS by Customer Segment</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                nps_data = pd.DataFrame({
+                    'Segment': ['Enterprise', 'SMB', 'Consumer Premium', 'Consumer Standard', 'Consumer Budget'],
+                    'NPS': [62, 51, 48, 42, 35],
+                    'Subscribers': [1200, 7874, 5200, 10500, 5473],
+                    'ARPU': [142, 58, 45, 32, 22],
+                    'Target': [65, 55, 50, 45, 40]
+                })
+                
+                # Lollipop chart for NPS
+                nps_line = alt.Chart(nps_data).mark_rule(strokeWidth=3).encode(
+                    y=alt.Y('Segment:N', sort='-x', title=None),
+                    x=alt.X('NPS:Q', title='NPS Score', scale=alt.Scale(domain=[0, 70])),
+                    color=alt.value('#E5E7EB')
+                )
+                
+                nps_point = alt.Chart(nps_data).mark_circle(size=200).encode(
+                    y=alt.Y('Segment:N', sort='-x'),
+                    x='NPS:Q',
+                    color=alt.Color('NPS:Q', scale=alt.Scale(
+                        domain=[30, 65],
+                        range=['#F59E0B', '#10B981']
+                    ), legend=None),
+                    tooltip=[
+                        alt.Tooltip('Segment:N'),
+                        alt.Tooltip('NPS:Q', title='NPS Score'),
+                        alt.Tooltip('Subscribers:Q', format=','),
+                        alt.Tooltip('ARPU:Q', title='ARPU (£)', format='d'),
+                        alt.Tooltip('Target:Q', title='Target NPS')
+                    ]
+                )
+                
+                # Target markers
+                target_mark = alt.Chart(nps_data).mark_tick(
+                    thickness=3,
+                    size=20,
+                    color='#DC2626'
+                ).encode(
+                    y=alt.Y('Segment:N', sort='-x'),
+                    x='Target:Q'
+                )
+                
+                charts.altair_chart(nps_line + nps_point + target_mark, use_container_width=True)
+                
+                st.markdown("""
+                <div style="display: flex; gap: 1rem; font-size: 0.8rem; color: #6B7280;">
+                    <span>● NPS Score</span>
+                    <span style="color: #DC2626;">| Target</span>
+                </div>
+                """, unsafe_allow_html=True)
+
+        with cust_right:
+            st.markdown('<div class="section-header">Churn Risk by Segment</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                churn_data = pd.DataFrame({
+                    'Segment': ['Enterprise', 'SMB', 'Consumer Premium', 'Consumer Standard', 'Consumer Budget'],
+                    'Churn Rate': [0.8, 1.4, 1.6, 2.1, 3.2],
+                    'At Risk': [10, 110, 83, 220, 175],
+                    'Revenue Impact': [14.2, 63.8, 37.4, 70.4, 38.5]
+                })
+                
+                churn_bars = alt.Chart(churn_data).mark_bar(
+                    cornerRadiusTopRight=6, cornerRadiusBottomRight=6
+                ).encode(
+                    x=alt.X('Churn Rate:Q', title='Churn Rate (%)', scale=alt.Scale(domain=[0, 4])),
+                    y=alt.Y('Segment:N', sort='-x', title=None),
+                    color=alt.Color('Churn Rate:Q', scale=alt.Scale(domain=[0, 4], range=['#10B981', '#F59E0B', '#EF4444']), legend=None),
+                    tooltip=[
+                        alt.Tooltip('Segment:N'),
+                        alt.Tooltip('Churn Rate:Q', title='Churn %', format='.1f'),
+                        alt.Tooltip('At Risk:Q', title='At Risk Customers'),
+                        alt.Tooltip('Revenue Impact:Q', title='Revenue at Risk (£K)', format='.1f')
+                    ]
+                ).properties(height=180)
+                
+                churn_text = alt.Chart(churn_data).mark_text(
+                    align='left', dx=5, fontSize=11, fontWeight='bold'
+                ).encode(
+                    x='Churn Rate:Q',
+                    y=alt.Y('Segment:N', sort='-x'),
+                    text=alt.Text('Churn Rate:Q', format='.1f'),
+                    color=alt.value('#1B2A4E')
+                )
+                
+                charts.altair_chart(churn_bars + churn_text, use_container_width=True)
+                
+                col_churn1, col_churn2 = st.columns(2)
+                with col_churn1:
+                    st.markdown("""
+                    <div style="background: #FEE2E2; border-radius: 8px; padding: 0.6rem; text-align: center;">
+                        <div style="font-size: 1.2rem; font-weight: 700; color: #DC2626;">598</div>
+                        <div style="font-size: 0.7rem; color: #991B1B;">At-Risk Customers</div>
+                    </div>
+                    """, unsafe_allow_html=True)
+                with col_churn2:
+                    st.markdown("""
+                    <div style="background: #FEF3C7; border-radius: 8px; padding: 0.6rem; text-align: center;">
+                        <div style="font-size: 1.2rem; font-weight: 700; color: #92400E;">£224K</div>
+                        <div style="font-size: 0.7rem; color: #92400E;">Monthly Revenue at Risk</div>
+                    </div>
+                    """, unsafe_allow_html=True)
+
+        st.markdown('<div class="section-header">Acquisition & Engagement Signals</div>', unsafe_allow_html=True)
+        acq_col1, acq_col2 = st.columns(2)
+        
+        with acq_col1:
+            st.markdown("**Acquisition Channel Mix**")
+            with st.container(border=True):
+                channel_df = pd.DataFrame({
+                    'Channel': ['Digital', 'Retail', 'Partner', 'Referral'],
+                    'Share': [44, 22, 18, 16]
+                })
+                channel_arc = alt.Chart(channel_df).mark_arc(innerRadius=50).encode(
+                    theta=alt.Theta('Share:Q', title=None),
+                    color=alt.Color('Channel:N', legend=alt.Legend(orient='bottom', title=None)),
+                    tooltip=['Channel:N', alt.Tooltip('Share:Q', format='.0f')]
+                ).properties(height=200)
+                charts.altair_chart(channel_arc, use_container_width=True)
+        
+        with acq_col2:
+            st.markdown("**Cohort Retention Curve**")
+            with st.container(border=True):
+                cohort_df = pd.DataFrame({
+                    'Month': ['M0', 'M1', 'M2', 'M3', 'M4', 'M5', 'M6'],
+                    'Retention': [100, 94, 90, 87, 84, 82, 80]
+                })
+                cohort_line = alt.Chart(cohort_df).mark_line(point=True, color='#6366F1', strokeWidth=2).encode(
+                    x=alt.X('Month:N', title=None),
+                    y=alt.Y('Retention:Q', title='Retention %'),
+                    tooltip=['Month:N', alt.Tooltip('Retention:Q', format='.0f')]
+                ).properties(height=200)
+                charts.altair_chart(cohort_line, use_container_width=True)
+
+        st.markdown('<div class="section-header">Sentiment & Brand Momentum</div>', unsafe_allow_html=True)
+        sent_col1, sent_col2 = st.columns(2)
+        
+        with sent_col1:
+            st.markdown("**Brand Sentiment Split**")
+            with st.container(border=True):
+                sent_df = pd.DataFrame({
+                    'Sentiment': ['Positive', 'Neutral', 'Negative'],
+                    'Share': [62, 26, 12]
+                })
+                sent_bar = alt.Chart(sent_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Share:Q', title='Share %'),
+                    y=alt.Y('Sentiment:N', sort='-x', title=None),
+                    color=alt.value('#10B981'),
+                    tooltip=['Sentiment:N', alt.Tooltip('Share:Q', format='.0f')]
+                ).properties(height=200)
+                charts.altair_chart(sent_bar, use_container_width=True)
+        
+        with sent_col2:
+            st.markdown("**Brand Awareness Trend**")
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                awareness_df = pd.DataFrame({
+                    'Month': months,
+                    'Awareness': [61, 62, 63, 65, 66, 68]
+                })
+                aware_line = alt.Chart(awareness_df).mark_line(point=True, color='#F59E0B', strokeWidth=2).encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('Awareness:Q', title='Awareness %'),
+                    tooltip=['Month:N', alt.Tooltip('Awareness:Q', format='.0f')]
+                ).properties(height=200)
+                charts.altair_chart(aware_line, use_container_width=True)
+
+        # Revenue & Subscriber Trends
+        st.markdown('<div class="section-header">Revenue & Subscriber Performance — 12 Month Trend</div>', unsafe_allow_html=True)
+        
+        with st.container(border=True):
+            trend_data = pd.DataFrame({
+                'Month': ['Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan'],
+                'Month_Num': list(range(1, 13)),
+                'Revenue': [4.2, 4.35, 4.48, 4.52, 4.61, 4.78, 4.85, 4.92, 5.05, 5.18, 5.32, 5.48],
+                'Subscribers': [28.5, 28.9, 29.2, 29.6, 30.1, 30.4, 30.8, 31.1, 31.5, 31.9, 32.2, 32.4],
+                'ARPU': [38.2, 38.5, 39.1, 39.4, 39.8, 40.2, 40.5, 40.8, 41.2, 41.6, 42.0, 42.3]
+            })
+            
+            col_t1, col_t2 = st.columns([2, 1])
+            
+            with col_t1:
+                base = alt.Chart(trend_data).encode(
+                    x=alt.X('Month:N', sort=list(trend_data['Month']), title=None,
+                           axis=alt.Axis(labelAngle=0))
+                )
+                
+                revenue_line = base.mark_line(
+                    color='#29B5E8', strokeWidth=3, point=alt.OverlayMarkDef(filled=True, size=60)
+                ).encode(
+                    y=alt.Y('Revenue:Q', title='Revenue (£M)', scale=alt.Scale(domain=[4, 6])),
+                    tooltip=[alt.Tooltip('Month:N'), alt.Tooltip('Revenue:Q', title='Revenue (£M)', format='.2f')]
+                )
+                
+                revenue_area = base.mark_area(
+                    color='#29B5E8', opacity=0.1
+                ).encode(y='Revenue:Q')
+                
+                subscriber_line = base.mark_line(
+                    color='#10B981', strokeWidth=3, strokeDash=[5,3], point=alt.OverlayMarkDef(filled=True, size=60)
+                ).encode(
+                    y=alt.Y('Subscribers:Q', title='Subscribers (K)', scale=alt.Scale(domain=[28, 34])),
+                    tooltip=[alt.Tooltip('Month:N'), alt.Tooltip('Subscribers:Q', title='Subscribers (K)', format='.1f')]
+                )
+                
+                chart = alt.layer(revenue_area, revenue_line).resolve_scale(y='independent').properties(height=250)
+                chart2 = subscriber_line.properties(height=250)
+                
+                final_chart = alt.layer(
+                    revenue_area, revenue_line, subscriber_line
+                ).resolve_scale(y='independent').properties(height=250)
+                
+                charts.altair_chart(final_chart, use_container_width=True)
+                
+                st.markdown("""
+                <div style="display: flex; gap: 2rem; font-size: 0.85rem; justify-content: center;">
+                    <span><span style="color: #29B5E8;">━━</span> Revenue (£M)</span>
+                    <span><span style="color: #10B981;">╌╌</span> Subscribers (K)</span>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col_t2:
+                st.markdown("""
+                <div style="background: linear-gradient(135deg, #E0F2FE 0%, #F0F9FF 100%); border-radius: 12px; padding: 1rem; margin-bottom: 0.75rem;">
+                    <div style="font-size: 0.75rem; color: #6B7280; text-transform: uppercase;">Revenue YTD</div>
+                    <div style="font-size: 1.75rem; font-weight: 700; color: #0369A1;">£5.48M</div>
+                    <div style="color: #10B981; font-size: 0.85rem; font-weight: 600;">↑ +30.5% YoY</div>
+                </div>
+                <div style="background: linear-gradient(135deg, #D1FAE5 0%, #ECFDF5 100%); border-radius: 12px; padding: 1rem; margin-bottom: 0.75rem;">
+                    <div style="font-size: 0.75rem; color: #6B7280; text-transform: uppercase;">Subscriber Base</div>
+                    <div style="font-size: 1.75rem; font-weight: 700; color: #065F46;">32.4K</div>
+                    <div style="color: #10B981; font-size: 0.85rem; font-weight: 600;">↑ +13.7% YoY</div>
+                </div>
+                <div style="background: linear-gradient(135deg, #FEF3C7 0%, #FFFBEB 100%); border-radius: 12px; padding: 1rem;">
+                    <div style="font-size: 0.75rem; color: #6B7280; text-transform: uppercase;">Avg ARPU</div>
+                    <div style="font-size: 1.75rem; font-weight: 700; color: #92400E;">£42.30</div>
+                    <div style="color: #10B981; font-size: 0.85rem; font-weight: 600;">↑ +10.7% YoY</div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        # Network Health & Customer Journey
+        col_net, col_funnel = st.columns(2)
+        
+        with col_net:
+            st.markdown('<div class="section-header">Network Performance Health</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                network_metrics = pd.DataFrame({
+                    'Metric': ['Network Uptime', '5G Coverage', 'Avg Latency', 'Call Quality', 'Data Speed'],
+                    'Value': [99.7, 78, 92, 96, 85],
+                    'Target': [99.9, 85, 95, 98, 90],
+                    'Status': ['On Track', 'Below', 'On Track', 'On Track', 'Below']
+                })
+                
+                bars = alt.Chart(network_metrics).mark_bar(
+                    cornerRadiusTopRight=6, cornerRadiusBottomRight=6
+                ).encode(
+                    x=alt.X('Value:Q', title='Score (%)', scale=alt.Scale(domain=[0, 100])),
+                    y=alt.Y('Metric:N', sort='-x', title=None),
+                    color=alt.condition(
+                        alt.datum.Value >= alt.datum.Target,
+                        alt.value('#10B981'),
+                        alt.value('#F59E0B')
+                    ),
+                    tooltip=[
+                        alt.Tooltip('Metric:N'),
+                        alt.Tooltip('Value:Q', title='Current'),
+                        alt.Tooltip('Target:Q', title='Target'),
+                        alt.Tooltip('Status:N')
+                    ]
+                ).properties(height=200)
+                
+                target_rule = alt.Chart(network_metrics).mark_tick(
+                    color='#DC2626', thickness=3, size=20
+                ).encode(
+                    x='Target:Q',
+                    y=alt.Y('Metric:N', sort='-x')
+                )
+                
+                charts.altair_chart(bars + target_rule, use_container_width=True)
+                
+                st.markdown("""
+                <div style="display: flex; gap: 1rem; font-size: 0.8rem; color: #6B7280;">
+                    <span style="color: #10B981;">● On Target</span>
+                    <span style="color: #F59E0B;">● Below Target</span>
+                    <span style="color: #DC2626;">| Target Line</span>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col_funnel:
+            st.markdown('<div class="section-header">Customer Journey Funnel</div>', unsafe_allow_html=True)
+            
+            # Funnel animation styles
+            
+            with st.container(border=True):
+                funnel_data = pd.DataFrame({
+                    'Stage': ['Website Visits', 'Plan Views', 'Sim Selection', 'Checkout', 'Activated'],
+                    'Count': [45000, 18500, 8200, 3100, 2480],
+                    'Rate': ['100%', '41%', '18%', '7%', '5.5%'],
+                    'Order': [1, 2, 3, 4, 5]
+                })
+                
+                funnel = alt.Chart(funnel_data).mark_bar(
+                    cornerRadius=4
+                ).encode(
+                    y=alt.Y('Stage:N', sort=alt.EncodingSortField(field='Order', order='ascending'), title=None),
+                    x=alt.X('Count:Q', title='Users', scale=alt.Scale(type='log')),
+                    color=alt.Color('Order:Q', scale=alt.Scale(scheme='blues', reverse=True), legend=None),
+                    tooltip=[
+                        alt.Tooltip('Stage:N'),
+                        alt.Tooltip('Count:Q', format=','),
+                        alt.Tooltip('Rate:N', title='Conversion')
+                    ]
+                ).properties(height=200)
+                
+                text = alt.Chart(funnel_data).mark_text(
+                    align='left', dx=5, fontSize=11, fontWeight='bold'
+                ).encode(
+                    y=alt.Y('Stage:N', sort=alt.EncodingSortField(field='Order', order='ascending')),
+                    x='Count:Q',
+                    text='Rate:N',
+                    color=alt.value('#1B2A4E')
+                )
+                
+                charts.altair_chart(funnel + text, use_container_width=True)
+                
+                st.markdown("""
+                <div class="funnel-opportunity">
+                    <strong style="color: #92400E; font-size: 0.85rem;">🎯 Opportunity</strong>
+                    <div style="color: #92400E; font-size: 0.8rem; margin-top: 0.25rem;">
+                        Checkout drop-off: <span class="highlight-value">62%</span> | <span class="highlight-value">£1.2M</span> potential if improved to 50%
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        # Customer Overview Section
+        st.markdown('<div class="section-header">Customer Overview</div>', unsafe_allow_html=True)
+        
+        cust_kpi_cols = st.columns(4)
+        
+        with cust_kpi_cols[0]:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="text-align: center;">
+                    <div style="font-size: 0.75rem; color: #6B7280; margin-bottom: 0.25rem;">Total Customers</div>
+                    <div style="font-size: 1.6rem; font-weight: 700; color: #1B2A4E;">103,504</div>
+                    <div style="font-size: 0.8rem; margin-top: 0.25rem;">
+                        <span style="color: #29B5E8;">B2C: 100,800</span> • <span style="color: #10B981;">B2B: 2,704</span>
+                    </div>
+                    <div style="font-size: 0.7rem; color: #10B981; margin-top: 0.25rem;">▲ 2.4% YoY</div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with cust_kpi_cols[1]:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="text-align: center;">
+                    <div style="font-size: 0.75rem; color: #6B7280; margin-bottom: 0.25rem;">Net Customer Growth</div>
+                    <div style="font-size: 1.6rem; font-weight: 700; color: #10B981;">+1,842</div>
+                    <div style="font-size: 0.8rem; margin-top: 0.25rem;">
+                        <span style="color: #10B981;">Adds: 3,240</span> • <span style="color: #DC2626;">Churn: 1,398</span>
+                    </div>
+                    <div style="font-size: 0.7rem; color: #10B981; margin-top: 0.25rem;">▲ 18% vs target</div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with cust_kpi_cols[2]:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="text-align: center;">
+                    <div style="font-size: 0.75rem; color: #6B7280; margin-bottom: 0.25rem;">Overall NPS</div>
+                    <div style="font-size: 1.6rem; font-weight: 700; color: #29B5E8;">+45</div>
+                    <div style="font-size: 0.8rem; margin-top: 0.25rem;">
+                        <span style="color: #29B5E8;">B2C: +42</span> • <span style="color: #10B981;">B2B: +58</span>
+                    </div>
+                    <div style="font-size: 0.7rem; color: #10B981; margin-top: 0.25rem;">▲ 3 pts vs Q4</div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with cust_kpi_cols[3]:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="text-align: center;">
+                    <div style="font-size: 0.75rem; color: #6B7280; margin-bottom: 0.25rem;">Revenue per Customer</div>
+                    <div style="font-size: 1.6rem; font-weight: 700; color: #1B2A4E;">£42.80</div>
+                    <div style="font-size: 0.8rem; margin-top: 0.25rem;">
+                        <span style="color: #29B5E8;">B2C: £38</span> • <span style="color: #10B981;">B2B: £142</span>
+                    </div>
+                    <div style="font-size: 0.7rem; color: #10B981; margin-top: 0.25rem;">▲ 1.8% YoY</div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        # Customer Growth Trend and Segment Split
+        growth_col, split_col = st.columns(2)
+        
+        with growth_col:
+            st.markdown("**Customer Base Trend (12 Months)**")
+            with st.container(border=True):
+                # Customer growth trend data (net adds to show movement clearly)
+                trend_months = pd.DataFrame({
+                    'Month': ['Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan'],
+                    'Month_Num': list(range(1, 13)),
+                    'Customers': [101.0, 101.3, 101.6, 101.9, 102.2, 102.5, 102.8, 103.0, 103.2, 103.3, 103.4, 103.5]
+                })
+                trend_months['Net_Adds_K'] = (trend_months['Customers'] - trend_months['Customers'].iloc[0]).round(2)
+                
+                area_chart = alt.Chart(trend_months).mark_area(
+                    color='#29B5E8',
+                    opacity=0.3,
+                    line={'color': '#29B5E8', 'strokeWidth': 2}
+                ).encode(
+                    x=alt.X('Month:N', sort=list(trend_months['Month']), title=None, axis=alt.Axis(labelAngle=0)),
+                    y=alt.Y(
+                        'Net_Adds_K:Q',
+                        title=None,
+                        scale=alt.Scale(domain=[0, 3], zero=True),
+                        axis=alt.Axis(format='.1f', tickCount=4)
+                    ),
+                    tooltip=[alt.Tooltip('Month:N'), alt.Tooltip('Net_Adds_K:Q', title='Net Adds (K)', format='.2f')]
+                ).properties(height=180)
+                
+                points = alt.Chart(trend_months).mark_circle(color='#29B5E8', size=40).encode(
+                    x=alt.X('Month:N', sort=list(trend_months['Month'])),
+                    y=alt.Y('Net_Adds_K:Q', scale=alt.Scale(domain=[0, 3], zero=True))
+                )
+                
+                charts.altair_chart(area_chart + points, use_container_width=True)
+                st.caption("Net Adds (K) vs Feb baseline")
+                st.markdown('<div style="text-align: center; font-size: 0.75rem; color: #10B981;">Steady growth trajectory • +2,504 net adds in 12 months</div>', unsafe_allow_html=True)
+        
+        with split_col:
+            st.markdown("**Revenue by Customer Segment**")
+            with st.container(border=True):
+                # Revenue split data
+                revenue_split = pd.DataFrame({
+                    'Segment': ['B2C', 'B2B'],
+                    'Revenue': [38.4, 14.8],
+                    'Percentage': ['72%', '28%']
+                })
+                
+                donut = alt.Chart(revenue_split).mark_arc(innerRadius=35, outerRadius=55).encode(
+                    theta=alt.Theta('Revenue:Q', stack=True),
+                    color=alt.Color('Segment:N', scale=alt.Scale(domain=['B2C', 'B2B'], range=['#29B5E8', '#10B981']), legend=None),
+                    tooltip=[alt.Tooltip('Segment:N'), alt.Tooltip('Revenue:Q', title='Revenue (£M)', format='.1f'), alt.Tooltip('Percentage:N')]
+                ).properties(height=130)
+                
+                col_chart, col_legend = st.columns([1, 1])
+                with col_chart:
+                    charts.altair_chart(donut, use_container_width=True)
+                with col_legend:
+                    st.markdown("""
+                    <div style="font-size: 0.85rem; padding-top: 1rem;">
+                        <div style="margin-bottom: 0.5rem;">
+                            <span style="display: inline-block; width: 12px; height: 12px; background: #29B5E8; border-radius: 2px; margin-right: 0.5rem;"></span>
+                            <strong>B2C:</strong> £38.4M (72%)
+                        </div>
+                        <div>
+                            <span style="display: inline-block; width: 12px; height: 12px; background: #10B981; border-radius: 2px; margin-right: 0.5rem;"></span>
+                            <strong>B2B:</strong> £14.8M (28%)
+                        </div>
+                        <div style="margin-top: 0.5rem; font-size: 0.75rem; color: #6B7280;">
+                            Total: £53.2M monthly
+                        </div>
+                    </div>
+                    """, unsafe_allow_html=True)
+        
+    with tab_strategy:
+        st.markdown('<div class="section-header">🤖 AI-Generated Executive Briefing</div>', unsafe_allow_html=True)
+        
+        if st.session_state.get('sf_highlights', True):
+            st.info("❄️ **Powered by Snowflake Cortex AI** — This summary is generated using CORTEX.COMPLETE() analyzing real-time data across all business units")
+        
+        with st.container(border=True):
+            summary_cols = st.columns([2, 1])
+            
+            with summary_cols[0]:
+                st.markdown("""
+                ### 📋 Today's Key Insights
+                
+                **Financial Performance:** Revenue grew 4.2% YoY to £4.24B, with EBITDA margin improving 
+                to 33.5%. Mobile services remain the primary growth driver (+5.8%), while fixed-line 
+                continues gradual decline (-2.1%).
+                
+                **Customer Health:** Net subscriber growth of +142K this quarter, but churn increased 
+                slightly to 1.2%. High-value segment shows strongest retention (0.8% churn), while 
+                prepaid segment needs attention (2.4% churn).
+                
+                **Network Performance:** 5G coverage expanded to 68% of population. Network quality 
+                scores improved with 99.2% availability. Customer experience scores at 4.2/5.0 for 
+                network satisfaction.
+                
+                **Risks & Opportunities:**
+                - ⚠️ **Watch:** Competitive pressure in business segment from new market entrants
+                - ✅ **Opportunity:** Data monetisation revenue up 22% — accelerate partner ecosystem
+                - 📈 **Trending:** 5G enterprise adoption growing faster than consumer
+                """)
+            
+            with summary_cols[1]:
+                st.markdown("**Quick Actions**")
+                
+                with st.container(border=True):
+                    st.markdown("🔴 **Urgent**")
+                    st.caption("Review Q1 churn spike in prepaid segment")
+                    st.button("Open Analysis →", key="action1", use_container_width=True)
+                
+                with st.container(border=True):
+                    st.markdown("🟡 **This Week**")
+                    st.caption("Approve 5G expansion business case for Phase 3")
+                    st.button("View Document →", key="action2", use_container_width=True)
+                
+                with st.container(border=True):
+                    st.markdown("🟢 **FYI**")
+                    st.caption("NPS score reached all-time high of +42")
+                    st.button("See Details →", key="action3", use_container_width=True)
+
+        st.markdown('<div class="section-header">CEO Strategic Priorities — Q1 2026</div>', unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #DC2626; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 1</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Accelerate Yorkshire Recovery</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Lowest NPS (38) and market share (3.9%)
+                - Network investment: £2.5M approved
+                - Target: +10 NPS points by Q3
+                - Expected subscriber growth: +800
+                """)
+        
+        with col2:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #F59E0B; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 2</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Capitalize on Three Weakness</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - +167 net port-ins from Three
+                - Their network issues are persistent
+                - Launch targeted win-back campaign
+                - Target: 500 additional converts
+                """)
+        
+        with col3:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #10B981; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 3</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Enterprise Segment Growth</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Highest NPS (62) & ARPU (£142)
+                - Only 4% of base, 12% of revenue
+                - Expand enterprise sales team
+                - Target: +200 accounts, £2.8M revenue
+                """)
+        
+        # Ask Intelligence Section
+        st.markdown('<div class="section-header">Ask Snowflake Intelligence</div>', unsafe_allow_html=True)
+        
+        questions = [
+            "Give me an executive summary of SnowTelco's current performance - subscribers, ARPU, and NPS by segment.",
+            "Show me our port-in versus port-out analysis - which competitors are we winning/losing customers?",
+            "What are our top network quality issues affecting customer satisfaction?",
+            "Compare our performance against main competitors - market share, satisfaction, quality.",
+            "Based on all data, what are the 3 most critical strategic priorities this quarter?"
+        ]
+        
+        sf_intel_url = "https://ai.snowflake.com/sfseeurope/pjose_aws3"
+        
+        cols = st.columns(2)
+        for i, q in enumerate(questions):
+            with cols[i % 2]:
+                escaped_q = q.replace('"', '&quot;').replace("'", "&#39;")
+                st.markdown(f"""
+                <a href="{sf_intel_url}" target="_blank" onclick="navigator.clipboard.writeText('{escaped_q}')" style="text-decoration: none; color: inherit; display: block;">
+                    <div class="question-card">
+                        <p style="margin-bottom: 1.5rem;"><strong>Q{i+1}:</strong> "{q}"</p>
+                    </div>
+                </a>
+                """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div style="text-align: center; margin-top: 1rem; padding: 1rem; background: linear-gradient(135deg, #29B5E8 0%, #1A8BC4 100%); border-radius: 8px;">
+            <a href="{sf_intel_url}" target="_blank" style="color: white; text-decoration: none; font-weight: 600; font-size: 1rem;">
+                ❄️ Ask these questions in Snowflake Intelligence →
+            </a>
+        </div>
+        """, unsafe_allow_html=True)
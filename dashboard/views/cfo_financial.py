@@ -0,0 +1,947 @@
+"""CFO Finance dashboard."""
+
+import streamlit as st
+import pandas as pd
+import altair as alt
+
+from dashboard import charts
+from dashboard.fragments import fragment
+
+
+def render_cfo_financial():
+    import pandas as pd
+    import altair as alt
+    
+    # CFO Header with Floating Coins Effect
+    st.markdown("""
+    <div class="cfo-header-wrap">
+        <div class="cfo-coins-bg">
+            <span class="cfo-coin" style="left: 5%; top: -10%; animation-delay: 0s;">💰</span>
+            <span class="cfo-coin" style="left: 15%; top: -15%; animation-delay: 0.8s;">💵</span>
+            <span class="cfo-coin" style="left: 28%; top: -5%; animation-delay: 1.6s;">💰</span>
+            <span class="cfo-coin" style="left: 40%; top: -20%; animation-delay: 2.4s;">💷</span>
+            <span class="cfo-coin" style="left: 55%; top: -8%; animation-delay: 3.2s;">💰</span>
+            <span class="cfo-coin" style="left: 68%; top: -12%; animation-delay: 0.4s;">💵</span>
+            <span class="cfo-coin" style="left: 80%; top: -18%; animation-delay: 1.2s;">💰</span>
+            <span class="cfo-coin" style="left: 92%; top: -6%; animation-delay: 2s;">💷</span>
+            <div class="cfo-shine" style="left: 20%; top: 30%;"></div>
+            <div class="cfo-shine" style="left: 60%; top: 50%; animation-delay: 0.7s;"></div>
+            <div class="cfo-shine" style="left: 80%; top: 25%; animation-delay: 1.4s;"></div>
+        </div>
+        <div class="cfo-header-content">
+            <h1>CFO Financial Dashboard</h1>
+            <p>Revenue, Profitability, Cash Flow & Financial Performance</p>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Dashboard Tabs
+    tab_overview, tab_ops, tab_strategy = st.tabs(["📊 Overview & Analysis", "💼 Financial Operations", "❄️ Snowflake Intelligence"])
+
+    with tab_overview:
+        
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['FINANCE', 'BILLING', 'MOBILE', 'SALES']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+        
+        # CFO REVENUE FLOW ANIMATION
+        st.markdown("""<div class="cfo-flow"><div class="cfo-header"><div class="cfo-title">💰 Revenue Flow Monitor</div><div class="cfo-status">● Healthy Cash Flow</div></div><div class="revenue-streams"><div class="stream-pipe"><div class="stream-flow"></div></div><div class="stream-pipe"><div class="stream-flow" style="animation-delay:0.3s"></div></div><div class="stream-pipe"><div class="stream-flow" style="animation-delay:0.6s"></div></div><div class="stream-pipe"><div class="stream-flow" style="animation-delay:0.9s"></div></div></div><div class="cfo-metrics"><div class="cfo-metric"><div class="cfo-val">£7.4M</div><div class="cfo-label">Monthly Revenue</div></div><div class="cfo-metric"><div class="cfo-val">23.1%</div><div class="cfo-label">Gross Margin</div></div><div class="cfo-metric"><div class="cfo-val">£2.1M</div><div class="cfo-label">Operating Cash</div></div><div class="cfo-metric"><div class="cfo-val">98.2%</div><div class="cfo-label">Collection Rate</div></div></div></div>""", unsafe_allow_html=True)
+        
+        
+        st.markdown('<div class="section-header">Financial Performance Overview</div>', unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #10B981;">
+                <div class="kpi-icon">💰</div>
+                <div class="kpi-label">Total Revenue</div>
+                <div class="kpi-value">£65.8M</div>
+                <div class="kpi-delta positive">↑ +12.4% YoY</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <path d="M0,35 L20,32 L40,28 L60,24 L80,18 L100,12" fill="none" stroke="#10B981" stroke-width="2"/>
+                    <path d="M0,35 L20,32 L40,28 L60,24 L80,18 L100,12 L100,40 L0,40 Z" fill="#10B981"/>
+                </svg>
+            </div>
+            <div class="kpi-card" style="--accent: #8B5CF6;">
+                <div class="kpi-icon">📊</div>
+                <div class="kpi-label">EBITDA</div>
+                <div class="kpi-value">£18.2M</div>
+                <div class="kpi-delta positive">↑ 27.6% margin</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <rect x="5" y="32" width="12" height="8" fill="#8B5CF6"/>
+                    <rect x="22" y="28" width="12" height="12" fill="#8B5CF6"/>
+                    <rect x="39" y="24" width="12" height="16" fill="#8B5CF6"/>
+                    <rect x="56" y="20" width="12" height="20" fill="#8B5CF6"/>
+                    <rect x="73" y="14" width="12" height="26" fill="#8B5CF6"/>
+                </svg>
+            </div>
+            <div class="kpi-card" style="--accent: #29B5E8;">
+                <div class="kpi-icon">💵</div>
+                <div class="kpi-label">Free Cash Flow</div>
+                <div class="kpi-value">£8.4M</div>
+                <div class="kpi-delta positive">↑ +18.2% QoQ</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <path d="M0,30 L20,28 L40,32 L60,24 L80,20 L100,14" fill="none" stroke="#29B5E8" stroke-width="2"/>
+                    <path d="M0,30 L20,28 L40,32 L60,24 L80,20 L100,14 L100,40 L0,40 Z" fill="#29B5E8"/>
+                </svg>
+            </div>
+            <div class="kpi-card" style="--accent: #F59E0B;">
+                <div class="kpi-icon">📈</div>
+                <div class="kpi-label">Billing Efficiency</div>
+                <div class="kpi-value">98.2%</div>
+                <div class="kpi-delta positive">↑ +1.1% vs target</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <path d="M0,28 L20,26 L40,24 L60,22 L80,18 L100,16" fill="none" stroke="#F59E0B" stroke-width="2"/>
+                    <path d="M0,28 L20,26 L40,24 L60,22 L80,18 L100,16 L100,40 L0,40 Z" fill="#F59E0B"/>
+                </svg>
+            </div>
+        </div>
+        
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #EC4899;">
+                <div class="kpi-icon">👥</div>
+                <div class="kpi-label">ARPU (Consumer)</div>
+                <div class="kpi-value">£32.40</div>
+                <div class="kpi-delta positive">↑ +£2.10 YoY</div>
+            </div>
+            <div class="kpi-card" style="--accent: #14B8A6;">
+                <div class="kpi-icon">🏢</div>
+                <div class="kpi-label">ARPU (Enterprise)</div>
+                <div class="kpi-value">£142.00</div>
+                <div class="kpi-delta positive">↑ +£8.50 YoY</div>
+            </div>
+            <div class="kpi-card" style="--accent: #6366F1;">
+                <div class="kpi-icon">📑</div>
+                <div class="kpi-label">DSO (Days)</div>
+                <div class="kpi-value">32</div>
+                <div class="kpi-delta neutral">Target: 28</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EF4444;">
+                <div class="kpi-icon">⚠️</div>
+                <div class="kpi-label">Overdue (£)</div>
+                <div class="kpi-value">£0.30M</div>
+                <div class="kpi-delta negative">4.6% of billing</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        col_left, col_right = st.columns([1.3, 1])
+        
+        with col_left:
+            st.markdown('<div class="section-header">Revenue by Customer Type & Segment</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                revenue_data = pd.DataFrame({
+                    'Customer Type': ['Consumer', 'Consumer', 'Consumer', 'Consumer', 'SMB', 'SMB', 'Enterprise', 'Enterprise'],
+                    'Segment': ['Budget', 'Standard', 'Premium', 'VIP', 'Small', 'Medium', 'Corporate', 'Strategic'],
+                    'Revenue': [4.2, 12.8, 8.5, 3.2, 5.8, 8.4, 12.2, 10.7],
+                    'ARPU': [22, 32, 45, 68, 52, 65, 128, 185],
+                    'Subscribers': [5473, 10500, 3800, 1400, 2800, 3200, 950, 450]
+                })
+                
+                bars = alt.Chart(revenue_data).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Revenue:Q', title='Revenue (£M)', scale=alt.Scale(domain=[0, 15])),
+                    y=alt.Y('Segment:N', sort=alt.EncodingSortField(field='Revenue', order='descending'), title=None),
+                    color=alt.Color('Customer Type:N',
+                        scale=alt.Scale(
+                            domain=['Consumer', 'SMB', 'Enterprise'],
+                            range=['#29B5E8', '#10B981', '#8B5CF6']
+                        ),
+                        legend=alt.Legend(orient='top', title=None)
+                    ),
+                    tooltip=[
+                        alt.Tooltip('Customer Type:N'),
+                        alt.Tooltip('Segment:N'),
+                        alt.Tooltip('Revenue:Q', title='Revenue (£M)', format='.1f'),
+                        alt.Tooltip('ARPU:Q', title='ARPU (£)', format='d'),
+                        alt.Tooltip('Subscribers:Q', format=',')
+                    ]
+                ).properties(height=280)
+                
+                text = alt.Chart(revenue_data).mark_text(
+                    align='left', dx=5, fontSize=11, fontWeight='bold'
+                ).encode(
+                    x=alt.X('Revenue:Q'),
+                    y=alt.Y('Segment:N', sort=alt.EncodingSortField(field='Revenue', order='descending')),
+                    text=alt.Text('Revenue:Q', format='.1f'),
+                    color=alt.value('#1B2A4E')
+                )
+                
+                charts.altair_chart(bars + text, use_container_width=True)
+                
+                seg_cols = st.columns(3)
+                with seg_cols[0]:
+                    st.markdown("""
+                    <div style="background: linear-gradient(135deg, #E0F2FE 0%, #F0F9FF 100%); border-left: 4px solid #29B5E8; border-radius: 0 8px 8px 0; padding: 0.75rem;">
+                        <div style="font-weight: 600; color: #29B5E8; font-size: 0.85rem;">Consumer</div>
+                        <div style="font-size: 1.3rem; font-weight: 700; color: #1B2A4E;">£28.7M</div>
+                        <div style="color: #6B7280; font-size: 0.75rem;">44% of revenue</div>
+                    </div>
+                    """, unsafe_allow_html=True)
+                with seg_cols[1]:
+                    st.markdown("""
+                    <div style="background: linear-gradient(135deg, #D1FAE5 0%, #ECFDF5 100%); border-left: 4px solid #10B981; border-radius: 0 8px 8px 0; padding: 0.75rem;">
+                        <div style="font-weight: 600; color: #10B981; font-size: 0.85rem;">SMB</div>
+                        <div style="font-size: 1.3rem; font-weight: 700; color: #1B2A4E;">£14.2M</div>
+                        <div style="color: #6B7280; font-size: 0.75rem;">22% of revenue</div>
+                    </div>
+                    """, unsafe_allow_html=True)
+                with seg_cols[2]:
+                    st.markdown("""
+                    <div style="background: linear-gradient(135deg, #EDE9FE 0%, #F5F3FF 100%); border-left: 4px solid #8B5CF6; border-radius: 0 8px 8px 0; padding: 0.75rem;">
+                        <div style="font-weight: 600; color: #8B5CF6; font-size: 0.85rem;">Enterprise</div>
+                        <div style="font-size: 1.3rem; font-weight: 700; color: #1B2A4E;">£22.9M</div>
+                        <div style="color: #6B7280; font-size: 0.75rem;">34% of revenue</div>
+                    </div>
+                    """, unsafe_allow_html=True)
+            
+            st.markdown('<div class="section-header">Monthly Revenue & ARPU Trend</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                monthly_data = pd.DataFrame({
+                    'Month': months,
+                    'Revenue': [5.12, 5.28, 5.41, 5.52, 5.68, 5.85],
+                    'Target': [5.0, 5.15, 5.30, 5.45, 5.60, 5.75]
+                })
+                
+                # Revenue bars
+                revenue_bars = alt.Chart(monthly_data).mark_bar(
+                    color='#29B5E8', 
+                    cornerRadiusTopLeft=6, 
+                    cornerRadiusTopRight=6, 
+                    opacity=0.8
+                ).encode(
+                    x=alt.X('Month:N', sort=months, title=None, axis=alt.Axis(labelAngle=0)),
+                    y=alt.Y('Revenue:Q', title='Revenue (£M)', scale=alt.Scale(domain=[0, 7])),
+                    tooltip=[alt.Tooltip('Month:N'), alt.Tooltip('Revenue:Q', title='Revenue (£M)', format='.2f')]
+                )
+                
+                # Target line
+                target_line = alt.Chart(monthly_data).mark_line(
+                    color='#DC2626', 
+                    strokeWidth=2, 
+                    strokeDash=[5, 3]
+                ).encode(
+                    x=alt.X('Month:N', sort=months),
+                    y=alt.Y('Target:Q', scale=alt.Scale(domain=[0, 7])),
+                    tooltip=[alt.Tooltip('Month:N'), alt.Tooltip('Target:Q', title='Target (£M)', format='.2f')]
+                )
+                
+                # Combine layers
+                combined = alt.layer(revenue_bars, target_line).properties(height=220)
+                charts.altair_chart(combined, use_container_width=True)
+                
+                st.markdown("""
+                <div style="display: flex; gap: 1.5rem; font-size: 0.8rem; justify-content: center; margin-top: 0.5rem;">
+                    <span><span style="color: #29B5E8;">█</span> Revenue (£M)</span>
+                    <span><span style="color: #DC2626;">╌╌</span> Target</span>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col_right:
+            st.markdown('<div class="section-header">Billing Status Distribution</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                billing_status = pd.DataFrame({
+                    'Status': ['Paid', 'Pending', 'Overdue 1-30d', 'Overdue 31-60d', 'Overdue 60d+'],
+                    'Amount': [5.82, 0.42, 0.18, 0.08, 0.04],
+                    'Count': [28450, 2100, 890, 320, 180],
+                    'Percentage': [89.0, 6.4, 2.8, 1.2, 0.6]
+                })
+                
+                donut = alt.Chart(billing_status).mark_arc(innerRadius=60, outerRadius=100, cornerRadius=4).encode(
+                    theta=alt.Theta('Amount:Q', stack=True),
+                    color=alt.Color('Status:N',
+                        scale=alt.Scale(
+                            domain=['Paid', 'Pending', 'Overdue 1-30d', 'Overdue 31-60d', 'Overdue 60d+'],
+                            range=['#10B981', '#29B5E8', '#F59E0B', '#F97316', '#DC2626']
+                        ),
+                        legend=None
+                    ),
+                    tooltip=[
+                        alt.Tooltip('Status:N'),
+                        alt.Tooltip('Amount:Q', title='Amount (£M)', format='.2f'),
+                        alt.Tooltip('Count:Q', title='Invoices', format=','),
+                        alt.Tooltip('Percentage:Q', title='Share (%)', format='.1f')
+                    ],
+                    order=alt.Order('Amount:Q', sort='descending')
+                ).properties(height=220)
+                
+                center_text = alt.Chart(pd.DataFrame({'text': ['£6.54M']})).mark_text(
+                    fontSize=22, fontWeight='bold', color='#1B2A4E'
+                ).encode(text='text:N')
+                
+                center_sub = alt.Chart(pd.DataFrame({'text': ['Total Billed']})).mark_text(
+                    fontSize=11, color='#6B7280', dy=18
+                ).encode(text='text:N')
+                
+                charts.altair_chart(donut + center_text + center_sub, use_container_width=True)
+                
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span><span style="display: inline-block; width: 10px; height: 10px; background: #10B981; border-radius: 2px; margin-right: 6px;"></span>Paid</span>
+                        <span style="font-weight: 600;">£5.82M (89%)</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span><span style="display: inline-block; width: 10px; height: 10px; background: #29B5E8; border-radius: 2px; margin-right: 6px;"></span>Pending</span>
+                        <span style="font-weight: 600;">£0.42M (6.4%)</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span><span style="display: inline-block; width: 10px; height: 10px; background: #F59E0B; border-radius: 2px; margin-right: 6px;"></span>Overdue 1-30d</span>
+                        <span style="font-weight: 600; color: #F59E0B;">£0.18M</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span><span style="display: inline-block; width: 10px; height: 10px; background: #F97316; border-radius: 2px; margin-right: 6px;"></span>Overdue 31-60d</span>
+                        <span style="font-weight: 600; color: #F97316;">£0.08M</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0;">
+                        <span><span style="display: inline-block; width: 10px; height: 10px; background: #DC2626; border-radius: 2px; margin-right: 6px;"></span>Overdue 60d+</span>
+                        <span style="font-weight: 600; color: #DC2626;">£0.04M</span>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                st.markdown("""
+                <div style="background: linear-gradient(135deg, #FEF3C7 0%, #FDE68A 100%); border-radius: 8px; padding: 0.75rem; margin-top: 0.75rem; border-left: 4px solid #F59E0B;">
+                    <div style="display: flex; align-items: center;">
+                        <span style="font-size: 1.25rem; margin-right: 0.5rem;">⚠️</span>
+                        <div>
+                            <strong style="color: #92400E; font-size: 0.85rem;">Action Required</strong>
+                            <div style="color: #B45309; font-size: 0.8rem;">£0.30M overdue · 1,390 invoices need follow-up</div>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            st.markdown('<div class="section-header">Payment Method Mix</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                payment_data = pd.DataFrame({
+                    'Method': ['Direct Debit', 'Card', 'Bank Transfer', 'PayPal', 'Other'],
+                    'Percentage': [62, 21, 10, 5, 2],
+                    'Amount': [4.06, 1.37, 0.65, 0.33, 0.13]
+                })
+                
+                bars = alt.Chart(payment_data).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Percentage:Q', title='Share (%)', scale=alt.Scale(domain=[0, 70])),
+                    y=alt.Y('Method:N', sort='-x', title=None),
+                    color=alt.Color('Method:N',
+                        scale=alt.Scale(
+                            domain=['Direct Debit', 'Card', 'Bank Transfer', 'PayPal', 'Other'],
+                            range=['#29B5E8', '#10B981', '#8B5CF6', '#F59E0B', '#6B7280']
+                        ),
+                        legend=None
+                    ),
+                    tooltip=[
+                        alt.Tooltip('Method:N'),
+                        alt.Tooltip('Percentage:Q', title='Share (%)', format='d'),
+                        alt.Tooltip('Amount:Q', title='Amount (£M)', format='.2f')
+                    ]
+                ).properties(height=160)
+                
+                charts.altair_chart(bars, use_container_width=True)
+        
+        st.markdown('<div class="section-header">ARPU Analysis by Customer Type & Segment</div>', unsafe_allow_html=True)
+        
+        with st.container(border=True):
+            col_arpu1, col_arpu2 = st.columns([1.2, 1])
+            
+            with col_arpu1:
+                arpu_trend = pd.DataFrame({
+                    'Month': ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan'] * 3,
+                    'Type': ['Consumer'] * 6 + ['SMB'] * 6 + ['Enterprise'] * 6,
+                    'ARPU': [30.2, 30.8, 31.4, 31.9, 32.2, 32.4,
+                            54.5, 55.8, 56.2, 57.1, 57.8, 58.2,
+                            135, 138, 140, 141, 142, 142]
+                })
+                
+                arpu_chart = alt.Chart(arpu_trend).mark_line(strokeWidth=3, point=alt.OverlayMarkDef(filled=True, size=50)).encode(
+                    x=alt.X('Month:N', sort=['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan'], title=None, axis=alt.Axis(labelAngle=0)),
+                    y=alt.Y('ARPU:Q', title='ARPU (£)', scale=alt.Scale(domain=[25, 150])),
+                    color=alt.Color('Type:N',
+                        scale=alt.Scale(
+                            domain=['Consumer', 'SMB', 'Enterprise'],
+                            range=['#29B5E8', '#10B981', '#8B5CF6']
+                        ),
+                        legend=alt.Legend(orient='top', title=None)
+                    ),
+                    tooltip=[
+                        alt.Tooltip('Month:N'),
+                        alt.Tooltip('Type:N'),
+                        alt.Tooltip('ARPU:Q', title='ARPU (£)', format='.1f')
+                    ]
+                ).properties(height=220)
+                
+                charts.altair_chart(arpu_chart, use_container_width=True)
+            
+            with col_arpu2:
+                arpu_segment = pd.DataFrame({
+                    'Segment': ['Budget', 'Standard', 'Premium', 'VIP', 'Small', 'Medium', 'Corporate', 'Strategic'],
+                    'ARPU': [22, 32, 45, 68, 52, 65, 128, 185],
+                    'Type': ['Consumer', 'Consumer', 'Consumer', 'Consumer', 'SMB', 'SMB', 'Enterprise', 'Enterprise'],
+                    'YoY_Change': ['+8%', '+7%', '+9%', '+12%', '+6%', '+8%', '+11%', '+15%']
+                })
+                
+                lollipop_line = alt.Chart(arpu_segment).mark_rule(strokeWidth=3).encode(
+                    x=alt.X('ARPU:Q', title='ARPU (£)', scale=alt.Scale(domain=[0, 200])),
+                    x2=alt.value(0),
+                    y=alt.Y('Segment:N', sort=list(arpu_segment['Segment']), title=None),
+                    color=alt.Color('Type:N',
+                        scale=alt.Scale(
+                            domain=['Consumer', 'SMB', 'Enterprise'],
+                            range=['#29B5E8', '#10B981', '#8B5CF6']
+                        ),
+                        legend=None
+                    )
+                )
+                
+                lollipop_point = alt.Chart(arpu_segment).mark_circle(size=200).encode(
+                    x='ARPU:Q',
+                    y=alt.Y('Segment:N', sort=list(arpu_segment['Segment'])),
+                    color=alt.Color('Type:N',
+                        scale=alt.Scale(
+                            domain=['Consumer', 'SMB', 'Enterprise'],
+                            range=['#29B5E8', '#10B981', '#8B5CF6']
+                        )
+                    ),
+                    tooltip=[
+                        alt.Tooltip('Segment:N'),
+                        alt.Tooltip('ARPU:Q', title='ARPU (£)', format='d'),
+                        alt.Tooltip('YoY_Change:N', title='YoY Growth')
+                    ]
+                )
+                
+                text_labels = alt.Chart(arpu_segment).mark_text(align='left', dx=12, fontSize=10, fontWeight='bold').encode(
+                    x='ARPU:Q',
+                    y=alt.Y('Segment:N', sort=list(arpu_segment['Segment'])),
+                    text='YoY_Change:N',
+                    color=alt.value('#10B981')
+                )
+                
+                charts.altair_chart((lollipop_line + lollipop_point + text_labels).properties(height=220), use_container_width=True)
+        
+        col_profit, col_vendor = st.columns(2)
+        
+        with col_profit:
+            st.markdown('<div class="section-header">Profitability Waterfall</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                waterfall_data = pd.DataFrame({
+                    'Category': ['Revenue', 'COGS', 'Gross Profit', 'OpEx', 'EBITDA', 'D&A', 'EBIT', 'Interest', 'Net Income'],
+                    'Amount': [65.8, -20.7, 45.1, -26.9, 18.2, -4.2, 14.0, -2.1, 11.9],
+                    'Type': ['total', 'negative', 'subtotal', 'negative', 'subtotal', 'negative', 'subtotal', 'negative', 'total'],
+                    'Display': [65.8, 20.7, 45.1, 26.9, 18.2, 4.2, 14.0, 2.1, 11.9]
+                })
+                
+                margin_data = pd.DataFrame({
+                    'Metric': ['Gross Margin', 'EBITDA Margin', 'Net Margin'],
+                    'Value': [68.5, 27.6, 18.1],
+                    'Target': [70, 30, 20]
+                })
+                
+                bars = alt.Chart(margin_data).mark_bar(cornerRadiusTopRight=8, cornerRadiusBottomRight=8).encode(
+                    x=alt.X('Value:Q', title='Margin (%)', scale=alt.Scale(domain=[0, 80])),
+                    y=alt.Y('Metric:N', sort=list(margin_data['Metric']), title=None),
+                    color=alt.condition(
+                        alt.datum.Value >= alt.datum.Target,
+                        alt.value('#10B981'),
+                        alt.value('#F59E0B')
+                    ),
+                    tooltip=[
+                        alt.Tooltip('Metric:N'),
+                        alt.Tooltip('Value:Q', title='Current %', format='.1f'),
+                        alt.Tooltip('Target:Q', title='Target %', format='.1f')
+                    ]
+                ).properties(height=140)
+                
+                target_tick = alt.Chart(margin_data).mark_tick(color='#DC2626', thickness=3, size=25).encode(
+                    x='Target:Q',
+                    y=alt.Y('Metric:N', sort=list(margin_data['Metric']))
+                )
+                
+                value_text = alt.Chart(margin_data).mark_text(align='left', dx=5, fontSize=12, fontWeight='bold').encode(
+                    x='Value:Q',
+                    y=alt.Y('Metric:N', sort=list(margin_data['Metric'])),
+                    text=alt.Text('Value:Q', format='.1f'),
+                    color=alt.value('#1B2A4E')
+                )
+                
+                charts.altair_chart(bars + target_tick + value_text, use_container_width=True)
+                
+                st.markdown("""
+                <div style="display: flex; gap: 1rem; font-size: 0.8rem; color: #6B7280; margin-top: 0.5rem;">
+                    <span><span style="color: #10B981;">█</span> On Target</span>
+                    <span><span style="color: #F59E0B;">█</span> Below Target</span>
+                    <span><span style="color: #DC2626;">|</span> Target</span>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                st.markdown("""
+                <div style="background: #F8FAFC; border-radius: 8px; padding: 1rem; margin-top: 0.75rem; border: 1px solid #E2E8F0;">
+                    <div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 0.75rem; text-align: center;">
+                        <div>
+                            <div style="font-size: 0.7rem; color: #64748B;">Revenue</div>
+                            <div style="font-size: 1.2rem; font-weight: 700; color: #1B2A4E;">£65.8M</div>
+                        </div>
+                        <div>
+                            <div style="font-size: 0.7rem; opacity: 0.8;">EBITDA</div>
+                            <div style="font-size: 1.2rem; font-weight: 700; color: #10B981;">£18.2M</div>
+                        </div>
+                        <div>
+                            <div style="font-size: 0.7rem; opacity: 0.8;">Net Income</div>
+                            <div style="font-size: 1.2rem; font-weight: 700; color: #29B5E8;">£11.9M</div>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col_vendor:
+            st.markdown('<div class="section-header">Vendor Spend by Department</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                vendor_data = pd.DataFrame({
+                    'Department': ['Network Ops', 'IT Systems', 'Marketing', 'Customer Service', 'Facilities', 'HR & Admin'],
+                    'Spend': [12.4, 8.2, 4.5, 3.8, 2.1, 1.5],
+                    'Budget': [13.0, 8.5, 5.0, 4.0, 2.5, 1.8],
+                    'Variance': ['-4.6%', '-3.5%', '-10%', '-5%', '-16%', '-16.7%']
+                })
+                
+                vendor_data['Utilization'] = (vendor_data['Spend'] / vendor_data['Budget'] * 100).round(0)
+                
+                bars = alt.Chart(vendor_data).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Spend:Q', title='Spend (£M)', scale=alt.Scale(domain=[0, 15])),
+                    y=alt.Y('Department:N', sort='-x', title=None),
+                    color=alt.Color('Utilization:Q',
+                        scale=alt.Scale(scheme='blues', domain=[80, 100]),
+                        legend=None
+                    ),
+                    tooltip=[
+                        alt.Tooltip('Department:N'),
+                        alt.Tooltip('Spend:Q', title='Spend (£M)', format='.1f'),
+                        alt.Tooltip('Budget:Q', title='Budget (£M)', format='.1f'),
+                        alt.Tooltip('Variance:N', title='vs Budget')
+                    ]
+                ).properties(height=200)
+                
+                budget_tick = alt.Chart(vendor_data).mark_tick(color='#DC2626', thickness=3, size=20).encode(
+                    x='Budget:Q',
+                    y=alt.Y('Department:N', sort='-x')
+                )
+                
+                charts.altair_chart(bars + budget_tick, use_container_width=True)
+                
+                col_v1, col_v2 = st.columns(2)
+                with col_v1:
+                    st.markdown("""
+                    <div style="background: #D1FAE5; border-radius: 8px; padding: 0.75rem; text-align: center;">
+                        <div style="font-size: 0.75rem; color: #065F46;">Total Spend</div>
+                        <div style="font-size: 1.4rem; font-weight: 700; color: #065F46;">£32.5M</div>
+                    </div>
+                    """, unsafe_allow_html=True)
+                with col_v2:
+                    st.markdown("""
+                    <div style="background: #E0F2FE; border-radius: 8px; padding: 0.75rem; text-align: center;">
+                        <div style="font-size: 0.75rem; color: #0369A1;">Under Budget</div>
+                        <div style="font-size: 1.4rem; font-weight: 700; color: #0369A1;">£2.3M</div>
+                    </div>
+                    """, unsafe_allow_html=True)
+        
+        # What-If Analysis Section
+        st.markdown('<div class="section-header">📊 What-If Scenario Analysis</div>', unsafe_allow_html=True)
+        
+        if st.session_state.get('sf_highlights', True):
+            st.info("❄️ **Powered by Snowflake** — Real-time financial modeling using Snowpark Python UDFs and Dynamic Tables for instant scenario calculations")
+        
+        _what_if_scenario_panel()
+        
+    with tab_ops:
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['FINANCE', 'BILLING', 'REVENUE_ASSURANCE']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+
+        st.markdown("""
+        <div class="fin-pulse">
+            <div class="fin-pulse-title">💼 Financial Operations Pulse</div>
+            <div class="fin-pulse-sub">Working capital, spend efficiency, and cash posture at a glance</div>
+            <div class="fin-pulse-metrics">
+                <span>DSO: 32 days</span>
+                <span>Overdue: £0.30M</span>
+                <span>Cash Runway: 9.3 months</span>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown('<div class="section-header">Working Capital</div>', unsafe_allow_html=True)
+        wc_left, wc_right = st.columns(2)
+
+        with wc_left:
+            st.markdown('<div class="section-header">Accounts Receivable Aging</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                ar_data = pd.DataFrame({
+                    'Bucket': ['0-30', '31-60', '61-90', '90+'],
+                    'Amount': [2.1, 0.9, 0.4, 0.3]
+                })
+                ar_chart = alt.Chart(ar_data).mark_bar(color='#29B5E8', cornerRadiusEnd=6).encode(
+                    y=alt.Y('Bucket:N', sort=None, title=None),
+                    x=alt.X('Amount:Q', title='£M', scale=alt.Scale(domain=[0, 2.5])),
+                    tooltip=['Bucket:N', alt.Tooltip('Amount:Q', title='£M', format='.1f')]
+                ).properties(height=180)
+                charts.altair_chart(ar_chart, use_container_width=True)
+
+        with wc_right:
+            st.markdown('<div class="section-header">Accounts Payable Aging</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                ap_data = pd.DataFrame({
+                    'Bucket': ['0-30', '31-60', '61-90', '90+'],
+                    'Amount': [1.6, 0.7, 0.3, 0.1]
+                })
+                ap_chart = alt.Chart(ap_data).mark_bar(color='#10B981', cornerRadiusEnd=6).encode(
+                    y=alt.Y('Bucket:N', sort=None, title=None),
+                    x=alt.X('Amount:Q', title='£M', scale=alt.Scale(domain=[0, 2.0])),
+                    tooltip=['Bucket:N', alt.Tooltip('Amount:Q', title='£M', format='.1f')]
+                ).properties(height=180)
+                charts.altair_chart(ap_chart, use_container_width=True)
+
+        st.markdown('<div class="section-header">Cost Structure</div>', unsafe_allow_html=True)
+        cost_cols = st.columns([1.2, 1])
+        with cost_cols[0]:
+            with st.container(border=True):
+                opex = pd.DataFrame({
+                    'Category': ['Network', 'IT', 'Support', 'Sales', 'Admin'],
+                    'Spend': [2.8, 1.9, 1.2, 0.9, 0.6]
+                })
+                donut = alt.Chart(opex).mark_arc(innerRadius=45, outerRadius=80).encode(
+                    theta=alt.Theta('Spend:Q'),
+                    color=alt.Color('Category:N', legend=None),
+                    tooltip=['Category:N', alt.Tooltip('Spend:Q', title='£M', format='.1f')]
+                ).properties(height=200)
+                charts.altair_chart(donut, use_container_width=True)
+        with cost_cols[1]:
+            with st.container(border=True):
+                st.markdown("""
+                **Top Cost Drivers**
+                - Network Ops: **£2.8M**
+                - IT & Cloud: **£1.9M**
+                - Support: **£1.2M**
+                - Sales: **£0.9M**
+                """)
+
+        st.markdown('<div class="section-header">Cash Runway & Forecast</div>', unsafe_allow_html=True)
+        with st.container(border=True):
+            st.markdown("""
+            <div style="font-weight: 600; margin-bottom: 0.4rem;">Runway Coverage: 9.3 months</div>
+            <div class="cash-bar"><div class="cash-fill"></div></div>
+            <div class="cash-row"><span>Low: 6 months</span><span>Target: 12 months</span></div>
+            """, unsafe_allow_html=True)
+
+        st.markdown('<div class="section-header">Top Vendor Spend</div>', unsafe_allow_html=True)
+        vendor_cols = st.columns([1.2, 1])
+        with vendor_cols[0]:
+            with st.container(border=True):
+                vendor_data = pd.DataFrame({
+                    'Vendor': ['Ericsson', 'AWS', 'Nokia', 'Accenture', 'Microsoft'],
+                    'Spend': [1.8, 1.2, 0.9, 0.7, 0.6]
+                })
+                vendor_chart = alt.Chart(vendor_data).mark_bar(color='#10B981', cornerRadiusEnd=6).encode(
+                    y=alt.Y('Vendor:N', sort='-x', title=None),
+                    x=alt.X('Spend:Q', title='£M'),
+                    tooltip=['Vendor:N', alt.Tooltip('Spend:Q', title='£M', format='.1f')]
+                ).properties(height=200)
+                charts.altair_chart(vendor_chart, use_container_width=True)
+        with vendor_cols[1]:
+            with st.container(border=True):
+                st.markdown("""
+                **Spend Notes**
+                - Cloud costs trending down **-6% QoQ**
+                - Network vendor savings **£0.4M** via consolidation
+                - Professional services under budget
+                """)
+
+        st.markdown('<div class="section-header">Budget vs Actual (YTD)</div>', unsafe_allow_html=True)
+        with st.container(border=True):
+            budget_data = pd.DataFrame({
+                'Category': ['Network', 'IT', 'Support', 'Sales', 'Admin'],
+                'Budget': [3.0, 2.1, 1.4, 1.0, 0.7],
+                'Actual': [2.8, 1.9, 1.2, 0.9, 0.6]
+            })
+            budget = alt.Chart(budget_data).mark_bar(color='#94A3B8').encode(
+                y=alt.Y('Category:N', sort='-x', title=None),
+                x=alt.X('Budget:Q', title='£M'),
+                tooltip=['Category:N', alt.Tooltip('Budget:Q', title='Budget (£M)', format='.1f')]
+            )
+            actual = alt.Chart(budget_data).mark_bar(color='#29B5E8').encode(
+                y=alt.Y('Category:N', sort='-x'),
+                x=alt.X('Actual:Q'),
+                tooltip=['Category:N', alt.Tooltip('Actual:Q', title='Actual (£M)', format='.1f')]
+            )
+            charts.altair_chart(alt.layer(budget, actual).properties(height=220), use_container_width=True)
+
+    with tab_strategy:
+        st.markdown('<div class="section-header">AI Executive Summary</div>', unsafe_allow_html=True)
+        if st.session_state.get('sf_highlights', True):
+            st.info("❄️ **Powered by Snowflake Cortex AI** — Finance insights synthesized from billing, payments, and revenue data.")
+        
+        with st.container(border=True):
+            st.markdown("""
+            **Finance Summary (Q1 2026):**
+            - Revenue +12.4% YoY with EBITDA margin at **27.6%**.
+            - Collection rate remains strong at **98.2%**, but DSO sits above target (32 vs 28).
+            - OpEx trending below budget in IT and Support, supporting margin expansion.
+            """)
+
+        insight_cols = st.columns(3)
+        with insight_cols[0]:
+            st.markdown('<div class="section-header">Top Insights</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                - **Revenue growth**: +£7.4M MTD
+                - **Enterprise ARPU**: £142 (+15% YoY)
+                - **Billing accuracy**: 98.2%
+                """)
+        with insight_cols[1]:
+            st.markdown('<div class="section-header">Risk Signals</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                - **DSO** above target by 4 days
+                - **Overdue** balance at £0.30M
+                - **Credit exposure** rising in SMB
+                """)
+        with insight_cols[2]:
+            st.markdown('<div class="section-header">Efficiency Signals</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                - **OpEx savings** £1.5M identified
+                - **Cloud spend** down 6% QoQ
+                - **Cash runway** 9.3 months
+                """)
+
+        st.markdown('<div class="section-header">Recommended Actions</div>', unsafe_allow_html=True)
+        action_cols = st.columns(3)
+        with action_cols[0]:
+            with st.container(border=True):
+                st.markdown("""
+                **1) DSO Reduction**
+                - Automate reminders & escalations
+                - Tighten credit checks
+                - Target: **28 days**
+                """)
+        with action_cols[1]:
+            with st.container(border=True):
+                st.markdown("""
+                **2) Margin Expansion**
+                - Vendor consolidation
+                - Reduce low-ROI spend
+                - Target: **30% EBITDA**
+                """)
+        with action_cols[2]:
+            with st.container(border=True):
+                st.markdown("""
+                **3) Cash Discipline**
+                - Prioritize collections
+                - Defer non-critical CapEx
+                - Maintain **12-month runway**
+                """)
+
+        st.markdown('<div class="section-header">CFO Strategic Priorities — Q1 2026</div>', unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #DC2626; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 1</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Reduce DSO to 28 Days</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current DSO: **32 days** (target: 28)
+                - **£0.30M** overdue requiring action
+                - Implement automated reminders
+                - Expected cash improvement: **£0.8M**
+                """)
+        
+        with col2:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #F59E0B; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 2</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Grow Enterprise ARPU</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Enterprise ARPU: **£142** (+15% YoY)
+                - Strategic accounts: **£185** ARPU
+                - Upsell pipeline: **£3.2M** qualified
+                - Target: **£155** ARPU by Q4
+                """)
+        
+        with col3:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #10B981; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 3</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">EBITDA Margin to 30%</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current margin: **27.6%** (target: 30%)
+                - OpEx savings identified: **£1.5M**
+                - Vendor consolidation: **£0.4M**
+                - Automation savings: **£0.3M**
+                """)
+        
+        st.markdown('<div class="section-header">Ask Snowflake Intelligence</div>', unsafe_allow_html=True)
+        
+        questions = [
+            "Show me our revenue breakdown by customer type - Consumer, SMB, and Enterprise - with average bill amounts.",
+            "What's our ARPU by customer type and segment? Show me Consumer vs SMB vs Enterprise, and break down by value tier.",
+            "What's our payment status distribution? Show me Paid vs Pending vs Overdue by customer type.",
+            "What are our top vendor expenses by department and what's the approval status?",
+            "What revenue is at risk from churned customers? Show me lifetime value lost by customer type."
+        ]
+        
+        sf_intel_url = "https://ai.snowflake.com/sfseeurope/pjose_aws3"
+        
+        cols = st.columns(2)
+        for i, q in enumerate(questions):
+            with cols[i % 2]:
+                escaped_q = q.replace('"', '&quot;').replace("'", "&#39;")
+                st.markdown(f"""
+                <a href="{sf_intel_url}" target="_blank" onclick="navigator.clipboard.writeText('{escaped_q}')" style="text-decoration: none; color: inherit; display: block;">
+                    <div class="question-card">
+                        <p style="margin-bottom: 1.5rem;"><strong>Q{i+1}:</strong> "{q}"</p>
+                    </div>
+                </a>
+                """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div style="text-align: center; margin-top: 1rem; padding: 1rem; background: linear-gradient(135deg, #29B5E8 0%, #1A8BC4 100%); border-radius: 8px;">
+            <a href="{sf_intel_url}" target="_blank" style="color: white; text-decoration: none; font-weight: 600; font-size: 1rem;">
+                ❄️ Ask these questions in Snowflake Intelligence →
+            </a>
+        </div>
+        """, unsafe_allow_html=True)
+
+
+WHAT_IF_SLIDER_KEYS = ("cfo_whatif_churn", "cfo_whatif_arpu", "cfo_whatif_opex")
+
+
+def _reset_what_if():
+    # Dropping the widget state makes each slider start again from its default
+    for key in WHAT_IF_SLIDER_KEYS:
+        st.session_state.pop(key, None)
+
+
+@fragment
+def _what_if_scenario_panel():
+    """Scenario sliders and projected impact; slider moves rerun only this panel."""
+    scenario_col1, scenario_col2 = st.columns([1, 2])
+    
+    with scenario_col1:
+        with st.container(border=True):
+            st.markdown("**Adjust Scenarios**")
+            
+            churn_change = st.slider("Churn Rate Change", -3.0, 3.0, 0.0, 0.1, format="%.1f%%", help="Impact of churn reduction initiatives", key="cfo_whatif_churn")
+            arpu_change = st.slider("ARPU Change", -5.0, 10.0, 0.0, 0.5, format="£%.1f", help="Average Revenue Per User change", key="cfo_whatif_arpu")
+            opex_change = st.slider("OpEx Reduction", -10.0, 5.0, 0.0, 0.5, format="%.1f%%", help="Operating expense change", key="cfo_whatif_opex")
+            
+            st.markdown("---")
+            st.button("🔄 Reset to Baseline", use_container_width=True, on_click=_reset_what_if)
+    
+    with scenario_col2:
+        with st.container(border=True):
+            st.markdown("**Projected Impact on Annual Financials**")
+            
+            # Base values
+            base_revenue = 4240  # £M
+            base_ebitda = 1420   # £M
+            base_customers = 12.4  # M
+            base_churn = 1.2  # %
+            
+            # Calculate impacts
+            churn_impact = (churn_change / 100) * base_customers * 420 * -1  # £420 avg annual revenue per customer
+            arpu_impact = arpu_change * 12 * base_customers  # annual impact
+            opex_impact = (opex_change / 100) * 2820 * -1  # £2.82B OpEx base
+            
+            total_revenue_impact = churn_impact + arpu_impact
+            total_ebitda_impact = total_revenue_impact + opex_impact
+            
+            impact_cols = st.columns(4)
+            
+            with impact_cols[0]:
+                delta_color = "normal" if total_revenue_impact >= 0 else "inverse"
+                st.metric("Revenue Impact", f"£{abs(total_revenue_impact):.1f}M", 
+                         f"{'↑' if total_revenue_impact >= 0 else '↓'} from baseline",
+                         delta_color=delta_color)
+            
+            with impact_cols[1]:
+                delta_color = "normal" if total_ebitda_impact >= 0 else "inverse"
+                st.metric("EBITDA Impact", f"£{abs(total_ebitda_impact):.1f}M",
+                         f"{'↑' if total_ebitda_impact >= 0 else '↓'} from baseline",
+                         delta_color=delta_color)
+            
+            with impact_cols[2]:
+                new_margin = ((base_ebitda + total_ebitda_impact) / (base_revenue + total_revenue_impact)) * 100
+                margin_change = new_margin - 33.5
+                st.metric("New EBITDA Margin", f"{new_margin:.1f}%", f"{margin_change:+.1f}pp")
+            
+            with impact_cols[3]:
+                retained_customers = (churn_change / 100) * base_customers * -1000
+                st.metric("Customers Retained", f"{retained_customers:+,.0f}K" if churn_change != 0 else "—",
+                         "from churn reduction" if churn_change < 0 else "")
+            
+            # Scenario summary
+            if total_ebitda_impact > 50:
+                st.success(f"✅ **Positive Scenario:** This combination could add £{total_ebitda_impact:.0f}M to annual EBITDA")
+            elif total_ebitda_impact < -50:
+                st.error(f"⚠️ **Risk Scenario:** This combination could reduce annual EBITDA by £{abs(total_ebitda_impact):.0f}M")
+            else:
+                st.info("📊 **Neutral Scenario:** Minimal impact on financials with current parameters")
+            
+            # Visual Impact Chart
+            
+            # Calculate bar widths (max 50% of track)
+            max_impact = 200  # £M for scaling
+            revenue_bar_width = min(abs(total_revenue_impact) / max_impact * 50, 50)
+            ebitda_bar_width = min(abs(total_ebitda_impact) / max_impact * 50, 50)
+            opex_bar_width = min(abs(opex_impact) / max_impact * 50, 50)
+            
+            revenue_class = "positive" if total_revenue_impact >= 0 else "negative"
+            ebitda_class = "positive" if total_ebitda_impact >= 0 else "negative"
+            opex_class = "positive" if opex_impact >= 0 else "negative"
+            
+            st.markdown(f"""
+            <div class="impact-visual">
+                <div class="impact-bar-container">
+                    <div class="impact-bar-label">Revenue</div>
+                    <div class="impact-bar-track">
+                        <div class="impact-bar-center"></div>
+                        <div class="impact-bar-fill {revenue_class}" style="--bar-width: {revenue_bar_width}%;"></div>
+                    </div>
+                    <div class="impact-bar-value" style="color: {'#10B981' if total_revenue_impact >= 0 else '#DC2626'};">
+                        {'+'if total_revenue_impact >= 0 else '-'}£{abs(total_revenue_impact):.0f}M
+                    </div>
+                </div>
+                <div class="impact-bar-container">
+                    <div class="impact-bar-label">OpEx Savings</div>
+                    <div class="impact-bar-track">
+                        <div class="impact-bar-center"></div>
+                        <div class="impact-bar-fill {opex_class}" style="--bar-width: {opex_bar_width}%;"></div>
+                    </div>
+                    <div class="impact-bar-value" style="color: {'#10B981' if opex_impact >= 0 else '#DC2626'};">
+                        {'+'if opex_impact >= 0 else '-'}£{abs(opex_impact):.0f}M
+                    </div>
+                </div>
+                <div class="impact-bar-container">
+                    <div class="impact-bar-label">EBITDA</div>
+                    <div class="impact-bar-track">
+                        <div class="impact-bar-center"></div>
+                        <div class="impact-bar-fill {ebitda_class}" style="--bar-width: {ebitda_bar_width}%;"></div>
+                    </div>
+                    <div class="impact-bar-value" style="color: {'#10B981' if total_ebitda_impact >= 0 else '#DC2626'};">
+                        {'+'if total_ebitda_impact >= 0 else '-'}£{abs(total_ebitda_impact):.0f}M
+                    </div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
@@ -0,0 +1,550 @@
+"""CHRO People dashboard."""
+
+import streamlit as st
+import pandas as pd
+import altair as alt
+
+from dashboard import charts
+
+
+def render_chro_people():
+    import pandas as pd
+    import altair as alt
+    
+    # CHRO Header with Connected People Network Effect
+    st.markdown("""
+    <div class="chro-header-wrap">
+        <div class="chro-network-bg">
+            <span class="chro-person" style="left: 15%; top: 25%; animation-delay: 0s;">👤</span>
+            <span class="chro-person" style="left: 30%; top: 60%; animation-delay: 0.2s;">👤</span>
+            <span class="chro-person" style="left: 50%; top: 30%; animation-delay: 0.4s;">👤</span>
+            <span class="chro-person" style="left: 70%; top: 55%; animation-delay: 0.6s;">👤</span>
+            <span class="chro-person" style="left: 85%; top: 25%; animation-delay: 0.8s;">👤</span>
+            <div class="chro-line" style="left: 18%; top: 35%; width: 80px; transform: rotate(30deg);"></div>
+            <div class="chro-line" style="left: 33%; top: 55%; width: 100px; transform: rotate(-20deg); animation-delay: 0.5s;"></div>
+            <div class="chro-line" style="left: 53%; top: 40%; width: 90px; transform: rotate(25deg); animation-delay: 1s;"></div>
+        </div>
+        <div class="chro-header-content">
+            <h1>CHRO People & Workforce Dashboard</h1>
+            <p>Workforce Analytics, Engagement & Talent Management</p>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Dashboard Tabs
+    tab_overview, tab_ops, tab_strategy = st.tabs(["📊 Overview & Analysis", "👥 People Operations", "❄️ Snowflake Intelligence"])
+
+    with tab_overview:
+        
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['WORKFORCE']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+        
+        # CHRO WORKFORCE PULSE ANIMATION
+        st.markdown("""<div class="chro-pulse"><div class="pulse-header"><div class="pulse-title">👥 Workforce Pulse</div><div class="pulse-live">● 2,847 Active Today</div></div><div class="people-flow"><span class="person-icon" style="animation-delay:0s">👤</span><span class="person-icon" style="animation-delay:0.1s">👤</span><span class="person-icon" style="animation-delay:0.2s">👤</span><span class="person-icon" style="animation-delay:0.3s">👤</span><span class="person-icon" style="animation-delay:0.4s">👤</span><span class="person-icon" style="animation-delay:0.5s">👤</span><span class="person-icon" style="animation-delay:0.6s">👤</span><span class="person-icon" style="animation-delay:0.7s">👤</span><span class="person-icon" style="animation-delay:0.8s">👤</span><span class="person-icon" style="animation-delay:0.9s">👤</span><span class="person-icon" style="animation-delay:1.0s">👤</span><span class="person-icon" style="animation-delay:1.1s">👤</span></div><div class="hr-metrics"><div class="hr-metric"><div class="hr-val">3,247</div><div class="hr-label">Total Headcount</div></div><div class="hr-metric"><div class="hr-val">82%</div><div class="hr-label">Engagement</div></div><div class="hr-metric"><div class="hr-val">8.2%</div><div class="hr-label">Attrition</div></div><div class="hr-metric"><div class="hr-val">94%</div><div class="hr-label">Training Complete</div></div></div></div>""", unsafe_allow_html=True)
+        
+        
+        st.markdown('<div class="section-header">Workforce Overview</div>', unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #29B5E8;">
+                <div class="kpi-icon">👥</div>
+                <div class="kpi-label">Total Headcount</div>
+                <div class="kpi-value">2,142</div>
+                <div class="kpi-delta positive">↑ +48 YTD</div>
+            </div>
+            <div class="kpi-card" style="--accent: #10B981;">
+                <div class="kpi-icon">💚</div>
+                <div class="kpi-label">Engagement Score</div>
+                <div class="kpi-value">3.8/5</div>
+                <div class="kpi-delta positive">↑ +0.2 YoY</div>
+            </div>
+            <div class="kpi-card" style="--accent: #8B5CF6;">
+                <div class="kpi-icon">⭐</div>
+                <div class="kpi-label">eNPS</div>
+                <div class="kpi-value">+25</div>
+                <div class="kpi-delta positive">↑ +8 pts YoY</div>
+            </div>
+            <div class="kpi-card" style="--accent: #F59E0B;">
+                <div class="kpi-icon">🔄</div>
+                <div class="kpi-label">Turnover Rate</div>
+                <div class="kpi-value">14%</div>
+                <div class="kpi-delta positive">↓ -2% YoY</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #14B8A6;">
+                <div class="kpi-icon">📈</div>
+                <div class="kpi-label">Open Positions</div>
+                <div class="kpi-value">68</div>
+                <div class="kpi-delta positive">Active hiring</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EC4899;">
+                <div class="kpi-icon">⏱️</div>
+                <div class="kpi-label">Time to Hire</div>
+                <div class="kpi-value">32 days</div>
+                <div class="kpi-delta positive">↓ -8 days</div>
+            </div>
+            <div class="kpi-card" style="--accent: #6366F1;">
+                <div class="kpi-icon">🎓</div>
+                <div class="kpi-label">Training Hours</div>
+                <div class="kpi-value">4,280</div>
+                <div class="kpi-delta positive">MTD completed</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EF4444;">
+                <div class="kpi-icon">⚠️</div>
+                <div class="kpi-label">At-Risk Employees</div>
+                <div class="kpi-value">142</div>
+                <div class="kpi-delta negative">Turnover risk</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # New: Engagement Trend and Hiring Pipeline
+        engagement_col, hiring_col = st.columns(2)
+        
+        with engagement_col:
+            st.markdown('<div class="section-header">Engagement Trend (Quarterly)</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                quarters = ['Q1 25', 'Q2 25', 'Q3 25', 'Q4 25', 'Q1 26']
+                engagement_trend = pd.DataFrame({
+                    'Quarter': quarters,
+                    'Score': [3.5, 3.6, 3.7, 3.7, 3.8],
+                    'eNPS': [15, 18, 20, 22, 25]
+                })
+                
+                score_line = alt.Chart(engagement_trend).mark_line(color='#10B981', strokeWidth=3).encode(
+                    x=alt.X('Quarter:N', sort=quarters, title=None),
+                    y=alt.Y('Score:Q', scale=alt.Scale(domain=[3, 4.5]), title='Engagement')
+                )
+                
+                score_points = alt.Chart(engagement_trend).mark_circle(color='#10B981', size=60).encode(
+                    x=alt.X('Quarter:N', sort=quarters),
+                    y=alt.Y('Score:Q'),
+                    tooltip=['Quarter:N', alt.Tooltip('Score:Q', format='.1f'), 'eNPS:Q']
+                )
+                
+                charts.altair_chart((score_line + score_points).properties(height=160), use_container_width=True)
+        
+        with hiring_col:
+            st.markdown('<div class="section-header">Hiring Pipeline</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Applied</span><span style="font-weight: 600;">420</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 16px;">
+                            <div style="background: #6366F1; width: 100%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Screened</span><span style="font-weight: 600;">168 (40%)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 16px;">
+                            <div style="background: #8B5CF6; width: 40%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Interview</span><span style="font-weight: 600;">84 (20%)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 16px;">
+                            <div style="background: #29B5E8; width: 20%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Offer</span><span style="font-weight: 600;">32 (8%)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 16px;">
+                            <div style="background: #F59E0B; width: 8%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div>
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Hired</span><span style="font-weight: 600;">18 (4%)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 16px;">
+                            <div style="background: #10B981; width: 4%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+
+        st.markdown('<div class="section-header">Talent & Retention Signals</div>', unsafe_allow_html=True)
+        talent_col1, talent_col2 = st.columns(2)
+        
+        with talent_col1:
+            st.markdown("**Attrition by Department**")
+            with st.container(border=True):
+                attr_df = pd.DataFrame({
+                    'Department': ['Contact Centre', 'Network Ops', 'Sales', 'IT', 'Corporate'],
+                    'Attrition': [18, 12, 14, 9, 7]
+                })
+                attr_bar = alt.Chart(attr_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Attrition:Q', title='%'),
+                    y=alt.Y('Department:N', sort='-x', title=None),
+                    color=alt.value('#EF4444'),
+                    tooltip=['Department:N', alt.Tooltip('Attrition:Q', format='.0f')]
+                ).properties(height=170)
+                charts.altair_chart(attr_bar, use_container_width=True)
+        
+        with talent_col2:
+            st.markdown("**Internal Mobility Rate**")
+            with st.container(border=True):
+                quarters = ['Q1 25', 'Q2 25', 'Q3 25', 'Q4 25', 'Q1 26']
+                mobility_df = pd.DataFrame({
+                    'Quarter': quarters,
+                    'Mobility': [6.2, 6.8, 7.4, 7.9, 8.4]
+                })
+                mobility_line = alt.Chart(mobility_df).mark_line(point=True, color='#6366F1', strokeWidth=2).encode(
+                    x=alt.X('Quarter:N', sort=quarters, title=None),
+                    y=alt.Y('Mobility:Q', title='%'),
+                    tooltip=['Quarter:N', alt.Tooltip('Mobility:Q', format='.1f')]
+                ).properties(height=170)
+                charts.altair_chart(mobility_line, use_container_width=True)
+        
+        col_left, col_right = st.columns([1.3, 1])
+        
+        with col_left:
+            st.markdown('<div class="section-header">Headcount by Department</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Contact Centre</span><span style="font-weight: 600;">680 <span style="color: #6B7280; font-size: 0.75rem;">(3.6 eng)</span></span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #29B5E8; width: 100%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Retail</span><span style="font-weight: 600;">520 <span style="color: #6B7280; font-size: 0.75rem;">(3.9 eng)</span></span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #29B5E8; width: 76%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Network Ops</span><span style="font-weight: 600;">420 <span style="color: #6B7280; font-size: 0.75rem;">(4.1 eng)</span></span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #29B5E8; width: 62%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>IT</span><span style="font-weight: 600;">280 <span style="color: #6B7280; font-size: 0.75rem;">(4.0 eng)</span></span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #29B5E8; width: 41%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div>
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Corporate</span><span style="font-weight: 600;">242 <span style="color: #6B7280; font-size: 0.75rem;">(3.8 eng)</span></span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #29B5E8; width: 36%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col_right:
+            st.markdown('<div class="section-header">Skills Gaps</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>5G Core Engineering</span>
+                        <span style="background: #FEE2E2; color: #DC2626; padding: 0.2rem 0.5rem; border-radius: 12px;">Critical</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>AI/ML</span>
+                        <span style="background: #FEE2E2; color: #DC2626; padding: 0.2rem 0.5rem; border-radius: 12px;">Critical</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Cloud Architecture</span>
+                        <span style="background: #FEF3C7; color: #92400E; padding: 0.2rem 0.5rem; border-radius: 12px;">High</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0;">
+                        <span>Cybersecurity</span>
+                        <span style="background: #FEF3C7; color: #92400E; padding: 0.2rem 0.5rem; border-radius: 12px;">High</span>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+
+    with tab_ops:
+        st.markdown("""
+        <div class="chro-ops-pulse">
+            <div class="chro-ops-header">
+                <div class="chro-ops-title">👥 People Ops Pulse</div>
+                <div class="chro-ops-tag">LIVE OPS</div>
+            </div>
+            <div class="chro-ops-grid">
+                <div class="chro-ops-card">
+                    <div class="chro-ops-label">Active Cases</div>
+                    <div class="chro-ops-value">96</div>
+                    <div class="chro-ops-delta">HR tickets</div>
+                </div>
+                <div class="chro-ops-card">
+                    <div class="chro-ops-label">Offer Accept</div>
+                    <div class="chro-ops-value">82%</div>
+                    <div class="chro-ops-delta">Last 30d</div>
+                </div>
+                <div class="chro-ops-card">
+                    <div class="chro-ops-label">Time to Fill</div>
+                    <div class="chro-ops-value">32d</div>
+                    <div class="chro-ops-delta">↓ 8d</div>
+                </div>
+                <div class="chro-ops-card">
+                    <div class="chro-ops-label">Training Done</div>
+                    <div class="chro-ops-value">94%</div>
+                    <div class="chro-ops-delta">MTD</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Recruiting Operations</div>', unsafe_allow_html=True)
+        rec_col1, rec_col2 = st.columns(2)
+        
+        with rec_col1:
+            st.markdown("**Offer Acceptance by Role**")
+            with st.container(border=True):
+                offer_df = pd.DataFrame({
+                    'Role': ['Engineering', 'Sales', 'Retail', 'Corporate'],
+                    'Acceptance': [78, 84, 88, 80]
+                })
+                offer_bar = alt.Chart(offer_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Acceptance:Q', title='%'),
+                    y=alt.Y('Role:N', sort='-x', title=None),
+                    color=alt.value('#10B981'),
+                    tooltip=['Role:N', alt.Tooltip('Acceptance:Q', format='.0f')]
+                ).properties(height=170)
+                charts.altair_chart(offer_bar, use_container_width=True)
+        
+        with rec_col2:
+            st.markdown("**Time-to-Fill by Department**")
+            with st.container(border=True):
+                ttf_df = pd.DataFrame({
+                    'Department': ['Contact Centre', 'Network Ops', 'Sales', 'IT', 'Corporate'],
+                    'Days': [38, 34, 29, 36, 26]
+                })
+                ttf_bar = alt.Chart(ttf_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Days:Q', title='Days'),
+                    y=alt.Y('Department:N', sort='-x', title=None),
+                    color=alt.value('#6366F1'),
+                    tooltip=['Department:N', 'Days:Q']
+                ).properties(height=170)
+                charts.altair_chart(ttf_bar, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Learning & Performance</div>', unsafe_allow_html=True)
+        learn_col1, learn_col2 = st.columns(2)
+        
+        with learn_col1:
+            st.markdown("**Training Completion by Department**")
+            with st.container(border=True):
+                train_df = pd.DataFrame({
+                    'Department': ['Contact Centre', 'Network Ops', 'Sales', 'IT', 'Corporate'],
+                    'Completion': [88, 92, 94, 90, 96]
+                })
+                train_bar = alt.Chart(train_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Completion:Q', title='%'),
+                    y=alt.Y('Department:N', sort='-x', title=None),
+                    color=alt.value('#29B5E8'),
+                    tooltip=['Department:N', alt.Tooltip('Completion:Q', format='.0f')]
+                ).properties(height=170)
+                charts.altair_chart(train_bar, use_container_width=True)
+        
+        with learn_col2:
+            st.markdown("**Performance Rating Mix**")
+            with st.container(border=True):
+                perf_df = pd.DataFrame({
+                    'Rating': ['Exceeds', 'Meets', 'Below'],
+                    'Share': [18, 68, 14]
+                })
+                perf_arc = alt.Chart(perf_df).mark_arc(innerRadius=55).encode(
+                    theta=alt.Theta('Share:Q', title=None),
+                    color=alt.Color('Rating:N', legend=None, scale=alt.Scale(
+                        range=['#10B981', '#29B5E8', '#EF4444']
+                    )),
+                    tooltip=['Rating:N', alt.Tooltip('Share:Q', format='.0f')]
+                ).properties(height=170)
+                charts.altair_chart(perf_arc, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Workforce Risk & Capacity</div>', unsafe_allow_html=True)
+        cap_col1, cap_col2 = st.columns(2)
+        
+        with cap_col1:
+            st.markdown("**Absence Rate by Department**")
+            with st.container(border=True):
+                abs_df = pd.DataFrame({
+                    'Department': ['Contact Centre', 'Network Ops', 'Sales', 'IT', 'Corporate'],
+                    'Absence': [4.2, 3.1, 2.8, 2.4, 1.9]
+                })
+                abs_bar = alt.Chart(abs_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Absence:Q', title='%'),
+                    y=alt.Y('Department:N', sort='-x', title=None),
+                    color=alt.value('#F59E0B'),
+                    tooltip=['Department:N', alt.Tooltip('Absence:Q', format='.1f')]
+                ).properties(height=170)
+                charts.altair_chart(abs_bar, use_container_width=True)
+        
+        with cap_col2:
+            st.markdown("**Span of Control**")
+            with st.container(border=True):
+                span_df = pd.DataFrame({
+                    'Layer': ['Exec', 'Senior Mgr', 'Mgr', 'Lead'],
+                    'Span': [5.2, 6.8, 8.1, 9.4]
+                })
+                span_line = alt.Chart(span_df).mark_line(point=True, color='#8B5CF6', strokeWidth=2).encode(
+                    x=alt.X('Layer:N', title=None),
+                    y=alt.Y('Span:Q', title='Direct reports'),
+                    tooltip=['Layer:N', alt.Tooltip('Span:Q', format='.1f')]
+                ).properties(height=170)
+                charts.altair_chart(span_line, use_container_width=True)
+
+    with tab_strategy:
+        st.markdown("""
+        <div class="sf-chro-pulse">
+            <div class="sf-chro-header">
+                <div class="sf-chro-title">❄️ Snowflake Intelligence Pulse</div>
+                <div class="sf-chro-tag">AI INSIGHTS</div>
+            </div>
+            <div class="sf-chro-grid">
+                <div class="sf-chro-card">
+                    <div class="sf-chro-label">Engagement</div>
+                    <div class="sf-chro-value">3.8/5</div>
+                    <div class="sf-chro-delta">Target 4.0</div>
+                </div>
+                <div class="sf-chro-card">
+                    <div class="sf-chro-label">Attrition</div>
+                    <div class="sf-chro-value">14%</div>
+                    <div class="sf-chro-delta">↓ 2% YoY</div>
+                </div>
+                <div class="sf-chro-card">
+                    <div class="sf-chro-label">Hiring Velocity</div>
+                    <div class="sf-chro-value">32d</div>
+                    <div class="sf-chro-delta">Time to fill</div>
+                </div>
+                <div class="sf-chro-card">
+                    <div class="sf-chro-label">Training</div>
+                    <div class="sf-chro-value">94%</div>
+                    <div class="sf-chro-delta">Completion</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">AI Executive Summary</div>', unsafe_allow_html=True)
+        st.info("Engagement and eNPS continue to improve, but attrition remains elevated in contact centre roles. Hiring velocity is trending in the right direction while training completion is strong. Prioritize retention programs for high-attrition teams and accelerate internal mobility to close critical skills gaps.")
+        
+        st.markdown('<div class="section-header">Signals & Insights</div>', unsafe_allow_html=True)
+        sig_col1, sig_col2, sig_col3 = st.columns(3)
+        with sig_col1:
+            with st.container(border=True):
+                st.markdown("**Attrition Hotspots**")
+                st.caption("Contact Centre attrition remains the highest at 18% despite improved engagement.")
+        with sig_col2:
+            with st.container(border=True):
+                st.markdown("**Skills Gap Risk**")
+                st.caption("5G Core and AI/ML remain critical gaps with limited internal pipeline.")
+        with sig_col3:
+            with st.container(border=True):
+                st.markdown("**Mobility Lift**")
+                st.caption("Internal mobility up to 8.4% as mentoring and rotations expand.")
+        
+        st.markdown('<div class="section-header">AI‑Powered Strategic Recommendations</div>', unsafe_allow_html=True)
+        rec_col1, rec_col2, rec_col3 = st.columns(3)
+        with rec_col1:
+            with st.container(border=True):
+                st.markdown("**Targeted Retention**")
+                st.caption("Deploy retention packages for contact centre and high-performer cohorts.")
+        with rec_col2:
+            with st.container(border=True):
+                st.markdown("**Skills Acceleration**")
+                st.caption("Expand 5G and AI/ML bootcamps to certify 200 employees by Q2.")
+        with rec_col3:
+            with st.container(border=True):
+                st.markdown("**Manager Enablement**")
+                st.caption("Scale manager training to lift engagement by 0.2 points.")
+        
+        st.markdown('<div class="section-header">Strategic Priorities</div>', unsafe_allow_html=True)
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #DC2626; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 1</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Engagement 4.0</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **3.8**/5 score
+                - Gap: **0.2** to target
+                - Focus: Contact Centre
+                - Action: Manager training
+                """)
+        with col2:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #F59E0B; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 2</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Skills Gap Closure</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Critical: **5G**, **AI/ML**
+                - Hires: **15** specialists
+                - Training: **200** employees
+                - Budget: **£420K** approved
+                """)
+        with col3:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #10B981; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 3</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Turnover < 12%</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **14%** turnover
+                - Target: **<12%** by Q2
+                - Focus: High performers
+                - Action: Retention bonuses
+                """)
+        
+        st.markdown('<div class="section-header">Ask Snowflake Intelligence</div>', unsafe_allow_html=True)
+        questions = ["What is our headcount by department?", "What are our engagement scores by department?", "What is our eNPS and which teams have highest/lowest?", "What are our critical skills gaps?"]
+        sf_intel_url = "https://ai.snowflake.com/sfseeurope/pjose_aws3"
+        cols = st.columns(2)
+        for i, q in enumerate(questions):
+            with cols[i % 2]:
+                escaped_q = q.replace('"', '&quot;').replace("'", "&#39;")
+                st.markdown(f"""
+                <a href="{sf_intel_url}" target="_blank" onclick="navigator.clipboard.writeText('{escaped_q}')" style="text-decoration: none; color: inherit; display: block;">
+                    <div class="question-card">
+                        <p style="margin-bottom: 1.5rem;"><strong>Q{i+1}:</strong> "{q}"</p>
+                    </div>
+                </a>
+                """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div style="text-align: center; margin-top: 1rem; padding: 1rem; background: linear-gradient(135deg, #29B5E8 0%, #1A8BC4 100%); border-radius: 8px;">
+            <a href="{sf_intel_url}" target="_blank" style="color: white; text-decoration: none; font-weight: 600; font-size: 1rem;">
+                ❄️ Ask these questions in Snowflake Intelligence →
+            </a>
+        </div>
+        """, unsafe_allow_html=True)
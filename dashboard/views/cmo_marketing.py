@@ -0,0 +1,1076 @@
+"""CMO Marketing dashboard."""
+
+import streamlit as st
+import pandas as pd
+import altair as alt
+
+from dashboard import charts
+
+
+def render_cmo_marketing():
+    import pandas as pd
+    import altair as alt
+    
+    # CMO Header with Radar Scan Effect
+    st.markdown("""
+    <div class="cmo-header-wrap">
+        <div class="cmo-radar-bg">
+            <div class="cmo-radar-ring" style="width: 60px; height: 60px;"></div>
+            <div class="cmo-radar-ring" style="width: 120px; height: 120px;"></div>
+            <div class="cmo-radar-ring" style="width: 180px; height: 180px;"></div>
+            <div class="cmo-radar-sweep"></div>
+            <div class="cmo-ping" style="top: 30%; left: 60%; animation-delay: 0s;"></div>
+            <div class="cmo-ping" style="top: 60%; left: 75%; animation-delay: 1s;"></div>
+            <div class="cmo-target" style="top: 25%; left: 70%; animation-delay: 0.3s;"></div>
+            <div class="cmo-target" style="top: 70%; left: 30%; animation-delay: 0.8s;"></div>
+            <div class="cmo-target" style="top: 40%; left: 80%; animation-delay: 1.3s;"></div>
+        </div>
+        <div class="cmo-header-content">
+            <h1>CMO Marketing Dashboard</h1>
+            <p>Customer Acquisition, Campaign Performance & Brand Health</p>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Dashboard Tabs
+    tab_overview, tab_campaigns, tab_strategy = st.tabs(["📊 Overview & Analysis", "📣 Campaigns & Growth", "❄️ Snowflake Intelligence"])
+
+    with tab_overview:
+        
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['MARKETING', 'SALES', 'MOBILE', 'CUSTOMER_EXPERIENCE']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+        
+        # CMO CAMPAIGN RADAR ANIMATION
+        st.markdown("""<div class="cmo-radar"><div class="radar-container"><div class="radar-circle radar-c1"></div><div class="radar-circle radar-c2"></div><div class="radar-circle radar-c3"></div><div class="radar-sweep"></div><div class="radar-dot" style="top:20%;left:60%"></div><div class="radar-dot" style="top:65%;left:25%;animation-delay:0.5s"></div><div class="radar-dot" style="top:40%;left:75%;animation-delay:1s"></div><div class="radar-dot" style="top:70%;left:70%;animation-delay:1.5s"></div></div><div class="cmo-channels"><div class="channel-item"><div class="channel-name">📱 Digital Campaigns</div><div class="channel-val">847K</div><div class="channel-trend">↑ 23% reach</div></div><div class="channel-item"><div class="channel-name">📧 Email Marketing</div><div class="channel-val">34.2%</div><div class="channel-trend">↑ Open rate</div></div><div class="channel-item"><div class="channel-name">🎯 Conversion Rate</div><div class="channel-val">12.8%</div><div class="channel-trend">↑ +2.1 pts</div></div><div class="channel-item"><div class="channel-name">💰 Campaign ROI</div><div class="channel-val">4.2x</div><div class="channel-trend">↑ vs 3.5x target</div></div></div></div>""", unsafe_allow_html=True)
+        
+        
+        st.markdown('<div class="section-header">Marketing Performance Overview</div>', unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #EC4899;">
+                <div class="kpi-icon">🎯</div>
+                <div class="kpi-label">New Customers (MTD)</div>
+                <div class="kpi-value">2,847</div>
+                <div class="kpi-delta positive">↑ +18.3% vs target</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <path d="M0,35 L20,30 L40,32 L60,25 L80,20 L100,12" fill="none" stroke="#EC4899" stroke-width="2"/>
+                    <path d="M0,35 L20,30 L40,32 L60,25 L80,20 L100,12 L100,40 L0,40 Z" fill="#EC4899"/>
+                </svg>
+            </div>
+            <div class="kpi-card" style="--accent: #8B5CF6;">
+                <div class="kpi-icon">📊</div>
+                <div class="kpi-label">Campaign ROI</div>
+                <div class="kpi-value">4.2x</div>
+                <div class="kpi-delta positive">↑ +0.8x vs Q3</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <rect x="5" y="30" width="12" height="10" fill="#8B5CF6"/>
+                    <rect x="22" y="26" width="12" height="14" fill="#8B5CF6"/>
+                    <rect x="39" y="22" width="12" height="18" fill="#8B5CF6"/>
+                    <rect x="56" y="18" width="12" height="22" fill="#8B5CF6"/>
+                    <rect x="73" y="12" width="12" height="28" fill="#8B5CF6"/>
+                </svg>
+            </div>
+            <div class="kpi-card" style="--accent: #29B5E8;">
+                <div class="kpi-icon">💰</div>
+                <div class="kpi-label">Marketing Spend</div>
+                <div class="kpi-value">£1.8M</div>
+                <div class="kpi-delta neutral">92% of budget</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <path d="M0,28 L20,26 L40,28 L60,24 L80,22 L100,20" fill="none" stroke="#29B5E8" stroke-width="2"/>
+                    <path d="M0,28 L20,26 L40,28 L60,24 L80,22 L100,20 L100,40 L0,40 Z" fill="#29B5E8"/>
+                </svg>
+            </div>
+            <div class="kpi-card" style="--accent: #10B981;">
+                <div class="kpi-icon">⭐</div>
+                <div class="kpi-label">NPS Score</div>
+                <div class="kpi-value">+42</div>
+                <div class="kpi-delta positive">↑ +8 pts YoY</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <path d="M0,32 L20,30 L40,26 L60,22 L80,18 L100,14" fill="none" stroke="#10B981" stroke-width="2"/>
+                    <path d="M0,32 L20,30 L40,26 L60,22 L80,18 L100,14 L100,40 L0,40 Z" fill="#10B981"/>
+                </svg>
+            </div>
+        </div>
+        
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #F59E0B;">
+                <div class="kpi-icon">📱</div>
+                <div class="kpi-label">CAC (Consumer)</div>
+                <div class="kpi-value">£48</div>
+                <div class="kpi-delta positive">↓ -£6 vs Q3</div>
+            </div>
+            <div class="kpi-card" style="--accent: #14B8A6;">
+                <div class="kpi-icon">🏢</div>
+                <div class="kpi-label">CAC (Enterprise)</div>
+                <div class="kpi-value">£320</div>
+                <div class="kpi-delta positive">↓ -£45 vs Q3</div>
+            </div>
+            <div class="kpi-card" style="--accent: #6366F1;">
+                <div class="kpi-icon">🔄</div>
+                <div class="kpi-label">Churn Rate</div>
+                <div class="kpi-value">1.8%</div>
+                <div class="kpi-delta positive">↓ -0.4% YoY</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EF4444;">
+                <div class="kpi-icon">📈</div>
+                <div class="kpi-label">Brand Awareness</div>
+                <div class="kpi-value">68%</div>
+                <div class="kpi-delta positive">↑ +5% YoY</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        col_left, col_right = st.columns([1.3, 1])
+        
+        with col_left:
+            st.markdown('<div class="section-header">Campaign Performance by Channel</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <table style="width: 100%; border-collapse: collapse; font-size: 0.85rem;">
+                    <thead>
+                        <tr style="border-bottom: 2px solid #E5E7EB;">
+                            <th style="text-align: left; padding: 0.5rem; color: #6B7280;">Channel</th>
+                            <th style="text-align: right; padding: 0.5rem; color: #6B7280;">Spend</th>
+                            <th style="text-align: right; padding: 0.5rem; color: #6B7280;">Leads</th>
+                            <th style="text-align: right; padding: 0.5rem; color: #6B7280;">Conv.</th>
+                            <th style="text-align: right; padding: 0.5rem; color: #6B7280;">ROI</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.6rem 0.5rem;"><span style="display: inline-block; width: 8px; height: 8px; background: #29B5E8; border-radius: 50%; margin-right: 8px;"></span>Digital Paid</td>
+                            <td style="text-align: right; padding: 0.6rem 0.5rem; font-weight: 600;">£420K</td>
+                            <td style="text-align: right; padding: 0.6rem 0.5rem;">4,200</td>
+                            <td style="text-align: right; padding: 0.6rem 0.5rem;">840</td>
+                            <td style="text-align: right; padding: 0.6rem 0.5rem;"><span style="background: #D1FAE5; color: #059669; padding: 0.15rem 0.5rem; border-radius: 12px; font-weight: 600;">5.2x</span></td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.6rem 0.5rem;"><span style="display: inline-block; width: 8px; height: 8px; background: #8B5CF6; border-radius: 50%; margin-right: 8px;"></span>TV/Radio</td>
+                            <td style="text-align: right; padding: 0.6rem 0.5rem; font-weight: 600;">£350K</td>
+                            <td style="text-align: right; padding: 0.6rem 0.5rem;">1,800</td>
+                            <td style="text-align: right; padding: 0.6rem 0.5rem;">270</td>
+                            <td style="text-align: right; padding: 0.6rem 0.5rem;"><span style="background: #FEF3C7; color: #D97706; padding: 0.15rem 0.5rem; border-radius: 12px; font-weight: 600;">2.1x</span></td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.6rem 0.5rem;"><span style="display: inline-block; width: 8px; height: 8px; background: #EC4899; border-radius: 50%; margin-right: 8px;"></span>Social Media</td>
+                            <td style="text-align: right; padding: 0.6rem 0.5rem; font-weight: 600;">£280K</td>
+                            <td style="text-align: right; padding: 0.6rem 0.5rem;">3,100</td>
+                            <td style="text-align: right; padding: 0.6rem 0.5rem;">620</td>
+                            <td style="text-align: right; padding: 0.6rem 0.5rem;"><span style="background: #D1FAE5; color: #059669; padding: 0.15rem 0.5rem; border-radius: 12px; font-weight: 600;">4.8x</span></td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.6rem 0.5rem;"><span style="display: inline-block; width: 8px; height: 8px; background: #F59E0B; border-radius: 50%; margin-right: 8px;"></span>Partnerships</td>
+                            <td style="text-align: right; padding: 0.6rem 0.5rem; font-weight: 600;">£180K</td>
+                            <td style="text-align: right; padding: 0.6rem 0.5rem;">1,200</td>
+                            <td style="text-align: right; padding: 0.6rem 0.5rem;">240</td>
+                            <td style="text-align: right; padding: 0.6rem 0.5rem;"><span style="background: #D1FAE5; color: #059669; padding: 0.15rem 0.5rem; border-radius: 12px; font-weight: 600;">3.6x</span></td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.6rem 0.5rem;"><span style="display: inline-block; width: 8px; height: 8px; background: #10B981; border-radius: 50%; margin-right: 8px;"></span>SEO/Organic</td>
+                            <td style="text-align: right; padding: 0.6rem 0.5rem; font-weight: 600;">£120K</td>
+                            <td style="text-align: right; padding: 0.6rem 0.5rem;">2,400</td>
+                            <td style="text-align: right; padding: 0.6rem 0.5rem;">480</td>
+                            <td style="text-align: right; padding: 0.6rem 0.5rem;"><span style="background: #DCFCE7; color: #15803D; padding: 0.15rem 0.5rem; border-radius: 12px; font-weight: 600;">12.4x</span></td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.6rem 0.5rem;"><span style="display: inline-block; width: 8px; height: 8px; background: #6366F1; border-radius: 50%; margin-right: 8px;"></span>Events</td>
+                            <td style="text-align: right; padding: 0.6rem 0.5rem; font-weight: 600;">£95K</td>
+                            <td style="text-align: right; padding: 0.6rem 0.5rem;">450</td>
+                            <td style="text-align: right; padding: 0.6rem 0.5rem;">90</td>
+                            <td style="text-align: right; padding: 0.6rem 0.5rem;"><span style="background: #FEF3C7; color: #D97706; padding: 0.15rem 0.5rem; border-radius: 12px; font-weight: 600;">2.4x</span></td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.6rem 0.5rem;"><span style="display: inline-block; width: 8px; height: 8px; background: #14B8A6; border-radius: 50%; margin-right: 8px;"></span>Email</td>
+                            <td style="text-align: right; padding: 0.6rem 0.5rem; font-weight: 600;">£85K</td>
+                            <td style="text-align: right; padding: 0.6rem 0.5rem;">2,800</td>
+                            <td style="text-align: right; padding: 0.6rem 0.5rem;">560</td>
+                            <td style="text-align: right; padding: 0.6rem 0.5rem;"><span style="background: #DCFCE7; color: #15803D; padding: 0.15rem 0.5rem; border-radius: 12px; font-weight: 600;">8.2x</span></td>
+                        </tr>
+                        <tr>
+                            <td style="padding: 0.6rem 0.5rem;"><span style="display: inline-block; width: 8px; height: 8px; background: #EF4444; border-radius: 50%; margin-right: 8px;"></span>Referral</td>
+                            <td style="text-align: right; padding: 0.6rem 0.5rem; font-weight: 600;">£70K</td>
+                            <td style="text-align: right; padding: 0.6rem 0.5rem;">1,100</td>
+                            <td style="text-align: right; padding: 0.6rem 0.5rem;">330</td>
+                            <td style="text-align: right; padding: 0.6rem 0.5rem;"><span style="background: #DCFCE7; color: #15803D; padding: 0.15rem 0.5rem; border-radius: 12px; font-weight: 600;">9.8x</span></td>
+                        </tr>
+                    </tbody>
+                </table>
+                """, unsafe_allow_html=True)
+                
+                ch_cols = st.columns(3)
+                with ch_cols[0]:
+                    st.markdown("""
+                    <div style="background: linear-gradient(135deg, #FDF4FF 0%, #FAE8FF 100%); border-left: 4px solid #EC4899; border-radius: 0 8px 8px 0; padding: 0.75rem;">
+                        <div style="font-weight: 600; color: #EC4899; font-size: 0.85rem;">Total Spend</div>
+                        <div style="font-size: 1.3rem; font-weight: 700; color: #1B2A4E;">£1.6M</div>
+                    </div>
+                    """, unsafe_allow_html=True)
+                with ch_cols[1]:
+                    st.markdown("""
+                    <div style="background: linear-gradient(135deg, #D1FAE5 0%, #ECFDF5 100%); border-left: 4px solid #10B981; border-radius: 0 8px 8px 0; padding: 0.75rem;">
+                        <div style="font-weight: 600; color: #10B981; font-size: 0.85rem;">Total Leads</div>
+                        <div style="font-size: 1.3rem; font-weight: 700; color: #1B2A4E;">17,050</div>
+                    </div>
+                    """, unsafe_allow_html=True)
+                with ch_cols[2]:
+                    st.markdown("""
+                    <div style="background: linear-gradient(135deg, #EDE9FE 0%, #F5F3FF 100%); border-left: 4px solid #8B5CF6; border-radius: 0 8px 8px 0; padding: 0.75rem;">
+                        <div style="font-weight: 600; color: #8B5CF6; font-size: 0.85rem;">Avg ROI</div>
+                        <div style="font-size: 1.3rem; font-weight: 700; color: #1B2A4E;">4.2x</div>
+                    </div>
+                    """, unsafe_allow_html=True)
+        
+        with col_right:
+            st.markdown('<div class="section-header">Customer Acquisition Funnel</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <div style="text-align: center;">
+                    <div style="position: relative; margin: 0.5rem auto;">
+                        <div style="background: linear-gradient(90deg, #8B5CF6 0%, #A78BFA 100%); color: white; padding: 0.75rem; border-radius: 8px 8px 0 0; font-weight: 600; width: 100%;">
+                            <div style="display: flex; justify-content: space-between; align-items: center;">
+                                <span>Impressions</span>
+                                <span style="font-size: 1.1rem;">2.45M</span>
+                            </div>
+                        </div>
+                        <div style="background: linear-gradient(90deg, #A855F7 0%, #C084FC 100%); color: white; padding: 0.65rem; font-weight: 600; width: 85%; margin: 0 auto;">
+                            <div style="display: flex; justify-content: space-between; align-items: center;">
+                                <span>Clicks</span>
+                                <span>98K <span style="font-size: 0.7rem; opacity: 0.8;">4.0%</span></span>
+                            </div>
+                        </div>
+                        <div style="background: linear-gradient(90deg, #C084FC 0%, #D8B4FE 100%); color: white; padding: 0.6rem; font-weight: 600; width: 65%; margin: 0 auto;">
+                            <div style="display: flex; justify-content: space-between; align-items: center;">
+                                <span>Leads</span>
+                                <span>17K <span style="font-size: 0.7rem; opacity: 0.8;">17.4%</span></span>
+                            </div>
+                        </div>
+                        <div style="background: linear-gradient(90deg, #D8B4FE 0%, #E9D5FF 100%); color: #5B21B6; padding: 0.55rem; font-weight: 600; width: 45%; margin: 0 auto;">
+                            <div style="display: flex; justify-content: space-between; align-items: center;">
+                                <span>Qualified</span>
+                                <span>6.8K <span style="font-size: 0.7rem; opacity: 0.7;">40%</span></span>
+                            </div>
+                        </div>
+                        <div style="background: linear-gradient(90deg, #10B981 0%, #34D399 100%); color: white; padding: 0.5rem; border-radius: 0 0 8px 8px; font-weight: 600; width: 30%; margin: 0 auto;">
+                            <div style="display: flex; justify-content: space-between; align-items: center;">
+                                <span>Converted</span>
+                                <span>2.8K</span>
+                            </div>
+                        </div>
+                    </div>
+                    <div style="margin-top: 1rem; padding: 0.75rem; background: #F0FDF4; border-radius: 8px; border: 1px solid #BBF7D0;">
+                        <div style="font-size: 0.8rem; color: #166534;">Overall Conversion Rate</div>
+                        <div style="font-size: 1.5rem; font-weight: 700; color: #15803D;">0.12%</div>
+                        <div style="font-size: 0.75rem; color: #22C55E;">↑ +0.02% vs last quarter</div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            st.markdown('<div class="section-header">Brand Sentiment</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                sentiment_data = pd.DataFrame({
+                    'Sentiment': ['Positive', 'Neutral', 'Negative'],
+                    'Percentage': [62, 28, 10],
+                    'Count': [18600, 8400, 3000]
+                })
+                
+                donut = alt.Chart(sentiment_data).mark_arc(innerRadius=50, outerRadius=85, cornerRadius=4).encode(
+                    theta=alt.Theta('Percentage:Q', stack=True),
+                    color=alt.Color('Sentiment:N',
+                        scale=alt.Scale(
+                            domain=['Positive', 'Neutral', 'Negative'],
+                            range=['#10B981', '#6B7280', '#EF4444']
+                        ),
+                        legend=None
+                    ),
+                    tooltip=[
+                        alt.Tooltip('Sentiment:N'),
+                        alt.Tooltip('Percentage:Q', format='d'),
+                        alt.Tooltip('Count:Q', title='Mentions', format=',')
+                    ]
+                ).properties(height=160)
+                
+                center_text = alt.Chart(pd.DataFrame({'text': ['62%']})).mark_text(
+                    fontSize=24, fontWeight='bold', color='#10B981'
+                ).encode(text='text:N')
+                
+                charts.altair_chart(donut + center_text, use_container_width=True)
+                
+                st.markdown("""
+                <div style="display: flex; justify-content: space-around; font-size: 0.8rem; text-align: center;">
+                    <div><span style="color: #10B981;">●</span> Positive 62%</div>
+                    <div><span style="color: #6B7280;">●</span> Neutral 28%</div>
+                    <div><span style="color: #EF4444;">●</span> Negative 10%</div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Monthly Acquisition & Churn Trends</div>', unsafe_allow_html=True)
+        
+        with st.container(border=True):
+            col_acq, col_churn = st.columns(2)
+            
+            with col_acq:
+                acq_data = pd.DataFrame({
+                    'Month': ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan'],
+                    'Consumer': [1850, 1920, 2100, 2280, 2450, 2520],
+                    'SMB': [180, 195, 210, 225, 240, 252],
+                    'Enterprise': [45, 52, 58, 62, 68, 75]
+                })
+                
+                acq_melted = acq_data.melt('Month', var_name='Segment', value_name='New Customers')
+                
+                acq_chart = alt.Chart(acq_melted).mark_area(opacity=0.7).encode(
+                    x=alt.X('Month:N', sort=['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan'], title=None),
+                    y=alt.Y('New Customers:Q', stack='zero', title='New Customers'),
+                    color=alt.Color('Segment:N',
+                        scale=alt.Scale(
+                            domain=['Consumer', 'SMB', 'Enterprise'],
+                            range=['#29B5E8', '#10B981', '#8B5CF6']
+                        ),
+                        legend=alt.Legend(orient='top', title=None)
+                    ),
+                    tooltip=[
+                        alt.Tooltip('Month:N'),
+                        alt.Tooltip('Segment:N'),
+                        alt.Tooltip('New Customers:Q', format=',')
+                    ]
+                ).properties(height=220, title='New Customer Acquisition')
+                
+                charts.altair_chart(acq_chart, use_container_width=True)
+            
+            with col_churn:
+                churn_data = pd.DataFrame({
+                    'Month': ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan'],
+                    'Churn Rate': [2.4, 2.2, 2.1, 1.9, 1.8, 1.8],
+                    'Target': [2.0, 2.0, 2.0, 2.0, 2.0, 2.0],
+                    'Churned': [720, 660, 630, 570, 540, 540]
+                })
+                
+                base = alt.Chart(churn_data).encode(
+                    x=alt.X('Month:N', sort=['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan'], title=None)
+                )
+                
+                bars = base.mark_bar(color='#EF4444', opacity=0.7, cornerRadiusTopLeft=4, cornerRadiusTopRight=4).encode(
+                    y=alt.Y('Churn Rate:Q', title='Churn Rate (%)', scale=alt.Scale(domain=[0, 3])),
+                    tooltip=[alt.Tooltip('Month:N'), alt.Tooltip('Churn Rate:Q', format='.1f'), alt.Tooltip('Churned:Q', format=',')]
+                )
+                
+                target_line = base.mark_line(color='#10B981', strokeWidth=2, strokeDash=[5, 3]).encode(
+                    y='Target:Q'
+                )
+                
+                charts.altair_chart((bars + target_line).properties(height=220, title='Churn Rate Trend'), use_container_width=True)
+        
+        col_ltv, col_segment = st.columns(2)
+        
+        with col_ltv:
+            st.markdown('<div class="section-header">Customer LTV by Segment</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                ltv_data = pd.DataFrame({
+                    'Segment': ['Budget', 'Standard', 'Premium', 'VIP', 'SMB Small', 'SMB Medium', 'Enterprise'],
+                    'LTV': [180, 420, 840, 1680, 1200, 2400, 8500],
+                    'CAC': [35, 45, 65, 120, 180, 280, 420],
+                    'Type': ['Consumer', 'Consumer', 'Consumer', 'Consumer', 'SMB', 'SMB', 'Enterprise']
+                })
+                
+                ltv_data['Ratio'] = (ltv_data['LTV'] / ltv_data['CAC']).round(1)
+                
+                lollipop_line = alt.Chart(ltv_data).mark_rule(strokeWidth=3).encode(
+                    x=alt.X('LTV:Q', title='Lifetime Value (£)', scale=alt.Scale(domain=[0, 9000])),
+                    x2=alt.value(0),
+                    y=alt.Y('Segment:N', sort=alt.EncodingSortField(field='LTV', order='descending'), title=None),
+                    color=alt.Color('Type:N',
+                        scale=alt.Scale(
+                            domain=['Consumer', 'SMB', 'Enterprise'],
+                            range=['#29B5E8', '#10B981', '#8B5CF6']
+                        ),
+                        legend=alt.Legend(orient='top', title=None)
+                    )
+                )
+                
+                lollipop_point = alt.Chart(ltv_data).mark_circle(size=200).encode(
+                    x='LTV:Q',
+                    y=alt.Y('Segment:N', sort=alt.EncodingSortField(field='LTV', order='descending')),
+                    color='Type:N',
+                    tooltip=[
+                        alt.Tooltip('Segment:N'),
+                        alt.Tooltip('LTV:Q', title='LTV (£)', format=','),
+                        alt.Tooltip('CAC:Q', title='CAC (£)', format=','),
+                        alt.Tooltip('Ratio:Q', title='LTV:CAC Ratio', format='.1f')
+                    ]
+                )
+                
+                text_labels = alt.Chart(ltv_data).mark_text(align='left', dx=12, fontSize=10, fontWeight='bold').encode(
+                    x='LTV:Q',
+                    y=alt.Y('Segment:N', sort=alt.EncodingSortField(field='LTV', order='descending')),
+                    text=alt.Text('Ratio:Q', format='.0fx'),
+                    color=alt.value('#10B981')
+                )
+                
+                charts.altair_chart((lollipop_line + lollipop_point + text_labels).properties(height=240), use_container_width=True)
+        
+        with col_segment:
+            st.markdown('<div class="section-header">Campaign Calendar — Q1 2026</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="display: flex; align-items: center; padding: 0.6rem; background: #FDF4FF; border-radius: 8px; margin-bottom: 0.5rem;">
+                        <span style="background: #EC4899; color: white; padding: 0.2rem 0.5rem; border-radius: 4px; font-size: 0.7rem; margin-right: 0.75rem;">LIVE</span>
+                        <div>
+                            <div style="font-weight: 600; color: #1B2A4E;">5G Launch Campaign</div>
+                            <div style="color: #6B7280; font-size: 0.75rem;">Jan 15 - Mar 31 · £450K budget</div>
+                        </div>
+                    </div>
+                    <div style="display: flex; align-items: center; padding: 0.6rem; background: #E0F2FE; border-radius: 8px; margin-bottom: 0.5rem;">
+                        <span style="background: #29B5E8; color: white; padding: 0.2rem 0.5rem; border-radius: 4px; font-size: 0.7rem; margin-right: 0.75rem;">LIVE</span>
+                        <div>
+                            <div style="font-weight: 600; color: #1B2A4E;">Valentine's Promo</div>
+                            <div style="color: #6B7280; font-size: 0.75rem;">Feb 1 - Feb 14 · £80K budget</div>
+                        </div>
+                    </div>
+                    <div style="display: flex; align-items: center; padding: 0.6rem; background: #F3F4F6; border-radius: 8px; margin-bottom: 0.5rem;">
+                        <span style="background: #6B7280; color: white; padding: 0.2rem 0.5rem; border-radius: 4px; font-size: 0.7rem; margin-right: 0.75rem;">PLANNED</span>
+                        <div>
+                            <div style="font-weight: 600; color: #1B2A4E;">Spring Switch Campaign</div>
+                            <div style="color: #6B7280; font-size: 0.75rem;">Mar 1 - Mar 31 · £200K budget</div>
+                        </div>
+                    </div>
+                    <div style="display: flex; align-items: center; padding: 0.6rem; background: #D1FAE5; border-radius: 8px;">
+                        <span style="background: #10B981; color: white; padding: 0.2rem 0.5rem; border-radius: 4px; font-size: 0.7rem; margin-right: 0.75rem;">COMPLETE</span>
+                        <div>
+                            <div style="font-weight: 600; color: #1B2A4E;">New Year Offer</div>
+                            <div style="color: #6B7280; font-size: 0.75rem;">Dec 26 - Jan 7 · 4.8x ROI achieved</div>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+    with tab_campaigns:
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['MARKETING', 'CUSTOMER_EXPERIENCE', 'DIGITAL', 'SALES']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+        st.markdown("""
+        <div class="cmo-campaign-pulse">
+            <div class="cmo-campaign-header">
+                <div class="cmo-campaign-title">📣 Campaign Pulse</div>
+                <div class="cmo-campaign-tag">LIVE</div>
+            </div>
+            <div class="cmo-campaign-grid">
+                <div class="cmo-campaign-card">
+                    <div class="cmo-campaign-label">Active Campaigns</div>
+                    <div class="cmo-campaign-value">6</div>
+                    <div class="cmo-campaign-sub">2 launches this month</div>
+                </div>
+                <div class="cmo-campaign-card">
+                    <div class="cmo-campaign-label">Conversion Rate</div>
+                    <div class="cmo-campaign-value">12.8%</div>
+                    <div class="cmo-campaign-sub">+2.1 pts QoQ</div>
+                </div>
+                <div class="cmo-campaign-card">
+                    <div class="cmo-campaign-label">Top Channel ROI</div>
+                    <div class="cmo-campaign-value">12.4x</div>
+                    <div class="cmo-campaign-sub">SEO/Organic</div>
+                </div>
+                <div class="cmo-campaign-card">
+                    <div class="cmo-campaign-label">Net New Adds</div>
+                    <div class="cmo-campaign-value">+2,847</div>
+                    <div class="cmo-campaign-sub">MTD performance</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        st.markdown('<div class="section-header">Campaigns & Growth</div>', unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Monthly Acquisition & Churn Trends</div>', unsafe_allow_html=True)
+        
+        with st.container(border=True):
+            col_acq, col_churn = st.columns(2)
+            
+            with col_acq:
+                acq_data = pd.DataFrame({
+                    'Month': ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan'],
+                    'Consumer': [1850, 1920, 2100, 2280, 2450, 2520],
+                    'SMB': [180, 195, 210, 225, 240, 252],
+                    'Enterprise': [45, 52, 58, 62, 68, 75]
+                })
+                
+                acq_melted = acq_data.melt('Month', var_name='Segment', value_name='New Customers')
+                
+                acq_chart = alt.Chart(acq_melted).mark_area(opacity=0.7).encode(
+                    x=alt.X('Month:N', sort=['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan'], title=None),
+                    y=alt.Y('New Customers:Q', stack='zero', title='New Customers'),
+                    color=alt.Color('Segment:N',
+                        scale=alt.Scale(
+                            domain=['Consumer', 'SMB', 'Enterprise'],
+                            range=['#29B5E8', '#10B981', '#8B5CF6']
+                        ),
+                        legend=alt.Legend(orient='top', title=None)
+                    ),
+                    tooltip=[
+                        alt.Tooltip('Month:N'),
+                        alt.Tooltip('Segment:N'),
+                        alt.Tooltip('New Customers:Q', format=',')
+                    ]
+                ).properties(height=220, title='New Customer Acquisition')
+                
+                charts.altair_chart(acq_chart, use_container_width=True)
+            
+            with col_churn:
+                churn_data = pd.DataFrame({
+                    'Month': ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan'],
+                    'Churn Rate': [2.4, 2.2, 2.1, 1.9, 1.8, 1.8],
+                    'Target': [2.0, 2.0, 2.0, 2.0, 2.0, 2.0],
+                    'Churned': [720, 660, 630, 570, 540, 540]
+                })
+                
+                base = alt.Chart(churn_data).encode(
+                    x=alt.X('Month:N', sort=['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan'], title=None)
+                )
+                
+                bars = base.mark_bar(color='#EF4444', opacity=0.7, cornerRadiusTopLeft=4, cornerRadiusTopRight=4).encode(
+                    y=alt.Y('Churn Rate:Q', title='Churn Rate (%)', scale=alt.Scale(domain=[0, 3])),
+                    tooltip=[alt.Tooltip('Month:N'), alt.Tooltip('Churn Rate:Q', format='.1f'), alt.Tooltip('Churned:Q', format=',')]
+                )
+                
+                target_line = base.mark_line(color='#10B981', strokeWidth=2, strokeDash=[5, 3]).encode(
+                    y='Target:Q'
+                )
+                
+                charts.altair_chart((bars + target_line).properties(height=220, title='Churn Rate Trend'), use_container_width=True)
+        
+        st.markdown('<div class="section-header">Campaign Calendar — Q1 2026</div>', unsafe_allow_html=True)
+        
+        with st.container(border=True):
+            st.markdown("""
+            <div style="font-size: 0.85rem;">
+                <div style="display: flex; align-items: center; padding: 0.6rem; background: #FDF4FF; border-radius: 8px; margin-bottom: 0.5rem;">
+                    <span style="background: #EC4899; color: white; padding: 0.2rem 0.5rem; border-radius: 4px; font-size: 0.7rem; margin-right: 0.75rem;">LIVE</span>
+                    <div>
+                        <div style="font-weight: 600; color: #1B2A4E;">5G Launch Campaign</div>
+                        <div style="color: #6B7280; font-size: 0.75rem;">Jan 15 - Mar 31 · £450K budget</div>
+                    </div>
+                </div>
+                <div style="display: flex; align-items: center; padding: 0.6rem; background: #E0F2FE; border-radius: 8px; margin-bottom: 0.5rem;">
+                    <span style="background: #29B5E8; color: white; padding: 0.2rem 0.5rem; border-radius: 4px; font-size: 0.7rem; margin-right: 0.75rem;">LIVE</span>
+                    <div>
+                        <div style="font-weight: 600; color: #1B2A4E;">Valentine's Promo</div>
+                        <div style="color: #6B7280; font-size: 0.75rem;">Feb 1 - Feb 14 · £80K budget</div>
+                    </div>
+                </div>
+                <div style="display: flex; align-items: center; padding: 0.6rem; background: #F3F4F6; border-radius: 8px; margin-bottom: 0.5rem;">
+                    <span style="background: #6B7280; color: white; padding: 0.2rem 0.5rem; border-radius: 4px; font-size: 0.7rem; margin-right: 0.75rem;">PLANNED</span>
+                    <div>
+                        <div style="font-weight: 600; color: #1B2A4E;">Spring Switch Campaign</div>
+                        <div style="color: #6B7280; font-size: 0.75rem;">Mar 1 - Mar 31 · £200K budget</div>
+                    </div>
+                </div>
+                <div style="display: flex; align-items: center; padding: 0.6rem; background: #D1FAE5; border-radius: 8px;">
+                    <span style="background: #10B981; color: white; padding: 0.2rem 0.5rem; border-radius: 4px; font-size: 0.7rem; margin-right: 0.75rem;">COMPLETE</span>
+                    <div>
+                        <div style="font-weight: 600; color: #1B2A4E;">New Year Offer</div>
+                        <div style="color: #6B7280; font-size: 0.75rem;">Dec 26 - Jan 7 · 4.8x ROI achieved</div>
+                    </div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Customer Insights & Retention</div>', unsafe_allow_html=True)
+        
+        seg_col, demo_col, acq_col = st.columns(3)
+        
+        with seg_col:
+            st.markdown("**Customer Segmentation by Value**")
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>🥇 Platinum</span><span style="font-weight: 600;">12,450 <span style="color: #10B981;">£85 ARPU</span></span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 16px;">
+                            <div style="background: linear-gradient(90deg, #6366F1, #8B5CF6); width: 15%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>🥈 Gold</span><span style="font-weight: 600;">28,320 <span style="color: #10B981;">£52 ARPU</span></span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 16px;">
+                            <div style="background: linear-gradient(90deg, #F59E0B, #FBBF24); width: 35%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>🥉 Silver</span><span style="font-weight: 600;">42,180 <span style="color: #6B7280;">£32 ARPU</span></span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 16px;">
+                            <div style="background: #9CA3AF; width: 52%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div>
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Bronze</span><span style="font-weight: 600;">18,250 <span style="color: #6B7280;">£18 ARPU</span></span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 16px;">
+                            <div style="background: #D1D5DB; width: 22%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                </div>
+                <div style="text-align: center; margin-top: 0.5rem; font-size: 0.75rem; color: #6B7280;">Total: 101,200 B2C Customers</div>
+                """, unsafe_allow_html=True)
+        
+        with demo_col:
+            st.markdown("**Age Demographics**")
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>18-24</span><span style="font-weight: 600;">14%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 14px;">
+                            <div style="background: #8B5CF6; width: 14%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>25-34</span><span style="font-weight: 600;">28%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 14px;">
+                            <div style="background: #6366F1; width: 28%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>35-44</span><span style="font-weight: 600;">24%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 14px;">
+                            <div style="background: #3B82F6; width: 24%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>45-54</span><span style="font-weight: 600;">18%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 14px;">
+                            <div style="background: #29B5E8; width: 18%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div>
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>55+</span><span style="font-weight: 600;">16%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 14px;">
+                            <div style="background: #10B981; width: 16%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                </div>
+                <div style="text-align: center; margin-top: 0.5rem; font-size: 0.75rem; color: #6B7280;">Median Age: 38</div>
+                """, unsafe_allow_html=True)
+        
+        with acq_col:
+            st.markdown("**Acquisition Channels**")
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Digital (Web/App)</span><span style="font-weight: 600; color: #10B981;">42%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 14px;">
+                            <div style="background: #10B981; width: 42%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Retail Store</span><span style="font-weight: 600;">28%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 14px;">
+                            <div style="background: #29B5E8; width: 28%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Telesales</span><span style="font-weight: 600;">15%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 14px;">
+                            <div style="background: #F59E0B; width: 15%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Partner/Reseller</span><span style="font-weight: 600;">10%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 14px;">
+                            <div style="background: #8B5CF6; width: 10%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div>
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Referral</span><span style="font-weight: 600;">5%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 14px;">
+                            <div style="background: #EC4899; width: 5%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                </div>
+                <div style="text-align: center; margin-top: 0.5rem; font-size: 0.75rem; color: #10B981;">Digital +8% YoY</div>
+                """, unsafe_allow_html=True)
+        
+        ret_col, engage_col = st.columns(2)
+        
+        with ret_col:
+            st.markdown("**Retention Cohorts (12 Month)**")
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>0-12 months</span>
+                        <span><strong>92%</strong> retained</span>
+                        <span style="color: #10B981;">▲ 2%</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>12-24 months</span>
+                        <span><strong>88%</strong> retained</span>
+                        <span style="color: #10B981;">▲ 1%</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>24-36 months</span>
+                        <span><strong>81%</strong> retained</span>
+                        <span style="color: #DC2626;">▼ 3%</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>36-48 months</span>
+                        <span><strong>85%</strong> retained</span>
+                        <span style="color: #10B981;">▲ 1%</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0;">
+                        <span>48+ months</span>
+                        <span><strong>94%</strong> retained</span>
+                        <span style="color: #10B981;">▲ 3%</span>
+                    </div>
+                </div>
+                <div style="text-align: center; margin-top: 0.5rem; font-size: 0.75rem; color: #DC2626;">⚠️ 24-36 mo cohort needs attention</div>
+                """, unsafe_allow_html=True)
+        
+        with engage_col:
+            st.markdown("**Digital Engagement**")
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; justify-content: space-around; text-align: center; padding: 0.5rem 0;">
+                    <div>
+                        <div style="font-size: 1.5rem; font-weight: 700; color: #29B5E8;">68%</div>
+                        <div style="font-size: 0.75rem; color: #6B7280;">App Active</div>
+                        <div style="font-size: 0.7rem; color: #10B981;">▲ 5%</div>
+                    </div>
+                    <div>
+                        <div style="font-size: 1.5rem; font-weight: 700; color: #10B981;">4.2M</div>
+                        <div style="font-size: 0.75rem; color: #6B7280;">Monthly Logins</div>
+                        <div style="font-size: 0.7rem; color: #10B981;">▲ 12%</div>
+                    </div>
+                    <div>
+                        <div style="font-size: 1.5rem; font-weight: 700; color: #8B5CF6;">72%</div>
+                        <div style="font-size: 0.75rem; color: #6B7280;">Self-Service</div>
+                        <div style="font-size: 0.7rem; color: #10B981;">▲ 8%</div>
+                    </div>
+                </div>
+                <div style="margin-top: 0.5rem; padding-top: 0.5rem; border-top: 1px solid #E5E7EB;">
+                    <div style="font-size: 0.8rem; text-align: center;">
+                        <span style="color: #1B2A4E; font-weight: 600;">Top Actions:</span> Bill Pay (34%) • Usage Check (28%) • Support (18%)
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        
+    with tab_strategy:
+        st.markdown('<div class="section-header">CMO Strategic Priorities — Q1 2026</div>', unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #DC2626; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 1</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Drive 5G Adoption</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Target: **15,000** 5G upgrades Q1
+                - Current pace: **12,400** (83%)
+                - £450K campaign budget allocated
+                - Focus on Premium/VIP segments
+                """)
+        
+        with col2:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #F59E0B; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 2</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Reduce CAC by 15%</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Consumer CAC: **£48** → £41 target
+                - Optimize digital spend allocation
+                - Increase referral program ROI
+                - Current progress: **-12.5%**
+                """)
+        
+        with col3:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #10B981; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 3</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">NPS to +50</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current NPS: **+42** (target: +50)
+                - Focus on detractor recovery
+                - Enhance onboarding experience
+                - Launch loyalty program Q2
+                """)
+        
+        # B2C Customer Insights Section
+        st.markdown('<div class="section-header">B2C Customer Insights</div>', unsafe_allow_html=True)
+        
+        if st.session_state.get('sf_highlights', True):
+            st.info("❄️ **Powered by Snowflake** — Customer segmentation using Cortex ML Classification and Sentiment Analysis on social data with CORTEX.SENTIMENT()")
+        
+        seg_col, demo_col, acq_col = st.columns(3)
+        
+        with seg_col:
+            st.markdown("**Customer Segmentation by Value**")
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>🥇 Platinum</span><span style="font-weight: 600;">12,450 <span style="color: #10B981;">£85 ARPU</span></span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 16px;">
+                            <div style="background: linear-gradient(90deg, #6366F1, #8B5CF6); width: 15%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>🥈 Gold</span><span style="font-weight: 600;">28,320 <span style="color: #10B981;">£52 ARPU</span></span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 16px;">
+                            <div style="background: linear-gradient(90deg, #F59E0B, #FBBF24); width: 35%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>🥉 Silver</span><span style="font-weight: 600;">42,180 <span style="color: #6B7280;">£32 ARPU</span></span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 16px;">
+                            <div style="background: #9CA3AF; width: 52%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div>
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Bronze</span><span style="font-weight: 600;">18,250 <span style="color: #6B7280;">£18 ARPU</span></span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 16px;">
+                            <div style="background: #D1D5DB; width: 22%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                </div>
+                <div style="text-align: center; margin-top: 0.5rem; font-size: 0.75rem; color: #6B7280;">Total: 101,200 B2C Customers</div>
+                """, unsafe_allow_html=True)
+        
+        with demo_col:
+            st.markdown("**Age Demographics**")
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>18-24</span><span style="font-weight: 600;">14%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 14px;">
+                            <div style="background: #8B5CF6; width: 14%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>25-34</span><span style="font-weight: 600;">28%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 14px;">
+                            <div style="background: #6366F1; width: 28%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>35-44</span><span style="font-weight: 600;">24%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 14px;">
+                            <div style="background: #3B82F6; width: 24%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>45-54</span><span style="font-weight: 600;">18%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 14px;">
+                            <div style="background: #29B5E8; width: 18%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div>
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>55+</span><span style="font-weight: 600;">16%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 14px;">
+                            <div style="background: #10B981; width: 16%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                </div>
+                <div style="text-align: center; margin-top: 0.5rem; font-size: 0.75rem; color: #6B7280;">Median Age: 38</div>
+                """, unsafe_allow_html=True)
+        
+        with acq_col:
+            st.markdown("**Acquisition Channels**")
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Digital (Web/App)</span><span style="font-weight: 600; color: #10B981;">42%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 14px;">
+                            <div style="background: #10B981; width: 42%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Retail Store</span><span style="font-weight: 600;">28%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 14px;">
+                            <div style="background: #29B5E8; width: 28%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Telesales</span><span style="font-weight: 600;">15%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 14px;">
+                            <div style="background: #F59E0B; width: 15%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Partner/Reseller</span><span style="font-weight: 600;">10%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 14px;">
+                            <div style="background: #8B5CF6; width: 10%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div>
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Referral</span><span style="font-weight: 600;">5%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 14px;">
+                            <div style="background: #EC4899; width: 5%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                </div>
+                <div style="text-align: center; margin-top: 0.5rem; font-size: 0.75rem; color: #10B981;">Digital +8% YoY</div>
+                """, unsafe_allow_html=True)
+        
+        # Customer Retention Insights
+        ret_col, engage_col = st.columns(2)
+        
+        with ret_col:
+            st.markdown("**Retention Cohorts (12 Month)**")
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>0-12 months</span>
+                        <span><strong>92%</strong> retained</span>
+                        <span style="color: #10B981;">▲ 2%</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>12-24 months</span>
+                        <span><strong>88%</strong> retained</span>
+                        <span style="color: #10B981;">▲ 1%</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>24-36 months</span>
+                        <span><strong>85%</strong> retained</span>
+                        <span style="color: #6B7280;">—</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0;">
+                        <span>36+ months</span>
+                        <span><strong>94%</strong> retained</span>
+                        <span style="color: #10B981;">▲ 3%</span>
+                    </div>
+                </div>
+                <div style="text-align: center; margin-top: 0.5rem; font-size: 0.75rem; color: #DC2626;">⚠️ 24-36 mo cohort needs attention</div>
+                """, unsafe_allow_html=True)
+        
+        with engage_col:
+            st.markdown("**Digital Engagement**")
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; justify-content: space-around; text-align: center; padding: 0.5rem 0;">
+                    <div>
+                        <div style="font-size: 1.5rem; font-weight: 700; color: #29B5E8;">68%</div>
+                        <div style="font-size: 0.75rem; color: #6B7280;">App Active</div>
+                        <div style="font-size: 0.7rem; color: #10B981;">▲ 5%</div>
+                    </div>
+                    <div>
+                        <div style="font-size: 1.5rem; font-weight: 700; color: #10B981;">4.2M</div>
+                        <div style="font-size: 0.75rem; color: #6B7280;">Monthly Logins</div>
+                        <div style="font-size: 0.7rem; color: #10B981;">▲ 12%</div>
+                    </div>
+                    <div>
+                        <div style="font-size: 1.5rem; font-weight: 700; color: #8B5CF6;">72%</div>
+                        <div style="font-size: 0.75rem; color: #6B7280;">Self-Service</div>
+                        <div style="font-size: 0.7rem; color: #10B981;">▲ 8%</div>
+                    </div>
+                </div>
+                <div style="margin-top: 0.5rem; padding-top: 0.5rem; border-top: 1px solid #E5E7EB;">
+                    <div style="font-size: 0.8rem; text-align: center;">
+                        <span style="color: #1B2A4E; font-weight: 600;">Top Actions:</span> Bill Pay (34%) • Usage Check (28%) • Support (18%)
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Ask Snowflake Intelligence</div>', unsafe_allow_html=True)
+        
+        questions = [
+            "What's our customer acquisition cost by channel and how does ROI compare across campaigns?",
+            "Show me churn risk by customer segment - which segments need retention focus?",
+            "What's the sentiment analysis from our social media mentions this month?",
+            "Which marketing campaigns are driving the highest quality leads?",
+            "What's the lifetime value distribution by customer segment and acquisition channel?"
+        ]
+        
+        sf_intel_url = "https://ai.snowflake.com/sfseeurope/pjose_aws3"
+        
+        cols = st.columns(2)
+        for i, q in enumerate(questions):
+            with cols[i % 2]:
+                escaped_q = q.replace('"', '&quot;').replace("'", "&#39;")
+                st.markdown(f"""
+                <a href="{sf_intel_url}" target="_blank" onclick="navigator.clipboard.writeText('{escaped_q}')" style="text-decoration: none; color: inherit; display: block;">
+                    <div class="question-card">
+                        <p style="margin-bottom: 1.5rem;"><strong>Q{i+1}:</strong> "{q}"</p>
+                    </div>
+                </a>
+                """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div style="text-align: center; margin-top: 1rem; padding: 1rem; background: linear-gradient(135deg, #29B5E8 0%, #1A8BC4 100%); border-radius: 8px;">
+            <a href="{sf_intel_url}" target="_blank" style="color: white; text-decoration: none; font-weight: 600; font-size: 1rem;">
+                ❄️ Ask these questions in Snowflake Intelligence →
+            </a>
+        </div>
+        """, unsafe_allow_html=True)
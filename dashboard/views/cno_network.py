@@ -0,0 +1,860 @@
+"""CNO Network Quality dashboard."""
+
+import streamlit as st
+import streamlit.components.v1 as components
+import pandas as pd
+import altair as alt
+
+from dashboard import charts, data, geo
+
+
+def render_cno_network():
+    import pandas as pd
+    import altair as alt
+    
+    # CNO Header with Signal Wave Effect
+    st.markdown("""
+    <div class="cno-header-wrap">
+        <div class="cno-signal-bg">
+            <span class="cno-tower" style="left: 50%; top: 50%; transform: translate(-50%, -50%);">📡</span>
+            <div class="cno-signal-ring" style="left: 50%; top: 50%; width: 40px; height: 40px; margin: -20px 0 0 -20px; animation-delay: 0s;"></div>
+            <div class="cno-signal-ring" style="left: 50%; top: 50%; width: 80px; height: 80px; margin: -40px 0 0 -40px; animation-delay: 0.5s;"></div>
+            <div class="cno-signal-ring" style="left: 50%; top: 50%; width: 120px; height: 120px; margin: -60px 0 0 -60px; animation-delay: 1s;"></div>
+            <div class="cno-wave" style="top: 30%; left: 0; width: 100%;"></div>
+            <div class="cno-wave" style="top: 70%; left: 0; width: 100%; animation-delay: 1.5s;"></div>
+        </div>
+        <div class="cno-header-content">
+            <h1>CNO Network Quality Dashboard</h1>
+            <p>Network Performance, 5G Rollout & Quality of Experience</p>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Dashboard Tabs
+    tab_overview, tab_mlops, tab_strategy = st.tabs(["📊 Overview & Analysis", "🧪 Model Ops & Strategy", "❄️ Snowflake Intelligence"])
+
+    with tab_overview:
+        
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['NETWORK_QOE', 'NETWORK_OPS', 'RAN']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+        
+        # CNO NETWORK SIGNAL ANIMATION
+        st.markdown("""<div class="cno-signal"><div class="signal-tower"><div class="signal-ring ring-1"></div><div class="signal-ring ring-2"></div><div class="signal-ring ring-3"></div><div class="tower-icon">📡</div><div class="signal-bars"><div class="sig-bar"></div><div class="sig-bar"></div><div class="sig-bar"></div><div class="sig-bar"></div><div class="sig-bar"></div></div></div><div class="network-stats"><div class="net-title">📶 Network Signal Quality</div><div class="net-grid"><div class="net-stat"><div class="net-val good">99.7%</div><div class="net-label">Availability</div><div class="net-status green">● Excellent</div></div><div class="net-stat"><div class="net-val">12ms</div><div class="net-label">Latency</div><div class="net-status green">● Optimal</div></div><div class="net-stat"><div class="net-val">142</div><div class="net-label">Gbps Throughput</div><div class="net-status green">● Peak</div></div><div class="net-stat"><div class="net-val">487</div><div class="net-label">Sites Online</div><div class="net-status green">● 97.4%</div></div></div></div></div>""", unsafe_allow_html=True)
+        
+        
+        st.markdown('<div class="section-header">Network Quality Overview</div>', unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #10B981;">
+                <div class="kpi-icon">📶</div>
+                <div class="kpi-label">Avg Download Speed</div>
+                <div class="kpi-value">142 Mbps</div>
+                <div class="kpi-delta positive">↑ +28% YoY</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <path d="M0,35 L20,32 L40,28 L60,24 L80,18 L100,12" fill="none" stroke="#10B981" stroke-width="2"/>
+                    <path d="M0,35 L20,32 L40,28 L60,24 L80,18 L100,12 L100,40 L0,40 Z" fill="#10B981"/>
+                </svg>
+            </div>
+            <div class="kpi-card" style="--accent: #8B5CF6;">
+                <div class="kpi-icon">⏱️</div>
+                <div class="kpi-label">Avg Latency</div>
+                <div class="kpi-value">18ms</div>
+                <div class="kpi-delta positive">↓ -8ms vs Q3</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <path d="M0,12 L20,14 L40,18 L60,22 L80,28 L100,32" fill="none" stroke="#8B5CF6" stroke-width="2"/>
+                    <path d="M0,12 L20,14 L40,18 L60,22 L80,28 L100,32 L100,40 L0,40 Z" fill="#8B5CF6"/>
+                </svg>
+            </div>
+            <div class="kpi-card" style="--accent: #29B5E8;">
+                <div class="kpi-icon">📺</div>
+                <div class="kpi-label">Video Quality Score</div>
+                <div class="kpi-value">4.2/5</div>
+                <div class="kpi-delta positive">↑ +0.4 YoY</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <rect x="5" y="32" width="12" height="8" fill="#29B5E8"/>
+                    <rect x="22" y="28" width="12" height="12" fill="#29B5E8"/>
+                    <rect x="39" y="24" width="12" height="16" fill="#29B5E8"/>
+                    <rect x="56" y="20" width="12" height="20" fill="#29B5E8"/>
+                    <rect x="73" y="14" width="12" height="26" fill="#29B5E8"/>
+                </svg>
+            </div>
+            <div class="kpi-card" style="--accent: #F59E0B;">
+                <div class="kpi-icon">🗼</div>
+                <div class="kpi-label">5G Coverage</div>
+                <div class="kpi-value">78%</div>
+                <div class="kpi-delta positive">↑ +12% vs Q3</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <path d="M0,28 L20,26 L40,24 L60,22 L80,18 L100,16" fill="none" stroke="#F59E0B" stroke-width="2"/>
+                    <path d="M0,28 L20,26 L40,24 L60,22 L80,18 L100,16 L100,40 L0,40 Z" fill="#F59E0B"/>
+                </svg>
+            </div>
+        </div>
+        
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #EC4899;">
+                <div class="kpi-icon">✅</div>
+                <div class="kpi-label">Network Availability</div>
+                <div class="kpi-value">99.94%</div>
+                <div class="kpi-delta positive">↑ Above SLA</div>
+            </div>
+            <div class="kpi-card" style="--accent: #14B8A6;">
+                <div class="kpi-icon">🔄</div>
+                <div class="kpi-label">Call Success Rate</div>
+                <div class="kpi-value">99.2%</div>
+                <div class="kpi-delta positive">↑ +0.3% MoM</div>
+            </div>
+            <div class="kpi-card" style="--accent: #6366F1;">
+                <div class="kpi-icon">📡</div>
+                <div class="kpi-label">Cell Sites</div>
+                <div class="kpi-value">2,840</div>
+                <div class="kpi-delta positive">↑ +120 YTD</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EF4444;">
+                <div class="kpi-icon">⚠️</div>
+                <div class="kpi-label">Active Alarms</div>
+                <div class="kpi-value">24</div>
+                <div class="kpi-delta neutral">3 Critical</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        col_left, col_right = st.columns([1.3, 1])
+        
+        with col_left:
+            st.markdown('<div class="section-header">Network Performance by Generation</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <table style="width: 100%; border-collapse: collapse; font-size: 0.85rem;">
+                    <thead>
+                        <tr style="border-bottom: 2px solid #E5E7EB;">
+                            <th style="text-align: left; padding: 0.6rem; color: #6B7280;">Network</th>
+                            <th style="text-align: center; padding: 0.6rem; color: #6B7280;">Download</th>
+                            <th style="text-align: center; padding: 0.6rem; color: #6B7280;">Upload</th>
+                            <th style="text-align: center; padding: 0.6rem; color: #6B7280;">Latency</th>
+                            <th style="text-align: center; padding: 0.6rem; color: #6B7280;">Video QoE</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        <tr style="border-bottom: 1px solid #F3F4F6; background: linear-gradient(90deg, #EDE9FE 0%, white 30%);">
+                            <td style="padding: 0.6rem; font-weight: 700; color: #8B5CF6;">5G</td>
+                            <td style="text-align: center; padding: 0.6rem;"><span style="font-weight: 700; color: #10B981;">285 Mbps</span></td>
+                            <td style="text-align: center; padding: 0.6rem;">48 Mbps</td>
+                            <td style="text-align: center; padding: 0.6rem;"><span style="font-weight: 700; color: #10B981;">12ms</span></td>
+                            <td style="text-align: center; padding: 0.6rem;"><span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">4.6</span></td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.6rem; font-weight: 600; color: #29B5E8;">4G LTE</td>
+                            <td style="text-align: center; padding: 0.6rem;">68 Mbps</td>
+                            <td style="text-align: center; padding: 0.6rem;">18 Mbps</td>
+                            <td style="text-align: center; padding: 0.6rem;">28ms</td>
+                            <td style="text-align: center; padding: 0.6rem;"><span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">4.0</span></td>
+                        </tr>
+                        <tr>
+                            <td style="padding: 0.6rem; font-weight: 600; color: #6B7280;">3G</td>
+                            <td style="text-align: center; padding: 0.6rem;">8 Mbps</td>
+                            <td style="text-align: center; padding: 0.6rem;">2 Mbps</td>
+                            <td style="text-align: center; padding: 0.6rem;">85ms</td>
+                            <td style="text-align: center; padding: 0.6rem;"><span style="background: #FEF3C7; color: #92400E; padding: 0.2rem 0.5rem; border-radius: 12px;">2.8</span></td>
+                        </tr>
+                    </tbody>
+                </table>
+                <div style="margin-top: 1rem; padding: 0.75rem; background: #F0F9FF; border-radius: 8px; text-align: center; font-size: 0.85rem;">
+                    <span style="color: #0369A1;">5G delivers <strong>4.2x faster</strong> downloads and <strong>58% lower</strong> latency vs 4G</span>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            st.markdown('<div class="section-header">UK Network Coverage Map</div>', unsafe_allow_html=True)
+            
+            components.html("""
+            <!DOCTYPE html>
+            <html>
+            <head>
+            <style>
+            * { margin: 0; padding: 0; box-sizing: border-box; }
+            body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; }
+            @keyframes uk-map-pulse { 0%, 100% { opacity: 0.6; } 50% { opacity: 1; } }
+            @keyframes uk-tower-ping { 0% { transform: scale(0.5); opacity: 1; } 100% { transform: scale(2); opacity: 0; } }
+            @keyframes uk-status-blink { 0%, 100% { opacity: 1; } 50% { opacity: 0.5; } }
+            .uk-map-container {
+                background: linear-gradient(135deg, #F0F9FF 0%, #E0F2FE 100%);
+                border-radius: 12px;
+                padding: 1.5rem;
+                position: relative;
+                display: flex;
+                flex-direction: column;
+                align-items: center;
+            }
+            .uk-map-svg { width: 100%; max-width: 400px; height: 340px; }
+            .uk-region { transition: all 0.3s ease; cursor: pointer; }
+            .uk-region:hover { filter: brightness(1.1); }
+            .uk-tower { animation: uk-map-pulse 2s ease-in-out infinite; }
+            .uk-ping { animation: uk-tower-ping 2s ease-out infinite; }
+            .uk-legend {
+                display: flex;
+                justify-content: center;
+                gap: 1.5rem;
+                margin-top: 1rem;
+                font-size: 12px;
+                flex-wrap: wrap;
+            }
+            .uk-legend-item { display: flex; align-items: center; gap: 6px; color: #374151; }
+            .uk-legend-dot { width: 12px; height: 12px; border-radius: 50%; }
+            </style>
+            </head>
+            <body>
+            <div class="uk-map-container">
+                <svg class="uk-map-svg" viewBox="0 0 320 380">
+                    <!-- UK Map Outline - Stylized -->
+                    <path d="M160,15 Q175,20 185,35 Q200,30 210,45 Q215,60 205,75 Q220,85 225,100 Q235,110 240,130 Q250,145 255,165 Q260,185 255,205 Q265,220 260,240 Q255,260 245,275 Q240,290 225,300 Q215,310 200,315 Q190,325 175,330 Q165,340 150,345 Q135,340 125,330 Q110,325 100,315 Q85,310 75,300 Q65,290 60,275 Q50,260 55,240 Q50,220 60,205 Q55,185 65,165 Q70,145 80,130 Q85,110 95,100 Q100,85 115,75 Q105,60 110,45 Q120,30 135,35 Q145,20 160,15 Z" 
+                          fill="#BFDBFE" stroke="#60A5FA" stroke-width="2.5" opacity="0.8"/>
+                    
+                    <!-- Scotland -->
+                    <ellipse cx="160" cy="55" rx="45" ry="32" fill="#10B981" opacity="0.75" class="uk-region"/>
+                    <text x="160" y="52" text-anchor="middle" font-size="11" fill="#1B2A4E" font-weight="600">Scotland</text>
+                    <circle class="uk-tower" cx="160" cy="40" r="5" fill="#10B981"/>
+                    <circle class="uk-ping" cx="160" cy="40" r="5" fill="none" stroke="#10B981" stroke-width="2"/>
+                    
+                    <!-- North -->
+                    <ellipse cx="150" cy="115" rx="40" ry="28" fill="#10B981" opacity="0.75" class="uk-region"/>
+                    <text x="150" y="118" text-anchor="middle" font-size="11" fill="#1B2A4E" font-weight="600">North</text>
+                    <circle class="uk-tower" cx="140" cy="100" r="4" fill="#10B981"/>
+                    
+                    <!-- Yorkshire with Alert -->
+                    <ellipse cx="175" cy="165" rx="35" ry="25" fill="#F59E0B" opacity="0.75" class="uk-region"/>
+                    <text x="175" y="168" text-anchor="middle" font-size="10" fill="#1B2A4E" font-weight="600">Yorkshire</text>
+                    <g transform="translate(210, 155)">
+                        <circle r="10" fill="#EF4444" class="uk-tower" style="animation: uk-status-blink 0.5s ease-in-out infinite;"/>
+                        <text x="14" y="4" font-size="9" fill="#EF4444" font-weight="600">Alert</text>
+                    </g>
+                    
+                    <!-- Wales -->
+                    <ellipse cx="95" cy="210" rx="30" ry="40" fill="#10B981" opacity="0.75" class="uk-region"/>
+                    <text x="95" y="213" text-anchor="middle" font-size="10" fill="#1B2A4E" font-weight="600">Wales</text>
+                    <circle class="uk-tower" cx="95" cy="195" r="4" fill="#10B981"/>
+                    
+                    <!-- Midlands -->
+                    <ellipse cx="160" cy="215" rx="40" ry="30" fill="#10B981" opacity="0.75" class="uk-region"/>
+                    <text x="160" y="218" text-anchor="middle" font-size="11" fill="#1B2A4E" font-weight="600">Midlands</text>
+                    <circle class="uk-tower" cx="150" cy="200" r="4" fill="#10B981"/>
+                    <circle class="uk-tower" cx="170" cy="205" r="4" fill="#10B981"/>
+                    
+                    <!-- London -->
+                    <ellipse cx="190" cy="275" rx="42" ry="32" fill="#10B981" opacity="0.8" class="uk-region"/>
+                    <text x="190" y="270" text-anchor="middle" font-size="11" fill="#1B2A4E" font-weight="600">London</text>
+                    <text x="190" y="285" text-anchor="middle" font-size="9" fill="#1B2A4E">168 Mbps</text>
+                    <circle class="uk-tower" cx="190" cy="255" r="5" fill="#10B981"/>
+                    <circle class="uk-ping" cx="190" cy="255" r="5" fill="none" stroke="#10B981" stroke-width="2" style="animation-delay: 1s;"/>
+                    
+                    <!-- South West -->
+                    <ellipse cx="115" cy="305" rx="35" ry="28" fill="#29B5E8" opacity="0.75" class="uk-region"/>
+                    <text x="115" y="308" text-anchor="middle" font-size="10" fill="#1B2A4E" font-weight="600">South West</text>
+                    <circle class="uk-tower" cx="115" cy="290" r="4" fill="#29B5E8"/>
+                    
+                    <!-- Animated ping rings on right side -->
+                    <circle cx="270" cy="120" r="8" fill="none" stroke="#10B981" stroke-width="1" class="uk-ping" style="animation-delay: 0.5s;"/>
+                    <circle cx="275" cy="280" r="8" fill="none" stroke="#29B5E8" stroke-width="1" class="uk-ping" style="animation-delay: 1.5s;"/>
+                    
+                    <!-- Stats Panel -->
+                    <rect x="15" y="20" width="90" height="70" rx="8" fill="white" stroke="#E5E7EB" stroke-width="1"/>
+                    <text x="60" y="42" text-anchor="middle" font-size="9" fill="#6B7280">Sites Online</text>
+                    <text x="60" y="62" text-anchor="middle" font-size="20" fill="#10B981" font-weight="700">487</text>
+                    <text x="60" y="78" text-anchor="middle" font-size="8" fill="#10B981">99.7% uptime</text>
+                </svg>
+                <div class="uk-legend">
+                    <div class="uk-legend-item"><div class="uk-legend-dot" style="background: #10B981;"></div>Excellent</div>
+                    <div class="uk-legend-item"><div class="uk-legend-dot" style="background: #29B5E8;"></div>Good</div>
+                    <div class="uk-legend-item"><div class="uk-legend-dot" style="background: #F59E0B;"></div>Moderate</div>
+                    <div class="uk-legend-item"><div class="uk-legend-dot" style="background: #EF4444;"></div>Alert</div>
+                </div>
+            </div>
+            </body>
+            </html>
+            """, height=450, scrolling=False)
+            
+            st.markdown('<div class="section-header">QoE by Region</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="display: flex; align-items: center; padding: 0.5rem 0; border-bottom: 1px solid #F3F4F6;">
+                        <span style="width: 100px; font-weight: 600;">London</span>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 14px; margin: 0 0.75rem;">
+                            <div style="background: #10B981; width: 92%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                        <span style="width: 80px; text-align: right; font-weight: 600;">168 Mbps</span>
+                    </div>
+                    <div style="display: flex; align-items: center; padding: 0.5rem 0; border-bottom: 1px solid #F3F4F6;">
+                        <span style="width: 100px; font-weight: 600;">Manchester</span>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 14px; margin: 0 0.75rem;">
+                            <div style="background: #10B981; width: 85%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                        <span style="width: 80px; text-align: right; font-weight: 600;">152 Mbps</span>
+                    </div>
+                    <div style="display: flex; align-items: center; padding: 0.5rem 0; border-bottom: 1px solid #F3F4F6;">
+                        <span style="width: 100px; font-weight: 600;">Birmingham</span>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 14px; margin: 0 0.75rem;">
+                            <div style="background: #29B5E8; width: 78%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                        <span style="width: 80px; text-align: right; font-weight: 600;">138 Mbps</span>
+                    </div>
+                    <div style="display: flex; align-items: center; padding: 0.5rem 0; border-bottom: 1px solid #F3F4F6;">
+                        <span style="width: 100px; font-weight: 600;">Leeds</span>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 14px; margin: 0 0.75rem;">
+                            <div style="background: #29B5E8; width: 72%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                        <span style="width: 80px; text-align: right; font-weight: 600;">128 Mbps</span>
+                    </div>
+                    <div style="display: flex; align-items: center; padding: 0.5rem 0;">
+                        <span style="width: 100px; font-weight: 600;">Rural</span>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 14px; margin: 0 0.75rem;">
+                            <div style="background: #F59E0B; width: 45%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                        <span style="width: 80px; text-align: right; font-weight: 600;">82 Mbps</span>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col_right:
+            st.markdown('<div class="section-header">5G Rollout Progress</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <div style="text-align: center; margin-bottom: 1rem;">
+                    <div style="font-size: 3rem; font-weight: 700; color: #8B5CF6;">78%</div>
+                    <div style="font-size: 0.85rem; color: #6B7280;">Population Coverage</div>
+                    <div style="background: #E5E7EB; border-radius: 4px; height: 16px; margin: 1rem 0;">
+                        <div style="background: linear-gradient(90deg, #8B5CF6, #29B5E8); width: 78%; height: 100%; border-radius: 4px;"></div>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; font-size: 0.75rem; color: #6B7280;">
+                        <span>Q4 Target: 85%</span>
+                        <span>+12% vs Q3</span>
+                    </div>
+                </div>
+                <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 0.5rem; font-size: 0.8rem;">
+                    <div style="background: #F3F4F6; padding: 0.5rem; border-radius: 8px; text-align: center;">
+                        <div style="color: #6B7280;">5G Sites</div>
+                        <div style="font-weight: 700; color: #8B5CF6;">1,420</div>
+                    </div>
+                    <div style="background: #F3F4F6; padding: 0.5rem; border-radius: 8px; text-align: center;">
+                        <div style="color: #6B7280;">Small Cells</div>
+                        <div style="font-weight: 700; color: #29B5E8;">680</div>
+                    </div>
+                    <div style="background: #F3F4F6; padding: 0.5rem; border-radius: 8px; text-align: center;">
+                        <div style="color: #6B7280;">Q1 Planned</div>
+                        <div style="font-weight: 700; color: #10B981;">+350</div>
+                    </div>
+                    <div style="background: #F3F4F6; padding: 0.5rem; border-radius: 8px; text-align: center;">
+                        <div style="color: #6B7280;">CapEx (Q1)</div>
+                        <div style="font-weight: 700; color: #F59E0B;">£12M</div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            st.markdown('<div class="section-header">App Category QoE</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>🎬 Video Streaming</span>
+                        <span style="font-weight: 700; background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">4.2/5</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>🎮 Gaming</span>
+                        <span style="font-weight: 700; background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">4.0/5</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>📱 Social Media</span>
+                        <span style="font-weight: 700; background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">4.4/5</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>📞 Video Calls</span>
+                        <span style="font-weight: 700; background: #FEF3C7; color: #92400E; padding: 0.2rem 0.5rem; border-radius: 12px;">3.8/5</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0;">
+                        <span>🌐 Web Browsing</span>
+                        <span style="font-weight: 700; background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">4.3/5</span>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            st.markdown('<div class="section-header">Network vs Churn</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.8rem; padding: 0.5rem; background: #FEF3C7; border-radius: 8px; margin-bottom: 0.5rem;">
+                    <span style="color: #92400E;">⚠️ <strong>12%</strong> of churners cited network quality</span>
+                </div>
+                <div style="font-size: 0.8rem;">
+                    <div style="display: flex; justify-content: space-between; padding: 0.3rem 0;">
+                        <span>5G Users Churn Rate</span>
+                        <span style="font-weight: 700; color: #10B981;">0.8%</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.3rem 0;">
+                        <span>4G Users Churn Rate</span>
+                        <span style="font-weight: 700; color: #F59E0B;">1.4%</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.3rem 0;">
+                        <span>3G Users Churn Rate</span>
+                        <span style="font-weight: 700; color: #EF4444;">2.8%</span>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Network Performance Heatmap by Region</div>', unsafe_allow_html=True)
+        
+        with st.container(border=True):
+            st.markdown("""
+            <div style="overflow-x: auto;">
+                <table style="width: 100%; border-collapse: collapse; font-size: 0.75rem; text-align: center;">
+                    <thead>
+                        <tr style="border-bottom: 2px solid #E5E7EB;">
+                            <th style="padding: 0.5rem; text-align: left; color: #6B7280;">Region</th>
+                            <th style="padding: 0.5rem; color: #6B7280;">Download</th>
+                            <th style="padding: 0.5rem; color: #6B7280;">Upload</th>
+                            <th style="padding: 0.5rem; color: #6B7280;">Latency</th>
+                            <th style="padding: 0.5rem; color: #6B7280;">Avail.</th>
+                            <th style="padding: 0.5rem; color: #6B7280;">5G Cover</th>
+                            <th style="padding: 0.5rem; color: #6B7280;">Alarms</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem; text-align: left; font-weight: 600;">London</td>
+                            <td style="padding: 0.5rem; background: #D1FAE5; color: #065F46;">285 Mbps</td>
+                            <td style="padding: 0.5rem; background: #D1FAE5; color: #065F46;">48 Mbps</td>
+                            <td style="padding: 0.5rem; background: #D1FAE5; color: #065F46;">12ms</td>
+                            <td style="padding: 0.5rem; background: #D1FAE5; color: #065F46;">99.8%</td>
+                            <td style="padding: 0.5rem; background: #D1FAE5; color: #065F46;">92%</td>
+                            <td style="padding: 0.5rem; background: #D1FAE5; color: #065F46;">4</td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem; text-align: left; font-weight: 600;">Manchester</td>
+                            <td style="padding: 0.5rem; background: #D1FAE5; color: #065F46;">248 Mbps</td>
+                            <td style="padding: 0.5rem; background: #D1FAE5; color: #065F46;">42 Mbps</td>
+                            <td style="padding: 0.5rem; background: #D1FAE5; color: #065F46;">14ms</td>
+                            <td style="padding: 0.5rem; background: #D1FAE5; color: #065F46;">99.6%</td>
+                            <td style="padding: 0.5rem; background: #D1FAE5; color: #065F46;">85%</td>
+                            <td style="padding: 0.5rem; background: #FEF3C7; color: #92400E;">12</td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem; text-align: left; font-weight: 600;">Birmingham</td>
+                            <td style="padding: 0.5rem; background: #D1FAE5; color: #065F46;">232 Mbps</td>
+                            <td style="padding: 0.5rem; background: #FEF3C7; color: #92400E;">36 Mbps</td>
+                            <td style="padding: 0.5rem; background: #FEF3C7; color: #92400E;">18ms</td>
+                            <td style="padding: 0.5rem; background: #D1FAE5; color: #065F46;">99.4%</td>
+                            <td style="padding: 0.5rem; background: #FEF3C7; color: #92400E;">72%</td>
+                            <td style="padding: 0.5rem; background: #FEF3C7; color: #92400E;">18</td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem; text-align: left; font-weight: 600;">Edinburgh</td>
+                            <td style="padding: 0.5rem; background: #FEF3C7; color: #92400E;">198 Mbps</td>
+                            <td style="padding: 0.5rem; background: #FEF3C7; color: #92400E;">32 Mbps</td>
+                            <td style="padding: 0.5rem; background: #FEF3C7; color: #92400E;">22ms</td>
+                            <td style="padding: 0.5rem; background: #D1FAE5; color: #065F46;">99.2%</td>
+                            <td style="padding: 0.5rem; background: #FEF3C7; color: #92400E;">65%</td>
+                            <td style="padding: 0.5rem; background: #D1FAE5; color: #065F46;">8</td>
+                        </tr>
+                        <tr>
+                            <td style="padding: 0.5rem; text-align: left; font-weight: 600;">Cardiff</td>
+                            <td style="padding: 0.5rem; background: #FEE2E2; color: #DC2626;">165 Mbps</td>
+                            <td style="padding: 0.5rem; background: #FEE2E2; color: #DC2626;">28 Mbps</td>
+                            <td style="padding: 0.5rem; background: #FEE2E2; color: #DC2626;">28ms</td>
+                            <td style="padding: 0.5rem; background: #FEF3C7; color: #92400E;">98.8%</td>
+                            <td style="padding: 0.5rem; background: #FEE2E2; color: #DC2626;">48%</td>
+                            <td style="padding: 0.5rem; background: #FEE2E2; color: #DC2626;">24</td>
+                        </tr>
+                    </tbody>
+                </table>
+            </div>
+            <div style="margin-top: 0.75rem; display: flex; justify-content: center; gap: 1rem; font-size: 0.7rem;">
+                <span><span style="background: #D1FAE5; padding: 0.2rem 0.5rem; border-radius: 4px; margin-right: 4px;">■</span>Excellent</span>
+                <span><span style="background: #FEF3C7; padding: 0.2rem 0.5rem; border-radius: 4px; margin-right: 4px;">■</span>Moderate</span>
+                <span><span style="background: #FEE2E2; padding: 0.2rem 0.5rem; border-radius: 4px; margin-right: 4px;">■</span>Needs Attention</span>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        col_cap, col_alarm = st.columns(2)
+        
+        with col_cap:
+            st.markdown('<div class="section-header">Capacity Utilization Trend</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan', 'Feb']
+                cap_data = pd.DataFrame({
+                    'Month': months,
+                    'Utilization': [52, 54, 56, 58, 60, 62, 64],
+                    'Status': ['Normal', 'Normal', 'Normal', 'Warning', 'Warning', 'Warning', 'Warning']
+                })
+                
+                cap_area = alt.Chart(cap_data).mark_area(
+                    line={'color': '#F59E0B', 'strokeWidth': 3},
+                    color=alt.Gradient(
+                        gradient='linear',
+                        stops=[alt.GradientStop(color='rgba(245, 158, 11, 0.3)', offset=0),
+                               alt.GradientStop(color='rgba(245, 158, 11, 0)', offset=1)],
+                        x1=1, x2=1, y1=1, y2=0
+                    )
+                ).encode(
+                    x=alt.X('Month:N', sort=months, axis=alt.Axis(labelAngle=0, title=None)),
+                    y=alt.Y('Utilization:Q', scale=alt.Scale(domain=[40, 90]), axis=alt.Axis(title='Utilization %'))
+                )
+                
+                cap_points = alt.Chart(cap_data).mark_circle(size=80).encode(
+                    x=alt.X('Month:N', sort=months),
+                    y=alt.Y('Utilization:Q'),
+                    color=alt.Color('Status:N', scale=alt.Scale(
+                        domain=['Normal', 'Warning'],
+                        range=['#10B981', '#F59E0B']
+                    ), legend=None),
+                    tooltip=['Month:N', alt.Tooltip('Utilization:Q', title='Utilization', format='d%')]
+                )
+                
+                critical_line = alt.Chart(pd.DataFrame({'y': [80]})).mark_rule(
+                    color='#EF4444', strokeDash=[4, 4]
+                ).encode(y='y:Q')
+                
+                warning_line = alt.Chart(pd.DataFrame({'y': [60]})).mark_rule(
+                    color='#F59E0B', strokeDash=[4, 4]
+                ).encode(y='y:Q')
+                
+                cap_label = alt.Chart(cap_data.tail(1)).mark_text(
+                    dy=-15, fontSize=12, fontWeight='bold', color='#F59E0B'
+                ).encode(
+                    x=alt.X('Month:N', sort=months),
+                    y=alt.Y('Utilization:Q'),
+                    text=alt.Text('Utilization:Q', format='d%')
+                )
+                
+                charts.altair_chart((cap_area + cap_points + critical_line + warning_line + cap_label).properties(height=160), use_container_width=True)
+                
+                st.markdown("""
+                <div style="display: flex; justify-content: space-around; font-size: 0.75rem; margin-top: 0.5rem;">
+                    <div style="text-align: center;">
+                        <div style="color: #6B7280;">Peak Hour</div>
+                        <div style="font-weight: 700; color: #F59E0B;">78%</div>
+                    </div>
+                    <div style="text-align: center;">
+                        <div style="color: #6B7280;">Off-Peak</div>
+                        <div style="font-weight: 700; color: #10B981;">42%</div>
+                    </div>
+                    <div style="text-align: center;">
+                        <div style="color: #6B7280;">Sites >70%</div>
+                        <div style="font-weight: 700; color: #EF4444;">124</div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col_alarm:
+            st.markdown('<div class="section-header">Alarm Trend Analysis</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 0.5rem; margin-bottom: 1rem;">
+                    <div style="background: #FEE2E2; border-radius: 8px; padding: 0.75rem; text-align: center;">
+                        <div style="font-size: 0.7rem; color: #DC2626;">Critical</div>
+                        <div style="font-size: 1.5rem; font-weight: 700; color: #DC2626;">12</div>
+                        <div style="font-size: 0.65rem; color: #DC2626;">↓ -4 vs yesterday</div>
+                    </div>
+                    <div style="background: #FEF3C7; border-radius: 8px; padding: 0.75rem; text-align: center;">
+                        <div style="font-size: 0.7rem; color: #92400E;">Major</div>
+                        <div style="font-size: 1.5rem; font-weight: 700; color: #F59E0B;">48</div>
+                        <div style="font-size: 0.65rem; color: #92400E;">↓ -12 vs yesterday</div>
+                    </div>
+                    <div style="background: #E0F2FE; border-radius: 8px; padding: 0.75rem; text-align: center;">
+                        <div style="font-size: 0.7rem; color: #0369A1;">Minor</div>
+                        <div style="font-size: 1.5rem; font-weight: 700; color: #29B5E8;">156</div>
+                        <div style="font-size: 0.65rem; color: #0369A1;">↑ +8 vs yesterday</div>
+                    </div>
+                </div>
+                <div style="font-size: 0.8rem;">
+                    <div style="font-weight: 600; color: #6B7280; margin-bottom: 0.5rem;">Top Alarm Categories</div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.3rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>RAN Cell Degradation</span>
+                        <span style="font-weight: 600; color: #EF4444;">38</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.3rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Backhaul Congestion</span>
+                        <span style="font-weight: 600; color: #F59E0B;">24</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.3rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Power Issues</span>
+                        <span style="font-weight: 600; color: #F59E0B;">18</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.3rem 0;">
+                        <span>Temperature Alerts</span>
+                        <span style="font-weight: 600; color: #29B5E8;">12</span>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        # Looping progress bar animations for CNO
+        
+        st.markdown('<div class="section-header">Cell Site Performance Distribution</div>', unsafe_allow_html=True)
+        
+        if st.session_state.get('sf_highlights', True):
+            st.info("❄️ **Powered by Snowflake** — Real-time network telemetry from 15,000+ cell sites processed via Snowpipe Streaming with Time Series Analysis")
+        
+        col_perf1, col_perf2, col_perf3, col_perf4 = st.columns(4)
+        
+        with col_perf1:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="text-align: center;">
+                    <div style="font-size: 0.75rem; color: #6B7280;">Excellent Sites</div>
+                    <div style="font-size: 2rem; font-weight: 700; color: #10B981;">1,842</div>
+                    <div style="font-size: 0.7rem; color: #10B981;">KPIs > 95th percentile</div>
+                    <div style="background: #E5E7EB; height: 8px; border-radius: 4px; margin-top: 0.5rem;">
+                        <div class="progress-bar" style="background: #10B981; width: 62%; height: 100%; animation-delay: 0s;"></div>
+                    </div>
+                    <div style="font-size: 0.7rem; color: #6B7280; margin-top: 0.25rem;">62% of fleet</div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col_perf2:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="text-align: center;">
+                    <div style="font-size: 0.75rem; color: #6B7280;">Good Sites</div>
+                    <div style="font-size: 2rem; font-weight: 700; color: #29B5E8;">724</div>
+                    <div style="font-size: 0.7rem; color: #29B5E8;">KPIs 80-95th percentile</div>
+                    <div style="background: #E5E7EB; height: 8px; border-radius: 4px; margin-top: 0.5rem;">
+                        <div class="progress-bar" style="background: #29B5E8; width: 24%; height: 100%; animation-delay: 0.2s;"></div>
+                    </div>
+                    <div style="font-size: 0.7rem; color: #6B7280; margin-top: 0.25rem;">24% of fleet</div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col_perf3:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="text-align: center;">
+                    <div style="font-size: 0.75rem; color: #6B7280;">Degraded Sites</div>
+                    <div style="font-size: 2rem; font-weight: 700; color: #F59E0B;">312</div>
+                    <div style="font-size: 0.7rem; color: #F59E0B;">KPIs 60-80th percentile</div>
+                    <div style="background: #E5E7EB; height: 8px; border-radius: 4px; margin-top: 0.5rem;">
+                        <div class="progress-bar" style="background: #F59E0B; width: 10%; height: 100%; animation-delay: 0.4s;"></div>
+                    </div>
+                    <div style="font-size: 0.7rem; color: #6B7280; margin-top: 0.25rem;">10% of fleet</div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col_perf4:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="text-align: center;">
+                    <div style="font-size: 0.75rem; color: #6B7280;">Critical Sites</div>
+                    <div style="font-size: 2rem; font-weight: 700; color: #EF4444;">98</div>
+                    <div style="font-size: 0.7rem; color: #EF4444;">KPIs < 60th percentile</div>
+                    <div style="background: #E5E7EB; height: 8px; border-radius: 4px; margin-top: 0.5rem;">
+                        <div class="progress-bar" style="background: #EF4444; width: 4%; height: 100%; animation-delay: 0.6s;"></div>
+                    </div>
+                    <div style="font-size: 0.7rem; color: #6B7280; margin-top: 0.25rem;">4% of fleet</div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Traffic & Throughput Insights</div>', unsafe_allow_html=True)
+        
+        col_traffic1, col_traffic2 = st.columns(2)
+        
+        with col_traffic1:
+            # Add looping animation for traffic bars
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="font-weight: 600; margin-bottom: 0.75rem; color: #1B2A4E;">Daily Traffic Pattern</div>
+                    <div class="traffic-bars" style="display: flex; align-items: flex-end; height: 100px; gap: 4px; margin-bottom: 0.5rem;">
+                        <div class="traffic-bar" style="flex: 1; height: 20%; background: #E0F2FE;"></div>
+                        <div class="traffic-bar" style="flex: 1; height: 15%; background: #E0F2FE;"></div>
+                        <div class="traffic-bar" style="flex: 1; height: 12%; background: #E0F2FE;"></div>
+                        <div class="traffic-bar" style="flex: 1; height: 18%; background: #E0F2FE;"></div>
+                        <div class="traffic-bar" style="flex: 1; height: 35%; background: #BAE6FD;"></div>
+                        <div class="traffic-bar" style="flex: 1; height: 55%; background: #7DD3FC;"></div>
+                        <div class="traffic-bar" style="flex: 1; height: 65%; background: #38BDF8;"></div>
+                        <div class="traffic-bar" style="flex: 1; height: 70%; background: #0EA5E9;"></div>
+                        <div class="traffic-bar" style="flex: 1; height: 75%; background: #0EA5E9;"></div>
+                        <div class="traffic-bar" style="flex: 1; height: 68%; background: #0EA5E9;"></div>
+                        <div class="traffic-bar" style="flex: 1; height: 72%; background: #0EA5E9;"></div>
+                        <div class="traffic-bar" style="flex: 1; height: 78%; background: #0284C7;"></div>
+                        <div class="traffic-bar" style="flex: 1; height: 82%; background: #0284C7;"></div>
+                        <div class="traffic-bar" style="flex: 1; height: 75%; background: #0EA5E9;"></div>
+                        <div class="traffic-bar" style="flex: 1; height: 70%; background: #0EA5E9;"></div>
+                        <div class="traffic-bar" style="flex: 1; height: 68%; background: #0EA5E9;"></div>
+                        <div class="traffic-bar" style="flex: 1; height: 72%; background: #0EA5E9;"></div>
+                        <div class="traffic-bar" style="flex: 1; height: 85%; background: #0369A1;"></div>
+                        <div class="traffic-bar" style="flex: 1; height: 95%; background: #0369A1;"></div>
+                        <div class="traffic-bar" style="flex: 1; height: 100%; background: linear-gradient(180deg, #EF4444, #0369A1);"></div>
+                        <div class="traffic-bar" style="flex: 1; height: 90%; background: #0369A1;"></div>
+                        <div class="traffic-bar" style="flex: 1; height: 75%; background: #0EA5E9;"></div>
+                        <div class="traffic-bar" style="flex: 1; height: 55%; background: #7DD3FC;"></div>
+                        <div class="traffic-bar" style="flex: 1; height: 35%; background: #BAE6FD;"></div>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; font-size: 0.65rem; color: #6B7280;">
+                        <span>00:00</span>
+                        <span>06:00</span>
+                        <span>12:00</span>
+                        <span>18:00</span>
+                        <span>24:00</span>
+                    </div>
+                    <div style="margin-top: 0.5rem; font-size: 0.7rem; text-align: center; color: #EF4444;">
+                        Peak: 20:00-21:00 (2.4 PB/hour)
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col_traffic2:
+            # Add looping animation for app bars
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="font-weight: 600; margin-bottom: 0.75rem; color: #1B2A4E;">Traffic by Application</div>
+                    <div style="margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; font-size: 0.8rem;">
+                            <span>Video Streaming</span>
+                            <span style="font-weight: 600;">48%</span>
+                        </div>
+                        <div style="background: #E5E7EB; height: 12px; border-radius: 4px; margin-top: 0.25rem;">
+                            <div class="app-bar" style="background: linear-gradient(90deg, #8B5CF6, #A78BFA); width: 48%; height: 100%; animation-delay: 0s;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; font-size: 0.8rem;">
+                            <span>Social Media</span>
+                            <span style="font-weight: 600;">22%</span>
+                        </div>
+                        <div style="background: #E5E7EB; height: 12px; border-radius: 4px; margin-top: 0.25rem;">
+                            <div class="app-bar" style="background: linear-gradient(90deg, #29B5E8, #7DD3FC); width: 22%; height: 100%; animation-delay: 0.2s;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; font-size: 0.8rem;">
+                            <span>Gaming</span>
+                            <span style="font-weight: 600;">12%</span>
+                        </div>
+                        <div style="background: #E5E7EB; height: 12px; border-radius: 4px; margin-top: 0.25rem;">
+                            <div class="app-bar" style="background: linear-gradient(90deg, #10B981, #6EE7B7); width: 12%; height: 100%; animation-delay: 0.4s;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; font-size: 0.8rem;">
+                            <span>Web/Other</span>
+                            <span style="font-weight: 600;">18%</span>
+                        </div>
+                        <div style="background: #E5E7EB; height: 12px; border-radius: 4px; margin-top: 0.25rem;">
+                            <div class="app-bar" style="background: linear-gradient(90deg, #F59E0B, #FCD34D); width: 18%; height: 100%; animation-delay: 0.6s;"></div>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        # Network Coverage Map
+        st.markdown('<div class="section-header">🗺️ UK Network Coverage & Performance</div>', unsafe_allow_html=True)
+        
+        map_col1, map_col2 = st.columns([2, 1])
+        
+        with map_col1:
+            with st.container(border=True):
+                geo.render_network_map("cno_map", height=450)
+        
+        with map_col2:
+            with st.container(border=True):
+                st.markdown("**5G Sites by Region**")
+                
+                try:
+                    coverage = geo.site_geometry(data.get_backend().name).region_summary()
+                except data.TableNotFound as exc:
+                    coverage = pd.DataFrame()
+                    st.caption(f"Site data unavailable: {exc}")
+                for row in coverage.itertuples():
+                    st.markdown(f"**{row.region}**")
+                    st.progress(row.pct_5g / 100)
+                    st.caption(f"{row.pct_5g:.1f}% of {row.sites} sites 5G-capable · {row.pct_active:.0f}% active")
+            
+            with st.container(border=True):
+                st.markdown("**Network Type Mix**")
+                st.metric("5G Coverage", "68%", "+12% YoY")
+                st.metric("4G Coverage", "99%", "+0.4% YoY")
+                st.metric("Cell Sites", "24,847", "+1,240 YoY")
+        
+
+    with tab_strategy:
+        st.markdown('<div class="section-header">CNO Strategic Priorities — Q1 2026</div>', unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #DC2626; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 1</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">5G Coverage 85%</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **78%** (target: 85%)
+                - 350 new sites planned Q1
+                - Focus: Rural & indoor coverage
+                - CapEx: **£12M** allocated
+                """)
+        
+        with col2:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #F59E0B; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 2</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Latency < 15ms</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **18ms** (target: <15ms)
+                - Edge compute: 8 sites Q1
+                - Core optimization: in progress
+                - Gaming QoE: **+0.4** target
+                """)
+        
+        with col3:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #10B981; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 3</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Availability 99.97%</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **99.94%** (target: 99.97%)
+                - Redundancy upgrade: 12 sites
+                - MTTR reduction: **-15 min**
+                - Zero P1 outages target
+                """)
+        
+        st.markdown('<div class="section-header">Ask Snowflake Intelligence</div>', unsafe_allow_html=True)
+        
+        questions = [
+            "What's the average download speed by network generation (3G/4G/5G)?",
+            "Show me the cells with the worst latency performance.",
+            "How does network performance correlate with churn risk?",
+            "Compare 5G vs 4G customer experience metrics.",
+            "Which cells need capacity upgrades based on customer experience?"
+        ]
+        
+        sf_intel_url = "https://ai.snowflake.com/sfseeurope/pjose_aws3"
+        
+        cols = st.columns(2)
+        for i, q in enumerate(questions):
+            with cols[i % 2]:
+                escaped_q = q.replace('"', '&quot;').replace("'", "&#39;")
+                st.markdown(f"""
+                <a href="{sf_intel_url}" target="_blank" onclick="navigator.clipboard.writeText('{escaped_q}')" style="text-decoration: none; color: inherit; display: block;">
+                    <div class="question-card">
+                        <p style="margin-bottom: 1.5rem;"><strong>Q{i+1}:</strong> "{q}"</p>
+                    </div>
+                </a>
+                """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div style="text-align: center; margin-top: 1rem; padding: 1rem; background: linear-gradient(135deg, #29B5E8 0%, #1A8BC4 100%); border-radius: 8px;">
+            <a href="{sf_intel_url}" target="_blank" style="color: white; text-decoration: none; font-weight: 600; font-size: 1rem;">
+                ❄️ Ask these questions in Snowflake Intelligence →
+            </a>
+        </div>
+        """, unsafe_allow_html=True)
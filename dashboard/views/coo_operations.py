@@ -0,0 +1,499 @@
+"""COO Operations dashboard."""
+
+import streamlit as st
+import pandas as pd
+import altair as alt
+
+from dashboard import charts
+
+
+def render_coo_operations():
+    import pandas as pd
+    import altair as alt
+    
+    # COO Header with Rotating Gears Effect
+    st.markdown("""
+    <div class="coo-header-wrap">
+        <div class="coo-gears-bg">
+            <span class="coo-gear spin" style="left: 5%; top: 10%; font-size: 50px;">⚙️</span>
+            <span class="coo-gear spin-rev" style="left: 12%; top: 40%; font-size: 35px;">⚙️</span>
+            <span class="coo-gear spin" style="right: 8%; top: 5%; font-size: 45px;">⚙️</span>
+            <span class="coo-gear spin-rev" style="right: 15%; top: 50%; font-size: 30px;">⚙️</span>
+            <span class="coo-gear spin" style="left: 40%; bottom: 5%; font-size: 25px;">⚙️</span>
+            <span class="coo-gear spin-rev" style="right: 40%; top: 15%; font-size: 28px;">⚙️</span>
+        </div>
+        <div class="coo-header-content">
+            <h1>COO Operations Dashboard</h1>
+            <p>Service Delivery, Workforce & Operational Excellence</p>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Dashboard Tabs
+    tab_overview, tab_mlops, tab_strategy = st.tabs(["📊 Overview & Analysis", "🧪 Model Ops & Strategy", "❄️ Snowflake Intelligence"])
+
+    with tab_overview:
+        
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['SUPPORT', 'WORKFORCE', 'FIELD_OPERATIONS', 'ORDER']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+        
+        # COO OPERATIONS COMMAND CENTER ANIMATION
+        st.markdown("""<div class="ops-command"><div class="ops-header"><div class="ops-title">⚙️ Operations Command Center</div><div class="ops-status"><div class="status-dot green"></div><span class="status-text">All Systems Operational</span></div></div><div class="ops-grid"><div class="ops-metric"><div class="ops-icon spin">⚙️</div><div class="ops-val">99.2%</div><div class="ops-label">Service Uptime</div></div><div class="ops-metric"><div class="ops-icon">📋</div><div class="ops-val">847</div><div class="ops-label">Orders Today</div></div><div class="ops-metric"><div class="ops-icon">🔧</div><div class="ops-val">142</div><div class="ops-label">Field Jobs Active</div></div><div class="ops-metric"><div class="ops-icon">⏱️</div><div class="ops-val">4.2h</div><div class="ops-label">Avg Resolution</div></div><div class="ops-metric"><div class="ops-icon">✅</div><div class="ops-val">94%</div><div class="ops-label">SLA Compliance</div></div></div></div>""", unsafe_allow_html=True)
+        
+        
+        st.markdown('<div class="section-header">Operations Performance Overview</div>', unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #10B981;">
+                <div class="kpi-icon">📞</div>
+                <div class="kpi-label">First Call Resolution</div>
+                <div class="kpi-value">78%</div>
+                <div class="kpi-delta positive">↑ +4% vs Q3</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <path d="M0,30 L20,28 L40,25 L60,22 L80,18 L100,16" fill="none" stroke="#10B981" stroke-width="2"/>
+                    <path d="M0,30 L20,28 L40,25 L60,22 L80,18 L100,16 L100,40 L0,40 Z" fill="#10B981"/>
+                </svg>
+            </div>
+            <div class="kpi-card" style="--accent: #29B5E8;">
+                <div class="kpi-icon">⏱️</div>
+                <div class="kpi-label">Avg Handle Time</div>
+                <div class="kpi-value">4.2m</div>
+                <div class="kpi-delta positive">↓ -0.8m vs target</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <path d="M0,15 L20,18 L40,16 L60,20 L80,22 L100,24" fill="none" stroke="#29B5E8" stroke-width="2"/>
+                    <path d="M0,15 L20,18 L40,16 L60,20 L80,22 L100,24 L100,40 L0,40 Z" fill="#29B5E8"/>
+                </svg>
+            </div>
+            <div class="kpi-card" style="--accent: #8B5CF6;">
+                <div class="kpi-icon">⭐</div>
+                <div class="kpi-label">CSAT Score</div>
+                <div class="kpi-value">4.3/5</div>
+                <div class="kpi-delta positive">↑ +0.2 YoY</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <rect x="5" y="28" width="12" height="12" fill="#8B5CF6"/>
+                    <rect x="22" y="24" width="12" height="16" fill="#8B5CF6"/>
+                    <rect x="39" y="20" width="12" height="20" fill="#8B5CF6"/>
+                    <rect x="56" y="16" width="12" height="24" fill="#8B5CF6"/>
+                    <rect x="73" y="14" width="12" height="26" fill="#8B5CF6"/>
+                </svg>
+            </div>
+            <div class="kpi-card" style="--accent: #F59E0B;">
+                <div class="kpi-icon">📋</div>
+                <div class="kpi-label">Order Fulfillment</div>
+                <div class="kpi-value">96.8%</div>
+                <div class="kpi-delta positive">↑ On-time delivery</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <path d="M0,22 L20,20 L40,18 L60,16 L80,14 L100,12" fill="none" stroke="#F59E0B" stroke-width="2"/>
+                    <path d="M0,22 L20,20 L40,18 L60,16 L80,14 L100,12 L100,40 L0,40 Z" fill="#F59E0B"/>
+                </svg>
+            </div>
+        </div>
+        
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #EC4899;">
+                <div class="kpi-icon">👥</div>
+                <div class="kpi-label">Agent Utilization</div>
+                <div class="kpi-value">82%</div>
+                <div class="kpi-delta neutral">Target: 80-85%</div>
+            </div>
+            <div class="kpi-card" style="--accent: #14B8A6;">
+                <div class="kpi-icon">🔧</div>
+                <div class="kpi-label">Field Jobs (MTD)</div>
+                <div class="kpi-value">4,280</div>
+                <div class="kpi-delta positive">↑ 94% completion</div>
+            </div>
+            <div class="kpi-card" style="--accent: #6366F1;">
+                <div class="kpi-icon">📉</div>
+                <div class="kpi-label">SLA Compliance</div>
+                <div class="kpi-value">97.2%</div>
+                <div class="kpi-delta positive">↑ vs 95% target</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EF4444;">
+                <div class="kpi-icon">🎫</div>
+                <div class="kpi-label">Open Tickets</div>
+                <div class="kpi-value">1,240</div>
+                <div class="kpi-delta negative">↑ +8% vs avg</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        col_left, col_right = st.columns([1.3, 1])
+        
+        with col_left:
+            st.markdown('<div class="section-header">Support Ticket Volume & Resolution</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="display: flex; gap: 1.5rem; font-size: 0.8rem; justify-content: center; margin-bottom: 0.75rem;">
+                        <span><span style="color: #EF4444;">█</span> Opened</span>
+                        <span><span style="color: #10B981;">█</span> Resolved</span>
+                    </div>
+                    <table style="width: 100%; border-collapse: collapse;">
+                        <thead>
+                            <tr style="color: #6B7280; font-size: 0.75rem;">
+                                <th style="text-align: center; padding: 0.4rem;">Mon</th>
+                                <th style="text-align: center; padding: 0.4rem;">Tue</th>
+                                <th style="text-align: center; padding: 0.4rem;">Wed</th>
+                                <th style="text-align: center; padding: 0.4rem;">Thu</th>
+                                <th style="text-align: center; padding: 0.4rem;">Fri</th>
+                                <th style="text-align: center; padding: 0.4rem;">Sat</th>
+                                <th style="text-align: center; padding: 0.4rem;">Sun</th>
+                            </tr>
+                        </thead>
+                        <tbody>
+                            <tr style="background: #FEE2E2;">
+                                <td style="text-align: center; padding: 0.5rem; color: #DC2626; font-weight: 600;">420</td>
+                                <td style="text-align: center; padding: 0.5rem; color: #DC2626; font-weight: 600;">385</td>
+                                <td style="text-align: center; padding: 0.5rem; color: #DC2626; font-weight: 600;">410</td>
+                                <td style="text-align: center; padding: 0.5rem; color: #DC2626; font-weight: 600;">395</td>
+                                <td style="text-align: center; padding: 0.5rem; color: #DC2626; font-weight: 600;">380</td>
+                                <td style="text-align: center; padding: 0.5rem; color: #DC2626;">180</td>
+                                <td style="text-align: center; padding: 0.5rem; color: #DC2626;">145</td>
+                            </tr>
+                            <tr style="background: #D1FAE5;">
+                                <td style="text-align: center; padding: 0.5rem; color: #065F46; font-weight: 600;">390</td>
+                                <td style="text-align: center; padding: 0.5rem; color: #065F46; font-weight: 600;">410</td>
+                                <td style="text-align: center; padding: 0.5rem; color: #065F46; font-weight: 600;">385</td>
+                                <td style="text-align: center; padding: 0.5rem; color: #065F46; font-weight: 600;">420</td>
+                                <td style="text-align: center; padding: 0.5rem; color: #065F46; font-weight: 600;">395</td>
+                                <td style="text-align: center; padding: 0.5rem; color: #065F46;">170</td>
+                                <td style="text-align: center; padding: 0.5rem; color: #065F46;">140</td>
+                            </tr>
+                        </tbody>
+                    </table>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                tkt_cols = st.columns(4)
+                with tkt_cols[0]:
+                    st.markdown("""
+                    <div style="text-align: center; padding: 0.5rem; background: #FEE2E2; border-radius: 8px;">
+                        <div style="font-size: 0.7rem; color: #DC2626;">Weekly Opened</div>
+                        <div style="font-size: 1.2rem; font-weight: 700; color: #DC2626;">2,315</div>
+                    </div>
+                    """, unsafe_allow_html=True)
+                with tkt_cols[1]:
+                    st.markdown("""
+                    <div style="text-align: center; padding: 0.5rem; background: #D1FAE5; border-radius: 8px;">
+                        <div style="font-size: 0.7rem; color: #065F46;">Weekly Resolved</div>
+                        <div style="font-size: 1.2rem; font-weight: 700; color: #065F46;">2,310</div>
+                    </div>
+                    """, unsafe_allow_html=True)
+                with tkt_cols[2]:
+                    st.markdown("""
+                    <div style="text-align: center; padding: 0.5rem; background: #E0F2FE; border-radius: 8px;">
+                        <div style="font-size: 0.7rem; color: #0369A1;">Avg Resolution</div>
+                        <div style="font-size: 1.2rem; font-weight: 700; color: #0369A1;">4.2h</div>
+                    </div>
+                    """, unsafe_allow_html=True)
+                with tkt_cols[3]:
+                    st.markdown("""
+                    <div style="text-align: center; padding: 0.5rem; background: #FEF3C7; border-radius: 8px;">
+                        <div style="font-size: 0.7rem; color: #92400E;">Backlog</div>
+                        <div style="font-size: 1.2rem; font-weight: 700; color: #92400E;">1,240</div>
+                    </div>
+                    """, unsafe_allow_html=True)
+        
+        with col_right:
+            st.markdown('<div class="section-header">Ticket Categories</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                category_data = pd.DataFrame({
+                    'Category': ['Billing', 'Technical', 'Service', 'Sales', 'Other'],
+                    'Count': [420, 380, 240, 120, 80],
+                    'Percentage': [34, 31, 19, 10, 6]
+                })
+                
+                donut = alt.Chart(category_data).mark_arc(innerRadius=50, outerRadius=85, cornerRadius=4).encode(
+                    theta=alt.Theta('Count:Q', stack=True),
+                    color=alt.Color('Category:N',
+                        scale=alt.Scale(
+                            domain=['Billing', 'Technical', 'Service', 'Sales', 'Other'],
+                            range=['#29B5E8', '#8B5CF6', '#10B981', '#F59E0B', '#6B7280']
+                        ),
+                        legend=None
+                    ),
+                    tooltip=[
+                        alt.Tooltip('Category:N'),
+                        alt.Tooltip('Count:Q'),
+                        alt.Tooltip('Percentage:Q', format='d')
+                    ]
+                ).properties(height=180)
+                
+                center_text = alt.Chart(pd.DataFrame({'text': ['1,240']})).mark_text(
+                    fontSize=20, fontWeight='bold', color='#1B2A4E'
+                ).encode(text='text:N')
+                
+                charts.altair_chart(donut + center_text, use_container_width=True)
+                
+                st.markdown("""
+                <div style="font-size: 0.8rem;">
+                    <div style="display: flex; justify-content: space-between; padding: 0.3rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span><span style="color: #29B5E8;">●</span> Billing</span><span style="font-weight: 600;">34%</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.3rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span><span style="color: #8B5CF6;">●</span> Technical</span><span style="font-weight: 600;">31%</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.3rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span><span style="color: #10B981;">●</span> Service</span><span style="font-weight: 600;">19%</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.3rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span><span style="color: #F59E0B;">●</span> Sales</span><span style="font-weight: 600;">10%</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.3rem 0;">
+                        <span><span style="color: #6B7280;">●</span> Other</span><span style="font-weight: 600;">6%</span>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Workforce Performance</div>', unsafe_allow_html=True)
+        
+        with st.container(border=True):
+            col_wf1, col_wf2 = st.columns(2)
+            
+            with col_wf1:
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="display: flex; align-items: center; padding: 0.5rem 0; border-bottom: 1px solid #F3F4F6;">
+                        <span style="width: 120px;">Field Services</span>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 14px; margin: 0 0.75rem;">
+                            <div style="background: #F59E0B; width: 88%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                        <span style="font-weight: 700; color: #F59E0B; width: 45px;">88%</span>
+                    </div>
+                    <div style="display: flex; align-items: center; padding: 0.5rem 0; border-bottom: 1px solid #F3F4F6;">
+                        <span style="width: 120px;">Contact Centre</span>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 14px; margin: 0 0.75rem;">
+                            <div style="background: #10B981; width: 82%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                        <span style="font-weight: 700; color: #10B981; width: 45px;">82%</span>
+                    </div>
+                    <div style="display: flex; align-items: center; padding: 0.5rem 0; border-bottom: 1px solid #F3F4F6;">
+                        <span style="width: 120px;">Technical Support</span>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 14px; margin: 0 0.75rem;">
+                            <div style="background: #10B981; width: 76%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                        <span style="font-weight: 700; color: #10B981; width: 45px;">76%</span>
+                    </div>
+                    <div style="display: flex; align-items: center; padding: 0.5rem 0; border-bottom: 1px solid #F3F4F6;">
+                        <span style="width: 120px;">Retail</span>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 14px; margin: 0 0.75rem;">
+                            <div style="background: #F59E0B; width: 72%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                        <span style="font-weight: 700; color: #F59E0B; width: 45px;">72%</span>
+                    </div>
+                    <div style="display: flex; align-items: center; padding: 0.5rem 0;">
+                        <span style="width: 120px;">Back Office</span>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 14px; margin: 0 0.75rem;">
+                            <div style="background: #F59E0B; width: 68%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                        <span style="font-weight: 700; color: #F59E0B; width: 45px;">68%</span>
+                    </div>
+                    <div style="text-align: center; font-size: 0.75rem; color: #6B7280; margin-top: 0.5rem;"><span style="color: #10B981;">█</span> Optimal (75-85%) <span style="color: #F59E0B; margin-left: 1rem;">█</span> Outside Range</div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col_wf2:
+                st.markdown("""
+                <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 0.75rem;">
+                    <div style="background: linear-gradient(135deg, #E0F2FE 0%, #F0F9FF 100%); border-radius: 12px; padding: 1rem; text-align: center;">
+                        <div style="font-size: 0.75rem; color: #0369A1;">Total Headcount</div>
+                        <div style="font-size: 1.5rem; font-weight: 700; color: #0369A1;">695</div>
+                        <div style="font-size: 0.7rem; color: #6B7280;">+12 vs budget</div>
+                    </div>
+                    <div style="background: linear-gradient(135deg, #D1FAE5 0%, #ECFDF5 100%); border-radius: 12px; padding: 1rem; text-align: center;">
+                        <div style="font-size: 0.75rem; color: #065F46;">Avg Utilization</div>
+                        <div style="font-size: 1.5rem; font-weight: 700; color: #065F46;">77%</div>
+                        <div style="font-size: 0.7rem; color: #6B7280;">Target: 75-85%</div>
+                    </div>
+                    <div style="background: linear-gradient(135deg, #EDE9FE 0%, #F5F3FF 100%); border-radius: 12px; padding: 1rem; text-align: center;">
+                        <div style="font-size: 0.75rem; color: #5B21B6;">Avg CSAT</div>
+                        <div style="font-size: 1.5rem; font-weight: 700; color: #5B21B6;">4.24</div>
+                        <div style="font-size: 0.7rem; color: #6B7280;">Target: 4.0</div>
+                    </div>
+                    <div style="background: linear-gradient(135deg, #FEF3C7 0%, #FDE68A 100%); border-radius: 12px; padding: 1rem; text-align: center;">
+                        <div style="font-size: 0.75rem; color: #92400E;">Attrition Rate</div>
+                        <div style="font-size: 1.5rem; font-weight: 700; color: #92400E;">12%</div>
+                        <div style="font-size: 0.7rem; color: #6B7280;">Industry: 18%</div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        col_field, col_order = st.columns(2)
+        
+        with col_field:
+            st.markdown('<div class="section-header">Field Operations</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                field_data = pd.DataFrame({
+                    'Type': ['Installation', 'Repair', 'Maintenance', 'Upgrade', 'Survey'],
+                    'Completed': [1820, 1240, 680, 420, 120],
+                    'Target': [1900, 1200, 700, 400, 150],
+                    'SLA_Met': [94, 96, 92, 98, 88]
+                })
+                
+                bars = alt.Chart(field_data).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Completed:Q', title='Jobs Completed', scale=alt.Scale(domain=[0, 2000])),
+                    y=alt.Y('Type:N', sort=alt.EncodingSortField(field='Completed', order='descending'), title=None),
+                    color=alt.Color('SLA_Met:Q',
+                        scale=alt.Scale(scheme='greens', domain=[85, 100]),
+                        legend=None
+                    ),
+                    tooltip=[
+                        alt.Tooltip('Type:N'),
+                        alt.Tooltip('Completed:Q', format=','),
+                        alt.Tooltip('Target:Q', format=','),
+                        alt.Tooltip('SLA_Met:Q', title='SLA Met %')
+                    ]
+                ).properties(height=180)
+                
+                target_tick = alt.Chart(field_data).mark_tick(color='#DC2626', thickness=3, size=20).encode(
+                    x='Target:Q',
+                    y=alt.Y('Type:N', sort=alt.EncodingSortField(field='Completed', order='descending'))
+                )
+                
+                charts.altair_chart(bars + target_tick, use_container_width=True)
+                
+                st.markdown("""
+                <div style="display: flex; gap: 0.75rem; justify-content: center;">
+                    <div style="background: #D1FAE5; padding: 0.5rem 1rem; border-radius: 8px; text-align: center;">
+                        <div style="font-size: 0.7rem; color: #065F46;">Total MTD</div>
+                        <div style="font-weight: 700; color: #065F46;">4,280</div>
+                    </div>
+                    <div style="background: #E0F2FE; padding: 0.5rem 1rem; border-radius: 8px; text-align: center;">
+                        <div style="font-size: 0.7rem; color: #0369A1;">Completion</div>
+                        <div style="font-weight: 700; color: #0369A1;">94%</div>
+                    </div>
+                    <div style="background: #EDE9FE; padding: 0.5rem 1rem; border-radius: 8px; text-align: center;">
+                        <div style="font-size: 0.7rem; color: #5B21B6;">Avg per Tech</div>
+                        <div style="font-weight: 700; color: #5B21B6;">24/wk</div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col_order:
+            st.markdown('<div class="section-header">Order Fulfillment Pipeline</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                order_data = pd.DataFrame({
+                    'Status': ['Received', 'Processing', 'Provisioning', 'Completed', 'Delayed'],
+                    'Count': [450, 320, 180, 2840, 45],
+                    'Percentage': [11.7, 8.3, 4.7, 74.1, 1.2]
+                })
+                
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="display: flex; justify-content: space-between; align-items: center; padding: 0.6rem; background: #E0F2FE; border-radius: 8px; margin-bottom: 0.5rem;">
+                        <span><span style="display: inline-block; width: 10px; height: 10px; background: #29B5E8; border-radius: 2px; margin-right: 6px;"></span>Received</span>
+                        <span style="font-weight: 600;">450</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; align-items: center; padding: 0.6rem; background: #FEF3C7; border-radius: 8px; margin-bottom: 0.5rem;">
+                        <span><span style="display: inline-block; width: 10px; height: 10px; background: #F59E0B; border-radius: 2px; margin-right: 6px;"></span>Processing</span>
+                        <span style="font-weight: 600;">320</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; align-items: center; padding: 0.6rem; background: #EDE9FE; border-radius: 8px; margin-bottom: 0.5rem;">
+                        <span><span style="display: inline-block; width: 10px; height: 10px; background: #8B5CF6; border-radius: 2px; margin-right: 6px;"></span>Provisioning</span>
+                        <span style="font-weight: 600;">180</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; align-items: center; padding: 0.6rem; background: #D1FAE5; border-radius: 8px; margin-bottom: 0.5rem;">
+                        <span><span style="display: inline-block; width: 10px; height: 10px; background: #10B981; border-radius: 2px; margin-right: 6px;"></span>Completed (MTD)</span>
+                        <span style="font-weight: 600;">2,840</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; align-items: center; padding: 0.6rem; background: #FEE2E2; border-radius: 8px;">
+                        <span><span style="display: inline-block; width: 10px; height: 10px; background: #EF4444; border-radius: 2px; margin-right: 6px;"></span>Delayed</span>
+                        <span style="font-weight: 600; color: #DC2626;">45</span>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                st.markdown("""
+                <div style="margin-top: 0.75rem; background: linear-gradient(135deg, #1B2A4E 0%, #2D3F6B 100%); border-radius: 8px; padding: 0.75rem; color: white; text-align: center;">
+                    <div style="font-size: 0.75rem; opacity: 0.8;">On-Time Delivery Rate</div>
+                    <div style="font-size: 1.5rem; font-weight: 700; color: #10B981;">96.8%</div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+
+    with tab_strategy:
+        st.markdown('<div class="section-header">COO Strategic Priorities — Q1 2026</div>', unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #DC2626; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 1</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">FCR to 82%</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current FCR: **78%** (target: 82%)
+                - Deploy AI-assisted resolution
+                - Knowledge base enhancement
+                - Agent training program: 85% complete
+                """)
+        
+        with col2:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #F59E0B; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 2</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Reduce Ticket Backlog</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current backlog: **1,240** (target: <1,000)
+                - Add 15 FTE to contact centre
+                - Automate 20% of billing tickets
+                - Expected resolution: Q1 end
+                """)
+        
+        with col3:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #10B981; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 3</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Field Efficiency +10%</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **24 jobs/tech/week**
+                - Route optimization: pilot complete
+                - Mobile app upgrade: deployed
+                - Target: **26.4 jobs/tech/week**
+                """)
+        
+        st.markdown('<div class="section-header">Ask Snowflake Intelligence</div>', unsafe_allow_html=True)
+        
+        questions = [
+            "What's our ticket volume trend and which categories are growing fastest?",
+            "Show me agent performance metrics - utilization, FCR, and CSAT by team.",
+            "What's our order fulfillment rate and where are the bottlenecks?",
+            "Which field service types have the highest completion rates and SLA compliance?",
+            "What's the correlation between staffing levels and customer satisfaction scores?"
+        ]
+        
+        sf_intel_url = "https://ai.snowflake.com/sfseeurope/pjose_aws3"
+        
+        cols = st.columns(2)
+        for i, q in enumerate(questions):
+            with cols[i % 2]:
+                escaped_q = q.replace('"', '&quot;').replace("'", "&#39;")
+                st.markdown(f"""
+                <a href="{sf_intel_url}" target="_blank" onclick="navigator.clipboard.writeText('{escaped_q}')" style="text-decoration: none; color: inherit; display: block;">
+                    <div class="question-card">
+                        <p style="margin-bottom: 1.5rem;"><strong>Q{i+1}:</strong> "{q}"</p>
+                    </div>
+                </a>
+                """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div style="text-align: center; margin-top: 1rem; padding: 1rem; background: linear-gradient(135deg, #29B5E8 0%, #1A8BC4 100%); border-radius: 8px;">
+            <a href="{sf_intel_url}" target="_blank" style="color: white; text-decoration: none; font-weight: 600; font-size: 1rem;">
+                ❄️ Ask these questions in Snowflake Intelligence →
+            </a>
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,1000 @@
+"""CSO Sustainability dashboard."""
+
+import streamlit as st
+import pandas as pd
+import altair as alt
+
+from dashboard import charts
+
+
+def render_cso_sustainability():
+    import pandas as pd
+    import altair as alt
+    
+    # CSO Header with Floating Leaves Effect
+    st.markdown("""
+    <div class="cso-header-wrap">
+        <div class="cso-nature-bg">
+            <span class="cso-leaf" style="left: 8%; top: -5%; animation-delay: 0s;">🍃</span>
+            <span class="cso-leaf" style="left: 20%; top: -10%; animation-delay: 1s;">🌿</span>
+            <span class="cso-leaf" style="left: 35%; top: -8%; animation-delay: 2s;">🍃</span>
+            <span class="cso-leaf" style="left: 50%; top: -12%; animation-delay: 3s;">🌱</span>
+            <span class="cso-leaf" style="left: 65%; top: -6%; animation-delay: 4s;">🍃</span>
+            <span class="cso-leaf" style="left: 80%; top: -15%; animation-delay: 0.5s;">🌿</span>
+            <span class="cso-leaf" style="left: 92%; top: -8%; animation-delay: 1.5s;">🍃</span>
+            <span class="cso-tree" style="left: 5%; bottom: 5%;">🌳</span>
+            <span class="cso-tree" style="right: 8%; bottom: 5%; animation-delay: 2s;">🌲</span>
+        </div>
+        <div class="cso-header-content">
+            <h1>CSO Sustainability & ESG Dashboard</h1>
+            <p>Carbon Reduction, Renewable Energy & Net Zero Progress</p>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Dashboard Tabs
+    tab_overview, tab_ops, tab_strategy = st.tabs(["📊 Overview & Analysis", "🌿 Operations & Impact", "❄️ Snowflake Intelligence"])
+
+    with tab_overview:
+        
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['SUSTAINABILITY']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+        
+        # CSO GREEN ENERGY ANIMATION
+        st.markdown("""<div class="cso-green"><div class="green-header"><div class="green-title">🌱 Sustainability Metrics</div><div class="green-badge">Net Zero 2030</div></div><div class="eco-meters"><div class="eco-meter"><div class="meter-container"><div class="meter-icon">🌿</div><div class="meter-fill renewable"></div></div><div class="meter-val">72%</div><div class="meter-label">Renewable Energy</div><div class="meter-target">Target: 100%</div></div><div class="eco-meter"><div class="meter-container"><div class="meter-icon">🏭</div><div class="meter-fill carbon"></div></div><div class="meter-val">-42%</div><div class="meter-label">Carbon Reduction</div><div class="meter-target">vs 2019 baseline</div></div><div class="eco-meter"><div class="meter-container"><div class="meter-icon">♻️</div><div class="meter-fill waste"></div></div><div class="meter-val">85%</div><div class="meter-label">Waste Recycled</div><div class="meter-target">Target: 95%</div></div><div class="eco-meter"><div class="meter-container"><div class="meter-icon">💧</div><div class="meter-fill water"></div></div><div class="meter-val">-33%</div><div class="meter-label">Water Usage</div><div class="meter-target">vs 2020</div></div></div></div>""", unsafe_allow_html=True)
+        
+        
+        st.markdown('<div class="section-header">Sustainability Overview</div>', unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #10B981;">
+                <div class="kpi-icon">🌿</div>
+                <div class="kpi-label">Renewable Energy</div>
+                <div class="kpi-value">65%</div>
+                <div class="kpi-delta positive">↑ +12% YoY</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <path d="M0,35 L20,32 L40,28 L60,22 L80,18 L100,12" fill="none" stroke="#10B981" stroke-width="2"/>
+                    <path d="M0,35 L20,32 L40,28 L60,22 L80,18 L100,12 L100,40 L0,40 Z" fill="#10B981"/>
+                </svg>
+            </div>
+            <div class="kpi-card" style="--accent: #3B82F6;">
+                <div class="kpi-icon">⚡</div>
+                <div class="kpi-label">Energy Consumption</div>
+                <div class="kpi-value">48.2 GWh</div>
+                <div class="kpi-delta positive">↓ -8% YoY</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <path d="M0,15 L20,18 L40,22 L60,26 L80,30 L100,32" fill="none" stroke="#3B82F6" stroke-width="2"/>
+                    <path d="M0,15 L20,18 L40,22 L60,26 L80,30 L100,32 L100,40 L0,40 Z" fill="#3B82F6"/>
+                </svg>
+            </div>
+            <div class="kpi-card" style="--accent: #6366F1;">
+                <div class="kpi-icon">🏭</div>
+                <div class="kpi-label">Carbon Emissions</div>
+                <div class="kpi-value">12.4K tCO₂e</div>
+                <div class="kpi-delta positive">↓ -15% YoY</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <path d="M0,12 L20,16 L40,20 L60,24 L80,28 L100,34" fill="none" stroke="#6366F1" stroke-width="2"/>
+                    <path d="M0,12 L20,16 L40,20 L60,24 L80,28 L100,34 L100,40 L0,40 Z" fill="#6366F1"/>
+                </svg>
+            </div>
+            <div class="kpi-card" style="--accent: #F59E0B;">
+                <div class="kpi-icon">📊</div>
+                <div class="kpi-label">PUE Ratio</div>
+                <div class="kpi-value">1.42</div>
+                <div class="kpi-delta positive">↓ -0.08 YoY</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <rect x="5" y="30" width="12" height="10" fill="#F59E0B"/>
+                    <rect x="22" y="26" width="12" height="14" fill="#F59E0B"/>
+                    <rect x="39" y="22" width="12" height="18" fill="#F59E0B"/>
+                    <rect x="56" y="20" width="12" height="20" fill="#F59E0B"/>
+                    <rect x="73" y="16" width="12" height="24" fill="#F59E0B"/>
+                </svg>
+            </div>
+        </div>
+        
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #14B8A6;">
+                <div class="kpi-icon">🎯</div>
+                <div class="kpi-label">Net Zero Progress</div>
+                <div class="kpi-value">42%</div>
+                <div class="kpi-delta positive">On track for 2035</div>
+            </div>
+            <div class="kpi-card" style="--accent: #8B5CF6;">
+                <div class="kpi-icon">♻️</div>
+                <div class="kpi-label">E-Waste Recycled</div>
+                <div class="kpi-value">94%</div>
+                <div class="kpi-delta positive">↑ +6% YoY</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EC4899;">
+                <div class="kpi-icon">🌱</div>
+                <div class="kpi-label">Green Tariff Customers</div>
+                <div class="kpi-value">8,420</div>
+                <div class="kpi-delta positive">28% of base</div>
+            </div>
+            <div class="kpi-card" style="--accent: #29B5E8;">
+                <div class="kpi-icon">🏢</div>
+                <div class="kpi-label">Sites Monitored</div>
+                <div class="kpi-value">475</div>
+                <div class="kpi-delta neutral">100% coverage</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        if st.session_state.get('sf_highlights', True):
+            st.info("❄️ **Powered by Snowflake** — ESG metrics aggregated from 475+ sites using Snowflake Data Sharing for regulatory reporting and stakeholder transparency")
+        
+        col_left, col_right = st.columns([1.3, 1])
+        
+        with col_left:
+            st.markdown('<div class="section-header">Renewable Energy Progress</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <div style="margin-bottom: 1rem;">
+                    <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 0.5rem;">
+                        <span style="font-weight: 600; color: #1B2A4E;">2024 Target: 70% Renewable</span>
+                        <span style="font-weight: 700; color: #10B981;">65% Achieved</span>
+                    </div>
+                    <div style="background: #E5E7EB; border-radius: 8px; height: 32px; position: relative; overflow: hidden;">
+                        <div style="background: linear-gradient(90deg, #10B981, #34D399); width: 65%; height: 100%; border-radius: 8px; display: flex; align-items: center; justify-content: flex-end; padding-right: 0.75rem;">
+                            <span style="color: white; font-weight: 600; font-size: 0.85rem;">65%</span>
+                        </div>
+                        <div style="position: absolute; left: 70%; top: 0; bottom: 0; border-left: 3px dashed #1B2A4E; opacity: 0.5;"></div>
+                        <span style="position: absolute; left: 70%; top: -18px; font-size: 0.65rem; color: #6B7280; transform: translateX(-50%);">Target</span>
+                    </div>
+                </div>
+                <div style="font-size: 0.85rem;">
+                    <div style="display: flex; align-items: center; padding: 0.5rem 0; border-bottom: 1px solid #F3F4F6;">
+                        <span style="width: 100px; font-weight: 600; color: #10B981;">Solar PV</span>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 20px; margin: 0 0.75rem;">
+                            <div style="background: linear-gradient(90deg, #FBBF24, #F59E0B); width: 35%; height: 100%; border-radius: 4px; display: flex; align-items: center; padding-left: 0.5rem;">
+                                <span style="color: white; font-size: 0.7rem; font-weight: 600;">35%</span>
+                            </div>
+                        </div>
+                        <span style="width: 70px; text-align: right; font-size: 0.8rem; color: #6B7280;">16.9 GWh</span>
+                    </div>
+                    <div style="display: flex; align-items: center; padding: 0.5rem 0; border-bottom: 1px solid #F3F4F6;">
+                        <span style="width: 100px; font-weight: 600; color: #10B981;">Wind Power</span>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 20px; margin: 0 0.75rem;">
+                            <div style="background: linear-gradient(90deg, #3B82F6, #60A5FA); width: 20%; height: 100%; border-radius: 4px; display: flex; align-items: center; padding-left: 0.5rem;">
+                                <span style="color: white; font-size: 0.7rem; font-weight: 600;">20%</span>
+                            </div>
+                        </div>
+                        <span style="width: 70px; text-align: right; font-size: 0.8rem; color: #6B7280;">9.6 GWh</span>
+                    </div>
+                    <div style="display: flex; align-items: center; padding: 0.5rem 0; border-bottom: 1px solid #F3F4F6;">
+                        <span style="width: 100px; font-weight: 600; color: #10B981;">Grid Green</span>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 20px; margin: 0 0.75rem;">
+                            <div style="background: linear-gradient(90deg, #10B981, #34D399); width: 10%; height: 100%; border-radius: 4px; display: flex; align-items: center; padding-left: 0.5rem;">
+                                <span style="color: white; font-size: 0.7rem; font-weight: 600;">10%</span>
+                            </div>
+                        </div>
+                        <span style="width: 70px; text-align: right; font-size: 0.8rem; color: #6B7280;">4.8 GWh</span>
+                    </div>
+                    <div style="display: flex; align-items: center; padding: 0.5rem 0;">
+                        <span style="width: 100px; font-weight: 600; color: #6B7280;">Grid (Non-Ren)</span>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 20px; margin: 0 0.75rem;">
+                            <div style="background: linear-gradient(90deg, #9CA3AF, #D1D5DB); width: 35%; height: 100%; border-radius: 4px; display: flex; align-items: center; padding-left: 0.5rem;">
+                                <span style="color: white; font-size: 0.7rem; font-weight: 600;">35%</span>
+                            </div>
+                        </div>
+                        <span style="width: 70px; text-align: right; font-size: 0.8rem; color: #6B7280;">16.9 GWh</span>
+                    </div>
+                </div>
+                <div style="margin-top: 1rem; padding: 0.75rem; background: #D1FAE5; border-radius: 8px; text-align: center; font-size: 0.85rem;">
+                    <span style="color: #065F46;">🌿 <strong>5% gap to 2024 target</strong> — Solar expansion in progress for Q2</span>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            st.markdown('<div class="section-header">Energy Consumption by Site Type</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <table style="width: 100%; border-collapse: collapse; font-size: 0.85rem;">
+                    <thead>
+                        <tr style="border-bottom: 2px solid #E5E7EB;">
+                            <th style="text-align: left; padding: 0.5rem; color: #6B7280;">Site Type</th>
+                            <th style="text-align: right; padding: 0.5rem; color: #6B7280;">Sites</th>
+                            <th style="text-align: right; padding: 0.5rem; color: #6B7280;">Energy (GWh)</th>
+                            <th style="text-align: right; padding: 0.5rem; color: #6B7280;">Avg/Site</th>
+                            <th style="text-align: right; padding: 0.5rem; color: #6B7280;">Efficiency</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem;"><span style="color: #EF4444;">●</span> Macro Cell</td>
+                            <td style="text-align: right; padding: 0.5rem; font-weight: 600;">185</td>
+                            <td style="text-align: right; padding: 0.5rem;">32.4</td>
+                            <td style="text-align: right; padding: 0.5rem;">175 MWh</td>
+                            <td style="text-align: right; padding: 0.5rem;"><span style="background: #FEF3C7; color: #92400E; padding: 0.2rem 0.5rem; border-radius: 12px;">Medium</span></td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem;"><span style="color: #10B981;">●</span> Small Cell</td>
+                            <td style="text-align: right; padding: 0.5rem; font-weight: 600;">240</td>
+                            <td style="text-align: right; padding: 0.5rem;">8.6</td>
+                            <td style="text-align: right; padding: 0.5rem;">36 MWh</td>
+                            <td style="text-align: right; padding: 0.5rem;"><span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">High</span></td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem;"><span style="color: #3B82F6;">●</span> Data Centre</td>
+                            <td style="text-align: right; padding: 0.5rem; font-weight: 600;">3</td>
+                            <td style="text-align: right; padding: 0.5rem;">5.8</td>
+                            <td style="text-align: right; padding: 0.5rem;">1,933 MWh</td>
+                            <td style="text-align: right; padding: 0.5rem;"><span style="background: #FEE2E2; color: #DC2626; padding: 0.2rem 0.5rem; border-radius: 12px;">Review</span></td>
+                        </tr>
+                        <tr>
+                            <td style="padding: 0.5rem;"><span style="color: #8B5CF6;">●</span> Office/Retail</td>
+                            <td style="text-align: right; padding: 0.5rem; font-weight: 600;">47</td>
+                            <td style="text-align: right; padding: 0.5rem;">1.4</td>
+                            <td style="text-align: right; padding: 0.5rem;">30 MWh</td>
+                            <td style="text-align: right; padding: 0.5rem;"><span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">High</span></td>
+                        </tr>
+                    </tbody>
+                </table>
+                <div style="margin-top: 0.75rem; padding: 0.5rem; background: #E0F2FE; border-radius: 8px; font-size: 0.8rem;">
+                    <span style="color: #0369A1;">💡 Small cells are <strong>4.8x more energy efficient</strong> per unit than macro cells</span>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col_right:
+            st.markdown('<div class="section-header">Carbon Emissions Trend</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="padding: 0.6rem; border-left: 4px solid #EF4444; background: #FEE2E2; border-radius: 0 8px 8px 0; margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <div>
+                                <div style="font-weight: 600; color: #DC2626;">2022 (Baseline)</div>
+                                <div style="font-size: 0.75rem; color: #6B7280;">Pre-initiative</div>
+                            </div>
+                            <span style="font-size: 1.2rem; font-weight: 700; color: #DC2626;">18.2K tCO₂e</span>
+                        </div>
+                    </div>
+                    <div style="padding: 0.6rem; border-left: 4px solid #F59E0B; background: #FEF3C7; border-radius: 0 8px 8px 0; margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <div>
+                                <div style="font-weight: 600; color: #92400E;">2023</div>
+                                <div style="font-size: 0.75rem; color: #6B7280;">↓ 20% reduction</div>
+                            </div>
+                            <span style="font-size: 1.2rem; font-weight: 700; color: #F59E0B;">14.6K tCO₂e</span>
+                        </div>
+                    </div>
+                    <div style="padding: 0.6rem; border-left: 4px solid #10B981; background: #D1FAE5; border-radius: 0 8px 8px 0; margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <div>
+                                <div style="font-weight: 600; color: #065F46;">2024 YTD</div>
+                                <div style="font-size: 0.75rem; color: #6B7280;">↓ 32% from baseline</div>
+                            </div>
+                            <span style="font-size: 1.2rem; font-weight: 700; color: #10B981;">12.4K tCO₂e</span>
+                        </div>
+                    </div>
+                    <div style="padding: 0.6rem; border-left: 4px solid #29B5E8; background: #E0F2FE; border-radius: 0 8px 8px 0;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <div>
+                                <div style="font-weight: 600; color: #0369A1;">2035 Target</div>
+                                <div style="font-size: 0.75rem; color: #6B7280;">Net Zero</div>
+                            </div>
+                            <span style="font-size: 1.2rem; font-weight: 700; color: #29B5E8;">0 tCO₂e</span>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            st.markdown('<div class="section-header">PUE by Facility</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>London DC (Primary)</span>
+                        <span style="font-weight: 700; background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">PUE: 1.35</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Manchester DC</span>
+                        <span style="font-weight: 700; background: #FEF3C7; color: #92400E; padding: 0.2rem 0.5rem; border-radius: 12px;">PUE: 1.48</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Birmingham DC</span>
+                        <span style="font-weight: 700; background: #FEF3C7; color: #92400E; padding: 0.2rem 0.5rem; border-radius: 12px;">PUE: 1.52</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0;">
+                        <span style="font-weight: 600;">Network Average</span>
+                        <span style="font-weight: 700; background: #E0F2FE; color: #0369A1; padding: 0.2rem 0.5rem; border-radius: 12px;">PUE: 1.42</span>
+                    </div>
+                </div>
+                <div style="margin-top: 0.75rem; padding: 0.5rem; background: #F3F4F6; border-radius: 8px; font-size: 0.75rem; text-align: center;">
+                    <span style="color: #6B7280;">Industry benchmark: 1.58 · Target: 1.30 by 2026</span>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            st.markdown('<div class="section-header">E-Waste Management</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 0.5rem;">
+                    <div style="background: linear-gradient(135deg, #D1FAE5 0%, #ECFDF5 100%); border-radius: 12px; padding: 0.75rem; text-align: center;">
+                        <div style="font-size: 0.7rem; color: #065F46;">Recycled</div>
+                        <div style="font-size: 1.3rem; font-weight: 700; color: #065F46;">94%</div>
+                        <div style="font-size: 0.65rem; color: #6B7280;">847 tonnes</div>
+                    </div>
+                    <div style="background: linear-gradient(135deg, #E0F2FE 0%, #F0F9FF 100%); border-radius: 12px; padding: 0.75rem; text-align: center;">
+                        <div style="font-size: 0.7rem; color: #0369A1;">Refurbished</div>
+                        <div style="font-size: 1.3rem; font-weight: 700; color: #0369A1;">4,200</div>
+                        <div style="font-size: 0.65rem; color: #6B7280;">Devices reused</div>
+                    </div>
+                    <div style="background: linear-gradient(135deg, #FEF3C7 0%, #FDE68A 100%); border-radius: 12px; padding: 0.75rem; text-align: center;">
+                        <div style="font-size: 0.7rem; color: #92400E;">Landfill Diverted</div>
+                        <div style="font-size: 1.3rem; font-weight: 700; color: #92400E;">98%</div>
+                        <div style="font-size: 0.65rem; color: #6B7280;">Near zero waste</div>
+                    </div>
+                    <div style="background: linear-gradient(135deg, #EDE9FE 0%, #F5F3FF 100%); border-radius: 12px; padding: 0.75rem; text-align: center;">
+                        <div style="font-size: 0.7rem; color: #5B21B6;">CO₂ Avoided</div>
+                        <div style="font-size: 1.3rem; font-weight: 700; color: #5B21B6;">1,240t</div>
+                        <div style="font-size: 0.65rem; color: #6B7280;">Via recycling</div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Net Zero Roadmap Progress</div>', unsafe_allow_html=True)
+        
+        with st.container(border=True):
+            col_chart, col_legend = st.columns([2, 1])
+            
+            with col_chart:
+                # Net Zero Progress Data
+                years = ['2022', '2023', '2024', 'Now', '2030', '2035']
+                net_zero_data = pd.DataFrame({
+                    'Year': years,
+                    'Progress': [0, 17, 32, 42, 72, 100],
+                    'Type': ['Actual', 'Actual', 'Actual', 'Actual', 'Projected', 'Target'],
+                    'Label': ['Baseline', '17%', '32%', '42%', '72%', '100%']
+                })
+                
+                # Actual progress (solid line)
+                actual_data = net_zero_data[net_zero_data['Type'] == 'Actual']
+                projected_data = net_zero_data[net_zero_data['Year'].isin(['Now', '2030', '2035'])]
+                
+                # Create layered chart
+                base = alt.Chart(net_zero_data).encode(
+                    x=alt.X('Year:N', sort=years, axis=alt.Axis(labelAngle=0, title=None))
+                )
+                
+                # Actual progress line
+                actual_line = alt.Chart(actual_data).mark_line(
+                    strokeWidth=4, color='#10B981'
+                ).encode(
+                    x=alt.X('Year:N', sort=years),
+                    y=alt.Y('Progress:Q', scale=alt.Scale(domain=[0, 110]), axis=alt.Axis(title='% to Net Zero', format='d'))
+                )
+                
+                # Projected line (dashed)
+                projected_line = alt.Chart(projected_data).mark_line(
+                    strokeWidth=3, color='#10B981', strokeDash=[6, 4]
+                ).encode(
+                    x=alt.X('Year:N', sort=years),
+                    y=alt.Y('Progress:Q')
+                )
+                
+                # Points
+                points = base.mark_circle(size=150).encode(
+                    y=alt.Y('Progress:Q'),
+                    color=alt.Color('Type:N', scale=alt.Scale(
+                        domain=['Actual', 'Projected', 'Target'],
+                        range=['#10B981', '#29B5E8', '#10B981']
+                    ), legend=None),
+                    tooltip=['Year:N', alt.Tooltip('Progress:Q', title='Progress', format='d%'), 'Type:N']
+                )
+                
+                # Labels
+                labels = base.mark_text(dy=-15, fontSize=11, fontWeight='bold').encode(
+                    y=alt.Y('Progress:Q'),
+                    text='Label:N',
+                    color=alt.value('#1B2A4E')
+                )
+                
+                # Target line
+                target_rule = alt.Chart(pd.DataFrame({'y': [100]})).mark_rule(
+                    color='#10B981', strokeDash=[4, 4], opacity=0.5
+                ).encode(y='y:Q')
+                
+                combined_chart = (actual_line + projected_line + points + labels + target_rule).properties(height=180)
+                charts.altair_chart(combined_chart, use_container_width=True)
+            
+            with col_legend:
+                st.markdown("""
+                <div style="font-size: 0.75rem; color: #6B7280; margin-bottom: 0.75rem;">Milestones</div>
+                <div style="display: flex; align-items: center; margin-bottom: 0.5rem;">
+                    <div style="width: 12px; height: 12px; background: #EF4444; border-radius: 50%; margin-right: 0.5rem;"></div>
+                    <span style="font-size: 0.8rem;"><strong>2022:</strong> Baseline set</span>
+                </div>
+                <div style="display: flex; align-items: center; margin-bottom: 0.5rem;">
+                    <div style="width: 12px; height: 12px; background: #F59E0B; border-radius: 50%; margin-right: 0.5rem;"></div>
+                    <span style="font-size: 0.8rem;"><strong>2024:</strong> 32% reduction</span>
+                </div>
+                <div style="display: flex; align-items: center; margin-bottom: 0.5rem;">
+                    <div style="width: 12px; height: 12px; background: #10B981; border-radius: 50%; margin-right: 0.5rem;"></div>
+                    <span style="font-size: 0.8rem;"><strong>Now:</strong> 42% complete</span>
+                </div>
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <div style="width: 12px; height: 12px; background: #29B5E8; border-radius: 50%; margin-right: 0.5rem;"></div>
+                    <span style="font-size: 0.8rem;"><strong>2035:</strong> Net Zero</span>
+                </div>
+                <div style="padding: 0.5rem; background: #D1FAE5; border-radius: 6px; text-align: center; font-size: 0.75rem;">
+                    <span style="color: #065F46;">✓ On track to target</span>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        col_site, col_carbon = st.columns(2)
+        
+        with col_site:
+            st.markdown('<div class="section-header">Top Energy Consuming Sites</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; font-size: 0.8rem;">
+                            <span>London DC (Primary)</span>
+                            <span style="font-weight: 600;">2,450 MWh</span>
+                        </div>
+                        <div style="background: #E5E7EB; height: 12px; border-radius: 4px; margin-top: 0.25rem;">
+                            <div style="background: linear-gradient(90deg, #3B82F6, #60A5FA); width: 100%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; font-size: 0.8rem;">
+                            <span>Manchester DC</span>
+                            <span style="font-weight: 600;">1,840 MWh</span>
+                        </div>
+                        <div style="background: #E5E7EB; height: 12px; border-radius: 4px; margin-top: 0.25rem;">
+                            <div style="background: linear-gradient(90deg, #3B82F6, #60A5FA); width: 75%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; font-size: 0.8rem;">
+                            <span>Birmingham DC</span>
+                            <span style="font-weight: 600;">1,510 MWh</span>
+                        </div>
+                        <div style="background: #E5E7EB; height: 12px; border-radius: 4px; margin-top: 0.25rem;">
+                            <div style="background: linear-gradient(90deg, #3B82F6, #60A5FA); width: 62%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; font-size: 0.8rem;">
+                            <span>Leeds Macro Cluster</span>
+                            <span style="font-weight: 600;">890 MWh</span>
+                        </div>
+                        <div style="background: #E5E7EB; height: 12px; border-radius: 4px; margin-top: 0.25rem;">
+                            <div style="background: linear-gradient(90deg, #F59E0B, #FBBF24); width: 36%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; font-size: 0.8rem;">
+                            <span>Glasgow Macro Cluster</span>
+                            <span style="font-weight: 600;">720 MWh</span>
+                        </div>
+                        <div style="background: #E5E7EB; height: 12px; border-radius: 4px; margin-top: 0.25rem;">
+                            <div style="background: linear-gradient(90deg, #F59E0B, #FBBF24); width: 29%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div>
+                        <div style="display: flex; justify-content: space-between; font-size: 0.8rem;">
+                            <span>Other Sites (465)</span>
+                            <span style="font-weight: 600;">40,790 MWh</span>
+                        </div>
+                        <div style="background: #E5E7EB; height: 12px; border-radius: 4px; margin-top: 0.25rem;">
+                            <div style="background: linear-gradient(90deg, #10B981, #34D399); width: 85%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col_carbon:
+            st.markdown('<div class="section-header">Carbon Intensity by Region</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 0.75rem; margin-bottom: 1rem;">
+                        <div style="background: #FEE2E2; border-radius: 8px; padding: 0.75rem; text-align: center;">
+                            <div style="font-size: 0.7rem; color: #DC2626;">Midlands</div>
+                            <div style="font-size: 1.5rem; font-weight: 700; color: #DC2626;">284</div>
+                            <div style="font-size: 0.65rem; color: #6B7280;">gCO₂/kWh</div>
+                        </div>
+                        <div style="background: #FEF3C7; border-radius: 8px; padding: 0.75rem; text-align: center;">
+                            <div style="font-size: 0.7rem; color: #92400E;">North</div>
+                            <div style="font-size: 1.5rem; font-weight: 700; color: #F59E0B;">248</div>
+                            <div style="font-size: 0.65rem; color: #6B7280;">gCO₂/kWh</div>
+                        </div>
+                        <div style="background: #D1FAE5; border-radius: 8px; padding: 0.75rem; text-align: center;">
+                            <div style="font-size: 0.7rem; color: #065F46;">Scotland</div>
+                            <div style="font-size: 1.5rem; font-weight: 700; color: #10B981;">156</div>
+                            <div style="font-size: 0.65rem; color: #6B7280;">gCO₂/kWh</div>
+                        </div>
+                        <div style="background: #E0F2FE; border-radius: 8px; padding: 0.75rem; text-align: center;">
+                            <div style="font-size: 0.7rem; color: #0369A1;">South</div>
+                            <div style="font-size: 1.5rem; font-weight: 700; color: #0369A1;">198</div>
+                            <div style="font-size: 0.65rem; color: #6B7280;">gCO₂/kWh</div>
+                        </div>
+                    </div>
+                    <div style="display: flex; justify-content: space-around; font-size: 0.75rem; padding: 0.5rem; background: #F9FAFB; border-radius: 6px;">
+                        <div style="text-align: center;">
+                            <div style="color: #6B7280;">UK Average</div>
+                            <div style="font-weight: 700; color: #1B2A4E;">212 g/kWh</div>
+                        </div>
+                        <div style="text-align: center;">
+                            <div style="color: #6B7280;">Our Average</div>
+                            <div style="font-weight: 700; color: #10B981;">221 g/kWh</div>
+                        </div>
+                        <div style="text-align: center;">
+                            <div style="color: #6B7280;">Target</div>
+                            <div style="font-weight: 700; color: #29B5E8;">180 g/kWh</div>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">ESG Scorecard</div>', unsafe_allow_html=True)
+        
+        with st.container(border=True):
+            st.markdown("""
+            <table style="width: 100%; border-collapse: collapse; font-size: 0.8rem;">
+                <thead>
+                    <tr style="border-bottom: 2px solid #E5E7EB; background: #F9FAFB;">
+                        <th style="text-align: left; padding: 0.6rem; color: #6B7280;">ESG Metric</th>
+                        <th style="text-align: center; padding: 0.6rem; color: #6B7280;">Category</th>
+                        <th style="text-align: right; padding: 0.6rem; color: #6B7280;">2023</th>
+                        <th style="text-align: right; padding: 0.6rem; color: #6B7280;">2024 YTD</th>
+                        <th style="text-align: right; padding: 0.6rem; color: #6B7280;">Target</th>
+                        <th style="text-align: right; padding: 0.6rem; color: #6B7280;">Status</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    <tr style="border-bottom: 1px solid #F3F4F6;">
+                        <td style="padding: 0.6rem; font-weight: 600;">Carbon Emissions (Scope 1+2)</td>
+                        <td style="text-align: center; padding: 0.6rem;"><span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px; font-size: 0.7rem;">Environmental</span></td>
+                        <td style="text-align: right; padding: 0.6rem;">14.6K tCO₂e</td>
+                        <td style="text-align: right; padding: 0.6rem;">12.4K tCO₂e</td>
+                        <td style="text-align: right; padding: 0.6rem;">13.0K</td>
+                        <td style="text-align: right; padding: 0.6rem;"><span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 8px; font-weight: 600;">✓ Ahead</span></td>
+                    </tr>
+                    <tr style="border-bottom: 1px solid #F3F4F6;">
+                        <td style="padding: 0.6rem; font-weight: 600;">Renewable Energy %</td>
+                        <td style="text-align: center; padding: 0.6rem;"><span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px; font-size: 0.7rem;">Environmental</span></td>
+                        <td style="text-align: right; padding: 0.6rem;">53%</td>
+                        <td style="text-align: right; padding: 0.6rem;">65%</td>
+                        <td style="text-align: right; padding: 0.6rem;">70%</td>
+                        <td style="text-align: right; padding: 0.6rem;"><span style="background: #FEF3C7; color: #92400E; padding: 0.2rem 0.5rem; border-radius: 8px; font-weight: 600;">→ On Track</span></td>
+                    </tr>
+                    <tr style="border-bottom: 1px solid #F3F4F6;">
+                        <td style="padding: 0.6rem; font-weight: 600;">E-Waste Recycling Rate</td>
+                        <td style="text-align: center; padding: 0.6rem;"><span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px; font-size: 0.7rem;">Environmental</span></td>
+                        <td style="text-align: right; padding: 0.6rem;">88%</td>
+                        <td style="text-align: right; padding: 0.6rem;">94%</td>
+                        <td style="text-align: right; padding: 0.6rem;">90%</td>
+                        <td style="text-align: right; padding: 0.6rem;"><span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 8px; font-weight: 600;">✓ Ahead</span></td>
+                    </tr>
+                    <tr style="border-bottom: 1px solid #F3F4F6;">
+                        <td style="padding: 0.6rem; font-weight: 600;">Gender Diversity (Leadership)</td>
+                        <td style="text-align: center; padding: 0.6rem;"><span style="background: #EDE9FE; color: #5B21B6; padding: 0.2rem 0.5rem; border-radius: 12px; font-size: 0.7rem;">Social</span></td>
+                        <td style="text-align: right; padding: 0.6rem;">38%</td>
+                        <td style="text-align: right; padding: 0.6rem;">42%</td>
+                        <td style="text-align: right; padding: 0.6rem;">45%</td>
+                        <td style="text-align: right; padding: 0.6rem;"><span style="background: #FEF3C7; color: #92400E; padding: 0.2rem 0.5rem; border-radius: 8px; font-weight: 600;">→ On Track</span></td>
+                    </tr>
+                    <tr style="border-bottom: 1px solid #F3F4F6;">
+                        <td style="padding: 0.6rem; font-weight: 600;">Employee Safety (LTIR)</td>
+                        <td style="text-align: center; padding: 0.6rem;"><span style="background: #EDE9FE; color: #5B21B6; padding: 0.2rem 0.5rem; border-radius: 12px; font-size: 0.7rem;">Social</span></td>
+                        <td style="text-align: right; padding: 0.6rem;">0.42</td>
+                        <td style="text-align: right; padding: 0.6rem;">0.38</td>
+                        <td style="text-align: right; padding: 0.6rem;"><0.40</td>
+                        <td style="text-align: right; padding: 0.6rem;"><span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 8px; font-weight: 600;">✓ Ahead</span></td>
+                    </tr>
+                    <tr>
+                        <td style="padding: 0.6rem; font-weight: 600;">Supplier ESG Compliance</td>
+                        <td style="text-align: center; padding: 0.6rem;"><span style="background: #E0F2FE; color: #0369A1; padding: 0.2rem 0.5rem; border-radius: 12px; font-size: 0.7rem;">Governance</span></td>
+                        <td style="text-align: right; padding: 0.6rem;">72%</td>
+                        <td style="text-align: right; padding: 0.6rem;">84%</td>
+                        <td style="text-align: right; padding: 0.6rem;">80%</td>
+                        <td style="text-align: right; padding: 0.6rem;"><span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 8px; font-weight: 600;">✓ Ahead</span></td>
+                    </tr>
+                </tbody>
+            </table>
+            <div style="margin-top: 0.75rem; padding: 0.5rem; background: linear-gradient(135deg, #D1FAE5 0%, #ECFDF5 100%); border-radius: 6px; font-size: 0.8rem; text-align: center;">
+                <span style="color: #065F46;">🌍 <strong>Overall ESG Score: 78/100</strong> — Top quartile in UK Telecoms · MSCI Rating: A</span>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        col_exp1, col_exp2, col_exp3, col_exp4 = st.columns(4)
+        
+        with col_exp1:
+            st.markdown('<div class="section-header">Green Customers</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="text-align: center;">
+                    <div style="font-size: 2rem; font-weight: 700; color: #10B981;">8,420</div>
+                    <div style="font-size: 0.75rem; color: #6B7280;">Green Tariff Subs</div>
+                    <div style="margin-top: 0.5rem; font-size: 0.75rem;">
+                        <div style="display: flex; justify-content: space-between;">
+                            <span>% of Base</span>
+                            <span style="color: #10B981;">28%</span>
+                        </div>
+                        <div style="display: flex; justify-content: space-between;">
+                            <span>YoY Growth</span>
+                            <span style="color: #10B981;">+42%</span>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col_exp2:
+            st.markdown('<div class="section-header">Water Usage</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="text-align: center;">
+                    <div style="font-size: 2rem; font-weight: 700; color: #3B82F6;">12.4K</div>
+                    <div style="font-size: 0.75rem; color: #6B7280;">m³ Consumed</div>
+                    <div style="margin-top: 0.5rem; font-size: 0.75rem;">
+                        <div style="display: flex; justify-content: space-between;">
+                            <span>vs 2023</span>
+                            <span style="color: #10B981;">-8%</span>
+                        </div>
+                        <div style="display: flex; justify-content: space-between;">
+                            <span>Recycled</span>
+                            <span style="color: #10B981;">45%</span>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col_exp3:
+            st.markdown('<div class="section-header">Fleet Emissions</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="text-align: center;">
+                    <div style="font-size: 2rem; font-weight: 700; color: #F59E0B;">34%</div>
+                    <div style="font-size: 0.75rem; color: #6B7280;">EV Fleet</div>
+                    <div style="margin-top: 0.5rem; font-size: 0.75rem;">
+                        <div style="display: flex; justify-content: space-between;">
+                            <span>Vehicles</span>
+                            <span style="color: #1B2A4E;">142/420</span>
+                        </div>
+                        <div style="display: flex; justify-content: space-between;">
+                            <span>2025 Target</span>
+                            <span style="color: #29B5E8;">50%</span>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col_exp4:
+            st.markdown('<div class="section-header">Supply Chain</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="text-align: center;">
+                    <div style="font-size: 2rem; font-weight: 700; color: #8B5CF6;">84%</div>
+                    <div style="font-size: 0.75rem; color: #6B7280;">ESG Compliant</div>
+                    <div style="margin-top: 0.5rem; font-size: 0.75rem;">
+                        <div style="display: flex; justify-content: space-between;">
+                            <span>Suppliers</span>
+                            <span style="color: #1B2A4E;">168/200</span>
+                        </div>
+                        <div style="display: flex; justify-content: space-between;">
+                            <span>Audited</span>
+                            <span style="color: #10B981;">92%</span>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+
+    with tab_ops:
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['ENERGY', 'CARBON', 'ESG']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="cso-ops-pulse">
+            <div class="cso-ops-title">🌿 Operations & Impact Pulse</div>
+            <div class="cso-ops-sub">Energy, emissions, and ESG compliance signals across the footprint.</div>
+            <div class="cso-ops-grid">
+                <div class="cso-ops-card">
+                    <div class="cso-ops-label">Renewables</div>
+                    <div class="cso-ops-value">65%</div>
+                    <div class="cso-ops-delta">↑ +12% YoY</div>
+                </div>
+                <div class="cso-ops-card">
+                    <div class="cso-ops-label">Emissions</div>
+                    <div class="cso-ops-value">12.4K tCO₂e</div>
+                    <div class="cso-ops-delta">↓ -15% YoY</div>
+                </div>
+                <div class="cso-ops-card">
+                    <div class="cso-ops-label">PUE</div>
+                    <div class="cso-ops-value">1.42</div>
+                    <div class="cso-ops-delta">Target 1.30</div>
+                </div>
+                <div class="cso-ops-card">
+                    <div class="cso-ops-label">Supplier ESG</div>
+                    <div class="cso-ops-value">84%</div>
+                    <div class="cso-ops-delta">Tier 2 focus</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown('<div class="section-header">Energy & Emissions Operations</div>', unsafe_allow_html=True)
+        ops_left, ops_right = st.columns(2)
+        
+        with ops_left:
+            st.markdown("**Energy Consumption by Site Type**")
+            with st.container(border=True):
+                energy_df = pd.DataFrame({
+                    'Site Type': ['Macro Sites', 'Small Cells', 'Data Centers', 'Offices'],
+                    'MWh': [18400, 6200, 9800, 2100]
+                })
+                energy_chart = alt.Chart(energy_df).mark_bar(color='#10B981', cornerRadiusEnd=6).encode(
+                    x=alt.X('MWh:Q', title='MWh (Monthly)'),
+                    y=alt.Y('Site Type:N', sort='-x', title=None),
+                    tooltip=['Site Type:N', 'MWh:Q']
+                ).properties(height=220)
+                charts.altair_chart(energy_chart, use_container_width=True)
+                st.caption("Macro sites account for 52% of total energy load.")
+        
+        with ops_right:
+            st.markdown("**Emissions Trend (12 Months)**")
+            with st.container(border=True):
+                emissions_df = pd.DataFrame({
+                    'Month': ['Jan','Feb','Mar','Apr','May','Jun','Jul','Aug','Sep','Oct','Nov','Dec'],
+                    'tCO2e': [1200, 1180, 1165, 1152, 1128, 1105, 1092, 1080, 1068, 1050, 1036, 1022]
+                })
+                emissions_line = alt.Chart(emissions_df).mark_line(color='#059669', strokeWidth=2).encode(
+                    x=alt.X('Month:N', title=None),
+                    y=alt.Y('tCO2e:Q', title='tCO₂e')
+                )
+                emissions_area = alt.Chart(emissions_df).mark_area(color='rgba(16,185,129,0.2)').encode(
+                    x='Month:N',
+                    y='tCO2e:Q'
+                )
+                charts.altair_chart((emissions_area + emissions_line).properties(height=220), use_container_width=True)
+                st.caption("Emissions down 15% YoY with renewable ramp-up.")
+        
+        st.markdown('<div class="section-header">Renewables & Water Stewardship</div>', unsafe_allow_html=True)
+        mix_left, mix_right = st.columns(2)
+        
+        with mix_left:
+            st.markdown("**Renewable Mix**")
+            with st.container(border=True):
+                mix_df = pd.DataFrame({
+                    'Source': ['Solar', 'Wind', 'Hydro', 'Grid'],
+                    'Share': [28, 22, 15, 35]
+                })
+                donut = alt.Chart(mix_df).mark_arc(innerRadius=50, outerRadius=90).encode(
+                    theta=alt.Theta('Share:Q'),
+                    color=alt.Color('Source:N', scale=alt.Scale(range=['#10B981', '#22C55E', '#34D399', '#9CA3AF']), legend=None),
+                    tooltip=['Source:N', 'Share:Q']
+                ).properties(height=220)
+                charts.altair_chart(donut, use_container_width=True)
+                st.caption("Renewables now represent 65% of total energy.")
+        
+        with mix_right:
+            st.markdown("**Water Usage by Region**")
+            with st.container(border=True):
+                water_df = pd.DataFrame({
+                    'Region': ['London', 'Midlands', 'North', 'Scotland', 'Wales'],
+                    'MLiters': [5.2, 3.8, 3.1, 2.6, 2.2]
+                })
+                water_chart = alt.Chart(water_df).mark_bar(color='#0EA5E9', cornerRadiusEnd=6).encode(
+                    x=alt.X('MLiters:Q', title='ML (Quarterly)'),
+                    y=alt.Y('Region:N', sort='-x', title=None),
+                    tooltip=['Region:N', 'MLiters:Q']
+                ).properties(height=220)
+                charts.altair_chart(water_chart, use_container_width=True)
+                st.caption("Water intensity improves as cooling upgrades roll out.")
+        
+        st.markdown('<div class="section-header">Compliance & Supplier ESG</div>', unsafe_allow_html=True)
+        comp_left, comp_right = st.columns(2)
+        
+        with comp_left:
+            st.markdown("**Regulatory Reporting Readiness**")
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="display: flex; justify-content: space-between; margin-bottom: 0.25rem;"><span>Scope 1+2 reporting</span><span style="font-weight: 600;">96%</span></div>
+                    <div style="background: #E5E7EB; border-radius: 6px; height: 10px; margin-bottom: 0.6rem;">
+                        <div style="background: #10B981; width: 96%; height: 100%; border-radius: 6px;"></div>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; margin-bottom: 0.25rem;"><span>Scope 3 coverage</span><span style="font-weight: 600;">82%</span></div>
+                    <div style="background: #E5E7EB; border-radius: 6px; height: 10px; margin-bottom: 0.6rem;">
+                        <div style="background: #F59E0B; width: 82%; height: 100%; border-radius: 6px;"></div>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; margin-bottom: 0.25rem;"><span>EU CSRD alignment</span><span style="font-weight: 600;">88%</span></div>
+                    <div style="background: #E5E7EB; border-radius: 6px; height: 10px;">
+                        <div style="background: #3B82F6; width: 88%; height: 100%; border-radius: 6px;"></div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with comp_right:
+            st.markdown("**Supplier ESG Compliance**")
+            with st.container(border=True):
+                supplier_df = pd.DataFrame({
+                    'Tier': ['Tier 1', 'Tier 2', 'Tier 3'],
+                    'Compliance': [92, 84, 76]
+                }).set_index('Tier')
+                st.bar_chart(supplier_df, height=220, color="#8B5CF6")
+                st.caption("Tier 2 remediation plan scheduled for Q2.")
+
+    with tab_strategy:
+        st.markdown("""
+        <div class="cso-ai-pulse">
+            <div class="cso-ai-header">
+                <div class="cso-ai-title">❄️ Snowflake Intelligence Pulse</div>
+                <div class="cso-ai-tag">AI LIVE</div>
+            </div>
+            <div class="cso-ai-grid">
+                <div class="cso-ai-card">
+                    <div class="cso-ai-label">Renewables</div>
+                    <div class="cso-ai-value">65%</div>
+                    <div class="cso-ai-sub">Target 70%</div>
+                </div>
+                <div class="cso-ai-card">
+                    <div class="cso-ai-label">Carbon Reduction</div>
+                    <div class="cso-ai-value">-42%</div>
+                    <div class="cso-ai-sub">vs 2019 baseline</div>
+                </div>
+                <div class="cso-ai-card">
+                    <div class="cso-ai-label">PUE Average</div>
+                    <div class="cso-ai-value">1.42</div>
+                    <div class="cso-ai-sub">Target 1.30</div>
+                </div>
+                <div class="cso-ai-card">
+                    <div class="cso-ai-label">Supplier ESG</div>
+                    <div class="cso-ai-value">84%</div>
+                    <div class="cso-ai-sub">Tier 2 focus</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">AI Executive Summary</div>', unsafe_allow_html=True)
+        if st.session_state.get('sf_highlights', True):
+            st.info("❄️ **Powered by Snowflake Cortex AI** — Summary synthesized from energy, emissions, and ESG compliance data.")
+        
+        with st.container(border=True):
+            st.markdown("""
+            **Executive Summary (Q1 2026):**
+            - Renewable energy reached **65%**, on track to hit 70% target.
+            - Emissions are **down 15% YoY** with data center efficiency gains.
+            - Supply chain compliance improved to **84%**, with Tier 2 remediation planned.
+            """)
+        
+        st.markdown('<div class="section-header">Signals & Insights</div>', unsafe_allow_html=True)
+        insight_cols = st.columns(3)
+        with insight_cols[0]:
+            st.markdown('<div class="section-header">Top Insights</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                - **Macro sites** drive 52% of energy load
+                - **Wind + solar** deliver 50% of renewables
+                - **Water intensity** down in London and North
+                """)
+        with insight_cols[1]:
+            st.markdown('<div class="section-header">Risk Signals</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                - **Network features** closest to SLA thresholds
+                - **Tier 2 suppliers** below 85% compliance
+                - **PUE** above target in Manchester DC
+                """)
+        with insight_cols[2]:
+            st.markdown('<div class="section-header">Growth Signals</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                - **Solar expansion** adds +5% renewables
+                - **Fleet EV** rollout to 50% by 2025
+                - **Energy efficiency** saves £180K/year
+                """)
+        
+        st.markdown('<div class="section-header">AI-Powered Strategic Recommendations</div>', unsafe_allow_html=True)
+        action_cols = st.columns(3)
+        with action_cols[0]:
+            with st.container(border=True):
+                st.markdown("""
+                - **Accelerate renewables** via PPAs in top 3 regions
+                - Prioritize sites with >1.5 PUE
+                """)
+        with action_cols[1]:
+            with st.container(border=True):
+                st.markdown("""
+                - **Reduce water intensity** with closed-loop cooling
+                - Target 10% reduction by Q4
+                """)
+        with action_cols[2]:
+            with st.container(border=True):
+                st.markdown("""
+                - **Improve supplier ESG** with quarterly audits
+                - Enforce Tier 2 remediation milestones
+                """)
+        
+        st.markdown('<div class="section-header">CSO Strategic Priorities — Q1 2026</div>', unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #DC2626; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 1</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Renewable Energy 70%</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **65%** renewable
+                - Gap: **5%** to target
+                - Action: Solar expansion Q2
+                - Investment: **£2.4M** approved
+                """)
+        
+        with col2:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #F59E0B; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 2</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">PUE Improvement</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **1.42** average
+                - Target: **1.30** by 2026
+                - Focus: Manchester DC cooling
+                - Savings: **£180K/year** energy
+                """)
+        
+        with col3:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #10B981; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 3</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Fleet Electrification</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **34%** EV fleet
+                - Target: **50%** by end 2025
+                - Vehicles: +70 EVs planned
+                - CO₂ reduction: **-420 tonnes**
+                """)
+        
+        st.markdown('<div class="section-header">Ask Snowflake Intelligence</div>', unsafe_allow_html=True)
+        
+        questions = [
+            "What's our total energy consumption this year?",
+            "What percentage of our energy comes from renewable sources?",
+            "Show me our carbon emissions trend.",
+            "Which sites consume the most energy?",
+            "What's our average PUE ratio?",
+            "Compare energy consumption by site type.",
+            "What's our progress toward net zero?",
+            "How many customers are on green tariffs?"
+        ]
+        
+        sf_intel_url = "https://ai.snowflake.com/sfseeurope/pjose_aws3"
+        
+        cols = st.columns(2)
+        for i, q in enumerate(questions):
+            with cols[i % 2]:
+                escaped_q = q.replace('"', '&quot;').replace("'", "&#39;")
+                st.markdown(f"""
+                <a href="{sf_intel_url}" target="_blank" onclick="navigator.clipboard.writeText('{escaped_q}')" style="text-decoration: none; color: inherit; display: block;">
+                    <div class="question-card">
+                        <p style="margin-bottom: 1.5rem;"><strong>Q{i+1}:</strong> "{q}"</p>
+                    </div>
+                </a>
+                """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div style="text-align: center; margin-top: 1rem; padding: 1rem; background: linear-gradient(135deg, #29B5E8 0%, #1A8BC4 100%); border-radius: 8px;">
+            <a href="{sf_intel_url}" target="_blank" style="color: white; text-decoration: none; font-weight: 600; font-size: 1rem;">
+                ❄️ Ask these questions in Snowflake Intelligence →
+            </a>
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,751 @@
+"""CTO Technology dashboard."""
+
+import streamlit as st
+import pandas as pd
+import altair as alt
+
+from dashboard import charts
+
+
+def render_cto_technology():
+    import pandas as pd
+    import altair as alt
+    
+    # Matrix Rain Header for CTO
+    st.markdown("""
+    <div class="cto-header-wrapper">
+        <div class="cto-matrix-bg">
+            <div class="cto-matrix-col" style="left: 5%; animation-duration: 8s;">01001011</div>
+            <div class="cto-matrix-col" style="left: 15%; animation-duration: 6s; animation-delay: -2s;">10110100</div>
+            <div class="cto-matrix-col" style="left: 25%; animation-duration: 9s; animation-delay: -4s;">01100101</div>
+            <div class="cto-matrix-col" style="left: 35%; animation-duration: 7s; animation-delay: -1s;">11010011</div>
+            <div class="cto-matrix-col" style="left: 45%; animation-duration: 10s; animation-delay: -3s;">00101110</div>
+            <div class="cto-matrix-col" style="left: 55%; animation-duration: 6s; animation-delay: -5s;">10011010</div>
+            <div class="cto-matrix-col" style="left: 65%; animation-duration: 8s; animation-delay: -2s;">01110101</div>
+            <div class="cto-matrix-col" style="left: 75%; animation-duration: 7s; animation-delay: -4s;">11001100</div>
+            <div class="cto-matrix-col" style="left: 85%; animation-duration: 9s; animation-delay: -1s;">00110011</div>
+            <div class="cto-matrix-col" style="left: 95%; animation-duration: 6s; animation-delay: -3s;">10101010</div>
+        </div>
+        <div class="cto-header-content">
+            <h1>CTO Technology Dashboard</h1>
+            <p>Network Performance, Infrastructure & Digital Transformation</p>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Dashboard Tabs
+    tab_overview, tab_platforms, tab_strategy = st.tabs(["📊 Overview & Analysis", "🧩 Platforms & Security", "❄️ Snowflake Intelligence"])
+
+    with tab_overview:
+        
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['NETWORK_OPS', 'IT_OPS', 'RAN', 'SLA']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+        
+        # CTO TECH STACK ANIMATION
+        st.markdown("""<div class="cto-stack"><div class="stack-header"><div class="stack-title">🏗️ Technology Stack Health</div><div class="stack-status"><div class="status-item"><div class="status-dot green"></div>492 Services Online</div><div class="status-item"><div class="status-dot yellow"></div>3 Degraded</div></div></div><div class="stack-layers"><div class="stack-layer"><div class="layer-label">Applications</div><div class="layer-bar apps"><span class="layer-text">32 Apps • 12 APIs</span><span class="layer-metric">99.9% Uptime</span><div class="data-particles"><div class="particle" style="left:5px;animation-delay:0s"></div><div class="particle" style="left:15px;animation-delay:0.5s"></div><div class="particle" style="left:25px;animation-delay:1s"></div></div></div></div><div class="stack-layer"><div class="layer-label">Platform</div><div class="layer-bar platform"><span class="layer-text">Snowflake • K8s • Cloud</span><span class="layer-metric">99.99% SLA</span><div class="data-particles"><div class="particle" style="left:5px;animation-delay:0.2s"></div><div class="particle" style="left:15px;animation-delay:0.7s"></div></div></div></div><div class="stack-layer"><div class="layer-label">Data Layer</div><div class="layer-bar data"><span class="layer-text">2.4PB Data • 34 Domains</span><span class="layer-metric">847 Queries/s</span><div class="data-particles"><div class="particle" style="left:5px;animation-delay:0.4s"></div><div class="particle" style="left:15px;animation-delay:0.9s"></div></div></div></div><div class="stack-layer"><div class="layer-label">Infrastructure</div><div class="layer-bar infra"><span class="layer-text">500 Sites • 3 DCs</span><span class="layer-metric">12ms Latency</span><div class="data-particles"><div class="particle" style="left:5px;animation-delay:0.6s"></div><div class="particle" style="left:15px;animation-delay:1.1s"></div></div></div></div></div></div>""", unsafe_allow_html=True)
+        
+        
+        st.markdown('<div class="section-header">Network & Infrastructure Overview</div>', unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #10B981;">
+                <div class="kpi-icon">📶</div>
+                <div class="kpi-label">Network Uptime</div>
+                <div class="kpi-value">99.97%</div>
+                <div class="kpi-delta positive">↑ SLA: 99.9%</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <path d="M0,15 L20,14 L40,16 L60,13 L80,12 L100,12" fill="none" stroke="#10B981" stroke-width="2"/>
+                    <path d="M0,15 L20,14 L40,16 L60,13 L80,12 L100,12 L100,40 L0,40 Z" fill="#10B981"/>
+                </svg>
+            </div>
+            <div class="kpi-card" style="--accent: #29B5E8;">
+                <div class="kpi-icon">🏗️</div>
+                <div class="kpi-label">5G Coverage</div>
+                <div class="kpi-value">78%</div>
+                <div class="kpi-delta positive">↑ +12% YoY</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <rect x="5" y="32" width="12" height="8" fill="#29B5E8"/>
+                    <rect x="22" y="28" width="12" height="12" fill="#29B5E8"/>
+                    <rect x="39" y="22" width="12" height="18" fill="#29B5E8"/>
+                    <rect x="56" y="18" width="12" height="22" fill="#29B5E8"/>
+                    <rect x="73" y="12" width="12" height="28" fill="#29B5E8"/>
+                </svg>
+            </div>
+            <div class="kpi-card" style="--accent: #8B5CF6;">
+                <div class="kpi-icon">⚡</div>
+                <div class="kpi-label">Avg Latency</div>
+                <div class="kpi-value">12ms</div>
+                <div class="kpi-delta positive">↓ -3ms MoM</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <path d="M0,12 L20,14 L40,13 L60,15 L80,18 L100,20" fill="none" stroke="#8B5CF6" stroke-width="2"/>
+                    <path d="M0,12 L20,14 L40,13 L60,15 L80,18 L100,20 L100,40 L0,40 Z" fill="#8B5CF6"/>
+                </svg>
+            </div>
+            <div class="kpi-card" style="--accent: #F59E0B;">
+                <div class="kpi-icon">🚨</div>
+                <div class="kpi-label">Active Incidents</div>
+                <div class="kpi-value">3</div>
+                <div class="kpi-delta positive">↓ -5 vs avg</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <rect x="5" y="20" width="12" height="20" fill="#F59E0B"/>
+                    <rect x="22" y="24" width="12" height="16" fill="#F59E0B"/>
+                    <rect x="39" y="28" width="12" height="12" fill="#F59E0B"/>
+                    <rect x="56" y="30" width="12" height="10" fill="#F59E0B"/>
+                    <rect x="73" y="34" width="12" height="6" fill="#F59E0B"/>
+                </svg>
+            </div>
+        </div>
+        
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #EC4899;">
+                <div class="kpi-icon">📊</div>
+                <div class="kpi-label">Throughput (Peak)</div>
+                <div class="kpi-value">142 Gbps</div>
+                <div class="kpi-delta positive">↑ +18% capacity</div>
+            </div>
+            <div class="kpi-card" style="--accent: #14B8A6;">
+                <div class="kpi-icon">🖥️</div>
+                <div class="kpi-label">Cloud Migration</div>
+                <div class="kpi-value">72%</div>
+                <div class="kpi-delta neutral">Target: 85% by Q4</div>
+            </div>
+            <div class="kpi-card" style="--accent: #6366F1;">
+                <div class="kpi-icon">🔒</div>
+                <div class="kpi-label">Security Score</div>
+                <div class="kpi-value">94/100</div>
+                <div class="kpi-delta positive">↑ +6 pts YoY</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EF4444;">
+                <div class="kpi-icon">💾</div>
+                <div class="kpi-label">Tech Debt Ratio</div>
+                <div class="kpi-value">18%</div>
+                <div class="kpi-delta positive">↓ -4% YoY</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        if st.session_state.get('sf_highlights', True):
+            st.info("❄️ **Powered by Snowflake** — Infrastructure monitoring with Snowpipe Streaming for real-time telemetry and Cortex Anomaly Detection for predictive maintenance")
+        
+        # Animated Circular Progress Section
+        st.markdown("""
+        <div class="cto-progress-grid">
+            <div class="cto-progress-item">
+                <div class="cto-progress-ring">
+                    <svg viewBox="0 0 100 100">
+                        <circle class="bg" cx="50" cy="50" r="45"/>
+                        <circle class="progress blue" cx="50" cy="50" r="45"/>
+                    </svg>
+                </div>
+                <div class="cto-progress-value">78%</div>
+                <div class="cto-progress-label">5G Coverage</div>
+                <div class="cto-progress-target">Target: 85%</div>
+            </div>
+            <div class="cto-progress-item">
+                <div class="cto-progress-ring">
+                    <svg viewBox="0 0 100 100">
+                        <circle class="bg" cx="50" cy="50" r="45"/>
+                        <circle class="progress green" cx="50" cy="50" r="45"/>
+                    </svg>
+                </div>
+                <div class="cto-progress-value">99.97%</div>
+                <div class="cto-progress-label">Network Uptime</div>
+                <div class="cto-progress-target">SLA: 99.9%</div>
+            </div>
+            <div class="cto-progress-item">
+                <div class="cto-progress-ring">
+                    <svg viewBox="0 0 100 100">
+                        <circle class="bg" cx="50" cy="50" r="45"/>
+                        <circle class="progress purple" cx="50" cy="50" r="45"/>
+                    </svg>
+                </div>
+                <div class="cto-progress-value">94%</div>
+                <div class="cto-progress-label">Security Score</div>
+                <div class="cto-progress-target">Target: 95%</div>
+            </div>
+            <div class="cto-progress-item">
+                <div class="cto-progress-ring">
+                    <svg viewBox="0 0 100 100">
+                        <circle class="bg" cx="50" cy="50" r="45"/>
+                        <circle class="progress orange" cx="50" cy="50" r="45"/>
+                    </svg>
+                </div>
+                <div class="cto-progress-value">72%</div>
+                <div class="cto-progress-label">Cloud Migration</div>
+                <div class="cto-progress-target">Target: 85%</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Network Performance by Region</div>', unsafe_allow_html=True)
+        
+        with st.container(border=True):
+            region_data = pd.DataFrame({
+                'Region': ['London', 'South East', 'Midlands', 'North West', 'Scotland', 'Wales', 'North East', 'South West'],
+                'Uptime': [99.98, 99.97, 99.96, 99.95, 99.94, 99.93, 99.92, 99.91],
+                'Latency': [8, 10, 12, 14, 16, 15, 18, 13],
+                'Cells': [1250, 890, 720, 680, 420, 280, 350, 410],
+                '5G_Coverage': [92, 85, 78, 72, 65, 58, 62, 68]
+            })
+            
+            bars = alt.Chart(region_data).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                x=alt.X('5G_Coverage:Q', title='5G Coverage (%)', scale=alt.Scale(domain=[0, 100])),
+                y=alt.Y('Region:N', sort=alt.EncodingSortField(field='5G_Coverage', order='descending'), title=None),
+                color=alt.Color('5G_Coverage:Q',
+                    scale=alt.Scale(scheme='blues', domain=[50, 100]),
+                    legend=None
+                ),
+                tooltip=[
+                    alt.Tooltip('Region:N'),
+                    alt.Tooltip('Uptime:Q', title='Uptime (%)', format='.2f'),
+                    alt.Tooltip('Latency:Q', title='Latency (ms)'),
+                    alt.Tooltip('Cells:Q', title='Cell Sites', format=','),
+                    alt.Tooltip('5G_Coverage:Q', title='5G Coverage (%)')
+                ]
+            ).properties(height=280)
+            
+            text = alt.Chart(region_data).mark_text(align='left', dx=5, fontSize=10, fontWeight='bold').encode(
+                x='5G_Coverage:Q',
+                y=alt.Y('Region:N', sort=alt.EncodingSortField(field='5G_Coverage', order='descending')),
+                text=alt.Text('5G_Coverage:Q', format='.0f'),
+                color=alt.value('#1B2A4E')
+            )
+            
+            charts.altair_chart(bars + text, use_container_width=True)
+            
+            reg_cols = st.columns(4)
+            with reg_cols[0]:
+                st.markdown("""
+                <div style="text-align: center; padding: 0.5rem;">
+                    <div style="font-size: 0.7rem; color: #6B7280;">Total Cells</div>
+                    <div style="font-size: 1.1rem; font-weight: 700; color: #1B2A4E;">5,000</div>
+                </div>
+                """, unsafe_allow_html=True)
+            with reg_cols[1]:
+                st.markdown("""
+                <div style="text-align: center; padding: 0.5rem;">
+                    <div style="font-size: 0.7rem; color: #6B7280;">5G Cells</div>
+                    <div style="font-size: 1.1rem; font-weight: 700; color: #29B5E8;">3,900</div>
+                </div>
+                """, unsafe_allow_html=True)
+            with reg_cols[2]:
+                st.markdown("""
+                <div style="text-align: center; padding: 0.5rem;">
+                    <div style="font-size: 0.7rem; color: #6B7280;">Avg Uptime</div>
+                    <div style="font-size: 1.1rem; font-weight: 700; color: #10B981;">99.95%</div>
+                </div>
+                """, unsafe_allow_html=True)
+            with reg_cols[3]:
+                st.markdown("""
+                <div style="text-align: center; padding: 0.5rem;">
+                    <div style="font-size: 0.7rem; color: #6B7280;">Avg Latency</div>
+                    <div style="font-size: 1.1rem; font-weight: 700; color: #8B5CF6;">12ms</div>
+                </div>
+                """, unsafe_allow_html=True)
+    
+    with tab_platforms:
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['IT_OPS', 'SECURITY', 'CLOUD', 'DIGITAL_TRANSFORMATION']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Incident Status</div>', unsafe_allow_html=True)
+        
+        with st.container(border=True):
+            incident_data = pd.DataFrame({
+                'Severity': ['P1 Critical', 'P2 High', 'P3 Medium', 'P4 Low'],
+                'Open': [0, 1, 2, 8],
+                'MTTR': [15, 45, 120, 480],
+                'Target_MTTR': [30, 60, 180, 720]
+            })
+            
+            st.markdown("""
+            <div style="font-size: 0.85rem;">
+                <div style="display: flex; justify-content: space-between; align-items: center; padding: 0.6rem; background: #D1FAE5; border-radius: 8px; margin-bottom: 0.5rem;">
+                    <span style="font-weight: 600;"><span style="color: #DC2626;">●</span> P1 Critical</span>
+                    <span style="background: #10B981; color: white; padding: 0.2rem 0.6rem; border-radius: 20px; font-size: 0.75rem;">0 Open</span>
+                </div>
+                <div style="display: flex; justify-content: space-between; align-items: center; padding: 0.6rem; background: #FEF3C7; border-radius: 8px; margin-bottom: 0.5rem;">
+                    <span style="font-weight: 600;"><span style="color: #F97316;">●</span> P2 High</span>
+                    <span style="background: #F59E0B; color: white; padding: 0.2rem 0.6rem; border-radius: 20px; font-size: 0.75rem;">1 Open</span>
+                </div>
+                <div style="display: flex; justify-content: space-between; align-items: center; padding: 0.6rem; background: #E0F2FE; border-radius: 8px; margin-bottom: 0.5rem;">
+                    <span style="font-weight: 600;"><span style="color: #29B5E8;">●</span> P3 Medium</span>
+                    <span style="background: #29B5E8; color: white; padding: 0.2rem 0.6rem; border-radius: 20px; font-size: 0.75rem;">2 Open</span>
+                </div>
+                <div style="display: flex; justify-content: space-between; align-items: center; padding: 0.6rem; background: #F3F4F6; border-radius: 8px;">
+                    <span style="font-weight: 600;"><span style="color: #6B7280;">●</span> P4 Low</span>
+                    <span style="background: #6B7280; color: white; padding: 0.2rem 0.6rem; border-radius: 20px; font-size: 0.75rem;">8 Open</span>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            st.markdown("""
+            <div style="margin-top: 1rem; background: linear-gradient(135deg, #1B2A4E 0%, #2D3F6B 100%); border-radius: 8px; padding: 0.75rem; color: white;">
+                <div style="font-size: 0.75rem; opacity: 0.8; margin-bottom: 0.25rem;">Mean Time to Resolution</div>
+                <div style="display: flex; justify-content: space-between;">
+                    <div style="text-align: center;">
+                        <div style="font-size: 1.1rem; font-weight: 700; color: #10B981;">15m</div>
+                        <div style="font-size: 0.65rem;">P1 (Target: 30m)</div>
+                    </div>
+                    <div style="text-align: center;">
+                        <div style="font-size: 1.1rem; font-weight: 700; color: #10B981;">45m</div>
+                        <div style="font-size: 0.65rem;">P2 (Target: 60m)</div>
+                    </div>
+                    <div style="text-align: center;">
+                        <div style="font-size: 1.1rem; font-weight: 700; color: #10B981;">2h</div>
+                        <div style="font-size: 0.65rem;">P3 (Target: 3h)</div>
+                    </div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">System Health</div>', unsafe_allow_html=True)
+        
+        with st.container(border=True):
+            st.markdown("""
+            <div style="font-size: 0.85rem;">
+                <div style="display: flex; align-items: center; padding: 0.5rem 0; border-bottom: 1px solid #F3F4F6;">
+                    <span style="width: 100px;">Core Network</span>
+                    <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 12px; margin: 0 1rem;">
+                        <div style="background: #10B981; width: 98%; height: 100%; border-radius: 4px;"></div>
+                    </div>
+                    <span style="font-weight: 700; color: #10B981; width: 40px;">98%</span>
+                </div>
+                <div style="display: flex; align-items: center; padding: 0.5rem 0; border-bottom: 1px solid #F3F4F6;">
+                    <span style="width: 100px;">RAN</span>
+                    <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 12px; margin: 0 1rem;">
+                        <div style="background: #10B981; width: 96%; height: 100%; border-radius: 4px;"></div>
+                    </div>
+                    <span style="font-weight: 700; color: #10B981; width: 40px;">96%</span>
+                </div>
+                <div style="display: flex; align-items: center; padding: 0.5rem 0; border-bottom: 1px solid #F3F4F6;">
+                    <span style="width: 100px;">BSS/OSS</span>
+                    <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 12px; margin: 0 1rem;">
+                        <div style="background: #F59E0B; width: 94%; height: 100%; border-radius: 4px;"></div>
+                    </div>
+                    <span style="font-weight: 700; color: #F59E0B; width: 40px;">94%</span>
+                </div>
+                <div style="display: flex; align-items: center; padding: 0.5rem 0; border-bottom: 1px solid #F3F4F6;">
+                    <span style="width: 100px;">Security</span>
+                    <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 12px; margin: 0 1rem;">
+                        <div style="background: #F59E0B; width: 94%; height: 100%; border-radius: 4px;"></div>
+                    </div>
+                    <span style="font-weight: 700; color: #F59E0B; width: 40px;">94%</span>
+                </div>
+                <div style="display: flex; align-items: center; padding: 0.5rem 0;">
+                    <span style="width: 100px;">Cloud Infra</span>
+                    <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 12px; margin: 0 1rem;">
+                        <div style="background: #F59E0B; width: 92%; height: 100%; border-radius: 4px;"></div>
+                    </div>
+                    <span style="font-weight: 700; color: #F59E0B; width: 40px;">92%</span>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Infrastructure Capacity & Utilization</div>', unsafe_allow_html=True)
+        
+        with st.container(border=True):
+            col_cap1, col_cap2 = st.columns(2)
+            
+            with col_cap1:
+                st.markdown("""
+                <div style="font-size: 0.8rem;">
+                    <div style="display: flex; justify-content: space-between; margin-bottom: 0.5rem; padding-bottom: 0.25rem; border-bottom: 1px dashed #DC2626;">
+                        <span style="color: #DC2626; font-weight: 600;">Threshold: 80%</span>
+                    </div>
+                    <table style="width: 100%; border-collapse: collapse;">
+                        <thead>
+                            <tr style="color: #6B7280; font-size: 0.7rem;">
+                                <th style="text-align: left; padding: 0.25rem;">Resource</th>
+                                <th style="text-align: center; padding: 0.25rem;">Aug</th>
+                                <th style="text-align: center; padding: 0.25rem;">Sep</th>
+                                <th style="text-align: center; padding: 0.25rem;">Oct</th>
+                                <th style="text-align: center; padding: 0.25rem;">Nov</th>
+                                <th style="text-align: center; padding: 0.25rem;">Dec</th>
+                                <th style="text-align: center; padding: 0.25rem; font-weight: 700;">Jan</th>
+                            </tr>
+                        </thead>
+                        <tbody>
+                            <tr>
+                                <td style="padding: 0.4rem 0.25rem;"><span style="display: inline-block; width: 10px; height: 10px; background: #8B5CF6; border-radius: 2px; margin-right: 0.5rem;"></span>Compute</td>
+                                <td style="text-align: center; padding: 0.4rem;">62%</td>
+                                <td style="text-align: center; padding: 0.4rem;">65%</td>
+                                <td style="text-align: center; padding: 0.4rem;">68%</td>
+                                <td style="text-align: center; padding: 0.4rem;">71%</td>
+                                <td style="text-align: center; padding: 0.4rem;">74%</td>
+                                <td style="text-align: center; padding: 0.4rem; font-weight: 700; color: #8B5CF6;">76%</td>
+                            </tr>
+                            <tr style="background: #F9FAFB;">
+                                <td style="padding: 0.4rem 0.25rem;"><span style="display: inline-block; width: 10px; height: 10px; background: #29B5E8; border-radius: 2px; margin-right: 0.5rem;"></span>Storage</td>
+                                <td style="text-align: center; padding: 0.4rem;">58%</td>
+                                <td style="text-align: center; padding: 0.4rem;">61%</td>
+                                <td style="text-align: center; padding: 0.4rem;">63%</td>
+                                <td style="text-align: center; padding: 0.4rem;">66%</td>
+                                <td style="text-align: center; padding: 0.4rem;">69%</td>
+                                <td style="text-align: center; padding: 0.4rem; font-weight: 700; color: #29B5E8;">72%</td>
+                            </tr>
+                            <tr>
+                                <td style="padding: 0.4rem 0.25rem;"><span style="display: inline-block; width: 10px; height: 10px; background: #10B981; border-radius: 2px; margin-right: 0.5rem;"></span>Network</td>
+                                <td style="text-align: center; padding: 0.4rem;">45%</td>
+                                <td style="text-align: center; padding: 0.4rem;">48%</td>
+                                <td style="text-align: center; padding: 0.4rem;">52%</td>
+                                <td style="text-align: center; padding: 0.4rem;">55%</td>
+                                <td style="text-align: center; padding: 0.4rem;">58%</td>
+                                <td style="text-align: center; padding: 0.4rem; font-weight: 700; color: #10B981;">62%</td>
+                            </tr>
+                        </tbody>
+                    </table>
+                    <div style="margin-top: 0.75rem; padding: 0.5rem; background: #FEF3C7; border-radius: 6px; text-align: center;">
+                        <span style="color: #92400E; font-size: 0.75rem;">📈 All resources trending up — Compute approaching threshold</span>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col_cap2:
+                st.markdown("""
+                <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 0.75rem;">
+                    <div style="background: linear-gradient(135deg, #EDE9FE 0%, #F5F3FF 100%); border-radius: 12px; padding: 1rem; text-align: center;">
+                        <div style="font-size: 0.75rem; color: #5B21B6;">Compute (vCPUs)</div>
+                        <div style="font-size: 1.5rem; font-weight: 700; color: #5B21B6;">76%</div>
+                        <div style="font-size: 0.7rem; color: #6B7280;">12,400 / 16,384</div>
+                    </div>
+                    <div style="background: linear-gradient(135deg, #E0F2FE 0%, #F0F9FF 100%); border-radius: 12px; padding: 1rem; text-align: center;">
+                        <div style="font-size: 0.75rem; color: #0369A1;">Storage (PB)</div>
+                        <div style="font-size: 1.5rem; font-weight: 700; color: #0369A1;">72%</div>
+                        <div style="font-size: 0.7rem; color: #6B7280;">14.4 / 20 PB</div>
+                    </div>
+                    <div style="background: linear-gradient(135deg, #D1FAE5 0%, #ECFDF5 100%); border-radius: 12px; padding: 1rem; text-align: center;">
+                        <div style="font-size: 0.75rem; color: #065F46;">Network (Gbps)</div>
+                        <div style="font-size: 1.5rem; font-weight: 700; color: #065F46;">62%</div>
+                        <div style="font-size: 0.7rem; color: #6B7280;">142 / 230 Gbps</div>
+                    </div>
+                    <div style="background: linear-gradient(135deg, #FEF3C7 0%, #FDE68A 100%); border-radius: 12px; padding: 1rem; text-align: center;">
+                        <div style="font-size: 0.75rem; color: #92400E;">Expansion Due</div>
+                        <div style="font-size: 1.5rem; font-weight: 700; color: #92400E;">Q3</div>
+                        <div style="font-size: 0.7rem; color: #6B7280;">+30% capacity</div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        col_projects, col_security = st.columns(2)
+        
+        with col_projects:
+            st.markdown('<div class="section-header">Digital Transformation Projects</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="padding: 0.6rem; border-left: 4px solid #10B981; background: #D1FAE5; border-radius: 0 8px 8px 0; margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <div>
+                                <div style="font-weight: 600; color: #065F46;">5G Core Modernization</div>
+                                <div style="font-size: 0.75rem; color: #6B7280;">Phase 2 of 3 · Due Q2</div>
+                            </div>
+                            <span style="font-weight: 700; color: #10B981;">78%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 6px; margin-top: 0.5rem;">
+                            <div style="background: #10B981; width: 78%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="padding: 0.6rem; border-left: 4px solid #29B5E8; background: #E0F2FE; border-radius: 0 8px 8px 0; margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <div>
+                                <div style="font-weight: 600; color: #0369A1;">Cloud Migration</div>
+                                <div style="font-size: 0.75rem; color: #6B7280;">Target 85% · Due Q4</div>
+                            </div>
+                            <span style="font-weight: 700; color: #29B5E8;">72%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 6px; margin-top: 0.5rem;">
+                            <div style="background: #29B5E8; width: 72%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="padding: 0.6rem; border-left: 4px solid #8B5CF6; background: #EDE9FE; border-radius: 0 8px 8px 0; margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <div>
+                                <div style="font-weight: 600; color: #5B21B6;">AI/ML Platform</div>
+                                <div style="font-size: 0.75rem; color: #6B7280;">POC Complete · Due Q3</div>
+                            </div>
+                            <span style="font-weight: 700; color: #8B5CF6;">45%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 6px; margin-top: 0.5rem;">
+                            <div style="background: #8B5CF6; width: 45%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="padding: 0.6rem; border-left: 4px solid #F59E0B; background: #FEF3C7; border-radius: 0 8px 8px 0;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <div>
+                                <div style="font-weight: 600; color: #92400E;">Legacy Decommission</div>
+                                <div style="font-size: 0.75rem; color: #6B7280;">18% tech debt · Due Q4</div>
+                            </div>
+                            <span style="font-weight: 700; color: #F59E0B;">35%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 6px; margin-top: 0.5rem;">
+                            <div style="background: #F59E0B; width: 35%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col_security:
+            st.markdown('<div class="section-header">Security & Compliance</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="display: flex; align-items: center; padding: 0.5rem 0; border-bottom: 1px solid #F3F4F6;">
+                        <span style="width: 130px;">Compliance</span>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 12px; margin: 0 1rem;">
+                            <div style="background: #10B981; width: 98%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                        <span style="font-weight: 700; color: #10B981; width: 40px;">98%</span>
+                    </div>
+                    <div style="display: flex; align-items: center; padding: 0.5rem 0; border-bottom: 1px solid #F3F4F6;">
+                        <span style="width: 130px;">Vulnerability Mgmt</span>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 12px; margin: 0 1rem;">
+                            <div style="background: #10B981; width: 96%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                        <span style="font-weight: 700; color: #10B981; width: 40px;">96%</span>
+                    </div>
+                    <div style="display: flex; align-items: center; padding: 0.5rem 0; border-bottom: 1px solid #F3F4F6;">
+                        <span style="width: 130px;">Access Control</span>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 12px; margin: 0 1rem;">
+                            <div style="background: #F59E0B; width: 94%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                        <span style="font-weight: 700; color: #F59E0B; width: 40px;">94%</span>
+                    </div>
+                    <div style="display: flex; align-items: center; padding: 0.5rem 0; border-bottom: 1px solid #F3F4F6;">
+                        <span style="width: 130px;">Data Protection</span>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 12px; margin: 0 1rem;">
+                            <div style="background: #F59E0B; width: 92%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                        <span style="font-weight: 700; color: #F59E0B; width: 40px;">92%</span>
+                    </div>
+                    <div style="display: flex; align-items: center; padding: 0.5rem 0;">
+                        <span style="width: 130px;">Threat Detection</span>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 12px; margin: 0 1rem;">
+                            <div style="background: #F59E0B; width: 90%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                        <span style="font-weight: 700; color: #F59E0B; width: 40px;">90%</span>
+                    </div>
+                </div>
+                <div style="display: flex; gap: 0.75rem; font-size: 0.8rem; justify-content: center; margin-top: 1rem;">
+                    <span style="background: #D1FAE5; color: #065F46; padding: 0.3rem 0.6rem; border-radius: 20px;">ISO 27001 ✓</span>
+                    <span style="background: #D1FAE5; color: #065F46; padding: 0.3rem 0.6rem; border-radius: 20px;">SOC 2 ✓</span>
+                    <span style="background: #D1FAE5; color: #065F46; padding: 0.3rem 0.6rem; border-radius: 20px;">GDPR ✓</span>
+                </div>
+                """, unsafe_allow_html=True)
+        
+    with tab_strategy:
+        st.markdown("""
+        <div class="cso-ai-pulse">
+            <div class="cso-ai-header">
+                <div class="cso-ai-title">❄️ Snowflake Intelligence Pulse</div>
+                <div class="cso-ai-tag">AI LIVE</div>
+            </div>
+            <div class="cso-ai-grid">
+                <div class="cso-ai-card">
+                    <div class="cso-ai-label">Renewables</div>
+                    <div class="cso-ai-value">65%</div>
+                    <div class="cso-ai-sub">Target 70%</div>
+                </div>
+                <div class="cso-ai-card">
+                    <div class="cso-ai-label">Carbon Reduction</div>
+                    <div class="cso-ai-value">-42%</div>
+                    <div class="cso-ai-sub">vs 2019 baseline</div>
+                </div>
+                <div class="cso-ai-card">
+                    <div class="cso-ai-label">PUE Average</div>
+                    <div class="cso-ai-value">1.42</div>
+                    <div class="cso-ai-sub">Target 1.30</div>
+                </div>
+                <div class="cso-ai-card">
+                    <div class="cso-ai-label">Supplier ESG</div>
+                    <div class="cso-ai-value">84%</div>
+                    <div class="cso-ai-sub">Tier 2 focus</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">AI Executive Summary</div>', unsafe_allow_html=True)
+        if st.session_state.get('sf_highlights', True):
+            st.info("❄️ **Powered by Snowflake Cortex AI** — Summary synthesized from energy, emissions, and ESG compliance data.")
+        
+        with st.container(border=True):
+            st.markdown("""
+            **Executive Summary (Q1 2026):**
+            - Renewable energy reached **65%**, on track to hit 70% target.
+            - Emissions are **down 15% YoY** with data center efficiency gains.
+            - Supply chain compliance improved to **84%**, with Tier 2 remediation planned.
+            """)
+        
+        st.markdown('<div class="section-header">Signals & Insights</div>', unsafe_allow_html=True)
+        insight_cols = st.columns(3)
+        with insight_cols[0]:
+            st.markdown('<div class="section-header">Top Insights</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                - **Macro sites** drive 52% of energy load
+                - **Wind + solar** deliver 50% of renewables
+                - **Water intensity** down in London and North
+                """)
+        with insight_cols[1]:
+            st.markdown('<div class="section-header">Risk Signals</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                - **Network features** closest to SLA thresholds
+                - **Tier 2 suppliers** below 85% compliance
+                - **PUE** above target in Manchester DC
+                """)
+        with insight_cols[2]:
+            st.markdown('<div class="section-header">Growth Signals</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                - **Solar expansion** adds +5% renewables
+                - **Fleet EV** rollout to 50% by 2025
+                - **Energy efficiency** saves £180K/year
+                """)
+        
+        st.markdown('<div class="section-header">AI-Powered Strategic Recommendations</div>', unsafe_allow_html=True)
+        action_cols = st.columns(3)
+        with action_cols[0]:
+            with st.container(border=True):
+                st.markdown("""
+                - **Accelerate renewables** via PPAs in top 3 regions
+                - Prioritize sites with >1.5 PUE
+                """)
+        with action_cols[1]:
+            with st.container(border=True):
+                st.markdown("""
+                - **Reduce water intensity** with closed-loop cooling
+                - Target 10% reduction by Q4
+                """)
+        with action_cols[2]:
+            with st.container(border=True):
+                st.markdown("""
+                - **Improve supplier ESG** with quarterly audits
+                - Enforce Tier 2 remediation milestones
+                """)
+        st.markdown("""
+        <div class="cto-ai-pulse">
+            <div class="cto-ai-header">
+                <div class="cto-ai-title">❄️ Snowflake Intelligence Pulse</div>
+                <div class="cto-ai-tag">AI LIVE</div>
+            </div>
+            <div class="cto-ai-grid">
+                <div class="cto-ai-card">
+                    <div class="cto-ai-label">Service Resilience</div>
+                    <div class="cto-ai-value">99.97%</div>
+                    <div class="cto-ai-sub">SLA above target</div>
+                </div>
+                <div class="cto-ai-card">
+                    <div class="cto-ai-label">Cloud Migration</div>
+                    <div class="cto-ai-value">72%</div>
+                    <div class="cto-ai-sub">On track for 85%</div>
+                </div>
+                <div class="cto-ai-card">
+                    <div class="cto-ai-label">Security Posture</div>
+                    <div class="cto-ai-value">94/100</div>
+                    <div class="cto-ai-sub">Patch compliance 98%</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">AI Executive Summary</div>', unsafe_allow_html=True)
+        if st.session_state.get('sf_highlights', True):
+            st.info("❄️ **Powered by Snowflake Cortex AI** — Executive summary synthesized from network, infra, and security telemetry.")
+        
+        with st.container(border=True):
+            st.markdown("""
+            **Executive Summary (Q1 2026):**
+            - Network performance remains strong (99.97% uptime) with latency improvements in all regions.
+            - Cloud migration is progressing (72%) but compute capacity is nearing the 80% threshold.
+            - Security posture is stable (94/100); access control and data protection are the top focus areas.
+            """)
+        
+        st.markdown('<div class="section-header">Signals & Insights</div>', unsafe_allow_html=True)
+        insight_cols = st.columns(3)
+        with insight_cols[0]:
+            st.markdown('<div class="section-header">Top Insights</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                - **5G coverage** at **78%**
+                - **Latency** down to **12ms**
+                - **Compute** at **76%** utilization
+                """)
+        with insight_cols[1]:
+            st.markdown('<div class="section-header">Risk Signals</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                - **Compute capacity** nearing threshold
+                - **Access control** at **94%**
+                - **Tech debt** still **18%**
+                """)
+        with insight_cols[2]:
+            st.markdown('<div class="section-header">Growth Signals</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                - **5G expansion** +12% YoY
+                - **SLA** above 99.9%
+                - **AI/ML platform** 45% complete
+                """)
+        
+        st.markdown('<div class="section-header">AI-Powered Strategic Recommendations</div>', unsafe_allow_html=True)
+        action_cols = st.columns(3)
+        with action_cols[0]:
+            with st.container(border=True):
+                st.markdown("""
+                **1) Accelerate 5G Rollout**
+                - Add 350 sites in Q1
+                - Focus Midlands & North
+                - Expected impact: +7% coverage
+                """)
+        with action_cols[1]:
+            with st.container(border=True):
+                st.markdown("""
+                **2) De-risk Capacity**
+                - Scale compute +30% by Q3
+                - Optimize storage tiers
+                - Expected impact: +12% headroom
+                """)
+        with action_cols[2]:
+            with st.container(border=True):
+                st.markdown("""
+                **3) Reduce Tech Debt**
+                - Retire 3 legacy systems
+                - Complete API modernization
+                - Expected impact: -3% debt
+                """)
+        
+        st.markdown('<div class="section-header">Ask Snowflake Intelligence</div>', unsafe_allow_html=True)
+        
+        questions = [
+            "What's our network uptime and latency performance by region over the last 30 days?",
+            "Show me the incident trend - how many P1/P2 incidents and what's our MTTR?",
+            "What's our 5G coverage by region and where should we prioritize new cell sites?",
+            "What's the capacity utilization trend and when do we need to expand?",
+            "Show me our digital transformation project status and any blockers."
+        ]
+        
+        sf_intel_url = "https://ai.snowflake.com/sfseeurope/pjose_aws3"
+        
+        cols = st.columns(2)
+        for i, q in enumerate(questions):
+            with cols[i % 2]:
+                escaped_q = q.replace('"', '&quot;').replace("'", "&#39;")
+                st.markdown(f"""
+                <a href="{sf_intel_url}" target="_blank" onclick="navigator.clipboard.writeText('{escaped_q}')" style="text-decoration: none; color: inherit; display: block;">
+                    <div class="question-card">
+                        <p style="margin-bottom: 1.5rem;"><strong>Q{i+1}:</strong> "{q}"</p>
+                    </div>
+                </a>
+                """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div style="text-align: center; margin-top: 1rem; padding: 1rem; background: linear-gradient(135deg, #29B5E8 0%, #1A8BC4 100%); border-radius: 8px;">
+            <a href="{sf_intel_url}" target="_blank" style="color: white; text-decoration: none; font-weight: 600; font-size: 1rem;">
+                ❄️ Ask these questions in Snowflake Intelligence →
+            </a>
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,807 @@
+"""CXO Customer Experience dashboard."""
+
+import streamlit as st
+import streamlit.components.v1 as components
+import pandas as pd
+import altair as alt
+
+from dashboard import charts
+
+
+def render_cxo_customer_experience():
+    import pandas as pd
+    import altair as alt
+    
+    # CXO Header with Heartbeat Pulse Effect
+    st.markdown("""
+    <div class="cxo-header-wrap">
+        <div class="cxo-heart-bg">
+            <span class="cxo-heart">❤️</span>
+            <div class="cxo-wave" style="top: 40%; animation-delay: 0s;"></div>
+            <div class="cxo-wave" style="top: 50%; animation-delay: 0.5s;"></div>
+            <div class="cxo-wave" style="top: 60%; animation-delay: 1s;"></div>
+            <span class="cxo-smile" style="left: 10%; top: 20%; animation-delay: 0s;">😊</span>
+            <span class="cxo-smile" style="right: 15%; top: 25%; animation-delay: 1s;">⭐</span>
+            <span class="cxo-smile" style="left: 15%; bottom: 20%; animation-delay: 2s;">👍</span>
+        </div>
+        <div class="cxo-header-content">
+            <h1>CXO Customer Experience Dashboard</h1>
+            <p>Customer Journey, NPS & Experience Transformation</p>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Dashboard Tabs
+    tab_overview, tab_mlops, tab_strategy = st.tabs(["📊 Overview & Analysis", "🧪 Model Ops & Strategy", "❄️ Snowflake Intelligence"])
+
+    with tab_overview:
+        
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['CUSTOMER_EXPERIENCE', 'MOBILE', 'SUPPORT']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+        
+        # CXO CUSTOMER JOURNEY ANIMATION
+        st.markdown("""<div class="cx-journey"><div class="cx-header"><div class="cx-title">💜 Customer Experience Journey</div><div class="cx-nps"><div class="nps-label">NPS Score</div><div class="nps-val">+47</div></div></div><div class="journey-path"><div class="journey-step"><div class="step-icon">🔍</div><div class="step-name">Awareness</div><div class="step-score">8.2</div></div><span class="journey-arrow">→</span><div class="journey-step"><div class="step-icon">🛒</div><div class="step-name">Purchase</div><div class="step-score">7.8</div></div><span class="journey-arrow">→</span><div class="journey-step"><div class="step-icon">📱</div><div class="step-name">Onboarding</div><div class="step-score">8.5</div></div><span class="journey-arrow">→</span><div class="journey-step"><div class="step-icon">🎧</div><div class="step-name">Support</div><div class="step-score">7.4</div></div><span class="journey-arrow">→</span><div class="journey-step"><div class="step-icon heart">❤️</div><div class="step-name">Loyalty</div><div class="step-score">8.1</div></div></div><div class="cx-stats"><div class="cx-stat"><div class="cx-stat-val">4.6/5</div><div class="cx-stat-label">CSAT Score</div></div><div class="cx-stat"><div class="cx-stat-val">87%</div><div class="cx-stat-label">First Contact</div></div><div class="cx-stat"><div class="cx-stat-val">2.1%</div><div class="cx-stat-label">Churn Rate</div></div><div class="cx-stat"><div class="cx-stat-val">£847</div><div class="cx-stat-label">Avg CLV</div></div></div></div>""", unsafe_allow_html=True)
+        
+        # Animated Customer Flow Sankey
+        st.markdown('<div class="section-header">Customer Flow Analysis</div>', unsafe_allow_html=True)
+        
+        components.html("""
+        <!DOCTYPE html>
+        <html>
+        <head>
+        <style>
+        * { margin: 0; padding: 0; box-sizing: border-box; }
+        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; }
+        @keyframes sankey-flow {
+            0% { stroke-dashoffset: 200; }
+            100% { stroke-dashoffset: 0; }
+        }
+        @keyframes sankey-flow-reverse {
+            0% { stroke-dashoffset: 0; }
+            100% { stroke-dashoffset: -200; }
+        }
+        @keyframes sankey-node-pulse {
+            0%, 100% { filter: drop-shadow(0 0 3px rgba(41, 181, 232, 0.3)); }
+            50% { filter: drop-shadow(0 0 10px rgba(41, 181, 232, 0.6)); }
+        }
+        @keyframes flow-particle {
+            0% { offset-distance: 0%; opacity: 0; }
+            5% { opacity: 1; }
+            95% { opacity: 1; }
+            100% { offset-distance: 100%; opacity: 0; }
+        }
+        .sankey-container {
+            background: linear-gradient(135deg, #F8FAFC 0%, #F1F5F9 100%);
+            border-radius: 16px;
+            padding: 1.5rem;
+            position: relative;
+            overflow: hidden;
+        }
+        .sankey-svg {
+            width: 100%;
+            height: 280px;
+        }
+        .sankey-node {
+            animation: sankey-node-pulse 3s ease-in-out infinite;
+        }
+        .sankey-path {
+            fill: none;
+            stroke-dasharray: 20 10;
+            animation: sankey-flow-reverse 2s linear infinite;
+        }
+        .sankey-legend {
+            display: flex;
+            justify-content: center;
+            gap: 2rem;
+            margin-top: 1rem;
+            flex-wrap: wrap;
+        }
+        .sankey-legend-item {
+            display: flex;
+            align-items: center;
+            gap: 6px;
+            font-size: 0.75rem;
+            color: #6B7280;
+        }
+        .sankey-legend-dot {
+            width: 12px;
+            height: 12px;
+            border-radius: 3px;
+        }
+        </style>
+        </head>
+        <body>
+        <div class="sankey-container">
+            <svg class="sankey-svg" viewBox="0 0 800 280">
+                <rect class="sankey-node" x="20" y="20" width="100" height="50" rx="8" fill="#3B82F6"/>
+                <text x="70" y="42" text-anchor="middle" fill="white" font-size="11" font-weight="600">Digital</text>
+                <text x="70" y="58" text-anchor="middle" fill="rgba(255,255,255,0.8)" font-size="10">45%</text>
+                
+                <rect class="sankey-node" x="20" y="90" width="100" height="40" rx="8" fill="#8B5CF6"/>
+                <text x="70" y="108" text-anchor="middle" fill="white" font-size="11" font-weight="600">Retail</text>
+                <text x="70" y="122" text-anchor="middle" fill="rgba(255,255,255,0.8)" font-size="10">30%</text>
+                
+                <rect class="sankey-node" x="20" y="150" width="100" height="35" rx="8" fill="#EC4899"/>
+                <text x="70" y="166" text-anchor="middle" fill="white" font-size="11" font-weight="600">Partner</text>
+                <text x="70" y="180" text-anchor="middle" fill="rgba(255,255,255,0.8)" font-size="10">15%</text>
+                
+                <rect class="sankey-node" x="20" y="205" width="100" height="30" rx="8" fill="#F59E0B"/>
+                <text x="70" y="218" text-anchor="middle" fill="white" font-size="11" font-weight="600">Referral</text>
+                <text x="70" y="232" text-anchor="middle" fill="rgba(255,255,255,0.8)" font-size="10">10%</text>
+                
+                <rect class="sankey-node" x="300" y="30" width="110" height="70" rx="8" fill="#10B981" style="animation-delay: 0.3s;"/>
+                <text x="355" y="58" text-anchor="middle" fill="white" font-size="11" font-weight="600">Consumer</text>
+                <text x="355" y="78" text-anchor="middle" fill="rgba(255,255,255,0.8)" font-size="10">62% - 18.6K</text>
+                
+                <rect class="sankey-node" x="300" y="120" width="110" height="50" rx="8" fill="#06B6D4" style="animation-delay: 0.5s;"/>
+                <text x="355" y="142" text-anchor="middle" fill="white" font-size="11" font-weight="600">SMB</text>
+                <text x="355" y="158" text-anchor="middle" fill="rgba(255,255,255,0.8)" font-size="10">26% - 7.8K</text>
+                
+                <rect class="sankey-node" x="300" y="190" width="110" height="45" rx="8" fill="#6366F1" style="animation-delay: 0.7s;"/>
+                <text x="355" y="210" text-anchor="middle" fill="white" font-size="11" font-weight="600">Enterprise</text>
+                <text x="355" y="226" text-anchor="middle" fill="rgba(255,255,255,0.8)" font-size="10">12% - 3.6K</text>
+                
+                <rect class="sankey-node" x="580" y="40" width="100" height="90" rx="8" fill="#10B981" style="animation-delay: 0.9s;"/>
+                <text x="630" y="75" text-anchor="middle" fill="white" font-size="11" font-weight="600">Retained</text>
+                <text x="630" y="95" text-anchor="middle" fill="rgba(255,255,255,0.8)" font-size="10">97.9%</text>
+                <text x="630" y="115" text-anchor="middle" fill="rgba(255,255,255,0.8)" font-size="9">29.4K customers</text>
+                
+                <rect class="sankey-node" x="580" y="150" width="100" height="45" rx="8" fill="#F59E0B" style="animation-delay: 1.1s;"/>
+                <text x="630" y="170" text-anchor="middle" fill="white" font-size="11" font-weight="600">At Risk</text>
+                <text x="630" y="186" text-anchor="middle" fill="rgba(255,255,255,0.8)" font-size="10">1.5% - 450</text>
+                
+                <rect class="sankey-node" x="580" y="210" width="100" height="35" rx="8" fill="#EF4444" style="animation-delay: 1.3s;"/>
+                <text x="630" y="226" text-anchor="middle" fill="white" font-size="11" font-weight="600">Churned</text>
+                <text x="630" y="240" text-anchor="middle" fill="rgba(255,255,255,0.8)" font-size="10">0.6% - 180</text>
+                
+                <path class="sankey-path" d="M120,45 C200,45 200,65 300,65" stroke="#3B82F6" stroke-width="20" opacity="0.4" style="animation-delay: 0.2s;"/>
+                <path class="sankey-path" d="M120,45 C200,45 200,145 300,145" stroke="#3B82F6" stroke-width="8" opacity="0.3" style="animation-delay: 0.3s;"/>
+                <path class="sankey-path" d="M120,110 C200,110 200,65 300,65" stroke="#8B5CF6" stroke-width="12" opacity="0.4" style="animation-delay: 0.4s;"/>
+                <path class="sankey-path" d="M120,110 C200,110 200,145 300,145" stroke="#8B5CF6" stroke-width="8" opacity="0.3" style="animation-delay: 0.5s;"/>
+                <path class="sankey-path" d="M120,167 C200,167 200,212 300,212" stroke="#EC4899" stroke-width="10" opacity="0.4" style="animation-delay: 0.6s;"/>
+                <path class="sankey-path" d="M120,220 C200,220 200,145 300,145" stroke="#F59E0B" stroke-width="6" opacity="0.4" style="animation-delay: 0.7s;"/>
+                
+                <path class="sankey-path" d="M410,65 C490,65 490,85 580,85" stroke="#10B981" stroke-width="28" opacity="0.5" style="animation-delay: 0.8s;"/>
+                <path class="sankey-path" d="M410,145 C490,145 490,85 580,85" stroke="#06B6D4" stroke-width="18" opacity="0.5" style="animation-delay: 0.9s;"/>
+                <path class="sankey-path" d="M410,212 C490,212 490,85 580,85" stroke="#6366F1" stroke-width="12" opacity="0.5" style="animation-delay: 1.0s;"/>
+                <path class="sankey-path" d="M410,65 C490,65 490,172 580,172" stroke="#F59E0B" stroke-width="4" opacity="0.5" style="animation-delay: 1.1s;"/>
+                <path class="sankey-path" d="M410,145 C490,145 490,172 580,172" stroke="#F59E0B" stroke-width="3" opacity="0.5" style="animation-delay: 1.2s;"/>
+                <path class="sankey-path" d="M410,65 C490,65 490,227 580,227" stroke="#EF4444" stroke-width="2" opacity="0.5" style="animation-delay: 1.3s;"/>
+            </svg>
+            <div class="sankey-legend">
+                <div class="sankey-legend-item"><div class="sankey-legend-dot" style="background: #3B82F6;"></div>Digital Channel</div>
+                <div class="sankey-legend-item"><div class="sankey-legend-dot" style="background: #8B5CF6;"></div>Retail Store</div>
+                <div class="sankey-legend-item"><div class="sankey-legend-dot" style="background: #EC4899;"></div>Partner</div>
+                <div class="sankey-legend-item"><div class="sankey-legend-dot" style="background: #10B981;"></div>Retained</div>
+                <div class="sankey-legend-item"><div class="sankey-legend-dot" style="background: #F59E0B;"></div>At Risk</div>
+                <div class="sankey-legend-item"><div class="sankey-legend-dot" style="background: #EF4444;"></div>Churned</div>
+            </div>
+        </div>
+        </body>
+        </html>
+        """, height=380, scrolling=False)
+        
+        
+        st.markdown('<div class="section-header">Customer Experience Overview</div>', unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #10B981;">
+                <div class="kpi-icon">⭐</div>
+                <div class="kpi-label">NPS Score</div>
+                <div class="kpi-value">+42</div>
+                <div class="kpi-delta positive">↑ +8 vs Q3</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <path d="M0,35 L20,32 L40,28 L60,24 L80,18 L100,12" fill="none" stroke="#10B981" stroke-width="2"/>
+                    <path d="M0,35 L20,32 L40,28 L60,24 L80,18 L100,12 L100,40 L0,40 Z" fill="#10B981"/>
+                </svg>
+            </div>
+            <div class="kpi-card" style="--accent: #8B5CF6;">
+                <div class="kpi-icon">😊</div>
+                <div class="kpi-label">CSAT Score</div>
+                <div class="kpi-value">4.3/5</div>
+                <div class="kpi-delta positive">↑ +0.3 YoY</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <rect x="5" y="32" width="12" height="8" fill="#8B5CF6"/>
+                    <rect x="22" y="28" width="12" height="12" fill="#8B5CF6"/>
+                    <rect x="39" y="24" width="12" height="16" fill="#8B5CF6"/>
+                    <rect x="56" y="20" width="12" height="20" fill="#8B5CF6"/>
+                    <rect x="73" y="14" width="12" height="26" fill="#8B5CF6"/>
+                </svg>
+            </div>
+            <div class="kpi-card" style="--accent: #29B5E8;">
+                <div class="kpi-icon">💪</div>
+                <div class="kpi-label">Customer Effort</div>
+                <div class="kpi-value">2.1</div>
+                <div class="kpi-delta positive">↓ Lower is better</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <path d="M0,15 L20,18 L40,20 L60,24 L80,28 L100,32" fill="none" stroke="#29B5E8" stroke-width="2"/>
+                    <path d="M0,15 L20,18 L40,20 L60,24 L80,28 L100,32 L100,40 L0,40 Z" fill="#29B5E8"/>
+                </svg>
+            </div>
+            <div class="kpi-card" style="--accent: #F59E0B;">
+                <div class="kpi-icon">🔄</div>
+                <div class="kpi-label">First Contact Resolution</div>
+                <div class="kpi-value">78%</div>
+                <div class="kpi-delta positive">↑ +5% vs target</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <path d="M0,28 L20,26 L40,24 L60,22 L80,18 L100,16" fill="none" stroke="#F59E0B" stroke-width="2"/>
+                    <path d="M0,28 L20,26 L40,24 L60,22 L80,18 L100,16 L100,40 L0,40 Z" fill="#F59E0B"/>
+                </svg>
+            </div>
+        </div>
+        
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #EC4899;">
+                <div class="kpi-icon">📱</div>
+                <div class="kpi-label">Digital Adoption</div>
+                <div class="kpi-value">68%</div>
+                <div class="kpi-delta positive">↑ +12% YoY</div>
+            </div>
+            <div class="kpi-card" style="--accent: #14B8A6;">
+                <div class="kpi-icon">⏱️</div>
+                <div class="kpi-label">Avg Response Time</div>
+                <div class="kpi-value">42s</div>
+                <div class="kpi-delta positive">↓ -18s vs Q3</div>
+            </div>
+            <div class="kpi-card" style="--accent: #6366F1;">
+                <div class="kpi-icon">✅</div>
+                <div class="kpi-label">Resolution Rate</div>
+                <div class="kpi-value">92%</div>
+                <div class="kpi-delta positive">↑ +3% MoM</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EF4444;">
+                <div class="kpi-icon">😤</div>
+                <div class="kpi-label">Detractors</div>
+                <div class="kpi-value">8%</div>
+                <div class="kpi-delta positive">↓ -2% vs Q3</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        col_left, col_right = st.columns([1.3, 1])
+        
+        with col_left:
+            st.markdown('<div class="section-header">Customer Journey Stages</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="display: flex; align-items: center; padding: 0.6rem 0; border-bottom: 1px solid #F3F4F6;">
+                        <div style="width: 110px; font-weight: 600;">Awareness</div>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 20px; margin: 0 0.75rem; position: relative;">
+                            <div style="background: linear-gradient(90deg, #8B5CF6, #A78BFA); width: 85%; height: 100%; border-radius: 4px; display: flex; align-items: center; justify-content: flex-end; padding-right: 0.5rem;">
+                                <span style="color: white; font-size: 0.75rem; font-weight: 600;">12,400</span>
+                            </div>
+                        </div>
+                        <span style="width: 60px; text-align: right; color: #10B981; font-weight: 600;">+4.2</span>
+                    </div>
+                    <div style="display: flex; align-items: center; padding: 0.6rem 0; border-bottom: 1px solid #F3F4F6;">
+                        <div style="width: 110px; font-weight: 600;">Consideration</div>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 20px; margin: 0 0.75rem; position: relative;">
+                            <div style="background: linear-gradient(90deg, #29B5E8, #5BC0EB); width: 72%; height: 100%; border-radius: 4px; display: flex; align-items: center; justify-content: flex-end; padding-right: 0.5rem;">
+                                <span style="color: white; font-size: 0.75rem; font-weight: 600;">8,900</span>
+                            </div>
+                        </div>
+                        <span style="width: 60px; text-align: right; color: #10B981; font-weight: 600;">+4.0</span>
+                    </div>
+                    <div style="display: flex; align-items: center; padding: 0.6rem 0; border-bottom: 1px solid #F3F4F6;">
+                        <div style="width: 110px; font-weight: 600;">Purchase</div>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 20px; margin: 0 0.75rem; position: relative;">
+                            <div style="background: linear-gradient(90deg, #10B981, #34D399); width: 58%; height: 100%; border-radius: 4px; display: flex; align-items: center; justify-content: flex-end; padding-right: 0.5rem;">
+                                <span style="color: white; font-size: 0.75rem; font-weight: 600;">6,200</span>
+                            </div>
+                        </div>
+                        <span style="width: 60px; text-align: right; color: #10B981; font-weight: 600;">+4.5</span>
+                    </div>
+                    <div style="display: flex; align-items: center; padding: 0.6rem 0; border-bottom: 1px solid #F3F4F6;">
+                        <div style="width: 110px; font-weight: 600;">Support</div>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 20px; margin: 0 0.75rem; position: relative;">
+                            <div style="background: linear-gradient(90deg, #F59E0B, #FBBF24); width: 45%; height: 100%; border-radius: 4px; display: flex; align-items: center; justify-content: flex-end; padding-right: 0.5rem;">
+                                <span style="color: white; font-size: 0.75rem; font-weight: 600;">4,800</span>
+                            </div>
+                        </div>
+                        <span style="width: 60px; text-align: right; color: #F59E0B; font-weight: 600;">+3.8</span>
+                    </div>
+                    <div style="display: flex; align-items: center; padding: 0.6rem 0; border-bottom: 1px solid #F3F4F6;">
+                        <div style="width: 110px; font-weight: 600;">Usage</div>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 20px; margin: 0 0.75rem; position: relative;">
+                            <div style="background: linear-gradient(90deg, #EC4899, #F472B6); width: 92%; height: 100%; border-radius: 4px; display: flex; align-items: center; justify-content: flex-end; padding-right: 0.5rem;">
+                                <span style="color: white; font-size: 0.75rem; font-weight: 600;">28,500</span>
+                            </div>
+                        </div>
+                        <span style="width: 60px; text-align: right; color: #10B981; font-weight: 600;">+4.4</span>
+                    </div>
+                    <div style="display: flex; align-items: center; padding: 0.6rem 0;">
+                        <div style="width: 110px; font-weight: 600;">Renewal</div>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 20px; margin: 0 0.75rem; position: relative;">
+                            <div style="background: linear-gradient(90deg, #6366F1, #818CF8); width: 35%; height: 100%; border-radius: 4px; display: flex; align-items: center; justify-content: flex-end; padding-right: 0.5rem;">
+                                <span style="color: white; font-size: 0.75rem; font-weight: 600;">2,400</span>
+                            </div>
+                        </div>
+                        <span style="width: 60px; text-align: right; color: #10B981; font-weight: 600;">+4.6</span>
+                    </div>
+                </div>
+                <div style="display: flex; justify-content: flex-end; font-size: 0.75rem; color: #6B7280; margin-top: 0.5rem;">
+                    <span>Interactions | Sentiment Score (1-5)</span>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            st.markdown('<div class="section-header">Channel Performance</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <table style="width: 100%; border-collapse: collapse; font-size: 0.85rem;">
+                    <thead>
+                        <tr style="border-bottom: 2px solid #E5E7EB;">
+                            <th style="text-align: left; padding: 0.5rem; color: #6B7280;">Channel</th>
+                            <th style="text-align: center; padding: 0.5rem; color: #6B7280;">Sentiment</th>
+                            <th style="text-align: center; padding: 0.5rem; color: #6B7280;">Effort</th>
+                            <th style="text-align: center; padding: 0.5rem; color: #6B7280;">Resolution</th>
+                            <th style="text-align: center; padding: 0.5rem; color: #6B7280;">Conv Rate</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem;">📱 Mobile App</td>
+                            <td style="text-align: center; padding: 0.5rem;"><span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">4.5</span></td>
+                            <td style="text-align: center; padding: 0.5rem;"><span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">1.8</span></td>
+                            <td style="text-align: center; padding: 0.5rem;">94%</td>
+                            <td style="text-align: center; padding: 0.5rem; font-weight: 600; color: #10B981;">12%</td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem;">💬 Live Chat</td>
+                            <td style="text-align: center; padding: 0.5rem;"><span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">4.2</span></td>
+                            <td style="text-align: center; padding: 0.5rem;"><span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">2.0</span></td>
+                            <td style="text-align: center; padding: 0.5rem;">88%</td>
+                            <td style="text-align: center; padding: 0.5rem; font-weight: 600; color: #10B981;">8%</td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem;">📞 Call Centre</td>
+                            <td style="text-align: center; padding: 0.5rem;"><span style="background: #FEF3C7; color: #92400E; padding: 0.2rem 0.5rem; border-radius: 12px;">3.8</span></td>
+                            <td style="text-align: center; padding: 0.5rem;"><span style="background: #FEF3C7; color: #92400E; padding: 0.2rem 0.5rem; border-radius: 12px;">2.8</span></td>
+                            <td style="text-align: center; padding: 0.5rem;">82%</td>
+                            <td style="text-align: center; padding: 0.5rem; font-weight: 600;">5%</td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem;">🏪 Retail Store</td>
+                            <td style="text-align: center; padding: 0.5rem;"><span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">4.4</span></td>
+                            <td style="text-align: center; padding: 0.5rem;"><span style="background: #FEF3C7; color: #92400E; padding: 0.2rem 0.5rem; border-radius: 12px;">2.5</span></td>
+                            <td style="text-align: center; padding: 0.5rem;">91%</td>
+                            <td style="text-align: center; padding: 0.5rem; font-weight: 600; color: #10B981;">18%</td>
+                        </tr>
+                        <tr>
+                            <td style="padding: 0.5rem;">🌐 Website</td>
+                            <td style="text-align: center; padding: 0.5rem;"><span style="background: #FEF3C7; color: #92400E; padding: 0.2rem 0.5rem; border-radius: 12px;">3.9</span></td>
+                            <td style="text-align: center; padding: 0.5rem;"><span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">2.2</span></td>
+                            <td style="text-align: center; padding: 0.5rem;">75%</td>
+                            <td style="text-align: center; padding: 0.5rem; font-weight: 600;">6%</td>
+                        </tr>
+                    </tbody>
+                </table>
+                """, unsafe_allow_html=True)
+        
+        with col_right:
+            st.markdown('<div class="section-header">NPS by Segment</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="padding: 0.6rem; border-left: 4px solid #10B981; background: #D1FAE5; border-radius: 0 8px 8px 0; margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <div>
+                                <div style="font-weight: 600; color: #065F46;">Premium</div>
+                                <div style="font-size: 0.75rem; color: #6B7280;">3,200 customers</div>
+                            </div>
+                            <span style="font-size: 1.5rem; font-weight: 700; color: #10B981;">+58</span>
+                        </div>
+                    </div>
+                    <div style="padding: 0.6rem; border-left: 4px solid #29B5E8; background: #E0F2FE; border-radius: 0 8px 8px 0; margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <div>
+                                <div style="font-weight: 600; color: #0369A1;">5G Subscribers</div>
+                                <div style="font-size: 0.75rem; color: #6B7280;">12,600 customers</div>
+                            </div>
+                            <span style="font-size: 1.5rem; font-weight: 700; color: #29B5E8;">+52</span>
+                        </div>
+                    </div>
+                    <div style="padding: 0.6rem; border-left: 4px solid #8B5CF6; background: #EDE9FE; border-radius: 0 8px 8px 0; margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <div>
+                                <div style="font-weight: 600; color: #5B21B6;">Standard</div>
+                                <div style="font-size: 0.75rem; color: #6B7280;">10,500 customers</div>
+                            </div>
+                            <span style="font-size: 1.5rem; font-weight: 700; color: #8B5CF6;">+38</span>
+                        </div>
+                    </div>
+                    <div style="padding: 0.6rem; border-left: 4px solid #F59E0B; background: #FEF3C7; border-radius: 0 8px 8px 0;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <div>
+                                <div style="font-weight: 600; color: #92400E;">Budget</div>
+                                <div style="font-size: 0.75rem; color: #6B7280;">5,400 customers</div>
+                            </div>
+                            <span style="font-size: 1.5rem; font-weight: 700; color: #F59E0B;">+24</span>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            st.markdown('<div class="section-header">Experience Initiatives</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="padding: 0.5rem; border-bottom: 1px solid #E5E7EB;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <span style="font-weight: 600;">AI Chatbot Rollout</span>
+                            <span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px; font-size: 0.75rem;">Live</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 6px; margin-top: 0.5rem;">
+                            <div style="background: #10B981; width: 100%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="padding: 0.5rem; border-bottom: 1px solid #E5E7EB;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <span style="font-weight: 600;">App Personalization</span>
+                            <span style="background: #E0F2FE; color: #0369A1; padding: 0.2rem 0.5rem; border-radius: 12px; font-size: 0.75rem;">78%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 6px; margin-top: 0.5rem;">
+                            <div style="background: #29B5E8; width: 78%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="padding: 0.5rem; border-bottom: 1px solid #E5E7EB;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <span style="font-weight: 600;">Proactive Outreach</span>
+                            <span style="background: #EDE9FE; color: #5B21B6; padding: 0.2rem 0.5rem; border-radius: 12px; font-size: 0.75rem;">52%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 6px; margin-top: 0.5rem;">
+                            <div style="background: #8B5CF6; width: 52%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="padding: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <span style="font-weight: 600;">Journey Redesign</span>
+                            <span style="background: #FEF3C7; color: #92400E; padding: 0.2rem 0.5rem; border-radius: 12px; font-size: 0.75rem;">35%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 6px; margin-top: 0.5rem;">
+                            <div style="background: #F59E0B; width: 35%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            st.markdown('<div class="section-header">Voice of Customer</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.8rem; color: #6B7280;">
+                    <div style="padding: 0.5rem; background: #F9FAFB; border-radius: 8px; margin-bottom: 0.5rem;">
+                        <div style="color: #10B981; font-weight: 600;">🟢 Promoter Themes</div>
+                        <div style="margin-top: 0.25rem;">Network quality, app experience, staff helpfulness</div>
+                    </div>
+                    <div style="padding: 0.5rem; background: #F9FAFB; border-radius: 8px;">
+                        <div style="color: #EF4444; font-weight: 600;">🔴 Detractor Themes</div>
+                        <div style="margin-top: 0.25rem;">Wait times, billing clarity, coverage gaps</div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">NPS Trend (6 Months)</div>', unsafe_allow_html=True)
+        
+        with st.container(border=True):
+            col_nps_chart, col_nps_breakdown = st.columns([2, 1])
+            
+            with col_nps_chart:
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan', 'Feb']
+                nps_trend_data = pd.DataFrame({
+                    'Month': months,
+                    'NPS': [38, 40, 43, 45, 48, 50, 52]
+                })
+                
+                nps_line = alt.Chart(nps_trend_data).mark_area(
+                    line={'color': '#10B981', 'strokeWidth': 3},
+                    color=alt.Gradient(
+                        gradient='linear',
+                        stops=[alt.GradientStop(color='rgba(16, 185, 129, 0.3)', offset=0),
+                               alt.GradientStop(color='rgba(16, 185, 129, 0)', offset=1)],
+                        x1=1, x2=1, y1=1, y2=0
+                    )
+                ).encode(
+                    x=alt.X('Month:N', sort=months, axis=alt.Axis(labelAngle=0, title=None)),
+                    y=alt.Y('NPS:Q', scale=alt.Scale(domain=[0, 60]), axis=alt.Axis(title='NPS Score'))
+                )
+                
+                nps_points = alt.Chart(nps_trend_data).mark_circle(size=80, color='#10B981').encode(
+                    x=alt.X('Month:N', sort=months),
+                    y=alt.Y('NPS:Q'),
+                    tooltip=['Month:N', alt.Tooltip('NPS:Q', title='NPS', format='+d')]
+                )
+                
+                target_line = alt.Chart(pd.DataFrame({'y': [45]})).mark_rule(
+                    color='#9CA3AF', strokeDash=[4, 4]
+                ).encode(y='y:Q')
+                
+                nps_labels = alt.Chart(nps_trend_data.tail(1)).mark_text(
+                    dy=-15, fontSize=12, fontWeight='bold', color='#10B981'
+                ).encode(
+                    x=alt.X('Month:N', sort=months),
+                    y=alt.Y('NPS:Q'),
+                    text=alt.Text('NPS:Q', format='+d')
+                )
+                
+                charts.altair_chart((nps_line + nps_points + target_line + nps_labels).properties(height=160), use_container_width=True)
+            
+            with col_nps_breakdown:
+                st.markdown("""
+                <div style="font-size: 0.75rem; color: #6B7280; margin-bottom: 0.75rem;">NPS Breakdown</div>
+                <div style="margin-bottom: 0.75rem;">
+                    <div style="display: flex; justify-content: space-between; font-size: 0.8rem;">
+                        <span style="color: #10B981;">Promoters</span>
+                        <span style="font-weight: 700; color: #10B981;">62%</span>
+                    </div>
+                    <div style="background: #E5E7EB; border-radius: 4px; height: 8px; margin-top: 0.25rem;">
+                        <div style="background: #10B981; width: 62%; height: 100%; border-radius: 4px;"></div>
+                    </div>
+                </div>
+                <div style="margin-bottom: 0.75rem;">
+                    <div style="display: flex; justify-content: space-between; font-size: 0.8rem;">
+                        <span style="color: #F59E0B;">Passives</span>
+                        <span style="font-weight: 700; color: #F59E0B;">28%</span>
+                    </div>
+                    <div style="background: #E5E7EB; border-radius: 4px; height: 8px; margin-top: 0.25rem;">
+                        <div style="background: #F59E0B; width: 28%; height: 100%; border-radius: 4px;"></div>
+                    </div>
+                </div>
+                <div>
+                    <div style="display: flex; justify-content: space-between; font-size: 0.8rem;">
+                        <span style="color: #EF4444;">Detractors</span>
+                        <span style="font-weight: 700; color: #EF4444;">10%</span>
+                    </div>
+                    <div style="background: #E5E7EB; border-radius: 4px; height: 8px; margin-top: 0.25rem;">
+                        <div style="background: #EF4444; width: 10%; height: 100%; border-radius: 4px;"></div>
+                    </div>
+                </div>
+                <div style="margin-top: 0.75rem; padding: 0.5rem; background: #D1FAE5; border-radius: 6px; text-align: center; font-size: 0.75rem;">
+                    <span style="color: #065F46;">↑ +14 pts in 6 months</span>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        col_sent, col_drop = st.columns(2)
+        
+        with col_sent:
+            st.markdown('<div class="section-header">Sentiment Analysis by Topic</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="display: flex; align-items: center; margin-bottom: 0.6rem; padding-bottom: 0.6rem; border-bottom: 1px solid #F3F4F6;">
+                        <div style="width: 100px;">Network</div>
+                        <div style="flex: 1; display: flex; gap: 2px; margin: 0 0.5rem;">
+                            <div style="background: #10B981; height: 16px; width: 72%; border-radius: 2px 0 0 2px;"></div>
+                            <div style="background: #F59E0B; height: 16px; width: 18%;"></div>
+                            <div style="background: #EF4444; height: 16px; width: 10%; border-radius: 0 2px 2px 0;"></div>
+                        </div>
+                        <span style="width: 50px; color: #10B981; font-weight: 700; font-size: 0.8rem;">+62</span>
+                    </div>
+                    <div style="display: flex; align-items: center; margin-bottom: 0.6rem; padding-bottom: 0.6rem; border-bottom: 1px solid #F3F4F6;">
+                        <div style="width: 100px;">App/Digital</div>
+                        <div style="flex: 1; display: flex; gap: 2px; margin: 0 0.5rem;">
+                            <div style="background: #10B981; height: 16px; width: 68%; border-radius: 2px 0 0 2px;"></div>
+                            <div style="background: #F59E0B; height: 16px; width: 20%;"></div>
+                            <div style="background: #EF4444; height: 16px; width: 12%; border-radius: 0 2px 2px 0;"></div>
+                        </div>
+                        <span style="width: 50px; color: #10B981; font-weight: 700; font-size: 0.8rem;">+56</span>
+                    </div>
+                    <div style="display: flex; align-items: center; margin-bottom: 0.6rem; padding-bottom: 0.6rem; border-bottom: 1px solid #F3F4F6;">
+                        <div style="width: 100px;">Pricing</div>
+                        <div style="flex: 1; display: flex; gap: 2px; margin: 0 0.5rem;">
+                            <div style="background: #10B981; height: 16px; width: 45%; border-radius: 2px 0 0 2px;"></div>
+                            <div style="background: #F59E0B; height: 16px; width: 35%;"></div>
+                            <div style="background: #EF4444; height: 16px; width: 20%; border-radius: 0 2px 2px 0;"></div>
+                        </div>
+                        <span style="width: 50px; color: #F59E0B; font-weight: 700; font-size: 0.8rem;">+25</span>
+                    </div>
+                    <div style="display: flex; align-items: center; margin-bottom: 0.6rem; padding-bottom: 0.6rem; border-bottom: 1px solid #F3F4F6;">
+                        <div style="width: 100px;">Support</div>
+                        <div style="flex: 1; display: flex; gap: 2px; margin: 0 0.5rem;">
+                            <div style="background: #10B981; height: 16px; width: 55%; border-radius: 2px 0 0 2px;"></div>
+                            <div style="background: #F59E0B; height: 16px; width: 28%;"></div>
+                            <div style="background: #EF4444; height: 16px; width: 17%; border-radius: 0 2px 2px 0;"></div>
+                        </div>
+                        <span style="width: 50px; color: #10B981; font-weight: 700; font-size: 0.8rem;">+38</span>
+                    </div>
+                    <div style="display: flex; align-items: center;">
+                        <div style="width: 100px;">Billing</div>
+                        <div style="flex: 1; display: flex; gap: 2px; margin: 0 0.5rem;">
+                            <div style="background: #10B981; height: 16px; width: 40%; border-radius: 2px 0 0 2px;"></div>
+                            <div style="background: #F59E0B; height: 16px; width: 32%;"></div>
+                            <div style="background: #EF4444; height: 16px; width: 28%; border-radius: 0 2px 2px 0;"></div>
+                        </div>
+                        <span style="width: 50px; color: #F59E0B; font-weight: 700; font-size: 0.8rem;">+12</span>
+                    </div>
+                </div>
+                <div style="margin-top: 0.75rem; display: flex; justify-content: center; gap: 1.5rem; font-size: 0.7rem;">
+                    <span><span style="background: #10B981; display: inline-block; width: 10px; height: 10px; border-radius: 2px; margin-right: 4px;"></span>Positive</span>
+                    <span><span style="background: #F59E0B; display: inline-block; width: 10px; height: 10px; border-radius: 2px; margin-right: 4px;"></span>Neutral</span>
+                    <span><span style="background: #EF4444; display: inline-block; width: 10px; height: 10px; border-radius: 2px; margin-right: 4px;"></span>Negative</span>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col_drop:
+            st.markdown('<div class="section-header">Journey Drop-off Analysis</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="text-align: center; margin-bottom: 0.75rem;">
+                        <span style="font-size: 0.75rem; color: #6B7280;">Purchase Journey Conversion Funnel</span>
+                    </div>
+                    <div style="display: flex; flex-direction: column; align-items: center; gap: 0.25rem;">
+                        <div style="background: linear-gradient(90deg, #29B5E8, #0EA5E9); width: 100%; padding: 0.5rem; border-radius: 4px; display: flex; justify-content: space-between;">
+                            <span style="color: white; font-weight: 600;">Browse Plans</span>
+                            <span style="color: white;">100%</span>
+                        </div>
+                        <div style="color: #EF4444; font-size: 0.7rem;">↓ -22% drop</div>
+                        <div style="background: linear-gradient(90deg, #29B5E8, #0EA5E9); width: 78%; padding: 0.5rem; border-radius: 4px; display: flex; justify-content: space-between;">
+                            <span style="color: white; font-weight: 600;">Configure</span>
+                            <span style="color: white;">78%</span>
+                        </div>
+                        <div style="color: #EF4444; font-size: 0.7rem;">↓ -15% drop</div>
+                        <div style="background: linear-gradient(90deg, #29B5E8, #0EA5E9); width: 63%; padding: 0.5rem; border-radius: 4px; display: flex; justify-content: space-between;">
+                            <span style="color: white; font-weight: 600;">Cart</span>
+                            <span style="color: white;">63%</span>
+                        </div>
+                        <div style="color: #EF4444; font-size: 0.7rem;">↓ -18% drop</div>
+                        <div style="background: linear-gradient(90deg, #29B5E8, #0EA5E9); width: 45%; padding: 0.5rem; border-radius: 4px; display: flex; justify-content: space-between;">
+                            <span style="color: white; font-weight: 600;">Checkout</span>
+                            <span style="color: white;">45%</span>
+                        </div>
+                        <div style="color: #10B981; font-size: 0.7rem;">↓ -7% drop</div>
+                        <div style="background: linear-gradient(90deg, #10B981, #059669); width: 38%; padding: 0.5rem; border-radius: 4px; display: flex; justify-content: space-between;">
+                            <span style="color: white; font-weight: 600;">Purchase</span>
+                            <span style="color: white;">38%</span>
+                        </div>
+                    </div>
+                    <div style="margin-top: 0.75rem; padding: 0.5rem; background: #FEF3C7; border-radius: 6px; font-size: 0.75rem; text-align: center;">
+                        <span style="color: #92400E;">⚠️ Focus: Reduce Browse → Configure drop-off</span>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Customer Feedback Word Cloud & Trends</div>', unsafe_allow_html=True)
+        
+        col_words, col_trends = st.columns(2)
+        
+        with col_words:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="text-align: center; padding: 1rem;">
+                    <span style="font-size: 2rem; color: #10B981; font-weight: 700;">fast </span>
+                    <span style="font-size: 1.2rem; color: #10B981;">reliable </span>
+                    <span style="font-size: 1.5rem; color: #10B981; font-weight: 600;">great coverage </span>
+                    <span style="font-size: 0.9rem; color: #10B981;">helpful staff </span>
+                    <span style="font-size: 1.8rem; color: #10B981; font-weight: 700;">5G </span>
+                    <span style="font-size: 1.1rem; color: #10B981;">easy app </span>
+                    <span style="font-size: 1.3rem; color: #F59E0B;">wait times </span>
+                    <span style="font-size: 1rem; color: #10B981;">good value </span>
+                    <span style="font-size: 1.4rem; color: #EF4444;">billing </span>
+                    <span style="font-size: 1rem; color: #10B981;">streaming </span>
+                    <span style="font-size: 0.9rem; color: #F59E0B;">pricing </span>
+                    <span style="font-size: 1.6rem; color: #10B981; font-weight: 600;">recommend </span>
+                    <span style="font-size: 1rem; color: #10B981;">quick </span>
+                </div>
+                <div style="display: flex; justify-content: center; gap: 1rem; font-size: 0.75rem; margin-top: 0.5rem;">
+                    <span style="color: #10B981;">● Positive (68%)</span>
+                    <span style="color: #F59E0B;">● Neutral (22%)</span>
+                    <span style="color: #EF4444;">● Negative (10%)</span>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col_trends:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="font-weight: 600; color: #6B7280; margin-bottom: 0.75rem;">Emerging Themes This Month</div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>5G Speed Praise</span>
+                        <span style="color: #10B981; font-weight: 600;">↑ +42%</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>App Ease of Use</span>
+                        <span style="color: #10B981; font-weight: 600;">↑ +28%</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>In-Store Experience</span>
+                        <span style="color: #10B981; font-weight: 600;">↑ +15%</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Call Center Wait</span>
+                        <span style="color: #EF4444; font-weight: 600;">↑ +8%</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0;">
+                        <span>Roaming Complaints</span>
+                        <span style="color: #10B981; font-weight: 600;">↓ -22%</span>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+
+    with tab_strategy:
+        st.markdown('<div class="section-header">CXO Strategic Priorities — Q1 2026</div>', unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #DC2626; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 1</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">NPS to +50</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **+42** (target: +50)
+                - Focus: Detractor recovery program
+                - Proactive outreach: 2,400 at-risk
+                - Target: **-3% detractors**
+                """)
+        
+        with col2:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #F59E0B; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 2</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Digital First 75%</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **68%** (target: 75%)
+                - App personalization: live Q1
+                - Self-service expansion: 12 journeys
+                - Cost savings: **£1.2M** projected
+                """)
+        
+        with col3:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #10B981; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 3</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Effort Score < 2.0</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **2.1** (target: <2.0)
+                - Journey redesign: 4 flows in progress
+                - AI chatbot: **40%** containment
+                - Wait time: **-30s** target
+                """)
+        
+        st.markdown('<div class="section-header">Ask Snowflake Intelligence</div>', unsafe_allow_html=True)
+        
+        questions = [
+            "What's the distribution of customer interactions by journey stage?",
+            "Which channels have the highest customer effort scores?",
+            "Show me the average sentiment score by channel this month.",
+            "Compare digital vs physical channel performance.",
+            "What's our NPS trend by customer segment?"
+        ]
+        
+        sf_intel_url = "https://ai.snowflake.com/sfseeurope/pjose_aws3"
+        
+        cols = st.columns(2)
+        for i, q in enumerate(questions):
+            with cols[i % 2]:
+                escaped_q = q.replace('"', '&quot;').replace("'", "&#39;")
+                st.markdown(f"""
+                <a href="{sf_intel_url}" target="_blank" onclick="navigator.clipboard.writeText('{escaped_q}')" style="text-decoration: none; color: inherit; display: block;">
+                    <div class="question-card">
+                        <p style="margin-bottom: 1.5rem;"><strong>Q{i+1}:</strong> "{q}"</p>
+                    </div>
+                </a>
+                """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div style="text-align: center; margin-top: 1rem; padding: 1rem; background: linear-gradient(135deg, #29B5E8 0%, #1A8BC4 100%); border-radius: 8px;">
+            <a href="{sf_intel_url}" target="_blank" style="color: white; text-decoration: none; font-weight: 600; font-size: 1rem;">
+                ❄️ Ask these questions in Snowflake Intelligence →
+            </a>
+        </div>
+        """, unsafe_allow_html=True)
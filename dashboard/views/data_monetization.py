@@ -0,0 +1,1069 @@
+"""Data Monetization & Sharing page."""
+
+import streamlit as st
+import streamlit.components.v1 as components
+import pandas as pd
+import altair as alt
+
+from dashboard import charts
+
+
+def render_data_monetization():
+    st.markdown("""
+    <div class="main-header">
+        <h1>Data Monetization & Data Sharing</h1>
+        <p>Unlocking Value from Telco Data Assets — Powered by Snowflake Data Cloud</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Dashboard Tabs
+    tab_overview, tab_strategy = st.tabs(["📊 Overview & Analysis", "🎯 Strategy & Priorities"])
+
+    with tab_overview:
+        
+        # DATA MONETIZATION - VALUE STREAM ANIMATION
+        st.markdown("""<div class="monetization-hero"><div class="hero-content"><div class="value-display"><div class="value-amount">£38.6M</div><div class="value-label">Annual Data Revenue</div></div><div class="coin-rain"><span class="coin" style="left:10px;animation-delay:0s">💰</span><span class="coin" style="left:30px;animation-delay:0.3s">💎</span><span class="coin" style="left:50px;animation-delay:0.6s">💰</span><span class="coin" style="left:20px;animation-delay:0.9s">💎</span><span class="coin" style="left:40px;animation-delay:1.2s">💰</span></div><div class="data-sources"><div class="source-card"><div class="source-icon">📱</div><div class="source-name">Mobility Data</div><div class="source-val">£12.4M</div></div><div class="source-card"><div class="source-icon">📊</div><div class="source-name">Analytics</div><div class="source-val">£9.8M</div></div><div class="source-card"><div class="source-icon">📍</div><div class="source-name">Location Intel</div><div class="source-val">£8.2M</div></div><div class="source-card"><div class="source-icon">🎯</div><div class="source-name">Audience</div><div class="source-val">£8.2M</div></div></div></div></div>""", unsafe_allow_html=True)
+        
+        # Create tabs
+        tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs([
+            "📊 Monetization Overview",
+            "📦 Data Products",
+            "🔗 Data Sharing Architecture",
+            "👥 Customer Intelligence",
+            "📡 Network Data Products",
+            "🤝 Partner Ecosystem",
+            "🌍 Cross-Industry Use Cases"
+        ])
+        
+        # ==================== TAB 1: MONETIZATION OVERVIEW ====================
+        with tab1:
+            st.markdown('<div class="section-header">Data Monetization Performance</div>', unsafe_allow_html=True)
+            
+            if st.session_state.get('sf_highlights', True):
+                st.info("❄️ **Powered by Snowflake Marketplace & Data Sharing** — Secure data monetization via Snowflake Data Clean Rooms, Private Listings, and Native App Framework")
+            
+            # Top KPIs
+            kpi_cols = st.columns(5)
+            kpis = [
+                ("£38.6M", "Annual Data Revenue", "+22.4%", "green"),
+                ("18", "Active Data Products", "+4", "green"),
+                ("86", "Data Partners", "+18", "green"),
+                ("1.8B", "API Calls/Month", "+28%", "green"),
+                ("£2.85", "Revenue per 1K Records", "+12%", "green")
+            ]
+            for col, (value, label, delta, color) in zip(kpi_cols, kpis):
+                with col:
+                    with st.container(border=True):
+                        st.metric(label, value, delta)
+            
+            # Revenue Trends
+            st.markdown("---")
+            rev_col1, rev_col2 = st.columns(2)
+            
+            with rev_col1:
+                st.markdown("**Data Revenue by Category (Monthly Trend)**")
+                with st.container(border=True):
+                    months = ['Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                    revenue_data = pd.DataFrame({
+                        'Month': months * 4,
+                        'Category': ['Customer Insights']*7 + ['Network Data']*7 + ['Location Intelligence']*7 + ['Partner Data']*7,
+                        'Revenue': [1.2, 1.4, 1.5, 1.8, 2.0, 2.2, 2.4,
+                                   0.8, 0.9, 1.0, 1.1, 1.2, 1.4, 1.5,
+                                   0.5, 0.6, 0.7, 0.8, 0.9, 1.0, 1.1,
+                                   0.3, 0.4, 0.4, 0.5, 0.6, 0.7, 0.8],
+                        'MonthOrder': [1,2,3,4,5,6,7]*4
+                    })
+                    chart = alt.Chart(revenue_data).mark_area(opacity=0.7).encode(
+                        x=alt.X('Month:N', sort=['Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan'], title=None),
+                        y=alt.Y('Revenue:Q', title='Revenue ($M)', stack='zero'),
+                        color=alt.Color('Category:N', scale=alt.Scale(scheme='tableau10')),
+                        tooltip=['Category', 'Month', 'Revenue']
+                    ).properties(height=250)
+                    charts.altair_chart(chart, use_container_width=True)
+            
+            with rev_col2:
+                st.markdown("**Revenue Mix by Data Type**")
+                with st.container(border=True):
+                    st.markdown("""
+                    <div style="display: flex; flex-direction: column; gap: 0.75rem; padding: 0.5rem;">
+                        <div>
+                            <div style="display: flex; justify-content: space-between; margin-bottom: 0.3rem;">
+                                <span style="font-weight: 500;">Customer Insights</span>
+                                <span style="font-weight: 600; color: #29B5E8;">£14.8M (38%)</span>
+                            </div>
+                            <div style="background: #E5E7EB; border-radius: 4px; height: 12px;">
+                                <div style="background: #29B5E8; width: 38%; height: 100%; border-radius: 4px;"></div>
+                            </div>
+                        </div>
+                        <div>
+                            <div style="display: flex; justify-content: space-between; margin-bottom: 0.3rem;">
+                                <span style="font-weight: 500;">Network Intelligence</span>
+                                <span style="font-weight: 600; color: #10B981;">£10.4M (27%)</span>
+                            </div>
+                            <div style="background: #E5E7EB; border-radius: 4px; height: 12px;">
+                                <div style="background: #10B981; width: 27%; height: 100%; border-radius: 4px;"></div>
+                            </div>
+                        </div>
+                        <div>
+                            <div style="display: flex; justify-content: space-between; margin-bottom: 0.3rem;">
+                                <span style="font-weight: 500;">Location Data</span>
+                                <span style="font-weight: 600; color: #8B5CF6;">£7.7M (20%)</span>
+                            </div>
+                            <div style="background: #E5E7EB; border-radius: 4px; height: 12px;">
+                                <div style="background: #8B5CF6; width: 20%; height: 100%; border-radius: 4px;"></div>
+                            </div>
+                        </div>
+                        <div>
+                            <div style="display: flex; justify-content: space-between; margin-bottom: 0.3rem;">
+                                <span style="font-weight: 500;">Partner/B2B Data</span>
+                                <span style="font-weight: 600; color: #F59E0B;">£5.7M (15%)</span>
+                            </div>
+                            <div style="background: #E5E7EB; border-radius: 4px; height: 12px;">
+                                <div style="background: #F59E0B; width: 15%; height: 100%; border-radius: 4px;"></div>
+                            </div>
+                        </div>
+                    </div>
+                    """, unsafe_allow_html=True)
+            
+            # Top Products
+            st.markdown("**Top Performing Data Products**")
+            top_products = pd.DataFrame({
+                'Product': ['Customer Propensity Scores', 'Network Coverage API', 'Audience Segments', 'Location Footfall', 'Churn Risk Indicators'],
+                'Category': ['Customer Intelligence', 'Network Data', 'Customer Intelligence', 'Location Data', 'Customer Intelligence'],
+                'Subscribers': [48, 32, 28, 24, 21],
+                'Monthly Revenue': ['£420K', '£380K', '£320K', '£290K', '£245K'],
+                'Growth': ['+24%', '+18%', '+32%', '+15%', '+28%'],
+                'Status': ['✅ Active', '✅ Active', '✅ Active', '✅ Active', '✅ Active']
+            })
+            st.dataframe(top_products, use_container_width=True, hide_index=True)
+        
+        # ==================== TAB 2: DATA PRODUCTS ====================
+        with tab2:
+            st.markdown('<div class="section-header">Data Products Catalog</div>', unsafe_allow_html=True)
+            
+            # Product Categories
+            cat_cols = st.columns(4)
+            categories = [
+                ("Customer Intelligence", "6 Products", "£14.8M ARR", "#29B5E8"),
+                ("Network & Coverage", "5 Products", "£10.4M ARR", "#10B981"),
+                ("Location & Mobility", "4 Products", "£7.7M ARR", "#8B5CF6"),
+                ("Partner & B2B", "3 Products", "£5.7M ARR", "#F59E0B")
+            ]
+            for col, (name, count, revenue, color) in zip(cat_cols, categories):
+                with col:
+                    with st.container(border=True):
+                        st.markdown(f"**{name}**")
+                        st.metric(count, revenue)
+            
+            st.markdown("---")
+            
+            # Full Product Catalog
+            st.markdown("**Complete Product Catalog**")
+            products_df = pd.DataFrame({
+                'Product Name': [
+                    'Customer Propensity Scores', 'Churn Risk API', 'CLV Predictions', 'Audience Segments',
+                    'Network Coverage Maps', 'QoE Benchmarks', '5G Availability Index', 'Cell Site Analytics',
+                    'Footfall Analytics', 'Mobility Patterns', 'Geo-Demographics', 'POI Insights',
+                    'MVNO Benchmarks', 'Wholesale Analytics', 'B2B Firmographics', 'IoT Device Insights'
+                ],
+                'Category': [
+                    'Customer', 'Customer', 'Customer', 'Customer',
+                    'Network', 'Network', 'Network', 'Network',
+                    'Location', 'Location', 'Location', 'Location',
+                    'Partner', 'Partner', 'Partner', 'Partner'
+                ],
+                'Delivery': [
+                    'API + Share', 'API', 'Data Share', 'Clean Room',
+                    'API + Share', 'Data Share', 'API', 'Data Share',
+                    'Clean Room', 'API', 'Data Share', 'API',
+                    'Data Share', 'Data Share', 'Clean Room', 'API'
+                ],
+                'Pricing Model': [
+                    'Per 1K records', 'Per API call', 'Monthly flat', 'Per query',
+                    'Monthly flat', 'Per 1K records', 'Per API call', 'Monthly flat',
+                    'Per query', 'Per 1K records', 'Monthly flat', 'Per API call',
+                    'Revenue share', 'Monthly flat', 'Per query', 'Per device'
+                ],
+                'Price': [
+                    '£2.50', '£0.005', '£15,000', '£0.02',
+                    '£8,500', '£1.80', '£0.008', '£12,000',
+                    '£0.03', '£3.20', '£6,500', '£0.012',
+                    '12%', '£18,000', '£0.025', '£0.50'
+                ],
+                'Active Subscribers': [48, 42, 38, 28, 32, 24, 45, 18, 24, 32, 22, 28, 8, 6, 14, 36],
+                'MRR': ['£42K', '£38K', '£38K', '£32K', '£38K', '£28K', '£24K', '£22K', '£29K', '£26K', '£22K', '£18K', '£48K', '£18K', '£24K', '£28K']
+            })
+            st.dataframe(products_df, use_container_width=True, hide_index=True)
+            
+            # Product Performance
+            st.markdown("---")
+            perf_col1, perf_col2 = st.columns(2)
+            
+            with perf_col1:
+                st.markdown("**Subscriber Growth by Category**")
+                with st.container(border=True):
+                    growth_data = pd.DataFrame({
+                        'Month': ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan'] * 4,
+                        'Category': ['Customer']*6 + ['Network']*6 + ['Location']*6 + ['Partner']*6,
+                        'Subscribers': [120, 128, 135, 142, 148, 156,
+                                       85, 92, 98, 105, 112, 119,
+                                       62, 68, 74, 78, 84, 91,
+                                       42, 45, 48, 52, 58, 64],
+                        'MonthOrder': [1,2,3,4,5,6]*4
+                    })
+                    chart = alt.Chart(growth_data).mark_line(point=True, strokeWidth=2).encode(
+                        x=alt.X('Month:N', sort=['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan'], title=None),
+                        y=alt.Y('Subscribers:Q', title='Total Subscribers'),
+                        color=alt.Color('Category:N', scale=alt.Scale(scheme='tableau10')),
+                        tooltip=['Category', 'Month', 'Subscribers']
+                    ).properties(height=220)
+                    charts.altair_chart(chart, use_container_width=True)
+            
+            with perf_col2:
+                st.markdown("**API Usage (Last 30 Days)**")
+                with st.container(border=True):
+                    api_data = pd.DataFrame({
+                        'API': ['Propensity API', 'Coverage API', 'Churn API', 'Location API', 'Segments API'],
+                        'Calls': [842, 724, 612, 548, 423],
+                        'Percentage': [24.8, 21.3, 18.0, 16.1, 12.5]
+                    })
+                    st.markdown("""
+                    <div style="font-size: 0.85rem;">
+                        <div style="margin-bottom: 0.75rem;">
+                            <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                                <span>Propensity API</span><span style="font-weight: 600;">842M calls</span>
+                            </div>
+                            <div style="background: #E5E7EB; border-radius: 4px; height: 10px;">
+                                <div style="background: #29B5E8; width: 100%; height: 100%; border-radius: 4px;"></div>
+                            </div>
+                        </div>
+                        <div style="margin-bottom: 0.75rem;">
+                            <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                                <span>Coverage API</span><span style="font-weight: 600;">724M calls</span>
+                            </div>
+                            <div style="background: #E5E7EB; border-radius: 4px; height: 10px;">
+                                <div style="background: #10B981; width: 86%; height: 100%; border-radius: 4px;"></div>
+                            </div>
+                        </div>
+                        <div style="margin-bottom: 0.75rem;">
+                            <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                                <span>Churn API</span><span style="font-weight: 600;">612M calls</span>
+                            </div>
+                            <div style="background: #E5E7EB; border-radius: 4px; height: 10px;">
+                                <div style="background: #8B5CF6; width: 73%; height: 100%; border-radius: 4px;"></div>
+                            </div>
+                        </div>
+                        <div style="margin-bottom: 0.75rem;">
+                            <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                                <span>Location API</span><span style="font-weight: 600;">548M calls</span>
+                            </div>
+                            <div style="background: #E5E7EB; border-radius: 4px; height: 10px;">
+                                <div style="background: #F59E0B; width: 65%; height: 100%; border-radius: 4px;"></div>
+                            </div>
+                        </div>
+                        <div>
+                            <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                                <span>Segments API</span><span style="font-weight: 600;">423M calls</span>
+                            </div>
+                            <div style="background: #E5E7EB; border-radius: 4px; height: 10px;">
+                                <div style="background: #EF4444; width: 50%; height: 100%; border-radius: 4px;"></div>
+                            </div>
+                        </div>
+                    </div>
+                    """, unsafe_allow_html=True)
+        
+        # ==================== TAB 3: DATA SHARING ARCHITECTURE ====================
+        with tab3:
+            st.markdown('<div class="section-header">Snowflake Data Sharing Architecture</div>', unsafe_allow_html=True)
+            
+            # Sharing Overview KPIs
+            share_kpis = st.columns(5)
+            share_metrics = [
+                ("48", "Active Data Shares", "Direct shares"),
+                ("12", "Marketplace Listings", "Public products"),
+                ("6", "Clean Rooms", "Privacy-preserving"),
+                ("3", "Private Exchanges", "Controlled access"),
+                ("142", "Connected Partners", "Total consumers")
+            ]
+            for col, (val, label, desc) in zip(share_kpis, share_metrics):
+                with col:
+                    with st.container(border=True):
+                        st.metric(label, val)
+                        st.caption(desc)
+            
+            st.markdown("---")
+            
+            # Data Sharing Types Architecture
+            st.markdown("**Snowflake Data Sharing Methods**")
+            
+            share_cols = st.columns(4)
+            
+            with share_cols[0]:
+                with st.container(border=True):
+                    st.markdown("### 🔗 Direct Data Shares")
+                    st.markdown("**Point-to-Point Sharing**")
+                    st.caption("Real-time, zero-copy data sharing directly with specific Snowflake accounts")
+                    st.markdown("---")
+                    st.markdown("**Use Cases:**")
+                    st.markdown("- MVNO partner data feeds")
+                    st.markdown("- Enterprise customer dashboards")
+                    st.markdown("- Regulatory reporting")
+                    st.markdown("---")
+                    st.metric("Active Shares", "48")
+                    st.metric("Partners", "32")
+            
+            with share_cols[1]:
+                with st.container(border=True):
+                    st.markdown("### 🏪 Snowflake Marketplace")
+                    st.markdown("**Public Data Products**")
+                    st.caption("List and sell data products to any Snowflake customer globally")
+                    st.markdown("---")
+                    st.markdown("**Listed Products:**")
+                    st.markdown("- Coverage Maps API")
+                    st.markdown("- Network QoE Benchmarks")
+                    st.markdown("- Mobility Patterns")
+                    st.markdown("---")
+                    st.metric("Listings", "12")
+                    st.metric("Subscribers", "89")
+            
+            with share_cols[2]:
+                with st.container(border=True):
+                    st.markdown("### 🔒 Data Clean Rooms")
+                    st.markdown("**Privacy-Preserving Analytics**")
+                    st.caption("Secure collaboration without exposing raw data")
+                    st.markdown("---")
+                    st.markdown("**Active Clean Rooms:**")
+                    st.markdown("- Advertiser overlap analysis")
+                    st.markdown("- Cross-industry insights")
+                    st.markdown("- Attribution modeling")
+                    st.markdown("---")
+                    st.metric("Clean Rooms", "6")
+                    st.metric("Queries/Month", "2.4K")
+            
+            with share_cols[3]:
+                with st.container(border=True):
+                    st.markdown("### 🏢 Private Data Exchange")
+                    st.markdown("**Controlled Access Hub**")
+                    st.caption("Curated data marketplace for approved partners only")
+                    st.markdown("---")
+                    st.markdown("**Exchange Members:**")
+                    st.markdown("- Tier 1 enterprise partners")
+                    st.markdown("- Government agencies")
+                    st.markdown("- Research institutions")
+                    st.markdown("---")
+                    st.metric("Exchanges", "3")
+                    st.metric("Members", "21")
+            
+            # Data Sharing Architecture Diagram
+            st.markdown("---")
+            st.markdown("**Data Sharing Flow Architecture**")
+            
+            import graphviz
+            
+            sharing_arch = graphviz.Digraph('sharing_architecture')
+            sharing_arch.attr(rankdir='LR', bgcolor='transparent', compound='true')
+            sharing_arch.attr('node', shape='box', style='rounded,filled', fontname='Inter', fontsize='10')
+            
+            # Data Sources cluster
+            with sharing_arch.subgraph(name='cluster_sources') as c:
+                c.attr(label='SnowTelco Data Assets', style='rounded', bgcolor='#E0F2FE')
+                c.node('cust_data', 'Customer\nData', fillcolor='#29B5E8', fontcolor='white')
+                c.node('network_data', 'Network\nData', fillcolor='#29B5E8', fontcolor='white')
+                c.node('location_data', 'Location\nData', fillcolor='#29B5E8', fontcolor='white')
+                c.node('partner_data', 'Partner\nData', fillcolor='#29B5E8', fontcolor='white')
+            
+            # Snowflake Platform
+            with sharing_arch.subgraph(name='cluster_snowflake') as c:
+                c.attr(label='Snowflake Data Cloud', style='rounded', bgcolor='#F0FDF4')
+                c.node('secure_views', 'Secure Views\n& Policies', fillcolor='#10B981', fontcolor='white')
+                c.node('governance', 'Access Control\n& Governance', fillcolor='#10B981', fontcolor='white')
+            
+            # Sharing Methods
+            with sharing_arch.subgraph(name='cluster_sharing') as c:
+                c.attr(label='Sharing Methods', style='rounded', bgcolor='#FEF3C7')
+                c.node('direct', 'Direct\nShares', fillcolor='#F59E0B', fontcolor='white')
+                c.node('marketplace', 'Marketplace\nListings', fillcolor='#F59E0B', fontcolor='white')
+                c.node('cleanroom', 'Clean\nRooms', fillcolor='#F59E0B', fontcolor='white')
+                c.node('exchange', 'Private\nExchange', fillcolor='#F59E0B', fontcolor='white')
+            
+            # Consumers
+            with sharing_arch.subgraph(name='cluster_consumers') as c:
+                c.attr(label='Data Consumers', style='rounded', bgcolor='#F3E8FF')
+                c.node('mvno', 'MVNO\nPartners', fillcolor='#8B5CF6', fontcolor='white')
+                c.node('enterprise', 'Enterprise\nCustomers', fillcolor='#8B5CF6', fontcolor='white')
+                c.node('advertisers', 'Advertisers\n& Media', fillcolor='#8B5CF6', fontcolor='white')
+                c.node('gov', 'Government\n& Research', fillcolor='#8B5CF6', fontcolor='white')
+            
+            # Edges
+            sharing_arch.edge('cust_data', 'secure_views')
+            sharing_arch.edge('network_data', 'secure_views')
+            sharing_arch.edge('location_data', 'secure_views')
+            sharing_arch.edge('partner_data', 'secure_views')
+            
+            sharing_arch.edge('secure_views', 'governance')
+            
+            sharing_arch.edge('governance', 'direct')
+            sharing_arch.edge('governance', 'marketplace')
+            sharing_arch.edge('governance', 'cleanroom')
+            sharing_arch.edge('governance', 'exchange')
+            
+            sharing_arch.edge('direct', 'mvno')
+            sharing_arch.edge('direct', 'enterprise')
+            sharing_arch.edge('marketplace', 'enterprise')
+            sharing_arch.edge('marketplace', 'advertisers')
+            sharing_arch.edge('cleanroom', 'advertisers')
+            sharing_arch.edge('exchange', 'gov')
+            
+            st.graphviz_chart(sharing_arch, use_container_width=True)
+            
+            # Active Shares Table
+            st.markdown("---")
+            st.markdown("**Active Data Shares Inventory**")
+            
+            shares_df = pd.DataFrame({
+                'Share Name': ['MVNO_Partner_Feed', 'Enterprise_Dashboard', 'Marketplace_Coverage', 'CleanRoom_MediaCo', 'Regulatory_Reporting', 'Research_Academic'],
+                'Type': ['Direct Share', 'Direct Share', 'Marketplace', 'Clean Room', 'Direct Share', 'Private Exchange'],
+                'Consumer': ['VirginMedia, Sky Mobile', 'Vodafone Enterprise', 'Public (89 subscribers)', 'WPP, Publicis, Omnicom', 'Ofcom, FCA', 'UCL, Imperial, Oxford'],
+                'Data Products': ['Usage, Billing, Network KPIs', 'Customer 360, Support Tickets', 'Coverage Maps, QoE Index', 'Audience Segments, Attribution', 'Compliance Reports, CDRs', 'Anonymized Network Data'],
+                'Records Shared': ['142M/day', '2.4M/day', '50M static', '12M/query', '8M/month', '500M static'],
+                'Revenue/Month': ['£124,000', '£48,000', '£86,000', '£52,000', 'Regulatory', '£18,000'],
+                'Status': ['✅ Active', '✅ Active', '✅ Active', '✅ Active', '✅ Active', '✅ Active']
+            })
+            st.dataframe(shares_df, use_container_width=True, hide_index=True)
+        
+        # ==================== TAB 4: CUSTOMER INTELLIGENCE ====================
+        with tab4:
+            st.markdown('<div class="section-header">Customer Intelligence Monetization</div>', unsafe_allow_html=True)
+            
+            # Customer Data Products
+            cust_kpis = st.columns(4)
+            cust_metrics = [
+                ("8.2M", "Customer Profiles", "Enriched & scored"),
+                ("6", "Intelligence Products", "In market"),
+                ("£14.8M", "Annual Revenue", "+24% YoY"),
+                ("92", "Active Subscribers", "+18 this quarter")
+            ]
+            for col, (val, label, desc) in zip(cust_kpis, cust_metrics):
+                with col:
+                    with st.container(border=True):
+                        st.metric(label, val)
+                        st.caption(desc)
+            
+            st.markdown("---")
+            cust_col1, cust_col2 = st.columns(2)
+            
+            with cust_col1:
+                st.markdown("**Customer Intelligence Products**")
+                with st.container(border=True):
+                    st.markdown("**Propensity Scores** &nbsp;&nbsp; <span style='color: #10B981;'>● Live</span>", unsafe_allow_html=True)
+                    st.caption("Churn, Upsell, Cross-sell propensity scores • Updated daily")
+                    st.progress(0.92)
+                    st.caption("92% model accuracy • 48 subscribers • £420K MRR")
+                    st.divider()
+                    st.markdown("**Audience Segments** &nbsp;&nbsp; <span style='color: #10B981;'>● Live</span>", unsafe_allow_html=True)
+                    st.caption("500+ pre-built segments • Custom segment builder")
+                    st.progress(0.88)
+                    st.caption("88% match rate • 28 subscribers • £320K MRR")
+                    st.divider()
+                    st.markdown("**CLV Predictions** &nbsp;&nbsp; <span style='color: #10B981;'>● Live</span>", unsafe_allow_html=True)
+                    st.caption("Customer lifetime value forecasts • 3, 6, 12 month horizons")
+                    st.progress(0.87)
+                    st.caption("87% accuracy • 38 subscribers • £380K MRR")
+                    st.divider()
+                    st.markdown("**Churn Risk API** &nbsp;&nbsp; <span style='color: #10B981;'>● Live</span>", unsafe_allow_html=True)
+                    st.caption("Real-time churn scoring via REST API")
+                    st.progress(0.94)
+                    st.caption("94% AUC-ROC • 42 subscribers • £380K MRR")
+            
+            with cust_col2:
+                st.markdown("**Privacy & Compliance Framework**")
+                with st.container(border=True):
+                    st.markdown("**Data Anonymization**")
+                    st.markdown("- k-anonymity (k=50) for all shared datasets")
+                    st.markdown("- Differential privacy for aggregate statistics")
+                    st.markdown("- PII tokenization with secure vaults")
+                    st.divider()
+                    st.markdown("**Consent Management**")
+                    st.markdown("- GDPR Article 6 legal basis tracking")
+                    st.markdown("- Opt-out propagation across all products")
+                    st.markdown("- Purpose limitation enforcement")
+                    st.divider()
+                    st.markdown("**Audit & Governance**")
+                    st.markdown("- Complete data lineage tracking")
+                    st.markdown("- Access logging for all queries")
+                    st.markdown("- Automated compliance reporting")
+            
+            # Segment Catalog
+            st.markdown("---")
+            st.markdown("**Pre-Built Audience Segments**")
+            segments_df = pd.DataFrame({
+                'Segment': ['High-Value Millennials', 'At-Risk Premium', 'Digital First', '5G Early Adopters', 'Family Plan Prospects', 'Business Switchers'],
+                'Size': ['1.2M', '842K', '2.4M', '680K', '1.8M', '420K'],
+                'Refresh': ['Daily', 'Real-time', 'Daily', 'Weekly', 'Daily', 'Daily'],
+                'Match Rate': ['94%', '92%', '96%', '88%', '91%', '89%'],
+                'Use Case': ['Upsell campaigns', 'Retention programs', 'App engagement', 'Network marketing', 'Bundle offers', 'Competitive wins'],
+                'Price/1K': ['£2.80', '£3.20', '£2.20', '£4.50', '£2.40', '£3.80']
+            })
+            st.dataframe(segments_df, use_container_width=True, hide_index=True)
+        
+        # ==================== TAB 5: NETWORK DATA PRODUCTS ====================
+        with tab5:
+            st.markdown('<div class="section-header">Network Data Monetization</div>', unsafe_allow_html=True)
+            
+            # Network Data KPIs
+            net_kpis = st.columns(4)
+            net_metrics = [
+                ("18K", "Cell Sites", "Coverage data"),
+                ("5", "Data Products", "In market"),
+                ("£10.4M", "Annual Revenue", "+18% YoY"),
+                ("74", "Active Subscribers", "+16 this quarter")
+            ]
+            for col, (val, label, desc) in zip(net_kpis, net_metrics):
+                with col:
+                    with st.container(border=True):
+                        st.metric(label, val)
+                        st.caption(desc)
+            
+            st.markdown("---")
+            
+            net_col1, net_col2 = st.columns(2)
+            
+            with net_col1:
+                st.markdown("**Network Data Products**")
+                with st.container(border=True):
+                    products = [
+                        ("Coverage Maps API", "Real-time 4G/5G coverage data by location", "£8,500/mo", "32 subs"),
+                        ("QoE Benchmarks", "Network quality metrics by region/operator", "£1.80/1K", "24 subs"),
+                        ("5G Availability Index", "5G rollout tracking and forecasts", "£0.008/call", "45 subs"),
+                        ("Cell Site Analytics", "Site performance and capacity metrics", "£12K/mo", "18 subs"),
+                        ("Spectrum Utilization", "Frequency band usage and efficiency", "£15K/mo", "12 subs"),
+                        ("Network Event Data", "Anonymized signaling and mobility events", "£2.40/1K", "28 subs")
+                    ]
+                    for name, desc, price, subs in products:
+                        st.markdown(f"**{name}**")
+                        st.caption(f"{desc}")
+                        st.markdown(f"💰 {price} • 👥 {subs}")
+                        st.divider()
+            
+            with net_col2:
+                st.markdown("**Coverage Data Applications**")
+                with st.container(border=True):
+                    st.markdown("""
+                    <div style="font-size: 0.9rem;">
+                        <div style="padding: 0.75rem; background: #F0FDF4; border-radius: 8px; margin-bottom: 0.75rem;">
+                            <strong style="color: #10B981;">🏢 Real Estate & Property</strong><br>
+                            <span style="color: #6B7280; font-size: 0.8rem;">Property valuations, connectivity scoring, site selection</span>
+                        </div>
+                        <div style="padding: 0.75rem; background: #EFF6FF; border-radius: 8px; margin-bottom: 0.75rem;">
+                            <strong style="color: #3B82F6;">🚗 Automotive & Fleet</strong><br>
+                            <span style="color: #6B7280; font-size: 0.8rem;">Connected car routing, fleet optimization, V2X planning</span>
+                        </div>
+                        <div style="padding: 0.75rem; background: #FEF3C7; border-radius: 8px; margin-bottom: 0.75rem;">
+                            <strong style="color: #F59E0B;">📱 App Developers</strong><br>
+                            <span style="color: #6B7280; font-size: 0.8rem;">Network-aware features, offline mode triggers, QoS adaptation</span>
+                        </div>
+                        <div style="padding: 0.75rem; background: #F3E8FF; border-radius: 8px; margin-bottom: 0.75rem;">
+                            <strong style="color: #8B5CF6;">🏛️ Government & Smart Cities</strong><br>
+                            <span style="color: #6B7280; font-size: 0.8rem;">Digital inclusion mapping, emergency services, infrastructure planning</span>
+                        </div>
+                        <div style="padding: 0.75rem; background: #FEE2E2; border-radius: 8px;">
+                            <strong style="color: #EF4444;">🏥 Healthcare & Emergency</strong><br>
+                            <span style="color: #6B7280; font-size: 0.8rem;">Telemedicine feasibility, ambulance routing, remote patient monitoring</span>
+                        </div>
+                    </div>
+                    """, unsafe_allow_html=True)
+            
+            # Location Intelligence
+            st.markdown("---")
+            st.markdown("**Location Intelligence Products**")
+            
+            loc_cols = st.columns(3)
+            with loc_cols[0]:
+                with st.container(border=True):
+                    st.markdown("### 📍 Footfall Analytics")
+                    st.metric("Subscribers", "24")
+                    st.metric("MRR", "£290K")
+                    st.caption("Anonymized visitor counts and dwell times for retail locations, venues, and POIs")
+            
+            with loc_cols[1]:
+                with st.container(border=True):
+                    st.markdown("### 🚶 Mobility Patterns")
+                    st.metric("Subscribers", "32")
+                    st.metric("MRR", "£260K")
+                    st.caption("Origin-destination flows, commute patterns, and population movement insights")
+            
+            with loc_cols[2]:
+                with st.container(border=True):
+                    st.markdown("### 🗺️ Geo-Demographics")
+                    st.metric("Subscribers", "22")
+                    st.metric("MRR", "£220K")
+                    st.caption("Population density, demographic profiles, and socioeconomic indicators by area")
+        
+        # ==================== TAB 6: PARTNER ECOSYSTEM ====================
+        with tab6:
+            st.markdown('<div class="section-header">Partner Data Ecosystem</div>', unsafe_allow_html=True)
+            
+            # 3D Globe - Global Data Sharing Network
+            components.html("""
+            <!DOCTYPE html>
+            <html>
+            <head>
+            <style>
+            * { margin: 0; padding: 0; box-sizing: border-box; }
+            body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; }
+            @keyframes globe-pulse { 0%, 100% { opacity: 0.6; } 50% { opacity: 1; } }
+            @keyframes connection-flow { 0% { stroke-dashoffset: 100; } 100% { stroke-dashoffset: 0; } }
+            @keyframes ping-ring { 0% { transform: scale(0.5); opacity: 1; } 100% { transform: scale(2); opacity: 0; } }
+            .globe-container {
+                background: linear-gradient(135deg, #0F172A 0%, #1E293B 100%);
+                border-radius: 16px;
+                padding: 1.5rem;
+                position: relative;
+                overflow: hidden;
+            }
+            .globe-header {
+                display: flex;
+                justify-content: space-between;
+                align-items: center;
+                margin-bottom: 1rem;
+            }
+            .globe-title { color: white; font-size: 1.1rem; font-weight: 600; }
+            .globe-live { display: flex; align-items: center; gap: 6px; color: #10B981; font-size: 0.8rem; }
+            .globe-live-dot { width: 8px; height: 8px; background: #10B981; border-radius: 50%; animation: globe-pulse 1.5s ease-in-out infinite; }
+            .globe-svg { width: 100%; height: 280px; }
+            .globe-base { fill: none; stroke: rgba(41, 181, 232, 0.3); stroke-width: 1; }
+            .globe-landmass { fill: rgba(41, 181, 232, 0.2); stroke: rgba(41, 181, 232, 0.5); stroke-width: 1; }
+            .globe-connection { stroke: #29B5E8; stroke-width: 2; stroke-dasharray: 100; animation: connection-flow 3s linear infinite; fill: none; }
+            .globe-partner { animation: globe-pulse 2s ease-in-out infinite; }
+            .globe-ping { animation: ping-ring 2s ease-out infinite; }
+            .globe-stats { display: flex; justify-content: space-around; margin-top: 1rem; padding-top: 1rem; border-top: 1px solid rgba(255,255,255,0.1); }
+            .globe-stat { text-align: center; }
+            .globe-stat-value { font-size: 1.3rem; font-weight: 700; color: #29B5E8; }
+            .globe-stat-label { font-size: 0.7rem; color: rgba(255,255,255,0.6); text-transform: uppercase; }
+            </style>
+            </head>
+            <body>
+            <div class="globe-container">
+                <div class="globe-header">
+                    <div class="globe-title">Global Data Sharing Network</div>
+                    <div class="globe-live"><div class="globe-live-dot"></div>Live Connections</div>
+                </div>
+                <svg class="globe-svg" viewBox="0 0 600 260">
+                    <ellipse cx="300" cy="130" rx="110" ry="110" class="globe-base"/>
+                    <ellipse cx="300" cy="130" rx="110" ry="40" class="globe-base"/>
+                    <ellipse cx="300" cy="130" rx="40" ry="110" class="globe-base"/>
+                    <ellipse cx="300" cy="130" rx="80" ry="80" class="globe-base"/>
+                    <path class="globe-landmass" d="M240,70 Q260,60 290,65 Q310,70 320,85 Q340,80 350,95 Q340,110 320,105 Q300,115 280,100 Q260,110 245,90 Z"/>
+                    <path class="globe-landmass" d="M320,130 Q340,125 360,135 Q380,130 390,150 Q385,170 365,175 Q345,180 330,165 Q315,155 320,140 Z"/>
+                    <path class="globe-landmass" d="M250,140 Q270,135 285,145 Q295,160 285,175 Q265,185 250,170 Q240,155 250,140 Z"/>
+                    <path class="globe-landmass" d="M215,100 Q235,95 240,115 Q235,130 220,130 Q205,125 210,110 Z"/>
+                    <circle cx="300" cy="80" r="8" fill="#29B5E8" class="globe-partner"/>
+                    <circle cx="300" cy="80" r="8" fill="none" stroke="#29B5E8" stroke-width="2" class="globe-ping"/>
+                    <text x="300" y="65" text-anchor="middle" fill="white" font-size="9" font-weight="600">UK HQ</text>
+                    <circle cx="380" cy="90" r="6" fill="#10B981" class="globe-partner" style="animation-delay: 0.3s;"/>
+                    <text x="395" y="85" fill="#10B981" font-size="8">Germany</text>
+                    <circle cx="420" cy="140" r="5" fill="#8B5CF6" class="globe-partner" style="animation-delay: 0.6s;"/>
+                    <text x="440" y="140" fill="#8B5CF6" font-size="8">UAE</text>
+                    <circle cx="250" cy="75" r="5" fill="#F59E0B" class="globe-partner" style="animation-delay: 0.9s;"/>
+                    <text x="230" y="68" fill="#F59E0B" font-size="8">Ireland</text>
+                    <circle cx="200" cy="110" r="6" fill="#EC4899" class="globe-partner" style="animation-delay: 1.2s;"/>
+                    <text x="175" y="105" fill="#EC4899" font-size="8">USA</text>
+                    <circle cx="360" cy="170" r="5" fill="#14B8A6" class="globe-partner" style="animation-delay: 1.5s;"/>
+                    <text x="375" y="180" fill="#14B8A6" font-size="8">India</text>
+                    <circle cx="430" cy="180" r="5" fill="#6366F1" class="globe-partner" style="animation-delay: 1.8s;"/>
+                    <text x="450" y="185" fill="#6366F1" font-size="8">Singapore</text>
+                    <path class="globe-connection" d="M300,80 Q340,60 380,90" style="animation-delay: 0s;"/>
+                    <path class="globe-connection" d="M300,80 Q370,100 420,140" style="animation-delay: 0.5s;"/>
+                    <path class="globe-connection" d="M300,80 Q275,70 250,75" style="animation-delay: 1s;"/>
+                    <path class="globe-connection" d="M300,80 Q250,85 200,110" style="animation-delay: 1.5s;"/>
+                    <path class="globe-connection" d="M300,80 Q340,130 360,170" style="animation-delay: 2s;"/>
+                    <path class="globe-connection" d="M300,80 Q380,140 430,180" style="animation-delay: 2.5s;"/>
+                    <circle r="3" fill="#29B5E8"><animateMotion dur="3s" repeatCount="indefinite" path="M300,80 Q340,60 380,90"/></circle>
+                    <circle r="3" fill="#29B5E8"><animateMotion dur="4s" repeatCount="indefinite" path="M300,80 Q370,100 420,140" begin="1s"/></circle>
+                    <circle r="3" fill="#29B5E8"><animateMotion dur="2.5s" repeatCount="indefinite" path="M300,80 Q250,85 200,110" begin="2s"/></circle>
+                    <rect x="30" y="30" width="100" height="80" rx="8" fill="rgba(255,255,255,0.05)" stroke="rgba(255,255,255,0.1)"/>
+                    <text x="80" y="55" text-anchor="middle" fill="rgba(255,255,255,0.6)" font-size="8">ACTIVE SHARES</text>
+                    <text x="80" y="80" text-anchor="middle" fill="#29B5E8" font-size="22" font-weight="700">86</text>
+                    <text x="80" y="100" text-anchor="middle" fill="#10B981" font-size="9">+12 this month</text>
+                    <rect x="470" y="30" width="110" height="90" rx="8" fill="rgba(255,255,255,0.05)" stroke="rgba(255,255,255,0.1)"/>
+                    <text x="525" y="50" text-anchor="middle" fill="rgba(255,255,255,0.6)" font-size="8">PARTNER TYPES</text>
+                    <text x="490" y="70" fill="#10B981" font-size="9">MVNOs: 6</text>
+                    <text x="490" y="85" fill="#8B5CF6" font-size="9">Analytics: 24</text>
+                    <text x="490" y="100" fill="#F59E0B" font-size="9">IoT: 18</text>
+                    <text x="490" y="115" fill="#EC4899" font-size="9">Enterprise: 38</text>
+                </svg>
+                <div class="globe-stats">
+                    <div class="globe-stat"><div class="globe-stat-value">5.7M</div><div class="globe-stat-label">Revenue YTD</div></div>
+                    <div class="globe-stat"><div class="globe-stat-value">12</div><div class="globe-stat-label">Countries</div></div>
+                    <div class="globe-stat"><div class="globe-stat-value">2.4TB</div><div class="globe-stat-label">Data Shared/Mo</div></div>
+                    <div class="globe-stat"><div class="globe-stat-value">99.9%</div><div class="globe-stat-label">SLA Compliance</div></div>
+                </div>
+            </div>
+            </body>
+            </html>
+            """, height=420, scrolling=False)
+            
+            # Partner KPIs
+            partner_kpis = st.columns(4)
+            partner_metrics = [
+                ("86", "Data Partners", "Connected accounts"),
+                ("6", "MVNOs", "Active data shares"),
+                ("£5.7M", "Partner Revenue", "+22% YoY"),
+                ("42", "B2B Subscribers", "+12 this quarter")
+            ]
+            for col, (val, label, desc) in zip(partner_kpis, partner_metrics):
+                with col:
+                    with st.container(border=True):
+                        st.metric(label, val)
+                        st.caption(desc)
+            
+            st.markdown("---")
+            
+            # MVNO Data Sharing
+            st.markdown("**MVNO Partner Data Feeds**")
+            mvno_df = pd.DataFrame({
+                'MVNO Partner': ['Virgin Media Mobile', 'Sky Mobile', 'Tesco Mobile', 'BT Mobile', 'Lebara', 'Lycamobile', 'giffgaff', 'VOXI'],
+                'Share Type': ['Direct Share', 'Direct Share', 'Direct Share', 'Direct Share', 'Direct Share', 'API', 'Direct Share', 'Direct Share'],
+                'Data Products': ['Full CDRs, Network KPIs, Billing', 'Usage, Coverage, Support', 'Usage, Billing, Retail', 'Full Suite', 'Usage, Top-ups, Roaming', 'Usage API, Coverage', 'Usage, Network, Community', 'Usage, Streaming Analytics'],
+                'Records/Day': ['42M', '38M', '24M', '18M', '12M', '8M', '15M', '10M'],
+                'Revenue Share': ['12%', '10%', '8%', '15%', '6%', '5%', '8%', '7%'],
+                'Monthly Revenue': ['£48K', '£42K', '£28K', '£38K', '£18K', '£12K', '£22K', '£16K'],
+                'Status': ['✅ Active', '✅ Active', '✅ Active', '✅ Active', '✅ Active', '✅ Active', '✅ Active', '✅ Active']
+            })
+            st.dataframe(mvno_df, use_container_width=True, hide_index=True)
+            
+            st.markdown("---")
+            
+            partner_col1, partner_col2 = st.columns(2)
+            
+            with partner_col1:
+                st.markdown("**B2B Data Products**")
+                with st.container(border=True):
+                    b2b_products = [
+                        ("Enterprise Firmographics", "Company profiles with telco usage patterns", "14 subscribers", "£24K MRR"),
+                        ("B2B Propensity Scores", "SMB/Enterprise acquisition propensity", "18 subscribers", "£32K MRR"),
+                        ("IoT Device Intelligence", "Connected device analytics & benchmarks", "36 subscribers", "£28K MRR"),
+                        ("Wholesale Benchmarks", "Interconnect and wholesale performance data", "6 subscribers", "£18K MRR")
+                    ]
+                    for name, desc, subs, revenue in b2b_products:
+                        st.markdown(f"**{name}**")
+                        st.caption(desc)
+                        st.markdown(f"👥 {subs} • 💰 {revenue}")
+                        st.divider()
+            
+            with partner_col2:
+                st.markdown("**Partner Revenue by Type**")
+                with st.container(border=True):
+                    st.markdown("""
+                    <div style="font-size: 0.85rem;">
+                        <div style="margin-bottom: 1rem;">
+                            <div style="display: flex; justify-content: space-between; margin-bottom: 0.3rem;">
+                                <span style="font-weight: 500;">MVNO Data Feeds</span>
+                                <span style="font-weight: 600; color: #29B5E8;">£2.2M (38%)</span>
+                            </div>
+                            <div style="background: #E5E7EB; border-radius: 4px; height: 14px;">
+                                <div style="background: #29B5E8; width: 38%; height: 100%; border-radius: 4px;"></div>
+                            </div>
+                        </div>
+                        <div style="margin-bottom: 1rem;">
+                            <div style="display: flex; justify-content: space-between; margin-bottom: 0.3rem;">
+                                <span style="font-weight: 500;">Enterprise/B2B Products</span>
+                                <span style="font-weight: 600; color: #10B981;">£2.2M (30%)</span>
+                            </div>
+                            <div style="background: #E5E7EB; border-radius: 4px; height: 14px;">
+                                <div style="background: #10B981; width: 30%; height: 100%; border-radius: 4px;"></div>
+                            </div>
+                        </div>
+                        <div style="margin-bottom: 1rem;">
+                            <div style="display: flex; justify-content: space-between; margin-bottom: 0.3rem;">
+                                <span style="font-weight: 500;">Wholesale Analytics</span>
+                                <span style="font-weight: 600; color: #8B5CF6;">£1.4M (19%)</span>
+                            </div>
+                            <div style="background: #E5E7EB; border-radius: 4px; height: 14px;">
+                                <div style="background: #8B5CF6; width: 19%; height: 100%; border-radius: 4px;"></div>
+                            </div>
+                        </div>
+                        <div>
+                            <div style="display: flex; justify-content: space-between; margin-bottom: 0.3rem;">
+                                <span style="font-weight: 500;">IoT/Connected Devices</span>
+                                <span style="font-weight: 600; color: #F59E0B;">£1.0M (13%)</span>
+                            </div>
+                            <div style="background: #E5E7EB; border-radius: 4px; height: 14px;">
+                                <div style="background: #F59E0B; width: 13%; height: 100%; border-radius: 4px;"></div>
+                            </div>
+                        </div>
+                    </div>
+                    """, unsafe_allow_html=True)
+        
+        # ==================== TAB 7: CROSS-INDUSTRY USE CASES ====================
+        with tab7:
+            st.markdown('<div class="section-header">Telco Data Monetization — Cross-Industry Use Cases</div>', unsafe_allow_html=True)
+            
+            st.markdown("""
+            <div style="background: #F8FAFC; border-radius: 12px; padding: 1.5rem; margin-bottom: 1.5rem; border: 1px solid #E2E8F0;">
+                <div style="text-align: center;">
+                    <div style="font-size: 1.3rem; font-weight: 600; margin-bottom: 0.5rem; color: #1B2A4E;">Unlocking Value Across Industries</div>
+                    <div style="font-size: 0.9rem; color: #64748B;">Telco data assets — mobility, location, network quality, and customer insights — create unique value propositions for diverse industries</div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            # Row 1: Retail, Financial Services, Advertising
+            row1 = st.columns(3)
+            
+            with row1[0]:
+                st.markdown("""
+                <div style="background: white; border: 1px solid #E5E7EB; border-radius: 12px; padding: 1.25rem; height: 320px;">
+                    <div style="display: flex; align-items: center; margin-bottom: 1rem;">
+                        <div style="background: #FEF3C7; width: 48px; height: 48px; border-radius: 10px; display: flex; align-items: center; justify-content: center; font-size: 1.5rem;">🛍️</div>
+                        <div style="margin-left: 0.75rem;">
+                            <div style="font-weight: 700; color: #1B2A4E; font-size: 1.1rem;">Retail & Real Estate</div>
+                            <div style="font-size: 0.75rem; color: #6B7280;">Site Selection & Customer Analytics</div>
+                        </div>
+                    </div>
+                    <div style="font-size: 0.85rem; color: #374151; line-height: 1.6;">
+                        <p style="margin-bottom: 0.75rem;"><strong>Footfall Analytics:</strong> Understand store visitor patterns, dwell time, and peak hours using anonymised mobility data.</p>
+                        <p style="margin-bottom: 0.75rem;"><strong>Catchment Analysis:</strong> Map where customers travel from to optimise store locations and marketing spend.</p>
+                        <p><strong>Competitive Intelligence:</strong> Benchmark foot traffic against competitors in the same retail park or high street.</p>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with row1[1]:
+                st.markdown("""
+                <div style="background: white; border: 1px solid #E5E7EB; border-radius: 12px; padding: 1.25rem; height: 320px;">
+                    <div style="display: flex; align-items: center; margin-bottom: 1rem;">
+                        <div style="background: #DBEAFE; width: 48px; height: 48px; border-radius: 10px; display: flex; align-items: center; justify-content: center; font-size: 1.5rem;">🏦</div>
+                        <div style="margin-left: 0.75rem;">
+                            <div style="font-weight: 700; color: #1B2A4E; font-size: 1.1rem;">Financial Services</div>
+                            <div style="font-size: 0.75rem; color: #6B7280;">Risk Assessment & Fraud Prevention</div>
+                        </div>
+                    </div>
+                    <div style="font-size: 0.85rem; color: #374151; line-height: 1.6;">
+                        <p style="margin-bottom: 0.75rem;"><strong>Alternative Credit Scoring:</strong> Use mobile top-up patterns and payment history for thin-file customers.</p>
+                        <p style="margin-bottom: 0.75rem;"><strong>Identity Verification:</strong> Confirm customer identity using SIM ownership and device binding data.</p>
+                        <p><strong>Fraud Detection:</strong> Detect anomalous location patterns that indicate potential fraud or account takeover.</p>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with row1[2]:
+                st.markdown("""
+                <div style="background: white; border: 1px solid #E5E7EB; border-radius: 12px; padding: 1.25rem; height: 320px;">
+                    <div style="display: flex; align-items: center; margin-bottom: 1rem;">
+                        <div style="background: #FCE7F3; width: 48px; height: 48px; border-radius: 10px; display: flex; align-items: center; justify-content: center; font-size: 1.5rem;">📺</div>
+                        <div style="margin-left: 0.75rem;">
+                            <div style="font-weight: 700; color: #1B2A4E; font-size: 1.1rem;">Advertising & Media</div>
+                            <div style="font-size: 0.75rem; color: #6B7280;">Audience Targeting & Attribution</div>
+                        </div>
+                    </div>
+                    <div style="font-size: 0.85rem; color: #374151; line-height: 1.6;">
+                        <p style="margin-bottom: 0.75rem;"><strong>Audience Segments:</strong> Build privacy-safe segments based on demographics, interests, and behaviours.</p>
+                        <p style="margin-bottom: 0.75rem;"><strong>Campaign Attribution:</strong> Measure real-world store visits after exposure to digital advertising.</p>
+                        <p><strong>Clean Room Analytics:</strong> Enable advertisers to match and analyse without exposing raw customer data.</p>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            # Row 2: Transportation, Government, Healthcare
+            row2 = st.columns(3)
+            
+            with row2[0]:
+                st.markdown("""
+                <div style="background: white; border: 1px solid #E5E7EB; border-radius: 12px; padding: 1.25rem; height: 320px;">
+                    <div style="display: flex; align-items: center; margin-bottom: 1rem;">
+                        <div style="background: #D1FAE5; width: 48px; height: 48px; border-radius: 10px; display: flex; align-items: center; justify-content: center; font-size: 1.5rem;">🚗</div>
+                        <div style="margin-left: 0.75rem;">
+                            <div style="font-weight: 700; color: #1B2A4E; font-size: 1.1rem;">Transport & Logistics</div>
+                            <div style="font-size: 0.75rem; color: #6B7280;">Route Optimisation & Traffic Analytics</div>
+                        </div>
+                    </div>
+                    <div style="font-size: 0.85rem; color: #374151; line-height: 1.6;">
+                        <p style="margin-bottom: 0.75rem;"><strong>Traffic Flow Analysis:</strong> Real-time and historical traffic patterns from anonymised device movement data.</p>
+                        <p style="margin-bottom: 0.75rem;"><strong>Fleet Optimisation:</strong> Optimise delivery routes based on network coverage and congestion patterns.</p>
+                        <p><strong>Connected Vehicle Services:</strong> Enable V2X applications with real-time network quality and coverage data.</p>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with row2[1]:
+                st.markdown("""
+                <div style="background: white; border: 1px solid #E5E7EB; border-radius: 12px; padding: 1.25rem; height: 320px;">
+                    <div style="display: flex; align-items: center; margin-bottom: 1rem;">
+                        <div style="background: #E0E7FF; width: 48px; height: 48px; border-radius: 10px; display: flex; align-items: center; justify-content: center; font-size: 1.5rem;">🏛️</div>
+                        <div style="margin-left: 0.75rem;">
+                            <div style="font-weight: 700; color: #1B2A4E; font-size: 1.1rem;">Government & Smart Cities</div>
+                            <div style="font-size: 0.75rem; color: #6B7280;">Urban Planning & Public Services</div>
+                        </div>
+                    </div>
+                    <div style="font-size: 0.85rem; color: #374151; line-height: 1.6;">
+                        <p style="margin-bottom: 0.75rem;"><strong>Population Dynamics:</strong> Understand population movement for transport and infrastructure planning.</p>
+                        <p style="margin-bottom: 0.75rem;"><strong>Digital Inclusion:</strong> Identify areas with poor connectivity to prioritise broadband investment.</p>
+                        <p><strong>Emergency Response:</strong> Support disaster response with real-time population density and evacuation patterns.</p>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with row2[2]:
+                st.markdown("""
+                <div style="background: white; border: 1px solid #E5E7EB; border-radius: 12px; padding: 1.25rem; height: 320px;">
+                    <div style="display: flex; align-items: center; margin-bottom: 1rem;">
+                        <div style="background: #FEE2E2; width: 48px; height: 48px; border-radius: 10px; display: flex; align-items: center; justify-content: center; font-size: 1.5rem;">🏥</div>
+                        <div style="margin-left: 0.75rem;">
+                            <div style="font-weight: 700; color: #1B2A4E; font-size: 1.1rem;">Healthcare</div>
+                            <div style="font-size: 0.75rem; color: #6B7280;">Telehealth & Population Health</div>
+                        </div>
+                    </div>
+                    <div style="font-size: 0.85rem; color: #374151; line-height: 1.6;">
+                        <p style="margin-bottom: 0.75rem;"><strong>Telehealth Feasibility:</strong> Map network quality to identify areas suitable for remote patient monitoring.</p>
+                        <p style="margin-bottom: 0.75rem;"><strong>Ambulance Routing:</strong> Optimise emergency vehicle routes based on real-time network and traffic data.</p>
+                        <p><strong>Population Health:</strong> Anonymised mobility data for epidemiological studies and health service planning.</p>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            # Row 3: Insurance, Tourism, Energy
+            row3 = st.columns(3)
+            
+            with row3[0]:
+                st.markdown("""
+                <div style="background: white; border: 1px solid #E5E7EB; border-radius: 12px; padding: 1.25rem; height: 320px;">
+                    <div style="display: flex; align-items: center; margin-bottom: 1rem;">
+                        <div style="background: #F3E8FF; width: 48px; height: 48px; border-radius: 10px; display: flex; align-items: center; justify-content: center; font-size: 1.5rem;">🛡️</div>
+                        <div style="margin-left: 0.75rem;">
+                            <div style="font-weight: 700; color: #1B2A4E; font-size: 1.1rem;">Insurance</div>
+                            <div style="font-size: 0.75rem; color: #6B7280;">Risk Assessment & Claims</div>
+                        </div>
+                    </div>
+                    <div style="font-size: 0.85rem; color: #374151; line-height: 1.6;">
+                        <p style="margin-bottom: 0.75rem;"><strong>Usage-Based Insurance:</strong> Support UBI models with driving behaviour insights from connected devices.</p>
+                        <p style="margin-bottom: 0.75rem;"><strong>Risk Scoring:</strong> Enhance property and casualty risk models with location and mobility patterns.</p>
+                        <p><strong>Claims Verification:</strong> Verify claim locations and timing using anonymised network data.</p>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with row3[1]:
+                st.markdown("""
+                <div style="background: white; border: 1px solid #E5E7EB; border-radius: 12px; padding: 1.25rem; height: 320px;">
+                    <div style="display: flex; align-items: center; margin-bottom: 1rem;">
+                        <div style="background: #FFEDD5; width: 48px; height: 48px; border-radius: 10px; display: flex; align-items: center; justify-content: center; font-size: 1.5rem;">✈️</div>
+                        <div style="margin-left: 0.75rem;">
+                            <div style="font-weight: 700; color: #1B2A4E; font-size: 1.1rem;">Tourism & Hospitality</div>
+                            <div style="font-size: 0.75rem; color: #6B7280;">Visitor Analytics & Destination Planning</div>
+                        </div>
+                    </div>
+                    <div style="font-size: 0.85rem; color: #374151; line-height: 1.6;">
+                        <p style="margin-bottom: 0.75rem;"><strong>Tourism Analytics:</strong> Understand visitor origins, dwell time, and travel patterns at destinations.</p>
+                        <p style="margin-bottom: 0.75rem;"><strong>Event Impact:</strong> Measure footfall and economic impact of festivals, concerts, and sporting events.</p>
+                        <p><strong>Roaming Insights:</strong> Analyse international visitor patterns from roaming data for tourism boards.</p>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with row3[2]:
+                st.markdown("""
+                <div style="background: white; border: 1px solid #E5E7EB; border-radius: 12px; padding: 1.25rem; height: 320px;">
+                    <div style="display: flex; align-items: center; margin-bottom: 1rem;">
+                        <div style="background: #DCFCE7; width: 48px; height: 48px; border-radius: 10px; display: flex; align-items: center; justify-content: center; font-size: 1.5rem;">⚡</div>
+                        <div style="margin-left: 0.75rem;">
+                            <div style="font-weight: 700; color: #1B2A4E; font-size: 1.1rem;">Energy & Utilities</div>
+                            <div style="font-size: 0.75rem; color: #6B7280;">Smart Grid & Demand Management</div>
+                        </div>
+                    </div>
+                    <div style="font-size: 0.85rem; color: #374151; line-height: 1.6;">
+                        <p style="margin-bottom: 0.75rem;"><strong>Demand Forecasting:</strong> Predict energy demand using population presence and movement patterns.</p>
+                        <p style="margin-bottom: 0.75rem;"><strong>Smart Meter Connectivity:</strong> Network coverage data for IoT smart meter rollout planning.</p>
+                        <p><strong>EV Charging:</strong> Optimise electric vehicle charging station placement based on mobility patterns.</p>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            # Row 4: Automotive, Research, App Developers
+            row4 = st.columns(3)
+            
+            with row4[0]:
+                st.markdown("""
+                <div style="background: white; border: 1px solid #E5E7EB; border-radius: 12px; padding: 1.25rem; height: 320px;">
+                    <div style="display: flex; align-items: center; margin-bottom: 1rem;">
+                        <div style="background: #FEF9C3; width: 48px; height: 48px; border-radius: 10px; display: flex; align-items: center; justify-content: center; font-size: 1.5rem;">🚙</div>
+                        <div style="margin-left: 0.75rem;">
+                            <div style="font-weight: 700; color: #1B2A4E; font-size: 1.1rem;">Automotive</div>
+                            <div style="font-size: 0.75rem; color: #6B7280;">Connected Cars & Navigation</div>
+                        </div>
+                    </div>
+                    <div style="font-size: 0.85rem; color: #374151; line-height: 1.6;">
+                        <p style="margin-bottom: 0.75rem;"><strong>Network-Aware Navigation:</strong> Route vehicles based on network coverage for uninterrupted connectivity.</p>
+                        <p style="margin-bottom: 0.75rem;"><strong>OTA Updates:</strong> Optimise over-the-air software update scheduling based on coverage and data speeds.</p>
+                        <p><strong>Autonomous Vehicle Support:</strong> Provide coverage maps for autonomous vehicle route planning and safety.</p>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with row4[1]:
+                st.markdown("""
+                <div style="background: white; border: 1px solid #E5E7EB; border-radius: 12px; padding: 1.25rem; height: 320px;">
+                    <div style="display: flex; align-items: center; margin-bottom: 1rem;">
+                        <div style="background: #E0F2FE; width: 48px; height: 48px; border-radius: 10px; display: flex; align-items: center; justify-content: center; font-size: 1.5rem;">🔬</div>
+                        <div style="margin-left: 0.75rem;">
+                            <div style="font-weight: 700; color: #1B2A4E; font-size: 1.1rem;">Academic Research</div>
+                            <div style="font-size: 0.75rem; color: #6B7280;">Urban Studies & Social Science</div>
+                        </div>
+                    </div>
+                    <div style="font-size: 0.85rem; color: #374151; line-height: 1.6;">
+                        <p style="margin-bottom: 0.75rem;"><strong>Urban Mobility Research:</strong> Support academic studies on commuting, urban sprawl, and social dynamics.</p>
+                        <p style="margin-bottom: 0.75rem;"><strong>Economic Analysis:</strong> Measure economic activity and recovery using mobility as a proxy indicator.</p>
+                        <p><strong>Behavioural Studies:</strong> Anonymised data for research on human behaviour and social patterns.</p>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with row4[2]:
+                st.markdown("""
+                <div style="background: white; border: 1px solid #E5E7EB; border-radius: 12px; padding: 1.25rem; height: 320px;">
+                    <div style="display: flex; align-items: center; margin-bottom: 1rem;">
+                        <div style="background: #CFFAFE; width: 48px; height: 48px; border-radius: 10px; display: flex; align-items: center; justify-content: center; font-size: 1.5rem;">📱</div>
+                        <div style="margin-left: 0.75rem;">
+                            <div style="font-weight: 700; color: #1B2A4E; font-size: 1.1rem;">App Developers</div>
+                            <div style="font-size: 0.75rem; color: #6B7280;">Network-Aware Applications</div>
+                        </div>
+                    </div>
+                    <div style="font-size: 0.85rem; color: #374151; line-height: 1.6;">
+                        <p style="margin-bottom: 0.75rem;"><strong>Adaptive Streaming:</strong> Adjust video quality dynamically based on predicted network conditions.</p>
+                        <p style="margin-bottom: 0.75rem;"><strong>Offline Mode Triggers:</strong> Pre-download content before users enter poor coverage areas.</p>
+                        <p><strong>QoS Optimisation:</strong> Prioritise features based on available bandwidth and latency conditions.</p>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+        
+        # Strategic Priorities
+        st.markdown("---")
+
+    with tab_strategy:
+        st.markdown('<div class="section-header">Data Monetization Strategic Priorities — Q1 2026</div>', unsafe_allow_html=True)
+        
+        priority_cols = st.columns(3)
+        with priority_cols[0]:
+            with st.container(border=True):
+                st.markdown("### 🚀 Product Expansion")
+                st.markdown("- Launch 5G coverage premium tier")
+                st.markdown("- New clean room partnerships (retail, finance)")
+                st.markdown("- Real-time streaming data products")
+                st.markdown("- Expand Marketplace listings to 20")
+        
+        with priority_cols[1]:
+            with st.container(border=True):
+                st.markdown("### 💰 Revenue Growth")
+                st.markdown("- Target £50M ARR by Q4 2026")
+                st.markdown("- Increase MVNO revenue share 15%")
+                st.markdown("- Launch usage-based pricing tier")
+                st.markdown("- Cross-sell to existing partners")
+        
+        with priority_cols[2]:
+            with st.container(border=True):
+                st.markdown("### 🔐 Trust & Governance")
+                st.markdown("- ISO 27701 privacy certification")
+                st.markdown("- Enhanced consent management")
+                st.markdown("- Automated data classification")
+                st.markdown("- Expand audit capabilities")
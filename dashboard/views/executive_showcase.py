@@ -0,0 +1,1233 @@
+"""Executive Showcase dashboard."""
+
+import streamlit as st
+import pandas as pd
+import altair as alt
+
+from dashboard import charts, cube, data
+
+
+def render_executive_showcase():
+    import pandas as pd
+    import numpy as np
+    import altair as alt
+
+    # Revenue bridge, ARPU, plan mix, regional heatmap and churn waterfall come from the KPI cube;
+    # a tile the backend has no facts for keeps the illustrative figures below
+    tiles = cube.kpi_cube(data.get_backend().name).tiles
+    
+    # Executive Showcase Header with Spotlight Effect
+    st.markdown("""
+    <div class="showcase-header-wrap">
+        <div class="showcase-effects">
+            <div class="showcase-spotlight"></div>
+            <div class="showcase-glow" style="top: -50px; left: 10%;"></div>
+            <div class="showcase-glow" style="top: -30px; right: 15%; animation-delay: 1.5s;"></div>
+            <span class="showcase-star" style="top: 20%; left: 10%;">✦</span>
+            <span class="showcase-star" style="top: 30%; left: 25%; animation-delay: 0.5s;">✦</span>
+            <span class="showcase-star" style="top: 15%; right: 20%; animation-delay: 1s;">✦</span>
+            <span class="showcase-star" style="top: 40%; right: 10%; animation-delay: 1.5s;">✦</span>
+            <span class="showcase-star" style="bottom: 20%; left: 40%; animation-delay: 0.8s;">✦</span>
+        </div>
+        <div class="showcase-header-content">
+            <h1>Executive Showcase</h1>
+            <p>Board-Ready Intelligence Dashboard — Cross-Domain Analytics & Strategic Insights</p>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    show_sf_highlights = st.session_state.get("sf_highlights", True)
+    if show_sf_highlights:
+        st.markdown("""
+        <div class="exec-sf-feature-banner">
+            <div class="exec-sf-feature-title">❄️ Snowflake Features powering this showcase</div>
+            <div class="exec-sf-feature-grid">
+                <span class="exec-sf-feature-pill">Snowflake Intelligence</span>
+                <span class="exec-sf-feature-pill">Cortex AI</span>
+                <span class="exec-sf-feature-pill">Cortex Search</span>
+                <span class="exec-sf-feature-pill">Semantic Models</span>
+                <span class="exec-sf-feature-pill">Dynamic Tables</span>
+                <span class="exec-sf-feature-pill">Snowpark</span>
+                <span class="exec-sf-feature-pill">Horizon Governance</span>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+    # Dashboard Tabs
+    tab_overview, tab_market, tab_strategy = st.tabs(["📊 Overview & Analysis", "🧭 Market & Customers", "❄️ Snowflake Intelligence"])
+
+    with tab_overview:
+        
+        # REAL-TIME BUSINESS PULSE - Business-focused animation
+        # CSS for the business pulse
+        
+        # HTML content for the business pulse
+        st.markdown("""<div class="business-pulse"><div class="pulse-header"><div class="pulse-live"><div class="pulse-dot"></div><span class="pulse-title">📊 Real-Time Business Pulse</span></div><div class="pulse-period">● Live</div></div><div class="pulse-metrics"><div class="pulse-metric"><div class="metric-icon">💰</div><div class="metric-val revenue">£7.4M</div><div class="metric-name">Monthly Revenue</div><div class="metric-trend up"><span>↑</span> +8.4% vs target</div></div><div class="pulse-metric"><div class="metric-icon">👥</div><div class="metric-val customers">30,247</div><div class="metric-name">Active Subscribers</div><div class="metric-trend up"><span>↑</span> +432 net adds</div></div><div class="pulse-metric"><div class="metric-icon">⭐</div><div class="metric-val nps">+47</div><div class="metric-name">NPS Score</div><div class="metric-trend up"><span>↑</span> +5 pts QoQ</div></div><div class="pulse-metric"><div class="metric-icon">📈</div><div class="metric-val growth">5.2%</div><div class="metric-name">Market Share</div><div class="metric-trend up"><span>↑</span> +0.4% YoY</div></div></div></div>""", unsafe_allow_html=True)
+        
+        # KPI Dashboard - Premium Card Design
+        st.markdown('<div class="section-header">Business Health at a Glance</div>', unsafe_allow_html=True)
+        
+        # Custom KPI Cards with embedded mini charts
+        st.markdown("""
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #29B5E8;">
+                <div class="kpi-icon">👥</div>
+                <div class="kpi-label">Total Subscribers</div>
+                <div class="kpi-value">30,247</div>
+                <div class="kpi-delta positive">↑ +5.2% QoQ</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <path d="M0,35 L15,32 L30,28 L45,25 L60,20 L75,15 L100,8" fill="none" stroke="#29B5E8" stroke-width="2"/>
+                    <path d="M0,35 L15,32 L30,28 L45,25 L60,20 L75,15 L100,8 L100,40 L0,40 Z" fill="#29B5E8"/>
+                </svg>
+            </div>
+            <div class="kpi-card" style="--accent: #10B981;">
+                <div class="kpi-icon">💰</div>
+                <div class="kpi-label">Quarterly Revenue</div>
+                <div class="kpi-value">£13.2M</div>
+                <div class="kpi-delta positive">↑ +8.4% YoY</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <path d="M0,32 L15,30 L30,26 L45,28 L60,20 L75,14 L100,8" fill="none" stroke="#10B981" stroke-width="2"/>
+                    <path d="M0,32 L15,30 L30,26 L45,28 L60,20 L75,14 L100,8 L100,40 L0,40 Z" fill="#10B981"/>
+                </svg>
+            </div>
+            <div class="kpi-card" style="--accent: #8B5CF6;">
+                <div class="kpi-icon">⭐</div>
+                <div class="kpi-label">NPS Score</div>
+                <div class="kpi-value">+47</div>
+                <div class="kpi-delta positive">↑ +5 pts</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <rect x="5" y="28" width="10" height="12" fill="#8B5CF6"/>
+                    <rect x="20" y="24" width="10" height="16" fill="#8B5CF6"/>
+                    <rect x="35" y="26" width="10" height="14" fill="#8B5CF6"/>
+                    <rect x="50" y="20" width="10" height="20" fill="#8B5CF6"/>
+                    <rect x="65" y="16" width="10" height="24" fill="#8B5CF6"/>
+                    <rect x="80" y="12" width="10" height="28" fill="#8B5CF6"/>
+                </svg>
+            </div>
+            <div class="kpi-card" style="--accent: #F59E0B;">
+                <div class="kpi-icon">📉</div>
+                <div class="kpi-label">Churn Rate</div>
+                <div class="kpi-value">2.1%</div>
+                <div class="kpi-delta positive">↓ -0.7%</div>
+                <svg class="kpi-chart" viewBox="0 0 100 40" preserveAspectRatio="none">
+                    <path d="M0,8 L15,12 L30,16 L45,18 L60,22 L75,28 L100,32" fill="none" stroke="#F59E0B" stroke-width="2"/>
+                    <path d="M0,8 L15,12 L30,16 L45,18 L60,22 L75,28 L100,32 L100,40 L0,40 Z" fill="#F59E0B"/>
+                </svg>
+            </div>
+        </div>
+        
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #06B6D4;">
+                <div class="kpi-icon">📡</div>
+                <div class="kpi-label">Network Availability</div>
+                <div class="kpi-value">99.7%</div>
+                <div class="kpi-delta positive">↑ +0.2%</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EC4899;">
+                <div class="kpi-icon">📊</div>
+                <div class="kpi-label">ARPU (Blended)</div>
+                <div class="kpi-value">£43.62</div>
+                <div class="kpi-delta positive">↑ +£2.10</div>
+            </div>
+            <div class="kpi-card" style="--accent: #14B8A6;">
+                <div class="kpi-icon">💬</div>
+                <div class="kpi-label">Support CSAT</div>
+                <div class="kpi-value">4.2/5</div>
+                <div class="kpi-delta positive">↑ +0.3</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EF4444;">
+                <div class="kpi-icon">⚠️</div>
+                <div class="kpi-label">At-Risk Revenue</div>
+                <div class="kpi-value">£2.4M</div>
+                <div class="kpi-delta neutral">847 customers</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Executive Performance Signals</div>', unsafe_allow_html=True)
+        exec_col1, exec_col2 = st.columns(2)
+        
+        with exec_col1:
+            st.markdown("**Revenue Mix by Segment**")
+            with st.container(border=True):
+                seg_df = pd.DataFrame({
+                    'Segment': ['Consumer', 'SMB', 'Enterprise', 'Wholesale'],
+                    'Revenue': [4.8, 1.6, 1.2, 0.7]
+                })
+                charts.altair_chart(_segment_revenue_bar(seg_df), use_container_width=True)
+        
+        with exec_col2:
+            st.markdown("**NPS vs Churn Risk**")
+            with st.container(border=True):
+                churn_df = pd.DataFrame({
+                    'Segment': ['Premium', 'Standard', 'Budget', 'Enterprise'],
+                    'NPS': [62, 47, 28, 55],
+                    'Churn': [1.2, 1.8, 2.9, 1.1]
+                })
+                charts.altair_chart(_nps_churn_scatter(churn_df), use_container_width=True)
+        
+        st.markdown('<div class="section-header">Revenue Bridge (YoY)</div>', unsafe_allow_html=True)
+        with st.container(border=True):
+            bridge_df = tiles['revenue_bridge']
+            if bridge_df is None:
+                bridge_df = pd.DataFrame({
+                    'Driver': ['Base', 'Volume', 'Price', 'Mix', 'Churn', 'Discounts', 'Current'],
+                    'Impact': [13.2, 1.2, 0.6, 0.4, -0.5, -0.3, 14.6],
+                    'Type': ['Total', 'Up', 'Up', 'Up', 'Down', 'Down', 'Total']
+                })
+                bridge_df['Label'] = [f"{v:.1f}M" if t == 'Total' else f"{v:+.1f}M"
+                                      for v, t in zip(bridge_df['Impact'], bridge_df['Type'])]
+            charts.altair_chart(_revenue_bridge(bridge_df), use_container_width=True)
+
+        st.markdown('<div class="section-header">ARPU & Plan Mix</div>', unsafe_allow_html=True)
+        arpu_col, mix_col = st.columns(2)
+        with arpu_col:
+            st.markdown("**ARPU by Segment**")
+            with st.container(border=True):
+                arpu_df = tiles['arpu_by_segment']
+                if arpu_df is None:
+                    arpu_df = pd.DataFrame({
+                        'Segment': ['Enterprise', 'Premium', 'Standard', 'Budget'],
+                        'ARPU': [142, 58, 38, 24]
+                    })
+                charts.altair_chart(_arpu_bar(arpu_df), use_container_width=True)
+        with mix_col:
+            st.markdown("**Plan Mix by Type**")
+            with st.container(border=True):
+                plan_df = tiles['plan_mix']
+                if plan_df is None:
+                    plan_df = pd.DataFrame({
+                        'Plan': ['Pay Monthly', 'SIM Only', 'Family', 'PAYG'],
+                        'Share': [46, 28, 16, 10]
+                    })
+                charts.altair_chart(_plan_mix_bar(plan_df), use_container_width=True)
+
+        # Main Dashboard Section - Enhanced Visual Design
+        col_left, col_right = st.columns([1.2, 1])
+        
+        with col_left:
+            # Revenue by Customer Segment - Enhanced Donut with Labels
+            st.markdown('<div class="section-header">Revenue Mix by Customer Segment</div>', unsafe_allow_html=True)
+            
+            revenue_data = pd.DataFrame({
+                'Segment': ['Consumer', 'SMB', 'Enterprise'],
+                'Revenue': [8.2, 3.4, 1.6],
+                'Percentage': [62, 26, 12],
+                'ARPU': [32, 58, 142],
+                'Customers': [21173, 7874, 1200],
+                'Growth': ['+4.2%', '+8.7%', '+15.3%']
+            })
+            
+            with st.container(border=True):
+                # Enhanced donut with center text
+                donut = alt.Chart(revenue_data).mark_arc(innerRadius=70, outerRadius=110, cornerRadius=4).encode(
+                    theta=alt.Theta('Revenue:Q', stack=True),
+                    color=alt.Color('Segment:N', 
+                        scale=alt.Scale(
+                            domain=['Consumer', 'SMB', 'Enterprise'],
+                            range=['#29B5E8', '#1B2A4E', '#10B981']
+                        ),
+                        legend=alt.Legend(orient='bottom', title=None, labelFontSize=11)
+                    ),
+                    tooltip=[
+                        alt.Tooltip('Segment:N'),
+                        alt.Tooltip('Revenue:Q', title='Revenue (£M)', format='.1f'),
+                        alt.Tooltip('Percentage:Q', title='Share', format='d'),
+                        alt.Tooltip('ARPU:Q', title='ARPU (£)', format='d'),
+                        alt.Tooltip('Customers:Q', format=',')
+                    ],
+                    order=alt.Order('Revenue:Q', sort='descending')
+                ).properties(height=260)
+                
+                # Center text
+                center_text = alt.Chart(pd.DataFrame({'text': ['£13.2M'], 'subtext': ['Total Revenue']})).mark_text(
+                    fontSize=24, fontWeight='bold', color='#1B2A4E'
+                ).encode(text='text:N')
+                
+                center_subtext = alt.Chart(pd.DataFrame({'text': ['Total Revenue']})).mark_text(
+                    fontSize=12, color='#6B7280', dy=20
+                ).encode(text='text:N')
+                
+                charts.altair_chart(donut + center_text + center_subtext, use_container_width=True)
+                
+                # Segment detail cards
+                seg_cols = st.columns(3)
+                segments_info = [
+                    ('Consumer', '#29B5E8', '£8.2M', '62%', '£32', '+4.2%'),
+                    ('SMB', '#1B2A4E', '£3.4M', '26%', '£58', '+8.7%'),
+                    ('Enterprise', '#10B981', '£1.6M', '12%', '£142', '+15.3%')
+                ]
+                for i, (seg, color, rev, share, arpu, growth) in enumerate(segments_info):
+                    with seg_cols[i]:
+                        st.markdown(f"""
+                        <div style="background: linear-gradient(135deg, {color}15 0%, {color}08 100%); border-left: 4px solid {color}; border-radius: 0 8px 8px 0; padding: 0.75rem;">
+                            <div style="font-weight: 600; color: {color}; font-size: 0.9rem;">{seg}</div>
+                            <div style="font-size: 1.2rem; font-weight: 700; color: #1B2A4E;">{rev}</div>
+                            <div style="color: #6B7280; font-size: 0.75rem;">ARPU {arpu} · <span style="color: #10B981;">{growth}</span></div>
+                        </div>
+                        """, unsafe_allow_html=True)
+            
+        with col_right:
+            # Customer Segments at Risk - Enhanced Lollipop Chart
+            st.markdown('<div class="section-header">At-Risk Customer Analysis</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                risk_data = pd.DataFrame({
+                    'Segment': ['Budget', 'Standard', 'Premium', 'VIP'],
+                    'At Risk': [312, 289, 178, 68],
+                    'Revenue at Risk': [187, 347, 534, 340],
+                    'Avg Propensity': [0.78, 0.65, 0.52, 0.41]
+                })
+                
+                # Lollipop chart - more impactful than basic bars
+                lollipop_line = alt.Chart(risk_data).mark_rule(strokeWidth=3).encode(
+                    x=alt.X('At Risk:Q', title='Customers at Risk', scale=alt.Scale(domain=[0, 350])),
+                    x2=alt.value(0),
+                    y=alt.Y('Segment:N', sort=['Budget', 'Standard', 'Premium', 'VIP'], title=None),
+                    color=alt.Color('Avg Propensity:Q', scale=alt.Scale(scheme='orangered', domain=[0.4, 0.8]), legend=None)
+                )
+                
+                lollipop_point = alt.Chart(risk_data).mark_circle(size=300).encode(
+                    x=alt.X('At Risk:Q'),
+                    y=alt.Y('Segment:N', sort=['Budget', 'Standard', 'Premium', 'VIP']),
+                    color=alt.Color('Avg Propensity:Q', scale=alt.Scale(scheme='orangered', domain=[0.4, 0.8]), title='Churn Risk'),
+                    tooltip=[
+                        'Segment',
+                        alt.Tooltip('At Risk:Q', title='Customers'),
+                        alt.Tooltip('Revenue at Risk:Q', title='Revenue (£K)', format=',.0f'),
+                        alt.Tooltip('Avg Propensity:Q', title='Risk Score', format='.0%')
+                    ]
+                )
+                
+                # Revenue labels on the right
+                rev_labels = alt.Chart(risk_data).mark_text(align='left', dx=15, fontSize=11, fontWeight='bold').encode(
+                    x=alt.X('At Risk:Q'),
+                    y=alt.Y('Segment:N', sort=['Budget', 'Standard', 'Premium', 'VIP']),
+                    text=alt.Text('Revenue at Risk:Q', format='£,.0fK'),
+                    color=alt.value('#DC2626')
+                )
+                
+                charts.altair_chart((lollipop_line + lollipop_point + rev_labels).properties(height=180), use_container_width=True)
+                
+                st.markdown("""
+                <div style="background: linear-gradient(135deg, #FEF3C7 0%, #FDE68A 100%); border-radius: 8px; padding: 0.75rem; margin-top: 0.5rem; border-left: 4px solid #F59E0B;">
+                    <div style="display: flex; align-items: center;">
+                        <span style="font-size: 1.5rem; margin-right: 0.5rem;">⚠️</span>
+                        <div>
+                            <strong style="color: #92400E;">Urgent: 847 customers at risk</strong>
+                            <div style="color: #B45309; font-size: 0.85rem;">£2.4M ARR exposed · Premium segment highest impact</div>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            # Network Quality Impact - Enhanced Bubble Chart
+            st.markdown('<div class="section-header">Network Quality vs NPS</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                cities = ['London', 'Manchester', 'Birmingham', 'Leeds', 'Glasgow', 'Liverpool', 'Bristol', 'Sheffield']
+                network_nps = pd.DataFrame({
+                    'City': cities,
+                    'Network Score': [94, 91, 88, 86, 92, 85, 93, 84],
+                    'NPS': [52, 48, 41, 38, 49, 36, 51, 35],
+                    'Subscribers': [8500, 4200, 3800, 2900, 2600, 2400, 2100, 1800],
+                    'Status': ['Strong', 'Good', 'At Risk', 'At Risk', 'Good', 'Critical', 'Strong', 'Critical']
+                })
+                
+                scatter = alt.Chart(network_nps).mark_circle(opacity=0.8).encode(
+                    x=alt.X('Network Score:Q', scale=alt.Scale(domain=[82, 96]), title='Network Quality', axis=alt.Axis(grid=True)),
+                    y=alt.Y('NPS:Q', scale=alt.Scale(domain=[32, 56]), title='NPS Score', axis=alt.Axis(grid=True)),
+                    size=alt.Size('Subscribers:Q', scale=alt.Scale(range=[200, 1500]), legend=None),
+                    color=alt.Color('Status:N', scale=alt.Scale(
+                        domain=['Critical', 'At Risk', 'Good', 'Strong'],
+                        range=['#DC2626', '#F59E0B', '#29B5E8', '#10B981']
+                    ), legend=alt.Legend(orient='top', title=None)),
+                    tooltip=['City', 'Network Score', 'NPS', alt.Tooltip('Subscribers:Q', format=',')]
+                )
+                
+                # City labels
+                labels = alt.Chart(network_nps).mark_text(dy=-15, fontSize=10, fontWeight='bold').encode(
+                    x='Network Score:Q',
+                    y='NPS:Q',
+                    text='City:N',
+                    color=alt.value('#1B2A4E')
+                )
+                
+                regression = scatter.transform_regression('Network Score', 'NPS').mark_line(
+                    color='#1B2A4E', strokeWidth=2, strokeDash=[6, 4], opacity=0.6
+                )
+                
+                charts.altair_chart((scatter + labels + regression).properties(height=220), use_container_width=True)
+                
+                # Insight badges
+                st.markdown("""
+                <div style="display: flex; gap: 0.5rem; flex-wrap: wrap;">
+                    <span style="background: #D1FAE5; color: #065F46; padding: 0.25rem 0.6rem; border-radius: 20px; font-size: 0.75rem; font-weight: 500;">R² = 0.89 Strong Correlation</span>
+                    <span style="background: #FEE2E2; color: #991B1B; padding: 0.25rem 0.6rem; border-radius: 20px; font-size: 0.75rem; font-weight: 500;">Sheffield, Liverpool need attention</span>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        # Churn Risk Correlation - Compact Heatmap
+        st.markdown('<div class="section-header">Churn Risk Correlation Matrix</div>', unsafe_allow_html=True)
+        
+        with st.container(border=True):
+            factors = ['NPS', 'Support', 'Bill Amt', 'Network', 'Tenure', 'Contract']
+            correlation_matrix = pd.DataFrame({
+                'Factor': factors * 6,
+                'Correlated With': [f for f in factors for _ in range(6)],
+                'Correlation': [
+                    1.0, -0.72, 0.15, -0.68, 0.45, 0.38,
+                    -0.72, 1.0, 0.22, 0.65, -0.31, -0.28,
+                    0.15, 0.22, 1.0, 0.08, 0.52, 0.61,
+                    -0.68, 0.65, 0.08, 1.0, -0.25, -0.19,
+                    0.45, -0.31, 0.52, -0.25, 1.0, 0.72,
+                    0.38, -0.28, 0.61, -0.19, 0.72, 1.0
+                ]
+            })
+            
+            heatmap = alt.Chart(correlation_matrix).mark_rect(cornerRadius=3).encode(
+                x=alt.X('Factor:N', title=None, sort=factors, axis=alt.Axis(labelAngle=-45)),
+                y=alt.Y('Correlated With:N', title=None, sort=factors),
+                color=alt.Color('Correlation:Q', 
+                    scale=alt.Scale(scheme='redblue', domain=[-1, 1]),
+                    legend=alt.Legend(orient='right', title='r', gradientLength=100)
+                ),
+                tooltip=['Factor', 'Correlated With', alt.Tooltip('Correlation:Q', format='.2f')]
+            ).properties(height=220)
+            
+            # Add correlation values as text
+            correlation_matrix['TextColor'] = correlation_matrix['Correlation'].apply(
+                lambda x: 'white' if abs(x) > 0.5 else '#1B2A4E'
+            )
+            text = alt.Chart(correlation_matrix).mark_text(fontSize=9, fontWeight='bold').encode(
+                x=alt.X('Factor:N', sort=factors),
+                y=alt.Y('Correlated With:N', sort=factors),
+                text=alt.Text('Correlation:Q', format='.1f'),
+                color=alt.Color('TextColor:N', scale=None)
+            )
+            
+            charts.altair_chart(heatmap + text, use_container_width=True)
+            
+            st.markdown("""
+            <div style="display: flex; gap: 1rem; margin-top: 0.5rem;">
+                <div style="flex: 1; background: #FEE2E2; border-radius: 8px; padding: 0.5rem; text-align: center;">
+                    <div style="font-weight: 700; color: #DC2626; font-size: 1.1rem;">-0.72</div>
+                    <div style="font-size: 0.7rem; color: #991B1B;">NPS ↔ Support Calls</div>
+                </div>
+                <div style="flex: 1; background: #FEE2E2; border-radius: 8px; padding: 0.5rem; text-align: center;">
+                    <div style="font-weight: 700; color: #DC2626; font-size: 1.1rem;">-0.68</div>
+                    <div style="font-size: 0.7rem; color: #991B1B;">NPS ↔ Network Issues</div>
+                </div>
+                <div style="flex: 1; background: #D1FAE5; border-radius: 8px; padding: 0.5rem; text-align: center;">
+                    <div style="font-weight: 700; color: #059669; font-size: 1.1rem;">+0.72</div>
+                    <div style="font-size: 0.7rem; color: #065F46;">Tenure ↔ Contract</div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # Competitive & Market Analysis
+        st.markdown('<div class="section-header">Competitive Intelligence & Market Position</div>', unsafe_allow_html=True)
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            with st.container(border=True):
+                st.markdown("**Port-In/Port-Out Analysis** <span style='color: #6B7280; font-size: 0.8rem;'>(Last 90 Days)</span>", unsafe_allow_html=True)
+                
+                porting_data = pd.DataFrame({
+                    'Competitor': ['Three', 'Vodafone', 'EE', 'O2', 'Virgin', 'Sky'],
+                    'Port-In': [312, 245, 189, 156, 134, 98],
+                    'Port-Out': [145, 178, 234, 189, 89, 67],
+                    'Net': [167, 67, -45, -33, 45, 31]
+                })
+                
+                # Butterfly/diverging bar chart
+                port_in = alt.Chart(porting_data).mark_bar(color='#10B981', cornerRadiusTopRight=4, cornerRadiusBottomRight=4).encode(
+                    x=alt.X('Port-In:Q', title='Port-In', scale=alt.Scale(domain=[0, 350])),
+                    y=alt.Y('Competitor:N', sort=list(porting_data['Competitor']), title=None, axis=alt.Axis(labels=False)),
+                    tooltip=[alt.Tooltip('Competitor'), alt.Tooltip('Port-In:Q', title='Gained')]
+                ).properties(height=220, width=240)
+                
+                port_out = alt.Chart(porting_data).mark_bar(color='#EF4444', cornerRadiusTopLeft=4, cornerRadiusBottomLeft=4).encode(
+                    x=alt.X('Port-Out:Q', title='Port-Out', scale=alt.Scale(domain=[0, 350], reverse=True)),
+                    y=alt.Y('Competitor:N', sort=list(porting_data['Competitor']), axis=alt.Axis(labels=True, title=None)),
+                    tooltip=[alt.Tooltip('Competitor'), alt.Tooltip('Port-Out:Q', title='Lost')]
+                ).properties(height=220, width=240)
+                
+                combined = alt.hconcat(port_out, port_in).resolve_scale(y='shared')
+                charts.altair_chart(combined)
+                
+                st.markdown("""
+                <div style="display: flex; justify-content: space-between; margin-top: 0.5rem;">
+                    <span style="background: #D1FAE5; color: #065F46; padding: 0.3rem 0.75rem; border-radius: 20px; font-size: 0.8rem; font-weight: 600;">Net: +432 customers</span>
+                    <span style="background: #DBEAFE; color: #1E40AF; padding: 0.3rem 0.75rem; border-radius: 20px; font-size: 0.8rem;">Three: +167 | EE: -45</span>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col2:
+            with st.container(border=True):
+                st.markdown("**UK Mobile Market Share**", unsafe_allow_html=True)
+                
+                market_data = pd.DataFrame({
+                    'Carrier': ['EE', 'O2', 'Vodafone', 'Three', 'SnowTelco', 'Others'],
+                    'Share': [28, 26, 22, 14, 5, 5],
+                    'Trend': ['→', '↓', '→', '↓', '↑', '→']
+                })
+                
+                # Stacked bar for market share
+                market_bar = alt.Chart(market_data).mark_bar(cornerRadius=4).encode(
+                    x=alt.X('Share:Q', stack='normalize', title=None, axis=alt.Axis(format='%', labelAngle=0)),
+                    color=alt.Color('Carrier:N', 
+                        scale=alt.Scale(
+                            domain=['EE', 'O2', 'Vodafone', 'Three', 'SnowTelco', 'Others'],
+                            range=['#6366F1', '#3B82F6', '#EF4444', '#F59E0B', '#29B5E8', '#9CA3AF']
+                        ),
+                        legend=None
+                    ),
+                    order=alt.Order('Share:Q', sort='descending'),
+                    tooltip=['Carrier', alt.Tooltip('Share:Q', title='Market Share', format='d%'), 'Trend']
+                ).properties(height=50)
+                
+                charts.altair_chart(market_bar, use_container_width=True)
+                
+                # Legend with trends
+                st.markdown("""
+                <div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 0.5rem; margin-top: 0.75rem;">
+                    <div style="display: flex; align-items: center; gap: 0.3rem;">
+                        <div style="width: 12px; height: 12px; background: #6366F1; border-radius: 2px;"></div>
+                        <span style="font-size: 0.8rem; color: #1B2A4E;">EE 28% →</span>
+                    </div>
+                    <div style="display: flex; align-items: center; gap: 0.3rem;">
+                        <div style="width: 12px; height: 12px; background: #3B82F6; border-radius: 2px;"></div>
+                        <span style="font-size: 0.8rem; color: #1B2A4E;">O2 26% <span style="color: #DC2626;">↓</span></span>
+                    </div>
+                    <div style="display: flex; align-items: center; gap: 0.3rem;">
+                        <div style="width: 12px; height: 12px; background: #EF4444; border-radius: 2px;"></div>
+                        <span style="font-size: 0.8rem; color: #1B2A4E;">Vodafone 22% →</span>
+                    </div>
+                    <div style="display: flex; align-items: center; gap: 0.3rem;">
+                        <div style="width: 12px; height: 12px; background: #F59E0B; border-radius: 2px;"></div>
+                        <span style="font-size: 0.8rem; color: #1B2A4E;">Three 14% <span style="color: #DC2626;">↓</span></span>
+                    </div>
+                    <div style="display: flex; align-items: center; gap: 0.3rem;">
+                        <div style="width: 12px; height: 12px; background: #29B5E8; border-radius: 2px;"></div>
+                        <span style="font-size: 0.8rem; color: #1B2A4E; font-weight: 600;">SnowTelco 5% <span style="color: #10B981;">↑</span></span>
+                    </div>
+                    <div style="display: flex; align-items: center; gap: 0.3rem;">
+                        <div style="width: 12px; height: 12px; background: #9CA3AF; border-radius: 2px;"></div>
+                        <span style="font-size: 0.8rem; color: #1B2A4E;">Others 5%</span>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                st.markdown("""
+                <div style="background: linear-gradient(135deg, #29B5E815 0%, #29B5E805 100%); border-left: 4px solid #29B5E8; border-radius: 0 8px 8px 0; padding: 0.75rem; margin-top: 0.75rem;">
+                    <strong style="color: #1B2A4E;">Target: 7% by 2027</strong>
+                    <div style="color: #6B7280; font-size: 0.85rem;">+2% growth opportunity • £15M incremental revenue</div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        # Regional Performance Map
+        st.markdown('<div class="section-header">Regional Performance Overview</div>', unsafe_allow_html=True)
+        
+        col_map, col_data = st.columns([1.2, 1])
+        
+        with col_map:
+            with st.container(border=True):
+                # UK regions with coordinates and metrics
+                uk_locations = pd.DataFrame({
+                    'Region': ['London', 'South East', 'Midlands', 'North West', 'Scotland', 'South West', 'Yorkshire', 'Wales', 'North East', 'East'],
+                    'lat': [51.5074, 51.2802, 52.4862, 53.4808, 55.9533, 51.4545, 53.8008, 52.1307, 54.9783, 52.2053],
+                    'lon': [-0.1278, -0.5217, -1.8904, -2.2426, -3.1883, -2.5879, -1.5491, -3.7837, -1.6178, 0.1218],
+                    'Subscribers': [8500, 4800, 4200, 3900, 2600, 2400, 2100, 1800, 1200, 847],
+                    'NPS': [52, 48, 41, 46, 49, 51, 38, 44, 42, 45],
+                    'Revenue': [3.8, 2.1, 1.9, 1.7, 1.2, 1.1, 0.9, 0.8, 0.5, 0.4],
+                    'Network': [94, 92, 88, 91, 92, 93, 86, 89, 87, 90]
+                })
+                
+                # Create color column based on NPS (hex format)
+                def nps_to_color(nps):
+                    # NPS range 35-55, map to red-green gradient
+                    ratio = min(max((nps - 35) / 20, 0), 1)
+                    r = int(255 * (1 - ratio))
+                    g = int(200 * ratio)
+                    return f'#{r:02x}{g:02x}64'
+                
+                uk_locations['color'] = uk_locations['NPS'].apply(nps_to_color)
+                # Make bubbles bigger - multiply by 5 for more visibility
+                uk_locations['size'] = uk_locations['Subscribers'] * 5
+                
+                # Animated legend showing live status
+                st.markdown("""
+                <div class="map-legend">
+                    <div class="legend-item"><div class="legend-dot red pulse"></div><span>Low NPS (&lt;42)</span></div>
+                    <div class="legend-item"><div class="legend-dot yellow pulse" style="animation-delay: 0.3s;"></div><span>Medium (42-48)</span></div>
+                    <div class="legend-item"><div class="legend-dot green pulse" style="animation-delay: 0.6s;"></div><span>High NPS (&gt;48)</span></div>
+                </div>
+                """, unsafe_allow_html=True)
+                
+                st.map(
+                    uk_locations,
+                    latitude='lat',
+                    longitude='lon',
+                    size='size',
+                    color='color',
+                    zoom=5,
+                    use_container_width=True
+                )
+                st.caption("Bubble size = Subscribers | Color = NPS (green=high, red=low)")
+        
+        with col_data:
+            with st.container(border=True):
+                regions = pd.DataFrame({
+                    'Region': ['London', 'South East', 'Midlands', 'North West', 'Scotland', 'South West', 'Yorkshire', 'Wales', 'North East', 'East'],
+                    'Subscribers': [8500, 4800, 4200, 3900, 2600, 2400, 2100, 1800, 1200, 847],
+                    'NPS': [52, 48, 41, 46, 49, 51, 38, 44, 42, 45],
+                    'Revenue': [3.8, 2.1, 1.9, 1.7, 1.2, 1.1, 0.9, 0.8, 0.5, 0.4],
+                    'Network Score': [94, 92, 88, 91, 92, 93, 86, 89, 87, 90]
+                })
+                
+                st.dataframe(
+                    regions,
+                    column_config={
+                        "Region": st.column_config.TextColumn("Region", pinned=True),
+                        "Subscribers": st.column_config.NumberColumn("Subs", format="%d"),
+                        "NPS": st.column_config.ProgressColumn("NPS", min_value=0, max_value=70, format="%d"),
+                        "Revenue": st.column_config.NumberColumn("Rev (£M)", format="£%.1f"),
+                        "Network Score": st.column_config.ProgressColumn("Net", min_value=80, max_value=100, format="%d%%")
+                    },
+                    hide_index=True,
+                    use_container_width=True,
+                    height=320
+                )
+            
+            col_perf1, col_perf2 = st.columns(2)
+            with col_perf1:
+                st.markdown("""
+                <div style="background: #D1FAE5; border-radius: 8px; padding: 0.75rem;">
+                    <strong style="color: #065F46; font-size: 0.85rem;">Top Performers</strong>
+                    <ul style="margin: 0.3rem 0 0 0.8rem; padding: 0; color: #065F46; font-size: 0.8rem;">
+                        <li>London: £3.8M rev</li>
+                        <li>South West: NPS 51</li>
+                        <li>London: 94% network</li>
+                    </ul>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col_perf2:
+                st.markdown("""
+                <div style="background: #FEE2E2; border-radius: 8px; padding: 0.75rem;">
+                    <strong style="color: #991B1B; font-size: 0.85rem;">Needs Attention</strong>
+                    <ul style="margin: 0.3rem 0 0 0.8rem; padding: 0; color: #991B1B; font-size: 0.8rem;">
+                        <li>Yorkshire: NPS 38</li>
+                        <li>Yorkshire: 86% net</li>
+                        <li>Wales: Slow growth</li>
+                    </ul>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        # Board Presentation Summary
+        st.markdown('<div class="section-header">Board Presentation Summary</div>', unsafe_allow_html=True)
+        
+        with st.container(border=True):
+            st.markdown("""
+            <div style="background: #F8FAFC; border-radius: 12px; padding: 1.5rem; border: 1px solid #E2E8F0;">
+                <h3 style="color: #1B2A4E; margin-top: 0;">Executive Summary — Q4 2025</h3>
+                <div style="display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 1rem;">
+                    <div>
+                        <strong style="color: #29B5E8;">1. Business Performance</strong>
+                        <p style="margin: 0.25rem 0 0.75rem 0; opacity: 0.9;">Revenue +8.4% YoY (£13.2M), subscriber base grew 5.2% to 30,247. Enterprise ARPU at £142 driving margin expansion.</p>
+                    </div>
+                    <div>
+                        <strong style="color: #29B5E8;">2. Customer Health</strong>
+                        <p style="margin: 0.25rem 0 0.75rem 0; opacity: 0.9;">NPS improved to +47 (+5 pts). Churn reduced to 2.1%. 847 customers (£2.4M) remain at-risk requiring intervention.</p>
+                    </div>
+                    <div>
+                        <strong style="color: #29B5E8;">3. Competitive Position</strong>
+                        <p style="margin: 0.25rem 0 0.75rem 0; opacity: 0.9;">Net port-in positive (+432). Gaining share from Three. Market share at 5%, on track for 7% target by 2027.</p>
+                    </div>
+                    <div>
+                        <strong style="color: #29B5E8;">4. Network Quality</strong>
+                        <p style="margin: 0.25rem 0 0.75rem 0; opacity: 0.9;">99.7% availability. Strong NPS-network correlation (R²=0.89). Yorkshire requires infrastructure investment.</p>
+                    </div>
+                    <div>
+                        <strong style="color: #29B5E8;">5. Strategic Priorities</strong>
+                        <p style="margin: 0.25rem 0 0 0; opacity: 0.9;">① Launch retention campaign (save £1.2M) ② Accelerate 5G rollout ③ Scale enterprise sales ④ Target Three defectors</p>
+                    </div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        # Interactive Agent Section
+
+    with tab_market:
+        st.markdown("""
+        <div class="exec-market-pulse">
+            <div class="exec-market-header">
+                <div class="exec-market-title">🧭 Market & Customer Pulse</div>
+                <div class="exec-market-tag">LIVE</div>
+            </div>
+            <div class="exec-market-grid">
+                <div class="exec-market-card">
+                    <div class="exec-market-label">Net Port-Ins</div>
+                    <div class="exec-market-value">+432</div>
+                    <div class="exec-market-delta">MTD</div>
+                </div>
+                <div class="exec-market-card">
+                    <div class="exec-market-label">Churn Risk</div>
+                    <div class="exec-market-value">2.1%</div>
+                    <div class="exec-market-delta">-0.2% QoQ</div>
+                </div>
+                <div class="exec-market-card">
+                    <div class="exec-market-label">5G Adoption</div>
+                    <div class="exec-market-value">42%</div>
+                    <div class="exec-market-delta">+8% QoQ</div>
+                </div>
+                <div class="exec-market-card">
+                    <div class="exec-market-label">ARPU</div>
+                    <div class="exec-market-value">£43.6</div>
+                    <div class="exec-market-delta">+£2.1 MoM</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['MOBILE', 'PORTING', 'MARKET_INTELLIGENCE', 'CUSTOMER_EXPERIENCE']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+        
+        
+        st.markdown('<div class="section-header">Market Position</div>', unsafe_allow_html=True)
+        pos_left, pos_right = st.columns([1.2, 1])
+        with pos_left:
+            st.markdown('<div class="section-header">UK Regional Performance</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                region_data = pd.DataFrame({
+                    'Region': ['London', 'South East', 'South West', 'Midlands', 'North West', 'North East', 'Yorkshire', 'Scotland', 'Wales', 'East'],
+                    'Market Share': [6.2, 5.8, 5.5, 4.8, 5.1, 4.2, 3.9, 4.5, 4.1, 5.3],
+                    'Subscribers': [6240, 4820, 3150, 4100, 3890, 2340, 2180, 1520, 980, 3027],
+                    'NPS': [52, 48, 51, 45, 44, 41, 38, 46, 43, 47],
+                    'Growth': ['+8.2%', '+6.1%', '+7.3%', '+5.2%', '+4.8%', '+3.1%', '+2.4%', '+5.5%', '+4.2%', '+6.8%']
+                })
+                bars = alt.Chart(region_data).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Market Share:Q', title='Market Share (%)', scale=alt.Scale(domain=[0, 8])),
+                    y=alt.Y('Region:N', sort='-x', title=None),
+                    color=alt.Color('Market Share:Q', scale=alt.Scale(scheme='blues'), legend=None),
+                    tooltip=[
+                        alt.Tooltip('Region:N'),
+                        alt.Tooltip('Market Share:Q', title='Share', format='.1f'),
+                        alt.Tooltip('Subscribers:Q', title='Subscribers', format=','),
+                        alt.Tooltip('NPS:Q', title='NPS'),
+                        alt.Tooltip('Growth:N', title='YoY Growth')
+                    ]
+                ).properties(height=260)
+                text = alt.Chart(region_data).mark_text(align='left', dx=5, fontSize=11, fontWeight='bold').encode(
+                    x=alt.X('Market Share:Q'),
+                    y=alt.Y('Region:N', sort='-x'),
+                    text=alt.Text('Market Share:Q', format='.1f'),
+                    color=alt.value('#1B2A4E')
+                )
+                charts.altair_chart(bars + text, use_container_width=True)
+        
+        with pos_right:
+            st.markdown('<div class="section-header">Competitive Share</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                competitor_data = pd.DataFrame({
+                    'Competitor': ['EE', 'O2', 'Vodafone', 'Three', 'SnowTelco', 'Others'],
+                    'Market Share': [28, 26, 22, 14, 5, 5]
+                })
+                donut = alt.Chart(competitor_data).mark_arc(innerRadius=55, outerRadius=95, cornerRadius=3).encode(
+                    theta=alt.Theta('Market Share:Q', stack=True),
+                    color=alt.Color('Competitor:N',
+                        scale=alt.Scale(
+                            domain=['EE', 'O2', 'Vodafone', 'Three', 'SnowTelco', 'Others'],
+                            range=['#8B5CF6', '#3B82F6', '#EF4444', '#F59E0B', '#29B5E8', '#9CA3AF']
+                        ),
+                        legend=None
+                    ),
+                    tooltip=[alt.Tooltip('Competitor:N'), alt.Tooltip('Market Share:Q', format='d', title='Share %')]
+                ).properties(height=220)
+                charts.altair_chart(donut, use_container_width=True)
+                st.markdown("""
+                <div style="font-size: 0.8rem; color: #6B7280; text-align: center;">
+                    SnowTelco gaining share vs Three and O2
+                </div>
+                """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Competitive Dynamics</div>', unsafe_allow_html=True)
+        with st.container(border=True):
+            st.markdown("""
+            <div class="benchmark-legend">
+                <div class="legend-item"><div class="legend-dot" style="background: linear-gradient(90deg, #29B5E8, #1A8BC4);"></div><span style="font-weight: 600; color: #1B2A4E;">SnowTelco</span></div>
+                <div class="legend-item"><div class="legend-dot" style="background: #D1D5DB;"></div><span style="color: #6B7280;">Industry Avg</span></div>
+            </div>
+            <div class="benchmark-row">
+                <div class="benchmark-label">NPS Score</div>
+                <div class="benchmark-bars">
+                    <div class="benchmark-bar-container">
+                        <div class="benchmark-bar-bg"><div class="benchmark-bar snowtelco" style="--fill-width: 72%;"></div></div>
+                        <div class="benchmark-value" style="color: #29B5E8;">72<span class="better-badge">+17</span></div>
+                    </div>
+                    <div class="benchmark-bar-container">
+                        <div class="benchmark-bar-bg"><div class="benchmark-bar industry" style="--fill-width: 55%;"></div></div>
+                        <div class="benchmark-value" style="color: #9CA3AF;">55</div>
+                    </div>
+                </div>
+            </div>
+            <div class="benchmark-row">
+                <div class="benchmark-label">Churn Rate</div>
+                <div class="benchmark-bars">
+                    <div class="benchmark-bar-container">
+                        <div class="benchmark-bar-bg"><div class="benchmark-bar snowtelco" style="--fill-width: 21%;"></div></div>
+                        <div class="benchmark-value" style="color: #29B5E8;">2.1%<span class="better-badge">Better</span></div>
+                    </div>
+                    <div class="benchmark-bar-container">
+                        <div class="benchmark-bar-bg"><div class="benchmark-bar industry" style="--fill-width: 28%;"></div></div>
+                        <div class="benchmark-value" style="color: #9CA3AF;">2.8%</div>
+                    </div>
+                </div>
+            </div>
+            <div class="benchmark-row">
+                <div class="benchmark-label">ARPU</div>
+                <div class="benchmark-bars">
+                    <div class="benchmark-bar-container">
+                        <div class="benchmark-bar-bg"><div class="benchmark-bar snowtelco" style="--fill-width: 78%;"></div></div>
+                        <div class="benchmark-value" style="color: #29B5E8;">£38<span class="better-badge">+£6</span></div>
+                    </div>
+                    <div class="benchmark-bar-container">
+                        <div class="benchmark-bar-bg"><div class="benchmark-bar industry" style="--fill-width: 64%;"></div></div>
+                        <div class="benchmark-value" style="color: #9CA3AF;">£32</div>
+                    </div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Regional Performance Heatmap</div>', unsafe_allow_html=True)
+        with st.container(border=True):
+            heat_df = tiles['regional_heatmap']
+            if heat_df is None:
+                heat_df = pd.DataFrame({
+                    'Region': ['London', 'South East', 'South West', 'Midlands', 'North West', 'North East', 'Yorkshire', 'Scotland', 'Wales', 'East'],
+                    'Market Share': [6.2, 5.8, 5.5, 4.8, 5.1, 4.2, 3.9, 4.5, 4.1, 5.3],
+                    'NPS': [52, 48, 51, 45, 44, 41, 38, 46, 43, 47],
+                    'Growth': [8.2, 6.1, 7.3, 5.2, 4.8, 3.1, 2.4, 5.5, 4.2, 6.8]
+                })
+            heat_long = heat_df.melt('Region', var_name='Metric', value_name='Value').dropna()
+            charts.altair_chart(_regional_heatmap(heat_long), use_container_width=True)
+
+        st.markdown('<div class="section-header">Competitive Porting Analysis</div>', unsafe_allow_html=True)
+        with st.container(border=True):
+            porting_data = pd.DataFrame({
+                'Competitor': ['Three', 'Vodafone', 'EE', 'O2', 'Virgin', 'Sky'],
+                'Port-In': [245, 156, 98, 112, 67, 45],
+                'Port-Out': [78, 123, 143, 87, 42, 38]
+            })
+            porting_long = porting_data.melt('Competitor', var_name='Flow', value_name='Count')
+            porting_long['Count'] = porting_long.apply(
+                lambda row: row['Count'] if row['Flow'] == 'Port-In' else -row['Count'], axis=1
+            )
+            porting_long['Abs'] = porting_long['Count'].abs()
+            porting_chart = alt.Chart(porting_long).mark_bar(cornerRadius=4).encode(
+                x=alt.X('Count:Q', title='Net Porting', scale=alt.Scale(domain=[-260, 260])),
+                y=alt.Y('Competitor:N', sort=list(porting_data['Competitor']), title=None),
+                color=alt.Color('Flow:N', scale=alt.Scale(range=['#10B981', '#EF4444']), legend=alt.Legend(orient='bottom', title=None)),
+                tooltip=['Competitor:N', 'Flow:N', alt.Tooltip('Abs:Q', title='Customers')]
+            ).properties(height=240)
+            zero_rule = alt.Chart(pd.DataFrame({'x': [0]})).mark_rule(color='#CBD5F5').encode(x='x:Q')
+            charts.altair_chart(porting_chart + zero_rule, use_container_width=True)
+            col_p1, col_p2 = st.columns(2)
+            with col_p1:
+                st.markdown("""
+                <div style="background: #D1FAE5; border-radius: 20px; padding: 0.5rem 1rem; text-align: center;">
+                    <span style="color: #065F46; font-weight: 600;">Net: +432 customers</span>
+                </div>
+                """, unsafe_allow_html=True)
+            with col_p2:
+                st.markdown("""
+                <div style="background: #E0F2FE; border-radius: 20px; padding: 0.5rem 1rem; text-align: center;">
+                    <span style="color: #0369A1; font-weight: 600;">Three: +167 | EE: -45</span>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Customer Health & Value</div>', unsafe_allow_html=True)
+        cust_left, cust_right = st.columns(2)
+        with cust_left:
+            st.markdown('<div class="section-header">NPS by Segment</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                nps_data = pd.DataFrame({
+                    'Segment': ['Enterprise', 'SMB', 'Premium', 'Standard', 'Budget'],
+                    'NPS': [62, 51, 48, 42, 35]
+                })
+                nps_bars = alt.Chart(nps_data).mark_bar(cornerRadiusEnd=6, color='#29B5E8').encode(
+                    y=alt.Y('Segment:N', sort='-x', title=None),
+                    x=alt.X('NPS:Q', title='NPS Score', scale=alt.Scale(domain=[0, 70])),
+                    tooltip=['Segment:N', 'NPS:Q']
+                ).properties(height=220)
+                charts.altair_chart(nps_bars, use_container_width=True)
+        
+        with cust_right:
+            st.markdown('<div class="section-header">Churn Risk by Segment</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                churn_data = pd.DataFrame({
+                    'Segment': ['Enterprise', 'SMB', 'Premium', 'Standard', 'Budget'],
+                    'Churn Rate': [0.8, 1.4, 1.6, 2.1, 3.2],
+                    'At Risk': [10, 110, 83, 220, 175],
+                    'Revenue Impact': [14.2, 63.8, 37.4, 70.4, 38.5]
+                })
+                churn_bars = alt.Chart(churn_data).mark_bar(
+                    cornerRadiusTopRight=6, cornerRadiusBottomRight=6
+                ).encode(
+                    x=alt.X('Churn Rate:Q', title='Churn Rate (%)', scale=alt.Scale(domain=[0, 4])),
+                    y=alt.Y('Segment:N', sort='-x', title=None),
+                    color=alt.Color('Churn Rate:Q', scale=alt.Scale(domain=[0, 4], range=['#10B981', '#F59E0B', '#EF4444']), legend=None),
+                    tooltip=[
+                        alt.Tooltip('Segment:N'),
+                        alt.Tooltip('Churn Rate:Q', title='Churn %', format='.1f'),
+                        alt.Tooltip('At Risk:Q', title='At Risk Customers'),
+                        alt.Tooltip('Revenue Impact:Q', title='Revenue at Risk (£K)', format='.1f')
+                    ]
+                ).properties(height=220)
+                charts.altair_chart(churn_bars, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Experience vs NPS</div>', unsafe_allow_html=True)
+        with st.container(border=True):
+            exp_df = pd.DataFrame({
+                'Region': ['London', 'South East', 'Midlands', 'North West', 'North East', 'Scotland', 'Wales', 'East'],
+                'Experience Score': [84, 81, 78, 76, 74, 79, 75, 80],
+                'NPS': [56, 49, 44, 42, 39, 46, 41, 47]
+            })
+            exp_scatter = alt.Chart(exp_df).mark_circle(size=180, opacity=0.75).encode(
+                x=alt.X('Experience Score:Q', title='Network Experience Score'),
+                y=alt.Y('NPS:Q', title='NPS'),
+                color=alt.Color('Region:N', legend=alt.Legend(orient='bottom', title=None)),
+                tooltip=['Region:N', 'Experience Score:Q', 'NPS:Q']
+            ).properties(height=260)
+            charts.altair_chart(exp_scatter, use_container_width=True)
+
+        st.markdown('<div class="section-header">Churn Cohort Waterfall</div>', unsafe_allow_html=True)
+        with st.container(border=True):
+            waterfall_df = tiles['churn_waterfall']
+            if waterfall_df is None:
+                waterfall_df = cube.waterfall_frame([
+                    ('Base', 0.0, 30.2e6), ('New Adds', 30.2e6, 31.0e6), ('Save Offers', 31.0e6, 31.6e6),
+                    ('Churn', 31.6e6, 30.8e6), ('Migrations', 30.8e6, 31.1e6), ('End', 0.0, 31.1e6)
+                ])
+            charts.altair_chart(_churn_waterfall(waterfall_df), use_container_width=True)
+
+        st.markdown('<div class="section-header">Growth & Mix</div>', unsafe_allow_html=True)
+        st.markdown("**Customer Base Trend (12 Months)**")
+        with st.container(border=True):
+            trend_months = pd.DataFrame({
+                'Month': ['Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan'],
+                'Customers': [101.0, 101.3, 101.6, 101.9, 102.2, 102.5, 102.8, 103.0, 103.2, 103.3, 103.4, 103.5]
+            })
+            trend_months['Net_Adds_K'] = (trend_months['Customers'] - trend_months['Customers'].iloc[0]).round(2)
+            area_chart = alt.Chart(trend_months).mark_area(
+                color='#29B5E8', opacity=0.3, line={'color': '#29B5E8', 'strokeWidth': 2}
+            ).encode(
+                x=alt.X('Month:N', sort=list(trend_months['Month']), title=None, axis=alt.Axis(labelAngle=0)),
+                y=alt.Y('Net_Adds_K:Q', title=None, scale=alt.Scale(domain=[0, 3], zero=True), axis=alt.Axis(format='.1f', tickCount=4)),
+                tooltip=[alt.Tooltip('Month:N'), alt.Tooltip('Net_Adds_K:Q', title='Net Adds (K)', format='.2f')]
+            ).properties(height=180)
+            points = alt.Chart(trend_months).mark_circle(color='#29B5E8', size=40).encode(
+                x=alt.X('Month:N', sort=list(trend_months['Month'])),
+                y=alt.Y('Net_Adds_K:Q', scale=alt.Scale(domain=[0, 3], zero=True))
+            )
+            charts.altair_chart(area_chart + points, use_container_width=True)
+            st.caption("Net Adds (K) vs Feb baseline")
+        
+        st.markdown('<div class="section-header">Revenue & Subscriber Trend</div>', unsafe_allow_html=True)
+        with st.container(border=True):
+            trend_data = pd.DataFrame({
+                'Month': ['Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan'],
+                'Revenue': [4.2, 4.35, 4.48, 4.52, 4.61, 4.78, 4.85, 4.92, 5.05, 5.18, 5.32, 5.48],
+                'Subscribers': [28.5, 28.9, 29.2, 29.6, 30.1, 30.4, 30.8, 31.1, 31.5, 31.9, 32.2, 32.4]
+            })
+            base = alt.Chart(trend_data).encode(
+                x=alt.X('Month:N', sort=list(trend_data['Month']), title=None, axis=alt.Axis(labelAngle=0))
+            )
+            revenue_line = base.mark_line(color='#10B981', strokeWidth=2).encode(
+                y=alt.Y('Revenue:Q', title='Revenue (£M)', scale=alt.Scale(domain=[4, 6])),
+                tooltip=[alt.Tooltip('Month:N'), alt.Tooltip('Revenue:Q', title='Revenue (£M)', format='.2f')]
+            )
+            subs_line = base.mark_line(color='#29B5E8', strokeWidth=2, strokeDash=[4, 3]).encode(
+                y=alt.Y('Subscribers:Q', title='Subscribers (K)', scale=alt.Scale(domain=[28, 34])),
+                tooltip=[alt.Tooltip('Month:N'), alt.Tooltip('Subscribers:Q', title='Subscribers (K)', format='.1f')]
+            )
+            charts.altair_chart(alt.layer(revenue_line, subs_line).resolve_scale(y='independent').properties(height=220), use_container_width=True)
+
+        st.markdown('<div class="section-header">Customer Value & Competitive Signals</div>', unsafe_allow_html=True)
+        value_col1, value_col2 = st.columns(2)
+        
+        with value_col1:
+            st.markdown("**ARPU by Segment**")
+            with st.container(border=True):
+                arpu_bar = alt.Chart(arpu_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('ARPU:Q', title='ARPU (£)'),
+                    y=alt.Y('Segment:N', sort='-x', title=None),
+                    color=alt.value('#14B8A6'),
+                    tooltip=['Segment:N', 'ARPU:Q']
+                ).properties(height=180)
+                charts.altair_chart(arpu_bar, use_container_width=True)
+        
+        with value_col2:
+            st.markdown("**Competitive Win/Loss Trend**")
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                win_df = pd.DataFrame({
+                    'Month': months,
+                    'Wins': [48, 52, 50, 55, 57, 60],
+                    'Losses': [34, 33, 35, 30, 28, 26]
+                })
+                win_long = win_df.melt('Month', var_name='Outcome', value_name='Count')
+                win_line = alt.Chart(win_long).mark_line(point=True).encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('Count:Q', title='Deals'),
+                    color=alt.Color('Outcome:N', scale=alt.Scale(range=['#22C55E', '#EF4444'])),
+                    tooltip=['Month:N', 'Outcome:N', 'Count:Q']
+                ).properties(height=180)
+                charts.altair_chart(win_line, use_container_width=True)
+
+    with tab_strategy:
+        st.markdown("""
+        <div class="sf-pulse">
+            <div class="sf-pulse-header">
+                <div class="sf-pulse-title">❄️ Snowflake Intelligence Pulse</div>
+                <div class="sf-pulse-tag">AI LIVE</div>
+            </div>
+            <div class="sf-pulse-metrics">
+                <div class="sf-pulse-card">
+                    <div class="sf-pulse-label">Revenue Momentum</div>
+                    <div class="sf-pulse-value">+8.4%</div>
+                    <div class="sf-pulse-sub">YoY growth</div>
+                </div>
+                <div class="sf-pulse-card">
+                    <div class="sf-pulse-label">Churn Risk</div>
+                    <div class="sf-pulse-value">2.1%</div>
+                    <div class="sf-pulse-sub">Improving</div>
+                </div>
+                <div class="sf-pulse-card">
+                    <div class="sf-pulse-label">5G Adoption</div>
+                    <div class="sf-pulse-value">42%</div>
+                    <div class="sf-pulse-sub">+8% QoQ</div>
+                </div>
+                <div class="sf-pulse-card">
+                    <div class="sf-pulse-label">Enterprise ARPU</div>
+                    <div class="sf-pulse-value">£142</div>
+                    <div class="sf-pulse-sub">4.4x Consumer</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown('<div class="section-header">AI Executive Summary</div>', unsafe_allow_html=True)
+        if st.session_state.get('sf_highlights', True):
+            st.info("❄️ **Powered by Snowflake Cortex AI** — Executive summary synthesized from revenue, churn, market share, and network quality data.")
+        
+        with st.container(border=True):
+            st.markdown("""
+            **Executive Summary (Q1 2026):**
+            - Revenue growth remains strong at **+8.4% YoY**, supported by enterprise ARPU and port-in momentum.
+            - Churn risk improved to **2.1%**, though prepaid segments need targeted retention.
+            - Market share reached **5.2%**, with 5G adoption accelerating in priority regions.
+            """)
+
+        st.markdown('<div class="section-header">Signals & Insights</div>', unsafe_allow_html=True)
+        insight_cols = st.columns(3)
+        with insight_cols[0]:
+            st.markdown('<div class="section-header">Top Insights</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                - **Enterprise ARPU** £142 driving margin expansion
+                - **Net port-ins** +432 MTD from Three
+                - **Revenue mix** steady with SMB uplift
+                """)
+        with insight_cols[1]:
+            st.markdown('<div class="section-header">Risk Signals</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                - **Prepaid churn** still above target
+                - **Yorkshire NPS** trailing by 9 points
+                - **Competitive pressure** vs EE in East
+                """)
+        with insight_cols[2]:
+            st.markdown('<div class="section-header">Growth Signals</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                - **5G adoption** +12% YoY
+                - **Enterprise pipeline** £1.8M active
+                - **Digital conversion** +7% QoQ
+                """)
+
+        # AI-Powered Strategic Recommendations
+        st.markdown('<div class="section-header">AI-Powered Strategic Recommendations</div>', unsafe_allow_html=True)
+        
+        action_cols = st.columns(3)
+        with action_cols[0]:
+            with st.container(border=True):
+                st.markdown("""
+                - **Target churn hotspots** with win-back bundles
+                - Focus on prepaid segments in the North
+                """)
+        with action_cols[1]:
+            with st.container(border=True):
+                st.markdown("""
+                - **Accelerate 5G rollout** in Yorkshire & Midlands
+                - Prioritize high NPS impact zones
+                """)
+        with action_cols[2]:
+            with st.container(border=True):
+                st.markdown("""
+                - **Scale enterprise sales** in top 3 verticals
+                - Goal: +£2.8M ARR in H1
+                """)
+
+        st.markdown('<div class="section-header">Executive Strategic Priorities — Q1 2026</div>', unsafe_allow_html=True)
+        action_cols = st.columns(3)
+        with action_cols[0]:
+            with st.container(border=True):
+                st.markdown("""
+                **1) Retention Focus**
+                - Target prepaid churn hotspots
+                - Offer tiered win-back bundles
+                - Goal: reduce churn by 0.4%
+                """)
+        with action_cols[1]:
+            with st.container(border=True):
+                st.markdown("""
+                **2) Competitive Capture**
+                - Double down on Three defectors
+                - Geo-target Manchester/Leeds
+                - Goal: +500 net adds
+                """)
+        with action_cols[2]:
+            with st.container(border=True):
+                st.markdown("""
+                **3) Enterprise Acceleration**
+                - Expand sales pods in London
+                - Prioritize high-ARPU verticals
+                - Goal: +£2.8M ARR
+                """)
+
+        st.markdown('<div class="section-header">Ask Snowflake Intelligence</div>', unsafe_allow_html=True)
+        
+        suggested_questions = [
+            "I'm preparing for a board meeting tomorrow. Give me a complete health check of SnowTelco.",
+            "Tell me more about our churn situation. Which segments are most at risk?",
+            "Show me the profile of our highest-risk customers. What do they have in common?",
+            "What retention offers can we make? Check our retention policy.",
+            "Is network quality contributing to our churn? Show me the correlation.",
+            "Based on everything, create a prioritized action plan for reducing churn."
+        ]
+        
+        sf_intel_url = "https://ai.snowflake.com/sfseeurope/pjose_aws3"
+        
+        cols = st.columns(2)
+        for i, q in enumerate(suggested_questions):
+            with cols[i % 2]:
+                escaped_q = q.replace('"', '&quot;').replace("'", "&#39;")
+                st.markdown(f"""
+                <a href="{sf_intel_url}" target="_blank" onclick="navigator.clipboard.writeText('{escaped_q}')" style="text-decoration: none; color: inherit; display: block;">
+                    <div class="question-card">
+                        <p style="margin-bottom: 1.5rem;"><strong>Q{i+1}:</strong> "{q}"</p>
+                    </div>
+                </a>
+                """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div style="text-align: center; margin-top: 1.5rem; padding: 1rem; background: linear-gradient(135deg, #29B5E8 0%, #1A8BC4 100%); border-radius: 8px;">
+            <a href="{sf_intel_url}" target="_blank" style="color: white; text-decoration: none;">
+                <p style="margin: 0; font-weight: 600; font-size: 1rem;">
+                    ❄️ Ask these questions in Snowflake Intelligence →
+                </p>
+            </a>
+        </div>
+        """, unsafe_allow_html=True)
+
+
+# Chart builders for the Executive Performance Signals, Revenue Bridge, ARPU &
+# Plan Mix, Regional Performance Heatmap and Churn Cohort Waterfall sections.
+# Their specs are cached on the data fingerprint, so reruns with unchanged data
+# skip building and validating the Altair charts.
+
+@charts.cached_chart
+def _segment_revenue_bar(seg_df):
+    return alt.Chart(seg_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+        x=alt.X('Revenue:Q', title='Revenue (£M)'),
+        y=alt.Y('Segment:N', sort='-x', title=None),
+        color=alt.value('#29B5E8'),
+        tooltip=['Segment:N', alt.Tooltip('Revenue:Q', format='.1f')]
+    ).properties(height=180)
+
+
+@charts.cached_chart
+def _nps_churn_scatter(churn_df):
+    return alt.Chart(churn_df).mark_circle(size=120, color='#8B5CF6').encode(
+        x=alt.X('NPS:Q', title='NPS'),
+        y=alt.Y('Churn:Q', title='Churn %'),
+        tooltip=['Segment:N', 'NPS:Q', alt.Tooltip('Churn:Q', format='.1f')]
+    ).properties(height=180)
+
+
+@charts.cached_chart
+def _revenue_bridge(bridge_df):
+    bridge_bar = alt.Chart(bridge_df).mark_bar(cornerRadiusTopLeft=4, cornerRadiusTopRight=4).encode(
+        x=alt.X('Driver:N', title=None),
+        y=alt.Y('Impact:Q', title='£M'),
+        color=alt.Color('Type:N', scale=alt.Scale(domain=['Up', 'Down', 'Total'], range=['#10B981', '#EF4444', '#3B82F6']), legend=None),
+        tooltip=['Driver:N', alt.Tooltip('Impact:Q', format='.1f')]
+    ).properties(height=200)
+    bridge_text = alt.Chart(bridge_df).mark_text(dy=-8, fontSize=10, fontWeight='bold').encode(
+        x='Driver:N',
+        y='Impact:Q',
+        text='Label:N',
+        color=alt.value('#1B2A4E')
+    )
+    return bridge_bar + bridge_text
+
+
+@charts.cached_chart
+def _arpu_bar(arpu_df):
+    return alt.Chart(arpu_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+        x=alt.X('ARPU:Q', title='ARPU (£)'),
+        y=alt.Y('Segment:N', sort='-x', title=None),
+        color=alt.value('#14B8A6'),
+        tooltip=['Segment:N', 'ARPU:Q']
+    ).properties(height=200)
+
+
+@charts.cached_chart
+def _plan_mix_bar(plan_df):
+    return alt.Chart(plan_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+        x=alt.X('Share:Q', title='Share %'),
+        y=alt.Y('Plan:N', sort='-x', title=None),
+        color=alt.value('#6366F1'),
+        tooltip=['Plan:N', alt.Tooltip('Share:Q', format='.0f')]
+    ).properties(height=200)
+
+
+@charts.cached_chart
+def _regional_heatmap(heat_long):
+    return alt.Chart(heat_long).mark_rect().encode(
+        x=alt.X('Metric:N', title=None),
+        y=alt.Y('Region:N', sort='-x', title=None),
+        color=alt.Color('Value:Q', scale=alt.Scale(scheme='blues')),
+        tooltip=['Region:N', 'Metric:N', alt.Tooltip('Value:Q', format='.1f')]
+    ).properties(height=260)
+
+
+@charts.cached_chart
+def _churn_waterfall(waterfall_df):
+    waterfall = alt.Chart(waterfall_df).mark_bar(cornerRadiusTopLeft=4, cornerRadiusTopRight=4).encode(
+        x=alt.X('Stage:N', sort=list(waterfall_df['Stage']), title=None),
+        y=alt.Y('Start:Q', title='Subscribers', axis=alt.Axis(format='~s')),
+        y2='End:Q',
+        color=alt.Color('Type:N', scale=alt.Scale(domain=['Increase', 'Decrease', 'Total'], range=['#10B981', '#EF4444', '#3B82F6']), legend=None),
+        tooltip=['Stage:N', 'Type:N', alt.Tooltip('Start:Q', format=',.0f'), alt.Tooltip('End:Q', format=',.0f')]
+    ).properties(height=220)
+    waterfall_text = alt.Chart(waterfall_df).mark_text(dy=-8, fontSize=10, fontWeight='bold').encode(
+        x=alt.X('Stage:N', sort=list(waterfall_df['Stage'])),
+        y='End:Q',
+        text='Label:N',
+        color=alt.value('#1B2A4E')
+    )
+    return waterfall + waterfall_text
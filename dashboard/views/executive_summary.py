@@ -0,0 +1,336 @@
+"""Executive Summary page."""
+
+import streamlit as st
+
+
+def render_executive_summary():
+    # EXECUTIVE SUMMARY - DATA CLOUD BANNER (Hub & Spoke) with Floating Particles
+    st.markdown("""<div class="hub-banner">
+        <div class="hub-particles">
+            <div class="hub-particle" style="left: 10%; top: 80%; animation-delay: 0s;"></div>
+            <div class="hub-particle small" style="left: 20%; top: 70%; animation-delay: 0.5s;"></div>
+            <div class="hub-particle" style="left: 30%; top: 85%; animation-delay: 1s;"></div>
+            <div class="hub-particle small" style="left: 40%; top: 75%; animation-delay: 1.5s;"></div>
+            <div class="hub-particle" style="left: 50%; top: 90%; animation-delay: 2s;"></div>
+            <div class="hub-particle small" style="left: 60%; top: 80%; animation-delay: 2.5s;"></div>
+            <div class="hub-particle" style="left: 70%; top: 85%; animation-delay: 3s;"></div>
+            <div class="hub-particle small" style="left: 80%; top: 75%; animation-delay: 3.5s;"></div>
+            <div class="hub-particle" style="left: 90%; top: 80%; animation-delay: 0.8s;"></div>
+            <div class="hub-sparkle" style="left: 15%; top: 20%; animation-delay: 0s;"></div>
+            <div class="hub-sparkle" style="left: 85%; top: 30%; animation-delay: 1s;"></div>
+            <div class="hub-sparkle" style="left: 45%; top: 15%; animation-delay: 2s;"></div>
+        </div>
+        <div class="hub-title">❄️ Snowflake AI Data Cloud</div><div class="hub-subtitle">Breaking Down Data Silos in Real-Time</div><div class="hub-content"><div class="hub-sources"><div class="hub-source"><span class="hub-source-icon">📡</span><span class="hub-source-label">Network</span></div><div class="hub-source"><span class="hub-source-icon">⚙️</span><span class="hub-source-label">OSS/BSS</span></div><div class="hub-source"><span class="hub-source-icon">🏪</span><span class="hub-source-label">Marketplace</span></div></div><div class="hub-arrows"><span class="hub-arrow">→</span><span class="hub-arrow">→</span><span class="hub-arrow">→</span></div><div class="hub-center"><span class="hub-center-icon">❄️</span><span class="hub-center-label">Snowflake</span></div><div class="hub-arrows"><span class="hub-arrow">→</span><span class="hub-arrow">→</span><span class="hub-arrow">→</span></div><div class="hub-sources"><div class="hub-source"><span class="hub-source-icon">📊</span><span class="hub-source-label">Analytics</span></div><div class="hub-source"><span class="hub-source-icon">🤖</span><span class="hub-source-label">AI/ML</span></div><div class="hub-source"><span class="hub-source-icon">💡</span><span class="hub-source-label">Insights</span></div></div></div><div class="hub-stats"><div class="hub-stat"><div class="hub-stat-value">60%</div><div class="hub-stat-label">Faster Insights</div></div><div class="hub-stat"><div class="hub-stat-value">40%</div><div class="hub-stat-label">Cost Reduction</div></div><div class="hub-stat"><div class="hub-stat-value">100%</div><div class="hub-stat-label">Data Unified</div></div><div class="hub-stat"><div class="hub-stat-value">5x</div><div class="hub-stat-label">ROI</div></div></div></div>""", unsafe_allow_html=True)
+    
+    st.markdown('<div class="section-header">About Snowflake</div>', unsafe_allow_html=True)
+    
+    col1, col2, col3, col4 = st.columns(4)
+    metrics = [
+        ("11,000+", "Enterprise Customers"),
+        ("$3.5B+", "Annual Revenue"),
+        ("~50%", "Fortune 500 Companies"),
+        ("#1", "Data Cloud Platform")
+    ]
+    for col, (value, label) in zip([col1, col2, col3, col4], metrics):
+        with col:
+            st.markdown(f"""
+            <div class="metric-card" style="text-align: center;">
+                <div class="metric-value" style="color: #29B5E8;">{value}</div>
+                <div class="metric-label">{label}</div>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    st.markdown('<div class="section-header">Why Snowflake for Telecom</div>', unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("""
+        <div class="architecture-box" style="min-height: 220px;">
+            <div style="font-size: 2rem; margin-bottom: 0.5rem;">🚀</div>
+            <h4>Bring Data & AI to Life</h4>
+            <p>Save time on building, configuring and tuning infrastructure with a single, 
+            fully managed platform. Streamline workflows, power business-critical use cases 
+            and uncover new commercial strategies.</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div class="architecture-box" style="min-height: 220px;">
+            <div style="font-size: 2rem; margin-bottom: 0.5rem;">🔗</div>
+            <h4>Connected Ecosystem</h4>
+            <p>Connect with mobile network operators, content providers, network equipment providers, 
+            and top data solutions providers. Optimize network performance, enhance customer experiences 
+            and monetize services more effectively.</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown("""
+        <div class="architecture-box" style="min-height: 220px;">
+            <div style="font-size: 2rem; margin-bottom: 0.5rem;">🔒</div>
+            <h4>Trusted Governance</h4>
+            <p>Govern and protect your data with best-in-class security. Use AI and large language models 
+            within Snowflake's security perimeter, with built-in policies, access controls and 
+            end-to-end observability.</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown('<div class="section-header">Leading Telcos Trust Snowflake</div>', unsafe_allow_html=True)
+    
+    customers = [
+        {"name": "AT&T", "logo": "https://upload.wikimedia.org/wikipedia/commons/thumb/3/31/AT%26T_logo_2016.svg/200px-AT%26T_logo_2016.svg.png"},
+        {"name": "T-Mobile", "logo": "https://upload.wikimedia.org/wikipedia/commons/thumb/8/88/T-Mobile_US_Logo_2022_RGB_Magenta_on_Transparent.svg/500px-T-Mobile_US_Logo_2022_RGB_Magenta_on_Transparent.svg.png"},
+        {"name": "Deutsche Telekom", "logo": "https://upload.wikimedia.org/wikipedia/commons/thumb/d/dd/Deutsche_Telekom_2022.svg/250px-Deutsche_Telekom_2022.svg.png"},
+        {"name": "Vodafone", "logo": "https://upload.wikimedia.org/wikipedia/en/thumb/c/cc/Vodafone_2017_logo.svg/500px-Vodafone_2017_logo.svg.png"},
+    ]
+    
+    cols = st.columns(4)
+    for col, customer in zip(cols, customers):
+        with col:
+            st.markdown(f"""
+            <div style="background: white; border: 1px solid #E5E7EB; border-radius: 12px; padding: 1.25rem; text-align: center; min-height: 100px; display: flex; flex-direction: column; justify-content: center; align-items: center;">
+                <div style="height: 60px; display: flex; align-items: center; justify-content: center;">
+                    <img src="{customer['logo']}" alt="{customer['name']}" style="max-height: 50px; max-width: 120px; object-fit: contain;">
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    st.markdown('<div class="section-header">Business Benefits & KPIs</div>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        <div style="background: linear-gradient(135deg, #E8F7FC 0%, #F0FAFF 100%); border-radius: 12px; padding: 1.5rem;">
+            <h4 style="color: #1B2A4E; margin-top: 0;">💰 Revenue & Growth</h4>
+            <ul style="color: #1B2A4E; margin: 0; padding-left: 1.2rem;">
+                <li><strong>15-25%</strong> reduction in customer churn</li>
+                <li><strong>20-30%</strong> increase in upsell conversion</li>
+                <li><strong>10-15%</strong> ARPU improvement</li>
+                <li><strong>$10M+</strong> fraud prevention savings</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("")
+        
+        st.markdown("""
+        <div style="background: linear-gradient(135deg, #FEF3C7 0%, #FFFBEB 100%); border-radius: 12px; padding: 1.5rem;">
+            <h4 style="color: #1B2A4E; margin-top: 0;">⚡ Operational Excellence</h4>
+            <ul style="color: #1B2A4E; margin: 0; padding-left: 1.2rem;">
+                <li><strong>40-60%</strong> faster time-to-insight</li>
+                <li><strong>30%</strong> network ops cost reduction</li>
+                <li><strong>50%</strong> less data engineering effort</li>
+                <li><strong>80%</strong> faster reporting</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div style="background: linear-gradient(135deg, #D1FAE5 0%, #ECFDF5 100%); border-radius: 12px; padding: 1.5rem;">
+            <h4 style="color: #1B2A4E; margin-top: 0;">📈 Customer Experience</h4>
+            <ul style="color: #1B2A4E; margin: 0; padding-left: 1.2rem;">
+                <li><strong>+15 pts</strong> NPS improvement</li>
+                <li><strong>25%</strong> call center volume reduction</li>
+                <li><strong>Real-time</strong> network issue detection</li>
+                <li><strong>360°</strong> unified customer view</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("")
+        
+        st.markdown("""
+        <div style="background: linear-gradient(135deg, #EDE9FE 0%, #F5F3FF 100%); border-radius: 12px; padding: 1.5rem;">
+            <h4 style="color: #1B2A4E; margin-top: 0;">🔒 Security & Governance</h4>
+            <ul style="color: #1B2A4E; margin: 0; padding-left: 1.2rem;">
+                <li><strong>Single source</strong> of truth</li>
+                <li><strong>GDPR/CCPA</strong> compliance built-in</li>
+                <li><strong>Row/column</strong> level access control</li>
+                <li><strong>Full audit</strong> trail & lineage</li>
+            </ul>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown('<div class="section-header">Join the Connected Future of Telecom</div>', unsafe_allow_html=True)
+    
+    use_cases = [
+        ("Churn Prediction", "Identify at-risk customers with ML models"),
+        ("Network Analytics", "Real-time performance monitoring"),
+        ("Revenue Assurance", "Detect billing anomalies and leakage"),
+        ("Customer 360", "Unified cross-channel customer view"),
+        ("Fraud Detection", "AI-powered SIM swap detection"),
+        ("5G Monetization", "Optimize 5G pricing and adoption"),
+    ]
+    
+    cols = st.columns(3)
+    for i, (title, desc) in enumerate(use_cases):
+        with cols[i % 3]:
+            st.markdown(f"""
+            <div class="talking-point" style="min-height: 70px;">
+                <strong>{title}</strong><br>
+                <span style="font-weight: 400; font-size: 0.85rem;">{desc}</span>
+            </div>
+            """, unsafe_allow_html=True)
+    
+    st.markdown('<div class="section-header">About This Demo</div>', unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div style="background: white; border: 2px solid #29B5E8; border-radius: 12px; padding: 1.5rem;">
+        <h4 style="color: #1B2A4E; margin-top: 0;">SnowTelco — Snowflake Intelligence Demo</h4>
+        <p style="color: #1B2A4E;">A comprehensive demo showcasing <strong>Snowflake Intelligence</strong> for a fictional UK telco:</p>
+        <div style="display: flex; flex-wrap: wrap; gap: 1rem; margin-top: 1rem;">
+            <div style="flex: 1; min-width: 150px; background: #F8FAFC; padding: 1rem; border-radius: 8px; text-align: center;">
+                <strong style="color: #29B5E8; font-size: 1.5rem;">30K+</strong><br>
+                <span style="color: #6B7280; font-size: 0.8rem;">Subscribers</span>
+            </div>
+            <div style="flex: 1; min-width: 150px; background: #F8FAFC; padding: 1rem; border-radius: 8px; text-align: center;">
+                <strong style="color: #29B5E8; font-size: 1.5rem;">34</strong><br>
+                <span style="color: #6B7280; font-size: 0.8rem;">Semantic Views</span>
+            </div>
+            <div style="flex: 1; min-width: 150px; background: #F8FAFC; padding: 1rem; border-radius: 8px; text-align: center;">
+                <strong style="color: #29B5E8; font-size: 1.5rem;">32</strong><br>
+                <span style="color: #6B7280; font-size: 0.8rem;">Dashboards</span>
+            </div>
+            <div style="flex: 1; min-width: 150px; background: #F8FAFC; padding: 1rem; border-radius: 8px; text-align: center;">
+                <strong style="color: #29B5E8; font-size: 1.5rem;">7</strong><br>
+                <span style="color: #6B7280; font-size: 0.8rem;">Search Services</span>
+            </div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("""
+        <div style="background: #F8FAFC; border-radius: 12px; padding: 1.5rem; margin-top: 1rem;">
+            <h4 style="color: #1B2A4E; margin-top: 0;">📊 Data Scale</h4>
+            <table style="width: 100%; color: #1B2A4E; font-size: 0.9rem;">
+                <tr><td style="padding: 0.3rem 0;"><strong>Subscribers</strong></td><td style="text-align: right;">30,000+ (B2C, SMB, Enterprise)</td></tr>
+                <tr><td style="padding: 0.3rem 0;"><strong>Network Sites</strong></td><td style="text-align: right;">500+ cell sites (4G/5G)</td></tr>
+                <tr><td style="padding: 0.3rem 0;"><strong>Support Tickets</strong></td><td style="text-align: right;">50,000+ historical records</td></tr>
+                <tr><td style="padding: 0.3rem 0;"><strong>Billing Records</strong></td><td style="text-align: right;">100,000+ invoices</td></tr>
+                <tr><td style="padding: 0.3rem 0;"><strong>Network Alarms</strong></td><td style="text-align: right;">25,000+ events</td></tr>
+                <tr><td style="padding: 0.3rem 0;"><strong>Partner Channels</strong></td><td style="text-align: right;">150+ retail partners</td></tr>
+                <tr><td style="padding: 0.3rem 0;"><strong>Retail Stores</strong></td><td style="text-align: right;">170 locations UK-wide</td></tr>
+            </table>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown("""
+        <div style="background: #F8FAFC; border-radius: 12px; padding: 1.5rem; margin-top: 1rem;">
+            <h4 style="color: #1B2A4E; margin-top: 0;">🤖 AI Capabilities</h4>
+            <table style="width: 100%; color: #1B2A4E; font-size: 0.9rem;">
+                <tr><td style="padding: 0.3rem 0;"><strong>Cortex Agent</strong></td><td style="text-align: right;">1 Executive Agent</td></tr>
+                <tr><td style="padding: 0.3rem 0;"><strong>Agent Tools</strong></td><td style="text-align: right;">41 tools (34 Analyst + 7 Search)</td></tr>
+                <tr><td style="padding: 0.3rem 0;"><strong>Semantic Views</strong></td><td style="text-align: right;">34 business domains</td></tr>
+                <tr><td style="padding: 0.3rem 0;"><strong>Cortex Search</strong></td><td style="text-align: right;">7 document collections</td></tr>
+                <tr><td style="padding: 0.3rem 0;"><strong>ML Models</strong></td><td style="text-align: right;">Churn, Upsell, CLV propensity</td></tr>
+                <tr><td style="padding: 0.3rem 0;"><strong>Document Pages</strong></td><td style="text-align: right;">200+ policy & strategy docs</td></tr>
+                <tr><td style="padding: 0.3rem 0;"><strong>Demo Questions</strong></td><td style="text-align: right;">150+ curated questions</td></tr>
+            </table>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div style="background: #F8FAFC; border-radius: 12px; padding: 1.5rem; margin-top: 1rem; border: 1px solid #E2E8F0;">
+        <h4 style="color: #1B2A4E; margin-top: 0;">🎯 Demo Coverage</h4>
+        <div style="display: flex; flex-wrap: wrap; gap: 0.5rem;">
+            <span style="background: rgba(41,181,232,0.2); color: #29B5E8; padding: 0.3rem 0.8rem; border-radius: 20px; font-size: 0.8rem;">Finance & Billing</span>
+            <span style="background: rgba(41,181,232,0.2); color: #29B5E8; padding: 0.3rem 0.8rem; border-radius: 20px; font-size: 0.8rem;">Network Operations</span>
+            <span style="background: rgba(41,181,232,0.2); color: #29B5E8; padding: 0.3rem 0.8rem; border-radius: 20px; font-size: 0.8rem;">Customer Service</span>
+            <span style="background: rgba(41,181,232,0.2); color: #29B5E8; padding: 0.3rem 0.8rem; border-radius: 20px; font-size: 0.8rem;">Sales & Marketing</span>
+            <span style="background: rgba(41,181,232,0.2); color: #29B5E8; padding: 0.3rem 0.8rem; border-radius: 20px; font-size: 0.8rem;">HR & Workforce</span>
+            <span style="background: rgba(41,181,232,0.2); color: #29B5E8; padding: 0.3rem 0.8rem; border-radius: 20px; font-size: 0.8rem;">Fraud Detection</span>
+            <span style="background: rgba(41,181,232,0.2); color: #29B5E8; padding: 0.3rem 0.8rem; border-radius: 20px; font-size: 0.8rem;">Partner Management</span>
+            <span style="background: rgba(41,181,232,0.2); color: #29B5E8; padding: 0.3rem 0.8rem; border-radius: 20px; font-size: 0.8rem;">Retail Operations</span>
+            <span style="background: rgba(41,181,232,0.2); color: #29B5E8; padding: 0.3rem 0.8rem; border-radius: 20px; font-size: 0.8rem;">B2B Contracts</span>
+            <span style="background: rgba(41,181,232,0.2); color: #29B5E8; padding: 0.3rem 0.8rem; border-radius: 20px; font-size: 0.8rem;">Wholesale/MVNO</span>
+            <span style="background: rgba(41,181,232,0.2); color: #29B5E8; padding: 0.3rem 0.8rem; border-radius: 20px; font-size: 0.8rem;">Sustainability</span>
+            <span style="background: rgba(41,181,232,0.2); color: #29B5E8; padding: 0.3rem 0.8rem; border-radius: 20px; font-size: 0.8rem;">Regulatory/SLA</span>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # ANIMATED ARCHITECTURE DIAGRAM
+    st.markdown('<div class="section-header">Architecture Overview</div>', unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div class="arch-container">
+        <div class="arch-row">
+            <div class="arch-column">
+                <div class="arch-section-label">Data Sources</div>
+                <div class="arch-box source"><span class="arch-icon">📡</span><div><div class="arch-label">Network Ops</div><div class="arch-sublabel">Performance & Sites</div></div></div>
+                <div class="arch-box source"><span class="arch-icon">🚨</span><div><div class="arch-label">Network Alarms</div><div class="arch-sublabel">NOC Events</div></div></div>
+                <div class="arch-box source"><span class="arch-icon">📶</span><div><div class="arch-label">RAN Data</div><div class="arch-sublabel">Cell Site Analytics</div></div></div>
+                <div class="arch-box source"><span class="arch-icon">💳</span><div><div class="arch-label">Billing</div><div class="arch-sublabel">Revenue & Invoices</div></div></div>
+                <div class="arch-box source"><span class="arch-icon">👥</span><div><div class="arch-label">Subscribers</div><div class="arch-sublabel">Customer Records</div></div></div>
+                <div class="arch-box source"><span class="arch-icon">🎫</span><div><div class="arch-label">Support Tickets</div><div class="arch-sublabel">Contact Center</div></div></div>
+                <div class="arch-box source"><span class="arch-icon">📦</span><div><div class="arch-label">Orders</div><div class="arch-sublabel">Activations & SIMs</div></div></div>
+                <div class="arch-box source"><span class="arch-icon">🤝</span><div><div class="arch-label">Partners</div><div class="arch-sublabel">Channel & Retail</div></div></div>
+                <div class="arch-box source"><span class="arch-icon">📊</span><div><div class="arch-label">Market Intel</div><div class="arch-sublabel">Competitor Data</div></div></div>
+                <div class="arch-box source"><span class="arch-icon">📄</span><div><div class="arch-label">Documents</div><div class="arch-sublabel">Policies & Strategy</div></div></div>
+            </div>
+            <div class="arch-pipes" style="height: 340px;">
+                <div class="arch-pipe" style="top: 6%;"><div class="arch-dot" style="animation-delay: 0s;"></div></div>
+                <div class="arch-pipe" style="top: 16%;"><div class="arch-dot" style="animation-delay: 0.25s;"></div></div>
+                <div class="arch-pipe" style="top: 26%;"><div class="arch-dot" style="animation-delay: 0.5s;"></div></div>
+                <div class="arch-pipe" style="top: 36%;"><div class="arch-dot" style="animation-delay: 0.75s;"></div></div>
+                <div class="arch-pipe" style="top: 46%;"><div class="arch-dot" style="animation-delay: 1s;"></div></div>
+                <div class="arch-pipe" style="top: 56%;"><div class="arch-dot" style="animation-delay: 1.25s;"></div></div>
+                <div class="arch-pipe" style="top: 66%;"><div class="arch-dot" style="animation-delay: 1.5s;"></div></div>
+                <div class="arch-pipe" style="top: 76%;"><div class="arch-dot" style="animation-delay: 1.75s;"></div></div>
+                <div class="arch-pipe" style="top: 86%;"><div class="arch-dot" style="animation-delay: 2s;"></div></div>
+                <div class="arch-pipe" style="top: 96%;"><div class="arch-dot" style="animation-delay: 2.25s;"></div></div>
+            </div>
+            <div class="arch-center">
+                <div class="arch-center-title">❄️ Snowflake</div>
+                <div class="arch-center-sub">AI Data Cloud</div>
+                <div class="arch-center-features">
+                    <span class="arch-feature">Cortex AI</span>
+                    <span class="arch-feature">ML Models</span>
+                    <span class="arch-feature">Semantic Views</span>
+                    <span class="arch-feature">Search</span>
+                    <span class="arch-feature">Notebooks</span>
+                    <span class="arch-feature">Streamlit</span>
+                </div>
+            </div>
+            <div class="arch-pipes" style="height: 340px;">
+                <div class="arch-pipe out" style="top: 6%;"><div class="arch-dot" style="animation-delay: 0.1s;"></div></div>
+                <div class="arch-pipe out" style="top: 16%;"><div class="arch-dot" style="animation-delay: 0.35s;"></div></div>
+                <div class="arch-pipe out" style="top: 26%;"><div class="arch-dot" style="animation-delay: 0.6s;"></div></div>
+                <div class="arch-pipe out" style="top: 36%;"><div class="arch-dot" style="animation-delay: 0.85s;"></div></div>
+                <div class="arch-pipe out" style="top: 46%;"><div class="arch-dot" style="animation-delay: 1.1s;"></div></div>
+                <div class="arch-pipe out" style="top: 56%;"><div class="arch-dot" style="animation-delay: 1.35s;"></div></div>
+                <div class="arch-pipe out" style="top: 66%;"><div class="arch-dot" style="animation-delay: 1.6s;"></div></div>
+                <div class="arch-pipe out" style="top: 76%;"><div class="arch-dot" style="animation-delay: 1.85s;"></div></div>
+                <div class="arch-pipe out" style="top: 86%;"><div class="arch-dot" style="animation-delay: 2.1s;"></div></div>
+                <div class="arch-pipe out" style="top: 96%;"><div class="arch-dot" style="animation-delay: 2.35s;"></div></div>
+            </div>
+            <div class="arch-column">
+                <div class="arch-section-label">Intelligence</div>
+                <div class="arch-box output"><span class="arch-icon">🧠</span><div><div class="arch-label">Snowflake Intelligence</div><div class="arch-sublabel">Natural Language</div></div></div>
+                <div class="arch-box output"><span class="arch-icon">📊</span><div><div class="arch-label">Dashboards</div><div class="arch-sublabel">32 Executive Views</div></div></div>
+                <div class="arch-box output"><span class="arch-icon">🔮</span><div><div class="arch-label">Churn Model</div><div class="arch-sublabel">ML Predictions</div></div></div>
+                <div class="arch-box output"><span class="arch-icon">📈</span><div><div class="arch-label">Upsell Model</div><div class="arch-sublabel">Propensity Scores</div></div></div>
+                <div class="arch-box output"><span class="arch-icon">🔍</span><div><div class="arch-label">Document Search</div><div class="arch-sublabel">7 Collections</div></div></div>
+                <div class="arch-box output"><span class="arch-icon">📋</span><div><div class="arch-label">Semantic Views</div><div class="arch-sublabel">34 Business Domains</div></div></div>
+                <div class="arch-box output"><span class="arch-icon">💡</span><div><div class="arch-label">Real-time Insights</div><div class="arch-sublabel">Live Analytics</div></div></div>
+                <div class="arch-box output"><span class="arch-icon">🎯</span><div><div class="arch-label">Analyst Tools</div><div class="arch-sublabel">41 AI Tools</div></div></div>
+                <div class="arch-box output"><span class="arch-icon">📱</span><div><div class="arch-label">Streamlit Apps</div><div class="arch-sublabel">Interactive UI</div></div></div>
+                <div class="arch-box output"><span class="arch-icon">📝</span><div><div class="arch-label">Notebooks</div><div class="arch-sublabel">Data Science</div></div></div>
+            </div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown("""
+    <div style="text-align: center; margin-top: 2rem; padding: 1rem; color: #6B7280; font-size: 0.8rem;">
+        Learn more at <a href="https://www.snowflake.com/en/solutions/industries/telecom/" target="_blank" style="color: #29B5E8;">snowflake.com/telecom</a>
+    </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,575 @@
+"""Head of Partners dashboard."""
+
+import streamlit as st
+import pandas as pd
+import altair as alt
+
+from dashboard import charts
+
+
+def render_head_of_partners():
+    import pandas as pd
+    import altair as alt
+    
+    st.markdown("""
+    <div class="main-header">
+        <h1>Head of Partners Dashboard</h1>
+        <p>Partner Performance, Commissions & Channel Revenue</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Dashboard Tabs
+    tab_overview, tab_ops, tab_strategy = st.tabs(["📊 Overview & Analysis", "🤝 Partner Operations", "❄️ Snowflake Intelligence"])
+
+    with tab_overview:
+        
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['PARTNER', 'ORDER', 'SALES']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+        
+        # HEAD OF PARTNERS - PARTNER NETWORK ANIMATION
+        st.markdown("""<div class="partner-network"><div class="partner-header"><div class="partner-title">🤝 Partner Ecosystem</div><div class="partner-count"><div class="partner-count-val">348</div><div class="partner-count-label">Active Partners</div></div></div><div class="partner-visual"><div class="partner-orbit-container"><div class="partner-center">🏢</div><div class="partner-dot gold"></div><div class="partner-dot silver"></div><div class="partner-dot bronze"></div></div><div class="partner-stats"><div class="partner-stat"><div class="partner-stat-val">£2.8M</div><div class="partner-stat-label">Revenue MTD</div></div><div class="partner-stat"><div class="partner-stat-val">94%</div><div class="partner-stat-label">Active Rate</div></div><div class="partner-stat"><div class="partner-stat-val">£847K</div><div class="partner-stat-label">Commissions</div></div></div></div></div>""", unsafe_allow_html=True)
+        
+        
+        st.markdown('<div class="section-header">Partner Channel Overview</div>', unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #29B5E8;">
+                <div class="kpi-icon">🤝</div>
+                <div class="kpi-label">Total Partners</div>
+                <div class="kpi-value">348</div>
+                <div class="kpi-delta positive">↑ +24 YTD</div>
+            </div>
+            <div class="kpi-card" style="--accent: #10B981;">
+                <div class="kpi-icon">💰</div>
+                <div class="kpi-label">Channel Revenue</div>
+                <div class="kpi-value">£2.8M</div>
+                <div class="kpi-delta positive">↑ +18% MoM</div>
+            </div>
+            <div class="kpi-card" style="--accent: #F59E0B;">
+                <div class="kpi-icon">📊</div>
+                <div class="kpi-label">Active This Month</div>
+                <div class="kpi-value">286</div>
+                <div class="kpi-delta neutral">82% active rate</div>
+            </div>
+            <div class="kpi-card" style="--accent: #8B5CF6;">
+                <div class="kpi-icon">📦</div>
+                <div class="kpi-label">Orders MTD</div>
+                <div class="kpi-value">1,842</div>
+                <div class="kpi-delta positive">↑ +22% vs target</div>
+            </div>
+        </div>
+        
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #EC4899;">
+                <div class="kpi-icon">💵</div>
+                <div class="kpi-label">Commissions Paid</div>
+                <div class="kpi-value">£142K</div>
+                <div class="kpi-delta neutral">This month</div>
+            </div>
+            <div class="kpi-card" style="--accent: #14B8A6;">
+                <div class="kpi-icon">📈</div>
+                <div class="kpi-label">Accrued</div>
+                <div class="kpi-value">£68K</div>
+                <div class="kpi-delta neutral">Next payment</div>
+            </div>
+            <div class="kpi-card" style="--accent: #6366F1;">
+                <div class="kpi-icon">👥</div>
+                <div class="kpi-label">New Customers</div>
+                <div class="kpi-value">624</div>
+                <div class="kpi-delta positive">Via partners</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EF4444;">
+                <div class="kpi-icon">⚠️</div>
+                <div class="kpi-label">At Risk Partners</div>
+                <div class="kpi-value">28</div>
+                <div class="kpi-delta negative">Low activity</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Channel Performance Highlights</div>', unsafe_allow_html=True)
+        
+        perf_col1, perf_col2 = st.columns(2)
+        
+        with perf_col1:
+            st.markdown("**Revenue by Product Line**")
+            with st.container(border=True):
+                product_rev = pd.DataFrame({
+                    'Product': ['Mobile', 'Broadband', 'Business', 'IoT', 'Cloud'],
+                    'Revenue': [1.12, 0.74, 0.46, 0.28, 0.20]
+                })
+                product_bar = alt.Chart(product_rev).mark_bar(cornerRadiusTopRight=8, cornerRadiusBottomRight=8).encode(
+                    x=alt.X('Revenue:Q', title='Revenue (£M)'),
+                    y=alt.Y('Product:N', sort='-x', title=None),
+                    color=alt.Color('Product:N', legend=None, scale=alt.Scale(
+                        domain=['Mobile', 'Broadband', 'Business', 'IoT', 'Cloud'],
+                        range=['#2563EB', '#10B981', '#F59E0B', '#8B5CF6', '#14B8A6']
+                    )),
+                    tooltip=['Product:N', alt.Tooltip('Revenue:Q', format='.2f')]
+                ).properties(height=180)
+                charts.altair_chart(product_bar, use_container_width=True)
+        
+        with perf_col2:
+            st.markdown("**Order Mix by Channel**")
+            with st.container(border=True):
+                channel_mix = pd.DataFrame({
+                    'Channel': ['Resellers', 'System Integrators', 'Retail Partners', 'Online Affiliates'],
+                    'Orders': [640, 420, 510, 272]
+                })
+                channel_arc = alt.Chart(channel_mix).mark_arc(innerRadius=45).encode(
+                    theta=alt.Theta('Orders:Q'),
+                    color=alt.Color('Channel:N', scale=alt.Scale(
+                        domain=['Resellers', 'System Integrators', 'Retail Partners', 'Online Affiliates'],
+                        range=['#2563EB', '#F59E0B', '#10B981', '#8B5CF6']
+                    ), legend=alt.Legend(orient='bottom', title=None)),
+                    tooltip=['Channel:N', 'Orders:Q']
+                ).properties(height=200)
+                charts.altair_chart(channel_arc, use_container_width=True)
+        
+        growth_col1, growth_col2 = st.columns(2)
+        
+        with growth_col1:
+            st.markdown("**Partner Activation Trend**")
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                activation_df = pd.DataFrame({
+                    'Month': months,
+                    'Activation': [78, 79, 80, 81, 82, 82]
+                })
+                activation_line = alt.Chart(activation_df).mark_line(point=True, color='#2563EB').encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('Activation:Q', title='Activation %', scale=alt.Scale(domain=[70, 90])),
+                    tooltip=['Month:N', 'Activation:Q']
+                ).properties(height=180)
+                charts.altair_chart(activation_line, use_container_width=True)
+        
+        with growth_col2:
+            st.markdown("**Partner Tier Mix**")
+            with st.container(border=True):
+                tier_mix = pd.DataFrame({
+                    'Tier': ['Gold', 'Silver', 'Bronze', 'Standard'],
+                    'Partners': [24, 68, 124, 132]
+                })
+                tier_donut = alt.Chart(tier_mix).mark_arc(innerRadius=45).encode(
+                    theta=alt.Theta('Partners:Q'),
+                    color=alt.Color('Tier:N', scale=alt.Scale(
+                        domain=['Gold', 'Silver', 'Bronze', 'Standard'],
+                        range=['#F59E0B', '#9CA3AF', '#CD7F32', '#6366F1']
+                    ), legend=alt.Legend(orient='bottom', title=None)),
+                    tooltip=['Tier:N', 'Partners:Q']
+                ).properties(height=200)
+                charts.altair_chart(tier_donut, use_container_width=True)
+        
+    with tab_ops:
+        st.markdown("""
+        <div class="partner-ops-pulse">
+            <div class="partner-ops-header">
+                <div class="partner-ops-title">🤝 Partner Operations Pulse</div>
+                <div class="partner-ops-tag">CHANNEL LIVE</div>
+            </div>
+            <div class="partner-ops-grid">
+                <div class="partner-ops-card">
+                    <div class="partner-ops-label">Active Partners</div>
+                    <div class="partner-ops-value">286</div>
+                    <div class="partner-ops-delta">82% activation rate</div>
+                </div>
+                <div class="partner-ops-card">
+                    <div class="partner-ops-label">Pipeline</div>
+                    <div class="partner-ops-value">22</div>
+                    <div class="partner-ops-delta">14 in application</div>
+                </div>
+                <div class="partner-ops-card">
+                    <div class="partner-ops-label">Commissions</div>
+                    <div class="partner-ops-value">£142K</div>
+                    <div class="partner-ops-delta">Paid MTD</div>
+                </div>
+                <div class="partner-ops-card">
+                    <div class="partner-ops-label">At-Risk</div>
+                    <div class="partner-ops-value">28</div>
+                    <div class="partner-ops-delta">Needs outreach</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+        # New: Partner Revenue Trend and Onboarding Pipeline
+        trend_col, pipeline_col = st.columns(2)
+        
+        with trend_col:
+            st.markdown('<div class="section-header">Partner Revenue Trend (6 Months)</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                rev_trend_data = pd.DataFrame({
+                    'Month': months * 4,
+                    'Tier': ['Gold']*6 + ['Silver']*6 + ['Bronze']*6 + ['Standard']*6,
+                    'Revenue': [0.98, 1.02, 1.08, 1.12, 1.18, 1.20,
+                               0.72, 0.74, 0.78, 0.80, 0.82, 0.84,
+                               0.42, 0.44, 0.46, 0.48, 0.50, 0.52,
+                               0.18, 0.20, 0.21, 0.22, 0.23, 0.24]
+                })
+                
+                stacked_area = alt.Chart(rev_trend_data).mark_area().encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('Revenue:Q', stack='zero', title='Revenue (£M)'),
+                    color=alt.Color('Tier:N', scale=alt.Scale(
+                        domain=['Gold', 'Silver', 'Bronze', 'Standard'],
+                        range=['#F59E0B', '#9CA3AF', '#CD7F32', '#6366F1']
+                    ), legend=alt.Legend(orient='bottom', title=None)),
+                    tooltip=['Month:N', 'Tier:N', alt.Tooltip('Revenue:Q', format='.2f')]
+                ).properties(height=180)
+                
+                charts.altair_chart(stacked_area, use_container_width=True)
+        
+        with pipeline_col:
+            st.markdown('<div class="section-header">Partner Onboarding Pipeline</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Prospect</span><span style="font-weight: 600;">22</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #6366F1; width: 100%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Application</span><span style="font-weight: 600;">14 (64%)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #8B5CF6; width: 64%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Approved</span><span style="font-weight: 600;">8 (36%)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #29B5E8; width: 36%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Training</span><span style="font-weight: 600;">5 (23%)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #F59E0B; width: 23%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div>
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Active</span><span style="font-weight: 600;">3 (14%)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #10B981; width: 14%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        col_left, col_right = st.columns([1.3, 1])
+        
+        with col_left:
+            st.markdown('<div class="section-header">Partner Performance by Tier</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                tier_data = pd.DataFrame({
+                    'Tier': ['Gold', 'Silver', 'Bronze', 'Standard'],
+                    'Partners': [24, 68, 124, 132],
+                    'Revenue': [1.2, 0.84, 0.52, 0.24],
+                    'Avg Revenue': [50.0, 12.4, 4.2, 1.8]
+                })
+                
+                tier_bars = alt.Chart(tier_data).mark_bar(cornerRadiusTopRight=8, cornerRadiusBottomRight=8).encode(
+                    y=alt.Y('Tier:N', sort=['Gold', 'Silver', 'Bronze', 'Standard'], title=None),
+                    x=alt.X('Revenue:Q', scale=alt.Scale(domain=[0, 1.5]), title='Revenue (£M)'),
+                    color=alt.Color('Tier:N', scale=alt.Scale(
+                        domain=['Gold', 'Silver', 'Bronze', 'Standard'],
+                        range=['#F59E0B', '#9CA3AF', '#CD7F32', '#6366F1']
+                    ), legend=None),
+                    tooltip=['Tier:N', 'Partners:Q', alt.Tooltip('Revenue:Q', title='Revenue (£M)', format='.2f'), alt.Tooltip('Avg Revenue:Q', title='Avg/Partner (£K)', format='.1f')]
+                ).properties(height=160)
+                
+                charts.altair_chart(tier_bars, use_container_width=True)
+                
+                st.markdown("""
+                <div style="display: flex; justify-content: space-around; font-size: 0.75rem; padding: 0.5rem; background: #F9FAFB; border-radius: 8px;">
+                    <div style="text-align: center;">
+                        <div style="color: #F59E0B; font-weight: 700;">🥇 Gold (24)</div>
+                        <div style="color: #6B7280;">£1.2M • £50K avg</div>
+                    </div>
+                    <div style="text-align: center;">
+                        <div style="color: #9CA3AF; font-weight: 700;">🥈 Silver (68)</div>
+                        <div style="color: #6B7280;">£840K • £12.4K avg</div>
+                    </div>
+                    <div style="text-align: center;">
+                        <div style="color: #CD7F32; font-weight: 700;">🥉 Bronze (124)</div>
+                        <div style="color: #6B7280;">£520K • £4.2K avg</div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            st.markdown('<div class="section-header">Top Performing Partners</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <table style="width: 100%; border-collapse: collapse; font-size: 0.85rem;">
+                    <thead>
+                        <tr style="border-bottom: 2px solid #E5E7EB;">
+                            <th style="text-align: left; padding: 0.5rem; color: #6B7280;">Partner</th>
+                            <th style="text-align: center; padding: 0.5rem; color: #6B7280;">Tier</th>
+                            <th style="text-align: right; padding: 0.5rem; color: #6B7280;">Revenue</th>
+                            <th style="text-align: right; padding: 0.5rem; color: #6B7280;">Orders</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem; font-weight: 600;">TechConnect Ltd</td>
+                            <td style="text-align: center; padding: 0.5rem;"><span style="background: #FEF3C7; color: #92400E; padding: 0.2rem 0.5rem; border-radius: 12px;">Gold</span></td>
+                            <td style="text-align: right; padding: 0.5rem; font-weight: 600;">£124,500</td>
+                            <td style="text-align: right; padding: 0.5rem;">186</td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem; font-weight: 600;">Mobile Solutions UK</td>
+                            <td style="text-align: center; padding: 0.5rem;"><span style="background: #FEF3C7; color: #92400E; padding: 0.2rem 0.5rem; border-radius: 12px;">Gold</span></td>
+                            <td style="text-align: right; padding: 0.5rem; font-weight: 600;">£98,200</td>
+                            <td style="text-align: right; padding: 0.5rem;">142</td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem; font-weight: 600;">DataFirst Partners</td>
+                            <td style="text-align: center; padding: 0.5rem;"><span style="background: #E5E7EB; color: #4B5563; padding: 0.2rem 0.5rem; border-radius: 12px;">Silver</span></td>
+                            <td style="text-align: right; padding: 0.5rem; font-weight: 600;">£76,800</td>
+                            <td style="text-align: right; padding: 0.5rem;">98</td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem; font-weight: 600;">Comms Direct</td>
+                            <td style="text-align: center; padding: 0.5rem;"><span style="background: #FEF3C7; color: #92400E; padding: 0.2rem 0.5rem; border-radius: 12px;">Gold</span></td>
+                            <td style="text-align: right; padding: 0.5rem; font-weight: 600;">£68,400</td>
+                            <td style="text-align: right; padding: 0.5rem;">112</td>
+                        </tr>
+                        <tr>
+                            <td style="padding: 0.5rem; font-weight: 600;">Network Plus</td>
+                            <td style="text-align: center; padding: 0.5rem;"><span style="background: #E5E7EB; color: #4B5563; padding: 0.2rem 0.5rem; border-radius: 12px;">Silver</span></td>
+                            <td style="text-align: right; padding: 0.5rem; font-weight: 600;">£54,200</td>
+                            <td style="text-align: right; padding: 0.5rem;">86</td>
+                        </tr>
+                    </tbody>
+                </table>
+                """, unsafe_allow_html=True)
+        
+        with col_right:
+            st.markdown('<div class="section-header">Commission Summary</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; font-size: 0.8rem;">
+                            <span>Paid This Month</span>
+                            <span style="font-weight: 600;">£142,400</span>
+                        </div>
+                        <div style="background: #E5E7EB; height: 12px; border-radius: 4px; margin-top: 0.25rem;">
+                            <div style="background: linear-gradient(90deg, #10B981, #34D399); width: 100%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; font-size: 0.8rem;">
+                            <span>Accrued (Pending)</span>
+                            <span style="font-weight: 600;">£68,200</span>
+                        </div>
+                        <div style="background: #E5E7EB; height: 12px; border-radius: 4px; margin-top: 0.25rem;">
+                            <div style="background: linear-gradient(90deg, #F59E0B, #FBBF24); width: 48%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; font-size: 0.8rem;">
+                            <span>Bonuses Earned</span>
+                            <span style="font-weight: 600;">£24,800</span>
+                        </div>
+                        <div style="background: #E5E7EB; height: 12px; border-radius: 4px; margin-top: 0.25rem;">
+                            <div style="background: linear-gradient(90deg, #8B5CF6, #A78BFA); width: 17%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                </div>
+                <div style="margin-top: 1rem; padding: 0.75rem; background: #D1FAE5; border-radius: 8px; text-align: center; font-size: 0.85rem;">
+                    <span style="color: #065F46;"><strong>Total YTD:</strong> £1.84M in partner commissions</span>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            st.markdown('<div class="section-header">At-Risk Partners</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="padding: 0.6rem; border-left: 4px solid #EF4444; background: #FEE2E2; border-radius: 0 8px 8px 0; margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <div>
+                                <div style="font-weight: 600; color: #DC2626;">ConnectIT Services</div>
+                                <div style="font-size: 0.75rem; color: #6B7280;">Silver • No orders in 45 days</div>
+                            </div>
+                            <span style="font-size: 0.75rem; background: #FEE2E2; color: #DC2626; padding: 0.2rem 0.5rem; border-radius: 12px;">Critical</span>
+                        </div>
+                    </div>
+                    <div style="padding: 0.6rem; border-left: 4px solid #F59E0B; background: #FEF3C7; border-radius: 0 8px 8px 0; margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <div>
+                                <div style="font-weight: 600; color: #92400E;">TelecomPro Ltd</div>
+                                <div style="font-size: 0.75rem; color: #6B7280;">Bronze • Revenue down 60%</div>
+                            </div>
+                            <span style="font-size: 0.75rem; background: #FEF3C7; color: #92400E; padding: 0.2rem 0.5rem; border-radius: 12px;">Warning</span>
+                        </div>
+                    </div>
+                    <div style="padding: 0.6rem; border-left: 4px solid #F59E0B; background: #FEF3C7; border-radius: 0 8px 8px 0;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <div>
+                                <div style="font-weight: 600; color: #92400E;">MobileMasters</div>
+                                <div style="font-size: 0.75rem; color: #6B7280;">Standard • Low engagement</div>
+                            </div>
+                            <span style="font-size: 0.75rem; background: #FEF3C7; color: #92400E; padding: 0.2rem 0.5rem; border-radius: 12px;">Warning</span>
+                        </div>
+                    </div>
+                </div>
+                <div style="margin-top: 0.75rem; padding: 0.5rem; background: #FEF3C7; border-radius: 8px; font-size: 0.75rem; text-align: center;">
+                    <span style="color: #92400E;">⚠️ 28 partners need outreach this month</span>
+                </div>
+                """, unsafe_allow_html=True)
+
+    with tab_strategy:
+        st.markdown("""
+        <div class="sf-partner-pulse">
+            <div class="sf-partner-header">
+                <div class="sf-partner-title">❄️ Snowflake Intelligence Pulse</div>
+                <div class="sf-partner-tag">AI LIVE</div>
+            </div>
+            <div class="sf-partner-grid">
+                <div class="sf-partner-card">
+                    <div class="sf-partner-label">Revenue at Risk</div>
+                    <div class="sf-partner-value">£210K</div>
+                </div>
+                <div class="sf-partner-card">
+                    <div class="sf-partner-label">Activation Lift</div>
+                    <div class="sf-partner-value">+6.4%</div>
+                </div>
+                <div class="sf-partner-card">
+                    <div class="sf-partner-label">Top Growth Tier</div>
+                    <div class="sf-partner-value">Gold</div>
+                </div>
+                <div class="sf-partner-card">
+                    <div class="sf-partner-label">Pipeline Velocity</div>
+                    <div class="sf-partner-value">23 days</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown('<div class="section-header">AI Executive Summary</div>', unsafe_allow_html=True)
+        if st.session_state.get('sf_highlights', True):
+            st.info("❄️ **Snowflake Intelligence** highlights a softening pipeline conversion in Silver-tier partners and a rising commission backlog. Targeted enablement and revised incentive tiers can unlock ~£210K in at-risk revenue and lift activation above 88%.")
+
+        st.markdown('<div class="section-header">Signals & Insights</div>', unsafe_allow_html=True)
+        sig_col1, sig_col2, sig_col3 = st.columns(3)
+        with sig_col1:
+            with st.container(border=True):
+                st.markdown("**Pipeline Bottleneck**")
+                st.caption("Application-to-approval conversion dips 9% vs last quarter; training step is slowest.")
+        with sig_col2:
+            with st.container(border=True):
+                st.markdown("**Tier Shift**")
+                st.caption("Gold partners drive 52% of incremental revenue; Silver performance flattening.")
+        with sig_col3:
+            with st.container(border=True):
+                st.markdown("**Churn Risk**")
+                st.caption("28 partners show low activity signals; 6 at immediate churn risk.")
+
+        st.markdown('<div class="section-header">AI-Powered Strategic Recommendations</div>', unsafe_allow_html=True)
+        rec_col1, rec_col2, rec_col3 = st.columns(3)
+        with rec_col1:
+            with st.container(border=True):
+                st.markdown("**Accelerate Onboarding**")
+                st.caption("Introduce auto-approval for low-risk profiles to cut cycle time by 6 days.")
+        with rec_col2:
+            with st.container(border=True):
+                st.markdown("**Incentive Rebalance**")
+                st.caption("Shift bonus weight to high-velocity SKUs; projected +£120K quarterly uplift.")
+        with rec_col3:
+            with st.container(border=True):
+                st.markdown("**At-Risk Rescue**")
+                st.caption("Run 4-week enablement sprints for 10 partners with highest revenue potential.")
+
+        st.markdown('<div class="section-header">Head of Partners Strategic Priorities — Q1 2026</div>', unsafe_allow_html=True)
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #DC2626; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 1</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Channel Revenue £3.5M</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **£2.8M** MTD
+                - Gap: **£700K** to target
+                - Focus: Gold partner growth
+                - Incentive: Q1 bonus program
+                """)
+        with col2:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #F59E0B; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 2</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Partner Activation 90%</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **82%** active
+                - Target: **90%** by Q2
+                - Action: Engagement program
+                - At-risk: **28** partners
+                """)
+        with col3:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #10B981; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 3</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Recruit 15 Partners</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Pipeline: **22** prospects
+                - Target: **15** new partners
+                - Focus: IT resellers
+                - Onboarding: Streamlined
+                """)
+        
+        st.markdown('<div class="section-header">Ask Snowflake Intelligence</div>', unsafe_allow_html=True)
+        
+        questions = [
+            "Give me an overview of our partner channel - total partners and revenue contribution.",
+            "Who are our top performing partners by revenue and orders?",
+            "What commissions have we paid and what's accrued?",
+            "Which partners are underperforming or at risk?",
+            "What does our partner recruitment pipeline look like?"
+        ]
+        
+        sf_intel_url = "https://ai.snowflake.com/sfseeurope/pjose_aws3"
+        cols = st.columns(2)
+        for i, q in enumerate(questions):
+            with cols[i % 2]:
+                escaped_q = q.replace('"', '&quot;').replace("'", "&#39;")
+                st.markdown(f"""
+                <a href="{sf_intel_url}" target="_blank" onclick="navigator.clipboard.writeText('{escaped_q}')" style="text-decoration: none; color: inherit; display: block;">
+                    <div class="question-card">
+                        <p style="margin-bottom: 1.5rem;"><strong>Q{i+1}:</strong> "{q}"</p>
+                    </div>
+                </a>
+                """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div style="text-align: center; margin-top: 1rem; padding: 1rem; background: linear-gradient(135deg, #29B5E8 0%, #1A8BC4 100%); border-radius: 8px;">
+            <a href="{sf_intel_url}" target="_blank" style="color: white; text-decoration: none; font-weight: 600; font-size: 1rem;">
+                ❄️ Ask these questions in Snowflake Intelligence →
+            </a>
+        </div>
+        """, unsafe_allow_html=True)
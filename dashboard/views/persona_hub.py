@@ -0,0 +1,496 @@
+"""Persona Hub navigation page."""
+
+import streamlit as st
+
+from dashboard import navigation, prefetch
+
+
+def render_persona_hub():
+    """Render the Persona Hub navigation dashboard"""
+    import streamlit.components.v1 as components
+    
+    # ===== PERSONA HUB CSS STYLES =====
+    
+    # ===== PERSONA DATA =====
+    personas = [
+        # Featured
+        {
+            "key": "00_WOW_Executive_Showcase",
+            "title": "Executive Showcase",
+            "persona": "CEO / Board Member / Executive Sponsor",
+            "duration": "10-15 min",
+            "focus": "Cross-domain analysis with conversational memory, data and document fusion, and predictive insights powered by Snowflake Cortex AI",
+            "snowflake_value": "Unified AI platform enabling natural language analytics across all business domains",
+            "icon": "🎯",
+            "featured": True,
+            "category": "c-suite"
+        },
+        # C-Suite
+        {
+            "key": "Executive_Summary",
+            "title": "Executive Summary",
+            "persona": "All Executives",
+            "duration": "5 min",
+            "focus": "High-level business overview with key metrics at a glance and strategic priorities",
+            "snowflake_value": "Real-time unified view across all business data",
+            "icon": "📊",
+            "featured": False,
+            "category": "c-suite"
+        },
+        {
+            "key": "01_CEO_Strategic",
+            "title": "CEO Strategic Overview",
+            "persona": "Chief Executive Officer",
+            "duration": "10 min",
+            "focus": "Overall business performance, market position, strategic KPIs, and competitive landscape analysis",
+            "snowflake_value": "AI-powered strategic insights from unified data sources",
+            "icon": "👔",
+            "featured": True,
+            "category": "c-suite"
+        },
+        {
+            "key": "02_CFO_Finance",
+            "title": "CFO Financial Performance",
+            "persona": "Chief Financial Officer",
+            "duration": "10 min",
+            "focus": "Revenue trends, ARPU analysis, billing efficiency, cost management, and vendor spend optimization",
+            "snowflake_value": "Financial data consolidation with predictive revenue modeling",
+            "icon": "💰",
+            "featured": False,
+            "category": "c-suite"
+        },
+        {
+            "key": "03_CMO_Marketing",
+            "title": "CMO Marketing Performance",
+            "persona": "Chief Marketing Officer",
+            "duration": "10 min",
+            "focus": "Campaign performance, customer acquisition costs, brand health, NPS trends, and churn prevention",
+            "snowflake_value": "Customer 360 view with ML-driven campaign optimization",
+            "icon": "📢",
+            "featured": False,
+            "category": "c-suite"
+        },
+        {
+            "key": "04_CTO_Technology",
+            "title": "CTO Technology & Network",
+            "persona": "Chief Technology Officer",
+            "duration": "10 min",
+            "focus": "Network strategy, 5G rollout progress, IT systems health, and digital transformation initiatives",
+            "snowflake_value": "Infrastructure analytics with capacity planning intelligence",
+            "icon": "🔧",
+            "featured": False,
+            "category": "c-suite"
+        },
+        {
+            "key": "05_COO_Operations",
+            "title": "COO Operations Excellence",
+            "persona": "Chief Operating Officer",
+            "duration": "10 min",
+            "focus": "Operational efficiency, process performance, service quality metrics, and workforce productivity",
+            "snowflake_value": "End-to-end operations visibility with process optimization AI",
+            "icon": "⚙️",
+            "featured": False,
+            "category": "c-suite"
+        },
+        {
+            "key": "06_CCO_Commercial",
+            "title": "CCO Commercial Performance",
+            "persona": "Chief Commercial Officer",
+            "duration": "10 min",
+            "focus": "Revenue growth, sales performance, partner channels, pricing strategy, and market expansion",
+            "snowflake_value": "Sales analytics with propensity scoring and revenue forecasting",
+            "icon": "📈",
+            "featured": False,
+            "category": "c-suite"
+        },
+        {
+            "key": "07_CXO_Customer_Experience",
+            "title": "CXO Customer Experience",
+            "persona": "Chief Experience Officer",
+            "duration": "10 min",
+            "focus": "Customer journey optimization, NPS improvement initiatives, and experience transformation programs",
+            "snowflake_value": "Journey analytics with sentiment analysis and churn prediction",
+            "icon": "😊",
+            "featured": False,
+            "category": "c-suite"
+        },
+        {
+            "key": "08_CNO_Network_QoE",
+            "title": "CNO Network Quality",
+            "persona": "Chief Networks Officer",
+            "duration": "10 min",
+            "focus": "Network performance metrics, RAN operations, customer experience correlation, and 5G coverage rollout",
+            "snowflake_value": "Network data lake with QoE correlation analytics",
+            "icon": "📡",
+            "featured": True,
+            "category": "c-suite"
+        },
+        {
+            "key": "09_CDO_Data_Science",
+            "title": "CDO AI/ML Analytics",
+            "persona": "Chief Data Officer",
+            "duration": "10 min",
+            "focus": "Predictive analytics, ML model operations, propensity scoring, and data-driven decision making",
+            "snowflake_value": "Cortex ML with automated feature engineering and model ops",
+            "icon": "🤖",
+            "featured": False,
+            "category": "c-suite"
+        },
+        {
+            "key": "10_CSO_Sustainability",
+            "title": "CSO Sustainability & ESG",
+            "persona": "Chief Sustainability Officer",
+            "duration": "10 min",
+            "focus": "Carbon reduction tracking, renewable energy adoption, net zero targets, and ESG compliance reporting",
+            "snowflake_value": "ESG data platform with carbon footprint analytics",
+            "icon": "🌱",
+            "featured": False,
+            "category": "c-suite"
+        },
+        # VP Level
+        {
+            "key": "11_VP_Customer_Service",
+            "title": "VP Customer Service",
+            "persona": "VP Customer Service",
+            "duration": "10 min",
+            "focus": "Contact center operations, ticket management, CSAT scores, and complaint handling efficiency",
+            "snowflake_value": "Service analytics with AI-powered resolution recommendations",
+            "icon": "🎧",
+            "featured": True,
+            "category": "vp-level"
+        },
+        {
+            "key": "12_VP_Network_Operations",
+            "title": "VP Network Operations",
+            "persona": "VP Network Operations",
+            "duration": "10 min",
+            "focus": "Network availability, alarm management, capacity planning, RF optimization, and SLA delivery tracking",
+            "snowflake_value": "Real-time network monitoring with anomaly detection",
+            "icon": "🖥️",
+            "featured": False,
+            "category": "vp-level"
+        },
+        {
+            "key": "Alert_Center",
+            "title": "Network Alert Center",
+            "persona": "NOC Manager",
+            "duration": "10 min",
+            "focus": "Real-time alert monitoring, incident management, SLA tracking, and impact analysis",
+            "snowflake_value": "Intelligent alerting with correlation and root cause analysis",
+            "icon": "🚨",
+            "featured": True,
+            "category": "vp-level"
+        },
+        {
+            "key": "13_Head_of_Partners",
+            "title": "Head of Partners",
+            "persona": "Head of Partners",
+            "duration": "10 min",
+            "focus": "Partner performance, commission management, recruitment pipeline, and partner experience",
+            "snowflake_value": "Partner ecosystem analytics with performance benchmarking",
+            "icon": "🤝",
+            "featured": False,
+            "category": "vp-level"
+        },
+        {
+            "key": "14_VP_Billing_Revenue",
+            "title": "VP Billing & Revenue",
+            "persona": "VP Billing & Revenue",
+            "duration": "10 min",
+            "focus": "Billing accuracy, payment collection status, revenue assurance, and dispute management",
+            "snowflake_value": "Revenue assurance platform with billing anomaly detection",
+            "icon": "💳",
+            "featured": False,
+            "category": "vp-level"
+        },
+        {
+            "key": "15_VP_IT_Digital",
+            "title": "VP IT & Digital",
+            "persona": "VP IT / Director of IT",
+            "duration": "10 min",
+            "focus": "IT incident management, SLA compliance, application health monitoring, and service delivery",
+            "snowflake_value": "IT operations analytics with service desk intelligence",
+            "icon": "💻",
+            "featured": False,
+            "category": "vp-level"
+        },
+        {
+            "key": "16_VP_Field_Operations",
+            "title": "VP Field Operations",
+            "persona": "VP Field Operations",
+            "duration": "10 min",
+            "focus": "Workforce optimization, field SLA compliance, cost management, and first-time fix rates",
+            "snowflake_value": "Field service optimization with route and scheduling AI",
+            "icon": "🔨",
+            "featured": False,
+            "category": "vp-level"
+        },
+        {
+            "key": "17_VP_Strategy",
+            "title": "VP Strategy",
+            "persona": "VP Strategy",
+            "duration": "10 min",
+            "focus": "Market positioning, competitive analysis, pricing strategy optimization, and growth opportunities",
+            "snowflake_value": "Market intelligence with competitive benchmarking analytics",
+            "icon": "🎯",
+            "featured": False,
+            "category": "vp-level"
+        },
+        {
+            "key": "18_VP_Communications",
+            "title": "VP Communications",
+            "persona": "VP Communications",
+            "duration": "10 min",
+            "focus": "Brand reputation monitoring, social media analytics, crisis management, and voice of customer",
+            "snowflake_value": "Social listening with sentiment analysis and trend detection",
+            "icon": "📣",
+            "featured": False,
+            "category": "vp-level"
+        },
+        {
+            "key": "19_Regulatory_Compliance",
+            "title": "Regulatory & Compliance",
+            "persona": "Head of Regulatory",
+            "duration": "10 min",
+            "focus": "Ofcom compliance tracking, SLA management, GDPR requirements, and service quality reporting",
+            "snowflake_value": "Compliance automation with regulatory reporting dashboards",
+            "icon": "⚖️",
+            "featured": False,
+            "category": "vp-level"
+        },
+        {
+            "key": "20_VP_Security",
+            "title": "VP Security & Fraud",
+            "persona": "VP Security",
+            "duration": "10 min",
+            "focus": "Fraud detection, loss prevention analytics, security threat monitoring, and risk assessment",
+            "snowflake_value": "Fraud analytics with ML-powered anomaly detection",
+            "icon": "🔒",
+            "featured": False,
+            "category": "vp-level"
+        },
+        {
+            "key": "21_VP_Enterprise_Sales",
+            "title": "VP Enterprise Sales",
+            "persona": "VP Enterprise Sales",
+            "duration": "10 min",
+            "focus": "B2B contract renewals, enterprise revenue retention, competitive threats, and deal pipeline",
+            "snowflake_value": "Enterprise analytics with account health scoring",
+            "icon": "🏢",
+            "featured": False,
+            "category": "vp-level"
+        },
+        {
+            "key": "22_VP_Wholesale",
+            "title": "VP Wholesale & MVNO",
+            "persona": "VP Wholesale",
+            "duration": "10 min",
+            "focus": "MVNO traffic analysis, wholesale revenue tracking, partner settlements, and capacity planning",
+            "snowflake_value": "Wholesale analytics with partner usage reconciliation",
+            "icon": "🔄",
+            "featured": False,
+            "category": "vp-level"
+        },
+        {
+            "key": "23_VP_Retail",
+            "title": "VP Retail Operations",
+            "persona": "VP Retail",
+            "duration": "10 min",
+            "focus": "Store performance, sales conversion rates, footfall analytics, and inventory management",
+            "snowflake_value": "Retail analytics with store performance optimization",
+            "icon": "🏪",
+            "featured": False,
+            "category": "vp-level"
+        },
+        {
+            "key": "24_CHRO_People",
+            "title": "CHRO People & Workforce",
+            "persona": "CHRO",
+            "duration": "10 min",
+            "focus": "Workforce analytics, employee engagement, talent management, and organizational effectiveness",
+            "snowflake_value": "People analytics with attrition prediction and skills mapping",
+            "icon": "👥",
+            "featured": False,
+            "category": "vp-level"
+        },
+        {
+            "key": "25_VP_Legal",
+            "title": "VP Legal & Counsel",
+            "persona": "VP Legal",
+            "duration": "10 min",
+            "focus": "Contract management, regulatory compliance, dispute tracking, and legal risk assessment",
+            "snowflake_value": "Legal analytics with contract intelligence and risk scoring",
+            "icon": "📜",
+            "featured": False,
+            "category": "vp-level"
+        },
+        {
+            "key": "26_VP_Product",
+            "title": "VP Product Management",
+            "persona": "VP Product",
+            "duration": "10 min",
+            "focus": "Product portfolio performance, plan adoption rates, pricing strategy, and feature utilization",
+            "snowflake_value": "Product analytics with usage patterns and pricing optimization",
+            "icon": "📦",
+            "featured": False,
+            "category": "vp-level"
+        },
+        {
+            "key": "27_VP_Procurement",
+            "title": "VP Procurement",
+            "persona": "VP Procurement",
+            "duration": "10 min",
+            "focus": "Vendor spend analysis, supplier performance, contract management, and cost optimization",
+            "snowflake_value": "Procurement analytics with spend visibility and savings tracking",
+            "icon": "🛒",
+            "featured": False,
+            "category": "vp-level"
+        },
+        {
+            "key": "data_monetization",
+            "title": "Data Monetization & Sharing",
+            "persona": "CDO / Head of Data Products",
+            "duration": "10 min",
+            "focus": "Data revenue streams, marketplace listings, clean rooms, partner data ecosystem, and cross-industry use cases",
+            "snowflake_value": "Snowflake Marketplace, Data Clean Rooms, and Native App Framework for secure monetization",
+            "icon": "💎",
+            "featured": True,
+            "category": "vp-level"
+        }
+    ]
+    
+    # Separate personas by category
+    # Get the main featured (Executive Showcase)
+    main_featured = next((p for p in personas if p["key"] == "00_WOW_Executive_Showcase"), None)
+    csuite_personas = [p for p in personas if p["category"] == "c-suite" and p["key"] != "00_WOW_Executive_Showcase"]
+    vp_personas = [p for p in personas if p["category"] == "vp-level"]
+    
+    # ===== HELPER FUNCTION TO BUILD TILE HTML =====
+    def build_tile_html(p, is_full_width=False, has_badge=False, is_vp=False):
+        tile_class = "persona-tile-featured" if is_full_width else "persona-tile"
+        image_class = "vp-level" if is_vp else "c-suite"
+        role_class = "persona-role vp" if is_vp else "persona-role"
+        
+        html = '<div class="' + tile_class + '" data-key="' + p['key'] + '">'
+        
+        # Add featured badge if has_badge is True (regardless of full-width)
+        if has_badge:
+            html += '<div class="featured-badge">⭐ FEATURED</div>'
+        
+        if is_full_width:
+            # Full-width layout (only for Executive Showcase)
+            html += '<div class="persona-image ' + image_class + '"><span class="persona-icon">' + p['icon'] + '</span></div>'
+            html += '<div class="persona-content">'
+            html += '<div class="persona-title">' + p['title'] + '</div>'
+            html += '<div><span class="' + role_class + '">' + p['persona'] + '</span>'
+            html += '<span class="persona-duration">⏱️ ' + p['duration'] + '</span></div>'
+            html += '<div class="persona-focus">' + p['focus'] + '</div>'
+            html += '<div class="persona-snowflake">' + p['snowflake_value'] + '</div>'
+            html += '</div></div>'
+        else:
+            # Regular tile layout (same size for all)
+            html += '<div class="persona-image ' + image_class + '"><span class="persona-icon">' + p['icon'] + '</span></div>'
+            html += '<div class="persona-title">' + p['title'] + '</div>'
+            html += '<div><span class="' + role_class + '">' + p['persona'] + '</span>'
+            html += '<span class="persona-duration">⏱️ ' + p['duration'] + '</span></div>'
+            html += '<div class="persona-focus">' + p['focus'] + '</div>'
+            html += '<div class="persona-snowflake">' + p['snowflake_value'] + '</div>'
+            html += '</div>'
+        return html
+    
+    # Build main featured tile (Executive Showcase) - FULL WIDTH with badge
+    featured_html = ""
+    if main_featured:
+        featured_html = build_tile_html(main_featured, is_full_width=True, has_badge=True, is_vp=False)
+    
+    # Build C-Suite tiles - ALL SAME SIZE, but some have featured badge
+    csuite_tiles = ""
+    for p in csuite_personas:
+        csuite_tiles += build_tile_html(p, is_full_width=False, has_badge=p.get('featured', False), is_vp=False)
+    
+    # Build VP tiles - ALL SAME SIZE, but some have featured badge
+    vp_tiles = ""
+    for p in vp_personas:
+        vp_tiles += build_tile_html(p, is_full_width=False, has_badge=p.get('featured', False), is_vp=True)
+    
+    # Main Featured Tile (Executive Showcase)
+    st.markdown(f"""
+    <div class="persona-grid">
+        {featured_html}
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # C-Suite Section
+    st.markdown("""
+    <div class="persona-section-header">
+        <span class="persona-section-badge">C-Suite</span>
+        <h2 class="persona-section-title">Executive Leadership</h2>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown(f"""
+    <div class="persona-grid" id="csuite-grid">
+        {csuite_tiles}
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # VP Section
+    st.markdown("""
+    <div class="persona-section-header">
+        <span class="persona-section-badge">VP & Directors</span>
+        <h2 class="persona-section-title">Functional Leaders</h2>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown(f"""
+    <div class="persona-grid" id="vp-grid">
+        {vp_tiles}
+    </div>
+    """, unsafe_allow_html=True)
+    
+    
+    # ===== JAVASCRIPT FOR CLICK NAVIGATION =====
+    # Note: Search filtering is handled inline above
+    
+    # Check for navigation request from JavaScript
+    # Create clickable buttons for each persona using Streamlit native components
+    st.markdown("---")
+    st.markdown("### Quick Navigation")
+    
+    # Create columns for navigation buttons
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.button("🎯 Executive Showcase", key="nav_exec_showcase", use_container_width=True,
+                  on_click=navigation.go_to, args=("00_WOW_Executive_Showcase",))
+        st.button("👔 CEO Strategic", key="nav_ceo", use_container_width=True,
+                  on_click=navigation.go_to, args=("01_CEO_Strategic",))
+        st.button("💰 CFO Finance", key="nav_cfo", use_container_width=True,
+                  on_click=navigation.go_to, args=("02_CFO_Finance",))
+            
+    with col2:
+        st.button("📢 CMO Marketing", key="nav_cmo", use_container_width=True,
+                  on_click=navigation.go_to, args=("03_CMO_Marketing",))
+        st.button("🔧 CTO Technology", key="nav_cto", use_container_width=True,
+                  on_click=navigation.go_to, args=("04_CTO_Technology",))
+        st.button("⚙️ COO Operations", key="nav_coo", use_container_width=True,
+                  on_click=navigation.go_to, args=("05_COO_Operations",))
+            
+    with col3:
+        st.button("📈 CCO Commercial", key="nav_cco", use_container_width=True,
+                  on_click=navigation.go_to, args=("06_CCO_Commercial",))
+        st.button("😊 CXO Experience", key="nav_cxo", use_container_width=True,
+                  on_click=navigation.go_to, args=("07_CXO_Customer_Experience",))
+        st.button("📡 CNO Network", key="nav_cno", use_container_width=True,
+                  on_click=navigation.go_to, args=("08_CNO_Network_QoE",))
+            
+    with col4:
+        st.button("🤖 CDO Data Science", key="nav_cdo", use_container_width=True,
+                  on_click=navigation.go_to, args=("09_CDO_Data_Science",))
+        st.button("🌱 CSO Sustainability", key="nav_cso", use_container_width=True,
+                  on_click=navigation.go_to, args=("10_CSO_Sustainability",))
+        st.button("📊 Executive Summary", key="nav_exec_sum", use_container_width=True,
+                  on_click=navigation.go_to, args=("Executive_Summary",))
+
+    # Warm every target page in the background so the first click is a warm render
+    prefetch.prefetch_pages([p["key"] for p in personas])
@@ -0,0 +1,660 @@
+"""Regulatory Compliance dashboard."""
+
+import streamlit as st
+import pandas as pd
+import altair as alt
+
+from dashboard import charts
+
+
+def render_regulatory_compliance():
+    import pandas as pd
+    import altair as alt
+    
+    st.markdown("""
+    <div class="main-header">
+        <h1>Regulatory & Compliance Dashboard</h1>
+        <p>Ofcom Compliance, SLA Management & Service Quality</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Dashboard Tabs
+    tab_overview, tab_ops, tab_strategy = st.tabs(["📊 Overview & Analysis", "⚖️ Compliance Operations", "❄️ Snowflake Intelligence"])
+
+    with tab_overview:
+        
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['SLA', 'COMPLAINT', 'NETWORK_OPS', 'MOBILE']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+        
+        # REGULATORY COMPLIANCE - COMPLIANCE SHIELD ANIMATION
+        st.markdown("""<div class="reg-compliance"><div class="reg-header"><div class="reg-title">⚖️ Regulatory Compliance Status</div><div class="reg-score"><div class="reg-score-val">97.8%</div><div class="reg-score-label">SLA Attainment</div></div></div><div class="reg-items"><div class="reg-item"><div class="reg-item-icon">🛡️</div><div class="reg-item-name">Ofcom SLAs</div><div class="reg-item-status pass"><span class="reg-check-icon">✓</span> Compliant</div></div><div class="reg-item"><div class="reg-item-icon">📋</div><div class="reg-item-name">GDPR</div><div class="reg-item-status pass"><span class="reg-check-icon">✓</span> Compliant</div></div><div class="reg-item"><div class="reg-item-icon">📊</div><div class="reg-item-name">ADR Scheme</div><div class="reg-item-status pass"><span class="reg-check-icon">✓</span> Active</div></div><div class="reg-item"><div class="reg-item-icon">⏱️</div><div class="reg-item-name">Response Time</div><div class="reg-item-status warn">⚠ Monitor</div></div></div><div class="reg-stats"><div class="reg-stat"><div class="reg-stat-val">9.4</div><div class="reg-stat-label">Complaints/1K</div></div><div class="reg-stat"><div class="reg-stat-val">8</div><div class="reg-stat-label">Ombudsman Cases</div></div><div class="reg-stat"><div class="reg-stat-val">99.1%</div><div class="reg-stat-label">Network SLA</div></div></div></div>""", unsafe_allow_html=True)
+        
+        
+        st.markdown('<div class="section-header">Regulatory Compliance Overview</div>', unsafe_allow_html=True)
+        st.markdown("""
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #10B981;">
+                <div class="kpi-icon">✅</div>
+                <div class="kpi-label">SLA Attainment</div>
+                <div class="kpi-value">97.8%</div>
+                <div class="kpi-delta positive">Above 95% target</div>
+            </div>
+            <div class="kpi-card" style="--accent: #29B5E8;">
+                <div class="kpi-icon">📋</div>
+                <div class="kpi-label">Complaints/1K Subs</div>
+                <div class="kpi-value">9.4</div>
+                <div class="kpi-delta positive">Below Ofcom avg</div>
+            </div>
+            <div class="kpi-card" style="--accent: #F59E0B;">
+                <div class="kpi-icon">⚖️</div>
+                <div class="kpi-label">Ombudsman Cases</div>
+                <div class="kpi-value">8</div>
+                <div class="kpi-delta positive">2.8% escalation</div>
+            </div>
+            <div class="kpi-card" style="--accent: #8B5CF6;">
+                <div class="kpi-icon">📡</div>
+                <div class="kpi-label">Network SLA</div>
+                <div class="kpi-value">99.72%</div>
+                <div class="kpi-delta positive">Above 99.5%</div>
+            </div>
+        </div>
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #EF4444;">
+                <div class="kpi-icon">💰</div>
+                <div class="kpi-label">SLA Credits</div>
+                <div class="kpi-value">£12.4K</div>
+                <div class="kpi-delta negative">MTD liability</div>
+            </div>
+            <div class="kpi-card" style="--accent: #14B8A6;">
+                <div class="kpi-icon">⏱️</div>
+                <div class="kpi-label">Avg Complaint Resolution</div>
+                <div class="kpi-value">4.2 days</div>
+                <div class="kpi-delta positive">Below 8-day target</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EC4899;">
+                <div class="kpi-icon">🔒</div>
+                <div class="kpi-label">GDPR Requests</div>
+                <div class="kpi-value">24</div>
+                <div class="kpi-delta positive">All within SLA</div>
+            </div>
+            <div class="kpi-card" style="--accent: #6366F1;">
+                <div class="kpi-icon">📊</div>
+                <div class="kpi-label">Next Ofcom Report</div>
+                <div class="kpi-value">14 days</div>
+                <div class="kpi-delta positive">Data ready</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Compliance Trend & Risk</div>', unsafe_allow_html=True)
+        trend_col1, trend_col2 = st.columns(2)
+        
+        with trend_col1:
+            st.markdown("**SLA Credits Trend (6 Months)**")
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                credits_df = pd.DataFrame({
+                    'Month': months,
+                    'Credits': [18.2, 16.8, 15.4, 14.6, 13.1, 12.4]
+                })
+                credits_line = alt.Chart(credits_df).mark_line(point=True, color='#EF4444', strokeWidth=2).encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('Credits:Q', title='£K'),
+                    tooltip=['Month:N', alt.Tooltip('Credits:Q', format='.1f')]
+                ).properties(height=170)
+                charts.altair_chart(credits_line, use_container_width=True)
+        
+        with trend_col2:
+            st.markdown("**Complaints by Region**")
+            with st.container(border=True):
+                region_df = pd.DataFrame({
+                    'Region': ['London', 'North West', 'Midlands', 'South East', 'Scotland', 'Wales'],
+                    'Complaints': [128, 92, 74, 88, 56, 42]
+                })
+                region_bar = alt.Chart(region_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Complaints:Q', title='Complaints'),
+                    y=alt.Y('Region:N', sort='-x', title=None),
+                    color=alt.value('#29B5E8'),
+                    tooltip=['Region:N', 'Complaints:Q']
+                ).properties(height=170)
+                charts.altair_chart(region_bar, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Product & Root Cause Signals</div>', unsafe_allow_html=True)
+        signal_col1, signal_col2 = st.columns(2)
+        
+        with signal_col1:
+            st.markdown("**SLA Breaches by Product**")
+            with st.container(border=True):
+                product_df = pd.DataFrame({
+                    'Product': ['Mobile', 'Broadband', 'TV', 'IoT'],
+                    'Breaches': [22, 14, 8, 5]
+                })
+                product_bar = alt.Chart(product_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Breaches:Q', title='Breaches'),
+                    y=alt.Y('Product:N', sort='-x', title=None),
+                    color=alt.value('#EF4444'),
+                    tooltip=['Product:N', 'Breaches:Q']
+                ).properties(height=170)
+                charts.altair_chart(product_bar, use_container_width=True)
+        
+        with signal_col2:
+            st.markdown("**Complaint Root Cause Mix**")
+            with st.container(border=True):
+                root_df = pd.DataFrame({
+                    'Cause': ['Billing', 'Coverage', 'Service', 'Outage'],
+                    'Share': [38, 26, 21, 15]
+                })
+                root_arc = alt.Chart(root_df).mark_arc(innerRadius=55).encode(
+                    theta=alt.Theta('Share:Q', title=None),
+                    color=alt.Color('Cause:N', legend=None, scale=alt.Scale(
+                        range=['#6366F1', '#F59E0B', '#10B981', '#29B5E8']
+                    )),
+                    tooltip=['Cause:N', alt.Tooltip('Share:Q', format='.0f')]
+                ).properties(height=170)
+                charts.altair_chart(root_arc, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Regulator Readiness</div>', unsafe_allow_html=True)
+        ready_col1, ready_col2 = st.columns(2)
+        
+        with ready_col1:
+            st.markdown("**Escalation Timeline (Weekly)**")
+            with st.container(border=True):
+                weeks = ['W1', 'W2', 'W3', 'W4', 'W5', 'W6']
+                esc_week_df = pd.DataFrame({
+                    'Week': weeks,
+                    'Escalations': [6, 5, 4, 5, 3, 2]
+                })
+                esc_area = alt.Chart(esc_week_df).mark_area(opacity=0.25, color='#F59E0B').encode(
+                    x=alt.X('Week:N', sort=weeks, title=None),
+                    y=alt.Y('Escalations:Q', title='Cases')
+                )
+                esc_line = alt.Chart(esc_week_df).mark_line(point=True, color='#F59E0B', strokeWidth=2).encode(
+                    x=alt.X('Week:N', sort=weeks),
+                    y=alt.Y('Escalations:Q'),
+                    tooltip=['Week:N', 'Escalations:Q']
+                )
+                charts.altair_chart((esc_area + esc_line).properties(height=170), use_container_width=True)
+        
+        with ready_col2:
+            st.markdown("**Regulatory Submission Readiness**")
+            with st.container(border=True):
+                report_df = pd.DataFrame({
+                    'Report': ['Ofcom SLA', 'GDPR Audit', 'ADR Review', 'Ombudsman'],
+                    'Ready': [92, 88, 81, 76]
+                })
+                report_bar = alt.Chart(report_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Ready:Q', title='Readiness %', scale=alt.Scale(domain=[0, 100])),
+                    y=alt.Y('Report:N', sort='-x', title=None),
+                    color=alt.value('#10B981'),
+                    tooltip=['Report:N', 'Ready:Q']
+                ).properties(height=170)
+                charts.altair_chart(report_bar, use_container_width=True)
+        
+        st.markdown('<div class="section-header">SLA & Penalty Exposure</div>', unsafe_allow_html=True)
+        exposure_col1, exposure_col2 = st.columns(2)
+        
+        with exposure_col1:
+            st.markdown("**SLA Breaches by Region**")
+            with st.container(border=True):
+                breach_region_df = pd.DataFrame({
+                    'Region': ['London', 'North West', 'Midlands', 'South East', 'Scotland', 'Wales'],
+                    'Breaches': [12, 9, 7, 6, 4, 3]
+                })
+                breach_bar = alt.Chart(breach_region_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Breaches:Q', title='Breaches'),
+                    y=alt.Y('Region:N', sort='-x', title=None),
+                    color=alt.value('#F97316'),
+                    tooltip=['Region:N', 'Breaches:Q']
+                ).properties(height=170)
+                charts.altair_chart(breach_bar, use_container_width=True)
+        
+        with exposure_col2:
+            st.markdown("**Penalty Exposure by Category**")
+            with st.container(border=True):
+                penalty_df = pd.DataFrame({
+                    'Category': ['Network', 'Billing', 'Privacy', 'Service'],
+                    'Exposure': [4.6, 3.2, 2.1, 1.4]
+                })
+                penalty_bar = alt.Chart(penalty_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Exposure:Q', title='£M Exposure'),
+                    y=alt.Y('Category:N', sort='-x', title=None),
+                    color=alt.value('#EF4444'),
+                    tooltip=['Category:N', alt.Tooltip('Exposure:Q', format='.1f')]
+                ).properties(height=170)
+                charts.altair_chart(penalty_bar, use_container_width=True)
+        
+    with tab_ops:
+        st.markdown("""
+        <div class="reg-ops-pulse">
+            <div class="reg-ops-header">
+                <div class="reg-ops-title">⚖️ Compliance Ops Pulse</div>
+                <div class="reg-ops-tag">LIVE OPS</div>
+            </div>
+            <div class="reg-ops-grid">
+                <div class="reg-ops-card">
+                    <div class="reg-ops-label">SLA Attainment</div>
+                    <div class="reg-ops-value">97.8%</div>
+                    <div class="reg-ops-delta">Above 95%</div>
+                </div>
+                <div class="reg-ops-card">
+                    <div class="reg-ops-label">Complaints/1K</div>
+                    <div class="reg-ops-value">9.4</div>
+                    <div class="reg-ops-delta">Below Ofcom avg</div>
+                </div>
+                <div class="reg-ops-card">
+                    <div class="reg-ops-label">Ombudsman</div>
+                    <div class="reg-ops-value">2.8%</div>
+                    <div class="reg-ops-delta">Target <2%</div>
+                </div>
+                <div class="reg-ops-card">
+                    <div class="reg-ops-label">GDPR Ready</div>
+                    <div class="reg-ops-value">90%</div>
+                    <div class="reg-ops-delta">Audit March</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Operational Readiness</div>', unsafe_allow_html=True)
+        ops_col1, ops_col2 = st.columns(2)
+        
+        with ops_col1:
+            st.markdown("**GDPR Request Mix**")
+            with st.container(border=True):
+                gdpr_df = pd.DataFrame({
+                    'Type': ['Access', 'Deletion', 'Portability', 'Correction'],
+                    'Requests': [12, 6, 4, 2]
+                })
+                gdpr_bar = alt.Chart(gdpr_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Requests:Q', title='Requests'),
+                    y=alt.Y('Type:N', sort='-x', title=None),
+                    color=alt.Color('Type:N', legend=None, scale=alt.Scale(
+                        range=['#10B981', '#F59E0B', '#29B5E8', '#8B5CF6']
+                    )),
+                    tooltip=['Type:N', 'Requests:Q']
+                ).properties(height=170)
+                charts.altair_chart(gdpr_bar, use_container_width=True)
+        
+        with ops_col2:
+            st.markdown("**Ombudsman Escalations Trend**")
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                esc_df = pd.DataFrame({
+                    'Month': months,
+                    'Escalations': [3.4, 3.2, 3.0, 2.9, 2.8, 2.8]
+                })
+                esc_line = alt.Chart(esc_df).mark_line(point=True, color='#F59E0B', strokeWidth=2).encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('Escalations:Q', title='%'),
+                    tooltip=['Month:N', alt.Tooltip('Escalations:Q', format='.1f')]
+                ).properties(height=170)
+                charts.altair_chart(esc_line, use_container_width=True)
+
+        st.markdown('<div class="section-header">Case Operations Mix</div>', unsafe_allow_html=True)
+        case_col1, case_col2 = st.columns(2)
+        
+        with case_col1:
+            st.markdown("**Investigation Backlog by Stage**")
+            with st.container(border=True):
+                backlog_df = pd.DataFrame({
+                    'Stage': ['Intake', 'Review', 'Legal', 'Resolution'],
+                    'Cases': [46, 32, 18, 12]
+                })
+                backlog_bar = alt.Chart(backlog_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Cases:Q', title='Cases'),
+                    y=alt.Y('Stage:N', sort='-x', title=None),
+                    color=alt.value('#6366F1'),
+                    tooltip=['Stage:N', 'Cases:Q']
+                ).properties(height=170)
+                charts.altair_chart(backlog_bar, use_container_width=True)
+        
+        with case_col2:
+            st.markdown("**SLA Breach Drivers**")
+            with st.container(border=True):
+                driver_df = pd.DataFrame({
+                    'Driver': ['Network', 'Vendor', 'Process', 'Complexity'],
+                    'Incidents': [14, 9, 7, 5]
+                })
+                driver_bar = alt.Chart(driver_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Incidents:Q', title='Breaches'),
+                    y=alt.Y('Driver:N', sort='-x', title=None),
+                    color=alt.value('#29B5E8'),
+                    tooltip=['Driver:N', 'Incidents:Q']
+                ).properties(height=170)
+                charts.altair_chart(driver_bar, use_container_width=True)
+
+        st.markdown('<div class="section-header">Regulatory Case Load</div>', unsafe_allow_html=True)
+        load_col1, load_col2 = st.columns(2)
+        
+        with load_col1:
+            st.markdown("**Open Cases by Regulator**")
+            with st.container(border=True):
+                regulator_df = pd.DataFrame({
+                    'Regulator': ['Ofcom', 'ICO', 'ADR', 'Local'],
+                    'Cases': [18, 9, 6, 4]
+                })
+                regulator_arc = alt.Chart(regulator_df).mark_arc(innerRadius=55).encode(
+                    theta=alt.Theta('Cases:Q', title=None),
+                    color=alt.Color('Regulator:N', legend=None, scale=alt.Scale(
+                        range=['#2563EB', '#10B981', '#F59E0B', '#EC4899']
+                    )),
+                    tooltip=['Regulator:N', 'Cases:Q']
+                ).properties(height=170)
+                charts.altair_chart(regulator_arc, use_container_width=True)
+        
+        with load_col2:
+            st.markdown("**Resolution Time by Channel**")
+            with st.container(border=True):
+                channel_df = pd.DataFrame({
+                    'Channel': ['Call Center', 'Digital', 'Retail', 'Partner'],
+                    'Days': [4.8, 3.6, 5.4, 4.1]
+                })
+                channel_bar = alt.Chart(channel_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Days:Q', title='Days to Resolve'),
+                    y=alt.Y('Channel:N', sort='-x', title=None),
+                    color=alt.value('#6366F1'),
+                    tooltip=['Channel:N', alt.Tooltip('Days:Q', format='.1f')]
+                ).properties(height=170)
+                charts.altair_chart(channel_bar, use_container_width=True)
+
+        st.markdown('<div class="section-header">Severity & Aging</div>', unsafe_allow_html=True)
+        sev_col1, sev_col2 = st.columns(2)
+        
+        with sev_col1:
+            st.markdown("**Escalation Severity Mix**")
+            with st.container(border=True):
+                severity_df = pd.DataFrame({
+                    'Severity': ['Critical', 'High', 'Medium', 'Low'],
+                    'Cases': [6, 12, 18, 22]
+                })
+                severity_arc = alt.Chart(severity_df).mark_arc(innerRadius=55).encode(
+                    theta=alt.Theta('Cases:Q', title=None),
+                    color=alt.Color('Severity:N', legend=None, scale=alt.Scale(
+                        range=['#EF4444', '#F59E0B', '#29B5E8', '#10B981']
+                    )),
+                    tooltip=['Severity:N', 'Cases:Q']
+                ).properties(height=170)
+                charts.altair_chart(severity_arc, use_container_width=True)
+        
+        with sev_col2:
+            st.markdown("**Case Aging Buckets**")
+            with st.container(border=True):
+                aging_df = pd.DataFrame({
+                    'Bucket': ['0-3 days', '4-7 days', '8-14 days', '15+ days'],
+                    'Cases': [38, 22, 14, 6]
+                })
+                aging_bar = alt.Chart(aging_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Cases:Q', title='Cases'),
+                    y=alt.Y('Bucket:N', sort='-x', title=None),
+                    color=alt.value('#10B981'),
+                    tooltip=['Bucket:N', 'Cases:Q']
+                ).properties(height=170)
+                charts.altair_chart(aging_bar, use_container_width=True)
+
+        # Compliance Score Trend and Complaint Resolution Funnel
+        compliance_col, funnel_col = st.columns(2)
+        
+        with compliance_col:
+            st.markdown('<div class="section-header">Compliance Score Trend</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                compliance_trend = pd.DataFrame({
+                    'Month': months,
+                    'Score': [94.2, 95.1, 95.8, 96.4, 97.2, 97.8],
+                    'Target': [95.0] * 6
+                })
+                
+                score_line = alt.Chart(compliance_trend).mark_line(color='#10B981', strokeWidth=3).encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('Score:Q', scale=alt.Scale(domain=[90, 100]), title='Score %')
+                )
+                
+                score_points = alt.Chart(compliance_trend).mark_circle(color='#10B981', size=60).encode(
+                    x=alt.X('Month:N', sort=months),
+                    y=alt.Y('Score:Q'),
+                    tooltip=['Month:N', alt.Tooltip('Score:Q', format='.1f')]
+                )
+                
+                target_rule = alt.Chart(compliance_trend).mark_rule(color='#DC2626', strokeDash=[4, 4]).encode(y='Target:Q')
+                
+                charts.altair_chart((score_line + score_points + target_rule).properties(height=160), use_container_width=True)
+        
+        with funnel_col:
+            st.markdown('<div class="section-header">Complaint Resolution Flow</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Resolved</span><span style="font-weight: 600;">312</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #10B981; width: 100%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Received</span><span style="font-weight: 600;">284</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #29B5E8; width: 91%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>In Progress</span><span style="font-weight: 600;">142</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #F59E0B; width: 46%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div>
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Escalated</span><span style="font-weight: 600;">8</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #EF4444; width: 3%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        col_left, col_right = st.columns([1.3, 1])
+        
+        with col_left:
+            st.markdown('<div class="section-header">SLA Performance Summary</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <table style="width: 100%; border-collapse: collapse; font-size: 0.85rem;">
+                    <thead>
+                        <tr style="border-bottom: 2px solid #E5E7EB;">
+                            <th style="text-align: left; padding: 0.5rem;">SLA Type</th>
+                            <th style="text-align: right; padding: 0.5rem;">Target</th>
+                            <th style="text-align: right; padding: 0.5rem;">Actual</th>
+                            <th style="text-align: right; padding: 0.5rem;">Status</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem;">Network Availability</td>
+                            <td style="text-align: right; padding: 0.5rem;">99.5%</td>
+                            <td style="text-align: right; padding: 0.5rem;">99.72%</td>
+                            <td style="text-align: right; padding: 0.5rem;"><span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">Met</span></td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem;">Complaint Resolution</td>
+                            <td style="text-align: right; padding: 0.5rem;">8 days</td>
+                            <td style="text-align: right; padding: 0.5rem;">4.2 days</td>
+                            <td style="text-align: right; padding: 0.5rem;"><span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">Met</span></td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem;">Fault Response (P1)</td>
+                            <td style="text-align: right; padding: 0.5rem;">4 hrs</td>
+                            <td style="text-align: right; padding: 0.5rem;">2.8 hrs</td>
+                            <td style="text-align: right; padding: 0.5rem;"><span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">Met</span></td>
+                        </tr>
+                        <tr>
+                            <td style="padding: 0.5rem;">GDPR Response</td>
+                            <td style="text-align: right; padding: 0.5rem;">30 days</td>
+                            <td style="text-align: right; padding: 0.5rem;">12 days</td>
+                            <td style="text-align: right; padding: 0.5rem;"><span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">Met</span></td>
+                        </tr>
+                    </tbody>
+                </table>
+                """, unsafe_allow_html=True)
+        
+        with col_right:
+            st.markdown('<div class="section-header">Complaint Categories</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Billing Disputes</span>
+                        <span style="font-weight: 600;">98 (34%)</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Service Quality</span>
+                        <span style="font-weight: 600;">72 (25%)</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Contract Terms</span>
+                        <span style="font-weight: 600;">58 (20%)</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0;">
+                        <span>Other</span>
+                        <span style="font-weight: 600;">56 (21%)</span>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+
+    with tab_strategy:
+        st.markdown("""
+        <div class="sf-reg-pulse">
+            <div class="sf-reg-header">
+                <div class="sf-reg-title">❄️ Snowflake Intelligence Pulse</div>
+                <div class="sf-reg-tag">AI LIVE</div>
+            </div>
+            <div class="sf-reg-grid">
+                <div class="sf-reg-card">
+                    <div class="sf-reg-label">SLA</div>
+                    <div class="sf-reg-value">97.8%</div>
+                </div>
+                <div class="sf-reg-card">
+                    <div class="sf-reg-label">Complaints</div>
+                    <div class="sf-reg-value">9.4/1K</div>
+                </div>
+                <div class="sf-reg-card">
+                    <div class="sf-reg-label">Escalation</div>
+                    <div class="sf-reg-value">2.8%</div>
+                </div>
+                <div class="sf-reg-card">
+                    <div class="sf-reg-label">Audit Ready</div>
+                    <div class="sf-reg-value">90%</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown('<div class="section-header">AI Executive Summary</div>', unsafe_allow_html=True)
+        if st.session_state.get('sf_highlights', True):
+            st.info("❄️ **Snowflake Intelligence** shows compliance trending above target, but ombudsman escalation remains above the 2% goal. Focused early‑resolution workflows and GDPR readiness actions can close the gap before the March audit.")
+
+        st.markdown('<div class="section-header">Signals & Insights</div>', unsafe_allow_html=True)
+        sig_col1, sig_col2, sig_col3 = st.columns(3)
+        with sig_col1:
+            with st.container(border=True):
+                st.markdown("**Escalation Risk**")
+                st.caption("Ombudsman cases at 2.8% driven by billing dispute delays.")
+        with sig_col2:
+            with st.container(border=True):
+                st.markdown("**SLA Stability**")
+                st.caption("Network availability holds at 99.72% with no breach risk.")
+        with sig_col3:
+            with st.container(border=True):
+                st.markdown("**Audit Readiness**")
+                st.caption("GDPR readiness at 90%; data retention gaps remain.")
+
+        st.markdown('<div class="section-header">AI-Powered Strategic Recommendations</div>', unsafe_allow_html=True)
+        rec_col1, rec_col2, rec_col3 = st.columns(3)
+        with rec_col1:
+            with st.container(border=True):
+                st.markdown("**Early Resolution Triage**")
+                st.caption("Route billing disputes to specialist pods; target escalation <2%.")
+        with rec_col2:
+            with st.container(border=True):
+                st.markdown("**SLA Monitoring**")
+                st.caption("Automate SLA variance alerts for Ofcom submissions.")
+        with rec_col3:
+            with st.container(border=True):
+                st.markdown("**GDPR Controls**")
+                st.caption("Complete retention policy updates ahead of March audit.")
+
+        st.markdown('<div class="section-header">Regulatory & Compliance Strategic Priorities — Q1 2026</div>', unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #DC2626; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 1</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Zero Ofcom Breaches</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **2** minor issues
+                - Target: **Zero** breaches
+                - Focus: Complaint handling
+                - Action: Process automation
+                """)
+        with col2:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #F59E0B; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 2</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Ombudsman < 2%</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **2.8%** escalation
+                - Target: **<2%** rate
+                - Action: Early resolution
+                - Training: Frontline teams
+                """)
+        with col3:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #10B981; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 3</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">GDPR Audit Ready</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Audit: March 2026
+                - Status: **90%** ready
+                - Gap: Data retention
+                - Action: Policy updates
+                """)
+        
+        st.markdown('<div class="section-header">Ask Snowflake Intelligence</div>', unsafe_allow_html=True)
+        questions = ["Show me our regulatory compliance status.", "How are we performing against published SLAs?", "Are we meeting Ofcom complaint handling requirements?", "What data do we need for our Ofcom submission?"]
+        sf_intel_url = "https://ai.snowflake.com/sfseeurope/pjose_aws3"
+        cols = st.columns(2)
+        for i, q in enumerate(questions):
+            with cols[i % 2]:
+                escaped_q = q.replace('"', '&quot;').replace("'", "&#39;")
+                st.markdown(f"""
+                <a href="{sf_intel_url}" target="_blank" onclick="navigator.clipboard.writeText('{escaped_q}')" style="text-decoration: none; color: inherit; display: block;">
+                    <div class="question-card">
+                        <p style="margin-bottom: 1.5rem;"><strong>Q{i+1}:</strong> "{q}"</p>
+                    </div>
+                </a>
+                """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div style="text-align: center; margin-top: 1rem; padding: 1rem; background: linear-gradient(135deg, #29B5E8 0%, #1A8BC4 100%); border-radius: 8px;">
+            <a href="{sf_intel_url}" target="_blank" style="color: white; text-decoration: none; font-weight: 600; font-size: 1rem;">
+                ❄️ Ask these questions in Snowflake Intelligence →
+            </a>
+        </div>
+        """, unsafe_allow_html=True)
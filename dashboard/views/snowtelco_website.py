@@ -0,0 +1,525 @@
+"""Simulated SnowTelco customer-facing website."""
+
+import streamlit as st
+
+
+def render_snowtelco_website():
+    """Render the SnowTelco customer-facing website"""
+    
+    # ===== GLOBAL STYLES FOR WEBSITE =====
+    
+    # ===== NAVIGATION BAR =====
+    st.markdown("""
+    <div class="web-navbar">
+        <div class="web-logo">
+            <div class="web-logo-icon">❄️</div>
+            <div class="web-logo-text">Snow<span>Telco</span></div>
+        </div>
+        <div class="web-nav-links">
+            <a href="#" class="web-nav-link">Mobile</a>
+            <a href="#" class="web-nav-link">Broadband</a>
+            <a href="#" class="web-nav-link">Business</a>
+            <a href="#" class="web-nav-link">Devices</a>
+            <a href="#" class="web-nav-link">Deals</a>
+            <a href="#" class="web-nav-link">Support</a>
+        </div>
+        <div class="web-nav-cta">
+            <button class="web-btn web-btn-outline">Sign In</button>
+            <button class="web-btn web-btn-primary">Join Now</button>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # ===== HERO SECTION =====
+    st.markdown("""
+    <div class="web-hero">
+        <div class="network-nodes">
+            <div class="network-node"></div>
+            <div class="network-node"></div>
+            <div class="network-node"></div>
+            <div class="network-node"></div>
+            <div class="network-node"></div>
+            <div class="network-node"></div>
+        </div>
+        <div class="hero-content">
+            <div class="hero-badge">
+                <div class="hero-badge-dot"></div>
+                UK's Fastest Growing Network
+            </div>
+            <h1 class="hero-title">Connect to <span>Unlimited</span> Possibilities</h1>
+            <p class="hero-subtitle">Experience lightning-fast 5G, award-winning customer service, and plans designed for how you live. Join 30,000+ happy customers today.</p>
+            <div class="hero-cta">
+                <a href="#" class="hero-btn hero-btn-primary">View Our Plans →</a>
+                <a href="#" class="hero-btn hero-btn-secondary">Check Coverage</a>
+            </div>
+            <div class="hero-stats">
+                <div class="hero-stat">
+                    <div class="hero-stat-value">99.5%</div>
+                    <div class="hero-stat-label">Network Uptime</div>
+                </div>
+                <div class="hero-stat">
+                    <div class="hero-stat-value">5G</div>
+                    <div class="hero-stat-label">Coverage Expanding</div>
+                </div>
+                <div class="hero-stat">
+                    <div class="hero-stat-value">+47</div>
+                    <div class="hero-stat-label">NPS Score</div>
+                </div>
+                <div class="hero-stat">
+                    <div class="hero-stat-value">24/7</div>
+                    <div class="hero-stat-label">UK Support</div>
+                </div>
+            </div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # ===== MOBILE PLANS SECTION =====
+    st.markdown("""
+    <div class="web-section">
+        <div class="web-section-header">
+            <div class="web-section-badge">📱 Mobile Plans</div>
+            <h2 class="web-section-title">Choose Your Perfect Plan</h2>
+            <p class="web-section-subtitle">Unlimited data, calls & texts on the UK's most reliable network. No contracts, no surprises.</p>
+        </div>
+        <div class="plans-grid">
+            <div class="plan-card">
+                <div class="plan-icon">🚀</div>
+                <div class="plan-name">Essential</div>
+                <div class="plan-desc">Perfect for light users and staying connected</div>
+                <div class="plan-price">
+                    <span class="plan-currency">£</span>
+                    <span class="plan-amount">15</span>
+                    <span class="plan-period">/month</span>
+                </div>
+                <ul class="plan-features">
+                    <li class="plan-feature"><span class="plan-feature-check">✓</span> 10GB 5G Data</li>
+                    <li class="plan-feature"><span class="plan-feature-check">✓</span> Unlimited UK Calls</li>
+                    <li class="plan-feature"><span class="plan-feature-check">✓</span> Unlimited Texts</li>
+                    <li class="plan-feature"><span class="plan-feature-check">✓</span> EU Roaming Included</li>
+                    <li class="plan-feature"><span class="plan-feature-check">✓</span> 5G Ready</li>
+                </ul>
+                <button class="plan-cta plan-cta-outline">Get Started</button>
+            </div>
+            <div class="plan-card featured">
+                <div class="plan-icon">⚡</div>
+                <div class="plan-name">Unlimited</div>
+                <div class="plan-desc">Our most popular plan with unlimited everything</div>
+                <div class="plan-price">
+                    <span class="plan-currency">£</span>
+                    <span class="plan-amount">30</span>
+                    <span class="plan-period">/month</span>
+                </div>
+                <ul class="plan-features">
+                    <li class="plan-feature"><span class="plan-feature-check">✓</span> Unlimited 5G Data</li>
+                    <li class="plan-feature"><span class="plan-feature-check">✓</span> Unlimited UK Calls</li>
+                    <li class="plan-feature"><span class="plan-feature-check">✓</span> Unlimited Texts</li>
+                    <li class="plan-feature"><span class="plan-feature-check">✓</span> 50GB EU Roaming</li>
+                    <li class="plan-feature"><span class="plan-feature-check">✓</span> Priority Support</li>
+                </ul>
+                <button class="plan-cta plan-cta-primary">Get Started</button>
+            </div>
+            <div class="plan-card">
+                <div class="plan-icon">👑</div>
+                <div class="plan-name">Premium</div>
+                <div class="plan-desc">Ultimate package with exclusive perks</div>
+                <div class="plan-price">
+                    <span class="plan-currency">£</span>
+                    <span class="plan-amount">45</span>
+                    <span class="plan-period">/month</span>
+                </div>
+                <ul class="plan-features">
+                    <li class="plan-feature"><span class="plan-feature-check">✓</span> Unlimited 5G+ Data</li>
+                    <li class="plan-feature"><span class="plan-feature-check">✓</span> International Calls (50 countries)</li>
+                    <li class="plan-feature"><span class="plan-feature-check">✓</span> 100GB Global Roaming</li>
+                    <li class="plan-feature"><span class="plan-feature-check">✓</span> Streaming Bundle Included</li>
+                    <li class="plan-feature"><span class="plan-feature-check">✓</span> Dedicated Account Manager</li>
+                </ul>
+                <button class="plan-cta plan-cta-outline">Get Started</button>
+            </div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # ===== DEVICES SECTION =====
+    st.markdown("""
+    <div class="web-section" style="background: linear-gradient(135deg, #F8FAFC 0%, #EFF6FF 100%); padding: 3rem 2rem; margin: 0 -1rem; border-radius: 0;">
+        <div class="web-section-header">
+            <div class="web-section-badge">📱 Latest Devices</div>
+            <h2 class="web-section-title">Shop the Newest Phones</h2>
+            <p class="web-section-subtitle">Get the latest smartphones with 0% APR financing. Trade in your old device for extra savings.</p>
+        </div>
+        <div class="devices-grid">
+            <div class="device-card">
+                <div class="device-image" style="background: transparent; border: none;">
+                    <img src="https://fdn2.gsmarena.com/vv/bigpic/apple-iphone-17-pro-max.jpg" alt="iPhone 17 Pro Max" style="width: 100%; height: 100%; object-fit: contain;">
+                </div>
+                <div class="device-name">iPhone 17 Pro Max</div>
+                <div class="device-specs">256GB • Orange Titanium</div>
+                <div class="device-price">From £54.99/mo</div>
+                <div class="device-finance">or £1,299 upfront</div>
+            </div>
+            <div class="device-card new">
+                <div class="device-image" style="background: transparent; border: none;">
+                    <img src="https://fdn2.gsmarena.com/vv/bigpic/samsung-galaxy-s26-ultra-r2.jpg" alt="Samsung Galaxy S26 Ultra" style="width: 100%; height: 100%; object-fit: contain;">
+                </div>
+                <div class="device-name">Samsung Galaxy S26 Ultra</div>
+                <div class="device-specs">512GB • Titanium Violet</div>
+                <div class="device-price">From £52.99/mo</div>
+                <div class="device-finance">or £1,249 upfront</div>
+            </div>
+            <div class="device-card">
+                <div class="device-image" style="background: transparent; border: none;">
+                    <img src="https://fdn2.gsmarena.com/vv/bigpic/google-pixel-10-pro-.jpg" alt="Google Pixel 10 Pro" style="width: 100%; height: 100%; object-fit: contain;">
+                </div>
+                <div class="device-name">Google Pixel 10 Pro</div>
+                <div class="device-specs">256GB • Porcelain</div>
+                <div class="device-price">From £44.99/mo</div>
+                <div class="device-finance">or £1,049 upfront</div>
+            </div>
+            <div class="device-card">
+                <div class="device-image" style="background: transparent; border: none;">
+                    <img src="https://fdn2.gsmarena.com/vv/bigpic/xiaomi-17-pro.jpg" alt="Xiaomi 17 Pro Max" style="width: 100%; height: 100%; object-fit: contain;">
+                </div>
+                <div class="device-name">Xiaomi 17 Pro Max</div>
+                <div class="device-specs">512GB • Aurora Green</div>
+                <div class="device-price">From £39.99/mo</div>
+                <div class="device-finance">or £899 upfront</div>
+            </div>
+        </div>
+        <div style="text-align: center; margin-top: 2rem;">
+            <button class="web-btn web-btn-primary">View All Devices →</button>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # ===== WHY CHOOSE US =====
+    st.markdown("""
+    <div class="web-section">
+        <div class="web-section-header">
+            <div class="web-section-badge">✨ Why SnowTelco</div>
+            <h2 class="web-section-title">What Makes Us Different</h2>
+            <p class="web-section-subtitle">We're not just another network. We're building the future of connectivity.</p>
+        </div>
+        <div class="features-grid">
+            <div class="feature-card">
+                <div class="feature-icon">🚀</div>
+                <div class="feature-title">Lightning Fast 5G</div>
+                <div class="feature-desc">Experience speeds up to 1Gbps with our expanding 5G network across the UK.</div>
+            </div>
+            <div class="feature-card">
+                <div class="feature-icon">💚</div>
+                <div class="feature-title">Carbon Neutral</div>
+                <div class="feature-desc">100% renewable energy powers our network. Every plan plants a tree.</div>
+            </div>
+            <div class="feature-card">
+                <div class="feature-icon">🎯</div>
+                <div class="feature-title">No Hidden Fees</div>
+                <div class="feature-desc">Transparent pricing with no surprise charges. What you see is what you pay.</div>
+            </div>
+            <div class="feature-card">
+                <div class="feature-icon">🏆</div>
+                <div class="feature-title">Award-Winning Support</div>
+                <div class="feature-desc">UK-based customer service available 24/7. Real people, real solutions.</div>
+            </div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # ===== COVERAGE SECTION =====
+    st.markdown("""
+    <div class="coverage-section">
+        <div class="coverage-content">
+            <div class="coverage-text">
+                <h3>🗺️ Nationwide Coverage You Can Count On</h3>
+                <p>Our network reaches 99% of the UK population with 4G, and our 5G coverage is expanding every day. Check if your area is covered with our interactive coverage map.</p>
+                <div class="coverage-stats">
+                    <div class="coverage-stat">
+                        <div class="coverage-stat-value">99%</div>
+                        <div class="coverage-stat-label">4G Population Coverage</div>
+                    </div>
+                    <div class="coverage-stat">
+                        <div class="coverage-stat-value">65%</div>
+                        <div class="coverage-stat-label">5G Coverage</div>
+                    </div>
+                    <div class="coverage-stat">
+                        <div class="coverage-stat-value">2,500+</div>
+                        <div class="coverage-stat-label">Cell Sites</div>
+                    </div>
+                </div>
+                <div style="margin-top: 1.5rem;">
+                    <button class="hero-btn hero-btn-primary">Check Your Coverage →</button>
+                </div>
+            </div>
+            <div class="coverage-map">
+                <div class="map-grid">
+                    <div class="map-cell"></div><div class="map-cell active"></div><div class="map-cell strong"></div><div class="map-cell strong"></div><div class="map-cell active"></div><div class="map-cell"></div><div class="map-cell"></div><div class="map-cell"></div>
+                    <div class="map-cell active"></div><div class="map-cell strong"></div><div class="map-cell strong"></div><div class="map-cell strong"></div><div class="map-cell strong"></div><div class="map-cell active"></div><div class="map-cell"></div><div class="map-cell"></div>
+                    <div class="map-cell"></div><div class="map-cell strong"></div><div class="map-cell strong"></div><div class="map-cell strong"></div><div class="map-cell strong"></div><div class="map-cell strong"></div><div class="map-cell active"></div><div class="map-cell"></div>
+                    <div class="map-cell"></div><div class="map-cell active"></div><div class="map-cell strong"></div><div class="map-cell strong"></div><div class="map-cell strong"></div><div class="map-cell active"></div><div class="map-cell"></div><div class="map-cell"></div>
+                    <div class="map-cell"></div><div class="map-cell"></div><div class="map-cell active"></div><div class="map-cell strong"></div><div class="map-cell active"></div><div class="map-cell"></div><div class="map-cell"></div><div class="map-cell"></div>
+                    <div class="map-cell"></div><div class="map-cell"></div><div class="map-cell"></div><div class="map-cell active"></div><div class="map-cell"></div><div class="map-cell"></div><div class="map-cell"></div><div class="map-cell"></div>
+                </div>
+            </div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # ===== BROADBAND SECTION =====
+    st.markdown("""
+    <div class="web-section">
+        <div class="web-section-header">
+            <div class="web-section-badge">🌐 Home Broadband</div>
+            <h2 class="web-section-title">Superfast Home Internet</h2>
+            <p class="web-section-subtitle">Stream, game, and work from home with our reliable fibre broadband.</p>
+        </div>
+        <div class="plans-grid">
+            <div class="plan-card">
+                <div class="plan-icon">🏠</div>
+                <div class="plan-name">Fibre Essential</div>
+                <div class="plan-desc">Perfect for browsing and streaming</div>
+                <div class="plan-price">
+                    <span class="plan-currency">£</span>
+                    <span class="plan-amount">24</span>
+                    <span class="plan-period">/month</span>
+                </div>
+                <ul class="plan-features">
+                    <li class="plan-feature"><span class="plan-feature-check">✓</span> 67 Mbps Average Speed</li>
+                    <li class="plan-feature"><span class="plan-feature-check">✓</span> Unlimited Downloads</li>
+                    <li class="plan-feature"><span class="plan-feature-check">✓</span> WiFi Router Included</li>
+                    <li class="plan-feature"><span class="plan-feature-check">✓</span> 18 Month Contract</li>
+                </ul>
+                <button class="plan-cta plan-cta-outline">Get Started</button>
+            </div>
+            <div class="plan-card featured">
+                <div class="plan-icon">⚡</div>
+                <div class="plan-name">Fibre Max</div>
+                <div class="plan-desc">Great for families and home offices</div>
+                <div class="plan-price">
+                    <span class="plan-currency">£</span>
+                    <span class="plan-amount">35</span>
+                    <span class="plan-period">/month</span>
+                </div>
+                <ul class="plan-features">
+                    <li class="plan-feature"><span class="plan-feature-check">✓</span> 150 Mbps Average Speed</li>
+                    <li class="plan-feature"><span class="plan-feature-check">✓</span> Unlimited Downloads</li>
+                    <li class="plan-feature"><span class="plan-feature-check">✓</span> WiFi 6 Router Included</li>
+                    <li class="plan-feature"><span class="plan-feature-check">✓</span> Mesh Extender Included</li>
+                </ul>
+                <button class="plan-cta plan-cta-primary">Get Started</button>
+            </div>
+            <div class="plan-card">
+                <div class="plan-icon">🔥</div>
+                <div class="plan-name">Fibre Ultra</div>
+                <div class="plan-desc">Maximum speed for power users</div>
+                <div class="plan-price">
+                    <span class="plan-currency">£</span>
+                    <span class="plan-amount">49</span>
+                    <span class="plan-period">/month</span>
+                </div>
+                <ul class="plan-features">
+                    <li class="plan-feature"><span class="plan-feature-check">✓</span> 500 Mbps Average Speed</li>
+                    <li class="plan-feature"><span class="plan-feature-check">✓</span> Unlimited Downloads</li>
+                    <li class="plan-feature"><span class="plan-feature-check">✓</span> WiFi 6E Router + 2 Extenders</li>
+                    <li class="plan-feature"><span class="plan-feature-check">✓</span> Priority Installation</li>
+                </ul>
+                <button class="plan-cta plan-cta-outline">Get Started</button>
+            </div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # ===== TESTIMONIALS =====
+    st.markdown("""
+    <div class="web-section" style="background: linear-gradient(135deg, #F8FAFC 0%, #EFF6FF 100%); padding: 3rem 2rem; margin: 0 -1rem; border-radius: 0;">
+        <div class="web-section-header">
+            <div class="web-section-badge">💬 Customer Stories</div>
+            <h2 class="web-section-title">Loved by 30,000+ Customers</h2>
+            <p class="web-section-subtitle">Don't just take our word for it. Here's what our customers say.</p>
+        </div>
+        <div class="testimonials-grid">
+            <div class="testimonial-card">
+                <div class="testimonial-stars">★★★★★</div>
+                <div class="testimonial-text">"Switched from my previous provider and the difference is night and day. Finally have signal everywhere I go, and the customer service is actually helpful!"</div>
+                <div class="testimonial-author">
+                    <div class="testimonial-avatar">JM</div>
+                    <div>
+                        <div class="testimonial-name">James Mitchell</div>
+                        <div class="testimonial-role">Premium Customer</div>
+                    </div>
+                </div>
+            </div>
+            <div class="testimonial-card">
+                <div class="testimonial-stars">★★★★★</div>
+                <div class="testimonial-text">"The 5G speeds are incredible. I work remotely and can now do video calls from anywhere. The unlimited plan is exactly what I needed."</div>
+                <div class="testimonial-author">
+                    <div class="testimonial-avatar">SC</div>
+                    <div>
+                        <div class="testimonial-name">Sarah Chen</div>
+                        <div class="testimonial-role">Unlimited Plan</div>
+                    </div>
+                </div>
+            </div>
+            <div class="testimonial-card">
+                <div class="testimonial-stars">★★★★★</div>
+                <div class="testimonial-text">"Best decision for our business. We moved our entire team to SnowTelco and saved 30% while getting better coverage. Highly recommend!"</div>
+                <div class="testimonial-author">
+                    <div class="testimonial-avatar">RK</div>
+                    <div>
+                        <div class="testimonial-name">Raj Kumar</div>
+                        <div class="testimonial-role">Business Customer</div>
+                    </div>
+                </div>
+            </div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # ===== BUSINESS SOLUTIONS =====
+    st.markdown("""
+    <div class="business-section">
+        <div class="web-section-header">
+            <div class="web-section-badge">🏢 Business Solutions</div>
+            <h2 class="web-section-title">Enterprise-Grade Connectivity</h2>
+            <p class="web-section-subtitle">Tailored solutions for businesses of all sizes. From startups to enterprises.</p>
+        </div>
+        <div class="business-grid">
+            <div class="business-card">
+                <div class="business-icon">📱</div>
+                <div class="business-title">Business Mobile</div>
+                <div class="business-desc">Flexible mobile plans for your team with shared data pools, device management, and priority support.</div>
+            </div>
+            <div class="business-card">
+                <div class="business-icon">🌐</div>
+                <div class="business-title">Business Broadband</div>
+                <div class="business-desc">Dedicated business lines with guaranteed uptime SLAs, static IPs, and 4-hour fix guarantee.</div>
+            </div>
+            <div class="business-card">
+                <div class="business-icon">☁️</div>
+                <div class="business-title">IoT & M2M</div>
+                <div class="business-desc">Connect your devices with our IoT platform. Fleet management, sensors, and smart solutions.</div>
+            </div>
+            <div class="business-card">
+                <div class="business-icon">🔒</div>
+                <div class="business-title">Private Networks</div>
+                <div class="business-desc">Dedicated 5G private networks for manufacturing, logistics, and enterprise campuses.</div>
+            </div>
+            <div class="business-card">
+                <div class="business-icon">📞</div>
+                <div class="business-title">Unified Comms</div>
+                <div class="business-desc">Voice, video, and collaboration tools in one platform. Microsoft Teams integration included.</div>
+            </div>
+            <div class="business-card">
+                <div class="business-icon">🛡️</div>
+                <div class="business-title">Cyber Security</div>
+                <div class="business-desc">Protect your business with our enterprise security suite. Threat detection and response included.</div>
+            </div>
+        </div>
+        <div style="text-align: center; margin-top: 2rem;">
+            <button class="web-btn web-btn-primary">Contact Business Sales →</button>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # ===== SUPPORT SECTION =====
+    st.markdown("""
+    <div class="web-section">
+        <div class="web-section-header">
+            <div class="web-section-badge">🤝 Help & Support</div>
+            <h2 class="web-section-title">We're Here to Help</h2>
+            <p class="web-section-subtitle">Get support your way - online, by phone, or in-store.</p>
+        </div>
+        <div class="support-grid">
+            <div class="support-card">
+                <div class="support-icon">💬</div>
+                <div class="support-title">Live Chat</div>
+                <div class="support-desc">Chat with us 24/7</div>
+            </div>
+            <div class="support-card">
+                <div class="support-icon">📞</div>
+                <div class="support-title">Call Us</div>
+                <div class="support-desc">0800 123 4567</div>
+            </div>
+            <div class="support-card">
+                <div class="support-icon">📍</div>
+                <div class="support-title">Find a Store</div>
+                <div class="support-desc">150+ locations</div>
+            </div>
+            <div class="support-card">
+                <div class="support-icon">📚</div>
+                <div class="support-title">Help Centre</div>
+                <div class="support-desc">FAQs & guides</div>
+            </div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # ===== FOOTER =====
+    st.markdown("""
+    <div class="web-footer">
+        <div class="footer-grid">
+            <div class="footer-brand">
+                <div class="footer-logo">
+                    <div class="footer-logo-icon">❄️</div>
+                    <div class="footer-logo-text">SnowTelco</div>
+                </div>
+                <p class="footer-desc">Connecting the UK with lightning-fast 5G and award-winning customer service. Building the network of tomorrow, today.</p>
+                <div class="footer-social">
+                    <div class="social-icon">f</div>
+                    <div class="social-icon">𝕏</div>
+                    <div class="social-icon">in</div>
+                    <div class="social-icon">📷</div>
+                </div>
+            </div>
+            <div class="footer-column">
+                <h4>Mobile</h4>
+                <ul class="footer-links">
+                    <li><a href="#" class="footer-link">Pay Monthly</a></li>
+                    <li><a href="#" class="footer-link">SIM Only</a></li>
+                    <li><a href="#" class="footer-link">Pay As You Go</a></li>
+                    <li><a href="#" class="footer-link">5G Plans</a></li>
+                    <li><a href="#" class="footer-link">International</a></li>
+                </ul>
+            </div>
+            <div class="footer-column">
+                <h4>Broadband</h4>
+                <ul class="footer-links">
+                    <li><a href="#" class="footer-link">Fibre Broadband</a></li>
+                    <li><a href="#" class="footer-link">Home WiFi</a></li>
+                    <li><a href="#" class="footer-link">TV Packages</a></li>
+                    <li><a href="#" class="footer-link">Bundles</a></li>
+                    <li><a href="#" class="footer-link">Coverage Check</a></li>
+                </ul>
+            </div>
+            <div class="footer-column">
+                <h4>Company</h4>
+                <ul class="footer-links">
+                    <li><a href="#" class="footer-link">About Us</a></li>
+                    <li><a href="#" class="footer-link">Careers</a></li>
+                    <li><a href="#" class="footer-link">Press</a></li>
+                    <li><a href="#" class="footer-link">Investors</a></li>
+                    <li><a href="#" class="footer-link">Sustainability</a></li>
+                </ul>
+            </div>
+            <div class="footer-column">
+                <h4>Support</h4>
+                <ul class="footer-links">
+                    <li><a href="#" class="footer-link">Help Centre</a></li>
+                    <li><a href="#" class="footer-link">Contact Us</a></li>
+                    <li><a href="#" class="footer-link">Store Finder</a></li>
+                    <li><a href="#" class="footer-link">Network Status</a></li>
+                    <li><a href="#" class="footer-link">Complaints</a></li>
+                </ul>
+            </div>
+        </div>
+        <div class="footer-bottom">
+            <div class="footer-copyright">© 2026 SnowTelco Ltd. All rights reserved.</div>
+            <div class="footer-legal">
+                <a href="#">Privacy Policy</a>
+                <a href="#">Terms of Service</a>
+                <a href="#">Cookie Settings</a>
+                <a href="#">Accessibility</a>
+            </div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
@@ -0,0 +1,430 @@
+"""VP Billing & Revenue dashboard."""
+
+import streamlit as st
+import pandas as pd
+import altair as alt
+
+from dashboard import charts
+
+
+def render_vp_billing_revenue():
+    import pandas as pd
+    import altair as alt
+    
+    st.markdown("""
+    <div class="main-header">
+        <h1>VP Billing & Revenue Dashboard</h1>
+        <p>Billing Performance, Payment Status & Revenue Assurance</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Dashboard Tabs
+    tab_overview, tab_ops, tab_strategy = st.tabs(["📊 Overview & Analysis", "💳 Revenue Operations", "❄️ Snowflake Intelligence"])
+
+    with tab_overview:
+        
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['BILLING', 'REVENUE_ASSURANCE', 'DISPUTE', 'MOBILE']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+        
+        # VP BILLING - BILLING STREAM ANIMATION
+        st.markdown("""<div class="billing-stream"><div class="billing-header"><div class="billing-title">💳 Billing Stream</div><div class="billing-live"><div class="billing-live-dot"></div><span class="billing-live-text">Processing</span></div></div><div class="billing-counter"><div class="billing-amount">£6.54M</div><div class="billing-label">Total Billed This Month</div></div><div class="billing-flow-track"><span class="billing-flow-item" style="animation-delay:0s">INV-31847</span><span class="billing-flow-item" style="animation-delay:1s">INV-31848</span><span class="billing-flow-item" style="animation-delay:2s">INV-31849</span></div><div class="billing-stats"><div class="billing-stat"><div class="billing-stat-val">31,847</div><div class="billing-stat-label">Invoices</div></div><div class="billing-stat"><div class="billing-stat-val">96.8%</div><div class="billing-stat-label">Collected</div></div><div class="billing-stat"><div class="billing-stat-val">£205</div><div class="billing-stat-label">Avg Invoice</div></div><div class="billing-stat"><div class="billing-stat-val">142</div><div class="billing-stat-label">Disputes</div></div></div></div>""", unsafe_allow_html=True)
+        
+        
+        st.markdown('<div class="section-header">Billing Overview</div>', unsafe_allow_html=True)
+        st.markdown("""
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #29B5E8;">
+                <div class="kpi-icon">📄</div>
+                <div class="kpi-label">Invoices Generated</div>
+                <div class="kpi-value">31,847</div>
+                <div class="kpi-delta positive">↑ +3.2% MoM</div>
+            </div>
+            <div class="kpi-card" style="--accent: #10B981;">
+                <div class="kpi-icon">💰</div>
+                <div class="kpi-label">Total Billed</div>
+                <div class="kpi-value">£6.54M</div>
+                <div class="kpi-delta positive">↑ +8.4% MoM</div>
+            </div>
+            <div class="kpi-card" style="--accent: #F59E0B;">
+                <div class="kpi-icon">📊</div>
+                <div class="kpi-label">Avg Invoice Value</div>
+                <div class="kpi-value">£205</div>
+                <div class="kpi-delta positive">↑ +£12 MoM</div>
+            </div>
+            <div class="kpi-card" style="--accent: #8B5CF6;">
+                <div class="kpi-icon">✅</div>
+                <div class="kpi-label">Collection Rate</div>
+                <div class="kpi-value">94.2%</div>
+                <div class="kpi-delta positive">↑ +1.8% MoM</div>
+            </div>
+        </div>
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #EF4444;">
+                <div class="kpi-icon">⚠️</div>
+                <div class="kpi-label">Overdue Amount</div>
+                <div class="kpi-value">£312K</div>
+                <div class="kpi-delta negative">4.8% of billed</div>
+            </div>
+            <div class="kpi-card" style="--accent: #14B8A6;">
+                <div class="kpi-icon">📝</div>
+                <div class="kpi-label">Credit Notes</div>
+                <div class="kpi-value">£48.2K</div>
+                <div class="kpi-delta negative">142 issued</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EC4899;">
+                <div class="kpi-icon">🔄</div>
+                <div class="kpi-label">Open Disputes</div>
+                <div class="kpi-value">89</div>
+                <div class="kpi-delta negative">£124K value</div>
+            </div>
+            <div class="kpi-card" style="--accent: #6366F1;">
+                <div class="kpi-icon">💵</div>
+                <div class="kpi-label">Unbilled Usage</div>
+                <div class="kpi-value">£28.4K</div>
+                <div class="kpi-delta negative">Revenue at risk</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # New: Collection Trend and Aging Analysis
+        collection_col, aging_col = st.columns(2)
+        
+        with collection_col:
+            st.markdown('<div class="section-header">Collection Rate Trend (12 Months)</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                months = ['Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                collection_data = pd.DataFrame({
+                    'Month': months,
+                    'Rate': [91.2, 91.8, 92.4, 92.1, 92.8, 93.2, 93.0, 93.5, 93.8, 94.0, 93.9, 94.2],
+                    'Target': [95.0] * 12
+                })
+                
+                rate_line = alt.Chart(collection_data).mark_line(color='#10B981', strokeWidth=3).encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('Rate:Q', scale=alt.Scale(domain=[88, 98]), title='Collection %')
+                )
+                
+                rate_points = alt.Chart(collection_data).mark_circle(color='#10B981', size=50).encode(
+                    x=alt.X('Month:N', sort=months),
+                    y=alt.Y('Rate:Q'),
+                    tooltip=['Month:N', alt.Tooltip('Rate:Q', format='.1f')]
+                )
+                
+                target_rule = alt.Chart(collection_data).mark_rule(color='#DC2626', strokeDash=[4, 4]).encode(y='Target:Q')
+                
+                charts.altair_chart((rate_line + rate_points + target_rule).properties(height=160), use_container_width=True)
+        
+        with aging_col:
+            st.markdown('<div class="section-header">Receivables Aging</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                aging_data = pd.DataFrame({
+                    'Aging': ['Current', '1-30 Days', '31-60 Days', '61-90 Days', '90+ Days'],
+                    'Amount': [5.82, 0.42, 0.18, 0.08, 0.04]
+                })
+                
+                aging_bars = alt.Chart(aging_data).mark_bar(cornerRadiusTopLeft=6, cornerRadiusTopRight=6).encode(
+                    x=alt.X('Aging:N', sort=['Current', '1-30 Days', '31-60 Days', '61-90 Days', '90+ Days'], title=None),
+                    y=alt.Y('Amount:Q', title='Amount (£M)'),
+                    color=alt.Color('Aging:N', scale=alt.Scale(
+                        domain=['Current', '1-30 Days', '31-60 Days', '61-90 Days', '90+ Days'],
+                        range=['#10B981', '#29B5E8', '#F59E0B', '#F97316', '#EF4444']
+                    ), legend=None),
+                    tooltip=['Aging:N', alt.Tooltip('Amount:Q', format='.2f')]
+                ).properties(height=160)
+                
+                charts.altair_chart(aging_bars, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Billing Quality Signals</div>', unsafe_allow_html=True)
+        quality_col1, quality_col2 = st.columns(2)
+        
+        with quality_col1:
+            st.markdown("**Invoice Volume vs Collected**")
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                volume_df = pd.DataFrame({
+                    'Month': months * 2,
+                    'Metric': ['Invoices'] * 6 + ['Collected'] * 6,
+                    'Value': [26.4, 27.1, 28.3, 29.0, 30.2, 31.8,
+                              24.8, 25.6, 26.4, 27.0, 28.5, 29.9]
+                })
+                volume_line = alt.Chart(volume_df).mark_line(point=True).encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('Value:Q', title='Volume (K)'),
+                    color=alt.Color('Metric:N', scale=alt.Scale(
+                        domain=['Invoices', 'Collected'],
+                        range=['#2563EB', '#10B981']
+                    ), legend=alt.Legend(orient='bottom', title=None)),
+                    tooltip=['Month:N', 'Metric:N', alt.Tooltip('Value:Q', format='.1f')]
+                ).properties(height=180)
+                charts.altair_chart(volume_line, use_container_width=True)
+        
+        with quality_col2:
+            st.markdown("**Credit Notes by Reason**")
+            with st.container(border=True):
+                credit_df = pd.DataFrame({
+                    'Reason': ['Pricing Error', 'Service Credit', 'Contract Adjustment', 'Usage Dispute', 'Other'],
+                    'Amount': [18.6, 11.4, 7.2, 6.0, 5.0]
+                })
+                credit_bar = alt.Chart(credit_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Amount:Q', title='Amount (£K)'),
+                    y=alt.Y('Reason:N', sort='-x', title=None),
+                    color=alt.Color('Reason:N', legend=None, scale=alt.Scale(
+                        range=['#EF4444', '#F59E0B', '#8B5CF6', '#29B5E8', '#10B981']
+                    )),
+                    tooltip=['Reason:N', alt.Tooltip('Amount:Q', format='.1f')]
+                ).properties(height=180)
+                charts.altair_chart(credit_bar, use_container_width=True)
+        
+    with tab_ops:
+        st.markdown("""
+        <div class="billing-ops-pulse">
+            <div class="billing-ops-header">
+                <div class="billing-ops-title">💳 Revenue Operations Pulse</div>
+                <div class="billing-ops-tag">LIVE OPS</div>
+            </div>
+            <div class="billing-ops-grid">
+                <div class="billing-ops-card">
+                    <div class="billing-ops-label">Collections</div>
+                    <div class="billing-ops-value">94.2%</div>
+                    <div class="billing-ops-delta">+1.8% MoM</div>
+                </div>
+                <div class="billing-ops-card">
+                    <div class="billing-ops-label">Overdue</div>
+                    <div class="billing-ops-value">£312K</div>
+                    <div class="billing-ops-delta">4.8% of billed</div>
+                </div>
+                <div class="billing-ops-card">
+                    <div class="billing-ops-label">Open Disputes</div>
+                    <div class="billing-ops-value">89</div>
+                    <div class="billing-ops-delta">£124K exposure</div>
+                </div>
+                <div class="billing-ops-card">
+                    <div class="billing-ops-label">Leakage Risk</div>
+                    <div class="billing-ops-value">£28.4K</div>
+                    <div class="billing-ops-delta">Unbilled usage</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Revenue Assurance & Disputes</div>', unsafe_allow_html=True)
+        
+        col_left, col_right = st.columns([1.3, 1])
+        
+        with col_left:
+            st.markdown("**Payment Status Distribution**")
+            with st.container(border=True):
+                payment_data = pd.DataFrame({
+                    'Status': ['Paid', 'Pending', 'Overdue 1-30d', 'Overdue 31-60d', 'Overdue 60d+'],
+                    'Amount': [5.82, 0.42, 0.18, 0.08, 0.04],
+                    'Count': [28450, 2100, 890, 320, 180]
+                })
+                
+                donut = alt.Chart(payment_data).mark_arc(innerRadius=60, outerRadius=100).encode(
+                    theta=alt.Theta('Amount:Q'),
+                    color=alt.Color('Status:N', scale=alt.Scale(
+                        domain=['Paid', 'Pending', 'Overdue 1-30d', 'Overdue 31-60d', 'Overdue 60d+'],
+                        range=['#10B981', '#29B5E8', '#F59E0B', '#F97316', '#DC2626']
+                    ), legend=alt.Legend(orient='bottom', title=None)),
+                    tooltip=['Status:N', alt.Tooltip('Amount:Q', title='Amount (£M)', format='.2f'), 'Count:Q']
+                ).properties(height=220)
+                
+                charts.altair_chart(donut, use_container_width=True)
+        
+        with col_right:
+            st.markdown("**Dispute Categories**")
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Incorrect Charges</span>
+                        <span style="font-weight: 600;">34 (£48K)</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Service Quality</span>
+                        <span style="font-weight: 600;">28 (£32K)</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Contract Terms</span>
+                        <span style="font-weight: 600;">15 (£24K)</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0;">
+                        <span>Other</span>
+                        <span style="font-weight: 600;">12 (£20K)</span>
+                    </div>
+                </div>
+                <div style="margin-top: 0.75rem; padding: 0.5rem; background: #FEF3C7; border-radius: 8px; font-size: 0.75rem; text-align: center;">
+                    <span style="color: #92400E;">Avg resolution: 8.4 days</span>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Collections & Resolution Ops</div>', unsafe_allow_html=True)
+        ops_col1, ops_col2 = st.columns(2)
+        
+        with ops_col1:
+            st.markdown("**Dunning Effectiveness**")
+            with st.container(border=True):
+                dunning_df = pd.DataFrame({
+                    'Stage': ['Reminder 1', 'Reminder 2', 'Final Notice', 'Collections'],
+                    'Recovered': [38, 26, 18, 12]
+                })
+                dunning_bar = alt.Chart(dunning_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Recovered:Q', title='Recovered (£K)'),
+                    y=alt.Y('Stage:N', sort='-x', title=None),
+                    color=alt.Color('Stage:N', legend=None, scale=alt.Scale(
+                        range=['#10B981', '#29B5E8', '#F59E0B', '#EF4444']
+                    )),
+                    tooltip=['Stage:N', alt.Tooltip('Recovered:Q', format='.0f')]
+                ).properties(height=180)
+                charts.altair_chart(dunning_bar, use_container_width=True)
+        
+        with ops_col2:
+            st.markdown("**Dispute Resolution Time**")
+            with st.container(border=True):
+                weeks = ['Wk1', 'Wk2', 'Wk3', 'Wk4', 'Wk5', 'Wk6']
+                resolution_df = pd.DataFrame({
+                    'Week': weeks,
+                    'Days': [9.6, 9.1, 8.7, 8.4, 8.3, 8.0]
+                })
+                resolution_line = alt.Chart(resolution_df).mark_line(point=True, color='#2563EB').encode(
+                    x=alt.X('Week:N', sort=weeks, title=None),
+                    y=alt.Y('Days:Q', title='Avg Days', scale=alt.Scale(domain=[6, 11])),
+                    tooltip=['Week:N', alt.Tooltip('Days:Q', format='.1f')]
+                ).properties(height=180)
+                charts.altair_chart(resolution_line, use_container_width=True)
+
+    with tab_strategy:
+        st.markdown("""
+        <div class="sf-billing-pulse">
+            <div class="sf-billing-header">
+                <div class="sf-billing-title">❄️ Snowflake Intelligence Pulse</div>
+                <div class="sf-billing-tag">AI LIVE</div>
+            </div>
+            <div class="sf-billing-grid">
+                <div class="sf-billing-card">
+                    <div class="sf-billing-label">At-Risk Cash</div>
+                    <div class="sf-billing-value">£312K</div>
+                </div>
+                <div class="sf-billing-card">
+                    <div class="sf-billing-label">Leakage</div>
+                    <div class="sf-billing-value">£28.4K</div>
+                </div>
+                <div class="sf-billing-card">
+                    <div class="sf-billing-label">Dispute Risk</div>
+                    <div class="sf-billing-value">£124K</div>
+                </div>
+                <div class="sf-billing-card">
+                    <div class="sf-billing-label">Collection Lift</div>
+                    <div class="sf-billing-value">+1.8%</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">AI Executive Summary</div>', unsafe_allow_html=True)
+        if st.session_state.get('sf_highlights', True):
+            st.info("❄️ **Snowflake Intelligence** detects overdue concentration in 1–30 day buckets and rising dispute volume in service quality. Focused recovery campaigns and invoice clarity updates can close the 1.8% collection gap and reduce dispute exposure by ~£30K.")
+        
+        st.markdown('<div class="section-header">Signals & Insights</div>', unsafe_allow_html=True)
+        sig_col1, sig_col2, sig_col3 = st.columns(3)
+        with sig_col1:
+            with st.container(border=True):
+                st.markdown("**Overdue Drift**")
+                st.caption("1–30 day overdue balance climbs 12% vs last month; SME segment driving most uplift.")
+        with sig_col2:
+            with st.container(border=True):
+                st.markdown("**Dispute Hotspots**")
+                st.caption("Service quality disputes cluster in two regions; average resolution above target by 2.1 days.")
+        with sig_col3:
+            with st.container(border=True):
+                st.markdown("**Leakage Risk**")
+                st.caption("Unbilled usage highest in roaming and IoT SKUs; daily reconciliation gap persists.")
+        
+        st.markdown('<div class="section-header">AI-Powered Strategic Recommendations</div>', unsafe_allow_html=True)
+        rec_col1, rec_col2, rec_col3 = st.columns(3)
+        with rec_col1:
+            with st.container(border=True):
+                st.markdown("**Targeted Collections**")
+                st.caption("Deploy segmented dunning for 1–30 day balances; expected +0.6% collection lift.")
+        with rec_col2:
+            with st.container(border=True):
+                st.markdown("**Invoice Clarity Fixes**")
+                st.caption("Redesign top dispute drivers; projected 25% reduction in incorrect charge claims.")
+        with rec_col3:
+            with st.container(border=True):
+                st.markdown("**Leakage Automation**")
+                st.caption("Real-time usage reconciliation and alerting to close £28K leakage risk.")
+        
+        st.markdown('<div class="section-header">VP Billing & Revenue Strategic Priorities — Q1 2026</div>', unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #DC2626; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 1</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Collection Rate 96%</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **94.2%** collected
+                - Gap: **1.8%** to target
+                - Focus: Overdue recovery
+                - Action: Automated reminders
+                """)
+        with col2:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #F59E0B; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 2</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Reduce Disputes 50%</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **89** open disputes
+                - Target: **<50** by Q2
+                - Root cause: Billing clarity
+                - Initiative: Invoice redesign
+                """)
+        with col3:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #10B981; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 3</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Revenue Assurance</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Unbilled: **£28.4K** at risk
+                - Target: **Zero** leakage
+                - Action: Daily reconciliation
+                - Automation: Real-time alerts
+                """)
+        
+        st.markdown('<div class="section-header">Ask Snowflake Intelligence</div>', unsafe_allow_html=True)
+        questions = [
+            "Show me billing performance - invoices, amounts, and average values.",
+            "What's our payment status distribution?",
+            "Are there revenue leakage risks?",
+            "Show me billing disputes and resolution times."
+        ]
+        sf_intel_url = "https://ai.snowflake.com/sfseeurope/pjose_aws3"
+        cols = st.columns(2)
+        for i, q in enumerate(questions):
+            with cols[i % 2]:
+                escaped_q = q.replace('"', '&quot;').replace("'", "&#39;")
+                st.markdown(f"""
+                <a href="{sf_intel_url}" target="_blank" onclick="navigator.clipboard.writeText('{escaped_q}')" style="text-decoration: none; color: inherit; display: block;">
+                    <div class="question-card">
+                        <p style="margin-bottom: 1.5rem;"><strong>Q{i+1}:</strong> "{q}"</p>
+                    </div>
+                </a>
+                """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div style="text-align: center; margin-top: 1rem; padding: 1rem; background: linear-gradient(135deg, #29B5E8 0%, #1A8BC4 100%); border-radius: 8px;">
+            <a href="{sf_intel_url}" target="_blank" style="color: white; text-decoration: none; font-weight: 600; font-size: 1rem;">
+                ❄️ Ask these questions in Snowflake Intelligence →
+            </a>
+        </div>
+        """, unsafe_allow_html=True)
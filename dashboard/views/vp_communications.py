@@ -0,0 +1,519 @@
+"""VP Communications dashboard."""
+
+import streamlit as st
+import pandas as pd
+import altair as alt
+
+from dashboard import charts
+
+
+def render_vp_communications():
+    import pandas as pd
+    import altair as alt
+    
+    st.markdown("""
+    <div class="main-header">
+        <h1>VP Communications Dashboard</h1>
+        <p>Brand Reputation, Social Media Monitoring & Crisis Management</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Dashboard Tabs
+    tab_overview, tab_ops, tab_strategy = st.tabs(["📊 Overview & Analysis", "📣 Communications Ops", "❄️ Snowflake Intelligence"])
+
+    with tab_overview:
+        
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['SOCIAL_SENTIMENT']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+        
+        # VP COMMUNICATIONS - SOCIAL SENTIMENT WAVE ANIMATION
+        st.markdown("""<div class="social-sentiment"><div class="social-header"><div class="social-title">📱 Social Sentiment Live</div><div class="social-mentions">8,420 mentions today</div></div><div class="social-emojis"><div class="social-emoji"><div class="social-emoji-icon">😊</div><div class="social-emoji-pct">35%</div><div class="social-emoji-label">Positive</div></div><div class="social-emoji"><div class="social-emoji-icon">😐</div><div class="social-emoji-pct">25%</div><div class="social-emoji-label">Neutral</div></div><div class="social-emoji"><div class="social-emoji-icon">😠</div><div class="social-emoji-pct">40%</div><div class="social-emoji-label">Negative</div></div></div><div class="social-channels"><div class="social-channel"><div class="social-channel-icon">🐦</div><div class="social-channel-val">3.2K</div><div class="social-channel-label">Twitter</div></div><div class="social-channel"><div class="social-channel-icon">📘</div><div class="social-channel-val">2.8K</div><div class="social-channel-label">Facebook</div></div><div class="social-channel"><div class="social-channel-icon">📸</div><div class="social-channel-val">1.4K</div><div class="social-channel-label">Instagram</div></div><div class="social-channel"><div class="social-channel-icon">💼</div><div class="social-channel-val">1K</div><div class="social-channel-label">LinkedIn</div></div></div></div>""", unsafe_allow_html=True)
+        
+        
+        st.markdown('<div class="section-header">Social Media Overview</div>', unsafe_allow_html=True)
+        st.markdown("""
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #10B981;">
+                <div class="kpi-icon">😊</div>
+                <div class="kpi-label">Positive Sentiment</div>
+                <div class="kpi-value">35%</div>
+                <div class="kpi-delta positive">↑ +4% WoW</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EF4444;">
+                <div class="kpi-icon">😠</div>
+                <div class="kpi-label">Negative Sentiment</div>
+                <div class="kpi-value">40%</div>
+                <div class="kpi-delta negative">↑ +2% WoW</div>
+            </div>
+            <div class="kpi-card" style="--accent: #9CA3AF;">
+                <div class="kpi-icon">😐</div>
+                <div class="kpi-label">Neutral</div>
+                <div class="kpi-value">25%</div>
+                <div class="kpi-delta positive">-6% WoW</div>
+            </div>
+            <div class="kpi-card" style="--accent: #29B5E8;">
+                <div class="kpi-icon">💬</div>
+                <div class="kpi-label">Total Mentions</div>
+                <div class="kpi-value">2,847</div>
+                <div class="kpi-delta positive">↑ +18% WoW</div>
+            </div>
+        </div>
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #F59E0B;">
+                <div class="kpi-icon">⏱️</div>
+                <div class="kpi-label">Avg Response Time</div>
+                <div class="kpi-value">2.4 hrs</div>
+                <div class="kpi-delta positive">↓ -0.6 hrs</div>
+            </div>
+            <div class="kpi-card" style="--accent: #8B5CF6;">
+                <div class="kpi-icon">📋</div>
+                <div class="kpi-label">Response Backlog</div>
+                <div class="kpi-value">42</div>
+                <div class="kpi-delta negative">Need attention</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EC4899;">
+                <div class="kpi-icon">🌟</div>
+                <div class="kpi-label">Influencer Mentions</div>
+                <div class="kpi-value">28</div>
+                <div class="kpi-delta positive">High reach</div>
+            </div>
+            <div class="kpi-card" style="--accent: #14B8A6;">
+                <div class="kpi-icon">🎯</div>
+                <div class="kpi-label">Engagement Rate</div>
+                <div class="kpi-value">3.2%</div>
+                <div class="kpi-delta positive">↑ +0.4%</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Awareness & Reach</div>', unsafe_allow_html=True)
+        reach_col1, reach_col2 = st.columns(2)
+        
+        with reach_col1:
+            st.markdown("**Share of Voice (Weekly)**")
+            with st.container(border=True):
+                weeks = ['W1', 'W2', 'W3', 'W4']
+                sov_df = pd.DataFrame({
+                    'Week': weeks * 3,
+                    'Brand': ['SnowTelco'] * 4 + ['EE'] * 4 + ['O2'] * 4,
+                    'Share': [18, 19, 20, 21, 28, 27, 27, 26, 24, 24, 23, 23]
+                })
+                sov_area = alt.Chart(sov_df).mark_area().encode(
+                    x=alt.X('Week:N', sort=weeks, title=None),
+                    y=alt.Y('Share:Q', stack='normalize', title='%'),
+                    color=alt.Color('Brand:N', legend=alt.Legend(orient='bottom', title=None)),
+                    tooltip=['Week:N', 'Brand:N', alt.Tooltip('Share:Q', format='.0f')]
+                ).properties(height=170)
+                charts.altair_chart(sov_area, use_container_width=True)
+        
+        with reach_col2:
+            st.markdown("**Earned Media Mentions**")
+            with st.container(border=True):
+                media_df = pd.DataFrame({
+                    'Channel': ['Press', 'Broadcast', 'Online', 'Podcasts'],
+                    'Mentions': [42, 18, 74, 12]
+                })
+                media_bar = alt.Chart(media_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Mentions:Q', title='Mentions'),
+                    y=alt.Y('Channel:N', sort='-x', title=None),
+                    color=alt.value('#29B5E8'),
+                    tooltip=['Channel:N', 'Mentions:Q']
+                ).properties(height=170)
+                charts.altair_chart(media_bar, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Engagement Performance</div>', unsafe_allow_html=True)
+        eng_col1, eng_col2 = st.columns(2)
+        
+        with eng_col1:
+            st.markdown("**Engagement Rate by Platform**")
+            with st.container(border=True):
+                eng_df = pd.DataFrame({
+                    'Platform': ['Twitter/X', 'Facebook', 'Instagram', 'LinkedIn'],
+                    'Engagement': [2.8, 3.1, 4.4, 3.6]
+                })
+                eng_bar = alt.Chart(eng_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Engagement:Q', title='Engagement %'),
+                    y=alt.Y('Platform:N', sort='-x', title=None),
+                    color=alt.Color('Platform:N', legend=None, scale=alt.Scale(
+                        range=['#2563EB', '#9CA3AF', '#EC4899', '#14B8A6']
+                    )),
+                    tooltip=['Platform:N', alt.Tooltip('Engagement:Q', format='.1f')]
+                ).properties(height=170)
+                charts.altair_chart(eng_bar, use_container_width=True)
+        
+        with eng_col2:
+            st.markdown("**Crisis Alert Volume (Daily)**")
+            with st.container(border=True):
+                days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+                crisis_df = pd.DataFrame({
+                    'Day': days,
+                    'Alerts': [6, 4, 8, 5, 7, 3, 2]
+                })
+                crisis_line = alt.Chart(crisis_df).mark_line(point=True, color='#EF4444', strokeWidth=2).encode(
+                    x=alt.X('Day:N', sort=days, title=None),
+                    y=alt.Y('Alerts:Q', title='Alerts'),
+                    tooltip=['Day:N', 'Alerts:Q']
+                ).properties(height=170)
+                charts.altair_chart(crisis_line, use_container_width=True)
+        
+    with tab_ops:
+        st.markdown("""
+        <div class="comms-ops-pulse">
+            <div class="comms-ops-header">
+                <div class="comms-ops-title">📣 Communications Pulse</div>
+                <div class="comms-ops-tag">LIVE</div>
+            </div>
+            <div class="comms-ops-grid">
+                <div class="comms-ops-card">
+                    <div class="comms-ops-label">Positive</div>
+                    <div class="comms-ops-value">35%</div>
+                    <div class="comms-ops-delta">+4% WoW</div>
+                </div>
+                <div class="comms-ops-card">
+                    <div class="comms-ops-label">Negative</div>
+                    <div class="comms-ops-value">40%</div>
+                    <div class="comms-ops-delta">+2% WoW</div>
+                </div>
+                <div class="comms-ops-card">
+                    <div class="comms-ops-label">Mentions</div>
+                    <div class="comms-ops-value">2,847</div>
+                    <div class="comms-ops-delta">+18% WoW</div>
+                </div>
+                <div class="comms-ops-card">
+                    <div class="comms-ops-label">Response</div>
+                    <div class="comms-ops-value">2.4 hrs</div>
+                    <div class="comms-ops-delta">-0.6 hrs</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+        # Sentiment Trend and Mention Volume
+        sentiment_trend_col, volume_col = st.columns(2)
+        
+        with sentiment_trend_col:
+            st.markdown('<div class="section-header">Sentiment Trend (4 Weeks)</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                weeks = ['Week 1', 'Week 2', 'Week 3', 'Week 4']
+                sentiment_trend = pd.DataFrame({
+                    'Week': weeks * 3,
+                    'Sentiment': ['Positive']*4 + ['Neutral']*4 + ['Negative']*4,
+                    'Percentage': [32, 33, 34, 35, 28, 27, 26, 25, 40, 40, 40, 40]
+                })
+                
+                sentiment_area = alt.Chart(sentiment_trend).mark_area().encode(
+                    x=alt.X('Week:N', sort=weeks, title=None),
+                    y=alt.Y('Percentage:Q', stack='normalize', title='%'),
+                    color=alt.Color('Sentiment:N', scale=alt.Scale(
+                        domain=['Positive', 'Neutral', 'Negative'],
+                        range=['#10B981', '#9CA3AF', '#EF4444']
+                    ), legend=alt.Legend(orient='bottom', title=None)),
+                    tooltip=['Week:N', 'Sentiment:N', alt.Tooltip('Percentage:Q', format='.0f')]
+                ).properties(height=160)
+                
+                charts.altair_chart(sentiment_area, use_container_width=True)
+        
+        with volume_col:
+            st.markdown('<div class="section-header">Daily Mention Volume</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+                volume_data = pd.DataFrame({
+                    'Day': days,
+                    'Mentions': [420, 380, 450, 520, 480, 320, 280]
+                })
+                
+                volume_bars = alt.Chart(volume_data).mark_bar(color='#29B5E8', cornerRadiusTopLeft=4, cornerRadiusTopRight=4).encode(
+                    x=alt.X('Day:N', sort=days, title=None),
+                    y=alt.Y('Mentions:Q', title='Mentions'),
+                    tooltip=['Day:N', 'Mentions:Q']
+                ).properties(height=160)
+                
+                charts.altair_chart(volume_bars, use_container_width=True)
+        
+        col_left, col_right = st.columns([1.3, 1])
+        
+        with col_left:
+            st.markdown('<div class="section-header">Sentiment by Platform</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                platform_data = pd.DataFrame({
+                    'Platform': ['Twitter/X', 'Facebook', 'Instagram', 'LinkedIn', 'TrustPilot'],
+                    'Positive': [32, 38, 45, 52, 28],
+                    'Negative': [45, 38, 25, 18, 52],
+                    'Mentions': [1240, 680, 420, 280, 227]
+                })
+                
+                st.markdown("""
+                <table style="width: 100%; border-collapse: collapse; font-size: 0.85rem;">
+                    <thead>
+                        <tr style="border-bottom: 2px solid #E5E7EB;">
+                            <th style="text-align: left; padding: 0.5rem;">Platform</th>
+                            <th style="text-align: right; padding: 0.5rem;">Positive</th>
+                            <th style="text-align: right; padding: 0.5rem;">Negative</th>
+                            <th style="text-align: right; padding: 0.5rem;">Mentions</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem;">Twitter/X</td>
+                            <td style="text-align: right; padding: 0.5rem; color: #10B981;">32%</td>
+                            <td style="text-align: right; padding: 0.5rem; color: #EF4444;">45%</td>
+                            <td style="text-align: right; padding: 0.5rem;">1,240</td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem;">Facebook</td>
+                            <td style="text-align: right; padding: 0.5rem; color: #10B981;">38%</td>
+                            <td style="text-align: right; padding: 0.5rem; color: #EF4444;">38%</td>
+                            <td style="text-align: right; padding: 0.5rem;">680</td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem;">Instagram</td>
+                            <td style="text-align: right; padding: 0.5rem; color: #10B981;">45%</td>
+                            <td style="text-align: right; padding: 0.5rem; color: #F59E0B;">25%</td>
+                            <td style="text-align: right; padding: 0.5rem;">420</td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem;">LinkedIn</td>
+                            <td style="text-align: right; padding: 0.5rem; color: #10B981;">52%</td>
+                            <td style="text-align: right; padding: 0.5rem; color: #10B981;">18%</td>
+                            <td style="text-align: right; padding: 0.5rem;">280</td>
+                        </tr>
+                        <tr>
+                            <td style="padding: 0.5rem;">TrustPilot</td>
+                            <td style="text-align: right; padding: 0.5rem; color: #F59E0B;">28%</td>
+                            <td style="text-align: right; padding: 0.5rem; color: #EF4444;">52%</td>
+                            <td style="text-align: right; padding: 0.5rem;">227</td>
+                        </tr>
+                    </tbody>
+                </table>
+                """, unsafe_allow_html=True)
+        
+        with col_right:
+            st.markdown('<div class="section-header">Top Topics</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Network Coverage</span>
+                        <span style="background: #FEE2E2; color: #DC2626; padding: 0.2rem 0.5rem; border-radius: 12px;">-0.42</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Customer Service</span>
+                        <span style="background: #FEF3C7; color: #92400E; padding: 0.2rem 0.5rem; border-radius: 12px;">-0.18</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>5G Plans</span>
+                        <span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">+0.32</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0;">
+                        <span>Pricing</span>
+                        <span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">+0.15</span>
+                    </div>
+                </div>
+                <div style="margin-top: 0.75rem; padding: 0.5rem; background: #FEE2E2; border-radius: 8px; font-size: 0.75rem; text-align: center;">
+                    <span style="color: #DC2626;">⚠️ Network coverage driving negative sentiment</span>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Crisis Response Performance</div>', unsafe_allow_html=True)
+        crisis_col1, crisis_col2 = st.columns(2)
+        
+        with crisis_col1:
+            st.markdown("**Response Time Distribution**")
+            with st.container(border=True):
+                response_df = pd.DataFrame({
+                    'Bucket': ['<30m', '30-60m', '1-2h', '2-4h', '4h+'],
+                    'Cases': [42, 38, 28, 16, 8]
+                })
+                response_bar = alt.Chart(response_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Cases:Q', title='Cases'),
+                    y=alt.Y('Bucket:N', sort='-x', title=None),
+                    color=alt.Color('Bucket:N', legend=None, scale=alt.Scale(
+                        range=['#10B981', '#14B8A6', '#F59E0B', '#F97316', '#EF4444']
+                    )),
+                    tooltip=['Bucket:N', 'Cases:Q']
+                ).properties(height=170)
+                charts.altair_chart(response_bar, use_container_width=True)
+        
+        with crisis_col2:
+            st.markdown("**Crisis Escalations by Severity**")
+            with st.container(border=True):
+                esc_df = pd.DataFrame({
+                    'Severity': ['P1', 'P2', 'P3', 'P4'],
+                    'Escalations': [6, 12, 18, 10]
+                })
+                esc_bar = alt.Chart(esc_df).mark_bar(cornerRadiusTopLeft=6, cornerRadiusTopRight=6).encode(
+                    x=alt.X('Severity:N', title=None),
+                    y=alt.Y('Escalations:Q', title='Escalations'),
+                    color=alt.Color('Severity:N', legend=None, scale=alt.Scale(
+                        domain=['P1', 'P2', 'P3', 'P4'],
+                        range=['#EF4444', '#F59E0B', '#29B5E8', '#9CA3AF']
+                    )),
+                    tooltip=['Severity:N', 'Escalations:Q']
+                ).properties(height=170)
+                charts.altair_chart(esc_bar, use_container_width=True)
+        
+        backlog_col1, backlog_col2 = st.columns(2)
+        
+        with backlog_col1:
+            st.markdown("**Response Backlog Trend**")
+            with st.container(border=True):
+                days = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
+                backlog_df = pd.DataFrame({
+                    'Day': days,
+                    'Backlog': [46, 44, 42, 40, 38, 36, 34]
+                })
+                backlog_line = alt.Chart(backlog_df).mark_line(point=True, color='#8B5CF6', strokeWidth=2).encode(
+                    x=alt.X('Day:N', sort=days, title=None),
+                    y=alt.Y('Backlog:Q', title='Backlog'),
+                    tooltip=['Day:N', 'Backlog:Q']
+                ).properties(height=170)
+                charts.altair_chart(backlog_line, use_container_width=True)
+        
+        with backlog_col2:
+            st.markdown("**Response Volume by Channel**")
+            with st.container(border=True):
+                resp_df = pd.DataFrame({
+                    'Channel': ['Twitter/X', 'Facebook', 'Instagram', 'LinkedIn', 'TrustPilot'],
+                    'Responses': [220, 180, 120, 90, 60]
+                })
+                resp_bar = alt.Chart(resp_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Responses:Q', title='Responses'),
+                    y=alt.Y('Channel:N', sort='-x', title=None),
+                    color=alt.Color('Channel:N', legend=None, scale=alt.Scale(
+                        range=['#2563EB', '#9CA3AF', '#EC4899', '#14B8A6', '#F59E0B']
+                    )),
+                    tooltip=['Channel:N', 'Responses:Q']
+                ).properties(height=170)
+                charts.altair_chart(resp_bar, use_container_width=True)
+        
+
+    with tab_strategy:
+        st.markdown("""
+        <div class="sf-comms-pulse">
+            <div class="sf-comms-header">
+                <div class="sf-comms-title">❄️ Snowflake Intelligence Pulse</div>
+                <div class="sf-comms-tag">AI LIVE</div>
+            </div>
+            <div class="sf-comms-grid">
+                <div class="sf-comms-card">
+                    <div class="sf-comms-label">Positive</div>
+                    <div class="sf-comms-value">35%</div>
+                </div>
+                <div class="sf-comms-card">
+                    <div class="sf-comms-label">Negative</div>
+                    <div class="sf-comms-value">40%</div>
+                </div>
+                <div class="sf-comms-card">
+                    <div class="sf-comms-label">Mentions</div>
+                    <div class="sf-comms-value">2,847</div>
+                </div>
+                <div class="sf-comms-card">
+                    <div class="sf-comms-label">Response</div>
+                    <div class="sf-comms-value">2.4 hrs</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown('<div class="section-header">AI Executive Summary</div>', unsafe_allow_html=True)
+        if st.session_state.get('sf_highlights', True):
+            st.info("❄️ **Snowflake Intelligence** flags negative sentiment concentration around network coverage and response time. Prioritizing coverage narrative and expanding social response capacity can lift positive sentiment by 6–8 points.")
+
+        st.markdown('<div class="section-header">Signals & Insights</div>', unsafe_allow_html=True)
+        sig_col1, sig_col2, sig_col3 = st.columns(3)
+        with sig_col1:
+            with st.container(border=True):
+                st.markdown("**Sentiment Mix**")
+                st.caption("Negative mentions hold at 40% with spikes after outage reports.")
+        with sig_col2:
+            with st.container(border=True):
+                st.markdown("**Platform Risk**")
+                st.caption("Twitter/X drives 44% of negative mentions; response latency highest.")
+        with sig_col3:
+            with st.container(border=True):
+                st.markdown("**Topic Drift**")
+                st.caption("Coverage and pricing topics dominate share of voice this week.")
+
+        st.markdown('<div class="section-header">AI-Powered Strategic Recommendations</div>', unsafe_allow_html=True)
+        rec_col1, rec_col2, rec_col3 = st.columns(3)
+        with rec_col1:
+            with st.container(border=True):
+                st.markdown("**Rapid Response Pods**")
+                st.caption("Deploy surge support for Twitter/X to reduce response time below 1 hr.")
+        with rec_col2:
+            with st.container(border=True):
+                st.markdown("**Coverage Narrative**")
+                st.caption("Launch 5G coverage proof points to counter negative sentiment drivers.")
+        with rec_col3:
+            with st.container(border=True):
+                st.markdown("**Influencer Amplification**")
+                st.caption("Expand positive influencer reach during peak sentiment windows.")
+
+        st.markdown('<div class="section-header">VP Communications Strategic Priorities — Q1 2026</div>', unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #DC2626; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 1</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Positive Sentiment 45%</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **35%** positive
+                - Gap: **10%** to target
+                - Focus: Network narrative
+                - Campaign: 5G coverage story
+                """)
+        with col2:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #F59E0B; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 2</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Response Time < 1hr</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **2.4 hrs** avg
+                - Target: **<1 hr** response
+                - Action: Social team expansion
+                - Tools: AI triage pilot
+                """)
+        with col3:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #10B981; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 3</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">TrustPilot 3.5 Stars</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **2.8** stars
+                - Target: **3.5** by Q2
+                - Action: Review response
+                - Program: Happy customer asks
+                """)
+        
+        st.markdown('<div class="section-header">Ask Snowflake Intelligence</div>', unsafe_allow_html=True)
+        questions = ["What's our social media sentiment this month?", "Which platforms have the most negative mentions?", "What topics are customers talking about most?", "Show me high-reach negative mentions."]
+        sf_intel_url = "https://ai.snowflake.com/sfseeurope/pjose_aws3"
+        cols = st.columns(2)
+        for i, q in enumerate(questions):
+            with cols[i % 2]:
+                escaped_q = q.replace('"', '&quot;').replace("'", "&#39;")
+                st.markdown(f"""
+                <a href="{sf_intel_url}" target="_blank" onclick="navigator.clipboard.writeText('{escaped_q}')" style="text-decoration: none; color: inherit; display: block;">
+                    <div class="question-card">
+                        <p style="margin-bottom: 1.5rem;"><strong>Q{i+1}:</strong> "{q}"</p>
+                    </div>
+                </a>
+                """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div style="text-align: center; margin-top: 1rem; padding: 1rem; background: linear-gradient(135deg, #29B5E8 0%, #1A8BC4 100%); border-radius: 8px;">
+            <a href="{sf_intel_url}" target="_blank" style="color: white; text-decoration: none; font-weight: 600; font-size: 1rem;">
+                ❄️ Ask these questions in Snowflake Intelligence →
+            </a>
+        </div>
+        """, unsafe_allow_html=True)
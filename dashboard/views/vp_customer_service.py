@@ -0,0 +1,924 @@
+"""VP Customer Service dashboard."""
+
+import streamlit as st
+import pandas as pd
+import altair as alt
+
+from dashboard import charts
+from dashboard.fragments import fragment
+
+
+def render_vp_customer_service():
+    import pandas as pd
+    import altair as alt
+    
+    # VP Customer Service Header with Chat Bubbles Effect
+    st.markdown("""
+    <div class="cs-header-wrap">
+        <div class="cs-bubbles-bg">
+            <span class="cs-bubble" style="left: 8%; bottom: 10%; animation-delay: 0s;">💬</span>
+            <span class="cs-bubble" style="left: 22%; bottom: 15%; animation-delay: 0.8s;">💬</span>
+            <span class="cs-bubble" style="left: 38%; bottom: 8%; animation-delay: 1.6s;">💬</span>
+            <span class="cs-bubble" style="left: 55%; bottom: 12%; animation-delay: 2.4s;">💬</span>
+            <span class="cs-bubble" style="left: 72%; bottom: 10%; animation-delay: 3.2s;">💬</span>
+            <span class="cs-bubble" style="left: 88%; bottom: 15%; animation-delay: 0.4s;">💬</span>
+            <div class="cs-typing-indicator" style="left: 15%; top: 25%;">
+                <span class="cs-typing-dot" style="animation-delay: 0s;"></span>
+                <span class="cs-typing-dot" style="animation-delay: 0.2s;"></span>
+                <span class="cs-typing-dot" style="animation-delay: 0.4s;"></span>
+            </div>
+            <div class="cs-typing-indicator" style="right: 20%; top: 35%;">
+                <span class="cs-typing-dot" style="animation-delay: 0.5s;"></span>
+                <span class="cs-typing-dot" style="animation-delay: 0.7s;"></span>
+                <span class="cs-typing-dot" style="animation-delay: 0.9s;"></span>
+            </div>
+        </div>
+        <div class="cs-header-content">
+            <h1>VP Customer Service Dashboard</h1>
+            <p>Contact Centre Operations, Ticket Management & CSAT Analytics</p>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Dashboard Tabs
+    tab_overview, tab_ops, tab_strategy = st.tabs(["📊 Overview & Analysis", "🧭 Service Operations", "❄️ Snowflake Intelligence"])
+
+    with tab_overview:
+        
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['SUPPORT', 'SUPPORT_TICKET', 'COMPLAINT', 'MOBILE']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+        
+        # VP CUSTOMER SERVICE - TICKET FLOW ANIMATION
+        st.markdown("""<div class="cs-flow"><div class="cs-header"><div class="cs-title">🎧 Contact Centre Live</div><div class="cs-live"><span class="phone">📞</span> 142 Active Calls</div></div><div class="ticket-pipeline"><div class="pipeline-stage"><div class="stage-count">847</div><div class="stage-label">New</div></div><div class="stage-arrow">→</div><div class="pipeline-stage"><div class="stage-count">423</div><div class="stage-label">In Progress</div></div><div class="stage-arrow">→</div><div class="pipeline-stage"><div class="stage-count">156</div><div class="stage-label">Pending</div></div><div class="stage-arrow">→</div><div class="pipeline-stage"><div class="stage-count" style="color:#10B981">12.4K</div><div class="stage-label">Resolved Today</div></div></div><div class="cs-stats"><div class="cs-stat"><div class="cs-stat-val">2:34</div><div class="cs-stat-label">Avg Wait Time</div></div><div class="cs-stat"><div class="cs-stat-val">87%</div><div class="cs-stat-label">FCR Rate</div></div><div class="cs-stat"><div class="cs-stat-val">4.6</div><div class="cs-stat-label">CSAT Score</div></div><div class="cs-stat"><div class="cs-stat-val">94%</div><div class="cs-stat-label">SLA Met</div></div></div></div>""", unsafe_allow_html=True)
+        
+        
+        st.markdown('<div class="section-header">Contact Centre Performance</div>', unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #29B5E8;">
+                <div class="kpi-icon">📞</div>
+                <div class="kpi-label">Calls Today</div>
+                <div class="kpi-value">2,847</div>
+                <div class="kpi-delta positive">↑ +12% vs avg</div>
+            </div>
+            <div class="kpi-card" style="--accent: #10B981;">
+                <div class="kpi-icon">⭐</div>
+                <div class="kpi-label">CSAT Score</div>
+                <div class="kpi-value">4.2/5</div>
+                <div class="kpi-delta positive">↑ +0.3 MoM</div>
+            </div>
+            <div class="kpi-card" style="--accent: #F59E0B;">
+                <div class="kpi-icon">⏱️</div>
+                <div class="kpi-label">Avg Handle Time</div>
+                <div class="kpi-value">6:42</div>
+                <div class="kpi-delta positive">↓ -0:18 vs target</div>
+            </div>
+            <div class="kpi-card" style="--accent: #8B5CF6;">
+                <div class="kpi-icon">✅</div>
+                <div class="kpi-label">First Call Resolution</div>
+                <div class="kpi-value">78%</div>
+                <div class="kpi-delta positive">↑ +3% MoM</div>
+            </div>
+        </div>
+        
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #EF4444;">
+                <div class="kpi-icon">🎫</div>
+                <div class="kpi-label">Open Tickets</div>
+                <div class="kpi-value">1,842</div>
+                <div class="kpi-delta negative">↑ +124 vs yesterday</div>
+            </div>
+            <div class="kpi-card" style="--accent: #14B8A6;">
+                <div class="kpi-icon">⏳</div>
+                <div class="kpi-label">Avg Wait Time</div>
+                <div class="kpi-value">2:15</div>
+                <div class="kpi-delta positive">↓ -0:30 vs target</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EC4899;">
+                <div class="kpi-icon">📋</div>
+                <div class="kpi-label">Complaints MTD</div>
+                <div class="kpi-value">284</div>
+                <div class="kpi-delta negative">↑ +12% MoM</div>
+            </div>
+            <div class="kpi-card" style="--accent: #6366F1;">
+                <div class="kpi-icon">👥</div>
+                <div class="kpi-label">Agents Online</div>
+                <div class="kpi-value">142</div>
+                <div class="kpi-delta neutral">92% staffed</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # New: CSAT Trend and Channel Distribution
+        trend_col, channel_col = st.columns(2)
+        
+        with trend_col:
+            st.markdown('<div class="section-header">CSAT Trend (12 Weeks)</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                weeks = [f'W{i}' for i in range(1, 13)]
+                csat_trend_data = pd.DataFrame({
+                    'Week': weeks,
+                    'CSAT': [4.0, 4.1, 4.0, 4.2, 4.1, 4.3, 4.2, 4.1, 4.2, 4.3, 4.2, 4.2],
+                    'Target': [4.0] * 12
+                })
+                
+                csat_line = alt.Chart(csat_trend_data).mark_line(color='#29B5E8', strokeWidth=3).encode(
+                    x=alt.X('Week:N', sort=weeks, title=None, axis=alt.Axis(labelAngle=0)),
+                    y=alt.Y('CSAT:Q', scale=alt.Scale(domain=[3.5, 4.5]), title='CSAT Score'),
+                    tooltip=['Week:N', alt.Tooltip('CSAT:Q', format='.2f')]
+                )
+                
+                csat_points = alt.Chart(csat_trend_data).mark_circle(color='#29B5E8', size=60).encode(
+                    x=alt.X('Week:N', sort=weeks),
+                    y=alt.Y('CSAT:Q'),
+                    tooltip=['Week:N', alt.Tooltip('CSAT:Q', format='.2f')]
+                )
+                
+                target_rule = alt.Chart(csat_trend_data).mark_rule(color='#DC2626', strokeDash=[4, 4]).encode(
+                    y='Target:Q'
+                )
+                
+                charts.altair_chart((csat_line + csat_points + target_rule).properties(height=180), use_container_width=True)
+        
+        with channel_col:
+            st.markdown('<div class="section-header">Channel Distribution</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                channel_data = pd.DataFrame({
+                    'Channel': ['Phone', 'Chat', 'Email', 'Social', 'Self-Service'],
+                    'Volume': [65, 18, 8, 5, 4],
+                    'CSAT': [4.2, 4.4, 3.8, 4.1, 4.6]
+                })
+                
+                channel_donut = alt.Chart(channel_data).mark_arc(innerRadius=50, outerRadius=80).encode(
+                    theta=alt.Theta('Volume:Q'),
+                    color=alt.Color('Channel:N', scale=alt.Scale(
+                        domain=['Phone', 'Chat', 'Email', 'Social', 'Self-Service'],
+                        range=['#29B5E8', '#10B981', '#F59E0B', '#EC4899', '#8B5CF6']
+                    ), legend=alt.Legend(orient='right', title=None)),
+                    tooltip=['Channel:N', alt.Tooltip('Volume:Q', title='%'), alt.Tooltip('CSAT:Q', format='.1f')]
+                ).properties(height=180)
+                
+                charts.altair_chart(channel_donut, use_container_width=True)
+        
+        col_left, col_right = st.columns([1.3, 1])
+        
+        with col_left:
+            st.markdown('<div class="section-header">CSAT by Queue</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                queue_data = pd.DataFrame({
+                    'Queue': ['Sales', 'Technical Support', 'Billing', 'Retention', 'General Enquiries'],
+                    'CSAT': [4.5, 4.1, 3.9, 4.3, 4.0],
+                    'Calls': [620, 890, 540, 320, 477],
+                    'AHT': ['5:20', '8:45', '6:10', '9:30', '4:45']
+                })
+                
+                csat_bars = alt.Chart(queue_data).mark_bar(cornerRadiusTopRight=8, cornerRadiusBottomRight=8).encode(
+                    y=alt.Y('Queue:N', sort=alt.EncodingSortField(field='CSAT', order='descending'), title=None),
+                    x=alt.X('CSAT:Q', scale=alt.Scale(domain=[0, 5]), title='CSAT Score'),
+                    color=alt.condition(
+                        alt.datum.CSAT >= 4.0,
+                        alt.value('#10B981'),
+                        alt.value('#F59E0B')
+                    ),
+                    tooltip=['Queue:N', alt.Tooltip('CSAT:Q', format='.1f'), 'Calls:Q', 'AHT:N']
+                ).properties(height=200)
+                
+                target_line = alt.Chart(pd.DataFrame({'x': [4.0]})).mark_rule(
+                    color='#DC2626', strokeDash=[4, 4], strokeWidth=2
+                ).encode(x='x:Q')
+                
+                charts.altair_chart(csat_bars + target_line, use_container_width=True)
+                
+                st.markdown("""
+                <div style="display: flex; gap: 1rem; font-size: 0.75rem; justify-content: center;">
+                    <span><span style="color: #10B981;">●</span> Above Target (4.0)</span>
+                    <span><span style="color: #F59E0B;">●</span> Below Target</span>
+                    <span><span style="color: #DC2626;">╌╌</span> Target</span>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            st.markdown('<div class="section-header">Ticket Categories</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <table style="width: 100%; border-collapse: collapse; font-size: 0.85rem;">
+                    <thead>
+                        <tr style="border-bottom: 2px solid #E5E7EB;">
+                            <th style="text-align: left; padding: 0.5rem; color: #6B7280;">Category</th>
+                            <th style="text-align: right; padding: 0.5rem; color: #6B7280;">Volume</th>
+                            <th style="text-align: right; padding: 0.5rem; color: #6B7280;">Avg Resolution</th>
+                            <th style="text-align: right; padding: 0.5rem; color: #6B7280;">SLA %</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem;"><span style="color: #EF4444;">●</span> Network Issues</td>
+                            <td style="text-align: right; padding: 0.5rem; font-weight: 600;">524</td>
+                            <td style="text-align: right; padding: 0.5rem;">4.2 hrs</td>
+                            <td style="text-align: right; padding: 0.5rem;"><span style="background: #FEE2E2; color: #DC2626; padding: 0.2rem 0.5rem; border-radius: 12px;">82%</span></td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem;"><span style="color: #F59E0B;">●</span> Billing Queries</td>
+                            <td style="text-align: right; padding: 0.5rem; font-weight: 600;">412</td>
+                            <td style="text-align: right; padding: 0.5rem;">2.8 hrs</td>
+                            <td style="text-align: right; padding: 0.5rem;"><span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">94%</span></td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem;"><span style="color: #10B981;">●</span> Plan Changes</td>
+                            <td style="text-align: right; padding: 0.5rem; font-weight: 600;">328</td>
+                            <td style="text-align: right; padding: 0.5rem;">1.5 hrs</td>
+                            <td style="text-align: right; padding: 0.5rem;"><span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">98%</span></td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem;"><span style="color: #29B5E8;">●</span> Device Support</td>
+                            <td style="text-align: right; padding: 0.5rem; font-weight: 600;">298</td>
+                            <td style="text-align: right; padding: 0.5rem;">3.1 hrs</td>
+                            <td style="text-align: right; padding: 0.5rem;"><span style="background: #FEF3C7; color: #92400E; padding: 0.2rem 0.5rem; border-radius: 12px;">89%</span></td>
+                        </tr>
+                        <tr>
+                            <td style="padding: 0.5rem;"><span style="color: #8B5CF6;">●</span> Account Issues</td>
+                            <td style="text-align: right; padding: 0.5rem; font-weight: 600;">280</td>
+                            <td style="text-align: right; padding: 0.5rem;">2.4 hrs</td>
+                            <td style="text-align: right; padding: 0.5rem;"><span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">92%</span></td>
+                        </tr>
+                    </tbody>
+                </table>
+                """, unsafe_allow_html=True)
+        
+        with col_right:
+            st.markdown('<div class="section-header">Agent Performance</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="padding: 0.6rem; border-left: 4px solid #10B981; background: #D1FAE5; border-radius: 0 8px 8px 0; margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <div>
+                                <div style="font-weight: 600; color: #065F46;">Sarah Mitchell</div>
+                                <div style="font-size: 0.75rem; color: #6B7280;">Technical Support • 42 calls</div>
+                            </div>
+                            <span style="font-size: 1.2rem; font-weight: 700; color: #10B981;">4.8</span>
+                        </div>
+                    </div>
+                    <div style="padding: 0.6rem; border-left: 4px solid #10B981; background: #D1FAE5; border-radius: 0 8px 8px 0; margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <div>
+                                <div style="font-weight: 600; color: #065F46;">James Chen</div>
+                                <div style="font-size: 0.75rem; color: #6B7280;">Retention • 38 calls</div>
+                            </div>
+                            <span style="font-size: 1.2rem; font-weight: 700; color: #10B981;">4.7</span>
+                        </div>
+                    </div>
+                    <div style="padding: 0.6rem; border-left: 4px solid #10B981; background: #D1FAE5; border-radius: 0 8px 8px 0; margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <div>
+                                <div style="font-weight: 600; color: #065F46;">Emma Thompson</div>
+                                <div style="font-size: 0.75rem; color: #6B7280;">Sales • 35 calls</div>
+                            </div>
+                            <span style="font-size: 1.2rem; font-weight: 700; color: #10B981;">4.6</span>
+                        </div>
+                    </div>
+                    <div style="padding: 0.6rem; border-left: 4px solid #F59E0B; background: #FEF3C7; border-radius: 0 8px 8px 0; margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <div>
+                                <div style="font-weight: 600; color: #92400E;">David Wilson</div>
+                                <div style="font-size: 0.75rem; color: #6B7280;">Billing • 28 calls</div>
+                            </div>
+                            <span style="font-size: 1.2rem; font-weight: 700; color: #F59E0B;">3.8</span>
+                        </div>
+                    </div>
+                </div>
+                <div style="margin-top: 0.75rem; padding: 0.5rem; background: #F3F4F6; border-radius: 8px; font-size: 0.75rem; text-align: center;">
+                    <span style="color: #6B7280;">Team Average: 4.2 • Top Performer Bonus: £250/month</span>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            st.markdown('<div class="section-header">Complaint Status</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 0.5rem;">
+                    <div style="background: linear-gradient(135deg, #FEE2E2 0%, #FECACA 100%); border-radius: 12px; padding: 0.75rem; text-align: center;">
+                        <div style="font-size: 0.7rem; color: #DC2626;">Open</div>
+                        <div style="font-size: 1.3rem; font-weight: 700; color: #DC2626;">84</div>
+                        <div style="font-size: 0.65rem; color: #6B7280;">Avg age: 3.2 days</div>
+                    </div>
+                    <div style="background: linear-gradient(135deg, #FEF3C7 0%, #FDE68A 100%); border-radius: 12px; padding: 0.75rem; text-align: center;">
+                        <div style="font-size: 0.7rem; color: #92400E;">In Progress</div>
+                        <div style="font-size: 1.3rem; font-weight: 700; color: #F59E0B;">142</div>
+                        <div style="font-size: 0.65rem; color: #6B7280;">Avg age: 5.8 days</div>
+                    </div>
+                    <div style="background: linear-gradient(135deg, #D1FAE5 0%, #A7F3D0 100%); border-radius: 12px; padding: 0.75rem; text-align: center;">
+                        <div style="font-size: 0.7rem; color: #065F46;">Resolved MTD</div>
+                        <div style="font-size: 1.3rem; font-weight: 700; color: #10B981;">312</div>
+                        <div style="font-size: 0.65rem; color: #6B7280;">Avg: 4.1 days</div>
+                    </div>
+                    <div style="background: linear-gradient(135deg, #EDE9FE 0%, #DDD6FE 100%); border-radius: 12px; padding: 0.75rem; text-align: center;">
+                        <div style="font-size: 0.7rem; color: #5B21B6;">Ombudsman</div>
+                        <div style="font-size: 1.3rem; font-weight: 700; color: #8B5CF6;">8</div>
+                        <div style="font-size: 0.65rem; color: #6B7280;">2.8% escalation</div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        # New: Escalation Funnel and Hourly Volume
+        funnel_col, hourly_col = st.columns(2)
+        
+        with funnel_col:
+            st.markdown('<div class="section-header">Escalation Funnel</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>L1 Resolved</span><span style="font-weight: 600;">2,420 (85%)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #10B981; width: 100%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>L2 Escalated</span><span style="font-weight: 600;">312 (11%)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #29B5E8; width: 13%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>L3 Escalated</span><span style="font-weight: 600;">89 (3%)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #F59E0B; width: 4%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div>
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Manager Escalated</span><span style="font-weight: 600;">26 (1%)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #EF4444; width: 1%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                </div>
+                <div style="text-align: center; font-size: 0.75rem; color: #6B7280; margin-top: 0.5rem;">
+                    <strong>85%</strong> First Contact Resolution at L1
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with hourly_col:
+            st.markdown('<div class="section-header">Hourly Call Volume</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                hours = ['08:00', '09:00', '10:00', '11:00', '12:00', '13:00', '14:00', '15:00', '16:00', '17:00', '18:00', '19:00']
+                hourly_data = pd.DataFrame({
+                    'Hour': hours,
+                    'Calls': [145, 312, 428, 389, 298, 342, 456, 412, 378, 289, 198, 120],
+                    'Wait Time': [1.2, 2.8, 4.1, 3.2, 2.1, 2.5, 3.8, 3.1, 2.4, 1.8, 1.4, 1.1]
+                })
+                
+                call_bars = alt.Chart(hourly_data).mark_bar(color='#29B5E8', cornerRadiusTopLeft=4, cornerRadiusTopRight=4).encode(
+                    x=alt.X('Hour:N', sort=hours, title=None, axis=alt.Axis(labelAngle=-45)),
+                    y=alt.Y('Calls:Q', title='Calls'),
+                    tooltip=['Hour:N', 'Calls:Q', alt.Tooltip('Wait Time:Q', title='Avg Wait (min)', format='.1f')]
+                ).properties(height=160)
+                
+                charts.altair_chart(call_bars, use_container_width=True)
+        
+        # Customer Experience Metrics Section
+        st.markdown('<div class="section-header">Customer Experience Metrics</div>', unsafe_allow_html=True)
+        
+        nps_col, ces_col, segment_col = st.columns(3)
+        
+        with nps_col:
+            st.markdown("**NPS Trend by Segment**")
+            with st.container(border=True):
+                st.markdown("""
+                <svg viewBox="0 0 200 100" style="width: 100%; height: 100px;">
+                    <!-- Consumer line -->
+                    <polyline points="10,60 40,55 70,50 100,52 130,48 160,45" fill="none" stroke="#29B5E8" stroke-width="2"/>
+                    <!-- B2B line -->
+                    <polyline points="10,40 40,38 70,35 100,32 130,30 160,28" fill="none" stroke="#10B981" stroke-width="2"/>
+                    <text x="10" y="95" font-size="8" fill="#6B7280">Aug</text>
+                    <text x="85" y="95" font-size="8" fill="#6B7280">Oct</text>
+                    <text x="155" y="95" font-size="8" fill="#6B7280">Jan</text>
+                </svg>
+                <div style="display: flex; justify-content: center; gap: 1rem; font-size: 0.75rem;">
+                    <span><span style="color: #29B5E8;">—</span> Consumer: +42</span>
+                    <span><span style="color: #10B981;">—</span> B2B: +58</span>
+                </div>
+                <div style="text-align: center; font-size: 0.7rem; color: #10B981; margin-top: 0.3rem;">▲ Both segments improving</div>
+                """, unsafe_allow_html=True)
+        
+        with ces_col:
+            st.markdown("**Customer Effort Score**")
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Bill Payment</span><span style="font-weight: 600; color: #10B981;">1.8</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 12px;">
+                            <div style="background: #10B981; width: 36%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Plan Change</span><span style="font-weight: 600; color: #F59E0B;">2.8</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 12px;">
+                            <div style="background: #F59E0B; width: 56%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Technical Support</span><span style="font-weight: 600; color: #DC2626;">3.4</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 12px;">
+                            <div style="background: #DC2626; width: 68%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div>
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Complaint Resolution</span><span style="font-weight: 600; color: #DC2626;">3.8</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 12px;">
+                            <div style="background: #DC2626; width: 76%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                </div>
+                <div style="text-align: center; font-size: 0.7rem; color: #6B7280; margin-top: 0.4rem;">Scale: 1 (Easy) - 5 (Difficult)</div>
+                """, unsafe_allow_html=True)
+        
+        with segment_col:
+            st.markdown("**Issue Resolution by Value Tier**")
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.8rem;">
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>🥇 Platinum</span>
+                        <span><strong>94%</strong> FCR</span>
+                        <span style="color: #10B981;">2.1 min wait</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>🥈 Gold</span>
+                        <span><strong>86%</strong> FCR</span>
+                        <span style="color: #F59E0B;">4.2 min wait</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>🥉 Silver</span>
+                        <span><strong>78%</strong> FCR</span>
+                        <span style="color: #F59E0B;">6.8 min wait</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.4rem 0;">
+                        <span>Bronze</span>
+                        <span><strong>72%</strong> FCR</span>
+                        <span style="color: #DC2626;">9.4 min wait</span>
+                    </div>
+                </div>
+                <div style="text-align: center; font-size: 0.7rem; color: #6B7280; margin-top: 0.4rem;">Priority routing enabled</div>
+                """, unsafe_allow_html=True)
+        
+        # Repeat Contact Analysis
+        repeat_col, journey_col = st.columns(2)
+        
+        with repeat_col:
+            st.markdown("**Repeat Contact Analysis**")
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; justify-content: space-around; text-align: center; padding: 0.5rem 0;">
+                    <div>
+                        <div style="font-size: 1.4rem; font-weight: 700; color: #10B981;">72%</div>
+                        <div style="font-size: 0.75rem; color: #6B7280;">One & Done</div>
+                    </div>
+                    <div>
+                        <div style="font-size: 1.4rem; font-weight: 700; color: #F59E0B;">18%</div>
+                        <div style="font-size: 0.75rem; color: #6B7280;">2 Contacts</div>
+                    </div>
+                    <div>
+                        <div style="font-size: 1.4rem; font-weight: 700; color: #DC2626;">10%</div>
+                        <div style="font-size: 0.75rem; color: #6B7280;">3+ Contacts</div>
+                    </div>
+                </div>
+                <div style="margin-top: 0.5rem; padding-top: 0.5rem; border-top: 1px solid #E5E7EB; font-size: 0.75rem;">
+                    <strong>Top Repeat Reasons:</strong> Billing disputes (34%), Network issues (28%), Plan confusion (22%)
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with journey_col:
+            st.markdown("**Customer Journey Touchpoints**")
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.8rem;">
+                    <div style="display: flex; align-items: center; margin-bottom: 0.4rem;">
+                        <div style="width: 80px;">App</div>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 16px; margin-right: 0.5rem;">
+                            <div style="background: #29B5E8; width: 45%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                        <span style="font-weight: 600;">45%</span>
+                    </div>
+                    <div style="display: flex; align-items: center; margin-bottom: 0.4rem;">
+                        <div style="width: 80px;">Phone</div>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 16px; margin-right: 0.5rem;">
+                            <div style="background: #10B981; width: 28%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                        <span style="font-weight: 600;">28%</span>
+                    </div>
+                    <div style="display: flex; align-items: center; margin-bottom: 0.4rem;">
+                        <div style="width: 80px;">Web Chat</div>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 16px; margin-right: 0.5rem;">
+                            <div style="background: #8B5CF6; width: 15%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                        <span style="font-weight: 600;">15%</span>
+                    </div>
+                    <div style="display: flex; align-items: center;">
+                        <div style="width: 80px;">Store</div>
+                        <div style="flex: 1; background: #E5E7EB; border-radius: 4px; height: 16px; margin-right: 0.5rem;">
+                            <div style="background: #F59E0B; width: 12%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                        <span style="font-weight: 600;">12%</span>
+                    </div>
+                </div>
+                <div style="text-align: center; font-size: 0.7rem; color: #10B981; margin-top: 0.4rem;">Digital channels +12% YoY</div>
+                """, unsafe_allow_html=True)
+        
+        # Customer 360 Deep Dive
+        st.markdown('<div class="section-header">🔍 Customer 360 Deep Dive</div>', unsafe_allow_html=True)
+        
+        if st.session_state.get('sf_highlights', True):
+            st.info("❄️ **Powered by Snowflake** — Unified customer view combining data from 12+ source systems using Dynamic Tables and Cortex AI for real-time scoring")
+        
+        # Customer lookup and profile; lookup widgets rerun only this panel
+        _customer_360_panel()
+        
+
+    with tab_ops:
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['SUPPORT', 'WORKFORCE', 'QUALITY']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="cs-ops-pulse">
+            <div class="cs-ops-title">🎧 Service Operations Pulse</div>
+            <div class="cs-ops-sub">Queue health, backlog, and workforce performance signals.</div>
+            <div class="cs-ops-grid">
+                <div class="cs-ops-card">
+                    <div class="cs-ops-label">SLA Met</div>
+                    <div class="cs-ops-value">94%</div>
+                    <div class="cs-ops-delta">↑ +2% WoW</div>
+                </div>
+                <div class="cs-ops-card">
+                    <div class="cs-ops-label">Backlog</div>
+                    <div class="cs-ops-value">1,842</div>
+                    <div class="cs-ops-delta">↓ -6% WoW</div>
+                </div>
+                <div class="cs-ops-card">
+                    <div class="cs-ops-label">AHT</div>
+                    <div class="cs-ops-value">6:42</div>
+                    <div class="cs-ops-delta">↓ -0:18</div>
+                </div>
+                <div class="cs-ops-card">
+                    <div class="cs-ops-label">CSAT</div>
+                    <div class="cs-ops-value">4.2</div>
+                    <div class="cs-ops-delta">↑ +0.3</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Backlog & Channel Load</div>', unsafe_allow_html=True)
+        ops_left, ops_right = st.columns(2)
+        
+        with ops_left:
+            st.markdown("**Ticket Aging Breakdown**")
+            with st.container(border=True):
+                aging_df = pd.DataFrame({
+                    'Age Bucket': ['0-24h', '1-3d', '4-7d', '8-14d', '15+d'],
+                    'Tickets': [620, 540, 360, 210, 112]
+                })
+                aging_chart = alt.Chart(aging_df).mark_bar(color='#0EA5E9', cornerRadiusEnd=6).encode(
+                    x=alt.X('Tickets:Q', title='Tickets'),
+                    y=alt.Y('Age Bucket:N', sort='-x', title=None),
+                    tooltip=['Age Bucket:N', 'Tickets:Q']
+                ).properties(height=220)
+                charts.altair_chart(aging_chart, use_container_width=True)
+                st.caption("32% of backlog is within SLA (0–3 days).")
+        
+        with ops_right:
+            st.markdown("**Channel Mix**")
+            with st.container(border=True):
+                channel_df = pd.DataFrame({
+                    'Channel': ['App', 'Phone', 'Chat', 'Store'],
+                    'Share': [45, 28, 15, 12]
+                })
+                channel_chart = alt.Chart(channel_df).mark_arc(innerRadius=50, outerRadius=90).encode(
+                    theta=alt.Theta('Share:Q'),
+                    color=alt.Color('Channel:N', scale=alt.Scale(range=['#0EA5E9', '#10B981', '#8B5CF6', '#F59E0B']), legend=None),
+                    tooltip=['Channel:N', 'Share:Q']
+                ).properties(height=220)
+                charts.altair_chart(channel_chart, use_container_width=True)
+                st.caption("Digital channels represent 60% of total volume.")
+        
+        st.markdown('<div class="section-header">Workforce & Quality</div>', unsafe_allow_html=True)
+        wf_left, wf_right = st.columns(2)
+        
+        with wf_left:
+            st.markdown("**Agent Occupancy Trend (8 Weeks)**")
+            with st.container(border=True):
+                occ_df = pd.DataFrame({
+                    'Week': [f'W{i}' for i in range(1, 9)],
+                    'Occupancy': [76, 78, 79, 81, 80, 82, 83, 81]
+                })
+                occ_chart = alt.Chart(occ_df).mark_line(color='#10B981', strokeWidth=2).encode(
+                    x=alt.X('Week:N', title=None),
+                    y=alt.Y('Occupancy:Q', title='Occupancy %', scale=alt.Scale(domain=[70, 90]))
+                )
+                charts.altair_chart(occ_chart.properties(height=200), use_container_width=True)
+                st.caption("Occupancy stays within 78–83% target band.")
+        
+        with wf_right:
+            st.markdown("**Repeat Contact Drivers**")
+            with st.container(border=True):
+                repeat_df = pd.DataFrame({
+                    'Reason': ['Billing', 'Network', 'Plan Confusion', 'Device', 'Other'],
+                    'Share': [34, 28, 22, 9, 7]
+                })
+                repeat_chart = alt.Chart(repeat_df).mark_bar(color='#F59E0B', cornerRadiusEnd=6).encode(
+                    x=alt.X('Share:Q', title='Share (%)'),
+                    y=alt.Y('Reason:N', sort='-x', title=None),
+                    tooltip=['Reason:N', 'Share:Q']
+                ).properties(height=200)
+                charts.altair_chart(repeat_chart, use_container_width=True)
+                st.caption("Billing and network issues drive 62% of repeat contacts.")
+
+    with tab_strategy:
+        st.markdown("""
+        <div class="cs-ai-pulse">
+            <div class="cs-ai-header">
+                <div class="cs-ai-title">❄️ Snowflake Intelligence Pulse</div>
+                <div class="cs-ai-tag">AI LIVE</div>
+            </div>
+            <div class="cs-ai-grid">
+                <div class="cs-ai-card">
+                    <div class="cs-ai-label">CSAT</div>
+                    <div class="cs-ai-value">4.2</div>
+                    <div class="cs-ai-sub">Target 4.5</div>
+                </div>
+                <div class="cs-ai-card">
+                    <div class="cs-ai-label">FCR</div>
+                    <div class="cs-ai-value">78%</div>
+                    <div class="cs-ai-sub">Target 85%</div>
+                </div>
+                <div class="cs-ai-card">
+                    <div class="cs-ai-label">Deflection</div>
+                    <div class="cs-ai-value">18%</div>
+                    <div class="cs-ai-sub">AI chatbot pilot</div>
+                </div>
+                <div class="cs-ai-card">
+                    <div class="cs-ai-label">Complaints</div>
+                    <div class="cs-ai-value">284</div>
+                    <div class="cs-ai-sub">↑ +12% MoM</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">AI Executive Summary</div>', unsafe_allow_html=True)
+        if st.session_state.get('sf_highlights', True):
+            st.info("❄️ **Powered by Snowflake Cortex AI** — Summary synthesized from contact center, ticket, and CSAT data.")
+        
+        with st.container(border=True):
+            st.markdown("""
+            **Executive Summary (Q1 2026):**
+            - CSAT holds at **4.2**, with technical support queues driving variance.
+            - FCR is **78%**, improving as knowledge base coverage expands.
+            - Backlog is trending down **6% WoW** with staffing stabilization.
+            """)
+        
+        st.markdown('<div class="section-header">Signals & Insights</div>', unsafe_allow_html=True)
+        insight_cols = st.columns(3)
+        with insight_cols[0]:
+            st.markdown('<div class="section-header">Top Insights</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                - **Digital volume** up 12% YoY
+                - **Repeat contacts** driven by billing and network
+                - **Top agents** exceed 4.7 CSAT
+                """)
+        with insight_cols[1]:
+            st.markdown('<div class="section-header">Risk Signals</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                - **Complaints MTD** +12% MoM
+                - **AHT** above target in tech queue
+                - **Pending tickets** >150
+                """)
+        with insight_cols[2]:
+            st.markdown('<div class="section-header">Growth Signals</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                - **AI chatbot** deflection trending 18%
+                - **FCR** +3% MoM with KB refresh
+                - **Wait time** down 30 seconds
+                """)
+        
+        st.markdown('<div class="section-header">AI-Powered Strategic Recommendations</div>', unsafe_allow_html=True)
+        action_cols = st.columns(3)
+        with action_cols[0]:
+            with st.container(border=True):
+                st.markdown("""
+                - **Raise CSAT** by prioritizing tech support coaching
+                - Add 25 agents to peak shifts
+                """)
+        with action_cols[1]:
+            with st.container(border=True):
+                st.markdown("""
+                - **Lift FCR** via knowledge base coverage
+                - Target top 5 ticket categories
+                """)
+        with action_cols[2]:
+            with st.container(border=True):
+                st.markdown("""
+                - **Scale chatbot** to app + WhatsApp
+                - Aim for 30% deflection by Q2
+                """)
+        
+        st.markdown('<div class="section-header">VP Customer Service Strategic Priorities — Q1 2026</div>', unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #DC2626; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 1</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">CSAT to 4.5</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **4.2** average
+                - Gap: **0.3** points
+                - Focus: Technical Support queue
+                - Training: Agent coaching program
+                """)
+        with col2:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #F59E0B; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 2</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">FCR to 85%</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **78%** FCR
+                - Target: **85%** by Q2
+                - Action: Knowledge base upgrade
+                - Investment: **£180K** approved
+                """)
+        with col3:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #10B981; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 3</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">AI Chatbot Launch</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Target: **30%** deflection
+                - Launch: March 2026
+                - Channels: Web, App, WhatsApp
+                - Savings: **£420K** projected
+                """)
+        
+        st.markdown('<div class="section-header">Ask Snowflake Intelligence</div>', unsafe_allow_html=True)
+        
+        questions = [
+            "Show me our contact centre performance - AHT, wait time, and CSAT by queue.",
+            "What are the top support ticket categories and resolution times?",
+            "Who are our top performing agents by CSAT?",
+            "Show me our formal complaint volumes and resolution times.",
+            "How does support performance differ between Consumer and B2B?"
+        ]
+        
+        sf_intel_url = "https://ai.snowflake.com/sfseeurope/pjose_aws3"
+        cols = st.columns(2)
+        for i, q in enumerate(questions):
+            with cols[i % 2]:
+                escaped_q = q.replace('"', '&quot;').replace("'", "&#39;")
+                st.markdown(f"""
+                <a href="{sf_intel_url}" target="_blank" onclick="navigator.clipboard.writeText('{escaped_q}')" style="text-decoration: none; color: inherit; display: block;">
+                    <div class="question-card">
+                        <p style="margin-bottom: 1.5rem;"><strong>Q{i+1}:</strong> "{q}"</p>
+                    </div>
+                </a>
+                """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div style="text-align: center; margin-top: 1rem; padding: 1rem; background: linear-gradient(135deg, #29B5E8 0%, #1A8BC4 100%); border-radius: 8px;">
+            <a href="{sf_intel_url}" target="_blank" style="color: white; text-decoration: none; font-weight: 600; font-size: 1rem;">
+                ❄️ Ask these questions in Snowflake Intelligence →
+            </a>
+        </div>
+        """, unsafe_allow_html=True)
+
+
+@fragment
+def _customer_360_panel():
+    """Customer lookup widgets and the Customer 360 profile."""
+    c360_col1, c360_col2 = st.columns([1, 3])
+    
+    with c360_col1:
+        with st.container(border=True):
+            st.markdown("**Customer Lookup**")
+            customer_id = st.text_input("Customer ID", value="CUST-2847156", label_visibility="collapsed", placeholder="Enter Customer ID", key="cs_cust_id")
+            segment_filter = st.selectbox("Or select segment", ["High Value", "At Risk", "New Customer", "Dormant"], index=0, key="cs_segment")
+            st.button("🔍 Load Profile", use_container_width=True, type="primary", key="cs_load_btn")
+    
+    with c360_col2:
+        with st.container(border=True):
+            # Customer Header
+            st.markdown("""
+            <div style="display: flex; justify-content: space-between; align-items: center; padding-bottom: 1rem; border-bottom: 1px solid #E5E7EB; margin-bottom: 1rem;">
+                <div>
+                    <div style="font-size: 1.2rem; font-weight: 700; color: #1B2A4E;">Sarah Mitchell</div>
+                    <div style="font-size: 0.85rem; color: #6B7280;">ID: CUST-2847156 • Premium Customer since 2019</div>
+                </div>
+                <div style="display: flex; gap: 0.5rem;">
+                    <div style="background: #DCFCE7; color: #166534; padding: 0.4rem 0.8rem; border-radius: 20px; font-size: 0.75rem; font-weight: 600;">High Value</div>
+                    <div style="background: #FEF3C7; color: #92400E; padding: 0.4rem 0.8rem; border-radius: 20px; font-size: 0.75rem; font-weight: 600;">Churn Risk: Medium</div>
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
+            
+            # Customer metrics
+            metric_cols = st.columns(6)
+            with metric_cols[0]:
+                st.metric("CLV", "£4,820", "Top 8%")
+            with metric_cols[1]:
+                st.metric("Tenure", "5.2 yrs", "Loyal")
+            with metric_cols[2]:
+                st.metric("ARPU", "£68.40", "+£4.20")
+            with metric_cols[3]:
+                st.metric("NPS Score", "9", "Promoter")
+            with metric_cols[4]:
+                st.metric("Churn Prob", "18%", "↑ 4%", delta_color="inverse")
+            with metric_cols[5]:
+                st.metric("Upsell Prob", "72%", "High")
+            
+            st.markdown("---")
+            
+            # Customer details tabs
+            detail_tabs = st.tabs(["📱 Products", "📞 Interactions", "🎯 Recommendations", "📊 Usage"])
+            
+            with detail_tabs[0]:
+                st.markdown("""
+                | Product | Plan | Monthly | Status |
+                |---------|------|---------|--------|
+                | Mobile (Primary) | Unlimited Max | £45.00 | Active |
+                | Mobile (Family) | Unlimited Plus | £32.00 | Active |
+                | Home Broadband | Fibre 500 | £38.00 | Active |
+                | TV Bundle | Entertainment+ | £15.00 | Active |
+                """)
+            
+            with detail_tabs[1]:
+                st.markdown("""
+                | Date | Channel | Type | Resolution |
+                |------|---------|------|------------|
+                | 28 Jan 2026 | App | Billing Query | ✅ Resolved |
+                | 15 Jan 2026 | Call | Upgrade Inquiry | ⏳ Pending |
+                | 02 Jan 2026 | Chat | Technical Support | ✅ Resolved |
+                | 18 Dec 2025 | Store | Device Purchase | ✅ Completed |
+                """)
+            
+            with detail_tabs[2]:
+                rec_cols = st.columns(3)
+                with rec_cols[0]:
+                    with st.container(border=True):
+                        st.markdown("**🎯 Top Recommendation**")
+                        st.markdown("Upgrade to 5G Unlimited")
+                        st.caption("72% acceptance probability")
+                        st.caption("£8/mo additional revenue")
+                with rec_cols[1]:
+                    with st.container(border=True):
+                        st.markdown("**📦 Bundle Opportunity**")
+                        st.markdown("Add Mobile Insurance")
+                        st.caption("64% acceptance probability")
+                        st.caption("£12/mo additional revenue")
+                with rec_cols[2]:
+                    with st.container(border=True):
+                        st.markdown("**⚠️ Retention Action**")
+                        st.markdown("Loyalty reward due")
+                        st.caption("Tenure milestone: 5 years")
+                        st.caption("Offer: 20% off for 6 months")
+            
+            with detail_tabs[3]:
+                usage_cols = st.columns(4)
+                with usage_cols[0]:
+                    st.metric("Data Used", "48.2 GB", "of Unlimited")
+                with usage_cols[1]:
+                    st.metric("Minutes", "842", "of Unlimited")
+                with usage_cols[2]:
+                    st.metric("Texts", "234", "of Unlimited")
+                with usage_cols[3]:
+                    st.metric("Roaming", "2.4 GB", "EU included")
@@ -0,0 +1,727 @@
+"""VP Enterprise Sales dashboard."""
+
+import streamlit as st
+import pandas as pd
+import altair as alt
+
+from dashboard import charts
+
+
+def render_vp_enterprise_sales():
+    import pandas as pd
+    import altair as alt
+    
+    st.markdown("""
+    <div class="main-header">
+        <h1>VP Enterprise Sales Dashboard</h1>
+        <p>B2B Contract Renewals, Enterprise Revenue & Competitive Analysis</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Dashboard Tabs
+    tab_overview, tab_ops, tab_strategy = st.tabs(["📊 Overview & Analysis", "💼 Sales Operations", "❄️ Snowflake Intelligence"])
+
+    with tab_overview:
+        
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['B2B_CONTRACT']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+        
+        # VP ENTERPRISE SALES - PIPELINE ANIMATION
+        st.markdown("""<div class="sales-pipeline"><div class="sales-header"><div class="sales-title">📊 Enterprise Pipeline</div><div class="sales-target">£24.5M Pipeline • 78% to Target</div></div><div class="pipeline-funnel"><div class="funnel-stage prospect"><div class="stage-val">47</div><div class="stage-name">Prospects</div><div class="stage-amount">£8.2M</div></div><span class="funnel-arrow">→</span><div class="funnel-stage qualified"><div class="stage-val">28</div><div class="stage-name">Qualified</div><div class="stage-amount">£6.4M</div></div><span class="funnel-arrow">→</span><div class="funnel-stage proposal"><div class="stage-val">15</div><div class="stage-name">Proposal</div><div class="stage-amount">£5.1M</div></div><span class="funnel-arrow">→</span><div class="funnel-stage negotiation"><div class="stage-val">8</div><div class="stage-name">Negotiation</div><div class="stage-amount">£3.2M</div></div><span class="funnel-arrow">→</span><div class="funnel-stage closed"><div class="stage-val">12</div><div class="stage-name">Closed Won</div><div class="stage-amount">£1.6M</div></div></div></div>""", unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="section-header">Enterprise Portfolio Overview</div>
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #29B5E8;">
+                <div class="kpi-icon">📋</div>
+                <div class="kpi-label">Total ACV</div>
+                <div class="kpi-value">£52.4M</div>
+                <div class="kpi-delta positive">↑ +12% YoY</div>
+            </div>
+            <div class="kpi-card" style="--accent: #10B981;">
+                <div class="kpi-icon">🔄</div>
+                <div class="kpi-label">Renewal Rate</div>
+                <div class="kpi-value">87%</div>
+                <div class="kpi-delta positive">↑ +4% vs target</div>
+            </div>
+            <div class="kpi-card" style="--accent: #F59E0B;">
+                <div class="kpi-icon">📅</div>
+                <div class="kpi-label">Renewals (90d)</div>
+                <div class="kpi-value">£8.4M</div>
+                <div class="kpi-delta positive">42 contracts</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EF4444;">
+                <div class="kpi-icon">⚠️</div>
+                <div class="kpi-label">At-Risk Revenue</div>
+                <div class="kpi-value">£3.2M</div>
+                <div class="kpi-delta negative">18 contracts</div>
+            </div>
+        </div>
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #8B5CF6;">
+                <div class="kpi-icon">📈</div>
+                <div class="kpi-label">Expansion Pipeline</div>
+                <div class="kpi-value">£2.8M</div>
+                <div class="kpi-delta positive">Upsell opportunities</div>
+            </div>
+            <div class="kpi-card" style="--accent: #14B8A6;">
+                <div class="kpi-icon">🏆</div>
+                <div class="kpi-label">Win Rate</div>
+                <div class="kpi-value">34%</div>
+                <div class="kpi-delta positive">↑ +6% vs BT</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EC4899;">
+                <div class="kpi-icon">👥</div>
+                <div class="kpi-label">Active Accounts</div>
+                <div class="kpi-value">524</div>
+                <div class="kpi-delta positive">↑ +28 YTD</div>
+            </div>
+            <div class="kpi-card" style="--accent: #6366F1;">
+                <div class="kpi-icon">💰</div>
+                <div class="kpi-label">Avg Contract Value</div>
+                <div class="kpi-value">£100K</div>
+                <div class="kpi-delta positive">↑ +8% YoY</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        if st.session_state.get('sf_highlights', True):
+            st.info("❄️ **Powered by Snowflake** — B2B contract analytics with Cortex ML for renewal prediction and churn risk scoring on enterprise accounts")
+        
+        st.markdown('<div class="section-header">Enterprise Growth Signals</div>', unsafe_allow_html=True)
+        growth_col1, growth_col2 = st.columns(2)
+        
+        with growth_col1:
+            st.markdown("**ACV Trend (6 Quarters)**")
+            with st.container(border=True):
+                quarters = ['Q1', 'Q2', 'Q3', 'Q4', 'Q1', 'Q2']
+                acv_df = pd.DataFrame({
+                    'Quarter': quarters,
+                    'ACV': [46.2, 47.8, 49.1, 50.6, 51.8, 52.4]
+                })
+                acv_line = alt.Chart(acv_df).mark_line(point=True, color='#29B5E8', strokeWidth=2).encode(
+                    x=alt.X('Quarter:N', sort=quarters, title=None),
+                    y=alt.Y('ACV:Q', title='£M'),
+                    tooltip=['Quarter:N', alt.Tooltip('ACV:Q', format='.1f')]
+                ).properties(height=170)
+                charts.altair_chart(acv_line, use_container_width=True)
+        
+        with growth_col2:
+            st.markdown("**Win Rate by Segment**")
+            with st.container(border=True):
+                segment_df = pd.DataFrame({
+                    'Segment': ['Enterprise', 'Mid-Market', 'SMB', 'Public'],
+                    'WinRate': [38, 34, 29, 41]
+                })
+                win_bar = alt.Chart(segment_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('WinRate:Q', title='%'),
+                    y=alt.Y('Segment:N', sort='-x', title=None),
+                    color=alt.value('#10B981'),
+                    tooltip=['Segment:N', alt.Tooltip('WinRate:Q', format='.0f')]
+                ).properties(height=170)
+                charts.altair_chart(win_bar, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Pipeline Mix</div>', unsafe_allow_html=True)
+        mix_col1, mix_col2 = st.columns(2)
+        
+        with mix_col1:
+            st.markdown("**Pipeline by Region**")
+            with st.container(border=True):
+                region_df = pd.DataFrame({
+                    'Region': ['London', 'North', 'Midlands', 'South', 'Scotland'],
+                    'Pipeline': [8.2, 5.6, 4.4, 3.8, 2.5]
+                })
+                region_bar = alt.Chart(region_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Pipeline:Q', title='£M'),
+                    y=alt.Y('Region:N', sort='-x', title=None),
+                    color=alt.value('#6366F1'),
+                    tooltip=['Region:N', alt.Tooltip('Pipeline:Q', format='.1f')]
+                ).properties(height=170)
+                charts.altair_chart(region_bar, use_container_width=True)
+        
+        with mix_col2:
+            st.markdown("**Deal Size Distribution**")
+            with st.container(border=True):
+                size_df = pd.DataFrame({
+                    'Band': ['<£50K', '£50-100K', '£100-250K', '£250K+'],
+                    'Deals': [18, 24, 16, 7]
+                })
+                size_bar = alt.Chart(size_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Deals:Q', title='Deals'),
+                    y=alt.Y('Band:N', sort='-x', title=None),
+                    color=alt.value('#F59E0B'),
+                    tooltip=['Band:N', 'Deals:Q']
+                ).properties(height=170)
+                charts.altair_chart(size_bar, use_container_width=True)
+
+        st.markdown('<div class="section-header">Revenue & Margin Signals</div>', unsafe_allow_html=True)
+        rev_col1, rev_col2 = st.columns(2)
+        
+        with rev_col1:
+            st.markdown("**Gross Margin by Product**")
+            with st.container(border=True):
+                margin_df = pd.DataFrame({
+                    'Product': ['UCaaS', 'SIP Trunks', 'SD-WAN', 'Mobile Fleet', 'Security'],
+                    'Margin': [46, 38, 41, 32, 52]
+                })
+                margin_bar = alt.Chart(margin_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Margin:Q', title='Margin %'),
+                    y=alt.Y('Product:N', sort='-x', title=None),
+                    color=alt.value('#29B5E8'),
+                    tooltip=['Product:N', alt.Tooltip('Margin:Q', format='.0f')]
+                ).properties(height=170)
+                charts.altair_chart(margin_bar, use_container_width=True)
+        
+        with rev_col2:
+            st.markdown("**ACV vs Revenue Trend**")
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                rev_df = pd.DataFrame({
+                    'Month': months * 2,
+                    'Metric': ['ACV'] * 6 + ['Revenue'] * 6,
+                    'Value': [46.2, 47.1, 48.0, 49.2, 50.6, 52.4,
+                              3.8, 3.9, 4.1, 4.3, 4.5, 4.7]
+                })
+                rev_line = alt.Chart(rev_df).mark_line(point=True).encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('Value:Q', title='£M'),
+                    color=alt.Color('Metric:N', scale=alt.Scale(
+                        domain=['ACV', 'Revenue'], range=['#6366F1', '#10B981']
+                    )),
+                    tooltip=['Month:N', 'Metric:N', alt.Tooltip('Value:Q', format='.1f')]
+                ).properties(height=170)
+                charts.altair_chart(rev_line, use_container_width=True)
+
+    with tab_ops:
+        st.markdown("""
+        <div class="ent-ops-pulse">
+            <div class="ent-ops-header">
+                <div class="ent-ops-title">💼 Sales Ops Pulse</div>
+                <div class="ent-ops-tag">LIVE OPS</div>
+            </div>
+            <div class="ent-ops-grid">
+                <div class="ent-ops-card">
+                    <div class="ent-ops-label">Renewals Due</div>
+                    <div class="ent-ops-value">42</div>
+                    <div class="ent-ops-delta">£8.4M ACV</div>
+                </div>
+                <div class="ent-ops-card">
+                    <div class="ent-ops-label">At-Risk ACV</div>
+                    <div class="ent-ops-value">£3.2M</div>
+                    <div class="ent-ops-delta">18 contracts</div>
+                </div>
+                <div class="ent-ops-card">
+                    <div class="ent-ops-label">Avg Cycle</div>
+                    <div class="ent-ops-value">64d</div>
+                    <div class="ent-ops-delta">↓ 6d QoQ</div>
+                </div>
+                <div class="ent-ops-card">
+                    <div class="ent-ops-label">Forecast Attain</div>
+                    <div class="ent-ops-value">78%</div>
+                    <div class="ent-ops-delta">Target 85%</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Renewal Operations</div>', unsafe_allow_html=True)
+        renew_col1, renew_col2 = st.columns(2)
+        
+        with renew_col1:
+            st.markdown("**Renewal Risk by Stage**")
+            with st.container(border=True):
+                risk_df = pd.DataFrame({
+                    'Stage': ['Discovery', 'Proposal', 'Negotiation', 'Legal'],
+                    'AtRisk': [6, 8, 5, 4]
+                })
+                risk_bar = alt.Chart(risk_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('AtRisk:Q', title='At-Risk Accounts'),
+                    y=alt.Y('Stage:N', sort='-x', title=None),
+                    color=alt.value('#EF4444'),
+                    tooltip=['Stage:N', 'AtRisk:Q']
+                ).properties(height=170)
+                charts.altair_chart(risk_bar, use_container_width=True)
+        
+        with renew_col2:
+            st.markdown("**Sales Cycle Time by Stage**")
+            with st.container(border=True):
+                cycle_df = pd.DataFrame({
+                    'Stage': ['Lead', 'Qualified', 'Proposal', 'Negotiation', 'Closed'],
+                    'Days': [8, 12, 16, 18, 10]
+                })
+                cycle_line = alt.Chart(cycle_df).mark_line(point=True, color='#29B5E8', strokeWidth=2).encode(
+                    x=alt.X('Stage:N', title=None),
+                    y=alt.Y('Days:Q', title='Days'),
+                    tooltip=['Stage:N', 'Days:Q']
+                ).properties(height=170)
+                charts.altair_chart(cycle_line, use_container_width=True)
+
+        st.markdown('<div class="section-header">Forecast & Slippage</div>', unsafe_allow_html=True)
+        forecast_col1, forecast_col2 = st.columns(2)
+        
+        with forecast_col1:
+            st.markdown("**Forecast Attainment (Quarterly)**")
+            with st.container(border=True):
+                quarters = ['Q1', 'Q2', 'Q3', 'Q4']
+                forecast_df = pd.DataFrame({
+                    'Quarter': quarters,
+                    'Attainment': [76, 78, 82, 80]
+                })
+                forecast_bar = alt.Chart(forecast_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Attainment:Q', title='%'),
+                    y=alt.Y('Quarter:N', sort='-x', title=None),
+                    color=alt.value('#10B981'),
+                    tooltip=['Quarter:N', alt.Tooltip('Attainment:Q', format='.0f')]
+                ).properties(height=170)
+                charts.altair_chart(forecast_bar, use_container_width=True)
+        
+        with forecast_col2:
+            st.markdown("**Pipeline Slippage (Days)**")
+            with st.container(border=True):
+                slip_df = pd.DataFrame({
+                    'Stage': ['Qualified', 'Proposal', 'Negotiation'],
+                    'Slippage': [2, 4, 6]
+                })
+                slip_bar = alt.Chart(slip_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Slippage:Q', title='Days'),
+                    y=alt.Y('Stage:N', sort='-x', title=None),
+                    color=alt.value('#F59E0B'),
+                    tooltip=['Stage:N', 'Slippage:Q']
+                ).properties(height=170)
+                charts.altair_chart(slip_bar, use_container_width=True)
+
+        st.markdown('<div class="section-header">Team Performance</div>', unsafe_allow_html=True)
+        team_col1, team_col2 = st.columns(2)
+        
+        with team_col1:
+            st.markdown("**Quota Attainment by Team**")
+            with st.container(border=True):
+                team_df = pd.DataFrame({
+                    'Team': ['North', 'South', 'London', 'Midlands'],
+                    'Attainment': [82, 76, 88, 71]
+                })
+                team_bar = alt.Chart(team_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Attainment:Q', title='%'),
+                    y=alt.Y('Team:N', sort='-x', title=None),
+                    color=alt.value('#6366F1'),
+                    tooltip=['Team:N', alt.Tooltip('Attainment:Q', format='.0f')]
+                ).properties(height=170)
+                charts.altair_chart(team_bar, use_container_width=True)
+        
+        with team_col2:
+            st.markdown("**Average Deal Velocity (Days)**")
+            with st.container(border=True):
+                velocity_df = pd.DataFrame({
+                    'Rep': ['Team A', 'Team B', 'Team C', 'Team D'],
+                    'Days': [52, 58, 61, 67]
+                })
+                velocity_bar = alt.Chart(velocity_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Days:Q', title='Days'),
+                    y=alt.Y('Rep:N', sort='-x', title=None),
+                    color=alt.value('#29B5E8'),
+                    tooltip=['Rep:N', 'Days:Q']
+                ).properties(height=170)
+                charts.altair_chart(velocity_bar, use_container_width=True)
+        
+        # Sales Pipeline and Renewal Calendar
+        pipeline_col, renewal_col = st.columns(2)
+        
+        with pipeline_col:
+            st.markdown('<div class="section-header">Sales Pipeline</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="margin-bottom: 0.75rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.25rem;">
+                            <span>Lead</span><span style="font-weight: 600;">£4.2M (42)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 20px; overflow: hidden;">
+                            <div style="background: #6366F1; width: 100%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.75rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.25rem;">
+                            <span>Qualified</span><span style="font-weight: 600;">£2.8M (28)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 20px; overflow: hidden;">
+                            <div style="background: #8B5CF6; width: 67%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.75rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.25rem;">
+                            <span>Proposal</span><span style="font-weight: 600;">£1.8M (18)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 20px; overflow: hidden;">
+                            <div style="background: #29B5E8; width: 43%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.75rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.25rem;">
+                            <span>Negotiation</span><span style="font-weight: 600;">£1.2M (12)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 20px; overflow: hidden;">
+                            <div style="background: #F59E0B; width: 29%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div>
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.25rem;">
+                            <span>Won</span><span style="font-weight: 600;">£0.8M (8)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 20px; overflow: hidden;">
+                            <div style="background: #10B981; width: 19%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with renewal_col:
+            st.markdown('<div class="section-header">Renewal Timeline (90 Days)</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; justify-content: space-around; align-items: flex-end; height: 140px; padding: 0 1rem;">
+                    <div style="text-align: center; flex: 1;">
+                        <div style="background: #EF4444; width: 60px; height: 100px; margin: 0 auto; border-radius: 6px 6px 0 0;"></div>
+                        <div style="font-size: 0.75rem; margin-top: 0.5rem; color: #6B7280;">0-30 Days</div>
+                        <div style="font-weight: 600; font-size: 0.85rem;">£3.2M</div>
+                        <div style="font-size: 0.7rem; color: #6B7280;">14 contracts</div>
+                    </div>
+                    <div style="text-align: center; flex: 1;">
+                        <div style="background: #F59E0B; width: 60px; height: 87px; margin: 0 auto; border-radius: 6px 6px 0 0;"></div>
+                        <div style="font-size: 0.75rem; margin-top: 0.5rem; color: #6B7280;">31-60 Days</div>
+                        <div style="font-weight: 600; font-size: 0.85rem;">£2.8M</div>
+                        <div style="font-size: 0.7rem; color: #6B7280;">16 contracts</div>
+                    </div>
+                    <div style="text-align: center; flex: 1;">
+                        <div style="background: #10B981; width: 60px; height: 75px; margin: 0 auto; border-radius: 6px 6px 0 0;"></div>
+                        <div style="font-size: 0.75rem; margin-top: 0.5rem; color: #6B7280;">61-90 Days</div>
+                        <div style="font-weight: 600; font-size: 0.85rem;">£2.4M</div>
+                        <div style="font-size: 0.7rem; color: #6B7280;">12 contracts</div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        col_left, col_right = st.columns([1.3, 1])
+        
+        with col_left:
+            st.markdown('<div class="section-header">Revenue by Product Type</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>UCaaS</span><span style="font-weight: 600;">£18.2M (142)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #29B5E8; width: 100%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>SIP Trunks</span><span style="font-weight: 600;">£12.4M (186)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #29B5E8; width: 68%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>SD-WAN</span><span style="font-weight: 600;">£8.6M (68)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #29B5E8; width: 47%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Mobile Fleet</span><span style="font-weight: 600;">£7.8M (98)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #29B5E8; width: 43%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div>
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Managed Security</span><span style="font-weight: 600;">£5.4M (30)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #29B5E8; width: 30%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col_right:
+            st.markdown('<div class="section-header">Competitive Threats</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>BT Business</span>
+                        <span style="background: #FEE2E2; color: #DC2626; padding: 0.2rem 0.5rem; border-radius: 12px;">8 at risk</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Vodafone</span>
+                        <span style="background: #FEF3C7; color: #92400E; padding: 0.2rem 0.5rem; border-radius: 12px;">5 at risk</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Virgin Media O2</span>
+                        <span style="background: #FEF3C7; color: #92400E; padding: 0.2rem 0.5rem; border-radius: 12px;">3 at risk</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0;">
+                        <span>Other</span>
+                        <span style="background: #E0F2FE; color: #0369A1; padding: 0.2rem 0.5rem; border-radius: 12px;">2 at risk</span>
+                    </div>
+                </div>
+                <div style="margin-top: 0.75rem; padding: 0.5rem; background: #FEE2E2; border-radius: 8px; font-size: 0.75rem; text-align: center;">
+                    <span style="color: #DC2626;">⚠️ £3.2M revenue at competitive risk</span>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        # B2B Account Health Section
+        st.markdown('<div class="section-header">B2B Account Health & Intelligence</div>', unsafe_allow_html=True)
+        
+        health_col, industry_col = st.columns(2)
+        
+        with health_col:
+            st.markdown("**Top 10 Accounts Health Scorecard**")
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.8rem;">
+                    <div style="display: flex; justify-content: space-between; padding: 0.35rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span style="flex: 2;">Barclays PLC</span>
+                        <span style="flex: 1; text-align: right;">£2.4M</span>
+                        <span style="flex: 1; text-align: right; color: #10B981;">● Healthy</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.35rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span style="flex: 2;">NHS Trust London</span>
+                        <span style="flex: 1; text-align: right;">£1.8M</span>
+                        <span style="flex: 1; text-align: right; color: #10B981;">● Healthy</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.35rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span style="flex: 2;">Tesco Stores Ltd</span>
+                        <span style="flex: 1; text-align: right;">£1.6M</span>
+                        <span style="flex: 1; text-align: right; color: #F59E0B;">● At Risk</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.35rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span style="flex: 2;">HSBC Holdings</span>
+                        <span style="flex: 1; text-align: right;">£1.4M</span>
+                        <span style="flex: 1; text-align: right; color: #10B981;">● Healthy</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.35rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span style="flex: 2;">Lloyds Banking</span>
+                        <span style="flex: 1; text-align: right;">£1.2M</span>
+                        <span style="flex: 1; text-align: right; color: #10B981;">● Healthy</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.35rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span style="flex: 2;">Manchester Council</span>
+                        <span style="flex: 1; text-align: right;">£1.1M</span>
+                        <span style="flex: 1; text-align: right; color: #DC2626;">● Critical</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.35rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span style="flex: 2;">Sainsbury's</span>
+                        <span style="flex: 1; text-align: right;">£0.9M</span>
+                        <span style="flex: 1; text-align: right; color: #10B981;">● Healthy</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.35rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span style="flex: 2;">PWC UK</span>
+                        <span style="flex: 1; text-align: right;">£0.8M</span>
+                        <span style="flex: 1; text-align: right; color: #F59E0B;">● At Risk</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.35rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span style="flex: 2;">Deloitte LLP</span>
+                        <span style="flex: 1; text-align: right;">£0.7M</span>
+                        <span style="flex: 1; text-align: right; color: #10B981;">● Healthy</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.35rem 0;">
+                        <span style="flex: 2;">BP PLC</span>
+                        <span style="flex: 1; text-align: right;">£0.6M</span>
+                        <span style="flex: 1; text-align: right; color: #10B981;">● Healthy</span>
+                    </div>
+                </div>
+                <div style="margin-top: 0.5rem; padding-top: 0.5rem; border-top: 1px solid #E5E7EB; font-size: 0.75rem; display: flex; justify-content: space-around;">
+                    <span><span style="color: #10B981;">●</span> Healthy: 7</span>
+                    <span><span style="color: #F59E0B;">●</span> At Risk: 2</span>
+                    <span><span style="color: #DC2626;">●</span> Critical: 1</span>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with industry_col:
+            st.markdown("**Revenue by Industry Vertical**")
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Financial Services</span><span style="font-weight: 600;">£8.4M (32%)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #29B5E8; width: 100%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Healthcare/NHS</span><span style="font-weight: 600;">£5.8M (22%)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #10B981; width: 69%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Retail & Distribution</span><span style="font-weight: 600;">£4.2M (16%)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #F59E0B; width: 50%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Public Sector</span><span style="font-weight: 600;">£3.6M (14%)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #8B5CF6; width: 43%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div>
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Manufacturing</span><span style="font-weight: 600;">£2.4M (9%)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #EC4899; width: 29%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+
+    with tab_strategy:
+        st.markdown("""
+        <div class="sf-ent-pulse">
+            <div class="sf-ent-header">
+                <div class="sf-ent-title">❄️ Snowflake Intelligence Pulse</div>
+                <div class="sf-ent-tag">AI INSIGHTS</div>
+            </div>
+            <div class="sf-ent-grid">
+                <div class="sf-ent-card">
+                    <div class="sf-ent-label">Renewal Forecast</div>
+                    <div class="sf-ent-value">89%</div>
+                    <div class="sf-ent-delta">↑ +2% QoQ</div>
+                </div>
+                <div class="sf-ent-card">
+                    <div class="sf-ent-label">At-Risk ACV</div>
+                    <div class="sf-ent-value">£3.2M</div>
+                    <div class="sf-ent-delta">18 accounts</div>
+                </div>
+                <div class="sf-ent-card">
+                    <div class="sf-ent-label">Expansion</div>
+                    <div class="sf-ent-value">£2.8M</div>
+                    <div class="sf-ent-delta">UCaaS focus</div>
+                </div>
+                <div class="sf-ent-card">
+                    <div class="sf-ent-label">Win Rate</div>
+                    <div class="sf-ent-value">34%</div>
+                    <div class="sf-ent-delta">Target 40%</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">AI Executive Summary</div>', unsafe_allow_html=True)
+        st.info("Renewal momentum remains strong at 87% with risk concentrated in 18 competitive accounts worth £3.2M. Expansion pipeline is led by UCaaS and SD-WAN, while win rates lag in mid-market segments. Prioritize executive engagement on near-term renewals and accelerate competitive positioning to lift win rate toward 40%.")
+        
+        st.markdown('<div class="section-header">Signals & Insights</div>', unsafe_allow_html=True)
+        sig_col1, sig_col2, sig_col3 = st.columns(3)
+        with sig_col1:
+            with st.container(border=True):
+                st.markdown("**Renewal Risk Clusters**")
+                st.caption("Five contracts drive 38% of at-risk ACV; most are in London finance accounts.")
+        with sig_col2:
+            with st.container(border=True):
+                st.markdown("**Pipeline Slippage**")
+                st.caption("Negotiation stage dwell time increased by 4 days, impacting Q2 forecast.")
+        with sig_col3:
+            with st.container(border=True):
+                st.markdown("**Expansion Hotspots**")
+                st.caption("UCaaS upsell rate is highest in healthcare and public sector renewals.")
+        
+        st.markdown('<div class="section-header">AI‑Powered Strategic Recommendations</div>', unsafe_allow_html=True)
+        rec_col1, rec_col2, rec_col3 = st.columns(3)
+        with rec_col1:
+            with st.container(border=True):
+                st.markdown("**Executive Renewal Plays**")
+                st.caption("Activate executive sponsorship on top 10 at-risk accounts within 2 weeks.")
+        with rec_col2:
+            with st.container(border=True):
+                st.markdown("**Competitive Countering**")
+                st.caption("Deploy battle cards for BT/Vodafone accounts and bundle SD-WAN offers.")
+        with rec_col3:
+            with st.container(border=True):
+                st.markdown("**Cycle Time Reduction**")
+                st.caption("Standardize legal templates to cut negotiation stage by 3–5 days.")
+        
+        st.markdown('<div class="section-header">Strategic Priorities</div>', unsafe_allow_html=True)
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #DC2626; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 1</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Renewal Rate 92%</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **87%** renewal
+                - Gap: **5%** to target
+                - Focus: At-risk accounts
+                - Action: Executive engagement
+                """)
+        with col2:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #F59E0B; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 2</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Expansion £3.5M</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Pipeline: **£2.8M** identified
+                - Target: **£3.5M** closed
+                - Focus: UCaaS upsell
+                - Timeline: Q1-Q2 2026
+                """)
+        with col3:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #10B981; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 3</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Win Rate 40%</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **34%** win rate
+                - Target: **40%** by Q2
+                - Action: Competitive intel
+                - Training: Battle cards
+                """)
+        
+        st.markdown('<div class="section-header">Ask Snowflake Intelligence</div>', unsafe_allow_html=True)
+        questions = ["What is our B2B contract portfolio value?", "Show me contracts coming up for renewal in 90 days.", "Which contracts have competitive threats?", "What's our at-risk contract value?"]
+        sf_intel_url = "https://ai.snowflake.com/sfseeurope/pjose_aws3"
+        cols = st.columns(2)
+        for i, q in enumerate(questions):
+            with cols[i % 2]:
+                escaped_q = q.replace('"', '&quot;').replace("'", "&#39;")
+                st.markdown(f"""
+                <a href="{sf_intel_url}" target="_blank" onclick="navigator.clipboard.writeText('{escaped_q}')" style="text-decoration: none; color: inherit; display: block;">
+                    <div class="question-card">
+                        <p style="margin-bottom: 1.5rem;"><strong>Q{i+1}:</strong> "{q}"</p>
+                    </div>
+                </a>
+                """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div style="text-align: center; margin-top: 1rem; padding: 1rem; background: linear-gradient(135deg, #29B5E8 0%, #1A8BC4 100%); border-radius: 8px;">
+            <a href="{sf_intel_url}" target="_blank" style="color: white; text-decoration: none; font-weight: 600; font-size: 1rem;">
+                ❄️ Ask these questions in Snowflake Intelligence →
+            </a>
+        </div>
+        """, unsafe_allow_html=True)
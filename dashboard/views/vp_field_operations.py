@@ -0,0 +1,427 @@
+"""VP Field Operations dashboard."""
+
+import streamlit as st
+import pandas as pd
+import altair as alt
+
+from dashboard import charts
+
+
+def render_vp_field_operations():
+    import pandas as pd
+    import altair as alt
+    
+    st.markdown("""
+    <div class="main-header">
+        <h1>VP Field Operations Dashboard</h1>
+        <p>Workforce Optimization, First-Time Fix & SLA Compliance</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Dashboard Tabs
+    tab_overview, tab_ops, tab_strategy = st.tabs(["📊 Overview & Analysis", "🛠️ Field Operations", "❄️ Snowflake Intelligence"])
+
+    with tab_overview:
+        
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['FIELD_OPERATIONS']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+        
+        # VP FIELD OPERATIONS - TECHNICIAN DISPATCH ANIMATION
+        st.markdown("""<div class="field-dispatch"><div class="field-header"><div class="field-title">🔧 Field Technician Dispatch</div><div class="field-live">Live Tracking</div></div><div class="field-map"><div class="field-techs"><div class="field-tech active"><span class="field-tech-icon">👷</span></div><div class="field-tech active"><span class="field-tech-icon">👷</span></div><div class="field-tech"><span class="field-tech-icon">👷</span></div><div class="field-tech active"><span class="field-tech-icon">👷</span></div><div class="field-tech"><span class="field-tech-icon">👷</span></div><div class="field-tech active"><span class="field-tech-icon">👷</span></div><div class="field-tech"><span class="field-tech-icon">👷</span></div><div class="field-tech active"><span class="field-tech-icon">👷</span></div></div></div><div class="field-stats"><div class="field-stat"><div class="field-stat-val">142</div><div class="field-stat-label">Jobs Today</div></div><div class="field-stat"><div class="field-stat-val">87%</div><div class="field-stat-label">First-Time Fix</div></div><div class="field-stat"><div class="field-stat-val">52 min</div><div class="field-stat-label">Avg Duration</div></div><div class="field-stat"><div class="field-stat-val">94%</div><div class="field-stat-label">SLA Met</div></div></div></div>""", unsafe_allow_html=True)
+        
+        
+        st.markdown('<div class="section-header">Field Operations Overview</div>', unsafe_allow_html=True)
+        st.markdown("""
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #10B981;">
+                <div class="kpi-icon">🔧</div>
+                <div class="kpi-label">First-Time Fix Rate</div>
+                <div class="kpi-value">87%</div>
+                <div class="kpi-delta positive">↑ +3% vs target</div>
+            </div>
+            <div class="kpi-card" style="--accent: #29B5E8;">
+                <div class="kpi-icon">📋</div>
+                <div class="kpi-label">Jobs Today</div>
+                <div class="kpi-value">142</div>
+                <div class="kpi-delta positive">92% completed</div>
+            </div>
+            <div class="kpi-card" style="--accent: #F59E0B;">
+                <div class="kpi-icon">⏱️</div>
+                <div class="kpi-label">Avg Job Duration</div>
+                <div class="kpi-value">52 min</div>
+                <div class="kpi-delta positive">↓ -8 min vs avg</div>
+            </div>
+            <div class="kpi-card" style="--accent: #8B5CF6;">
+                <div class="kpi-icon">📍</div>
+                <div class="kpi-label">SLA Compliance</div>
+                <div class="kpi-value">94%</div>
+                <div class="kpi-delta positive">↑ Above 90% target</div>
+            </div>
+        </div>
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #14B8A6;">
+                <div class="kpi-icon">👷</div>
+                <div class="kpi-label">Technicians Active</div>
+                <div class="kpi-value">86</div>
+                <div class="kpi-delta positive">94% utilization</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EC4899;">
+                <div class="kpi-icon">⭐</div>
+                <div class="kpi-label">Customer CSAT</div>
+                <div class="kpi-value">4.4/5</div>
+                <div class="kpi-delta positive">↑ +0.2 MoM</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EF4444;">
+                <div class="kpi-icon">🔄</div>
+                <div class="kpi-label">Rescheduled</div>
+                <div class="kpi-value">18</div>
+                <div class="kpi-delta negative">↑ +6 vs yesterday</div>
+            </div>
+            <div class="kpi-card" style="--accent: #6366F1;">
+                <div class="kpi-icon">💰</div>
+                <div class="kpi-label">Cost Per Visit</div>
+                <div class="kpi-value">£68</div>
+                <div class="kpi-delta positive">↓ -£4 vs budget</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Workforce & Cost Signals</div>', unsafe_allow_html=True)
+        work_col1, work_col2 = st.columns(2)
+        
+        with work_col1:
+            st.markdown("**Jobs by Region**")
+            with st.container(border=True):
+                region_jobs = pd.DataFrame({
+                    'Region': ['London', 'North West', 'Midlands', 'South East', 'Scotland', 'Wales'],
+                    'Jobs': [38, 26, 22, 24, 16, 12]
+                })
+                region_bar = alt.Chart(region_jobs).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Jobs:Q', title='Jobs'),
+                    y=alt.Y('Region:N', sort='-x', title=None),
+                    color=alt.value('#29B5E8'),
+                    tooltip=['Region:N', 'Jobs:Q']
+                ).properties(height=180)
+                charts.altair_chart(region_bar, use_container_width=True)
+        
+        with work_col2:
+            st.markdown("**Cost per Visit Trend**")
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                cost_df = pd.DataFrame({
+                    'Month': months,
+                    'Cost': [72, 70, 69, 71, 68, 68]
+                })
+                cost_line = alt.Chart(cost_df).mark_line(point=True, color='#F59E0B').encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('Cost:Q', title='£ per Visit', scale=alt.Scale(domain=[60, 80])),
+                    tooltip=['Month:N', alt.Tooltip('Cost:Q', format='.0f')]
+                ).properties(height=180)
+                charts.altair_chart(cost_line, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Operational Mix</div>', unsafe_allow_html=True)
+        mix_col1, mix_col2 = st.columns(2)
+        
+        with mix_col1:
+            st.markdown("**Jobs by Type**")
+            with st.container(border=True):
+                job_mix = pd.DataFrame({
+                    'Type': ['Installation', 'Repair', 'Maintenance', 'Upgrade'],
+                    'Jobs': [48, 42, 32, 20]
+                }).set_index('Type')
+                st.bar_chart(job_mix, height=180)
+        
+        with mix_col2:
+            st.markdown("**Technician Utilization Trend**")
+            with st.container(border=True):
+                util_df = pd.DataFrame({
+                    'Month': months,
+                    'Utilization': [90, 91, 92, 93, 94, 94]
+                }).set_index('Month')
+                st.line_chart(util_df, height=180)
+        
+    with tab_ops:
+        st.markdown("""
+        <div class="field-ops-pulse">
+            <div class="field-ops-header">
+                <div class="field-ops-title">🛠️ Field Operations Pulse</div>
+                <div class="field-ops-tag">LIVE OPS</div>
+            </div>
+            <div class="field-ops-grid">
+                <div class="field-ops-card">
+                    <div class="field-ops-label">First-Time Fix</div>
+                    <div class="field-ops-value">87%</div>
+                    <div class="field-ops-delta">+3% vs target</div>
+                </div>
+                <div class="field-ops-card">
+                    <div class="field-ops-label">SLA Compliance</div>
+                    <div class="field-ops-value">94%</div>
+                    <div class="field-ops-delta">Above 90% target</div>
+                </div>
+                <div class="field-ops-card">
+                    <div class="field-ops-label">Avg Duration</div>
+                    <div class="field-ops-value">52 min</div>
+                    <div class="field-ops-delta">-8 min vs avg</div>
+                </div>
+                <div class="field-ops-card">
+                    <div class="field-ops-label">Cost/Visit</div>
+                    <div class="field-ops-value">£68</div>
+                    <div class="field-ops-delta">-£4 vs budget</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # SLA Compliance Trend and FTF by Visit Type
+        sla_col, ftf_col = st.columns(2)
+        
+        with sla_col:
+            st.markdown('<div class="section-header">SLA Compliance Trend</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                weeks = [f'W{i}' for i in range(1, 13)]
+                sla_trend = pd.DataFrame({
+                    'Week': weeks,
+                    'Compliance': [92, 93, 91, 94, 93, 95, 94, 93, 95, 94, 93, 94],
+                    'Target': [90] * 12
+                })
+                
+                sla_line = alt.Chart(sla_trend).mark_line(color='#10B981', strokeWidth=3).encode(
+                    x=alt.X('Week:N', sort=weeks, title=None, axis=alt.Axis(labelAngle=0)),
+                    y=alt.Y('Compliance:Q', scale=alt.Scale(domain=[85, 100]), title='%'),
+                    tooltip=['Week:N', alt.Tooltip('Compliance:Q', format='.0f')]
+                )
+                
+                sla_points = alt.Chart(sla_trend).mark_circle(color='#10B981', size=50).encode(
+                    x=alt.X('Week:N', sort=weeks),
+                    y=alt.Y('Compliance:Q'),
+                    tooltip=['Week:N', alt.Tooltip('Compliance:Q', format='.0f')]
+                )
+                
+                target_rule = alt.Chart(sla_trend).mark_rule(color='#DC2626', strokeDash=[4, 4]).encode(y='Target:Q')
+                
+                charts.altair_chart((sla_line + sla_points + target_rule).properties(height=160), use_container_width=True)
+                st.markdown('<div style="text-align: center; font-size: 0.75rem; color: #6B7280;"><span style="color: #DC2626;">---</span> 90% SLA Target</div>', unsafe_allow_html=True)
+        
+        with ftf_col:
+            st.markdown('<div class="section-header">First-Time Fix by Type</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                ftf_data = pd.DataFrame({
+                    'Type': ['Installation', 'Repair', 'Maintenance', 'Upgrade'],
+                    'FTF': [92, 78, 95, 88],
+                    'Jobs': [48, 42, 32, 20]
+                })
+                
+                ftf_bars = alt.Chart(ftf_data).mark_bar(cornerRadiusTopLeft=6, cornerRadiusTopRight=6).encode(
+                    x=alt.X('Type:N', title=None),
+                    y=alt.Y('FTF:Q', scale=alt.Scale(domain=[0, 100]), title='FTF %'),
+                    color=alt.condition(alt.datum.FTF >= 90, alt.value('#10B981'), alt.value('#F59E0B')),
+                    tooltip=['Type:N', alt.Tooltip('FTF:Q', format='.0f'), 'Jobs:Q']
+                ).properties(height=160)
+                
+                charts.altair_chart(ftf_bars, use_container_width=True)
+        
+        col_left, col_right = st.columns([1.3, 1])
+        
+        with col_left:
+            st.markdown('<div class="section-header">Top Technicians (CSAT)</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                tech_data = pd.DataFrame({
+                    'Technician': ['Mike Johnson', 'Sarah Williams', 'Dave Brown', 'Lisa Chen', 'Tom Harris'],
+                    'CSAT': [4.9, 4.8, 4.7, 4.6, 4.5],
+                    'Jobs': [28, 32, 25, 30, 27],
+                    'FTF': [96, 94, 92, 90, 91]
+                })
+                
+                bars = alt.Chart(tech_data).mark_bar(cornerRadiusTopRight=8, cornerRadiusBottomRight=8).encode(
+                    y=alt.Y('Technician:N', sort=alt.EncodingSortField(field='CSAT', order='descending'), title=None),
+                    x=alt.X('CSAT:Q', scale=alt.Scale(domain=[0, 5]), title='CSAT Score'),
+                    color=alt.value('#10B981'),
+                    tooltip=['Technician:N', alt.Tooltip('CSAT:Q', format='.1f'), 'Jobs:Q', alt.Tooltip('FTF:Q', title='First-Time Fix %')]
+                ).properties(height=180)
+                
+                charts.altair_chart(bars, use_container_width=True)
+        
+        with col_right:
+            st.markdown('<div class="section-header">Visit Types</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Installation</span>
+                        <span style="font-weight: 600;">48 (£72 avg)</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Repair</span>
+                        <span style="font-weight: 600;">42 (£85 avg)</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Maintenance</span>
+                        <span style="font-weight: 600;">32 (£48 avg)</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0;">
+                        <span>Upgrade</span>
+                        <span style="font-weight: 600;">20 (£62 avg)</span>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Reschedule Drivers</div>', unsafe_allow_html=True)
+        res_col1, res_col2 = st.columns(2)
+        
+        with res_col1:
+            st.markdown("**Reschedule Reasons**")
+            with st.container(border=True):
+                res_df = pd.DataFrame({
+                    'Reason': ['Customer Not Home', 'Parts Missing', 'Weather', 'Access Issue', 'Other'],
+                    'Count': [6, 5, 3, 2, 2]
+                })
+                res_bar = alt.Chart(res_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Count:Q', title='Reschedules'),
+                    y=alt.Y('Reason:N', sort='-x', title=None),
+                    color=alt.Color('Reason:N', legend=None, scale=alt.Scale(
+                        range=['#EF4444', '#F59E0B', '#29B5E8', '#10B981', '#8B5CF6']
+                    )),
+                    tooltip=['Reason:N', 'Count:Q']
+                ).properties(height=180)
+                charts.altair_chart(res_bar, use_container_width=True)
+        
+        with res_col2:
+            st.markdown("**Parts Availability by Depot**")
+            with st.container(border=True):
+                parts_df = pd.DataFrame({
+                    'Depot': ['London', 'Manchester', 'Birmingham', 'Leeds', 'Glasgow'],
+                    'Availability': [96, 92, 94, 90, 93]
+                })
+                parts_chart = parts_df.set_index('Depot')
+                st.bar_chart(parts_chart, height=180)
+        
+    with tab_strategy:
+        st.markdown("""
+        <div class="sf-field-pulse">
+            <div class="sf-field-header">
+                <div class="sf-field-title">❄️ Snowflake Intelligence Pulse</div>
+                <div class="sf-field-tag">AI LIVE</div>
+            </div>
+            <div class="sf-field-grid">
+                <div class="sf-field-card">
+                    <div class="sf-field-label">FTF Gap</div>
+                    <div class="sf-field-value">5%</div>
+                </div>
+                <div class="sf-field-card">
+                    <div class="sf-field-label">SLA Risk</div>
+                    <div class="sf-field-value">6 routes</div>
+                </div>
+                <div class="sf-field-card">
+                    <div class="sf-field-label">Cost Drift</div>
+                    <div class="sf-field-value">£6/visit</div>
+                </div>
+                <div class="sf-field-card">
+                    <div class="sf-field-label">CSAT Trend</div>
+                    <div class="sf-field-value">+0.2</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">AI Executive Summary</div>', unsafe_allow_html=True)
+        if st.session_state.get('sf_highlights', True):
+            st.info("❄️ **Snowflake Intelligence** identifies a 5% first-time fix gap tied to repair visits and parts availability, while SLA compliance remains strong. Route optimization and targeted upskilling can reduce cost per visit by £6 and lift FTF toward the 92% target.")
+        
+        st.markdown('<div class="section-header">Signals & Insights</div>', unsafe_allow_html=True)
+        sig_col1, sig_col2, sig_col3 = st.columns(3)
+        with sig_col1:
+            with st.container(border=True):
+                st.markdown("**FTF Variance**")
+                st.caption("Repair visits underperform at 78% FTF; maintenance leads at 95%.")
+        with sig_col2:
+            with st.container(border=True):
+                st.markdown("**Route Efficiency**")
+                st.caption("High reschedule rates in two regions increase cost per visit by £4.")
+        with sig_col3:
+            with st.container(border=True):
+                st.markdown("**Technician Performance**")
+                st.caption("Top 10 technicians deliver 18% higher CSAT and 4% better FTF.")
+        
+        st.markdown('<div class="section-header">AI-Powered Strategic Recommendations</div>', unsafe_allow_html=True)
+        rec_col1, rec_col2, rec_col3 = st.columns(3)
+        with rec_col1:
+            with st.container(border=True):
+                st.markdown("**Parts Pre-Positioning**")
+                st.caption("Stock critical parts per route to lift repair FTF by ~6%.")
+        with rec_col2:
+            with st.container(border=True):
+                st.markdown("**Dynamic Routing**")
+                st.caption("Rebalance technician routes to cut travel time by 12%.")
+        with rec_col3:
+            with st.container(border=True):
+                st.markdown("**Skills Match**")
+                st.caption("Match complex repairs to high-CSAT techs to reduce reschedules.")
+        
+        st.markdown('<div class="section-header">VP Field Operations Strategic Priorities — Q1 2026</div>', unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #DC2626; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 1</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">FTF Rate 92%</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **87%** FTF
+                - Gap: **5%** to target
+                - Action: Parts inventory
+                - Training: Upskill program
+                """)
+        with col2:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #F59E0B; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 2</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Cost Reduction 10%</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **£68** per visit
+                - Target: **£62** per visit
+                - Action: Route optimization
+                - Savings: **£180K** projected
+                """)
+        with col3:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #10B981; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 3</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Mobile App Launch</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Target: **100%** adoption
+                - Features: Job mgmt, parts
+                - Launch: February 2026
+                - Efficiency: **+15%** projected
+                """)
+        
+        st.markdown('<div class="section-header">Ask Snowflake Intelligence</div>', unsafe_allow_html=True)
+        questions = ["What's our first-time fix rate?", "Show me technician performance rankings.", "What's our SLA compliance rate by region?", "What's the average cost per visit by type?"]
+        sf_intel_url = "https://ai.snowflake.com/sfseeurope/pjose_aws3"
+        cols = st.columns(2)
+        for i, q in enumerate(questions):
+            with cols[i % 2]:
+                escaped_q = q.replace('"', '&quot;').replace("'", "&#39;")
+                st.markdown(f"""
+                <a href="{sf_intel_url}" target="_blank" onclick="navigator.clipboard.writeText('{escaped_q}')" style="text-decoration: none; color: inherit; display: block;">
+                    <div class="question-card">
+                        <p style="margin-bottom: 1.5rem;"><strong>Q{i+1}:</strong> "{q}"</p>
+                    </div>
+                </a>
+                """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div style="text-align: center; margin-top: 1rem; padding: 1rem; background: linear-gradient(135deg, #29B5E8 0%, #1A8BC4 100%); border-radius: 8px;">
+            <a href="{sf_intel_url}" target="_blank" style="color: white; text-decoration: none; font-weight: 600; font-size: 1rem;">
+                ❄️ Ask these questions in Snowflake Intelligence →
+            </a>
+        </div>
+        """, unsafe_allow_html=True)
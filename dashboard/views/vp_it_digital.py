@@ -0,0 +1,433 @@
+"""VP IT & Digital dashboard."""
+
+import streamlit as st
+import pandas as pd
+import altair as alt
+
+from dashboard import charts
+
+
+def render_vp_it_digital():
+    import pandas as pd
+    import altair as alt
+    
+    st.markdown("""
+    <div class="main-header">
+        <h1>VP IT & Digital Dashboard</h1>
+        <p>IT Incident Management, SLA Compliance & Application Health</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Dashboard Tabs
+    tab_overview, tab_ops, tab_strategy = st.tabs(["📊 Overview & Analysis", "🧩 IT Operations", "❄️ Snowflake Intelligence"])
+
+    with tab_overview:
+        
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['IT_OPS', 'SLA', 'CUSTOMER_EXPERIENCE']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+        
+        # VP IT & DIGITAL - SYSTEM HEALTH ANIMATION
+        st.markdown("""<div class="it-health"><div class="it-header"><div class="it-title">💻 IT Systems Health Monitor</div><div class="it-status">Last scan: 2 min ago</div></div><div class="it-systems"><div class="it-system"><div class="it-system-icon">🗄️</div><div class="it-system-name">Database</div><div class="it-system-status healthy">Healthy</div></div><div class="it-system"><div class="it-system-icon">🌐</div><div class="it-system-name">Web Apps</div><div class="it-system-status warning">Warning</div></div><div class="it-system"><div class="it-system-icon">📧</div><div class="it-system-name">Email</div><div class="it-system-status healthy">Healthy</div></div><div class="it-system"><div class="it-system-icon">🔐</div><div class="it-system-name">Auth</div><div class="it-system-status healthy">Healthy</div></div><div class="it-system"><div class="it-system-icon">📊</div><div class="it-system-name">Analytics</div><div class="it-system-status healthy">Healthy</div></div></div><div class="it-incidents"><div class="it-incident"><div class="it-incident-dot p1"></div><span class="it-incident-text">P1: 3</span></div><div class="it-incident"><div class="it-incident-dot p2"></div><span class="it-incident-text">P2: 12</span></div><div class="it-incident"><div class="it-incident-dot p3"></div><span class="it-incident-text">P3/P4: 48</span></div></div></div>""", unsafe_allow_html=True)
+        
+        
+        st.markdown('<div class="section-header">IT Operations Overview</div>', unsafe_allow_html=True)
+        st.markdown("""
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #EF4444;">
+                <div class="kpi-icon">🔴</div>
+                <div class="kpi-label">P1 Incidents</div>
+                <div class="kpi-value">3</div>
+                <div class="kpi-delta negative">Active now</div>
+            </div>
+            <div class="kpi-card" style="--accent: #F59E0B;">
+                <div class="kpi-icon">🟡</div>
+                <div class="kpi-label">P2 Incidents</div>
+                <div class="kpi-value">12</div>
+                <div class="kpi-delta negative">↑ +4 vs yesterday</div>
+            </div>
+            <div class="kpi-card" style="--accent: #3B82F6;">
+                <div class="kpi-icon">🔵</div>
+                <div class="kpi-label">P3/P4 Incidents</div>
+                <div class="kpi-value">48</div>
+                <div class="kpi-delta positive">↓ -8 vs yesterday</div>
+            </div>
+            <div class="kpi-card" style="--accent: #10B981;">
+                <div class="kpi-icon">✅</div>
+                <div class="kpi-label">SLA Attainment</div>
+                <div class="kpi-value">94.2%</div>
+                <div class="kpi-delta positive">Above 90% target</div>
+            </div>
+        </div>
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #8B5CF6;">
+                <div class="kpi-icon">⏱️</div>
+                <div class="kpi-label">MTTR (P1)</div>
+                <div class="kpi-value">2.8 hrs</div>
+                <div class="kpi-delta positive">↓ vs 4hr target</div>
+            </div>
+            <div class="kpi-card" style="--accent: #14B8A6;">
+                <div class="kpi-icon">📊</div>
+                <div class="kpi-label">System Uptime</div>
+                <div class="kpi-value">99.92%</div>
+                <div class="kpi-delta positive">↑ +0.04% MoM</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EC4899;">
+                <div class="kpi-icon">🔄</div>
+                <div class="kpi-label">Changes This Week</div>
+                <div class="kpi-value">24</div>
+                <div class="kpi-delta positive">100% success</div>
+            </div>
+            <div class="kpi-card" style="--accent: #6366F1;">
+                <div class="kpi-icon">🛡️</div>
+                <div class="kpi-label">Security Events</div>
+                <div class="kpi-value">142</div>
+                <div class="kpi-delta positive">All mitigated</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Service Reliability Signals</div>', unsafe_allow_html=True)
+        rel_col1, rel_col2 = st.columns(2)
+        
+        with rel_col1:
+            st.markdown("**Uptime Trend (12 Months)**")
+            with st.container(border=True):
+                months = ['Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                uptime_df = pd.DataFrame({
+                    'Month': months,
+                    'Uptime': [99.88, 99.89, 99.90, 99.91, 99.90, 99.91, 99.92, 99.91, 99.92, 99.93, 99.92, 99.92]
+                })
+                uptime_line = alt.Chart(uptime_df).mark_line(point=True, color='#10B981').encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('Uptime:Q', title='Uptime %', scale=alt.Scale(domain=[99.7, 100])),
+                    tooltip=['Month:N', alt.Tooltip('Uptime:Q', format='.2f')]
+                ).properties(height=180)
+                charts.altair_chart(uptime_line, use_container_width=True)
+        
+        with rel_col2:
+            st.markdown("**SLA Compliance by Application**")
+            with st.container(border=True):
+                sla_df = pd.DataFrame({
+                    'App': ['CRM', 'Billing', 'Customer Portal', 'Network OSS', 'Analytics'],
+                    'SLA': [99.6, 99.3, 99.1, 99.4, 99.8]
+                })
+                sla_chart = sla_df.set_index('App')
+                st.bar_chart(sla_chart, height=180)
+        
+        backlog_col1, backlog_col2 = st.columns(2)
+        
+        with backlog_col1:
+            st.markdown("**Ticket Backlog by Team**")
+            with st.container(border=True):
+                backlog_df = pd.DataFrame({
+                    'Team': ['App Support', 'Network Ops', 'Security', 'Infra', 'Service Desk'],
+                    'Backlog': [42, 36, 18, 24, 56]
+                })
+                backlog_bar = alt.Chart(backlog_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Backlog:Q', title='Open Tickets'),
+                    y=alt.Y('Team:N', sort='-x', title=None),
+                    color=alt.value('#29B5E8'),
+                    tooltip=['Team:N', 'Backlog:Q']
+                ).properties(height=180)
+                charts.altair_chart(backlog_bar, use_container_width=True)
+        
+        with backlog_col2:
+            st.markdown("**Digital Experience Incidents**")
+            with st.container(border=True):
+                dx_df = pd.DataFrame({
+                    'Week': ['W1', 'W2', 'W3', 'W4', 'W5', 'W6'],
+                    'Incidents': [14, 12, 16, 11, 10, 9]
+                })
+                dx_line = alt.Chart(dx_df).mark_line(point=True, color='#6366F1').encode(
+                    x=alt.X('Week:N', title=None),
+                    y=alt.Y('Incidents:Q', title='Incidents'),
+                    tooltip=['Week:N', 'Incidents:Q']
+                ).properties(height=180)
+                charts.altair_chart(dx_line, use_container_width=True)
+        
+    with tab_ops:
+        st.markdown("""
+        <div class="it-ops-pulse">
+            <div class="it-ops-header">
+                <div class="it-ops-title">🧩 IT Operations Pulse</div>
+                <div class="it-ops-tag">LIVE OPS</div>
+            </div>
+            <div class="it-ops-grid">
+                <div class="it-ops-card">
+                    <div class="it-ops-label">P1 MTTR</div>
+                    <div class="it-ops-value">2.8 hrs</div>
+                    <div class="it-ops-delta">-1.2 hrs vs target</div>
+                </div>
+                <div class="it-ops-card">
+                    <div class="it-ops-label">SLA Attainment</div>
+                    <div class="it-ops-value">94.2%</div>
+                    <div class="it-ops-delta">+0.8% QoQ</div>
+                </div>
+                <div class="it-ops-card">
+                    <div class="it-ops-label">Changes</div>
+                    <div class="it-ops-value">24</div>
+                    <div class="it-ops-delta">100% success</div>
+                </div>
+                <div class="it-ops-card">
+                    <div class="it-ops-label">Uptime</div>
+                    <div class="it-ops-value">99.92%</div>
+                    <div class="it-ops-delta">0.03% to goal</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Incident Trend and Change Success Rate
+        trend_col, change_col = st.columns(2)
+        
+        with trend_col:
+            st.markdown('<div class="section-header">Incident Trend (8 Weeks)</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                weeks = [f'W{i}' for i in range(1, 9)]
+                it_trend_data = pd.DataFrame({
+                    'Week': weeks * 3,
+                    'Severity': ['P1']*8 + ['P2']*8 + ['P3/P4']*8,
+                    'Count': [4, 3, 5, 2, 4, 3, 2, 3,
+                             14, 12, 15, 11, 13, 10, 14, 12,
+                             52, 48, 55, 45, 50, 42, 48, 48]
+                })
+                
+                incident_lines = alt.Chart(it_trend_data).mark_line(strokeWidth=2).encode(
+                    x=alt.X('Week:N', sort=weeks, title=None),
+                    y=alt.Y('Count:Q', title='Incidents'),
+                    color=alt.Color('Severity:N', scale=alt.Scale(
+                        domain=['P1', 'P2', 'P3/P4'],
+                        range=['#EF4444', '#F59E0B', '#3B82F6']
+                    ), legend=alt.Legend(orient='bottom', title=None)),
+                    tooltip=['Week:N', 'Severity:N', 'Count:Q']
+                ).properties(height=160)
+                
+                charts.altair_chart(incident_lines, use_container_width=True)
+        
+        with change_col:
+            st.markdown('<div class="section-header">Change Success Rate</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="text-align: center; padding: 1rem;">
+                    <div style="font-size: 3rem; font-weight: 700; color: #10B981;">100%</div>
+                    <div style="font-size: 0.85rem; color: #6B7280;">24/24 Changes Successful</div>
+                    <div style="margin-top: 1rem; display: flex; justify-content: space-around; font-size: 0.75rem;">
+                        <div><span style="color: #10B981; font-weight: 600;">18</span> Standard</div>
+                        <div><span style="color: #F59E0B; font-weight: 600;">4</span> Normal</div>
+                        <div><span style="color: #EF4444; font-weight: 600;">2</span> Emergency</div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        col_left, col_right = st.columns([1.3, 1])
+        
+        with col_left:
+            st.markdown('<div class="section-header">Incidents by Category</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                incident_data = pd.DataFrame({
+                    'Category': ['Network', 'Application', 'Database', 'Security', 'Hardware'],
+                    'Count': [18, 24, 8, 6, 7],
+                    'MTTR': [3.2, 2.4, 4.1, 1.8, 6.2]
+                })
+                
+                bars = alt.Chart(incident_data).mark_bar(cornerRadiusTopRight=8, cornerRadiusBottomRight=8).encode(
+                    y=alt.Y('Category:N', sort=alt.EncodingSortField(field='Count', order='descending'), title=None),
+                    x=alt.X('Count:Q', scale=alt.Scale(domain=[0, 30]), title='Incident Count'),
+                    color=alt.value('#29B5E8'),
+                    tooltip=['Category:N', 'Count:Q', alt.Tooltip('MTTR:Q', title='MTTR (hrs)', format='.1f')]
+                ).properties(height=180)
+                
+                charts.altair_chart(bars, use_container_width=True)
+        
+        with col_right:
+            st.markdown('<div class="section-header">Top Affected Systems</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>CRM Platform</span>
+                        <span style="background: #FEE2E2; color: #DC2626; padding: 0.2rem 0.5rem; border-radius: 12px;">8 incidents</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Billing System</span>
+                        <span style="background: #FEF3C7; color: #92400E; padding: 0.2rem 0.5rem; border-radius: 12px;">6 incidents</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Customer Portal</span>
+                        <span style="background: #FEF3C7; color: #92400E; padding: 0.2rem 0.5rem; border-radius: 12px;">5 incidents</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0;">
+                        <span>Network OSS</span>
+                        <span style="background: #E0F2FE; color: #0369A1; padding: 0.2rem 0.5rem; border-radius: 12px;">4 incidents</span>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Operational Effectiveness</div>', unsafe_allow_html=True)
+        ops_col1, ops_col2 = st.columns(2)
+        
+        with ops_col1:
+            st.markdown("**Change Volume by Type**")
+            with st.container(border=True):
+                change_df = pd.DataFrame({
+                    'Type': ['Standard', 'Normal', 'Emergency'],
+                    'Changes': [18, 4, 2]
+                })
+                change_bar = alt.Chart(change_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Changes:Q', title='Changes'),
+                    y=alt.Y('Type:N', sort='-x', title=None),
+                    color=alt.Color('Type:N', legend=None, scale=alt.Scale(
+                        domain=['Standard', 'Normal', 'Emergency'],
+                        range=['#10B981', '#F59E0B', '#EF4444']
+                    )),
+                    tooltip=['Type:N', 'Changes:Q']
+                ).properties(height=180)
+                charts.altair_chart(change_bar, use_container_width=True)
+        
+        with ops_col2:
+            st.markdown("**MTTR by Category**")
+            with st.container(border=True):
+                mttr_df = pd.DataFrame({
+                    'Category': ['Network', 'Application', 'Database', 'Security', 'Hardware'],
+                    'MTTR': [3.2, 2.4, 4.1, 1.8, 6.2]
+                })
+                mttr_bar = alt.Chart(mttr_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('MTTR:Q', title='MTTR (hrs)'),
+                    y=alt.Y('Category:N', sort='-x', title=None),
+                    color=alt.Color('Category:N', legend=None, scale=alt.Scale(
+                        range=['#29B5E8', '#8B5CF6', '#F59E0B', '#10B981', '#EF4444']
+                    )),
+                    tooltip=['Category:N', alt.Tooltip('MTTR:Q', format='.1f')]
+                ).properties(height=180)
+                charts.altair_chart(mttr_bar, use_container_width=True)
+        
+    with tab_strategy:
+        st.markdown("""
+        <div class="sf-it-pulse">
+            <div class="sf-it-header">
+                <div class="sf-it-title">❄️ Snowflake Intelligence Pulse</div>
+                <div class="sf-it-tag">AI LIVE</div>
+            </div>
+            <div class="sf-it-grid">
+                <div class="sf-it-card">
+                    <div class="sf-it-label">P1 Risk</div>
+                    <div class="sf-it-value">3 active</div>
+                </div>
+                <div class="sf-it-card">
+                    <div class="sf-it-label">MTTR Delta</div>
+                    <div class="sf-it-value">+0.8 hrs</div>
+                </div>
+                <div class="sf-it-card">
+                    <div class="sf-it-label">Uptime Gap</div>
+                    <div class="sf-it-value">0.03%</div>
+                </div>
+                <div class="sf-it-card">
+                    <div class="sf-it-label">Change Risk</div>
+                    <div class="sf-it-value">Low</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">AI Executive Summary</div>', unsafe_allow_html=True)
+        if st.session_state.get('sf_highlights', True):
+            st.info("❄️ **Snowflake Intelligence** detects elevated P1 exposure tied to CRM and billing systems, with MTTR still above target. Change success is strong, and targeted automation should close the MTTR gap by 0.8 hours while protecting 99.95% uptime.")
+        
+        st.markdown('<div class="section-header">Signals & Insights</div>', unsafe_allow_html=True)
+        sig_col1, sig_col2, sig_col3 = st.columns(3)
+        with sig_col1:
+            with st.container(border=True):
+                st.markdown("**Incident Concentration**")
+                st.caption("Application incidents account for 36% of volume; CRM and portal drive most alerts.")
+        with sig_col2:
+            with st.container(border=True):
+                st.markdown("**MTTR Variance**")
+                st.caption("Hardware incidents average 6.2 hours; automation gaps in diagnostics.")
+        with sig_col3:
+            with st.container(border=True):
+                st.markdown("**SLA Drift**")
+                st.caption("Uptime at 99.92%; billing system maintenance drives 0.03% shortfall.")
+        
+        st.markdown('<div class="section-header">AI-Powered Strategic Recommendations</div>', unsafe_allow_html=True)
+        rec_col1, rec_col2, rec_col3 = st.columns(3)
+        with rec_col1:
+            with st.container(border=True):
+                st.markdown("**Runbook Automation**")
+                st.caption("Expand auto-remediation for top 5 incident patterns; expected MTTR -0.6 hrs.")
+        with rec_col2:
+            with st.container(border=True):
+                st.markdown("**CRM Stability Sprint**")
+                st.caption("Prioritize CRM patching and capacity tuning to reduce P1 exposure by 30%.")
+        with rec_col3:
+            with st.container(border=True):
+                st.markdown("**Change Risk Controls**")
+                st.caption("Adopt canary releases for emergency changes to keep success rate at 99%+.")
+        
+        st.markdown('<div class="section-header">VP IT & Digital Strategic Priorities — Q1 2026</div>', unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #DC2626; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 1</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">P1 MTTR < 2 hrs</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **2.8 hrs** MTTR
+                - Target: **<2 hrs** by Q2
+                - Action: Automated runbooks
+                - Investment: **£240K** AIOps
+                """)
+        with col2:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #F59E0B; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 2</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">99.95% Uptime</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **99.92%** uptime
+                - Gap: **0.03%** to target
+                - Focus: CRM stability
+                - Action: Infrastructure upgrade
+                """)
+        with col3:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #10B981; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 3</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Cloud Migration</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Target: **60%** on cloud
+                - Current: **42%** migrated
+                - Q1 Focus: Billing system
+                - Budget: **£1.8M** approved
+                """)
+        
+        st.markdown('<div class="section-header">Ask Snowflake Intelligence</div>', unsafe_allow_html=True)
+        questions = ["Show me open IT incidents by severity.", "What's our MTTR by severity?", "Which applications have the most incidents?", "How are we performing against IT SLAs?"]
+        sf_intel_url = "https://ai.snowflake.com/sfseeurope/pjose_aws3"
+        cols = st.columns(2)
+        for i, q in enumerate(questions):
+            with cols[i % 2]:
+                escaped_q = q.replace('"', '&quot;').replace("'", "&#39;")
+                st.markdown(f"""
+                <a href="{sf_intel_url}" target="_blank" onclick="navigator.clipboard.writeText('{escaped_q}')" style="text-decoration: none; color: inherit; display: block;">
+                    <div class="question-card">
+                        <p style="margin-bottom: 1.5rem;"><strong>Q{i+1}:</strong> "{q}"</p>
+                    </div>
+                </a>
+                """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div style="text-align: center; margin-top: 1rem; padding: 1rem; background: linear-gradient(135deg, #29B5E8 0%, #1A8BC4 100%); border-radius: 8px;">
+            <a href="{sf_intel_url}" target="_blank" style="color: white; text-decoration: none; font-weight: 600; font-size: 1rem;">
+                ❄️ Ask these questions in Snowflake Intelligence →
+            </a>
+        </div>
+        """, unsafe_allow_html=True)
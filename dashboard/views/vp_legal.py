@@ -0,0 +1,527 @@
+"""VP Legal dashboard."""
+
+import streamlit as st
+import pandas as pd
+import altair as alt
+
+from dashboard import charts
+
+
+def render_vp_legal():
+    import pandas as pd
+    import altair as alt
+    
+    st.markdown("""
+    <div class="main-header">
+        <h1>VP Legal & General Counsel Dashboard</h1>
+        <p>Contracts, Regulatory Compliance & Risk Management</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Dashboard Tabs
+    tab_overview, tab_ops, tab_strategy = st.tabs(["📊 Overview & Analysis", "⚖️ Legal Operations", "❄️ Snowflake Intelligence"])
+
+    with tab_overview:
+        
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['B2B_CONTRACT', 'COMPLAINT', 'SLA', 'FINANCE']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+        
+        # VP LEGAL - CONTRACT LIFECYCLE ANIMATION
+        st.markdown("""<div class="legal-contracts"><div class="legal-header"><div class="legal-title">📋 Contract Lifecycle</div><div class="legal-value"><div class="legal-value-amount">£52.4M</div><div class="legal-value-label">Portfolio Value</div></div></div><div class="legal-pipeline"><div class="legal-stage"><div class="legal-stage-icon">📝</div><div class="legal-stage-name">Draft</div><div class="legal-stage-count">24</div></div><span class="legal-arrow">→</span><div class="legal-stage"><div class="legal-stage-icon">🔍</div><div class="legal-stage-name">Review</div><div class="legal-stage-count">18</div></div><span class="legal-arrow">→</span><div class="legal-stage"><div class="legal-stage-icon">✍️</div><div class="legal-stage-name">Signing</div><div class="legal-stage-count">12</div></div><span class="legal-arrow">→</span><div class="legal-stage"><div class="legal-stage-icon">✅</div><div class="legal-stage-name">Active</div><div class="legal-stage-count">524</div></div><span class="legal-arrow">→</span><div class="legal-stage"><div class="legal-stage-icon">🔄</div><div class="legal-stage-name">Renewal</div><div class="legal-stage-count">47</div></div></div><div class="legal-alerts"><div class="legal-alert"><div class="legal-alert-val">18</div><div class="legal-alert-label">Open Disputes</div></div><div class="legal-alert"><div class="legal-alert-val">8</div><div class="legal-alert-label">Ombudsman Cases</div></div><div class="legal-alert"><div class="legal-alert-val">£420K</div><div class="legal-alert-label">Risk Exposure</div></div></div></div>""", unsafe_allow_html=True)
+        
+        
+        st.markdown('<div class="section-header">Legal Overview</div>', unsafe_allow_html=True)
+        st.markdown("""
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #29B5E8;">
+                <div class="kpi-icon">📋</div>
+                <div class="kpi-label">Contract Portfolio</div>
+                <div class="kpi-value">£52.4M</div>
+                <div class="kpi-delta positive">524 contracts</div>
+            </div>
+            <div class="kpi-card" style="--accent: #F59E0B;">
+                <div class="kpi-icon">⚖️</div>
+                <div class="kpi-label">Open Disputes</div>
+                <div class="kpi-value">18</div>
+                <div class="kpi-delta negative">£420K exposure</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EF4444;">
+                <div class="kpi-icon">📑</div>
+                <div class="kpi-label">Ombudsman Cases</div>
+                <div class="kpi-value">8</div>
+                <div class="kpi-delta negative">Active</div>
+            </div>
+            <div class="kpi-card" style="--accent: #10B981;">
+                <div class="kpi-icon">✅</div>
+                <div class="kpi-label">SLA Compliance</div>
+                <div class="kpi-value">97.8%</div>
+                <div class="kpi-delta positive">Above target</div>
+            </div>
+        </div>
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #8B5CF6;">
+                <div class="kpi-icon">💰</div>
+                <div class="kpi-label">SLA Credits</div>
+                <div class="kpi-value">£12.4K</div>
+                <div class="kpi-delta negative">MTD liability</div>
+            </div>
+            <div class="kpi-card" style="--accent: #14B8A6;">
+                <div class="kpi-icon">🔒</div>
+                <div class="kpi-label">GDPR Requests</div>
+                <div class="kpi-value">24</div>
+                <div class="kpi-delta positive">All within SLA</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EC4899;">
+                <div class="kpi-icon">📅</div>
+                <div class="kpi-label">Renewals (90d)</div>
+                <div class="kpi-value">42</div>
+                <div class="kpi-delta positive">£8.4M value</div>
+            </div>
+            <div class="kpi-card" style="--accent: #6366F1;">
+                <div class="kpi-icon">⚠️</div>
+                <div class="kpi-label">High-Risk Contracts</div>
+                <div class="kpi-value">8</div>
+                <div class="kpi-delta negative">Need review</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Contract Health Signals</div>', unsafe_allow_html=True)
+        health_col1, health_col2 = st.columns(2)
+        
+        with health_col1:
+            st.markdown("**Renewals by Risk Tier**")
+            with st.container(border=True):
+                risk_df = pd.DataFrame({
+                    'Tier': ['Low', 'Medium', 'High'],
+                    'Contracts': [24, 12, 6]
+                })
+                risk_bar = alt.Chart(risk_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Contracts:Q', title='Contracts'),
+                    y=alt.Y('Tier:N', sort='-x', title=None),
+                    color=alt.value('#F59E0B'),
+                    tooltip=['Tier:N', 'Contracts:Q']
+                ).properties(height=170)
+                charts.altair_chart(risk_bar, use_container_width=True)
+        
+        with health_col2:
+            st.markdown("**Dispute Resolution Time**")
+            with st.container(border=True):
+                dispute_df = pd.DataFrame({
+                    'Stage': ['Intake', 'Review', 'Negotiation', 'Closure'],
+                    'Days': [5, 9, 14, 7]
+                })
+                dispute_bar = alt.Chart(dispute_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Days:Q', title='Days'),
+                    y=alt.Y('Stage:N', sort='-x', title=None),
+                    color=alt.value('#6366F1'),
+                    tooltip=['Stage:N', 'Days:Q']
+                ).properties(height=170)
+                charts.altair_chart(dispute_bar, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Regulatory & Litigation Signals</div>', unsafe_allow_html=True)
+        reg_col1, reg_col2 = st.columns(2)
+        
+        with reg_col1:
+            st.markdown("**Regulatory Findings Trend**")
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                findings_df = pd.DataFrame({
+                    'Month': months,
+                    'Findings': [6, 5, 7, 4, 3, 3]
+                })
+                findings_line = alt.Chart(findings_df).mark_line(point=True, color='#10B981', strokeWidth=2).encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('Findings:Q', title='Findings'),
+                    tooltip=['Month:N', 'Findings:Q']
+                ).properties(height=170)
+                charts.altair_chart(findings_line, use_container_width=True)
+        
+        with reg_col2:
+            st.markdown("**Litigation Mix**")
+            with st.container(border=True):
+                mix_df = pd.DataFrame({
+                    'Type': ['Contract', 'Employment', 'Regulatory', 'IP'],
+                    'Share': [42, 24, 20, 14]
+                })
+                mix_arc = alt.Chart(mix_df).mark_arc(innerRadius=55).encode(
+                    theta=alt.Theta('Share:Q', title=None),
+                    color=alt.Color(
+                        'Type:N',
+                        legend=alt.Legend(orient='bottom', title=None, direction='horizontal'),
+                        scale=alt.Scale(range=['#EF4444', '#3B82F6', '#F59E0B', '#8B5CF6'])
+                    ),
+                    tooltip=['Type:N', alt.Tooltip('Share:Q', format='.0f')]
+                ).properties(height=170)
+                charts.altair_chart(mix_arc, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Complaints & Privacy Signals</div>', unsafe_allow_html=True)
+        comp_col1, comp_col2 = st.columns(2)
+        
+        with comp_col1:
+            st.markdown("**Ombudsman Cases Trend**")
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                omb_df = pd.DataFrame({
+                    'Month': months,
+                    'Cases': [9, 10, 8, 7, 8, 8]
+                })
+                omb_line = alt.Chart(omb_df).mark_line(point=True, color='#F59E0B', strokeWidth=2).encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('Cases:Q', title='Cases'),
+                    tooltip=['Month:N', 'Cases:Q']
+                ).properties(height=170)
+                charts.altair_chart(omb_line, use_container_width=True)
+        
+        with comp_col2:
+            st.markdown("**GDPR Request Mix**")
+            with st.container(border=True):
+                gdpr_df = pd.DataFrame({
+                    'Type': ['Access', 'Deletion', 'Portability', 'Correction'],
+                    'Requests': [12, 6, 4, 2]
+                })
+                gdpr_bar = alt.Chart(gdpr_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Requests:Q', title='Requests'),
+                    y=alt.Y('Type:N', sort='-x', title=None),
+                    color=alt.value('#29B5E8'),
+                    tooltip=['Type:N', 'Requests:Q']
+                ).properties(height=170)
+                charts.altair_chart(gdpr_bar, use_container_width=True)
+        
+    with tab_ops:
+        st.markdown("""
+        <div class="legal-ops-pulse">
+            <div class="legal-ops-header">
+                <div class="legal-ops-title">⚖️ Legal Ops Pulse</div>
+                <div class="legal-ops-tag">LIVE OPS</div>
+            </div>
+            <div class="legal-ops-grid">
+                <div class="legal-ops-card">
+                    <div class="legal-ops-label">Active Matters</div>
+                    <div class="legal-ops-value">18</div>
+                    <div class="legal-ops-delta">Open disputes</div>
+                </div>
+                <div class="legal-ops-card">
+                    <div class="legal-ops-label">Risk Exposure</div>
+                    <div class="legal-ops-value">£420K</div>
+                    <div class="legal-ops-delta">MTD</div>
+                </div>
+                <div class="legal-ops-card">
+                    <div class="legal-ops-label">SLA Credits</div>
+                    <div class="legal-ops-value">£12.4K</div>
+                    <div class="legal-ops-delta">Liability</div>
+                </div>
+                <div class="legal-ops-card">
+                    <div class="legal-ops-label">Compliance</div>
+                    <div class="legal-ops-value">97.8%</div>
+                    <div class="legal-ops-delta">Ofcom</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        spend_col, risk_col = st.columns(2)
+        
+        with spend_col:
+            st.markdown('<div class="section-header">Legal Spend Trend</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                legal_spend = pd.DataFrame({
+                    'Month': months,
+                    'Internal': [42, 45, 48, 44, 46, 48],
+                    'External': [28, 32, 35, 30, 38, 42]
+                })
+                
+                internal_line = alt.Chart(legal_spend).mark_line(color='#29B5E8', strokeWidth=2).encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('Internal:Q', scale=alt.Scale(domain=[0, 100]), title='Spend (£K)')
+                )
+                
+                external_line = alt.Chart(legal_spend).mark_line(color='#F59E0B', strokeWidth=2, strokeDash=[4, 4]).encode(
+                    x=alt.X('Month:N', sort=months),
+                    y=alt.Y('External:Q')
+                )
+                
+                charts.altair_chart((internal_line + external_line).properties(height=160), use_container_width=True)
+                st.markdown('<div style="text-align: center; font-size: 0.75rem;"><span style="color: #29B5E8;">—</span> Internal <span style="color: #F59E0B;">- -</span> External</div>', unsafe_allow_html=True)
+        
+        with risk_col:
+            st.markdown('<div class="section-header">Risk Exposure by Type</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Contract</span><span style="font-weight: 600;">£180K</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #EF4444; width: 100%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Employment</span><span style="font-weight: 600;">£105K</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #3B82F6; width: 58%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Regulatory</span><span style="font-weight: 600;">£85K</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #F59E0B; width: 47%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div>
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>IP</span><span style="font-weight: 600;">£50K</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #8B5CF6; width: 28%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        col_left, col_right = st.columns([1.3, 1])
+        
+        with col_left:
+            st.markdown('<div class="section-header">Active Legal Matters</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <table style="width: 100%; border-collapse: collapse; font-size: 0.85rem;">
+                    <thead>
+                        <tr style="border-bottom: 2px solid #E5E7EB;">
+                            <th style="text-align: left; padding: 0.5rem;">Matter</th>
+                            <th style="text-align: right; padding: 0.5rem;">Exposure</th>
+                            <th style="text-align: right; padding: 0.5rem;">Status</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem;">Contract Dispute - TechCorp</td>
+                            <td style="text-align: right; padding: 0.5rem;">£180K</td>
+                            <td style="text-align: right; padding: 0.5rem;"><span style="background: #FEE2E2; color: #DC2626; padding: 0.2rem 0.5rem; border-radius: 12px;">Litigation</span></td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem;">SLA Breach Claim</td>
+                            <td style="text-align: right; padding: 0.5rem;">£85K</td>
+                            <td style="text-align: right; padding: 0.5rem;"><span style="background: #FEF3C7; color: #92400E; padding: 0.2rem 0.5rem; border-radius: 12px;">Negotiation</span></td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem;">GDPR Complaint</td>
+                            <td style="text-align: right; padding: 0.5rem;">£50K</td>
+                            <td style="text-align: right; padding: 0.5rem;"><span style="background: #E0F2FE; color: #0369A1; padding: 0.2rem 0.5rem; border-radius: 12px;">Review</span></td>
+                        </tr>
+                        <tr>
+                            <td style="padding: 0.5rem;">Vendor Contract</td>
+                            <td style="text-align: right; padding: 0.5rem;">£105K</td>
+                            <td style="text-align: right; padding: 0.5rem;"><span style="background: #FEF3C7; color: #92400E; padding: 0.2rem 0.5rem; border-radius: 12px;">Mediation</span></td>
+                        </tr>
+                    </tbody>
+                </table>
+                """, unsafe_allow_html=True)
+        
+        with col_right:
+            st.markdown('<div class="section-header">Regulatory Status</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Ofcom Compliance</span>
+                        <span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">Compliant</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>GDPR</span>
+                        <span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">Compliant</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Consumer Rights</span>
+                        <span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">Compliant</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0;">
+                        <span>Competition Law</span>
+                        <span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">Compliant</span>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Matter Lifecycle & SLA Performance</div>', unsafe_allow_html=True)
+        life_col1, life_col2 = st.columns(2)
+        
+        with life_col1:
+            st.markdown("**Matter Aging Buckets**")
+            with st.container(border=True):
+                aging_df = pd.DataFrame({
+                    'Bucket': ['0-30d', '31-60d', '61-90d', '90d+'],
+                    'Matters': [6, 5, 4, 3]
+                })
+                aging_bar = alt.Chart(aging_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Matters:Q', title='Open Matters'),
+                    y=alt.Y('Bucket:N', sort='-x', title=None),
+                    color=alt.value('#F97316'),
+                    tooltip=['Bucket:N', 'Matters:Q']
+                ).properties(height=170)
+                charts.altair_chart(aging_bar, use_container_width=True)
+        
+        with life_col2:
+            st.markdown("**SLA Compliance Trend**")
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                sla_df = pd.DataFrame({
+                    'Month': months,
+                    'Compliance': [96.8, 97.2, 97.6, 98.1, 97.9, 97.8]
+                })
+                sla_line = alt.Chart(sla_df).mark_line(point=True, color='#2563EB', strokeWidth=2).encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('Compliance:Q', title='Compliance %', scale=alt.Scale(domain=[95, 100])),
+                    tooltip=['Month:N', alt.Tooltip('Compliance:Q', format='.1f')]
+                ).properties(height=170)
+                charts.altair_chart(sla_line, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Workload & Resolution Flow</div>', unsafe_allow_html=True)
+        work_col1, work_col2 = st.columns(2)
+        
+        with work_col1:
+            st.markdown("**Case Volume by Practice**")
+            with st.container(border=True):
+                practice_df = pd.DataFrame({
+                    'Practice': ['Contracts', 'Employment', 'Regulatory', 'IP'],
+                    'Cases': [7, 5, 4, 2]
+                })
+                practice_bar = alt.Chart(practice_df).mark_bar(cornerRadiusTopLeft=6, cornerRadiusTopRight=6).encode(
+                    x=alt.X('Practice:N', title=None),
+                    y=alt.Y('Cases:Q', title='Cases'),
+                    color=alt.value('#10B981'),
+                    tooltip=['Practice:N', 'Cases:Q']
+                ).properties(height=170)
+                charts.altair_chart(practice_bar, use_container_width=True)
+        
+        with work_col2:
+            st.markdown("**Settlement Pipeline (Weekly)**")
+            with st.container(border=True):
+                weeks = ['W1', 'W2', 'W3', 'W4', 'W5', 'W6']
+                settle_df = pd.DataFrame({
+                    'Week': weeks,
+                    'Open': [12, 12, 11, 10, 9, 9],
+                    'In Negotiation': [6, 7, 6, 6, 5, 4],
+                    'Closed': [2, 3, 4, 5, 6, 7]
+                })
+                settle_area = alt.Chart(settle_df).transform_fold(
+                    ['Open', 'In Negotiation', 'Closed'],
+                    as_=['Stage', 'Count']
+                ).mark_area(opacity=0.5).encode(
+                    x=alt.X('Week:N', sort=weeks, title=None),
+                    y=alt.Y('Count:Q', title='Matters'),
+                    color=alt.Color('Stage:N', scale=alt.Scale(range=['#F97316', '#60A5FA', '#22C55E'])),
+                    tooltip=['Stage:N', 'Count:Q']
+                ).properties(height=170)
+                charts.altair_chart(settle_area, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Matter Aging & Counsel Mix</div>', unsafe_allow_html=True)
+        age_col, counsel_col = st.columns(2)
+        
+        with age_col:
+            st.markdown("**Matter Aging Buckets**")
+            with st.container(border=True):
+                aging_df = pd.DataFrame({
+                    'Bucket': ['0-30d', '31-60d', '61-90d', '90d+'],
+                    'Matters': [6, 5, 4, 3]
+                })
+                aging_bar = alt.Chart(aging_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Matters:Q', title='Matters'),
+                    y=alt.Y('Bucket:N', sort='-x', title=None),
+                    color=alt.value('#2563EB'),
+                    tooltip=['Bucket:N', 'Matters:Q']
+                ).properties(height=170)
+                charts.altair_chart(aging_bar, use_container_width=True)
+        
+        with counsel_col:
+            st.markdown("**Outside Counsel Mix**")
+            with st.container(border=True):
+                counsel_df = pd.DataFrame({
+                    'Firm': ['Alpha', 'North & Co', 'Lexis', 'Kite'],
+                    'Share': [38, 26, 20, 16]
+                })
+                counsel_arc = alt.Chart(counsel_df).mark_arc(innerRadius=50).encode(
+                    theta=alt.Theta('Share:Q', title=None),
+                    color=alt.Color(
+                        'Firm:N',
+                        legend=alt.Legend(orient='bottom', title=None, direction='horizontal'),
+                        scale=alt.Scale(range=['#60A5FA', '#34D399', '#FBBF24', '#A78BFA'])
+                    ),
+                    tooltip=['Firm:N', alt.Tooltip('Share:Q', format='.0f')]
+                ).properties(height=190)
+                charts.altair_chart(counsel_arc, use_container_width=True)
+
+    with tab_strategy:
+        st.markdown('<div class="section-header">VP Legal Strategic Priorities — Q1 2026</div>', unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #DC2626; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 1</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Resolve TechCorp</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Exposure: **£180K**
+                - Status: Active litigation
+                - Target: Settlement Q1
+                - Strategy: Mediation offer
+                """)
+        with col2:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #F59E0B; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 2</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Contract Risk Review</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - High-risk: **8** contracts
+                - Review: All by Feb
+                - Focus: Liability terms
+                - Action: Renegotiation
+                """)
+        with col3:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #10B981; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 3</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">SLA Credits < £10K</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **£12.4K** MTD
+                - Target: **<£10K** monthly
+                - Action: SLA monitoring
+                - Alert: Proactive triggers
+                """)
+        
+        st.markdown('<div class="section-header">Ask Snowflake Intelligence</div>', unsafe_allow_html=True)
+        questions = ["What is our B2B contract portfolio value?", "Show me our formal complaint trends.", "What's our SLA compliance rate and breach exposure?", "What active legal matters do we have?"]
+        sf_intel_url = "https://ai.snowflake.com/sfseeurope/pjose_aws3"
+        cols = st.columns(2)
+        for i, q in enumerate(questions):
+            with cols[i % 2]:
+                escaped_q = q.replace('"', '&quot;').replace("'", "&#39;")
+                st.markdown(f"""
+                <a href="{sf_intel_url}" target="_blank" onclick="navigator.clipboard.writeText('{escaped_q}')" style="text-decoration: none; color: inherit; display: block;">
+                    <div class="question-card">
+                        <p style="margin-bottom: 1.5rem;"><strong>Q{i+1}:</strong> "{q}"</p>
+                    </div>
+                </a>
+                """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div style="text-align: center; margin-top: 1rem; padding: 1rem; background: linear-gradient(135deg, #29B5E8 0%, #1A8BC4 100%); border-radius: 8px;">
+            <a href="{sf_intel_url}" target="_blank" style="color: white; text-decoration: none; font-weight: 600; font-size: 1rem;">
+                ❄️ Ask these questions in Snowflake Intelligence →
+            </a>
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,709 @@
+"""VP Network Operations dashboard."""
+
+import streamlit as st
+import pandas as pd
+import altair as alt
+
+from dashboard import charts
+
+
+def render_vp_network_operations():
+    import pandas as pd
+    import altair as alt
+    
+    def _spark_points(values, width=300, height=90, padding=8):
+        min_v = min(values)
+        max_v = max(values)
+        span = max(max_v - min_v, 0.0001)
+        step = (width - 2 * padding) / max(len(values) - 1, 1)
+        points = []
+        for i, v in enumerate(values):
+            x = padding + i * step
+            y = padding + (max_v - v) / span * (height - 2 * padding)
+            points.append(f"{x:.1f},{y:.1f}")
+        return " ".join(points)
+    
+    st.markdown("""
+    <div class="main-header">
+        <h1>VP Network Operations Dashboard</h1>
+        <p>Network Availability, RF Optimization, Alarm Management & SLA Delivery</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Dashboard Tabs
+    tab_overview, tab_rf, tab_strategy = st.tabs(["📊 Overview & Analysis", "📶 RF Optimization", "❄️ Snowflake Intelligence"])
+
+    with tab_overview:
+        
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['NETWORK_OPS', 'NETWORK_ALARM', 'SLA', 'RAN']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+        
+        # VP NETWORK OPS - NETWORK PULSE ANIMATION
+        st.markdown("""<div class="netops-pulse"><div class="netops-header"><div class="netops-title">📡 Network Operations Live</div><div class="netops-status"><div class="netops-dot"></div><span class="netops-status-text">All Systems Nominal</span></div></div><div class="netops-grid"><div class="netops-bars"><div class="netops-bar" style="height:45px;animation-delay:0s"></div><div class="netops-bar" style="height:55px;animation-delay:0.1s"></div><div class="netops-bar" style="height:40px;animation-delay:0.2s"></div><div class="netops-bar" style="height:60px;animation-delay:0.3s"></div><div class="netops-bar" style="height:35px;animation-delay:0.4s"></div><div class="netops-bar" style="height:50px;animation-delay:0.5s"></div><div class="netops-bar" style="height:45px;animation-delay:0.6s"></div><div class="netops-bar" style="height:55px;animation-delay:0.7s"></div><div class="netops-bar" style="height:40px;animation-delay:0.8s"></div><div class="netops-bar" style="height:48px;animation-delay:0.9s"></div></div><div class="netops-metrics"><div class="netops-metric"><div class="netops-val">99.72%</div><div class="netops-label">Availability</div></div><div class="netops-metric"><div class="netops-val">24ms</div><div class="netops-label">Latency</div></div><div class="netops-metric"><div class="netops-val">847</div><div class="netops-label">Active Alarms</div></div><div class="netops-metric"><div class="netops-val">12,847</div><div class="netops-label">Sites Online</div></div></div></div></div>""", unsafe_allow_html=True)
+        
+        
+        st.markdown('<div class="section-header">Network Health Overview</div>', unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #10B981;">
+                <div class="kpi-icon">📡</div>
+                <div class="kpi-label">Network Availability</div>
+                <div class="kpi-value">99.72%</div>
+                <div class="kpi-delta positive">↑ +0.08% MoM</div>
+            </div>
+            <div class="kpi-card" style="--accent: #29B5E8;">
+                <div class="kpi-icon">⚡</div>
+                <div class="kpi-label">Avg Latency</div>
+                <div class="kpi-value">24ms</div>
+                <div class="kpi-delta positive">↓ -3ms vs target</div>
+            </div>
+            <div class="kpi-card" style="--accent: #8B5CF6;">
+                <div class="kpi-icon">📊</div>
+                <div class="kpi-label">Throughput</div>
+                <div class="kpi-value">4.2 Gbps</div>
+                <div class="kpi-delta positive">↑ +12% MoM</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EF4444;">
+                <div class="kpi-icon">🚨</div>
+                <div class="kpi-label">Active Alarms</div>
+                <div class="kpi-value">216</div>
+                <div class="kpi-delta negative">↑ +18 vs yesterday</div>
+            </div>
+        </div>
+        
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #F59E0B;">
+                <div class="kpi-icon">🔧</div>
+                <div class="kpi-label">MTTR (Critical)</div>
+                <div class="kpi-value">42 min</div>
+                <div class="kpi-delta positive">↓ -8 min vs SLA</div>
+            </div>
+            <div class="kpi-card" style="--accent: #14B8A6;">
+                <div class="kpi-icon">📋</div>
+                <div class="kpi-label">SLA Attainment</div>
+                <div class="kpi-value">97.8%</div>
+                <div class="kpi-delta positive">Above 95% target</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EC4899;">
+                <div class="kpi-icon">🏗️</div>
+                <div class="kpi-label">Sites Monitored</div>
+                <div class="kpi-value">475</div>
+                <div class="kpi-delta neutral">100% coverage</div>
+            </div>
+            <div class="kpi-card" style="--accent: #6366F1;">
+                <div class="kpi-icon">📈</div>
+                <div class="kpi-label">Capacity Util.</div>
+                <div class="kpi-value">64%</div>
+                <div class="kpi-delta neutral">Within target</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # New: Network Availability Trend and Capacity Forecast
+        avail_col, capacity_col = st.columns(2)
+        
+        with avail_col:
+            st.markdown('<div class="section-header">Network Availability (30 Days)</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                days = list(range(1, 31))
+                avail_values = [99.8, 99.9, 99.7, 99.6, 99.8, 99.9, 99.9, 99.5, 99.7, 99.8,
+                               99.9, 99.8, 99.7, 99.9, 99.8, 99.6, 99.7, 99.8, 99.9, 99.7,
+                               99.8, 99.9, 99.8, 99.7, 99.8, 99.9, 99.7, 99.6, 99.7, 99.72]
+                avail_data = pd.DataFrame({
+                    'Day': days,
+                    'Availability': avail_values
+                })
+                
+                # Create bar chart for better visibility
+                avail_bars = alt.Chart(avail_data).mark_bar(
+                    color='#29B5E8', opacity=0.7
+                ).encode(
+                    x=alt.X('Day:O', title='Day', axis=alt.Axis(labelAngle=0, values=[1, 5, 10, 15, 20, 25, 30])),
+                    y=alt.Y(
+                        'Availability:Q',
+                        scale=alt.Scale(domain=[99.0, 100], zero=False),
+                        title='%',
+                        axis=alt.Axis(format='.2f')
+                    ),
+                    tooltip=['Day:O', alt.Tooltip('Availability:Q', format='.2f', title='Availability %')]
+                )
+                
+                # Line on top of bars
+                avail_line = alt.Chart(avail_data).mark_line(
+                    color='#0891B2', strokeWidth=2
+                ).encode(
+                    x=alt.X('Day:O'),
+                    y=alt.Y('Availability:Q', scale=alt.Scale(domain=[99.0, 100], zero=False))
+                )
+                
+                # SLA target line at 99.5%
+                target_df = pd.DataFrame({'y': [99.5]})
+                target_line = alt.Chart(target_df).mark_rule(
+                    color='#DC2626', strokeDash=[5, 5], strokeWidth=2
+                ).encode(y='y:Q')
+                
+                chart = (avail_bars + avail_line + target_line).properties(height=220)
+                charts.altair_chart(chart, use_container_width=True)
+                st.markdown('<div style="text-align: center; font-size: 0.75rem; color: #6B7280;"><span style="color: #DC2626;">---</span> 99.5% SLA Target</div>', unsafe_allow_html=True)
+        
+        with capacity_col:
+            st.markdown('<div class="section-header">Capacity Forecast</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                forecast_data = pd.DataFrame({
+                    'Month': ['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun'],
+                    'Actual': [64, 67, None, None, None, None],
+                    'Forecast': [64, 67, 71, 74, 78, 82],
+                    'Threshold': [80] * 6
+                })
+                
+                actual_line = alt.Chart(forecast_data.dropna(subset=['Actual'])).mark_line(
+                    color='#29B5E8', strokeWidth=3
+                ).encode(
+                    x=alt.X('Month:N', sort=['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun'], title=None),
+                    y=alt.Y('Actual:Q', scale=alt.Scale(domain=[50, 100]), title='Utilization %')
+                )
+                
+                forecast_line = alt.Chart(forecast_data).mark_line(
+                    color='#8B5CF6', strokeWidth=2, strokeDash=[5, 3]
+                ).encode(
+                    x=alt.X('Month:N', sort=['Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun']),
+                    y=alt.Y('Forecast:Q')
+                )
+                
+                threshold_rule = alt.Chart(forecast_data).mark_rule(color='#EF4444', strokeDash=[4, 4]).encode(
+                    y='Threshold:Q'
+                )
+                
+                charts.altair_chart((actual_line + forecast_line + threshold_rule).properties(height=160), use_container_width=True)
+                st.markdown('<div style="text-align: center; font-size: 0.75rem;"><span style="color: #29B5E8;">—</span> Actual <span style="color: #8B5CF6;">- -</span> Forecast <span style="color: #EF4444;">---</span> 80% Threshold</div>', unsafe_allow_html=True)
+
+        col_left, col_right = st.columns([1.3, 1])
+        
+        with col_left:
+            st.markdown('<div class="section-header">Alarms by Severity</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                alarm_data = pd.DataFrame({
+                    'Severity': ['Critical', 'Major', 'Minor', 'Warning'],
+                    'Count': [12, 48, 98, 58],
+                    'MTTR': [42, 68, 120, 180],
+                    'Trend': ['↓', '↓', '↑', '→']
+                })
+                
+                alarm_bars = alt.Chart(alarm_data).mark_bar(cornerRadiusTopRight=8, cornerRadiusBottomRight=8).encode(
+                    y=alt.Y('Severity:N', sort=['Critical', 'Major', 'Minor', 'Warning'], title=None),
+                    x=alt.X('Count:Q', scale=alt.Scale(domain=[0, 120]), title='Alarm Count'),
+                    color=alt.Color('Severity:N', scale=alt.Scale(
+                        domain=['Critical', 'Major', 'Minor', 'Warning'],
+                        range=['#DC2626', '#F59E0B', '#3B82F6', '#9CA3AF']
+                    ), legend=None),
+                    tooltip=['Severity:N', 'Count:Q', alt.Tooltip('MTTR:Q', title='MTTR (min)')]
+                ).properties(height=160)
+                
+                charts.altair_chart(alarm_bars, use_container_width=True)
+                
+                st.markdown("""
+                <div style="display: flex; justify-content: space-around; font-size: 0.75rem; padding: 0.5rem; background: #F9FAFB; border-radius: 8px;">
+                    <div style="text-align: center;">
+                        <div style="color: #DC2626; font-weight: 700;">12 Critical</div>
+                        <div style="color: #6B7280;">MTTR: 42min</div>
+                    </div>
+                    <div style="text-align: center;">
+                        <div style="color: #F59E0B; font-weight: 700;">48 Major</div>
+                        <div style="color: #6B7280;">MTTR: 68min</div>
+                    </div>
+                    <div style="text-align: center;">
+                        <div style="color: #3B82F6; font-weight: 700;">98 Minor</div>
+                        <div style="color: #6B7280;">MTTR: 2hrs</div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            st.markdown('<div class="section-header">Regional Performance</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <table style="width: 100%; border-collapse: collapse; font-size: 0.85rem;">
+                    <thead>
+                        <tr style="border-bottom: 2px solid #E5E7EB;">
+                            <th style="text-align: left; padding: 0.5rem; color: #6B7280;">Region</th>
+                            <th style="text-align: right; padding: 0.5rem; color: #6B7280;">Avail.</th>
+                            <th style="text-align: right; padding: 0.5rem; color: #6B7280;">Latency</th>
+                            <th style="text-align: right; padding: 0.5rem; color: #6B7280;">Alarms</th>
+                            <th style="text-align: right; padding: 0.5rem; color: #6B7280;">Status</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem; font-weight: 600;">London</td>
+                            <td style="text-align: right; padding: 0.5rem;">99.91%</td>
+                            <td style="text-align: right; padding: 0.5rem;">18ms</td>
+                            <td style="text-align: right; padding: 0.5rem;">24</td>
+                            <td style="text-align: right; padding: 0.5rem;"><span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">Healthy</span></td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem; font-weight: 600;">Manchester</td>
+                            <td style="text-align: right; padding: 0.5rem;">99.68%</td>
+                            <td style="text-align: right; padding: 0.5rem;">26ms</td>
+                            <td style="text-align: right; padding: 0.5rem;">42</td>
+                            <td style="text-align: right; padding: 0.5rem;"><span style="background: #FEF3C7; color: #92400E; padding: 0.2rem 0.5rem; border-radius: 12px;">Monitor</span></td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem; font-weight: 600;">Birmingham</td>
+                            <td style="text-align: right; padding: 0.5rem;">99.54%</td>
+                            <td style="text-align: right; padding: 0.5rem;">28ms</td>
+                            <td style="text-align: right; padding: 0.5rem;">38</td>
+                            <td style="text-align: right; padding: 0.5rem;"><span style="background: #FEF3C7; color: #92400E; padding: 0.2rem 0.5rem; border-radius: 12px;">Monitor</span></td>
+                        </tr>
+                        <tr style="border-bottom: 1px solid #F3F4F6;">
+                            <td style="padding: 0.5rem; font-weight: 600;">Leeds</td>
+                            <td style="text-align: right; padding: 0.5rem;">99.42%</td>
+                            <td style="text-align: right; padding: 0.5rem;">32ms</td>
+                            <td style="text-align: right; padding: 0.5rem;">52</td>
+                            <td style="text-align: right; padding: 0.5rem;"><span style="background: #FEE2E2; color: #DC2626; padding: 0.2rem 0.5rem; border-radius: 12px;">Attention</span></td>
+                        </tr>
+                        <tr>
+                            <td style="padding: 0.5rem; font-weight: 600;">Scotland</td>
+                            <td style="text-align: right; padding: 0.5rem;">99.78%</td>
+                            <td style="text-align: right; padding: 0.5rem;">22ms</td>
+                            <td style="text-align: right; padding: 0.5rem;">28</td>
+                            <td style="text-align: right; padding: 0.5rem;"><span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">Healthy</span></td>
+                        </tr>
+                    </tbody>
+                </table>
+                """, unsafe_allow_html=True)
+        
+        with col_right:
+            st.markdown('<div class="section-header">High Utilization Sites</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="padding: 0.6rem; border-left: 4px solid #EF4444; background: #FEE2E2; border-radius: 0 8px 8px 0; margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <div>
+                                <div style="font-weight: 600; color: #DC2626;">Leeds Central</div>
+                                <div style="font-size: 0.75rem; color: #6B7280;">Macro Cell • 1,200 users</div>
+                            </div>
+                            <span style="font-size: 1.2rem; font-weight: 700; color: #DC2626;">92%</span>
+                        </div>
+                    </div>
+                    <div style="padding: 0.6rem; border-left: 4px solid #EF4444; background: #FEE2E2; border-radius: 0 8px 8px 0; margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <div>
+                                <div style="font-weight: 600; color: #DC2626;">Manchester Arena</div>
+                                <div style="font-size: 0.75rem; color: #6B7280;">Small Cell • 890 users</div>
+                            </div>
+                            <span style="font-size: 1.2rem; font-weight: 700; color: #DC2626;">88%</span>
+                        </div>
+                    </div>
+                    <div style="padding: 0.6rem; border-left: 4px solid #F59E0B; background: #FEF3C7; border-radius: 0 8px 8px 0; margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <div>
+                                <div style="font-weight: 600; color: #92400E;">Birmingham New St</div>
+                                <div style="font-size: 0.75rem; color: #6B7280;">Macro Cell • 980 users</div>
+                            </div>
+                            <span style="font-size: 1.2rem; font-weight: 700; color: #F59E0B;">78%</span>
+                        </div>
+                    </div>
+                    <div style="padding: 0.6rem; border-left: 4px solid #F59E0B; background: #FEF3C7; border-radius: 0 8px 8px 0;">
+                        <div style="display: flex; justify-content: space-between; align-items: center;">
+                            <div>
+                                <div style="font-weight: 600; color: #92400E;">Sheffield City</div>
+                                <div style="font-size: 0.75rem; color: #6B7280;">Macro Cell • 720 users</div>
+                            </div>
+                            <span style="font-size: 1.2rem; font-weight: 700; color: #F59E0B;">74%</span>
+                        </div>
+                    </div>
+                </div>
+                <div style="margin-top: 0.75rem; padding: 0.5rem; background: #FEE2E2; border-radius: 8px; font-size: 0.75rem; text-align: center;">
+                    <span style="color: #DC2626;">⚠️ <strong>124 sites</strong> above 70% utilization threshold</span>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            st.markdown('<div class="section-header">SLA Performance</div>', unsafe_allow_html=True)
+            
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: grid; grid-template-columns: repeat(2, 1fr); gap: 0.5rem;">
+                    <div style="background: linear-gradient(135deg, #D1FAE5 0%, #A7F3D0 100%); border-radius: 12px; padding: 0.75rem; text-align: center;">
+                        <div style="font-size: 0.7rem; color: #065F46;">SLAs Met</div>
+                        <div style="font-size: 1.3rem; font-weight: 700; color: #10B981;">2,847</div>
+                        <div style="font-size: 0.65rem; color: #6B7280;">97.8%</div>
+                    </div>
+                    <div style="background: linear-gradient(135deg, #FEE2E2 0%, #FECACA 100%); border-radius: 12px; padding: 0.75rem; text-align: center;">
+                        <div style="font-size: 0.7rem; color: #DC2626;">SLAs Breached</div>
+                        <div style="font-size: 1.3rem; font-weight: 700; color: #EF4444;">64</div>
+                        <div style="font-size: 0.65rem; color: #6B7280;">2.2%</div>
+                    </div>
+                    <div style="background: linear-gradient(135deg, #E0F2FE 0%, #BAE6FD 100%); border-radius: 12px; padding: 0.75rem; text-align: center;">
+                        <div style="font-size: 0.7rem; color: #0369A1;">Credit Liability</div>
+                        <div style="font-size: 1.3rem; font-weight: 700; color: #0EA5E9;">£12.4K</div>
+                        <div style="font-size: 0.65rem; color: #6B7280;">MTD exposure</div>
+                    </div>
+                    <div style="background: linear-gradient(135deg, #FEF3C7 0%, #FDE68A 100%); border-radius: 12px; padding: 0.75rem; text-align: center;">
+                        <div style="font-size: 0.7rem; color: #92400E;">At Risk</div>
+                        <div style="font-size: 1.3rem; font-weight: 700; color: #F59E0B;">18</div>
+                        <div style="font-size: 0.65rem; color: #6B7280;">Trending to breach</div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+
+    with tab_rf:
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['RAN', 'NETWORK_OPS']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+
+        st.markdown("""
+        <div class="rf-ops-pulse">
+            <div class="rf-ops-title">📶 RF Optimization Pulse</div>
+            <div class="rf-ops-sub">Signal quality, drops, and handover performance hotspots.</div>
+            <div class="rf-ops-grid">
+                <div class="rf-ops-card">
+                    <div class="rf-ops-label">RSRP</div>
+                    <div class="rf-ops-value">-97 dBm</div>
+                    <div class="rf-ops-delta">Stable</div>
+                </div>
+                <div class="rf-ops-card">
+                    <div class="rf-ops-label">RSRQ</div>
+                    <div class="rf-ops-value">-9 dB</div>
+                    <div class="rf-ops-delta">Within target</div>
+                </div>
+                <div class="rf-ops-card">
+                    <div class="rf-ops-label">SINR</div>
+                    <div class="rf-ops-value">18 dB</div>
+                    <div class="rf-ops-delta">Monitor</div>
+                </div>
+                <div class="rf-ops-card">
+                    <div class="rf-ops-label">Call Drops</div>
+                    <div class="rf-ops-value">0.7%</div>
+                    <div class="rf-ops-delta">↓ -0.2% MoM</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown('<div class="section-header">RF Optimization KPIs</div>', unsafe_allow_html=True)
+        with st.container(border=True):
+            st.markdown("""
+            <div class="kpi-grid">
+                <div class="kpi-card" style="--accent: #0EA5E9;">
+                    <div class="kpi-icon">📶</div>
+                    <div class="kpi-label">RSRP (Signal)</div>
+                    <div class="kpi-value">-97 dBm</div>
+                    <div class="kpi-delta neutral">Stable vs baseline</div>
+                </div>
+                <div class="kpi-card" style="--accent: #22C55E;">
+                    <div class="kpi-icon">🛰️</div>
+                    <div class="kpi-label">RSRQ (Quality)</div>
+                    <div class="kpi-value">-9 dB</div>
+                    <div class="kpi-delta neutral">Within target</div>
+                </div>
+                <div class="kpi-card" style="--accent: #8B5CF6;">
+                    <div class="kpi-icon">📡</div>
+                    <div class="kpi-label">SINR</div>
+                    <div class="kpi-value">18 dB</div>
+                    <div class="kpi-delta neutral">Monitor hotspots</div>
+                </div>
+                <div class="kpi-card" style="--accent: #10B981;">
+                    <div class="kpi-icon">🔁</div>
+                    <div class="kpi-label">Handover Success</div>
+                    <div class="kpi-value">98.4%</div>
+                    <div class="kpi-delta positive">↑ +0.3% MoM</div>
+                </div>
+            </div>
+
+            <div class="kpi-grid">
+                <div class="kpi-card" style="--accent: #EF4444;">
+                    <div class="kpi-icon">📉</div>
+                    <div class="kpi-label">Call Drop Rate</div>
+                    <div class="kpi-value">0.7%</div>
+                    <div class="kpi-delta positive">↓ -0.2% MoM</div>
+                </div>
+                <div class="kpi-card" style="--accent: #F59E0B;">
+                    <div class="kpi-icon">📊</div>
+                    <div class="kpi-label">PRB Utilization</div>
+                    <div class="kpi-value">72%</div>
+                    <div class="kpi-delta neutral">Near threshold</div>
+                </div>
+                <div class="kpi-card" style="--accent: #6366F1;">
+                    <div class="kpi-icon">✅</div>
+                    <div class="kpi-label">RRC Setup</div>
+                    <div class="kpi-value">99.1%</div>
+                    <div class="kpi-delta positive">↑ +0.4% MoM</div>
+                </div>
+                <div class="kpi-card" style="--accent: #14B8A6;">
+                    <div class="kpi-icon">🧭</div>
+                    <div class="kpi-label">E-RAB Setup</div>
+                    <div class="kpi-value">98.7%</div>
+                    <div class="kpi-delta neutral">Within SLA</div>
+                </div>
+            </div>
+
+            <div style="margin-top: 0.5rem; font-size: 0.8rem; color: #6B7280;">
+                Optimization focus: improve SINR in Leeds and Manchester cells with PRB &gt;80%.
+            </div>
+            """, unsafe_allow_html=True)
+
+
+        st.markdown('<div class="section-header">RF Optimization Analytics (2026)</div>', unsafe_allow_html=True)
+        rf_cols = st.columns([1.4, 1.2, 1])
+
+        rsrp_vals = [-100, -98, -101, -97, -99, -96, -98]
+        rsrq_vals = [-11.2, -10.6, -10.9, -10.1, -10.4, -9.8, -10.2]
+        sinr_vals = [15.4, 16.2, 14.8, 17.1, 16.6, 17.8, 16.9]
+        rsrp_points = _spark_points(rsrp_vals)
+        rsrq_points = _spark_points(rsrq_vals)
+        sinr_points = _spark_points(sinr_vals)
+
+        with rf_cols[0]:
+            st.markdown('<div class="section-header">Signal Quality (Last 7 Days)</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown(f"""
+                <div class="rf-sparkline">
+                    <svg viewBox="0 0 300 90" preserveAspectRatio="none">
+                        <polyline class="rf-line a" stroke="#0EA5E9" points="{rsrp_points}"></polyline>
+                        <polyline class="rf-line b" stroke="#22C55E" points="{rsrq_points}"></polyline>
+                        <polyline class="rf-line c" stroke="#8B5CF6" points="{sinr_points}"></polyline>
+                    </svg>
+                </div>
+                <div class="rf-legend">
+                    RSRP (blue) • RSRQ (green) • SINR (purple)
+                </div>
+                """, unsafe_allow_html=True)
+
+        handover_vals = [98.1, 98.3, 98.0, 98.4, 98.6, 98.5, 98.7]
+        calldrop_vals = [0.9, 0.8, 0.95, 0.75, 0.7, 0.72, 0.68]
+        handover_points = _spark_points(handover_vals)
+        calldrop_points = _spark_points(calldrop_vals)
+
+        with rf_cols[1]:
+            st.markdown('<div class="section-header">Handover vs Call Drop</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown(f"""
+                <div class="rf-sparkline">
+                    <svg viewBox="0 0 300 90" preserveAspectRatio="none">
+                        <polyline class="rf-line a" stroke="#10B981" points="{handover_points}"></polyline>
+                        <polyline class="rf-line b" stroke="#EF4444" points="{calldrop_points}"></polyline>
+                    </svg>
+                </div>
+                <div class="rf-legend">
+                    Handover Success (green) • Call Drop Rate (red)
+                </div>
+                """, unsafe_allow_html=True)
+
+        with rf_cols[2]:
+            st.markdown('<div class="section-header">Top Call Drop Sites</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                drop_sites = pd.DataFrame({
+                    'Site': ['Leeds Central', 'Manchester Arena', 'Birmingham New St', 'Sheffield City', 'Glasgow West'],
+                    'Call Drop %': [1.4, 1.2, 1.0, 0.9, 0.85]
+                })
+                drop_chart = alt.Chart(drop_sites).mark_bar(color='#EF4444', cornerRadiusEnd=6).encode(
+                    y=alt.Y('Site:N', sort='-x', title=None),
+                    x=alt.X('Call Drop %:Q', title=None),
+                    tooltip=['Site:N', alt.Tooltip('Call Drop %:Q', format='.2f')]
+                ).properties(height=160)
+                charts.altair_chart(drop_chart, use_container_width=True)
+
+        rf_row_left, rf_row_right = st.columns([1.2, 1])
+        with rf_row_left:
+            st.markdown('<div class="section-header">Correlation: Call Drop vs RSRP</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                corr_data = pd.DataFrame({
+                    'Site': ['Leeds Central', 'Manchester Arena', 'Birmingham New St', 'Sheffield City', 'Glasgow West', 'London East', 'Liverpool Dock'],
+                    'RSRP': [-106, -103, -101, -100, -98, -96, -97],
+                    'Call Drop %': [1.5, 1.2, 1.0, 0.9, 0.8, 0.7, 0.75]
+                })
+                corr_chart = alt.Chart(corr_data).mark_circle(size=90, color='#EF4444', opacity=0.7).encode(
+                    x=alt.X('RSRP:Q', title='RSRP (dBm)'),
+                    y=alt.Y('Call Drop %:Q', title='Call Drop Rate %'),
+                    tooltip=['Site:N', 'RSRP:Q', alt.Tooltip('Call Drop %:Q', format='.2f')]
+                ).properties(height=200)
+                charts.altair_chart(corr_chart, use_container_width=True)
+
+        with rf_row_right:
+            st.markdown('<div class="section-header">SINR & PRB Hotspots</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                hotspot_data = pd.DataFrame({
+                    'Cell': ['Leeds C-12', 'Manchester M-07', 'Birmingham B-03', 'Sheffield S-09', 'Liverpool L-05'],
+                    'SINR (dB)': [8.4, 9.1, 7.8, 8.9, 9.4],
+                    'PRB Util %': [88, 86, 91, 84, 82]
+                })
+                hotspot_chart = alt.Chart(hotspot_data).mark_bar(color='#F59E0B', cornerRadiusEnd=6).encode(
+                    y=alt.Y('Cell:N', sort='-x', title=None),
+                    x=alt.X('PRB Util %:Q', title='PRB Utilization %'),
+                    tooltip=['Cell:N', 'SINR (dB):Q', 'PRB Util %:Q']
+                ).properties(height=200)
+                charts.altair_chart(hotspot_chart, use_container_width=True)
+
+    with tab_strategy:
+        st.markdown("""
+        <div class="net-ai-pulse">
+            <div class="net-ai-header">
+                <div class="net-ai-title">❄️ Snowflake Intelligence Pulse</div>
+                <div class="net-ai-tag">AI LIVE</div>
+            </div>
+            <div class="net-ai-grid">
+                <div class="net-ai-card">
+                    <div class="net-ai-label">Availability</div>
+                    <div class="net-ai-value">99.72%</div>
+                    <div class="net-ai-sub">Target 99.9%</div>
+                </div>
+                <div class="net-ai-card">
+                    <div class="net-ai-label">Latency</div>
+                    <div class="net-ai-value">24 ms</div>
+                    <div class="net-ai-sub">Target &lt; 20 ms</div>
+                </div>
+                <div class="net-ai-card">
+                    <div class="net-ai-label">Call Drops</div>
+                    <div class="net-ai-value">0.7%</div>
+                    <div class="net-ai-sub">↓ -0.2% MoM</div>
+                </div>
+                <div class="net-ai-card">
+                    <div class="net-ai-label">Sites at Risk</div>
+                    <div class="net-ai-value">124</div>
+                    <div class="net-ai-sub">>70% utilization</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">AI Executive Summary</div>', unsafe_allow_html=True)
+        if st.session_state.get('sf_highlights', True):
+            st.info("❄️ **Powered by Snowflake Cortex AI** — Summary synthesized from availability, RF, and alarm telemetry.")
+        
+        with st.container(border=True):
+            st.markdown("""
+            **Executive Summary (Q1 2026):**
+            - Network availability holds at **99.72%**, with localized alarms in Leeds and Manchester.
+            - RF optimization shows improving SINR in priority cells, but **124 sites** remain above 70% utilization.
+            - MTTR improved to **42 min**, trending toward the 30‑minute target.
+            """)
+        
+        st.markdown('<div class="section-header">Signals & Insights</div>', unsafe_allow_html=True)
+        insight_cols = st.columns(3)
+        with insight_cols[0]:
+            st.markdown('<div class="section-header">Top Insights</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                - **5G** delivers 4.2x faster downloads vs 4G
+                - **SINR** improving in Manchester hotspots
+                - **SLA attainment** at 97.8%
+                """)
+        with insight_cols[1]:
+            st.markdown('<div class="section-header">Risk Signals</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                - **124 sites** above 70% utilization
+                - **Call drops** elevated in Leeds Central
+                - **Critical alarms** at 12 sites
+                """)
+        with insight_cols[2]:
+            st.markdown('<div class="section-header">Growth Signals</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                - **Capacity upgrades** scheduled for top 20 sites
+                - **Handover success** at 98.4%
+                - **RF tuning** coverage expanding weekly
+                """)
+        
+        st.markdown('<div class="section-header">AI-Powered Strategic Recommendations</div>', unsafe_allow_html=True)
+        action_cols = st.columns(3)
+        with action_cols[0]:
+            with st.container(border=True):
+                st.markdown("""
+                - **Lift availability** with targeted Leeds upgrades
+                - Automate P1 incident routing
+                """)
+        with action_cols[1]:
+            with st.container(border=True):
+                st.markdown("""
+                - **Reduce MTTR** via AIOps auto-triage
+                - Standardize playbooks across regions
+                """)
+        with action_cols[2]:
+            with st.container(border=True):
+                st.markdown("""
+                - **Expand capacity** on top 20 congested sites
+                - Prioritize PRB >80% cells
+                """)
+        
+        st.markdown('<div class="section-header">VP Network Operations Strategic Priorities — Q1 2026</div>', unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #DC2626; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 1</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">99.9% Availability</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **99.72%** uptime
+                - Gap: **0.18%** to target
+                - Focus: Leeds region upgrades
+                - Investment: **£1.2M** capex
+                """)
+        with col2:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #F59E0B; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 2</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">MTTR Reduction</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Target: **30 min** for P1
+                - Current: **42 min** MTTR
+                - Action: AIOps automation
+                - Launch: February 2026
+                """)
+        with col3:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #10B981; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 3</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Capacity Planning</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Alert: **124 sites** >70%
+                - Action: Expand top 20 sites
+                - Budget: **£3.8M** approved
+                - Timeline: Q1-Q2 2026
+                """)
+        
+        st.markdown('<div class="section-header">Ask Snowflake Intelligence</div>', unsafe_allow_html=True)
+        
+        questions = [
+            "Show me the current health of our network - availability, latency, and throughput.",
+            "Show me network alarms by severity with MTTR and alarm duration.",
+            "How is our network performing by region?",
+            "Which network elements have utilization above 60%?",
+            "Show me RF optimization KPIs - RSRP, RSRQ, SINR, handover success, and call drop rate.",
+            "Are we meeting our SLAs? Show me breaches and credit liability."
+        ]
+        
+        sf_intel_url = "https://ai.snowflake.com/sfseeurope/pjose_aws3"
+        cols = st.columns(2)
+        for i, q in enumerate(questions):
+            with cols[i % 2]:
+                escaped_q = q.replace('"', '&quot;').replace("'", "&#39;")
+                st.markdown(f"""
+                <a href="{sf_intel_url}" target="_blank" onclick="navigator.clipboard.writeText('{escaped_q}')" style="text-decoration: none; color: inherit; display: block;">
+                    <div class="question-card">
+                        <p style="margin-bottom: 1.5rem;"><strong>Q{i+1}:</strong> "{q}"</p>
+                    </div>
+                </a>
+                """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div style="text-align: center; margin-top: 1rem; padding: 1rem; background: linear-gradient(135deg, #29B5E8 0%, #1A8BC4 100%); border-radius: 8px;">
+            <a href="{sf_intel_url}" target="_blank" style="color: white; text-decoration: none; font-weight: 600; font-size: 1rem;">
+                ❄️ Ask these questions in Snowflake Intelligence →
+            </a>
+        </div>
+        """, unsafe_allow_html=True)
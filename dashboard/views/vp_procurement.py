@@ -0,0 +1,945 @@
+"""VP Procurement dashboard."""
+
+import streamlit as st
+import pandas as pd
+import altair as alt
+
+from dashboard import charts
+
+
+def render_vp_procurement():
+    import pandas as pd
+    import altair as alt
+    
+    st.markdown("""
+    <div class="main-header">
+        <h1>VP Procurement Dashboard</h1>
+        <p>Vendor Spend, Supplier Management & Cost Optimization</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Dashboard Tabs
+    tab_overview, tab_ops, tab_strategy = st.tabs(["📊 Overview & Analysis", "🧾 Procurement Operations", "❄️ Snowflake Intelligence"])
+
+    with tab_overview:
+        
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['FINANCE', 'ASSET']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+        
+        # VP PROCUREMENT - SPEND TRACKER ANIMATION
+        st.markdown("""<div class="proc-spend"><div class="proc-header"><div class="proc-title">💰 Procurement Spend Tracker</div><div class="proc-total"><div class="proc-total-val">£108M</div><div class="proc-total-label">Annual Spend</div></div></div><div class="proc-bars"><div class="proc-bar-item"><span class="proc-bar-label">Network Infra</span><div class="proc-bar-track"><div class="proc-bar-fill network"></div></div><span class="proc-bar-val">£42M</span></div><div class="proc-bar-item"><span class="proc-bar-label">IT Systems</span><div class="proc-bar-track"><div class="proc-bar-fill it"></div></div><span class="proc-bar-val">£28M</span></div><div class="proc-bar-item"><span class="proc-bar-label">Services</span><div class="proc-bar-track"><div class="proc-bar-fill services"></div></div><span class="proc-bar-val">£24M</span></div><div class="proc-bar-item"><span class="proc-bar-label">Other</span><div class="proc-bar-track"><div class="proc-bar-fill other"></div></div><span class="proc-bar-val">£14M</span></div></div><div class="proc-stats"><div class="proc-stat"><div class="proc-stat-icon">🤝</div><div class="proc-stat-val">248</div><div class="proc-stat-label">Vendors</div></div><div class="proc-stat"><div class="proc-stat-icon">📋</div><div class="proc-stat-val">42</div><div class="proc-stat-label">Pending</div></div><div class="proc-stat"><div class="proc-stat-icon">💵</div><div class="proc-stat-val">£2.4M</div><div class="proc-stat-label">Savings YTD</div></div><div class="proc-stat"><div class="proc-stat-icon">📊</div><div class="proc-stat-val">94%</div><div class="proc-stat-label">On Contract</div></div></div></div>""", unsafe_allow_html=True)
+        
+        
+        st.markdown('<div class="section-header">Procurement Overview</div>', unsafe_allow_html=True)
+        st.markdown("""
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #29B5E8;">
+                <div class="kpi-icon">💰</div>
+                <div class="kpi-label">Annual Spend</div>
+                <div class="kpi-value">£108M</div>
+                <div class="kpi-delta positive">YTD tracked</div>
+            </div>
+            <div class="kpi-card" style="--accent: #10B981;">
+                <div class="kpi-icon">🤝</div>
+                <div class="kpi-label">Active Vendors</div>
+                <div class="kpi-value">248</div>
+                <div class="kpi-delta positive">Under contract</div>
+            </div>
+            <div class="kpi-card" style="--accent: #F59E0B;">
+                <div class="kpi-icon">📋</div>
+                <div class="kpi-label">Pending Approvals</div>
+                <div class="kpi-value">42</div>
+                <div class="kpi-delta negative">£2.4M value</div>
+            </div>
+            <div class="kpi-card" style="--accent: #8B5CF6;">
+                <div class="kpi-icon">💹</div>
+                <div class="kpi-label">Savings Identified</div>
+                <div class="kpi-value">£2.1M</div>
+                <div class="kpi-delta positive">Optimization opp.</div>
+            </div>
+        </div>
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #14B8A6;">
+                <div class="kpi-icon">🏗️</div>
+                <div class="kpi-label">Network/Tech</div>
+                <div class="kpi-value">70%</div>
+                <div class="kpi-delta positive">£75.6M spend</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EC4899;">
+                <div class="kpi-icon">🏢</div>
+                <div class="kpi-label">Facilities</div>
+                <div class="kpi-value">15%</div>
+                <div class="kpi-delta positive">£16.2M spend</div>
+            </div>
+            <div class="kpi-card" style="--accent: #6366F1;">
+                <div class="kpi-icon">💼</div>
+                <div class="kpi-label">Professional Svcs</div>
+                <div class="kpi-value">10%</div>
+                <div class="kpi-delta positive">£10.8M spend</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EF4444;">
+                <div class="kpi-icon">⚠️</div>
+                <div class="kpi-label">Emergency POs</div>
+                <div class="kpi-value">8%</div>
+                <div class="kpi-delta negative">Above 5% target</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # New: Spend Trend and Contract Renewals
+        spend_trend_col, renewal_col = st.columns(2)
+        
+        with spend_trend_col:
+            st.markdown('<div class="section-header">Spend Trend (12 Months)</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <svg viewBox="0 0 400 140" style="width: 100%; height: 160px;">
+                    <!-- Network line (blue) - values 6.2-6.6 scaled -->
+                    <polyline points="20,35 50,25 80,40 110,15 140,30 170,25 200,35 230,15 260,25 290,10 320,15 350,30" 
+                        fill="none" stroke="#29B5E8" stroke-width="2"/>
+                    <!-- Facilities line (green) - values 1.3-1.4 scaled -->
+                    <polyline points="20,95 50,90 80,95 110,90 140,95 170,90 200,95 230,90 260,95 290,90 320,90 350,92" 
+                        fill="none" stroke="#10B981" stroke-width="2"/>
+                    <!-- Services line (amber) - values 0.8-0.92 scaled -->
+                    <polyline points="20,115 50,110 80,112 110,110 140,111 170,108 200,112 230,110 260,111 290,108 320,110 350,110" 
+                        fill="none" stroke="#F59E0B" stroke-width="2"/>
+                    <!-- X-axis labels -->
+                    <text x="20" y="135" font-size="8" fill="#6B7280" text-anchor="middle">Feb</text>
+                    <text x="80" y="135" font-size="8" fill="#6B7280" text-anchor="middle">Apr</text>
+                    <text x="140" y="135" font-size="8" fill="#6B7280" text-anchor="middle">Jun</text>
+                    <text x="200" y="135" font-size="8" fill="#6B7280" text-anchor="middle">Aug</text>
+                    <text x="260" y="135" font-size="8" fill="#6B7280" text-anchor="middle">Oct</text>
+                    <text x="320" y="135" font-size="8" fill="#6B7280" text-anchor="middle">Dec</text>
+                </svg>
+                <div style="display: flex; justify-content: center; gap: 1rem; font-size: 0.75rem;">
+                    <span><span style="color: #29B5E8;">—</span> Network (£6.3M)</span>
+                    <span><span style="color: #10B981;">—</span> Facilities (£1.4M)</span>
+                    <span><span style="color: #F59E0B;">—</span> Services (£0.9M)</span>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with renewal_col:
+            st.markdown('<div class="section-header">Contract Renewals (Next 6 Mo)</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; justify-content: space-around; align-items: flex-end; height: 140px; padding: 1rem 0;">
+                    <div style="text-align: center; flex: 1;">
+                        <div style="background: #EF4444; width: 80px; height: 100px; margin: 0 auto; border-radius: 6px 6px 0 0;"></div>
+                        <div style="font-weight: 600; margin-top: 0.5rem;">£28.4M</div>
+                        <div style="font-size: 0.8rem; color: #6B7280;">Q1 2026</div>
+                        <div style="font-size: 0.7rem; color: #9CA3AF;">8 contracts</div>
+                    </div>
+                    <div style="text-align: center; flex: 1;">
+                        <div style="background: #F59E0B; width: 80px; height: 64px; margin: 0 auto; border-radius: 6px 6px 0 0;"></div>
+                        <div style="font-weight: 600; margin-top: 0.5rem;">£18.2M</div>
+                        <div style="font-size: 0.8rem; color: #6B7280;">Q2 2026</div>
+                        <div style="font-size: 0.7rem; color: #9CA3AF;">12 contracts</div>
+                    </div>
+                </div>
+                <div style="text-align: center; font-size: 0.75rem; color: #DC2626;"><strong>Ericsson</strong> renewal (£24.2M) in March 2026</div>
+                """, unsafe_allow_html=True)
+        
+        col_left, col_right = st.columns([1.3, 1])
+        
+        with col_left:
+            st.markdown('<div class="section-header">Top Vendors by Spend</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Ericsson</span><span style="font-weight: 600;">£24.2M (12)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #29B5E8; width: 100%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Nokia</span><span style="font-weight: 600;">£18.4M (8)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #29B5E8; width: 76%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Cisco</span><span style="font-weight: 600;">£12.8M (15)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #29B5E8; width: 53%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>AWS</span><span style="font-weight: 600;">£8.4M (6)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #29B5E8; width: 35%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div>
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Microsoft</span><span style="font-weight: 600;">£6.2M (18)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #29B5E8; width: 26%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col_right:
+            st.markdown('<div class="section-header">Savings Opportunities</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Vendor Consolidation</span>
+                        <span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">£840K</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Contract Renegotiation</span>
+                        <span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">£620K</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Volume Discounts</span>
+                        <span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">£420K</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0;">
+                        <span>Process Efficiency</span>
+                        <span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">£220K</span>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Supplier & Process Signals</div>', unsafe_allow_html=True)
+        sig_col1, sig_col2 = st.columns(2)
+        
+        with sig_col1:
+            st.markdown("**Supplier Performance Score**")
+            with st.container(border=True):
+                perf_df = pd.DataFrame({
+                    'Supplier': ['Ericsson', 'Nokia', 'Cisco', 'AWS'],
+                    'Score': [92, 88, 85, 90]
+                })
+                perf_bar = alt.Chart(perf_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Score:Q', title='Score'),
+                    y=alt.Y('Supplier:N', sort='-x', title=None),
+                    color=alt.value('#10B981'),
+                    tooltip=['Supplier:N', 'Score:Q']
+                ).properties(height=180)
+                charts.altair_chart(perf_bar, use_container_width=True)
+        
+        with sig_col2:
+            st.markdown("**PO Cycle Time (Days)**")
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                cycle_df = pd.DataFrame({
+                    'Month': months,
+                    'Days': [12.4, 11.8, 11.2, 10.6, 10.2, 9.6]
+                })
+                cycle_line = alt.Chart(cycle_df).mark_line(point=True, color='#3B82F6', strokeWidth=2).encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('Days:Q', title='Days'),
+                    tooltip=['Month:N', alt.Tooltip('Days:Q', format='.1f')]
+                ).properties(height=180)
+                charts.altair_chart(cycle_line, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Risk & Compliance Signals</div>', unsafe_allow_html=True)
+        risk_col1, risk_col2 = st.columns(2)
+        
+        with risk_col1:
+            st.markdown("**Contract Compliance Rate**")
+            with st.container(border=True):
+                comp_df = pd.DataFrame({
+                    'Month': ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan'],
+                    'Compliance': [91, 92, 93, 94, 93, 94]
+                })
+                comp_line = alt.Chart(comp_df).mark_line(point=True, color='#14B8A6', strokeWidth=2).encode(
+                    x=alt.X('Month:N', sort=['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan'], title=None),
+                    y=alt.Y('Compliance:Q', title='Compliance %', scale=alt.Scale(domain=[88, 100])),
+                    tooltip=['Month:N', alt.Tooltip('Compliance:Q', format='.0f')]
+                ).properties(height=180)
+                charts.altair_chart(comp_line, use_container_width=True)
+        
+        with risk_col2:
+            st.markdown("**Supplier Risk Tier Mix**")
+            with st.container(border=True):
+                risk_df = pd.DataFrame({
+                    'Tier': ['Tier 1', 'Tier 2', 'Tier 3'],
+                    'Share': [58, 28, 14]
+                })
+                risk_arc = alt.Chart(risk_df).mark_arc(innerRadius=50).encode(
+                    theta=alt.Theta('Share:Q', title=None),
+                    color=alt.Color('Tier:N', legend=alt.Legend(orient='bottom', title=None)),
+                    tooltip=['Tier:N', alt.Tooltip('Share:Q', format='.0f')]
+                ).properties(height=190)
+                charts.altair_chart(risk_arc, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Spend Variance & Concentration</div>', unsafe_allow_html=True)
+        var_col1, var_col2 = st.columns(2)
+        
+        with var_col1:
+            st.markdown("**Category Spend Variance**")
+            with st.container(border=True):
+                var_df = pd.DataFrame({
+                    'Category': ['Network', 'IT', 'Facilities', 'Services'],
+                    'Variance': [4.2, -1.6, 2.1, -0.8]
+                })
+                var_bar = alt.Chart(var_df).mark_bar(cornerRadiusTopLeft=6, cornerRadiusTopRight=6).encode(
+                    x=alt.X('Category:N', title=None),
+                    y=alt.Y('Variance:Q', title='Variance %'),
+                    color=alt.condition(
+                        alt.datum.Variance >= 0,
+                        alt.value('#EF4444'),
+                        alt.value('#10B981')
+                    ),
+                    tooltip=['Category:N', alt.Tooltip('Variance:Q', format='.1f')]
+                ).properties(height=180)
+                charts.altair_chart(var_bar, use_container_width=True)
+        
+        with var_col2:
+            st.markdown("**Vendor Concentration Index**")
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                hhi_df = pd.DataFrame({
+                    'Month': months,
+                    'HHI': [0.28, 0.29, 0.30, 0.31, 0.30, 0.29]
+                })
+                hhi_line = alt.Chart(hhi_df).mark_line(point=True, color='#6366F1', strokeWidth=2).encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('HHI:Q', title='HHI'),
+                    tooltip=['Month:N', alt.Tooltip('HHI:Q', format='.2f')]
+                ).properties(height=180)
+                charts.altair_chart(hhi_line, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Invoice & Payment Accuracy</div>', unsafe_allow_html=True)
+        inv_col1, inv_col2 = st.columns(2)
+        
+        with inv_col1:
+            st.markdown("**Invoice Exception Rate**")
+            with st.container(border=True):
+                exc_df = pd.DataFrame({
+                    'Month': ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan'],
+                    'Rate': [4.1, 3.8, 3.5, 3.2, 3.0, 2.8]
+                })
+                exc_line = alt.Chart(exc_df).mark_line(point=True, color='#F59E0B', strokeWidth=2).encode(
+                    x=alt.X('Month:N', sort=['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan'], title=None),
+                    y=alt.Y('Rate:Q', title='Exception %'),
+                    tooltip=['Month:N', alt.Tooltip('Rate:Q', format='.1f')]
+                ).properties(height=180)
+                charts.altair_chart(exc_line, use_container_width=True)
+        
+        with inv_col2:
+            st.markdown("**Payment Timeliness**")
+            with st.container(border=True):
+                pay_df = pd.DataFrame({
+                    'Status': ['On Time', '1-5 Days', '6-15 Days', '15+ Days'],
+                    'Share': [72, 16, 8, 4]
+                })
+                pay_bar = alt.Chart(pay_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Share:Q', title='Share %'),
+                    y=alt.Y('Status:N', sort='-x', title=None),
+                    color=alt.value('#3B82F6'),
+                    tooltip=['Status:N', alt.Tooltip('Share:Q', format='.0f')]
+                ).properties(height=180)
+                charts.altair_chart(pay_bar, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Diversity & Discount Signals</div>', unsafe_allow_html=True)
+        div_col1, div_col2 = st.columns(2)
+        
+        with div_col1:
+            st.markdown("**Supplier Diversity Mix**")
+            with st.container(border=True):
+                div_df = pd.DataFrame({
+                    'Type': ['SME', 'Minority-owned', 'Women-owned', 'Other'],
+                    'Share': [46, 18, 14, 22]
+                })
+                div_arc = alt.Chart(div_df).mark_arc(innerRadius=50).encode(
+                    theta=alt.Theta('Share:Q', title=None),
+                    color=alt.Color('Type:N', legend=alt.Legend(orient='bottom', title=None)),
+                    tooltip=['Type:N', alt.Tooltip('Share:Q', format='.0f')]
+                ).properties(height=190)
+                charts.altair_chart(div_arc, use_container_width=True)
+        
+        with div_col2:
+            st.markdown("**Early Payment Discount Uptake**")
+            with st.container(border=True):
+                disc_df = pd.DataFrame({
+                    'Month': ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan'],
+                    'Uptake': [22, 24, 26, 28, 29, 31]
+                })
+                disc_line = alt.Chart(disc_df).mark_line(point=True, color='#0EA5E9', strokeWidth=2).encode(
+                    x=alt.X('Month:N', sort=['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan'], title=None),
+                    y=alt.Y('Uptake:Q', title='Uptake %'),
+                    tooltip=['Month:N', alt.Tooltip('Uptake:Q', format='.0f')]
+                ).properties(height=180)
+                charts.altair_chart(disc_line, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Budget & Forecast Signals</div>', unsafe_allow_html=True)
+        bud_col1, bud_col2 = st.columns(2)
+        
+        with bud_col1:
+            st.markdown("**Budget vs Actual Spend**")
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                bud_df = pd.DataFrame({
+                    'Month': months,
+                    'Budget': [8.1, 8.0, 8.2, 8.1, 8.3, 8.4],
+                    'Actual': [8.2, 8.1, 8.3, 8.4, 8.5, 8.6]
+                })
+                bud_line = alt.Chart(bud_df).transform_fold(
+                    ['Budget', 'Actual'],
+                    as_=['Type', 'Value']
+                ).mark_line(point=True).encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('Value:Q', title='£M'),
+                    color=alt.Color('Type:N', scale=alt.Scale(range=['#10B981', '#EF4444'])),
+                    tooltip=['Month:N', 'Type:N', alt.Tooltip('Value:Q', format='.1f')]
+                ).properties(height=180)
+                charts.altair_chart(bud_line, use_container_width=True)
+        
+        with bud_col2:
+            st.markdown("**Forecast Accuracy**")
+            with st.container(border=True):
+                acc_df = pd.DataFrame({
+                    'Month': ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan'],
+                    'Accuracy': [92, 93, 94, 95, 94, 95]
+                })
+                acc_bar = alt.Chart(acc_df).mark_bar(cornerRadiusTopLeft=6, cornerRadiusTopRight=6).encode(
+                    x=alt.X('Month:N', title=None, sort=['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']),
+                    y=alt.Y('Accuracy:Q', title='Accuracy %'),
+                    color=alt.value('#10B981'),
+                    tooltip=['Month:N', alt.Tooltip('Accuracy:Q', format='.0f')]
+                ).properties(height=180)
+                charts.altair_chart(acc_bar, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Supplier Diversity by Region</div>', unsafe_allow_html=True)
+        divr_col1, divr_col2 = st.columns(2)
+        
+        with divr_col1:
+            st.markdown("**Diversity Share by Region**")
+            with st.container(border=True):
+                region_df = pd.DataFrame({
+                    'Region': ['UK', 'EU', 'US', 'APAC'],
+                    'Diverse': [32, 28, 24, 26],
+                    'Non-Diverse': [68, 72, 76, 74]
+                })
+                region_long = region_df.melt('Region', var_name='Type', value_name='Share')
+                region_bar = alt.Chart(region_long).mark_bar().encode(
+                    x=alt.X('Region:N', title=None),
+                    y=alt.Y('Share:Q', title='Share %', stack='normalize'),
+                    color=alt.Color('Type:N', scale=alt.Scale(range=['#22C55E', '#CBD5F5']), legend=alt.Legend(orient='bottom', title=None)),
+                    tooltip=['Region:N', 'Type:N', alt.Tooltip('Share:Q', format='.0f')]
+                ).properties(height=180)
+                charts.altair_chart(region_bar, use_container_width=True)
+        
+        with divr_col2:
+            st.markdown("**Diverse Supplier Growth**")
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                div_growth_df = pd.DataFrame({
+                    'Month': months,
+                    'Suppliers': [82, 85, 88, 90, 92, 95]
+                })
+                div_growth_line = alt.Chart(div_growth_df).mark_line(point=True, color='#16A34A', strokeWidth=2).encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('Suppliers:Q', title='Suppliers'),
+                    tooltip=['Month:N', 'Suppliers:Q']
+                ).properties(height=180)
+                charts.altair_chart(div_growth_line, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Payment Terms Distribution</div>', unsafe_allow_html=True)
+        terms_col1, terms_col2 = st.columns(2)
+        
+        with terms_col1:
+            st.markdown("**Terms Mix**")
+            with st.container(border=True):
+                terms_df = pd.DataFrame({
+                    'Terms': ['Net 15', 'Net 30', 'Net 45', 'Net 60'],
+                    'Share': [18, 44, 26, 12]
+                })
+                terms_bar = alt.Chart(terms_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Share:Q', title='Share %'),
+                    y=alt.Y('Terms:N', sort='-x', title=None),
+                    color=alt.value('#0EA5E9'),
+                    tooltip=['Terms:N', alt.Tooltip('Share:Q', format='.0f')]
+                ).properties(height=180)
+                charts.altair_chart(terms_bar, use_container_width=True)
+        
+        with terms_col2:
+            st.markdown("**Average Days Payable**")
+            with st.container(border=True):
+                dpo_df = pd.DataFrame({
+                    'Month': ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan'],
+                    'DPO': [33, 34, 35, 36, 35, 36]
+                })
+                dpo_line = alt.Chart(dpo_df).mark_line(point=True, color='#2563EB', strokeWidth=2).encode(
+                    x=alt.X('Month:N', sort=['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan'], title=None),
+                    y=alt.Y('DPO:Q', title='Days'),
+                    tooltip=['Month:N', 'DPO:Q']
+                ).properties(height=180)
+                charts.altair_chart(dpo_line, use_container_width=True)
+        
+
+    with tab_ops:
+        st.markdown("""
+        <div class="proc-ops-pulse">
+            <div class="proc-ops-header">
+                <div class="proc-ops-title">🧾 Procurement Ops Pulse</div>
+                <div class="proc-ops-tag">LIVE</div>
+            </div>
+            <div class="proc-ops-grid">
+                <div class="proc-ops-card">
+                    <div class="proc-ops-label">Approvals SLA</div>
+                    <div class="proc-ops-value">93%</div>
+                    <div class="proc-ops-delta">+4% MoM</div>
+                </div>
+                <div class="proc-ops-card">
+                    <div class="proc-ops-label">Pending PO Value</div>
+                    <div class="proc-ops-value">£2.4M</div>
+                    <div class="proc-ops-delta">42 requests</div>
+                </div>
+                <div class="proc-ops-card">
+                    <div class="proc-ops-label">Savings Realized</div>
+                    <div class="proc-ops-value">£1.6M</div>
+                    <div class="proc-ops-delta">YTD</div>
+                </div>
+                <div class="proc-ops-card">
+                    <div class="proc-ops-label">Emergency POs</div>
+                    <div class="proc-ops-value">8%</div>
+                    <div class="proc-ops-delta">Above target</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Approval & Sourcing Flow</div>', unsafe_allow_html=True)
+        flow_col1, flow_col2 = st.columns(2)
+        
+        with flow_col1:
+            st.markdown("**Approval Backlog by Stage**")
+            with st.container(border=True):
+                backlog_df = pd.DataFrame({
+                    'Stage': ['Intake', 'Finance', 'Legal', 'Final'],
+                    'Count': [14, 12, 9, 7]
+                })
+                backlog_bar = alt.Chart(backlog_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Count:Q', title='Requests'),
+                    y=alt.Y('Stage:N', sort='-x', title=None),
+                    color=alt.value('#22C55E'),
+                    tooltip=['Stage:N', 'Count:Q']
+                ).properties(height=180)
+                charts.altair_chart(backlog_bar, use_container_width=True)
+        
+        with flow_col2:
+            st.markdown("**Sourcing Cycle (Days)**")
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                sourcing_df = pd.DataFrame({
+                    'Month': months,
+                    'Days': [28, 26, 24, 23, 22, 21]
+                })
+                sourcing_line = alt.Chart(sourcing_df).mark_line(point=True, color='#059669', strokeWidth=2).encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('Days:Q', title='Days'),
+                    tooltip=['Month:N', alt.Tooltip('Days:Q', format='.0f')]
+                ).properties(height=180)
+                charts.altair_chart(sourcing_line, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Vendor Performance & Risk Ops</div>', unsafe_allow_html=True)
+        ops_col1, ops_col2 = st.columns(2)
+        
+        with ops_col1:
+            st.markdown("**Vendor SLA Adherence**")
+            with st.container(border=True):
+                sla_df = pd.DataFrame({
+                    'Vendor': ['Ericsson', 'Nokia', 'Cisco', 'AWS'],
+                    'SLA': [96, 94, 92, 95]
+                })
+                sla_bar = alt.Chart(sla_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('SLA:Q', title='SLA %'),
+                    y=alt.Y('Vendor:N', sort='-x', title=None),
+                    color=alt.value('#3B82F6'),
+                    tooltip=['Vendor:N', alt.Tooltip('SLA:Q', format='.0f')]
+                ).properties(height=180)
+                charts.altair_chart(sla_bar, use_container_width=True)
+        
+        with ops_col2:
+            st.markdown("**Contract Renewal Risk (90 Days)**")
+            with st.container(border=True):
+                risk_df = pd.DataFrame({
+                    'Vendor': ['Ericsson', 'Nokia', 'Cisco', 'AWS'],
+                    'Risk': [72, 38, 44, 30]
+                })
+                risk_bar = alt.Chart(risk_df).mark_bar(cornerRadiusTopLeft=6, cornerRadiusTopRight=6).encode(
+                    x=alt.X('Vendor:N', title=None),
+                    y=alt.Y('Risk:Q', title='Risk %'),
+                    color=alt.value('#EF4444'),
+                    tooltip=['Vendor:N', alt.Tooltip('Risk:Q', format='.0f')]
+                ).properties(height=180)
+                charts.altair_chart(risk_bar, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Savings Pipeline</div>', unsafe_allow_html=True)
+        save_col1, save_col2 = st.columns(2)
+        
+        with save_col1:
+            st.markdown("**Savings by Initiative**")
+            with st.container(border=True):
+                save_df = pd.DataFrame({
+                    'Initiative': ['Consolidation', 'Renegotiation', 'Volume', 'Process'],
+                    'Savings': [0.84, 0.62, 0.42, 0.22]
+                })
+                save_bar = alt.Chart(save_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Savings:Q', title='Savings (£M)'),
+                    y=alt.Y('Initiative:N', sort='-x', title=None),
+                    color=alt.value('#F59E0B'),
+                    tooltip=['Initiative:N', alt.Tooltip('Savings:Q', format='.2f')]
+                ).properties(height=180)
+                charts.altair_chart(save_bar, use_container_width=True)
+        
+        with save_col2:
+            st.markdown("**Savings Run-Rate (Monthly)**")
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                run_df = pd.DataFrame({
+                    'Month': months,
+                    'Savings': [0.12, 0.16, 0.2, 0.22, 0.26, 0.3]
+                })
+                run_line = alt.Chart(run_df).mark_line(point=True, color='#F59E0B', strokeWidth=2).encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('Savings:Q', title='£M'),
+                    tooltip=['Month:N', alt.Tooltip('Savings:Q', format='.2f')]
+                ).properties(height=180)
+                charts.altair_chart(run_line, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Sourcing & Contract Ops</div>', unsafe_allow_html=True)
+        src_col1, src_col2 = st.columns(2)
+        
+        with src_col1:
+            st.markdown("**RFX Win Rate**")
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                win_df = pd.DataFrame({
+                    'Month': months,
+                    'WinRate': [48, 52, 55, 57, 60, 62]
+                })
+                win_line = alt.Chart(win_df).mark_line(point=True, color='#22C55E', strokeWidth=2).encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('WinRate:Q', title='Win %'),
+                    tooltip=['Month:N', alt.Tooltip('WinRate:Q', format='.0f')]
+                ).properties(height=180)
+                charts.altair_chart(win_line, use_container_width=True)
+        
+        with src_col2:
+            st.markdown("**Contract Coverage by Category**")
+            with st.container(border=True):
+                cov_df = pd.DataFrame({
+                    'Category': ['Network', 'IT', 'Facilities', 'Services'],
+                    'Coverage': [95, 92, 88, 86]
+                })
+                cov_bar = alt.Chart(cov_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Coverage:Q', title='Coverage %'),
+                    y=alt.Y('Category:N', sort='-x', title=None),
+                    color=alt.value('#0EA5E9'),
+                    tooltip=['Category:N', alt.Tooltip('Coverage:Q', format='.0f')]
+                ).properties(height=180)
+                charts.altair_chart(cov_bar, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Quality & Compliance Ops</div>', unsafe_allow_html=True)
+        qc_col1, qc_col2 = st.columns(2)
+        
+        with qc_col1:
+            st.markdown("**Audit Findings Trend**")
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                audit_df = pd.DataFrame({
+                    'Month': months,
+                    'Findings': [9, 8, 10, 7, 6, 5]
+                })
+                audit_line = alt.Chart(audit_df).mark_line(point=True, color='#F97316', strokeWidth=2).encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('Findings:Q', title='Findings'),
+                    tooltip=['Month:N', 'Findings:Q']
+                ).properties(height=180)
+                charts.altair_chart(audit_line, use_container_width=True)
+        
+        with qc_col2:
+            st.markdown("**Invoice Exception Mix**")
+            with st.container(border=True):
+                exc_df = pd.DataFrame({
+                    'Type': ['Price', 'Quantity', 'PO Mismatch', 'Tax'],
+                    'Share': [34, 28, 22, 16]
+                })
+                exc_arc = alt.Chart(exc_df).mark_arc(innerRadius=50).encode(
+                    theta=alt.Theta('Share:Q', title=None),
+                    color=alt.Color('Type:N', legend=alt.Legend(orient='bottom', title=None)),
+                    tooltip=['Type:N', alt.Tooltip('Share:Q', format='.0f')]
+                ).properties(height=190)
+                charts.altair_chart(exc_arc, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Contract Leakage Hotspots</div>', unsafe_allow_html=True)
+        leak_col1, leak_col2 = st.columns(2)
+        
+        with leak_col1:
+            st.markdown("**Leakage Heatmap**")
+            with st.container(border=True):
+                leak_df = pd.DataFrame({
+                    'Month': ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan'] * 4,
+                    'Category': ['Network'] * 6 + ['IT'] * 6 + ['Facilities'] * 6 + ['Services'] * 6,
+                    'Leakage': [2.2, 2.4, 2.6, 2.1, 1.9, 1.7, 1.4, 1.5, 1.7, 1.3, 1.2, 1.1, 0.9, 1.1, 1.0, 0.8, 0.7, 0.6, 1.2, 1.3, 1.4, 1.1, 1.0, 0.9]
+                })
+                leak_heat = alt.Chart(leak_df).mark_rect().encode(
+                    x=alt.X('Month:N', title=None, sort=['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']),
+                    y=alt.Y('Category:N', title=None),
+                    color=alt.Color('Leakage:Q', scale=alt.Scale(scheme='oranges')),
+                    tooltip=['Category:N', 'Month:N', alt.Tooltip('Leakage:Q', format='.1f')]
+                ).properties(height=180)
+                charts.altair_chart(leak_heat, use_container_width=True)
+        
+        with leak_col2:
+            st.markdown("**Leakage by Category**")
+            with st.container(border=True):
+                leak_cat_df = pd.DataFrame({
+                    'Category': ['Network', 'IT', 'Facilities', 'Services'],
+                    'Leakage': [12.9, 8.2, 5.1, 7.0]
+                })
+                leak_bar = alt.Chart(leak_cat_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Leakage:Q', title='Leakage (£M)'),
+                    y=alt.Y('Category:N', sort='-x', title=None),
+                    color=alt.value('#F97316'),
+                    tooltip=['Category:N', alt.Tooltip('Leakage:Q', format='.1f')]
+                ).properties(height=180)
+                charts.altair_chart(leak_bar, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Automation & Throughput</div>', unsafe_allow_html=True)
+        auto_col1, auto_col2 = st.columns(2)
+        
+        with auto_col1:
+            st.markdown("**PO Automation Rate**")
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                auto_df = pd.DataFrame({
+                    'Month': months,
+                    'Automation': [62, 64, 66, 69, 71, 73]
+                })
+                auto_line = alt.Chart(auto_df).mark_line(point=True, color='#22C55E', strokeWidth=2).encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('Automation:Q', title='Automation %'),
+                    tooltip=['Month:N', alt.Tooltip('Automation:Q', format='.0f')]
+                ).properties(height=180)
+                charts.altair_chart(auto_line, use_container_width=True)
+        
+        with auto_col2:
+            st.markdown("**Requisition Throughput**")
+            with st.container(border=True):
+                thr_df = pd.DataFrame({
+                    'Week': ['W1', 'W2', 'W3', 'W4', 'W5', 'W6'],
+                    'Processed': [58, 62, 60, 65, 68, 72]
+                })
+                thr_bar = alt.Chart(thr_df).mark_bar(cornerRadiusTopLeft=6, cornerRadiusTopRight=6).encode(
+                    x=alt.X('Week:N', title=None),
+                    y=alt.Y('Processed:Q', title='Requests'),
+                    color=alt.value('#6366F1'),
+                    tooltip=['Week:N', 'Processed:Q']
+                ).properties(height=180)
+                charts.altair_chart(thr_bar, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Savings vs Target</div>', unsafe_allow_html=True)
+        tgt_col1, tgt_col2 = st.columns(2)
+        
+        with tgt_col1:
+            st.markdown("**Cumulative Savings vs Target**")
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                cum_df = pd.DataFrame({
+                    'Month': months,
+                    'Actual': [0.4, 0.7, 1.0, 1.3, 1.7, 2.1],
+                    'Target': [0.5, 0.8, 1.2, 1.6, 2.0, 2.5]
+                })
+                cum_line = alt.Chart(cum_df).transform_fold(
+                    ['Actual', 'Target'],
+                    as_=['Series', 'Value']
+                ).mark_line(point=True).encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('Value:Q', title='£M'),
+                    color=alt.Color('Series:N', scale=alt.Scale(range=['#22C55E', '#F59E0B'])),
+                    tooltip=['Month:N', 'Series:N', alt.Tooltip('Value:Q', format='.1f')]
+                ).properties(height=180)
+                charts.altair_chart(cum_line, use_container_width=True)
+        
+        with tgt_col2:
+            st.markdown("**Pipeline Confidence**")
+            with st.container(border=True):
+                conf_df = pd.DataFrame({
+                    'Stage': ['Identified', 'In Negotiation', 'Approved', 'Realized'],
+                    'Share': [35, 28, 22, 15]
+                })
+                conf_arc = alt.Chart(conf_df).mark_arc(innerRadius=50).encode(
+                    theta=alt.Theta('Share:Q', title=None),
+                    color=alt.Color('Stage:N', legend=alt.Legend(orient='bottom', title=None)),
+                    tooltip=['Stage:N', alt.Tooltip('Share:Q', format='.0f')]
+                ).properties(height=190)
+                charts.altair_chart(conf_arc, use_container_width=True)
+    
+    with tab_strategy:
+        st.markdown("""
+        <div class="proc-ai-pulse">
+            <div class="proc-ai-header">
+                <div class="proc-ai-title">❄️ Snowflake Intelligence Pulse</div>
+                <div class="proc-ai-tag">AI LIVE</div>
+            </div>
+            <div class="proc-ai-grid">
+                <div class="proc-ai-card">
+                    <div class="proc-ai-label">Spend Efficiency</div>
+                    <div class="proc-ai-value">92%</div>
+                    <div class="proc-ai-sub">On budget</div>
+                </div>
+                <div class="proc-ai-card">
+                    <div class="proc-ai-label">Savings Velocity</div>
+                    <div class="proc-ai-value">£0.30M</div>
+                    <div class="proc-ai-sub">Monthly run-rate</div>
+                </div>
+                <div class="proc-ai-card">
+                    <div class="proc-ai-label">Supplier Risk</div>
+                    <div class="proc-ai-value">Low</div>
+                    <div class="proc-ai-sub">Tier mix stable</div>
+                </div>
+                <div class="proc-ai-card">
+                    <div class="proc-ai-label">Approval SLA</div>
+                    <div class="proc-ai-value">93%</div>
+                    <div class="proc-ai-sub">Improving</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">AI Executive Summary</div>', unsafe_allow_html=True)
+        if st.session_state.get('sf_highlights', True):
+            st.info("❄️ **Powered by Snowflake Cortex AI** — Summary synthesized from spend, supplier performance, and approval cycle data.")
+        
+        with st.container(border=True):
+            st.markdown("""
+            **Executive Summary (Q1 2026):**
+            - **Savings** tracking £2.1M identified, with consolidation driving the largest impact.
+            - **Approval SLA** improved to **93%**, reducing PO cycle time to 9.6 days.
+            - **Vendor risk** concentrated in two top renewals; proactive renegotiation recommended.
+            """)
+        
+        st.markdown('<div class="section-header">Signals & Insights</div>', unsafe_allow_html=True)
+        insight_cols = st.columns(3)
+        with insight_cols[0]:
+            st.markdown('<div class="section-header">Top Insights</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                - **Network infra** remains 70% of spend
+                - **Sourcing cycle** dropped to 21 days
+                - **Top 5 vendors** hold 58% of spend
+                """)
+        with insight_cols[1]:
+            st.markdown('<div class="section-header">Risk Signals</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                - **Emergency POs** remain above 5% target
+                - **Ericsson renewal** has high exposure
+                - **Compliance** dip in Oct requires audit
+                """)
+        with insight_cols[2]:
+            st.markdown('<div class="section-header">Growth Signals</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                - **Supplier performance** improving QoQ
+                - **Volume discounts** unlocked in Q1
+                - **Contract renewals** provide negotiation leverage
+                """)
+        
+        st.markdown('<div class="section-header">AI-Powered Strategic Recommendations</div>', unsafe_allow_html=True)
+        action_cols = st.columns(3)
+        with action_cols[0]:
+            with st.container(border=True):
+                st.markdown("""
+                - **Accelerate consolidation** across tier-2 vendors
+                - Target £0.4M savings gap by Q2
+                """)
+        with action_cols[1]:
+            with st.container(border=True):
+                st.markdown("""
+                - **Reduce emergency POs** via demand forecasting
+                - Implement pre-approved spend thresholds
+                """)
+        with action_cols[2]:
+            with st.container(border=True):
+                st.markdown("""
+                - **Renegotiate top renewals** with SLA incentives
+                - Lock in multi-year discounts
+                """)
+        
+        st.markdown('<div class="section-header">VP Procurement Strategic Priorities — Q1 2026</div>', unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #DC2626; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 1</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Savings £2.5M</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Identified: **£2.1M**
+                - Gap: **£400K** to target
+                - Focus: Vendor consolidation
+                - Action: RFP refresh
+                """)
+        with col2:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #F59E0B; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 2</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Emergency PO < 5%</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **8%** emergency
+                - Target: **<5%** by Q2
+                - Action: Planning improvements
+                - Process: Forecast integration
+                """)
+        with col3:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #10B981; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 3</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Ericsson Renewal</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Contract: **£24.2M** annual
+                - Renewal: March 2026
+                - Target: **5%** reduction
+                - Savings: **£1.2M** potential
+                """)
+        
+        st.markdown('<div class="section-header">Ask Snowflake Intelligence</div>', unsafe_allow_html=True)
+        questions = ["What is our vendor spend by category?", "Who are our top vendors by spend?", "What's pending approval status?", "Where can we optimize vendor spend?"]
+        sf_intel_url = "https://ai.snowflake.com/sfseeurope/pjose_aws3"
+        cols = st.columns(2)
+        for i, q in enumerate(questions):
+            with cols[i % 2]:
+                escaped_q = q.replace('"', '&quot;').replace("'", "&#39;")
+                st.markdown(f"""
+                <a href="{sf_intel_url}" target="_blank" onclick="navigator.clipboard.writeText('{escaped_q}')" style="text-decoration: none; color: inherit; display: block;">
+                    <div class="question-card">
+                        <p style="margin-bottom: 1.5rem;"><strong>Q{i+1}:</strong> "{q}"</p>
+                    </div>
+                </a>
+                """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div style="text-align: center; margin-top: 1rem; padding: 1rem; background: linear-gradient(135deg, #29B5E8 0%, #1A8BC4 100%); border-radius: 8px;">
+            <a href="{sf_intel_url}" target="_blank" style="color: white; text-decoration: none; font-weight: 600; font-size: 1rem;">
+                ❄️ Ask these questions in Snowflake Intelligence →
+            </a>
+        </div>
+        """, unsafe_allow_html=True)
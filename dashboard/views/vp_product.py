@@ -0,0 +1,587 @@
+"""VP Product Management dashboard."""
+
+import streamlit as st
+import pandas as pd
+import altair as alt
+
+from dashboard import charts
+
+
+def render_vp_product():
+    import pandas as pd
+    import altair as alt
+    
+    st.markdown("""
+    <div class="main-header">
+        <h1>VP Product Management Dashboard</h1>
+        <p>Product Portfolio, Plan Performance & Pricing Strategy</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Dashboard Tabs
+    tab_overview, tab_ops, tab_strategy = st.tabs(["📊 Overview & Analysis", "🧭 Product Operations", "❄️ Snowflake Intelligence"])
+
+    with tab_overview:
+        
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['PLAN', 'MOBILE', 'MARKET_INTELLIGENCE']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+        
+        # VP PRODUCT - PRODUCT LIFECYCLE ANIMATION
+        st.markdown("""<div class="product-lifecycle"><div class="lifecycle-wheel"><div class="wheel-segment launch"></div><div class="wheel-segment grow"></div><div class="wheel-segment mature"></div><div class="wheel-segment decline"></div><div class="wheel-center">📱</div></div><div class="product-stages"><div class="prod-title">📦 Product Lifecycle Status</div><div class="stages-grid"><div class="stage-card"><div class="stage-icon">🚀</div><div class="stage-count">3</div><div class="stage-name">Launch</div></div><div class="stage-card"><div class="stage-icon">📈</div><div class="stage-count">8</div><div class="stage-name">Growth</div></div><div class="stage-card"><div class="stage-icon">⭐</div><div class="stage-count">10</div><div class="stage-name">Mature</div></div><div class="stage-card"><div class="stage-icon">📉</div><div class="stage-count">3</div><div class="stage-name">Sunset</div></div></div></div></div>""", unsafe_allow_html=True)
+        
+        
+        st.markdown('<div class="section-header">Product Portfolio Overview</div>', unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #29B5E8;">
+                <div class="kpi-icon">📱</div>
+                <div class="kpi-label">Active Plans</div>
+                <div class="kpi-value">24</div>
+                <div class="kpi-delta positive">Consumer + B2B</div>
+            </div>
+            <div class="kpi-card" style="--accent: #10B981;">
+                <div class="kpi-icon">📡</div>
+                <div class="kpi-label">5G Plans</div>
+                <div class="kpi-value">14</div>
+                <div class="kpi-delta positive">58% of portfolio</div>
+            </div>
+            <div class="kpi-card" style="--accent: #F59E0B;">
+                <div class="kpi-icon">👥</div>
+                <div class="kpi-label">5G Adoption</div>
+                <div class="kpi-value">42%</div>
+                <div class="kpi-delta positive">↑ +8% MoM</div>
+            </div>
+            <div class="kpi-card" style="--accent: #8B5CF6;">
+                <div class="kpi-icon">💰</div>
+                <div class="kpi-label">Avg ARPU</div>
+                <div class="kpi-value">£43.60</div>
+                <div class="kpi-delta positive">↑ +£2.10 MoM</div>
+            </div>
+        </div>
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #14B8A6;">
+                <div class="kpi-icon">📊</div>
+                <div class="kpi-label">Pay Monthly</div>
+                <div class="kpi-value">62%</div>
+                <div class="kpi-delta positive">ARPU: £52</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EC4899;">
+                <div class="kpi-icon">💳</div>
+                <div class="kpi-label">SIM Only</div>
+                <div class="kpi-value">28%</div>
+                <div class="kpi-delta positive">ARPU: £28</div>
+            </div>
+            <div class="kpi-card" style="--accent: #6366F1;">
+                <div class="kpi-icon">🔋</div>
+                <div class="kpi-label">PAYG</div>
+                <div class="kpi-value">10%</div>
+                <div class="kpi-delta positive">ARPU: £18</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EF4444;">
+                <div class="kpi-icon">📉</div>
+                <div class="kpi-label">Underperforming</div>
+                <div class="kpi-value">4</div>
+                <div class="kpi-delta negative">Plans need review</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # New: 5G Adoption Trend and ARPU by Plan Type
+        adoption_col, arpu_type_col = st.columns(2)
+        
+        with adoption_col:
+            st.markdown('<div class="section-header">5G Adoption Trend</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                adoption_data = pd.DataFrame({
+                    'Month': months,
+                    '5G': [34, 36, 38, 39, 41, 42],
+                    '4G': [66, 64, 62, 61, 59, 58]
+                })
+                
+                adoption_area = alt.Chart(adoption_data.melt('Month', var_name='Network', value_name='Pct')).mark_area().encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('Pct:Q', stack='normalize', title='%'),
+                    color=alt.Color('Network:N', scale=alt.Scale(
+                        domain=['5G', '4G'],
+                        range=['#8B5CF6', '#E5E7EB']
+                    ), legend=alt.Legend(orient='bottom', title=None)),
+                    tooltip=['Month:N', 'Network:N', alt.Tooltip('Pct:Q', format='.0f')]
+                ).properties(height=160)
+                
+                charts.altair_chart(adoption_area, use_container_width=True)
+        
+        with arpu_type_col:
+            st.markdown('<div class="section-header">ARPU by Plan Type</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; justify-content: space-around; align-items: flex-end; height: 160px; padding: 1rem 0;">
+                    <div style="text-align: center; flex: 1;">
+                        <div style="background: #29B5E8; width: 60px; height: 104px; margin: 0 auto; border-radius: 6px 6px 0 0;"></div>
+                        <div style="font-weight: 600; margin-top: 0.5rem;">£52</div>
+                        <div style="font-size: 0.75rem; color: #6B7280;">Pay Monthly</div>
+                        <div style="font-size: 0.7rem; color: #9CA3AF;">62% share</div>
+                    </div>
+                    <div style="text-align: center; flex: 1;">
+                        <div style="background: #10B981; width: 60px; height: 56px; margin: 0 auto; border-radius: 6px 6px 0 0;"></div>
+                        <div style="font-weight: 600; margin-top: 0.5rem;">£28</div>
+                        <div style="font-size: 0.75rem; color: #6B7280;">SIM Only</div>
+                        <div style="font-size: 0.7rem; color: #9CA3AF;">28% share</div>
+                    </div>
+                    <div style="text-align: center; flex: 1;">
+                        <div style="background: #F59E0B; width: 60px; height: 36px; margin: 0 auto; border-radius: 6px 6px 0 0;"></div>
+                        <div style="font-weight: 600; margin-top: 0.5rem;">£18</div>
+                        <div style="font-size: 0.75rem; color: #6B7280;">PAYG</div>
+                        <div style="font-size: 0.7rem; color: #9CA3AF;">10% share</div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        col_left, col_right = st.columns([1.3, 1])
+        
+        with col_left:
+            st.markdown('<div class="section-header">Top Plans by Subscribers</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Unlimited 5G</span><span style="font-weight: 600;">8,420 <span style="color: #6B7280; font-size: 0.75rem;">(£55)</span></span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #29B5E8; width: 100%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Essential 10GB</span><span style="font-weight: 600;">6,280 <span style="color: #6B7280; font-size: 0.75rem;">(£28)</span></span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #29B5E8; width: 75%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Premium 100GB</span><span style="font-weight: 600;">4,120 <span style="color: #6B7280; font-size: 0.75rem;">(£45)</span></span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #29B5E8; width: 49%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Family Share</span><span style="font-weight: 600;">3,840 <span style="color: #6B7280; font-size: 0.75rem;">(£42)</span></span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #29B5E8; width: 46%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div>
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Business Pro</span><span style="font-weight: 600;">2,680 <span style="color: #6B7280; font-size: 0.75rem;">(£68)</span></span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #29B5E8; width: 32%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col_right:
+            st.markdown('<div class="section-header">Competitor Pricing</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="font-weight: 600; color: #6B7280; margin-bottom: 0.5rem;">Unlimited 5G Comparison</div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>SnowTelco</span>
+                        <span style="background: #29B5E8; color: white; padding: 0.2rem 0.5rem; border-radius: 12px; font-weight: 600;">£45/mo</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>EE</span>
+                        <span style="font-weight: 600;">£54/mo</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Three</span>
+                        <span style="font-weight: 600;">£42/mo</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0;">
+                        <span>Vodafone</span>
+                        <span style="font-weight: 600;">£48/mo</span>
+                    </div>
+                </div>
+                <div style="margin-top: 0.75rem; padding: 0.5rem; background: #D1FAE5; border-radius: 8px; font-size: 0.75rem; text-align: center;">
+                    <span style="color: #065F46;">Competitive positioning: Mid-market value leader</span>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Plan Performance Signals</div>', unsafe_allow_html=True)
+        perf_col1, perf_col2 = st.columns(2)
+        
+        with perf_col1:
+            st.markdown("**Subscriber Growth by Plan**")
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                growth_df = pd.DataFrame({
+                    'Month': months,
+                    'Unlimited 5G': [7.8, 8.1, 8.3, 8.4, 8.5, 8.7],
+                    'Essential 10GB': [5.9, 6.1, 6.2, 6.3, 6.3, 6.4],
+                    'SIM Only': [2.4, 2.5, 2.6, 2.7, 2.8, 2.9]
+                })
+                growth_line = alt.Chart(growth_df).transform_fold(
+                    ['Unlimited 5G', 'Essential 10GB', 'SIM Only'],
+                    as_=['Plan', 'Subscribers']
+                ).mark_line(point=True).encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('Subscribers:Q', title='Subscribers (M)'),
+                    color=alt.Color('Plan:N', scale=alt.Scale(range=['#29B5E8', '#10B981', '#F59E0B'])),
+                    tooltip=['Month:N', 'Plan:N', alt.Tooltip('Subscribers:Q', format='.1f')]
+                ).properties(height=180)
+                charts.altair_chart(growth_line, use_container_width=True)
+        
+        with perf_col2:
+            st.markdown("**Churn Risk by Plan**")
+            with st.container(border=True):
+                churn_df = pd.DataFrame({
+                    'Plan': ['Unlimited 5G', 'Essential 10GB', 'SIM Only', 'PAYG'],
+                    'Risk': [1.8, 2.6, 3.2, 4.4]
+                })
+                churn_bar = alt.Chart(churn_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Risk:Q', title='Risk %'),
+                    y=alt.Y('Plan:N', sort='-x', title=None),
+                    color=alt.value('#EF4444'),
+                    tooltip=['Plan:N', alt.Tooltip('Risk:Q', format='.1f')]
+                ).properties(height=180)
+                charts.altair_chart(churn_bar, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Value & Usage Signals</div>', unsafe_allow_html=True)
+        value_col1, value_col2 = st.columns(2)
+        
+        with value_col1:
+            st.markdown("**Add-on Attachment Rate**")
+            with st.container(border=True):
+                add_on_df = pd.DataFrame({
+                    'Add-on': ['Roaming', 'Streaming', 'Device Protect', 'Cloud'],
+                    'Attach': [22, 18, 15, 10]
+                })
+                add_on_bar = alt.Chart(add_on_df).mark_bar(cornerRadiusTopLeft=6, cornerRadiusTopRight=6).encode(
+                    x=alt.X('Add-on:N', title=None),
+                    y=alt.Y('Attach:Q', title='Attach %'),
+                    color=alt.value('#6366F1'),
+                    tooltip=['Add-on:N', alt.Tooltip('Attach:Q', format='.0f')]
+                ).properties(height=180)
+                charts.altair_chart(add_on_bar, use_container_width=True)
+        
+        with value_col2:
+            st.markdown("**Data Utilization by Plan**")
+            with st.container(border=True):
+                util_df = pd.DataFrame({
+                    'Plan': ['Unlimited 5G', 'Essential 10GB', 'SIM Only', 'PAYG'],
+                    'Utilization': [78, 64, 58, 42]
+                })
+                util_bar = alt.Chart(util_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Utilization:Q', title='Utilization %'),
+                    y=alt.Y('Plan:N', sort='-x', title=None),
+                    color=alt.value('#14B8A6'),
+                    tooltip=['Plan:N', alt.Tooltip('Utilization:Q', format='.0f')]
+                ).properties(height=180)
+                charts.altair_chart(util_bar, use_container_width=True)
+        
+
+    with tab_ops:
+        st.markdown("""
+        <div class="product-ops-pulse">
+            <div class="product-ops-header">
+                <div class="product-ops-title">🧭 Product Ops Pulse</div>
+                <div class="product-ops-tag">LIVE</div>
+            </div>
+            <div class="product-ops-grid">
+                <div class="product-ops-card">
+                    <div class="product-ops-label">Launches Q1</div>
+                    <div class="product-ops-value">6</div>
+                    <div class="product-ops-delta">2 in Feb</div>
+                </div>
+                <div class="product-ops-card">
+                    <div class="product-ops-label">Roadmap On-Track</div>
+                    <div class="product-ops-value">84%</div>
+                    <div class="product-ops-delta">+6% vs last qtr</div>
+                </div>
+                <div class="product-ops-card">
+                    <div class="product-ops-label">Active Price Tests</div>
+                    <div class="product-ops-value">5</div>
+                    <div class="product-ops-delta">2 enterprise</div>
+                </div>
+                <div class="product-ops-card">
+                    <div class="product-ops-label">Backlog Health</div>
+                    <div class="product-ops-value">92%</div>
+                    <div class="product-ops-delta">Low risk</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Launch & Roadmap Operations</div>', unsafe_allow_html=True)
+        road_col1, road_col2 = st.columns(2)
+        
+        with road_col1:
+            st.markdown("**Feature Readiness**")
+            with st.container(border=True):
+                readiness_df = pd.DataFrame({
+                    'Feature': ['Family Plan', '5G Bundles', 'IoT Starter', 'Biz Elite'],
+                    'Readiness': [78, 86, 64, 72]
+                })
+                readiness_bar = alt.Chart(readiness_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Readiness:Q', title='Readiness %'),
+                    y=alt.Y('Feature:N', sort='-x', title=None),
+                    color=alt.value('#3B82F6'),
+                    tooltip=['Feature:N', alt.Tooltip('Readiness:Q', format='.0f')]
+                ).properties(height=180)
+                charts.altair_chart(readiness_bar, use_container_width=True)
+        
+        with road_col2:
+            st.markdown("**Release Cadence (Monthly)**")
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                release_df = pd.DataFrame({
+                    'Month': months,
+                    'Releases': [2, 3, 2, 4, 3, 5]
+                })
+                release_line = alt.Chart(release_df).mark_line(point=True, color='#10B981', strokeWidth=2).encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('Releases:Q', title='Releases'),
+                    tooltip=['Month:N', 'Releases:Q']
+                ).properties(height=180)
+                charts.altair_chart(release_line, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Pricing & Experimentation</div>', unsafe_allow_html=True)
+        price_col1, price_col2 = st.columns(2)
+        
+        with price_col1:
+            st.markdown("**Promo Lift by Segment**")
+            with st.container(border=True):
+                lift_df = pd.DataFrame({
+                    'Segment': ['Consumer', 'Family', 'SMB', 'Enterprise'],
+                    'Lift': [12, 18, 9, 6]
+                })
+                lift_bar = alt.Chart(lift_df).mark_bar(cornerRadiusTopLeft=6, cornerRadiusTopRight=6).encode(
+                    x=alt.X('Segment:N', title=None),
+                    y=alt.Y('Lift:Q', title='Lift %'),
+                    color=alt.value('#F59E0B'),
+                    tooltip=['Segment:N', alt.Tooltip('Lift:Q', format='.0f')]
+                ).properties(height=180)
+                charts.altair_chart(lift_bar, use_container_width=True)
+        
+        with price_col2:
+            st.markdown("**Price Test Funnel**")
+            with st.container(border=True):
+                funnel_df = pd.DataFrame({
+                    'Week': ['W1', 'W2', 'W3', 'W4', 'W5', 'W6'],
+                    'Tested': [120, 115, 110, 108, 105, 104],
+                    'Adopted': [45, 48, 52, 50, 53, 55],
+                    'Rolled Back': [10, 9, 8, 7, 6, 6]
+                })
+                funnel_area = alt.Chart(funnel_df).transform_fold(
+                    ['Tested', 'Adopted', 'Rolled Back'],
+                    as_=['Stage', 'Count']
+                ).mark_area(opacity=0.5).encode(
+                    x=alt.X('Week:N', sort=['W1', 'W2', 'W3', 'W4', 'W5', 'W6'], title=None),
+                    y=alt.Y('Count:Q', title='Experiments'),
+                    color=alt.Color('Stage:N', scale=alt.Scale(range=['#60A5FA', '#22C55E', '#EF4444'])),
+                    tooltip=['Stage:N', 'Count:Q']
+                ).properties(height=180)
+                charts.altair_chart(funnel_area, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Quality & Experience Signals</div>', unsafe_allow_html=True)
+        qual_col1, qual_col2 = st.columns(2)
+        
+        with qual_col1:
+            st.markdown("**NPS by Plan**")
+            with st.container(border=True):
+                nps_df = pd.DataFrame({
+                    'Plan': ['Unlimited 5G', 'Essential 10GB', 'SIM Only', 'PAYG'],
+                    'NPS': [42, 36, 31, 24]
+                })
+                nps_bar = alt.Chart(nps_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('NPS:Q', title='NPS'),
+                    y=alt.Y('Plan:N', sort='-x', title=None),
+                    color=alt.value('#8B5CF6'),
+                    tooltip=['Plan:N', 'NPS:Q']
+                ).properties(height=180)
+                charts.altair_chart(nps_bar, use_container_width=True)
+        
+        with qual_col2:
+            st.markdown("**Defect Escape Rate**")
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                defect_df = pd.DataFrame({
+                    'Month': months,
+                    'Escape': [3.8, 3.4, 3.2, 2.9, 2.7, 2.6]
+                })
+                defect_line = alt.Chart(defect_df).mark_line(point=True, color='#EF4444', strokeWidth=2).encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('Escape:Q', title='Rate %'),
+                    tooltip=['Month:N', alt.Tooltip('Escape:Q', format='.1f')]
+                ).properties(height=180)
+                charts.altair_chart(defect_line, use_container_width=True)
+    
+    with tab_strategy:
+        st.markdown("""
+        <div class="prod-ai-pulse">
+            <div class="prod-ai-header">
+                <div class="prod-ai-title">❄️ Snowflake Intelligence Pulse</div>
+                <div class="prod-ai-tag">AI LIVE</div>
+            </div>
+            <div class="prod-ai-grid">
+                <div class="prod-ai-card">
+                    <div class="prod-ai-label">Portfolio Health</div>
+                    <div class="prod-ai-value">84%</div>
+                    <div class="prod-ai-sub">Plans above target</div>
+                </div>
+                <div class="prod-ai-card">
+                    <div class="prod-ai-label">5G Migration</div>
+                    <div class="prod-ai-value">+8%</div>
+                    <div class="prod-ai-sub">MoM uplift</div>
+                </div>
+                <div class="prod-ai-card">
+                    <div class="prod-ai-label">Price Elasticity</div>
+                    <div class="prod-ai-value">1.12</div>
+                    <div class="prod-ai-sub">Low churn risk</div>
+                </div>
+                <div class="prod-ai-card">
+                    <div class="prod-ai-label">Launch Velocity</div>
+                    <div class="prod-ai-value">5.2/wk</div>
+                    <div class="prod-ai-sub">Best quarter</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">AI Executive Summary</div>', unsafe_allow_html=True)
+        if st.session_state.get('sf_highlights', True):
+            st.info("❄️ **Powered by Snowflake Cortex AI** — Summary synthesized from plan performance, pricing, and adoption signals.")
+        
+        with st.container(border=True):
+            st.markdown("""
+            **Executive Summary (Q1 2026):**
+            - **5G adoption** reached **42%**, with strongest growth in Unlimited 5G plans.
+            - **ARPU uplift** is tracking +£2.10 MoM, driven by add-on attachment.
+            - **Churn risk** remains elevated in PAYG; targeted migration offers recommended.
+            """)
+        
+        st.markdown('<div class="section-header">Signals & Insights</div>', unsafe_allow_html=True)
+        insight_cols = st.columns(3)
+        with insight_cols[0]:
+            st.markdown('<div class="section-header">Top Insights</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                - **Unlimited 5G** contributes 33% of net adds
+                - **Streaming add-ons** lead attachment at 18%
+                - **Family plans** show highest NPS lift
+                """)
+        with insight_cols[1]:
+            st.markdown('<div class="section-header">Risk Signals</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                - **PAYG churn** 4.4% with price sensitivity
+                - **SIM-only** NPS trails by 11 points
+                - **Release defects** above target in Dec
+                """)
+        with insight_cols[2]:
+            st.markdown('<div class="section-header">Growth Signals</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                - **SMB promo lift** +9% in Q1
+                - **5G bundles** outperform targets by 6%
+                - **IoT starter** shows 12% adoption potential
+                """)
+        
+        st.markdown('<div class="section-header">AI-Powered Strategic Recommendations</div>', unsafe_allow_html=True)
+        action_cols = st.columns(3)
+        with action_cols[0]:
+            with st.container(border=True):
+                st.markdown("""
+                - **Accelerate 5G migrations** using family plan incentives
+                - Expand targeted offers in high-churn regions
+                """)
+        with action_cols[1]:
+            with st.container(border=True):
+                st.markdown("""
+                - **Reprice PAYG** to reduce churn sensitivity
+                - Test add-on bundles to lift ARPU by £1.50
+                """)
+        with action_cols[2]:
+            with st.container(border=True):
+                st.markdown("""
+                - **Improve release quality** via staged rollouts
+                - Prioritize roadmap items with NPS impact
+                """)
+        
+        st.markdown('<div class="section-header">VP Product Management Strategic Priorities — Q1 2026</div>', unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #DC2626; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 1</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">5G Adoption 50%</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **42%** on 5G
+                - Gap: **8%** to target
+                - Action: Migration offers
+                - Campaign: March 2026
+                """)
+        with col2:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #F59E0B; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 2</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">ARPU £46</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **£43.60** ARPU
+                - Gap: **£2.40** to target
+                - Action: Value upselling
+                - Focus: SIM Only to PM
+                """)
+        with col3:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #10B981; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 3</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Family Plan Launch</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Target: **2,000** signups
+                - Launch: February 2026
+                - Pricing: **£35**/line
+                - Revenue: **£840K** projected
+                """)
+        
+        st.markdown('<div class="section-header">Ask Snowflake Intelligence</div>', unsafe_allow_html=True)
+        questions = ["What is our mobile plan portfolio?", "Which plans have the most subscribers?", "What's our 5G adoption rate by segment?", "How do our prices compare to competitors?"]
+        sf_intel_url = "https://ai.snowflake.com/sfseeurope/pjose_aws3"
+        cols = st.columns(2)
+        for i, q in enumerate(questions):
+            with cols[i % 2]:
+                escaped_q = q.replace('"', '&quot;').replace("'", "&#39;")
+                st.markdown(f"""
+                <a href="{sf_intel_url}" target="_blank" onclick="navigator.clipboard.writeText('{escaped_q}')" style="text-decoration: none; color: inherit; display: block;">
+                    <div class="question-card">
+                        <p style="margin-bottom: 1.5rem;"><strong>Q{i+1}:</strong> "{q}"</p>
+                    </div>
+                </a>
+                """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div style="text-align: center; margin-top: 1rem; padding: 1rem; background: linear-gradient(135deg, #29B5E8 0%, #1A8BC4 100%); border-radius: 8px;">
+            <a href="{sf_intel_url}" target="_blank" style="color: white; text-decoration: none; font-weight: 600; font-size: 1rem;">
+                ❄️ Ask these questions in Snowflake Intelligence →
+            </a>
+        </div>
+        """, unsafe_allow_html=True)
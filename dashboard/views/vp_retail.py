@@ -0,0 +1,762 @@
+"""VP Retail dashboard."""
+
+import streamlit as st
+import pandas as pd
+import altair as alt
+
+from dashboard import charts
+
+
+def render_vp_retail():
+    import pandas as pd
+    import altair as alt
+    
+    st.markdown("""
+    <div class="main-header">
+        <h1>VP Retail Operations Dashboard</h1>
+        <p>Store Performance, Sales Analytics & Footfall Conversion</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Dashboard Tabs
+    tab_overview, tab_ops, tab_strategy = st.tabs(["📊 Overview & Analysis", "🛍️ Retail Operations", "❄️ Snowflake Intelligence"])
+
+    with tab_overview:
+        
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['RETAIL']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+        
+        # VP RETAIL - STORE GRID ANIMATION
+        st.markdown("""<div class="retail-grid"><div class="retail-header"><div class="retail-title">🏪 Store Network Live</div><div class="retail-live">● 170 Stores • Real-time</div></div><div class="stores-map"><div class="store-dot high">LON-OX</div><div class="store-dot high" style="animation-delay:0.1s">LON-RE</div><div class="store-dot medium" style="animation-delay:0.2s">MAN-AR</div><div class="store-dot high" style="animation-delay:0.3s">BIR-BU</div><div class="store-dot high" style="animation-delay:0.4s">LEE-TR</div><div class="store-dot low" style="animation-delay:0.5s">LIV-ON</div><div class="store-dot high" style="animation-delay:0.6s">GLA-BC</div><div class="store-dot medium" style="animation-delay:0.7s">EDI-PR</div><div class="store-dot high" style="animation-delay:0.8s">BRI-CA</div><div class="store-dot high" style="animation-delay:0.9s">CAR-QS</div><div class="store-dot high" style="animation-delay:1.0s">NEW-EG</div><div class="store-dot high" style="animation-delay:1.1s">SHE-ME</div><div class="store-dot high" style="animation-delay:1.2s">NOT-VR</div><div class="store-dot medium" style="animation-delay:1.3s">LES-HM</div><div class="store-dot high" style="animation-delay:1.4s">COV-WO</div><div class="store-dot low" style="animation-delay:1.5s">BRA-SG</div><div class="store-dot high" style="animation-delay:1.6s">STK-PO</div><div class="store-dot high" style="animation-delay:1.7s">HUL-PV</div><div class="store-dot medium" style="animation-delay:1.8s">PLY-DR</div><div class="store-dot high" style="animation-delay:1.9s">SOU-WQ</div></div><div class="retail-stats"><div class="retail-stat"><div class="retail-val">12.4K</div><div class="retail-label">Footfall Today</div></div><div class="retail-stat"><div class="retail-val">34%</div><div class="retail-label">Conversion</div></div><div class="retail-stat"><div class="retail-val">£847K</div><div class="retail-label">Revenue Today</div></div><div class="retail-stat"><div class="retail-val">4.7</div><div class="retail-label">CSAT</div></div></div></div>""", unsafe_allow_html=True)
+        
+        
+        st.markdown('<div class="section-header">Retail Overview</div>', unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #29B5E8;">
+                <div class="kpi-icon">🏪</div>
+                <div class="kpi-label">Total Stores</div>
+                <div class="kpi-value">170</div>
+                <div class="kpi-delta positive">UK-wide</div>
+            </div>
+            <div class="kpi-card" style="--accent: #10B981;">
+                <div class="kpi-icon">💰</div>
+                <div class="kpi-label">Retail Revenue</div>
+                <div class="kpi-value">£2.8M</div>
+                <div class="kpi-delta positive">↑ +12% MoM</div>
+            </div>
+            <div class="kpi-card" style="--accent: #F59E0B;">
+                <div class="kpi-icon">👥</div>
+                <div class="kpi-label">Footfall MTD</div>
+                <div class="kpi-value">142K</div>
+                <div class="kpi-delta positive">↑ +8% vs LY</div>
+            </div>
+            <div class="kpi-card" style="--accent: #8B5CF6;">
+                <div class="kpi-icon">🎯</div>
+                <div class="kpi-label">Conversion Rate</div>
+                <div class="kpi-value">24%</div>
+                <div class="kpi-delta positive">↑ +3% MoM</div>
+            </div>
+        </div>
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #14B8A6;">
+                <div class="kpi-icon">📊</div>
+                <div class="kpi-label">Sales/Sq Ft</div>
+                <div class="kpi-value">£142</div>
+                <div class="kpi-delta positive">↑ +£8 MoM</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EC4899;">
+                <div class="kpi-icon">📱</div>
+                <div class="kpi-label">Contract Sales</div>
+                <div class="kpi-value">68%</div>
+                <div class="kpi-delta positive">vs 32% PAYG</div>
+            </div>
+            <div class="kpi-card" style="--accent: #6366F1;">
+                <div class="kpi-icon">👤</div>
+                <div class="kpi-label">Sales/Employee</div>
+                <div class="kpi-value">£4.2K</div>
+                <div class="kpi-delta positive">↑ +£320 MoM</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EF4444;">
+                <div class="kpi-icon">📉</div>
+                <div class="kpi-label">Underperforming</div>
+                <div class="kpi-value">12</div>
+                <div class="kpi-delta negative">Stores below target</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # New: Footfall vs Conversion Trend and Regional Performance
+        footfall_col, regional_col = st.columns(2)
+        
+        with footfall_col:
+            st.markdown('<div class="section-header">Footfall vs Conversion</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                weeks = [f'W{i}' for i in range(1, 9)]
+                footfall_data = pd.DataFrame({
+                    'Week': weeks,
+                    'Footfall': [17.2, 18.1, 16.8, 17.5, 18.4, 17.9, 18.2, 18.8],
+                    'Conversion': [22, 23, 21, 24, 23, 25, 24, 24]
+                })
+                
+                footfall_bars = alt.Chart(footfall_data).mark_bar(color='#E5E7EB', cornerRadiusTopLeft=4, cornerRadiusTopRight=4).encode(
+                    x=alt.X('Week:N', sort=weeks, title=None),
+                    y=alt.Y('Footfall:Q', title='Footfall (K)')
+                )
+                
+                conversion_line = alt.Chart(footfall_data).mark_line(color='#10B981', strokeWidth=3).encode(
+                    x=alt.X('Week:N', sort=weeks),
+                    y=alt.Y('Conversion:Q', scale=alt.Scale(domain=[15, 30]), title='Conv %'),
+                    tooltip=['Week:N', alt.Tooltip('Conversion:Q', format='.0f')]
+                )
+                
+                charts.altair_chart(alt.layer(footfall_bars, conversion_line).resolve_scale(y='independent').properties(height=160), use_container_width=True)
+        
+        with regional_col:
+            st.markdown('<div class="section-header">Regional Performance</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>London</span><span style="font-weight: 600;">£0.72M</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 16px;">
+                            <div style="background: #29B5E8; width: 100%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>North</span><span style="font-weight: 600;">£0.62M</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 16px;">
+                            <div style="background: #29B5E8; width: 86%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>South East</span><span style="font-weight: 600;">£0.58M</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 16px;">
+                            <div style="background: #29B5E8; width: 81%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Midlands</span><span style="font-weight: 600;">£0.52M</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 16px;">
+                            <div style="background: #29B5E8; width: 72%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div>
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Scotland</span><span style="font-weight: 600;">£0.36M</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 16px;">
+                            <div style="background: #29B5E8; width: 50%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+
+        st.markdown('<div class="section-header">Revenue & Basket Signals</div>', unsafe_allow_html=True)
+        basket_col1, basket_col2 = st.columns(2)
+        
+        with basket_col1:
+            st.markdown("**Average Basket Value (Weekly)**")
+            with st.container(border=True):
+                weeks = [f'W{i}' for i in range(1, 9)]
+                basket_df = pd.DataFrame({
+                    'Week': weeks,
+                    'Basket': [92, 98, 96, 101, 104, 108, 110, 112]
+                })
+                basket_line = alt.Chart(basket_df).mark_line(point=True, color='#6366F1', strokeWidth=2).encode(
+                    x=alt.X('Week:N', sort=weeks, title=None),
+                    y=alt.Y('Basket:Q', title='£'),
+                    tooltip=['Week:N', alt.Tooltip('Basket:Q', format='.0f')]
+                ).properties(height=170)
+                charts.altair_chart(basket_line, use_container_width=True)
+        
+        with basket_col2:
+            st.markdown("**Revenue by Channel**")
+            with st.container(border=True):
+                channel_df = pd.DataFrame({
+                    'Channel': ['In-Store', 'Click & Collect', 'Assisted Digital', 'Partners'],
+                    'Share': [54, 18, 16, 12]
+                })
+                channel_arc = alt.Chart(channel_df).mark_arc(innerRadius=55).encode(
+                    theta=alt.Theta('Share:Q', title=None),
+                    color=alt.Color('Channel:N', legend=None, scale=alt.Scale(
+                        range=['#29B5E8', '#10B981', '#F59E0B', '#8B5CF6']
+                    )),
+                    tooltip=['Channel:N', alt.Tooltip('Share:Q', format='.0f')]
+                ).properties(height=170)
+                charts.altair_chart(channel_arc, use_container_width=True)
+        
+        col_left, col_right = st.columns([1.3, 1])
+        
+        with col_left:
+            st.markdown('<div class="section-header">Performance by Store Type</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Standard <span style="color: #6B7280; font-size: 0.75rem;">(86 stores)</span></span>
+                            <span style="font-weight: 600;">£1.42M</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #29B5E8; width: 100%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Flagship <span style="color: #6B7280; font-size: 0.75rem;">(12 stores)</span></span>
+                            <span style="font-weight: 600;">£0.84M</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #29B5E8; width: 59%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Express <span style="color: #6B7280; font-size: 0.75rem;">(48 stores)</span></span>
+                            <span style="font-weight: 600;">£0.38M</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #29B5E8; width: 27%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div>
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Kiosk <span style="color: #6B7280; font-size: 0.75rem;">(24 stores)</span></span>
+                            <span style="font-weight: 600;">£0.16M</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #29B5E8; width: 11%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col_right:
+            st.markdown('<div class="section-header">Top Product Categories</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Contract Phones</span>
+                        <span style="font-weight: 600;">£1.24M (44%)</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>SIM Only</span>
+                        <span style="font-weight: 600;">£680K (24%)</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Accessories</span>
+                        <span style="font-weight: 600;">£480K (17%)</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0;">
+                        <span>PAYG</span>
+                        <span style="font-weight: 600;">£420K (15%)</span>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+
+        st.markdown('<div class="section-header">Inventory & Promo Signals</div>', unsafe_allow_html=True)
+        inv_col1, inv_col2 = st.columns(2)
+        
+        with inv_col1:
+            st.markdown("**Inventory Health by Category**")
+            with st.container(border=True):
+                inv_df = pd.DataFrame({
+                    'Category': ['Contract Phones', 'SIM Only', 'Accessories', 'PAYG'],
+                    'Days': [26, 18, 32, 14]
+                })
+                inv_bar = alt.Chart(inv_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Days:Q', title='Days on Hand'),
+                    y=alt.Y('Category:N', sort='-x', title=None),
+                    color=alt.value('#10B981'),
+                    tooltip=['Category:N', 'Days:Q']
+                ).properties(height=170)
+                charts.altair_chart(inv_bar, use_container_width=True)
+        
+        with inv_col2:
+            st.markdown("**Promo Lift vs Baseline**")
+            with st.container(border=True):
+                promo_df = pd.DataFrame({
+                    'Promo': ['Handset Bundle', 'Trade-In', 'Family Plan', 'SIM Only'],
+                    'Lift': [22, 18, 14, 9]
+                })
+                promo_bar = alt.Chart(promo_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Lift:Q', title='Lift %'),
+                    y=alt.Y('Promo:N', sort='-x', title=None),
+                    color=alt.value('#F59E0B'),
+                    tooltip=['Promo:N', alt.Tooltip('Lift:Q', format='.0f')]
+                ).properties(height=170)
+                charts.altair_chart(promo_bar, use_container_width=True)
+        
+        # In-Store Customer Behavior Section
+        st.markdown('<div class="section-header">In-Store Customer Behavior</div>', unsafe_allow_html=True)
+        
+        demo_col, journey_col, cust_type_col = st.columns(3)
+        
+        with demo_col:
+            st.markdown("**Visitor Demographics**")
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>18-24</span><span style="font-weight: 600;">22%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 12px;">
+                            <div style="background: #8B5CF6; width: 22%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>25-34</span><span style="font-weight: 600;">32%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 12px;">
+                            <div style="background: #6366F1; width: 32%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>35-44</span><span style="font-weight: 600;">24%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 12px;">
+                            <div style="background: #3B82F6; width: 24%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>45-54</span><span style="font-weight: 600;">14%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 12px;">
+                            <div style="background: #29B5E8; width: 14%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div>
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>55+</span><span style="font-weight: 600;">8%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 12px;">
+                            <div style="background: #10B981; width: 8%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                </div>
+                <div style="text-align: center; margin-top: 0.4rem; font-size: 0.7rem; color: #6B7280;">Skews younger than online (median: 32)</div>
+                """, unsafe_allow_html=True)
+        
+        with journey_col:
+            st.markdown("**In-Store Journey**")
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="margin-bottom: 0.75rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.25rem;">
+                            <span>Footfall</span><span style="font-weight: 600;">48,200</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 20px;">
+                            <div style="background: #29B5E8; width: 100%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.75rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.25rem;">
+                            <span>Engaged (>5 min)</span><span style="font-weight: 600;">28,920 (60%)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 20px;">
+                            <div style="background: #10B981; width: 60%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.75rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.25rem;">
+                            <span>Staff Assisted</span><span style="font-weight: 600;">18,472 (38%)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 20px;">
+                            <div style="background: #8B5CF6; width: 38%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div>
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.25rem;">
+                            <span>Converted</span><span style="font-weight: 600;">11,568 (24%)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 20px;">
+                            <div style="background: #F59E0B; width: 24%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with cust_type_col:
+            st.markdown("**New vs Existing Customers**")
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; justify-content: space-around; text-align: center; padding: 0.5rem 0;">
+                    <div>
+                        <div style="font-size: 1.8rem; font-weight: 700; color: #10B981;">62%</div>
+                        <div style="font-size: 0.8rem; color: #6B7280;">New Customers</div>
+                        <div style="font-size: 0.7rem; color: #6B7280;">7,172 sales</div>
+                    </div>
+                    <div>
+                        <div style="font-size: 1.8rem; font-weight: 700; color: #29B5E8;">38%</div>
+                        <div style="font-size: 0.8rem; color: #6B7280;">Existing</div>
+                        <div style="font-size: 0.7rem; color: #6B7280;">4,396 sales</div>
+                    </div>
+                </div>
+                <div style="margin-top: 0.5rem; padding-top: 0.5rem; border-top: 1px solid #E5E7EB; font-size: 0.75rem; text-align: center;">
+                    <strong>Existing Customer Actions:</strong> Upgrade 58% • Support 24% • Add Line 18%
+                </div>
+                """, unsafe_allow_html=True)
+        
+        # Purchase Behavior
+        purchase_col, reason_col = st.columns(2)
+        
+        with purchase_col:
+            st.markdown("**Purchase Behavior by Customer Type**")
+            with st.container(border=True):
+                st.markdown("""
+                <table style="width: 100%; font-size: 0.8rem; border-collapse: collapse;">
+                    <tr style="border-bottom: 2px solid #E5E7EB; background: #F9FAFB;">
+                        <th style="text-align: left; padding: 0.4rem;">Type</th>
+                        <th style="text-align: center; padding: 0.4rem;">Avg Basket</th>
+                        <th style="text-align: center; padding: 0.4rem;">Time in Store</th>
+                        <th style="text-align: center; padding: 0.4rem;">Upsell Rate</th>
+                    </tr>
+                    <tr style="border-bottom: 1px solid #E5E7EB;">
+                        <td style="padding: 0.4rem;">New - Contract</td>
+                        <td style="text-align: center; padding: 0.4rem; font-weight: 600;">£142</td>
+                        <td style="text-align: center; padding: 0.4rem;">28 min</td>
+                        <td style="text-align: center; padding: 0.4rem; color: #10B981;">68%</td>
+                    </tr>
+                    <tr style="border-bottom: 1px solid #E5E7EB;">
+                        <td style="padding: 0.4rem;">New - PAYG</td>
+                        <td style="text-align: center; padding: 0.4rem; font-weight: 600;">£48</td>
+                        <td style="text-align: center; padding: 0.4rem;">12 min</td>
+                        <td style="text-align: center; padding: 0.4rem; color: #F59E0B;">34%</td>
+                    </tr>
+                    <tr style="border-bottom: 1px solid #E5E7EB;">
+                        <td style="padding: 0.4rem;">Upgrade</td>
+                        <td style="text-align: center; padding: 0.4rem; font-weight: 600;">£186</td>
+                        <td style="text-align: center; padding: 0.4rem;">22 min</td>
+                        <td style="text-align: center; padding: 0.4rem; color: #10B981;">72%</td>
+                    </tr>
+                    <tr>
+                        <td style="padding: 0.4rem;">Accessory Only</td>
+                        <td style="text-align: center; padding: 0.4rem; font-weight: 600;">£38</td>
+                        <td style="text-align: center; padding: 0.4rem;">8 min</td>
+                        <td style="text-align: center; padding: 0.4rem; color: #DC2626;">12%</td>
+                    </tr>
+                </table>
+                """, unsafe_allow_html=True)
+        
+        with reason_col:
+            st.markdown("**Visit Reason Analysis**")
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>New Purchase</span><span style="font-weight: 600;">42%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 14px;">
+                            <div style="background: #10B981; width: 42%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Upgrade/Renewal</span><span style="font-weight: 600;">28%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 14px;">
+                            <div style="background: #29B5E8; width: 28%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.5rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Support/Repair</span><span style="font-weight: 600;">18%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 14px;">
+                            <div style="background: #F59E0B; width: 18%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div>
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Browse/Research</span><span style="font-weight: 600;">12%</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 14px;">
+                            <div style="background: #8B5CF6; width: 12%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                </div>
+                <div style="text-align: center; margin-top: 0.4rem; font-size: 0.7rem; color: #10B981;">Browsers convert at 32% on return visit</div>
+                """, unsafe_allow_html=True)
+        
+
+    with tab_ops:
+        st.markdown("""
+        <div class="retail-ops-pulse">
+            <div class="retail-ops-header">
+                <div class="retail-ops-title">🛍️ Retail Ops Pulse</div>
+                <div class="retail-ops-tag">LIVE OPS</div>
+            </div>
+            <div class="retail-ops-grid">
+                <div class="retail-ops-card">
+                    <div class="retail-ops-label">Open Tickets</div>
+                    <div class="retail-ops-value">56</div>
+                    <div class="retail-ops-delta">Store ops</div>
+                </div>
+                <div class="retail-ops-card">
+                    <div class="retail-ops-label">Staffed Shifts</div>
+                    <div class="retail-ops-value">94%</div>
+                    <div class="retail-ops-delta">Target 96%</div>
+                </div>
+                <div class="retail-ops-card">
+                    <div class="retail-ops-label">Promo Compliance</div>
+                    <div class="retail-ops-value">88%</div>
+                    <div class="retail-ops-delta">Last audit</div>
+                </div>
+                <div class="retail-ops-card">
+                    <div class="retail-ops-label">Stockouts</div>
+                    <div class="retail-ops-value">14</div>
+                    <div class="retail-ops-delta">Critical SKUs</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Store Ops Performance</div>', unsafe_allow_html=True)
+        ops_col1, ops_col2 = st.columns(2)
+        
+        with ops_col1:
+            st.markdown("**Queue Time by Store Type**")
+            with st.container(border=True):
+                queue_df = pd.DataFrame({
+                    'Store Type': ['Flagship', 'Standard', 'Express', 'Kiosk'],
+                    'Minutes': [7.2, 6.1, 5.4, 4.2]
+                })
+                queue_bar = alt.Chart(queue_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Minutes:Q', title='Minutes'),
+                    y=alt.Y('Store Type:N', sort='-x', title=None),
+                    color=alt.value('#29B5E8'),
+                    tooltip=['Store Type:N', alt.Tooltip('Minutes:Q', format='.1f')]
+                ).properties(height=170)
+                charts.altair_chart(queue_bar, use_container_width=True)
+        
+        with ops_col2:
+            st.markdown("**Staffing Coverage (Weekly)**")
+            with st.container(border=True):
+                weeks = [f'W{i}' for i in range(1, 9)]
+                staff_df = pd.DataFrame({
+                    'Week': weeks,
+                    'Coverage': [91, 93, 94, 92, 95, 96, 94, 94]
+                })
+                staff_line = alt.Chart(staff_df).mark_line(point=True, color='#10B981', strokeWidth=2).encode(
+                    x=alt.X('Week:N', sort=weeks, title=None),
+                    y=alt.Y('Coverage:Q', title='%'),
+                    tooltip=['Week:N', alt.Tooltip('Coverage:Q', format='.0f')]
+                ).properties(height=170)
+                charts.altair_chart(staff_line, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Returns & Service Ops</div>', unsafe_allow_html=True)
+        ret_col1, ret_col2 = st.columns(2)
+        
+        with ret_col1:
+            st.markdown("**Return Rate by Category**")
+            with st.container(border=True):
+                ret_df = pd.DataFrame({
+                    'Category': ['Contract Phones', 'Accessories', 'SIM Only', 'PAYG'],
+                    'Rate': [6.2, 4.1, 2.8, 3.4]
+                })
+                ret_bar = alt.Chart(ret_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Rate:Q', title='%'),
+                    y=alt.Y('Category:N', sort='-x', title=None),
+                    color=alt.value('#F59E0B'),
+                    tooltip=['Category:N', alt.Tooltip('Rate:Q', format='.1f')]
+                ).properties(height=170)
+                charts.altair_chart(ret_bar, use_container_width=True)
+        
+        with ret_col2:
+            st.markdown("**Service Ticket Resolution**")
+            with st.container(border=True):
+                res_df = pd.DataFrame({
+                    'Stage': ['Same Day', '1-2 Days', '3-5 Days', '5+ Days'],
+                    'Share': [42, 31, 18, 9]
+                })
+                res_arc = alt.Chart(res_df).mark_arc(innerRadius=55).encode(
+                    theta=alt.Theta('Share:Q', title=None),
+                    color=alt.Color('Stage:N', legend=None, scale=alt.Scale(
+                        range=['#10B981', '#29B5E8', '#F59E0B', '#EF4444']
+                    )),
+                    tooltip=['Stage:N', alt.Tooltip('Share:Q', format='.0f')]
+                ).properties(height=170)
+                charts.altair_chart(res_arc, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Store Compliance & Loss</div>', unsafe_allow_html=True)
+        comp_col1, comp_col2 = st.columns(2)
+        
+        with comp_col1:
+            st.markdown("**Promo Compliance by Region**")
+            with st.container(border=True):
+                comp_df = pd.DataFrame({
+                    'Region': ['London', 'North', 'South East', 'Midlands', 'Scotland'],
+                    'Compliance': [92, 86, 88, 84, 90]
+                })
+                comp_bar = alt.Chart(comp_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Compliance:Q', title='%'),
+                    y=alt.Y('Region:N', sort='-x', title=None),
+                    color=alt.value('#6366F1'),
+                    tooltip=['Region:N', alt.Tooltip('Compliance:Q', format='.0f')]
+                ).properties(height=170)
+                charts.altair_chart(comp_bar, use_container_width=True)
+        
+        with comp_col2:
+            st.markdown("**Shrinkage by Store Type**")
+            with st.container(border=True):
+                shrink_df = pd.DataFrame({
+                    'Store Type': ['Flagship', 'Standard', 'Express', 'Kiosk'],
+                    'Shrinkage': [1.2, 0.9, 0.7, 0.5]
+                })
+                shrink_bar = alt.Chart(shrink_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Shrinkage:Q', title='%'),
+                    y=alt.Y('Store Type:N', sort='-x', title=None),
+                    color=alt.value('#EF4444'),
+                    tooltip=['Store Type:N', alt.Tooltip('Shrinkage:Q', format='.1f')]
+                ).properties(height=170)
+                charts.altair_chart(shrink_bar, use_container_width=True)
+
+    with tab_strategy:
+        st.markdown("""
+        <div class="sf-retail-pulse">
+            <div class="sf-retail-header">
+                <div class="sf-retail-title">❄️ Snowflake Intelligence Pulse</div>
+                <div class="sf-retail-tag">AI INSIGHTS</div>
+            </div>
+            <div class="sf-retail-grid">
+                <div class="sf-retail-card">
+                    <div class="sf-retail-label">Conversion</div>
+                    <div class="sf-retail-value">24%</div>
+                    <div class="sf-retail-delta">Target 28%</div>
+                </div>
+                <div class="sf-retail-card">
+                    <div class="sf-retail-label">Footfall</div>
+                    <div class="sf-retail-value">142K</div>
+                    <div class="sf-retail-delta">MTD</div>
+                </div>
+                <div class="sf-retail-card">
+                    <div class="sf-retail-label">Sales/Sq Ft</div>
+                    <div class="sf-retail-value">£142</div>
+                    <div class="sf-retail-delta">Target £160</div>
+                </div>
+                <div class="sf-retail-card">
+                    <div class="sf-retail-label">Underperforming</div>
+                    <div class="sf-retail-value">12</div>
+                    <div class="sf-retail-delta">Stores</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">AI Executive Summary</div>', unsafe_allow_html=True)
+        st.info("Retail performance is improving with rising basket values and strong footfall, but conversion remains below target in several regions. Inventory pressure in accessories and promo compliance gaps are creating missed revenue opportunities. Prioritize staffing coverage and store coaching in underperforming locations to lift conversion and sales per square foot.")
+        
+        st.markdown('<div class="section-header">Signals & Insights</div>', unsafe_allow_html=True)
+        sig_col1, sig_col2, sig_col3 = st.columns(3)
+        with sig_col1:
+            with st.container(border=True):
+                st.markdown("**Conversion Hotspots**")
+                st.caption("London flagships outperform by +6% conversion vs network average.")
+        with sig_col2:
+            with st.container(border=True):
+                st.markdown("**Basket Value Lift**")
+                st.caption("Accessory attach rate correlates with 18% higher basket size.")
+        with sig_col3:
+            with st.container(border=True):
+                st.markdown("**Promo Compliance Gaps**")
+                st.caption("Midlands stores show the lowest promo compliance at 84%.")
+        
+        st.markdown('<div class="section-header">AI‑Powered Strategic Recommendations</div>', unsafe_allow_html=True)
+        rec_col1, rec_col2, rec_col3 = st.columns(3)
+        with rec_col1:
+            with st.container(border=True):
+                st.markdown("**Staffing Optimization**")
+                st.caption("Align peak-hour staffing to lift conversion by 2–3 points.")
+        with rec_col2:
+            with st.container(border=True):
+                st.markdown("**Merchandising Reset**")
+                st.caption("Refresh accessory bays to increase attach and reduce stockouts.")
+        with rec_col3:
+            with st.container(border=True):
+                st.markdown("**Store Coaching**")
+                st.caption("Target 12 underperforming stores with coaching and incentives.")
+        
+        st.markdown('<div class="section-header">Strategic Priorities</div>', unsafe_allow_html=True)
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #DC2626; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 1</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Conversion 28%</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **24%** conversion
+                - Gap: **4%** to target
+                - Action: Sales training
+                - Incentive: Q1 bonus
+                """)
+        with col2:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #F59E0B; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 2</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">£160/sq ft Target</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **£142**/sq ft
+                - Gap: **£18** to target
+                - Focus: Flagship stores
+                - Action: Visual merchandising
+                """)
+        with col3:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #10B981; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 3</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Underperformers Fix</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - At-risk: **12** stores
+                - Action: Store reviews
+                - Options: Relocate or close
+                - Timeline: Q1 decision
+                """)
+        
+        st.markdown('<div class="section-header">Ask Snowflake Intelligence</div>', unsafe_allow_html=True)
+        questions = ["What is our retail sales revenue by store type?", "What are our footfall and conversion rates?", "Which stores are top and bottom performers?", "How are retail staff performing on commission?"]
+        sf_intel_url = "https://ai.snowflake.com/sfseeurope/pjose_aws3"
+        cols = st.columns(2)
+        for i, q in enumerate(questions):
+            with cols[i % 2]:
+                escaped_q = q.replace('"', '&quot;').replace("'", "&#39;")
+                st.markdown(f"""
+                <a href="{sf_intel_url}" target="_blank" onclick="navigator.clipboard.writeText('{escaped_q}')" style="text-decoration: none; color: inherit; display: block;">
+                    <div class="question-card">
+                        <p style="margin-bottom: 1.5rem;"><strong>Q{i+1}:</strong> "{q}"</p>
+                    </div>
+                </a>
+                """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div style="text-align: center; margin-top: 1rem; padding: 1rem; background: linear-gradient(135deg, #29B5E8 0%, #1A8BC4 100%); border-radius: 8px;">
+            <a href="{sf_intel_url}" target="_blank" style="color: white; text-decoration: none; font-weight: 600; font-size: 1rem;">
+                ❄️ Ask these questions in Snowflake Intelligence →
+            </a>
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,517 @@
+"""VP Security dashboard."""
+
+import streamlit as st
+import pandas as pd
+import altair as alt
+
+from dashboard import charts
+
+
+def render_vp_security():
+    import pandas as pd
+    import altair as alt
+    
+    st.markdown("""
+    <div class="main-header">
+        <h1>VP Security & Fraud Prevention Dashboard</h1>
+        <p>Fraud Detection, Loss Prevention & Security Analytics</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Dashboard Tabs
+    tab_overview, tab_ops, tab_strategy = st.tabs(["📊 Overview & Analysis", "🛡️ Security Operations", "❄️ Snowflake Intelligence"])
+
+    with tab_overview:
+        
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['FRAUD_DETECTION']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+        
+        # VP SECURITY - THREAT RADAR ANIMATION
+        st.markdown("""<div class="security-radar"><div class="radar-display"><div class="radar-bg-sec"></div><div class="radar-inner-sec"></div><div class="radar-center-sec"></div><div class="radar-line-sec"></div><div class="threat-dot critical" style="top:20%;left:65%"></div><div class="threat-dot warning" style="top:60%;left:25%;animation-delay:0.3s"></div><div class="threat-dot safe" style="top:75%;left:70%;animation-delay:0.6s"></div><div class="threat-dot warning" style="top:35%;left:30%;animation-delay:0.9s"></div><div class="shield-icon">🛡️</div></div><div class="security-stats"><div class="sec-title">🔒 Threat Detection Live</div><div class="sec-grid"><div class="sec-item blocked"><div class="sec-val">2,847</div><div class="sec-label">Threats Blocked Today</div></div><div class="sec-item detected"><div class="sec-val">23</div><div class="sec-label">Active Investigations</div></div><div class="sec-item prevented"><div class="sec-val">£1.2M</div><div class="sec-label">Fraud Prevented MTD</div></div><div class="sec-item saved"><div class="sec-val">99.7%</div><div class="sec-label">Detection Rate</div></div></div></div></div>""", unsafe_allow_html=True)
+        
+        
+        st.markdown('<div class="section-header">Fraud Prevention Overview</div>', unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #10B981;">
+                <div class="kpi-icon">🛡️</div>
+                <div class="kpi-label">Losses Prevented</div>
+                <div class="kpi-value">£2.4M</div>
+                <div class="kpi-delta positive">YTD savings</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EF4444;">
+                <div class="kpi-icon">🚨</div>
+                <div class="kpi-label">Active Cases</div>
+                <div class="kpi-value">142</div>
+                <div class="kpi-delta negative">18 critical</div>
+            </div>
+            <div class="kpi-card" style="--accent: #F59E0B;">
+                <div class="kpi-icon">🔍</div>
+                <div class="kpi-label">Detected MTD</div>
+                <div class="kpi-value">847</div>
+                <div class="kpi-delta positive">↑ +12% detection</div>
+            </div>
+            <div class="kpi-card" style="--accent: #8B5CF6;">
+                <div class="kpi-icon">🤖</div>
+                <div class="kpi-label">ML Accuracy</div>
+                <div class="kpi-value">94.2%</div>
+                <div class="kpi-delta positive">↑ +2% MoM</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #29B5E8;">
+                <div class="kpi-icon">⏱️</div>
+                <div class="kpi-label">Avg Resolution</div>
+                <div class="kpi-value">4.2 hrs</div>
+                <div class="kpi-delta positive">↓ -1.8 hrs</div>
+            </div>
+            <div class="kpi-card" style="--accent: #14B8A6;">
+                <div class="kpi-icon">📊</div>
+                <div class="kpi-label">False Positive Rate</div>
+                <div class="kpi-value">3.8%</div>
+                <div class="kpi-delta positive">↓ -0.6%</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EC4899;">
+                <div class="kpi-icon">🔄</div>
+                <div class="kpi-label">SIM Swap Blocked</div>
+                <div class="kpi-value">284</div>
+                <div class="kpi-delta positive">This month</div>
+            </div>
+            <div class="kpi-card" style="--accent: #6366F1;">
+                <div class="kpi-icon">👤</div>
+                <div class="kpi-label">Account Takeover</div>
+                <div class="kpi-value">42</div>
+                <div class="kpi-delta positive">Prevented</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        if st.session_state.get('sf_highlights', True):
+            st.info("❄️ **Powered by Snowflake Cortex AI** — Real-time fraud detection using Cortex Anomaly Detection and ML Classification with 94% accuracy on transaction data")
+        
+        # New: Fraud Trend and ML Model Performance
+        fraud_trend_col, ml_col = st.columns(2)
+        
+        with fraud_trend_col:
+            st.markdown('<div class="section-header">Fraud Cases Trend (6 Months)</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                fraud_trend = pd.DataFrame({
+                    'Month': months * 3,
+                    'Type': ['Identity']*6 + ['SIM Swap']*6 + ['Other']*6,
+                    'Cases': [280, 290, 295, 300, 308, 312,
+                             240, 252, 260, 268, 276, 284,
+                             180, 190, 200, 220, 240, 251]
+                })
+                
+                fraud_area = alt.Chart(fraud_trend).mark_area().encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('Cases:Q', stack='zero', title='Cases'),
+                    color=alt.Color('Type:N', scale=alt.Scale(
+                        domain=['Identity', 'SIM Swap', 'Other'],
+                        range=['#EF4444', '#F59E0B', '#6B7280']
+                    ), legend=alt.Legend(orient='bottom', title=None)),
+                    tooltip=['Month:N', 'Type:N', 'Cases:Q']
+                ).properties(height=160)
+                
+                charts.altair_chart(fraud_area, use_container_width=True)
+        
+        with ml_col:
+            st.markdown('<div class="section-header">ML Model Accuracy</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                ml_data = pd.DataFrame({
+                    'Month': ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan'],
+                    'Accuracy': [91.2, 92.0, 92.8, 93.4, 93.8, 94.2],
+                    'Precision': [89.5, 90.2, 91.0, 91.8, 92.4, 93.0]
+                })
+                
+                accuracy_line = alt.Chart(ml_data).mark_line(color='#10B981', strokeWidth=2).encode(
+                    x=alt.X('Month:N', title=None),
+                    y=alt.Y('Accuracy:Q', scale=alt.Scale(domain=[85, 100]), title='%'),
+                    tooltip=['Month:N', alt.Tooltip('Accuracy:Q', format='.1f')]
+                )
+                
+                precision_line = alt.Chart(ml_data).mark_line(color='#8B5CF6', strokeWidth=2, strokeDash=[4, 4]).encode(
+                    x=alt.X('Month:N'),
+                    y=alt.Y('Precision:Q'),
+                    tooltip=['Month:N', alt.Tooltip('Precision:Q', format='.1f')]
+                )
+                
+                charts.altair_chart((accuracy_line + precision_line).properties(height=160), use_container_width=True)
+                st.markdown('<div style="text-align: center; font-size: 0.75rem;"><span style="color: #10B981;">—</span> Accuracy <span style="color: #8B5CF6;">- -</span> Precision</div>', unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Channel & Segment Risk</div>', unsafe_allow_html=True)
+        channel_col1, channel_col2 = st.columns(2)
+        
+        with channel_col1:
+            st.markdown("**Fraud Losses by Channel**")
+            with st.container(border=True):
+                channel_df = pd.DataFrame({
+                    'Channel': ['Digital', 'Retail', 'Call Center', 'Partner'],
+                    'Losses': [1.1, 0.7, 0.4, 0.2]
+                })
+                channel_bar = alt.Chart(channel_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Losses:Q', title='£M'),
+                    y=alt.Y('Channel:N', sort='-x', title=None),
+                    color=alt.value('#EF4444'),
+                    tooltip=['Channel:N', alt.Tooltip('Losses:Q', format='.1f')]
+                ).properties(height=170)
+                charts.altair_chart(channel_bar, use_container_width=True)
+        
+        with channel_col2:
+            st.markdown("**High-Risk Segment Mix**")
+            with st.container(border=True):
+                segment_df = pd.DataFrame({
+                    'Segment': ['Prepaid', 'SME', 'Consumer', 'Enterprise'],
+                    'Share': [32, 26, 24, 18]
+                })
+                segment_arc = alt.Chart(segment_df).mark_arc(innerRadius=55).encode(
+                    theta=alt.Theta('Share:Q', title=None),
+                    color=alt.Color('Segment:N', legend=None, scale=alt.Scale(
+                        range=['#F59E0B', '#6366F1', '#10B981', '#29B5E8']
+                    )),
+                    tooltip=['Segment:N', alt.Tooltip('Share:Q', format='.0f')]
+                ).properties(height=170)
+                charts.altair_chart(segment_arc, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Threat Velocity</div>', unsafe_allow_html=True)
+        velocity_col1, velocity_col2 = st.columns(2)
+        
+        with velocity_col1:
+            st.markdown("**Suspicious Login Attempts (Weekly)**")
+            with st.container(border=True):
+                weeks = ['W1', 'W2', 'W3', 'W4', 'W5', 'W6']
+                login_df = pd.DataFrame({
+                    'Week': weeks,
+                    'Attempts': [860, 910, 980, 940, 1020, 1085]
+                })
+                login_line = alt.Chart(login_df).mark_line(point=True, color='#29B5E8', strokeWidth=2).encode(
+                    x=alt.X('Week:N', sort=weeks, title=None),
+                    y=alt.Y('Attempts:Q', title='Attempts'),
+                    tooltip=['Week:N', 'Attempts:Q']
+                ).properties(height=170)
+                charts.altair_chart(login_line, use_container_width=True)
+        
+        with velocity_col2:
+            st.markdown("**SIM Swap Attempts by Region**")
+            with st.container(border=True):
+                sim_df = pd.DataFrame({
+                    'Region': ['London', 'North West', 'Midlands', 'South East', 'Scotland', 'Wales'],
+                    'Attempts': [82, 64, 48, 52, 34, 21]
+                })
+                sim_bar = alt.Chart(sim_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Attempts:Q', title='Attempts'),
+                    y=alt.Y('Region:N', sort='-x', title=None),
+                    color=alt.value('#F59E0B'),
+                    tooltip=['Region:N', 'Attempts:Q']
+                ).properties(height=170)
+                charts.altair_chart(sim_bar, use_container_width=True)
+
+    with tab_ops:
+        st.markdown("""
+        <div class="sec-ops-pulse">
+            <div class="sec-ops-header">
+                <div class="sec-ops-title">🛡️ Security Ops Pulse</div>
+                <div class="sec-ops-tag">LIVE OPS</div>
+            </div>
+            <div class="sec-ops-grid">
+                <div class="sec-ops-card">
+                    <div class="sec-ops-label">Active Alerts</div>
+                    <div class="sec-ops-value">186</div>
+                    <div class="sec-ops-delta">28 critical</div>
+                </div>
+                <div class="sec-ops-card">
+                    <div class="sec-ops-label">High Risk Cases</div>
+                    <div class="sec-ops-value">42</div>
+                    <div class="sec-ops-delta">Triage queue</div>
+                </div>
+                <div class="sec-ops-card">
+                    <div class="sec-ops-label">Avg Triage</div>
+                    <div class="sec-ops-value">18m</div>
+                    <div class="sec-ops-delta">↓ 6m WoW</div>
+                </div>
+                <div class="sec-ops-card">
+                    <div class="sec-ops-label">Fraud Losses</div>
+                    <div class="sec-ops-value">£0.6M</div>
+                    <div class="sec-ops-delta">MTD exposure</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Investigation Workbench</div>', unsafe_allow_html=True)
+        work_col1, work_col2 = st.columns(2)
+        
+        with work_col1:
+            st.markdown("**Case Volume by Queue**")
+            with st.container(border=True):
+                queue_df = pd.DataFrame({
+                    'Queue': ['Identity', 'SIM Swap', 'Payments', 'Account'],
+                    'Cases': [38, 29, 22, 17]
+                })
+                queue_bar = alt.Chart(queue_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Cases:Q', title='Cases'),
+                    y=alt.Y('Queue:N', sort='-x', title=None),
+                    color=alt.value('#6366F1'),
+                    tooltip=['Queue:N', 'Cases:Q']
+                ).properties(height=170)
+                charts.altair_chart(queue_bar, use_container_width=True)
+        
+        with work_col2:
+            st.markdown("**Alert Source Mix**")
+            with st.container(border=True):
+                source_df = pd.DataFrame({
+                    'Source': ['ML Model', 'Rules', 'Customer', 'Partner'],
+                    'Share': [54, 26, 12, 8]
+                })
+                source_arc = alt.Chart(source_df).mark_arc(innerRadius=55).encode(
+                    theta=alt.Theta('Share:Q', title=None),
+                    color=alt.Color('Source:N', legend=None, scale=alt.Scale(
+                        range=['#10B981', '#29B5E8', '#F59E0B', '#EC4899']
+                    )),
+                    tooltip=['Source:N', alt.Tooltip('Share:Q', format='.0f')]
+                ).properties(height=170)
+                charts.altair_chart(source_arc, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Containment Metrics</div>', unsafe_allow_html=True)
+        cont_col1, cont_col2 = st.columns(2)
+        
+        with cont_col1:
+            st.markdown("**Containment Rate Trend**")
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                contain_df = pd.DataFrame({
+                    'Month': months,
+                    'Rate': [92.1, 92.8, 93.4, 94.0, 94.4, 94.9]
+                })
+                contain_line = alt.Chart(contain_df).mark_line(point=True, color='#10B981', strokeWidth=2).encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('Rate:Q', title='%'),
+                    tooltip=['Month:N', alt.Tooltip('Rate:Q', format='.1f')]
+                ).properties(height=170)
+                charts.altair_chart(contain_line, use_container_width=True)
+        
+        with cont_col2:
+            st.markdown("**False Positives by Model**")
+            with st.container(border=True):
+                fp_df = pd.DataFrame({
+                    'Model': ['Identity', 'SIM Swap', 'Payments', 'Device'],
+                    'Rate': [4.2, 3.6, 3.1, 2.4]
+                })
+                fp_bar = alt.Chart(fp_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Rate:Q', title='%'),
+                    y=alt.Y('Model:N', sort='-x', title=None),
+                    color=alt.value('#EF4444'),
+                    tooltip=['Model:N', alt.Tooltip('Rate:Q', format='.1f')]
+                ).properties(height=170)
+                charts.altair_chart(fp_bar, use_container_width=True)
+        
+        col_left, col_right = st.columns([1.3, 1])
+        
+        with col_left:
+            st.markdown('<div class="section-header">Fraud by Category</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Identity Fraud</span><span style="font-weight: 600;">312 cases (£420K)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #EF4444; width: 100%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>SIM Swap</span><span style="font-weight: 600;">284 cases (£380K)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #F59E0B; width: 91%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Traffic Fraud</span><span style="font-weight: 600;">142 cases (£280K)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #3B82F6; width: 46%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Device Fraud</span><span style="font-weight: 600;">89 cases (£120K)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #8B5CF6; width: 29%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div>
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Internal</span><span style="font-weight: 600;">20 cases (£45K)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #6B7280; width: 6%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col_right:
+            st.markdown('<div class="section-header">Detection Methods</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>ML Models</span>
+                        <span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">62% (526)</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Rule Engine</span>
+                        <span style="background: #E0F2FE; color: #0369A1; padding: 0.2rem 0.5rem; border-radius: 12px;">28% (237)</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0;">
+                        <span>Manual Review</span>
+                        <span style="background: #F3F4F6; color: #4B5563; padding: 0.2rem 0.5rem; border-radius: 12px;">10% (84)</span>
+                    </div>
+                </div>
+                <div style="margin-top: 0.75rem; padding: 0.5rem; background: #D1FAE5; border-radius: 8px; font-size: 0.75rem; text-align: center;">
+                    <span style="color: #065F46;">ML models 3x more effective than rules</span>
+                </div>
+                """, unsafe_allow_html=True)
+
+    with tab_strategy:
+        st.markdown("""
+        <div class="sf-sec-pulse">
+            <div class="sf-sec-header">
+                <div class="sf-sec-title">❄️ Snowflake Intelligence Pulse</div>
+                <div class="sf-sec-tag">AI INSIGHTS</div>
+            </div>
+            <div class="sf-sec-grid">
+                <div class="sf-sec-card">
+                    <div class="sf-sec-label">Fraud Risk</div>
+                    <div class="sf-sec-value">High</div>
+                    <div class="sf-sec-delta">SIM swap spike</div>
+                </div>
+                <div class="sf-sec-card">
+                    <div class="sf-sec-label">Containment</div>
+                    <div class="sf-sec-value">94.9%</div>
+                    <div class="sf-sec-delta">↑ +1.2% MoM</div>
+                </div>
+                <div class="sf-sec-card">
+                    <div class="sf-sec-label">Exposure</div>
+                    <div class="sf-sec-value">£0.6M</div>
+                    <div class="sf-sec-delta">MTD at risk</div>
+                </div>
+                <div class="sf-sec-card">
+                    <div class="sf-sec-label">Model Lift</div>
+                    <div class="sf-sec-value">3.1x</div>
+                    <div class="sf-sec-delta">vs rules</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">AI Executive Summary</div>', unsafe_allow_html=True)
+        st.info("Fraud attempts increased 9% WoW, driven by SIM swap and identity theft spikes in urban regions. ML models are sustaining 94%+ accuracy with reduced false positives, while containment improved to 94.9%. Focus on high-risk prepaid segments and partner-channel anomalies to reduce exposure below £0.5M this month.")
+        
+        st.markdown('<div class="section-header">Signals & Insights</div>', unsafe_allow_html=True)
+        sig_col1, sig_col2, sig_col3 = st.columns(3)
+        with sig_col1:
+            with st.container(border=True):
+                st.markdown("**SIM Swap Clusters**")
+                st.caption("Three SIM swap clusters account for 41% of current high-risk alerts in London and North West.")
+        with sig_col2:
+            with st.container(border=True):
+                st.markdown("**Channel Leakage**")
+                st.caption("Digital and partner channels show elevated loss ratios; authentication friction below baseline.")
+        with sig_col3:
+            with st.container(border=True):
+                st.markdown("**Model Drift Watch**")
+                st.caption("Identity model drift detected in SME segment; retraining recommended within 2 weeks.")
+        
+        st.markdown('<div class="section-header">AI‑Powered Strategic Recommendations</div>', unsafe_allow_html=True)
+        rec_col1, rec_col2, rec_col3 = st.columns(3)
+        with rec_col1:
+            with st.container(border=True):
+                st.markdown("**Tighten SIM Swap Controls**")
+                st.caption("Add biometric step-up for high-risk prepaid and escalate to manual review.")
+        with rec_col2:
+            with st.container(border=True):
+                st.markdown("**Partner Channel Guardrails**")
+                st.caption("Deploy anomaly detection on partner activations and block repeat device IDs.")
+        with rec_col3:
+            with st.container(border=True):
+                st.markdown("**Model Refresh Cadence**")
+                st.caption("Accelerate retraining cadence to bi-weekly for identity and device fraud models.")
+        
+        st.markdown('<div class="section-header">Strategic Priorities</div>', unsafe_allow_html=True)
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #DC2626; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 1</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">ML Accuracy 96%</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **94.2%** accuracy
+                - Gap: **1.8%** to target
+                - Action: Model retraining
+                - Data: Q4 fraud patterns
+                """)
+        with col2:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #F59E0B; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 2</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">SIM Swap Zero Fraud</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Blocked: **284** this month
+                - Target: **100%** prevention
+                - Action: Biometric verification
+                - Launch: February 2026
+                """)
+        with col3:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #10B981; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 3</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">£3M Loss Prevention</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - YTD: **£2.4M** prevented
+                - Target: **£3M** by Q2
+                - Focus: Identity fraud
+                - ROI: **8x** on investment
+                """)
+        
+        st.markdown('<div class="section-header">Ask Snowflake Intelligence</div>', unsafe_allow_html=True)
+        questions = ["What is our fraud detection volume by category?", "How effective are our detection methods?", "Show me critical and high severity fraud cases.", "What's our fraud resolution rate?"]
+        sf_intel_url = "https://ai.snowflake.com/sfseeurope/pjose_aws3"
+        cols = st.columns(2)
+        for i, q in enumerate(questions):
+            with cols[i % 2]:
+                escaped_q = q.replace('"', '&quot;').replace("'", "&#39;")
+                st.markdown(f"""
+                <a href="{sf_intel_url}" target="_blank" onclick="navigator.clipboard.writeText('{escaped_q}')" style="text-decoration: none; color: inherit; display: block;">
+                    <div class="question-card">
+                        <p style="margin-bottom: 1.5rem;"><strong>Q{i+1}:</strong> "{q}"</p>
+                    </div>
+                </a>
+                """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div style="text-align: center; margin-top: 1rem; padding: 1rem; background: linear-gradient(135deg, #29B5E8 0%, #1A8BC4 100%); border-radius: 8px;">
+            <a href="{sf_intel_url}" target="_blank" style="color: white; text-decoration: none; font-weight: 600; font-size: 1rem;">
+                ❄️ Ask these questions in Snowflake Intelligence →
+            </a>
+        </div>
+        """, unsafe_allow_html=True)
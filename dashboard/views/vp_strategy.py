@@ -0,0 +1,514 @@
+"""VP Strategy dashboard."""
+
+import streamlit as st
+import pandas as pd
+import altair as alt
+
+from dashboard import charts
+
+
+def render_vp_strategy():
+    import pandas as pd
+    import altair as alt
+    
+    st.markdown("""
+    <div class="main-header">
+        <h1>VP Strategy Dashboard</h1>
+        <p>Market Position, Competitive Intelligence & Growth Opportunities</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Dashboard Tabs
+    tab_overview, tab_market, tab_strategy = st.tabs(["📊 Overview & Analysis", "🧭 Market & Growth", "❄️ Snowflake Intelligence"])
+
+    with tab_overview:
+        
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['MARKET_INTELLIGENCE']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+        
+        
+        # VP STRATEGY - COMPETITIVE RADAR ANIMATION
+        st.markdown("""<div class="strategy-radar"><div class="radar-viz"><div class="quadrant tl"></div><div class="quadrant tr"></div><div class="quadrant bl"></div><div class="quadrant br"></div><div class="center-point"></div><div class="orbit-dot ee"></div><div class="orbit-dot o2"></div><div class="orbit-dot voda"></div><div class="orbit-dot three"></div></div><div class="strategy-insights"><div class="strat-title">🎯 Competitive Intelligence</div><div class="strat-grid"><div class="strat-item"><div class="strat-label">Market Position</div><div class="strat-val">#5 UK</div><div class="strat-sub">5.2% share</div></div><div class="strat-item"><div class="strat-label">Target 2027</div><div class="strat-val">#4 UK</div><div class="strat-sub">7% share goal</div></div><div class="strat-item"><div class="strat-label">Opportunity</div><div class="strat-val">£180M</div><div class="strat-sub">Addressable gap</div></div><div class="strat-item"><div class="strat-label">Threat Level</div><div class="strat-val">Medium</div><div class="strat-sub">Three declining</div></div></div></div></div>""", unsafe_allow_html=True)
+        
+        
+        st.markdown('<div class="section-header">Market Position Overview</div>', unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #29B5E8;">
+                <div class="kpi-icon">📊</div>
+                <div class="kpi-label">Market Share</div>
+                <div class="kpi-value">5.2%</div>
+                <div class="kpi-delta positive">↑ +0.4% YoY</div>
+            </div>
+            <div class="kpi-card" style="--accent: #10B981;">
+                <div class="kpi-icon">📈</div>
+                <div class="kpi-label">TAM (UK Mobile)</div>
+                <div class="kpi-value">£18.4B</div>
+                <div class="kpi-delta positive">↑ +3.2% YoY</div>
+            </div>
+            <div class="kpi-card" style="--accent: #F59E0B;">
+                <div class="kpi-icon">🎯</div>
+                <div class="kpi-label">SAM</div>
+                <div class="kpi-value">£2.8B</div>
+                <div class="kpi-delta positive">SMB + Consumer</div>
+            </div>
+            <div class="kpi-card" style="--accent: #8B5CF6;">
+                <div class="kpi-icon">💰</div>
+                <div class="kpi-label">ARPU vs Market</div>
+                <div class="kpi-value">+£4.20</div>
+                <div class="kpi-delta positive">Above average</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Growth & Segment Signals</div>', unsafe_allow_html=True)
+        seg_col1, seg_col2 = st.columns(2)
+        
+        with seg_col1:
+            st.markdown("**Subscriber Growth by Segment**")
+            with st.container(border=True):
+                seg_df = pd.DataFrame({
+                    'Segment': ['Consumer', 'SMB', 'Enterprise'],
+                    'Growth': [3.4, 5.1, 2.2]
+                }).set_index('Segment')
+                st.bar_chart(seg_df, height=180)
+        
+        with seg_col2:
+            st.markdown("**Churn vs Market (Quarterly)**")
+            with st.container(border=True):
+                churn_df = pd.DataFrame({
+                    'Quarter': ['Q2', 'Q3', 'Q4', 'Q1'],
+                    'SnowTelco': [1.8, 1.7, 1.6, 1.6],
+                    'Market': [2.1, 2.0, 1.9, 1.9]
+                }).set_index('Quarter')
+                st.line_chart(churn_df, height=180)
+        
+        st.markdown('<div class="section-header">Brand & Adoption Signals</div>', unsafe_allow_html=True)
+        brand_col1, brand_col2 = st.columns(2)
+        
+        with brand_col1:
+            st.markdown("**NPS by Competitor**")
+            with st.container(border=True):
+                nps_df = pd.DataFrame({
+                    'Brand': ['SnowTelco', 'EE', 'O2', 'Vodafone', 'Three'],
+                    'NPS': [38, 32, 28, 26, 20]
+                }).set_index('Brand')
+                st.bar_chart(nps_df, height=180)
+        
+        with brand_col2:
+            st.markdown("**5G Adoption Trend**")
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                adoption_df = pd.DataFrame({
+                    'Month': months,
+                    'Adoption': [28, 30, 32, 34, 36, 38]
+                })
+                adoption_area = alt.Chart(adoption_df).mark_area(opacity=0.25, color='#2563EB').encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('Adoption:Q', title='Adoption %', scale=alt.Scale(domain=[20, 45])),
+                    tooltip=['Month:N', alt.Tooltip('Adoption:Q', format='.0f')]
+                )
+                adoption_line = alt.Chart(adoption_df).mark_line(point=True, color='#2563EB', strokeWidth=2).encode(
+                    x=alt.X('Month:N', sort=months),
+                    y=alt.Y('Adoption:Q')
+                )
+                st.markdown('<div class="viz-pulse">', unsafe_allow_html=True)
+                charts.altair_chart((adoption_area + adoption_line).properties(height=180), use_container_width=True)
+                st.markdown('</div>', unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Regional Growth & Acquisition</div>', unsafe_allow_html=True)
+        reg_col1, reg_col2 = st.columns(2)
+        
+        with reg_col1:
+            st.markdown("**Regional Net Adds**")
+            with st.container(border=True):
+                region_df = pd.DataFrame({
+                    'Region': ['London', 'North West', 'Midlands', 'South East', 'Scotland', 'Wales'],
+                    'Net Adds': [18.4, 12.6, 9.8, 11.2, 6.4, 4.8]
+                })
+                region_bar = alt.Chart(region_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Net Adds:Q', title='Net Adds (K)'),
+                    y=alt.Y('Region:N', sort='-x', title=None),
+                    color=alt.value('#29B5E8'),
+                    tooltip=['Region:N', alt.Tooltip('Net Adds:Q', format='.1f')]
+                ).properties(height=180)
+                st.markdown('<div class="viz-pulse">', unsafe_allow_html=True)
+                charts.altair_chart(region_bar, use_container_width=True)
+                st.markdown('</div>', unsafe_allow_html=True)
+        
+        with reg_col2:
+            st.markdown("**Acquisition Channels Mix**")
+            with st.container(border=True):
+                channel_df = pd.DataFrame({
+                    'Channel': ['Retail', 'Online', 'Partner', 'Inbound'],
+                    'Share': [38, 32, 18, 12]
+                })
+                channel_donut = alt.Chart(channel_df).mark_arc(innerRadius=45).encode(
+                    theta=alt.Theta('Share:Q'),
+                    color=alt.Color('Channel:N', scale=alt.Scale(
+                        domain=['Retail', 'Online', 'Partner', 'Inbound'],
+                        range=['#2563EB', '#10B981', '#F59E0B', '#8B5CF6']
+                    ), legend=alt.Legend(orient='bottom', title=None)),
+                    tooltip=['Channel:N', 'Share:Q']
+                ).properties(height=180)
+                st.markdown('<div class="viz-pulse">', unsafe_allow_html=True)
+                charts.altair_chart(channel_donut, use_container_width=True)
+                st.markdown('</div>', unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Plan Mix & Win-Back</div>', unsafe_allow_html=True)
+        mix_col1, mix_col2 = st.columns(2)
+        
+        with mix_col1:
+            st.markdown("**Plan Mix (Active Base)**")
+            with st.container(border=True):
+                plan_df = pd.DataFrame({
+                    'Plan': ['SIM Only', 'Handset', '5G Premium', 'Family'],
+                    'Share': [44, 28, 18, 10]
+                })
+                plan_donut = alt.Chart(plan_df).mark_arc(innerRadius=45).encode(
+                    theta=alt.Theta('Share:Q'),
+                    color=alt.Color('Plan:N', scale=alt.Scale(
+                        domain=['SIM Only', 'Handset', '5G Premium', 'Family'],
+                        range=['#29B5E8', '#9CA3AF', '#10B981', '#F59E0B']
+                    ), legend=alt.Legend(orient='bottom', title=None)),
+                    tooltip=['Plan:N', 'Share:Q']
+                ).properties(height=180)
+                st.markdown('<div class="viz-pulse">', unsafe_allow_html=True)
+                charts.altair_chart(plan_donut, use_container_width=True)
+                st.markdown('</div>', unsafe_allow_html=True)
+        
+        with mix_col2:
+            st.markdown("**Win-Back Conversion Trend**")
+            with st.container(border=True):
+                quarters = ['Q2', 'Q3', 'Q4', 'Q1']
+                winback_df = pd.DataFrame({
+                    'Quarter': quarters,
+                    'Conversion': [12, 14, 16, 18]
+                })
+                winback_line = alt.Chart(winback_df).mark_line(point=True, color='#10B981', strokeWidth=2).encode(
+                    x=alt.X('Quarter:N', sort=quarters, title=None),
+                    y=alt.Y('Conversion:Q', title='Conversion %', scale=alt.Scale(domain=[8, 22])),
+                    tooltip=['Quarter:N', alt.Tooltip('Conversion:Q', format='.0f')]
+                ).properties(height=180)
+                st.markdown('<div class="viz-pulse">', unsafe_allow_html=True)
+                charts.altair_chart(winback_line, use_container_width=True)
+                st.markdown('</div>', unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Pricing Elasticity</div>', unsafe_allow_html=True)
+        price_col1, price_col2 = st.columns(2)
+        
+        with price_col1:
+            st.markdown("**Price Sensitivity by Segment**")
+            with st.container(border=True):
+                elastic_df = pd.DataFrame({
+                    'Segment': ['Consumer', 'SMB', 'Enterprise'],
+                    'Elasticity': [1.3, 0.9, 0.6]
+                })
+                elastic_bar = alt.Chart(elastic_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Elasticity:Q', title='Elasticity'),
+                    y=alt.Y('Segment:N', sort='-x', title=None),
+                    color=alt.Color('Segment:N', legend=None, scale=alt.Scale(
+                        range=['#EF4444', '#F59E0B', '#10B981']
+                    )),
+                    tooltip=['Segment:N', alt.Tooltip('Elasticity:Q', format='.1f')]
+                ).properties(height=180)
+                st.markdown('<div class="viz-pulse">', unsafe_allow_html=True)
+                charts.altair_chart(elastic_bar, use_container_width=True)
+                st.markdown('</div>', unsafe_allow_html=True)
+        
+        with price_col2:
+            st.markdown("**Promo Lift vs Baseline**")
+            with st.container(border=True):
+                promo_df = pd.DataFrame({
+                    'Offer': ['SIM Only', 'Handset', '5G Premium', 'Family'],
+                    'Lift': [8, 6, 10, 5]
+                })
+                promo_bar = alt.Chart(promo_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Lift:Q', title='Lift %'),
+                    y=alt.Y('Offer:N', sort='-x', title=None),
+                    color=alt.Color('Offer:N', legend=None, scale=alt.Scale(
+                        range=['#29B5E8', '#9CA3AF', '#10B981', '#F59E0B']
+                    )),
+                    tooltip=['Offer:N', alt.Tooltip('Lift:Q', format='.0f')]
+                ).properties(height=180)
+                st.markdown('<div class="viz-pulse">', unsafe_allow_html=True)
+                charts.altair_chart(promo_bar, use_container_width=True)
+                st.markdown('</div>', unsafe_allow_html=True)
+        
+    with tab_market:
+        st.markdown("""
+        <div class="strat-ops-pulse">
+            <div class="strat-ops-header">
+                <div class="strat-ops-title">🧭 Market & Growth Pulse</div>
+                <div class="strat-ops-tag">LIVE</div>
+            </div>
+            <div class="strat-ops-grid">
+                <div class="strat-ops-card">
+                    <div class="strat-ops-label">Share</div>
+                    <div class="strat-ops-value">5.2%</div>
+                    <div class="strat-ops-delta">+0.4% YoY</div>
+                </div>
+                <div class="strat-ops-card">
+                    <div class="strat-ops-label">ARPU Gap</div>
+                    <div class="strat-ops-value">£4.20</div>
+                    <div class="strat-ops-delta">Above market</div>
+                </div>
+                <div class="strat-ops-card">
+                    <div class="strat-ops-label">Opportunity</div>
+                    <div class="strat-ops-value">£180M</div>
+                    <div class="strat-ops-delta">SMB + Consumer</div>
+                </div>
+                <div class="strat-ops-card">
+                    <div class="strat-ops-label">Threat Level</div>
+                    <div class="strat-ops-value">Medium</div>
+                    <div class="strat-ops-delta">Three declining</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+        # Market Share Trend and ARPU Comparison
+        share_trend_col, arpu_col = st.columns(2)
+        
+        with share_trend_col:
+            st.markdown('<div class="section-header">Market Share Trend (12 Months)</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                months = ['Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                share_trend_data = pd.DataFrame({
+                    'Month': months * 3,
+                    'MonthOrder': list(range(12)) * 3,
+                    'Carrier': ['SnowTelco']*12 + ['Three']*12 + ['Others']*12,
+                    'Share': [4.6, 4.7, 4.7, 4.8, 4.8, 4.9, 5.0, 5.0, 5.1, 5.1, 5.2, 5.2,
+                             14.8, 14.7, 14.6, 14.5, 14.4, 14.3, 14.2, 14.2, 14.1, 14.0, 14.0, 14.0,
+                             5.2, 5.1, 5.1, 5.0, 5.0, 4.9, 4.9, 4.9, 4.8, 4.8, 4.8, 4.8]
+                })
+                
+                share_lines = alt.Chart(share_trend_data).mark_line(strokeWidth=2, point=True).encode(
+                    x=alt.X('Month:N', sort=alt.EncodingSortField(field='MonthOrder'), title=None, axis=alt.Axis(labelAngle=-45)),
+                    y=alt.Y('Share:Q', scale=alt.Scale(domain=[0, 20]), title='Share %'),
+                    color=alt.Color('Carrier:N', scale=alt.Scale(
+                        domain=['SnowTelco', 'Three', 'Others'],
+                        range=['#29B5E8', '#EF4444', '#9CA3AF']
+                    ), legend=alt.Legend(orient='bottom', title=None)),
+                    order='MonthOrder:Q',
+                    tooltip=['Month:N', 'Carrier:N', alt.Tooltip('Share:Q', format='.1f')]
+                ).properties(height=160)
+                
+                charts.altair_chart(share_lines, use_container_width=True)
+        
+        with arpu_col:
+            st.markdown('<div class="section-header">ARPU Comparison</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                arpu_data = pd.DataFrame({
+                    'Carrier': ['EE', 'Vodafone', 'SnowTelco', 'O2', 'Three'],
+                    'ARPU': [48.20, 44.80, 43.60, 42.10, 38.40]
+                })
+                
+                arpu_bars = alt.Chart(arpu_data).mark_bar(cornerRadiusTopRight=8, cornerRadiusBottomRight=8).encode(
+                    y=alt.Y('Carrier:N', sort=alt.EncodingSortField(field='ARPU', order='descending'), title=None),
+                    x=alt.X('ARPU:Q', scale=alt.Scale(domain=[0, 55]), title='ARPU (£)'),
+                    color=alt.condition(alt.datum.Carrier == 'SnowTelco', alt.value('#29B5E8'), alt.value('#9CA3AF')),
+                    tooltip=['Carrier:N', alt.Tooltip('ARPU:Q', format='£.2f')]
+                ).properties(height=160)
+                
+                charts.altair_chart(arpu_bars, use_container_width=True)
+        
+        col_left, col_right = st.columns([1.3, 1])
+        
+        with col_left:
+            st.markdown('<div class="section-header">Competitor Market Share</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                market_data = pd.DataFrame({
+                    'Carrier': ['EE', 'O2', 'Vodafone', 'Three', 'SnowTelco', 'Others'],
+                    'Share': [28, 26, 22, 14, 5.2, 4.8],
+                    'Trend': ['+0.2%', '-0.4%', '+0.1%', '-0.3%', '+0.4%', '0%']
+                })
+                
+                bars = alt.Chart(market_data).mark_bar(cornerRadiusTopRight=8, cornerRadiusBottomRight=8).encode(
+                    y=alt.Y('Carrier:N', sort=alt.EncodingSortField(field='Share', order='descending'), title=None),
+                    x=alt.X('Share:Q', scale=alt.Scale(domain=[0, 35]), title='Market Share (%)'),
+                    color=alt.condition(alt.datum.Carrier == 'SnowTelco', alt.value('#29B5E8'), alt.value('#9CA3AF')),
+                    tooltip=['Carrier:N', alt.Tooltip('Share:Q', format='.1f'), 'Trend:N']
+                ).properties(height=200)
+                
+                charts.altair_chart(bars, use_container_width=True)
+        
+        with col_right:
+            st.markdown('<div class="section-header">Competitive Threats</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="padding: 0.6rem; border-left: 4px solid #EF4444; background: #FEE2E2; border-radius: 0 8px 8px 0; margin-bottom: 0.5rem;">
+                        <div style="font-weight: 600; color: #DC2626;">Three Price War</div>
+                        <div style="font-size: 0.75rem; color: #6B7280;">Aggressive SMB pricing -15%</div>
+                    </div>
+                    <div style="padding: 0.6rem; border-left: 4px solid #F59E0B; background: #FEF3C7; border-radius: 0 8px 8px 0; margin-bottom: 0.5rem;">
+                        <div style="font-weight: 600; color: #92400E;">EE 5G Expansion</div>
+                        <div style="font-size: 0.75rem; color: #6B7280;">+200 sites in our key regions</div>
+                    </div>
+                    <div style="padding: 0.6rem; border-left: 4px solid #10B981; background: #D1FAE5; border-radius: 0 8px 8px 0;">
+                        <div style="font-weight: 600; color: #065F46;">Opportunity: Three Churn</div>
+                        <div style="font-size: 0.75rem; color: #6B7280;">+167 port-ins this quarter</div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Pricing & Offer Dynamics</div>', unsafe_allow_html=True)
+        price_col1, price_col2 = st.columns(2)
+        
+        with price_col1:
+            st.markdown("**Promo Intensity by Competitor**")
+            with st.container(border=True):
+                promo_df = pd.DataFrame({
+                    'Competitor': ['EE', 'O2', 'Vodafone', 'Three', 'SnowTelco'],
+                    'Intensity': [78, 64, 59, 85, 52]
+                })
+                promo_bar = alt.Chart(promo_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Intensity:Q', title='Promo Intensity'),
+                    y=alt.Y('Competitor:N', sort='-x', title=None),
+                    color=alt.condition(alt.datum.Competitor == 'SnowTelco', alt.value('#29B5E8'), alt.value('#9CA3AF')),
+                    tooltip=['Competitor:N', 'Intensity:Q']
+                ).properties(height=180)
+                charts.altair_chart(promo_bar, use_container_width=True)
+        
+        with price_col2:
+            st.markdown("**Offer Mix (New Activations)**")
+            with st.container(border=True):
+                offer_df = pd.DataFrame({
+                    'Offer': ['SIM Only', 'Handset', '5G Premium', 'Family'],
+                    'Share': [42, 26, 18, 14]
+                }).set_index('Offer')
+                st.bar_chart(offer_df, height=180)
+        
+
+    with tab_strategy:
+        st.markdown("""
+        <div class="sf-strategy-pulse">
+            <div class="sf-strategy-header">
+                <div class="sf-strategy-title">❄️ Snowflake Intelligence Pulse</div>
+                <div class="sf-strategy-tag">AI LIVE</div>
+            </div>
+            <div class="sf-strategy-grid">
+                <div class="sf-strategy-card">
+                    <div class="sf-strategy-label">Share Gap</div>
+                    <div class="sf-strategy-value">0.8%</div>
+                </div>
+                <div class="sf-strategy-card">
+                    <div class="sf-strategy-label">Port-in Lift</div>
+                    <div class="sf-strategy-value">+167</div>
+                </div>
+                <div class="sf-strategy-card">
+                    <div class="sf-strategy-label">ARPU Lead</div>
+                    <div class="sf-strategy-value">£4.20</div>
+                </div>
+                <div class="sf-strategy-card">
+                    <div class="sf-strategy-label">Threat Level</div>
+                    <div class="sf-strategy-value">Medium</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+
+        st.markdown('<div class="section-header">AI Executive Summary</div>', unsafe_allow_html=True)
+        if st.session_state.get('sf_highlights', True):
+            st.info("❄️ **Snowflake Intelligence** shows steady share gains but a 0.8% gap to the 6% target. ARPU leadership is strong, while competitor price pressure remains elevated in SMB. Focused win‑back and 5G differentiation can accelerate share momentum.")
+
+        st.markdown('<div class="section-header">Signals & Insights</div>', unsafe_allow_html=True)
+        sig_col1, sig_col2, sig_col3 = st.columns(3)
+        with sig_col1:
+            with st.container(border=True):
+                st.markdown("**Share Momentum**")
+                st.caption("SnowTelco share trends +0.4% YoY; Three declining for 4 straight quarters.")
+        with sig_col2:
+            with st.container(border=True):
+                st.markdown("**ARPU Advantage**")
+                st.caption("ARPU sits £4.20 above market average, supported by premium 5G bundles.")
+        with sig_col3:
+            with st.container(border=True):
+                st.markdown("**Competitive Pressure**")
+                st.caption("SMB price pressure intensifies; targeted discounts needed to protect margin.")
+
+        st.markdown('<div class="section-header">AI-Powered Strategic Recommendations</div>', unsafe_allow_html=True)
+        rec_col1, rec_col2, rec_col3 = st.columns(3)
+        with rec_col1:
+            with st.container(border=True):
+                st.markdown("**Win‑Back Acceleration**")
+                st.caption("Target 3,200 churners with 5G‑plus bundles; projected +0.3% share lift.")
+        with rec_col2:
+            with st.container(border=True):
+                st.markdown("**SMB Pricing Guardrails**")
+                st.caption("Deploy segmented pricing to counter Three without eroding ARPU leadership.")
+        with rec_col3:
+            with st.container(border=True):
+                st.markdown("**5G Differentiation**")
+                st.caption("Lead with coverage + value messaging in top 5 growth regions.")
+
+        st.markdown('<div class="section-header">VP Strategy Strategic Priorities — Q1 2026</div>', unsafe_allow_html=True)
+        
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #DC2626; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 1</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">6% Market Share</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **5.2%** share
+                - Gap: **0.8%** to target
+                - Focus: SMB segment
+                - Action: Competitive pricing
+                """)
+        with col2:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #F59E0B; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 2</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Three Win-Back</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Opportunity: **3,200** churners
+                - Target: **500** acquisitions
+                - Campaign: March 2026
+                - Budget: **£120K** approved
+                """)
+        with col3:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #10B981; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 3</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">5G Differentiation</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Coverage: **65%** UK pop.
+                - USP: Best value 5G
+                - Marketing: Q1 campaign
+                - Investment: **£2.4M** capex
+                """)
+        
+        st.markdown('<div class="section-header">Ask Snowflake Intelligence</div>', unsafe_allow_html=True)
+        questions = ["What's our market share vs competitors?", "How has our market share trended?", "How does our ARPU compare to competitors?", "Which competitors are gaining/losing share?"]
+        sf_intel_url = "https://ai.snowflake.com/sfseeurope/pjose_aws3"
+        cols = st.columns(2)
+        for i, q in enumerate(questions):
+            with cols[i % 2]:
+                escaped_q = q.replace('"', '&quot;').replace("'", "&#39;")
+                st.markdown(f"""
+                <a href="{sf_intel_url}" target="_blank" onclick="navigator.clipboard.writeText('{escaped_q}')" style="text-decoration: none; color: inherit; display: block;">
+                    <div class="question-card">
+                        <p style="margin-bottom: 1.5rem;"><strong>Q{i+1}:</strong> "{q}"</p>
+                    </div>
+                </a>
+                """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div style="text-align: center; margin-top: 1rem; padding: 1rem; background: linear-gradient(135deg, #29B5E8 0%, #1A8BC4 100%); border-radius: 8px;">
+            <a href="{sf_intel_url}" target="_blank" style="color: white; text-decoration: none; font-weight: 600; font-size: 1rem;">
+                ❄️ Ask these questions in Snowflake Intelligence →
+            </a>
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,537 @@
+"""VP Wholesale dashboard."""
+
+import streamlit as st
+import pandas as pd
+import altair as alt
+
+from dashboard import charts
+
+
+def render_vp_wholesale():
+    import pandas as pd
+    import altair as alt
+    
+    st.markdown("""
+    <div class="main-header">
+        <h1>VP Wholesale & MVNO Dashboard</h1>
+        <p>MVNO Traffic, Wholesale Revenue & Partner Settlements</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    # Dashboard Tabs
+    tab_overview, tab_ops, tab_strategy = st.tabs(["📊 Overview & Analysis", "📶 Wholesale Operations", "❄️ Snowflake Intelligence"])
+
+    with tab_overview:
+        
+        views_html = " ".join([f'<span class="semantic-view-badge">{v}</span>' for v in ['WHOLESALE_MVNO']])
+        st.markdown(f'<div style="margin-bottom: 1.5rem;">{views_html}</div>', unsafe_allow_html=True)
+        
+        # VP WHOLESALE - TRAFFIC FLOW ANIMATION
+        st.markdown("""<div class="wholesale-flow"><div class="flow-header"><div class="flow-title">🔄 MVNO Traffic Flow</div><div class="flow-live">● Live Traffic</div></div><div class="traffic-visual"><div class="partner-node mvno1">📱</div><div class="traffic-pipe"><div class="traffic-packet"></div><div class="traffic-packet" style="animation-delay:0.5s"></div></div><div class="core-node">SnowTelco Core</div><div class="traffic-pipe"><div class="traffic-packet" style="animation-delay:0.3s"></div><div class="traffic-packet" style="animation-delay:0.8s"></div></div><div class="partner-node mvno2">📱</div><div class="partner-node mvno3">📱</div></div><div class="wholesale-stats"><div class="ws-stat"><div class="ws-val">12</div><div class="ws-label">MVNO Partners</div></div><div class="ws-stat"><div class="ws-val">847K</div><div class="ws-label">Wholesale Subs</div></div><div class="ws-stat"><div class="ws-val">£2.4M</div><div class="ws-label">Monthly Revenue</div></div><div class="ws-stat"><div class="ws-val">142TB</div><div class="ws-label">Traffic Today</div></div></div></div>""", unsafe_allow_html=True)
+        
+        
+        st.markdown('<div class="section-header">Wholesale Overview</div>', unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #29B5E8;">
+                <div class="kpi-icon">🤝</div>
+                <div class="kpi-label">MVNO Partners</div>
+                <div class="kpi-value">12</div>
+                <div class="kpi-delta positive">Active contracts</div>
+            </div>
+            <div class="kpi-card" style="--accent: #10B981;">
+                <div class="kpi-icon">💰</div>
+                <div class="kpi-label">Wholesale Revenue</div>
+                <div class="kpi-value">£4.2M</div>
+                <div class="kpi-delta positive">↑ +18% YoY</div>
+            </div>
+            <div class="kpi-card" style="--accent: #F59E0B;">
+                <div class="kpi-icon">📊</div>
+                <div class="kpi-label">Data Traffic</div>
+                <div class="kpi-value">842 TB</div>
+                <div class="kpi-delta positive">↑ +40% YoY</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EF4444;">
+                <div class="kpi-icon">⚠️</div>
+                <div class="kpi-label">Overdue Settlements</div>
+                <div class="kpi-value">£124K</div>
+                <div class="kpi-delta negative">3 partners</div>
+            </div>
+        </div>
+        <div class="kpi-grid">
+            <div class="kpi-card" style="--accent: #8B5CF6;">
+                <div class="kpi-icon">📞</div>
+                <div class="kpi-label">Voice Minutes</div>
+                <div class="kpi-value">42M</div>
+                <div class="kpi-delta positive">MTD</div>
+            </div>
+            <div class="kpi-card" style="--accent: #14B8A6;">
+                <div class="kpi-icon">💬</div>
+                <div class="kpi-label">SMS Volume</div>
+                <div class="kpi-value">18M</div>
+                <div class="kpi-delta positive">↑ +8% MoM</div>
+            </div>
+            <div class="kpi-card" style="--accent: #EC4899;">
+                <div class="kpi-icon">👥</div>
+                <div class="kpi-label">MVNO Subscribers</div>
+                <div class="kpi-value">284K</div>
+                <div class="kpi-delta positive">On our network</div>
+            </div>
+            <div class="kpi-card" style="--accent: #6366F1;">
+                <div class="kpi-icon">📈</div>
+                <div class="kpi-label">Avg ARPU</div>
+                <div class="kpi-value">£4.80</div>
+                <div class="kpi-delta positive">Per sub/month</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # New: Traffic Trend and Partner Growth
+        traffic_col, growth_col = st.columns(2)
+        
+        with traffic_col:
+            st.markdown('<div class="section-header">Traffic Trend (6 Months)</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                traffic_trend = pd.DataFrame({
+                    'Month': months * 3,
+                    'Type': ['Voice']*6 + ['SMS']*6 + ['Data']*6,
+                    'Volume': [38, 39, 40, 40, 41, 42,
+                              15, 16, 16, 17, 17, 18,
+                              620, 680, 720, 760, 800, 842]
+                })
+                
+                # Normalize data for display
+                traffic_lines = alt.Chart(traffic_trend[traffic_trend['Type'] != 'Data']).mark_line(strokeWidth=2).encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('Volume:Q', title='Voice/SMS (M)'),
+                    color=alt.Color('Type:N', scale=alt.Scale(
+                        domain=['Voice', 'SMS'],
+                        range=['#29B5E8', '#10B981']
+                    ), legend=alt.Legend(orient='bottom', title=None)),
+                    tooltip=['Month:N', 'Type:N', 'Volume:Q']
+                ).properties(height=160)
+                
+                charts.altair_chart(traffic_lines, use_container_width=True)
+        
+        with growth_col:
+            st.markdown('<div class="section-header">Wholesale Revenue Trend</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                rev_df = pd.DataFrame({
+                    'Month': months,
+                    'Revenue': [3.2, 3.4, 3.6, 3.8, 4.0, 4.2]
+                })
+                rev_line = alt.Chart(rev_df).mark_line(point=True, color='#10B981', strokeWidth=2).encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('Revenue:Q', title='£M'),
+                    tooltip=['Month:N', alt.Tooltip('Revenue:Q', format='.1f')]
+                ).properties(height=160)
+                charts.altair_chart(rev_line, use_container_width=True)
+
+        st.markdown('<div class="section-header">Partner Economics</div>', unsafe_allow_html=True)
+        econ_col1, econ_col2 = st.columns(2)
+        
+        with econ_col1:
+            st.markdown("**ARPU by Partner**")
+            with st.container(border=True):
+                arpu_df = pd.DataFrame({
+                    'Partner': ['Tesco', 'GiffGaff', 'Lebara', 'Lyca', 'iD'],
+                    'ARPU': [5.4, 4.9, 4.6, 4.2, 3.9]
+                })
+                arpu_bar = alt.Chart(arpu_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('ARPU:Q', title='£/sub'),
+                    y=alt.Y('Partner:N', sort='-x', title=None),
+                    color=alt.value('#6366F1'),
+                    tooltip=['Partner:N', alt.Tooltip('ARPU:Q', format='.1f')]
+                ).properties(height=170)
+                charts.altair_chart(arpu_bar, use_container_width=True)
+        
+        with econ_col2:
+            st.markdown("**Subscriber Share by Partner**")
+            with st.container(border=True):
+                share_df = pd.DataFrame({
+                    'Partner': ['Tesco', 'GiffGaff', 'Lebara', 'Lyca', 'iD'],
+                    'Share': [34, 22, 18, 14, 12]
+                })
+                share_arc = alt.Chart(share_df).mark_arc(innerRadius=55).encode(
+                    theta=alt.Theta('Share:Q', title=None),
+                    color=alt.Color('Partner:N', legend=None, scale=alt.Scale(
+                        range=['#29B5E8', '#10B981', '#F59E0B', '#8B5CF6', '#EC4899']
+                    )),
+                    tooltip=['Partner:N', alt.Tooltip('Share:Q', format='.0f')]
+                ).properties(height=170)
+                charts.altair_chart(share_arc, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Roaming & Cost Signals</div>', unsafe_allow_html=True)
+        roam_col1, roam_col2 = st.columns(2)
+        
+        with roam_col1:
+            st.markdown("**Roaming Revenue Mix**")
+            with st.container(border=True):
+                roam_df = pd.DataFrame({
+                    'Type': ['Inbound', 'Outbound', 'Domestic'],
+                    'Share': [18, 12, 70]
+                })
+                roam_arc = alt.Chart(roam_df).mark_arc(innerRadius=55).encode(
+                    theta=alt.Theta('Share:Q', title=None),
+                    color=alt.Color('Type:N', legend=None, scale=alt.Scale(
+                        range=['#F59E0B', '#29B5E8', '#10B981']
+                    )),
+                    tooltip=['Type:N', alt.Tooltip('Share:Q', format='.0f')]
+                ).properties(height=170)
+                charts.altair_chart(roam_arc, use_container_width=True)
+        
+        with roam_col2:
+            st.markdown("**Cost per GB by Partner**")
+            with st.container(border=True):
+                cost_df = pd.DataFrame({
+                    'Partner': ['Tesco', 'GiffGaff', 'Lebara', 'Lyca', 'iD'],
+                    'Cost': [0.42, 0.38, 0.46, 0.51, 0.55]
+                })
+                cost_bar = alt.Chart(cost_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Cost:Q', title='£/GB'),
+                    y=alt.Y('Partner:N', sort='-x', title=None),
+                    color=alt.value('#6366F1'),
+                    tooltip=['Partner:N', alt.Tooltip('Cost:Q', format='.2f')]
+                ).properties(height=170)
+                charts.altair_chart(cost_bar, use_container_width=True)
+        
+    with tab_ops:
+        st.markdown("""
+        <div class="ws-ops-pulse">
+            <div class="ws-ops-header">
+                <div class="ws-ops-title">📶 Wholesale Ops Pulse</div>
+                <div class="ws-ops-tag">LIVE OPS</div>
+            </div>
+            <div class="ws-ops-grid">
+                <div class="ws-ops-card">
+                    <div class="ws-ops-label">Partner Tickets</div>
+                    <div class="ws-ops-value">28</div>
+                    <div class="ws-ops-delta">Open</div>
+                </div>
+                <div class="ws-ops-card">
+                    <div class="ws-ops-label">Settlement Risk</div>
+                    <div class="ws-ops-value">£124K</div>
+                    <div class="ws-ops-delta">Overdue</div>
+                </div>
+                <div class="ws-ops-card">
+                    <div class="ws-ops-label">Traffic SLA</div>
+                    <div class="ws-ops-value">99.3%</div>
+                    <div class="ws-ops-delta">Last 7d</div>
+                </div>
+                <div class="ws-ops-card">
+                    <div class="ws-ops-label">Margin</div>
+                    <div class="ws-ops-value">42%</div>
+                    <div class="ws-ops-delta">Target 45%</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">Partner Growth & Mix</div>', unsafe_allow_html=True)
+        mix_col1, mix_col2 = st.columns(2)
+        
+        with mix_col1:
+            st.markdown("**Partner YoY Growth**")
+            with st.container(border=True):
+                growth_df = pd.DataFrame({
+                    'Partner': ['GiffGaff', 'Tesco', 'Lebara', 'Lyca', 'iD'],
+                    'Growth': [24, 18, 12, 8, -5]
+                })
+                growth_bar = alt.Chart(growth_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Growth:Q', title='YoY %'),
+                    y=alt.Y('Partner:N', sort='-x', title=None),
+                    color=alt.condition(alt.datum.Growth > 0, alt.value('#10B981'), alt.value('#EF4444')),
+                    tooltip=['Partner:N', alt.Tooltip('Growth:Q', format='.0f')]
+                ).properties(height=170)
+                charts.altair_chart(growth_bar, use_container_width=True)
+        
+        with mix_col2:
+            st.markdown("**Traffic Mix by Type**")
+            with st.container(border=True):
+                mix_df = pd.DataFrame({
+                    'Type': ['Voice', 'SMS', 'Data'],
+                    'Share': [22, 8, 70]
+                })
+                mix_arc = alt.Chart(mix_df).mark_arc(innerRadius=55).encode(
+                    theta=alt.Theta('Share:Q', title=None),
+                    color=alt.Color('Type:N', legend=None, scale=alt.Scale(
+                        range=['#29B5E8', '#10B981', '#6366F1']
+                    )),
+                    tooltip=['Type:N', alt.Tooltip('Share:Q', format='.0f')]
+                ).properties(height=190)
+                charts.altair_chart(mix_arc, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Partner SLA & Tickets</div>', unsafe_allow_html=True)
+        sla_col1, sla_col2 = st.columns(2)
+        
+        with sla_col1:
+            st.markdown("**Partner SLA Trend (Monthly)**")
+            with st.container(border=True):
+                months = ['Aug', 'Sep', 'Oct', 'Nov', 'Dec', 'Jan']
+                sla_df = pd.DataFrame({
+                    'Month': months,
+                    'SLA': [98.7, 98.9, 99.0, 99.1, 99.2, 99.3]
+                })
+                sla_line = alt.Chart(sla_df).mark_line(point=True, color='#10B981', strokeWidth=2).encode(
+                    x=alt.X('Month:N', sort=months, title=None),
+                    y=alt.Y('SLA:Q', title='%'),
+                    tooltip=['Month:N', alt.Tooltip('SLA:Q', format='.1f')]
+                ).properties(height=170)
+                charts.altair_chart(sla_line, use_container_width=True)
+        
+        with sla_col2:
+            st.markdown("**Ticket Volume by Partner**")
+            with st.container(border=True):
+                ticket_df = pd.DataFrame({
+                    'Partner': ['Tesco', 'GiffGaff', 'Lebara', 'Lyca', 'iD'],
+                    'Tickets': [6, 5, 8, 4, 5]
+                })
+                ticket_bar = alt.Chart(ticket_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Tickets:Q', title='Tickets'),
+                    y=alt.Y('Partner:N', sort='-x', title=None),
+                    color=alt.value('#F59E0B'),
+                    tooltip=['Partner:N', 'Tickets:Q']
+                ).properties(height=170)
+                charts.altair_chart(ticket_bar, use_container_width=True)
+        
+        st.markdown('<div class="section-header">Settlement & Margin Ops</div>', unsafe_allow_html=True)
+        settle_col1, settle_col2 = st.columns(2)
+        
+        with settle_col1:
+            st.markdown("**Settlement Aging**")
+            with st.container(border=True):
+                aging_df = pd.DataFrame({
+                    'Bucket': ['0-15d', '16-30d', '31-60d', '60d+'],
+                    'Amount': [2.4, 0.24, 0.12, 0.06]
+                })
+                aging_bar = alt.Chart(aging_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Amount:Q', title='£M'),
+                    y=alt.Y('Bucket:N', sort='-x', title=None),
+                    color=alt.value('#F59E0B'),
+                    tooltip=['Bucket:N', alt.Tooltip('Amount:Q', format='.2f')]
+                ).properties(height=170)
+                charts.altair_chart(aging_bar, use_container_width=True)
+        
+        with settle_col2:
+            st.markdown("**Margin by Service**")
+            with st.container(border=True):
+                margin_df = pd.DataFrame({
+                    'Service': ['Voice', 'SMS', 'Data', 'Roaming'],
+                    'Margin': [38, 44, 41, 32]
+                })
+                margin_bar = alt.Chart(margin_df).mark_bar(cornerRadiusTopRight=6, cornerRadiusBottomRight=6).encode(
+                    x=alt.X('Margin:Q', title='%'),
+                    y=alt.Y('Service:N', sort='-x', title=None),
+                    color=alt.value('#29B5E8'),
+                    tooltip=['Service:N', alt.Tooltip('Margin:Q', format='.0f')]
+                ).properties(height=170)
+                charts.altair_chart(margin_bar, use_container_width=True)
+        
+        col_left, col_right = st.columns([1.3, 1])
+        
+        with col_left:
+            st.markdown('<div class="section-header">Top MVNO Partners</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Tesco Mobile</span><span style="font-weight: 600;">£1.42M (98K)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #29B5E8; width: 100%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Lebara</span><span style="font-weight: 600;">£0.98M (72K)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #29B5E8; width: 69%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>Lycamobile</span><span style="font-weight: 600;">£0.72M (54K)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #29B5E8; width: 51%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div style="margin-bottom: 0.6rem;">
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>GiffGaff</span><span style="font-weight: 600;">£0.54M (38K)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #29B5E8; width: 38%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                    <div>
+                        <div style="display: flex; justify-content: space-between; margin-bottom: 0.2rem;">
+                            <span>iD Mobile</span><span style="font-weight: 600;">£0.34M (22K)</span>
+                        </div>
+                        <div style="background: #E5E7EB; border-radius: 4px; height: 18px;">
+                            <div style="background: #29B5E8; width: 24%; height: 100%; border-radius: 4px;"></div>
+                        </div>
+                    </div>
+                </div>
+                """, unsafe_allow_html=True)
+        
+        with col_right:
+            st.markdown('<div class="section-header">Settlement Status</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.markdown("""
+                <div style="font-size: 0.85rem;">
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Current (Paid)</span>
+                        <span style="background: #D1FAE5; color: #065F46; padding: 0.2rem 0.5rem; border-radius: 12px;">£3.84M</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0; border-bottom: 1px solid #E5E7EB;">
+                        <span>Pending (<30 days)</span>
+                        <span style="background: #FEF3C7; color: #92400E; padding: 0.2rem 0.5rem; border-radius: 12px;">£242K</span>
+                    </div>
+                    <div style="display: flex; justify-content: space-between; padding: 0.5rem 0;">
+                        <span>Overdue (>30 days)</span>
+                        <span style="background: #FEE2E2; color: #DC2626; padding: 0.2rem 0.5rem; border-radius: 12px;">£124K</span>
+                    </div>
+                </div>
+                <div style="margin-top: 0.75rem; padding: 0.5rem; background: #FEE2E2; border-radius: 8px; font-size: 0.75rem; text-align: center;">
+                    <span style="color: #DC2626;">⚠️ Lebara: 45 days overdue (£68K)</span>
+                </div>
+                """, unsafe_allow_html=True)
+
+    with tab_strategy:
+        st.markdown("""
+        <div class="sf-ws-pulse">
+            <div class="sf-ws-header">
+                <div class="sf-ws-title">❄️ Snowflake Intelligence Pulse</div>
+                <div class="sf-ws-tag">AI INSIGHTS</div>
+            </div>
+            <div class="sf-ws-grid">
+                <div class="sf-ws-card">
+                    <div class="sf-ws-label">Revenue Run-Rate</div>
+                    <div class="sf-ws-value">£4.2M</div>
+                    <div class="sf-ws-delta">↑ +18% YoY</div>
+                </div>
+                <div class="sf-ws-card">
+                    <div class="sf-ws-label">Settlement Risk</div>
+                    <div class="sf-ws-value">£124K</div>
+                    <div class="sf-ws-delta">3 partners</div>
+                </div>
+                <div class="sf-ws-card">
+                    <div class="sf-ws-label">Traffic Growth</div>
+                    <div class="sf-ws-value">+40%</div>
+                    <div class="sf-ws-delta">Data YoY</div>
+                </div>
+                <div class="sf-ws-card">
+                    <div class="sf-ws-label">Margin</div>
+                    <div class="sf-ws-value">42%</div>
+                    <div class="sf-ws-delta">Target 45%</div>
+                </div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('<div class="section-header">AI Executive Summary</div>', unsafe_allow_html=True)
+        st.info("Wholesale revenue continues to climb on strong data traffic growth, but settlement risk remains concentrated in three partners. Margin performance is healthy at 42% yet below target; contract renewal and pricing optimization on high-usage MVNOs can lift profitability. Focus on accelerating IoT MVNO pipeline and tightening overdue enforcement to secure Q1 goals.")
+        
+        st.markdown('<div class="section-header">Signals & Insights</div>', unsafe_allow_html=True)
+        sig_col1, sig_col2, sig_col3 = st.columns(3)
+        with sig_col1:
+            with st.container(border=True):
+                st.markdown("**Partner Growth Leaders**")
+                st.caption("GiffGaff and Tesco account for 60% of net subscriber gains this quarter.")
+        with sig_col2:
+            with st.container(border=True):
+                st.markdown("**Settlement Risk**")
+                st.caption("Overdue exposure is concentrated in one partner; 45+ days past due.")
+        with sig_col3:
+            with st.container(border=True):
+                st.markdown("**Traffic Mix Shift**")
+                st.caption("Data now represents 70% of traffic with accelerating roaming usage.")
+        
+        st.markdown('<div class="section-header">AI‑Powered Strategic Recommendations</div>', unsafe_allow_html=True)
+        rec_col1, rec_col2, rec_col3 = st.columns(3)
+        with rec_col1:
+            with st.container(border=True):
+                st.markdown("**Incentivize Data Growth**")
+                st.caption("Introduce tiered volume pricing to capture upside from heavy-usage MVNOs.")
+        with rec_col2:
+            with st.container(border=True):
+                st.markdown("**Automate Settlement Controls**")
+                st.caption("Trigger auto-suspend workflows at 30+ day overdue thresholds.")
+        with rec_col3:
+            with st.container(border=True):
+                st.markdown("**Accelerate IoT MVNO Pipeline**")
+                st.caption("Prioritize IoT partner onboarding to unlock £600K incremental revenue.")
+        
+        st.markdown('<div class="section-header">Strategic Priorities</div>', unsafe_allow_html=True)
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #DC2626; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 1</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Revenue £5M</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Current: **£4.2M** revenue
+                - Gap: **£800K** to target
+                - Focus: Data traffic growth
+                - Action: Partner incentives
+                """)
+        with col2:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #F59E0B; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 2</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">Zero Overdue</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Overdue: **£124K** current
+                - Target: **Zero** by Feb
+                - Action: Lebara escalation
+                - Process: Auto-suspend policy
+                """)
+        with col3:
+            with st.container(border=True):
+                st.markdown("""
+                <div style="display: flex; align-items: center; margin-bottom: 0.75rem;">
+                    <span style="background: #10B981; color: white; padding: 0.25rem 0.75rem; border-radius: 20px; font-size: 0.7rem; font-weight: 600;">PRIORITY 3</span>
+                </div>
+                <h4 style="color: #1B2A4E; margin: 0 0 0.5rem 0;">New MVNO Partner</h4>
+                """, unsafe_allow_html=True)
+                st.markdown("""
+                - Pipeline: **3** prospects
+                - Target: **1** signed Q1
+                - Focus: IoT MVNO
+                - Revenue: **£600K** potential
+                """)
+        
+        st.markdown('<div class="section-header">Ask Snowflake Intelligence</div>', unsafe_allow_html=True)
+        questions = ["What is our MVNO partner portfolio and revenue?", "Show me MVNO traffic trends by partner.", "Which partners have overdue settlements?", "Which MVNOs are growing fastest?"]
+        sf_intel_url = "https://ai.snowflake.com/sfseeurope/pjose_aws3"
+        cols = st.columns(2)
+        for i, q in enumerate(questions):
+            with cols[i % 2]:
+                escaped_q = q.replace('"', '&quot;').replace("'", "&#39;")
+                st.markdown(f"""
+                <a href="{sf_intel_url}" target="_blank" onclick="navigator.clipboard.writeText('{escaped_q}')" style="text-decoration: none; color: inherit; display: block;">
+                    <div class="question-card">
+                        <p style="margin-bottom: 1.5rem;"><strong>Q{i+1}:</strong> "{q}"</p>
+                    </div>
+                </a>
+                """, unsafe_allow_html=True)
+        
+        st.markdown(f"""
+        <div style="text-align: center; margin-top: 1rem; padding: 1rem; background: linear-gradient(135deg, #29B5E8 0%, #1A8BC4 100%); border-radius: 8px;">
+            <a href="{sf_intel_url}" target="_blank" style="color: white; text-decoration: none; font-weight: 600; font-size: 1rem;">
+                ❄️ Ask these questions in Snowflake Intelligence →
+            </a>
+        </div>
+        """, unsafe_allow_html=True)
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+SnowTelco KPI Cube Builder
+==========================
+Builds or refreshes demo_data/kpi_cube/<backend>.parquet, the month x region x
+segment x plan cube behind the Executive Showcase tiles (see dashboard/cube.py
+for its facts and measures).
+
+Without --full only each fact's latest stored month and anything after it
+are re-aggregated; on SQL backends (duckdb, snowpark) only those rows are
+read. Run it after appending a month of data so the first dashboard render
+does not pay for the refresh.
+
+Usage:
+    python scripts/build_kpi_cube.py
+    python scripts/build_kpi_cube.py --backend duckdb
+    python scripts/build_kpi_cube.py --full
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from dashboard import cube, data  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--backend', help=f'data backend (default: ${data.BACKEND_ENV} or {data.DEFAULT_BACKEND})')
+    parser.add_argument('--output', default=cube.CUBE_PATH, help='cube directory')
+    parser.add_argument('--full', action='store_true', help='rebuild from all fact rows')
+    args = parser.parse_args()
+    # st.cache_* warn about the missing script run context outside `streamlit run`
+    logging.getLogger('streamlit').setLevel(logging.ERROR)
+
+    backend = data.get_backend(args.backend)
+    start = time.perf_counter()
+    frame, refreshed, written = cube.refresh(backend, root=os.path.abspath(args.output), full=args.full)
+    elapsed = time.perf_counter() - start
+
+    print(f"KPI cube for the {backend.name} backend: {len(frame):,} rows in {elapsed:.2f}s")
+    for fact in cube.FACTS:
+        if fact.table not in refreshed:
+            print(f"  {fact.table:<20} not on this backend, kept {int((frame['source'] == fact.table).sum()):,} rows")
+            continue
+        months = refreshed[fact.table]
+        span = f"{months[0]}..{months[-1]}" if len(months) > 1 else (months[0] if months else 'no rows')
+        print(f"  {fact.table:<20} re-aggregated {len(months):>3} month(s) ({span})")
+    path = cube.cube_file(backend.name, os.path.abspath(args.output))
+    if not written:
+        sys.exit(f"✗ Could not write {path} (read-only file system or pyarrow missing)")
+    print(f"✓ Written to {os.path.relpath(path, REPO_ROOT)}")
+
+
+if __name__ == '__main__':
+    main()
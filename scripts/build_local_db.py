@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+SnowTelco Local Database Builder
+================================
+Builds demo_data/snowtelco.duckdb, an embedded DuckDB mirror of the
+SnowTelco_V2 schema, so the dashboard (SNOWTELCO_DATA_BACKEND=duckdb) and
+ad-hoc SQL can run without a Snowflake account.
+
+The build follows the Snowflake setup scripts rather than a separate schema:
+- tables and column types come from sql_scripts/03_create_tables.sql
+- the table -> file mapping comes from the COPY INTO statements in
+  sql_scripts/04_load_data.sql (and 13/10 for 2024/2025 history with
+  --with-history)
+- files are read with the CSV_FORMAT rules from 01_infrastructure.sql
+  (NULL_IF values, trimmed fields, short rows padded with NULLs) and matched
+  to the table by header name, and rows that fail a type cast or NOT NULL are
+  skipped, as ON_ERROR = 'CONTINUE' does in Snowflake (--keep-bad-values
+  loads such values as NULL instead)
+
+The database is written to a temp file and renamed into place, so readers
+never see a half-built file. A build signature (DDL, load scripts and CSV
+sizes/mtimes) is stored in the database; an unchanged build is skipped
+unless --force is given.
+
+Semantic views, Cortex Search and the agent are Snowflake features and are
+not mirrored; only the tables are.
+
+Usage:
+    python scripts/build_local_db.py
+    python scripts/build_local_db.py --with-history --force
+    python scripts/build_local_db.py --output /tmp/snowtelco.duckdb
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SQL_PATH = os.path.join(REPO_ROOT, 'sql_scripts')
+DEMO_DATA_PATH = os.path.join(REPO_ROOT, 'demo_data')
+DEFAULT_OUTPUT = os.path.join(DEMO_DATA_PATH, 'snowtelco.duckdb')
+
+DDL_SCRIPT = '03_create_tables.sql'
+LOAD_SCRIPT = '04_load_data.sql'
+HISTORY_SCRIPTS = {
+    # load script -> local folder for its stage path additional_data/<year>/
+    '13_load_2024_data.sql': os.path.join(DEMO_DATA_PATH, 'additional_data', '2024', 'csv'),
+    '10_load_2025_data.sql': os.path.join(DEMO_DATA_PATH, 'additional_data', '2025', 'csv'),
+}
+
+# CSV_FORMAT in 01_infrastructure.sql
+NULL_IF = ['NULL', 'null', '', 'N/A', 'n/a']
+
+BUILD_INFO_TABLE = '_build_info'
+
+_CREATE_RE = re.compile(r'CREATE\s+OR\s+REPLACE\s+TABLE\s+(\w+)\s*\(', re.IGNORECASE)
+_COPY_RE = re.compile(r'COPY\s+INTO\s+(\w+)\s*(?:\(([^)]*)\))?\s*FROM\s*(?:\(\s*SELECT\s+(.*?)\s+FROM\s+)?'
+                      r'@INTERNAL_DATA_STAGE/(\S+?\.csv)', re.IGNORECASE | re.DOTALL)
+_STAGE_COLUMN_RE = re.compile(r'\$(\d+)')
+_COLUMN_RE = re.compile(r'^("[^"]+"|\w+)\s+(\w+(?:\s*\([^)]*\))?)(.*)$', re.DOTALL)
+_DEFAULT_RE = re.compile(r'\bDEFAULT\s+(\'[^\']*\'|\S+)', re.IGNORECASE)
+
+
+def strip_comments(sql):
+    return '\n'.join(line.split('--', 1)[0] for line in sql.splitlines())
+
+
+def split_top_level(body):
+    """Split a column list on commas that are not inside parentheses or quotes."""
+    parts, depth, quote, start = [], 0, None, 0
+    for i, ch in enumerate(body):
+        if quote:
+            if ch == quote:
+                quote = None
+        elif ch in '\'"':
+            quote = ch
+        elif ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+        elif ch == ',' and depth == 0:
+            parts.append(body[start:i])
+            start = i + 1
+    parts.append(body[start:])
+    return [p.strip() for p in parts if p.strip()]
+
+
+def duckdb_type(snowflake_type):
+    """Map a Snowflake column type from the DDL to its DuckDB equivalent."""
+    base = snowflake_type.split('(')[0].strip().upper()
+    if base in ('INT', 'INTEGER', 'BIGINT', 'SMALLINT', 'NUMBER'):
+        return snowflake_type.upper().replace('NUMBER', 'DECIMAL') if '(' in snowflake_type else 'BIGINT'
+    if base in ('VARCHAR', 'STRING', 'TEXT', 'CHAR'):
+        return 'VARCHAR'
+    if base in ('FLOAT', 'DOUBLE', 'REAL'):
+        return 'DOUBLE'
+    if base in ('TIMESTAMP', 'TIMESTAMP_NTZ', 'DATETIME'):
+        return 'TIMESTAMP'
+    return snowflake_type.upper().replace(' ', '')
+
+
+def parse_tables(ddl):
+    """Return {table: [(column, duckdb_type, not_null, default)]} from CREATE TABLE statements."""
+    ddl = strip_comments(ddl)
+    tables = {}
+    for match in _CREATE_RE.finditer(ddl):
+        depth, pos = 1, match.end()
+        while depth:
+            depth += {'(': 1, ')': -1}.get(ddl[pos], 0)
+            pos += 1
+        columns = []
+        for item in split_top_level(ddl[match.end():pos - 1]):
+            if item.split()[0].upper() in ('CONSTRAINT', 'PRIMARY', 'FOREIGN', 'UNIQUE'):
+                continue
+            col = _COLUMN_RE.match(item)
+            name, col_type, rest = col.group(1).strip('"').lower(), col.group(2), col.group(3)
+            default = _DEFAULT_RE.search(rest)
+            columns.append((name, duckdb_type(col_type), 'NOT NULL' in rest.upper(),
+                            default.group(1) if default else None))
+        tables[match.group(1).lower()] = columns
+    return tables
+
+
+def parse_loads(sql, folder):
+    """Return [(table, local csv path, transform)] for the COPY INTO statements in a load script.
+
+    ``transform`` is None for a plain load, or a list of (column, expression)
+    pairs for a ``COPY INTO t (cols) FROM (SELECT $1, ... FROM @stage)`` load.
+    """
+    loads = []
+    for table, column_list, select_list, stage_path in _COPY_RE.findall(strip_comments(sql)):
+        filename = os.path.basename(stage_path)
+        if stage_path.startswith('demo_data/'):
+            path = os.path.join(REPO_ROOT, stage_path)
+        else:
+            path = os.path.join(folder, filename)
+        transform = None
+        if select_list:
+            columns = [c.strip().strip('"').lower() for c in split_top_level(column_list)]
+            transform = list(zip(columns, split_top_level(select_list)))
+        loads.append((table.lower(), path, transform))
+    return loads
+
+
+def read_script(name):
+    with open(os.path.join(SQL_PATH, name), encoding='utf-8') as f:
+        return f.read()
+
+
+def quote(name):
+    return '"' + name.replace('"', '""') + '"'
+
+
+def sql_string(value):
+    return "'" + value.replace("'", "''") + "'"
+
+
+def create_table_sql(table, columns):
+    defs = []
+    for name, col_type, not_null, default in columns:
+        definition = f'{quote(name)} {col_type}'
+        if default is not None:
+            definition += f' DEFAULT {default}'
+        defs.append(definition)
+    return f'CREATE TABLE {table} ({", ".join(defs)})'
+
+
+def cast_expr(raw, col_type):
+    if col_type == 'BIGINT':
+        # Snowflake accepts '3.0' (and rounds '2.5') for INT columns
+        return f'COALESCE(TRY_CAST({raw} AS BIGINT), TRY_CAST(ROUND(TRY_CAST({raw} AS DOUBLE)) AS BIGINT))'
+    if col_type == 'VARCHAR':
+        return raw
+    return f'TRY_CAST({raw} AS {col_type})'
+
+
+def csv_header(path):
+    with open(path, newline='', encoding='utf-8') as f:
+        return [name.strip().strip('"').lower() for name in next(csv.reader(f), [])]
+
+
+def load_file(con, table, columns, path, transform=None, keep_bad_values=False):
+    """Load one CSV into ``table``. Returns the number of rows read from the file.
+
+    When every header name is a column of the table the file is matched by
+    name (a few CSVs leave out trailing DDL columns, or order them
+    differently); otherwise it is loaded positionally like COPY INTO. A
+    transform load evaluates its ``$n`` expressions in DuckDB instead.
+    """
+    header = csv_header(path)
+    by_column = {c[0]: c for c in columns}
+    names = [f'c{i}' for i in range(len(header))]
+    if transform:
+        loaded = [by_column[name] for name, _ in transform]
+        raw_values = [_STAGE_COLUMN_RE.sub(lambda m: f'NULLIF(TRIM(c{int(m.group(1)) - 1}), \'\')', expr)
+                      for _, expr in transform]
+        raw_values = [f'CAST(({expr}) AS VARCHAR)' for expr in raw_values]
+    else:
+        if set(header) <= set(by_column):
+            loaded = [by_column[name] for name in header]
+        else:
+            loaded = columns[:len(header)]
+        raw_values = [f'NULLIF(TRIM(c{i}), \'\')' for i in range(len(loaded))]
+    source = (
+        f'read_csv({sql_string(path)}, header = true, all_varchar = true, quote = \'"\', escape = \'"\', '
+        f'nullstr = [{", ".join(sql_string(v) for v in NULL_IF)}], '
+        f'names = [{", ".join(sql_string(n) for n in names)}], null_padding = true, strict_mode = false)'
+    )
+    casts = [cast_expr(raw, col_type) for raw, (_, col_type, _, _) in zip(raw_values, loaded)]
+    checks = []
+    for raw, cast, (_, col_type, not_null, _) in zip(raw_values, casts, loaded):
+        if not_null:
+            checks.append(f'{cast} IS NOT NULL')
+        elif col_type != 'VARCHAR' and not keep_bad_values:
+            checks.append(f'({raw} IS NULL OR {cast} IS NOT NULL)')
+    # Columns the file does not have get their DEFAULT (or NULL); reject rows
+    # only when such a column is NOT NULL without a default.
+    missing = [c for c in columns if c not in loaded]
+    if any(not_null and default is None for _, _, not_null, default in missing):
+        checks.append('FALSE')
+    where = ' AND '.join(checks) or 'TRUE'
+    total = con.execute(f'SELECT COUNT(*) FROM {source}').fetchone()[0]
+    con.execute(
+        f'INSERT INTO {table} ({", ".join(quote(c[0]) for c in loaded)}) '
+        f'SELECT {", ".join(casts)} FROM {source} WHERE {where}'
+    )
+    return total
+
+
+def build_signature(scripts, files):
+    digest = hashlib.sha256()
+    with open(os.path.abspath(__file__), 'rb') as f:
+        digest.update(f.read())
+    for name in scripts:
+        digest.update(name.encode())
+        digest.update(read_script(name).encode())
+    for path in sorted(files):
+        stat = os.stat(path)
+        digest.update(f'{os.path.relpath(path, REPO_ROOT)}:{stat.st_size}:{stat.st_mtime_ns}'.encode())
+    return digest.hexdigest()
+
+
+def existing_signature(output):
+    import duckdb
+
+    if not os.path.exists(output):
+        return None
+    try:
+        with duckdb.connect(output, read_only=True) as con:
+            return con.execute(f'SELECT signature FROM {BUILD_INFO_TABLE}').fetchone()[0]
+    except duckdb.Error:
+        return None
+
+
+def build(output, with_history=False, force=False, keep_bad_values=False):
+    import duckdb
+
+    tables = parse_tables(read_script(DDL_SCRIPT))
+    scripts = [DDL_SCRIPT, LOAD_SCRIPT]
+    loads = parse_loads(read_script(LOAD_SCRIPT), DEMO_DATA_PATH)
+    if with_history:
+        for script, folder in HISTORY_SCRIPTS.items():
+            scripts.append(script)
+            loads.extend(parse_loads(read_script(script), folder))
+
+    present = [load for load in loads if os.path.exists(load[1]) and load[0] in tables]
+    missing = sorted({os.path.relpath(path, REPO_ROOT) for _, path, _ in loads if not os.path.exists(path)})
+    signature = build_signature(scripts, [path for _, path, _ in present])
+    if keep_bad_values:
+        signature += ':keep-bad-values'
+
+    if not force and existing_signature(output) == signature:
+        print(f"✓ {os.path.relpath(output, REPO_ROOT)} is up to date (use --force to rebuild)")
+        return
+
+    start = time.perf_counter()
+    tmp_output = output + '.tmp'
+    for stale in (tmp_output, tmp_output + '.wal'):
+        if os.path.exists(stale):
+            os.remove(stale)
+
+    stats = {}
+    with duckdb.connect(tmp_output) as con:
+        for table, columns in tables.items():
+            con.execute(create_table_sql(table, columns))
+        for table, path, transform in present:
+            before = con.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+            total = load_file(con, table, tables[table], path, transform, keep_bad_values)
+            after = con.execute(f'SELECT COUNT(*) FROM {table}').fetchone()[0]
+            rows, rejected = stats.get(table, (0, 0))
+            stats[table] = (rows + after - before, rejected + total - (after - before))
+        con.execute(f'CREATE TABLE {BUILD_INFO_TABLE} (signature VARCHAR, built_at TIMESTAMP, info VARCHAR)')
+        con.execute(
+            f'INSERT INTO {BUILD_INFO_TABLE} VALUES (?, current_timestamp, ?)',
+            [signature, json.dumps({'with_history': with_history, 'keep_bad_values': keep_bad_values, 'tables': stats, 'missing_files': missing})],
+        )
+        con.execute('CHECKPOINT')
+    os.replace(tmp_output, output)
+
+    elapsed = time.perf_counter() - start
+    for table, (rows, rejected) in sorted(stats.items()):
+        note = f'  ({rejected:,} rejected)' if rejected else ''
+        print(f"  {table:<40} {rows:>10,} rows{note}")
+    empty = sorted(set(tables) - set(stats))
+    print(f"\n✓ Built {os.path.relpath(output, REPO_ROOT)} in {elapsed:.1f}s: "
+          f"{len(stats)} tables loaded, {len(empty)} created empty")
+    if missing:
+        print(f"  {len(missing)} files referenced by the load scripts are not in the repo "
+              f"(e.g. {missing[0]}) and were skipped")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='database file to write')
+    parser.add_argument('--with-history', action='store_true', help='also load the 2024/2025 history files')
+    parser.add_argument('--keep-bad-values', action='store_true',
+                        help='load values that fail their column type as NULL instead of skipping the row')
+    parser.add_argument('--force', action='store_true', help='rebuild even if the inputs are unchanged')
+    args = parser.parse_args()
+    try:
+        import duckdb  # noqa: F401
+    except ImportError:
+        sys.exit('duckdb is required: pip install duckdb')
+    build(os.path.abspath(args.output), with_history=args.with_history, force=args.force,
+          keep_bad_values=args.keep_bad_values)
+
+
+if __name__ == '__main__':
+    main()
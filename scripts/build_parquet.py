@@ -0,0 +1,284 @@
+#!/usr/bin/env python3
+"""
+SnowTelco Parquet Builder
+=========================
+Converts every CSV under demo_data/ into compressed, typed Parquet under
+demo_data/parquet/ (the default root of the dashboard's parquet backend) and
+writes demo_data/parquet/manifest.json describing the result.
+
+- split files (foo_1.csv, foo_2.csv) become one foo.parquet
+- column types are inferred from the data, except that columns declared
+  VARCHAR in sql_scripts/03_create_tables.sql stay strings (IDs, ICCIDs,
+  postcodes keep their leading zeros); NULL_IF values from CSV_FORMAT are nulls
+- fact tables with a date column are sorted by it and split into row groups
+  on month boundaries, so row-group min/max statistics let readers skip
+  months; dimension tables (*_dim) keep their CSV row order
+- timestamps are stored in microseconds; files are ZSTD compressed
+
+The manifest records, per table: source CSVs with sha256, output file with
+sha256 and size, row count, schema, per-column null count and min/max, and
+the row groups with their date range. Tables whose sources are unchanged
+(same checksums) are skipped unless --force is given.
+
+Usage:
+    python scripts/build_parquet.py
+    python scripts/build_parquet.py --force
+    python scripts/build_parquet.py --tables sales_fact ran_site_dim
+"""
+
+import argparse
+import datetime
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+
+from build_local_db import DDL_SCRIPT, NULL_IF, parse_tables, read_script
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEMO_DATA_PATH = os.path.join(REPO_ROOT, 'demo_data')
+OUTPUT_PATH = os.path.join(DEMO_DATA_PATH, 'parquet')
+MANIFEST_NAME = 'manifest.json'
+MANIFEST_VERSION = 2
+
+COMPRESSION = 'zstd'
+# Row group size for tables without a date column
+ROW_GROUP_SIZE = 128 * 1024
+# Consecutive months are merged until a row group has at least this many rows;
+# tiny row groups cost more in metadata than pruning saves
+MIN_ROW_GROUP_ROWS = 8 * 1024
+
+_SPLIT_RE = re.compile(r'^(.*)_(\d+)$')
+_YEAR_SUFFIX_RE = re.compile(r'_(20\d\d)$')
+# Preferred partition columns, in order, when a table has several dates
+_DATE_COLUMN_HINTS = ('date', 'month', 'snapshot_date', 'order_date', 'activation_timestamp')
+
+
+def find_sources(root=DEMO_DATA_PATH):
+    """Return {relative table path: [csv files]} with split parts grouped in order."""
+    sources = {}
+    for folder, dirs, files in os.walk(root):
+        dirs[:] = [d for d in dirs if os.path.join(folder, d) != OUTPUT_PATH]
+        for filename in files:
+            if not filename.endswith('.csv'):
+                continue
+            stem = filename[:-4]
+            split = _SPLIT_RE.match(stem)
+            part = 0
+            if split and not _YEAR_SUFFIX_RE.search(stem):
+                stem, part = split.group(1), int(split.group(2))
+            # additional_data/2024/csv/foo.csv -> additional_data/2024/foo
+            rel_folder = os.path.relpath(folder, root)
+            if os.path.basename(rel_folder) == 'csv':
+                rel_folder = os.path.dirname(rel_folder)
+            key = os.path.normpath(os.path.join(rel_folder, stem))
+            sources.setdefault(key, []).append((part, os.path.join(folder, filename)))
+    return {key: [path for _, path in sorted(parts)] for key, parts in sorted(sources.items())}
+
+
+def ddl_table(name, tables):
+    """Map a file stem such as complaint_fact_2024 to its DDL table."""
+    if name in tables:
+        return name
+    stripped = _YEAR_SUFFIX_RE.sub('', name)
+    return stripped if stripped in tables else None
+
+
+def sha256(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def read_csv_table(paths, string_columns):
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+
+    def read(path, column_types):
+        return pacsv.read_csv(
+            path,
+            convert_options=pacsv.ConvertOptions(
+                null_values=NULL_IF, strings_can_be_null=True, column_types=column_types),
+        )
+
+    first = read(paths[0], {c: pa.string() for c in string_columns})
+    if len(paths) == 1:
+        return first
+    # Later parts must decode to the same schema as the first
+    types = {field.name: field.type for field in first.schema}
+    return pa.concat_tables([first] + [read(path, types) for path in paths[1:]])
+
+
+def pick_date_column(table, name):
+    import pyarrow as pa
+
+    # Dimensions are small and read whole; keep them in source order
+    if name.endswith('_dim'):
+        return None
+    candidates = [f.name for f in table.schema
+                  if pa.types.is_date(f.type) or pa.types.is_timestamp(f.type)]
+    if not candidates:
+        return None
+    for hint in _DATE_COLUMN_HINTS:
+        if hint in candidates:
+            return hint
+    return candidates[0]
+
+
+def month_slices(table, date_column):
+    """Sort by ``date_column`` (nulls last) and cut it into (offset, length) slices.
+
+    Slices end on month boundaries and hold at least MIN_ROW_GROUP_ROWS rows
+    (except the last), so each row group covers one or more whole months.
+    """
+    import pyarrow.compute as pc
+
+    table = table.sort_by([(date_column, 'ascending')])
+    values = table.column(date_column)
+    months = pc.strftime(values, format='%Y-%m').to_pylist()
+    slices, start = [], 0
+    for i in range(1, len(months) + 1):
+        if i == len(months) or (months[i] != months[i - 1] and i - start >= MIN_ROW_GROUP_ROWS):
+            slices.append((start, i - start))
+            start = i
+    return table, slices
+
+
+def json_value(value):
+    if isinstance(value, (datetime.date, datetime.datetime)):
+        return value.isoformat()
+    if isinstance(value, float) and value != value:
+        return None
+    return value
+
+
+def column_stats(table):
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    stats = {}
+    for field, column in zip(table.schema, table.columns):
+        entry = {'type': str(field.type), 'null_count': column.null_count}
+        if column.null_count < len(column) and not pa.types.is_boolean(field.type):
+            minmax = pc.min_max(column)
+            entry['min'] = json_value(minmax['min'].as_py())
+            entry['max'] = json_value(minmax['max'].as_py())
+        stats[field.name] = entry
+    return stats
+
+
+def write_parquet(table, path, date_column):
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+
+    row_groups = []
+    tmp_path = path + '.tmp'
+    # Microsecond timestamps read back as datetime64[us], like the csv and duckdb backends
+    with pq.ParquetWriter(tmp_path, table.schema, compression=COMPRESSION, coerce_timestamps='us') as writer:
+        if date_column:
+            table, slices = month_slices(table, date_column)
+            for offset, length in slices:
+                part = table.slice(offset, length)
+                writer.write_table(part, row_group_size=length)
+                dates = pc.min_max(part.column(date_column))
+                row_groups.append({'rows': length, 'min': json_value(dates['min'].as_py()),
+                                   'max': json_value(dates['max'].as_py())})
+        else:
+            writer.write_table(table, row_group_size=ROW_GROUP_SIZE)
+            for offset in range(0, max(table.num_rows, 1), ROW_GROUP_SIZE):
+                row_groups.append({'rows': min(ROW_GROUP_SIZE, table.num_rows - offset)})
+    os.replace(tmp_path, path)
+    return row_groups
+
+
+def load_manifest(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding='utf-8') as f:
+        manifest = json.load(f)
+    return manifest.get('tables', {}) if manifest.get('version') == MANIFEST_VERSION else {}
+
+
+def build(output=OUTPUT_PATH, only=None, force=False):
+    os.makedirs(output, exist_ok=True)
+    manifest_path = os.path.join(output, MANIFEST_NAME)
+    previous = load_manifest(manifest_path)
+    ddl = parse_tables(read_script(DDL_SCRIPT))
+
+    entries = {}
+    csv_bytes = parquet_bytes = built = 0
+    start = time.perf_counter()
+    for key, paths in find_sources().items():
+        name = os.path.basename(key)
+        if only and name not in only and key not in only:
+            if key in previous:
+                entries[key] = previous[key]
+            continue
+        out_path = os.path.join(output, key + '.parquet')
+        sources = [{'path': os.path.relpath(p, REPO_ROOT), 'sha256': sha256(p), 'bytes': os.path.getsize(p)}
+                   for p in paths]
+        old = previous.get(key)
+        if (not force and old and old['sources'] == sources and os.path.exists(out_path)
+                and sha256(out_path) == old['sha256']):
+            entries[key] = old
+        else:
+            table_name = ddl_table(name, ddl)
+            string_columns = [c for c, col_type, _, _ in ddl.get(table_name, []) if col_type == 'VARCHAR']
+            with open(paths[0], encoding='utf-8') as f:
+                header = {c.strip().strip('"') for c in f.readline().rstrip('\r\n').split(',')}
+            table = read_csv_table(paths, [c for c in string_columns if c in header])
+            date_column = pick_date_column(table, table_name or name)
+            os.makedirs(os.path.dirname(out_path), exist_ok=True)
+            row_groups = write_parquet(table, out_path, date_column)
+            entries[key] = {
+                'table': table_name or name,
+                'file': os.path.relpath(out_path, output),
+                'sha256': sha256(out_path),
+                'bytes': os.path.getsize(out_path),
+                'rows': table.num_rows,
+                'sources': sources,
+                'date_column': date_column,
+                'row_groups': row_groups,
+                'columns': column_stats(table),
+            }
+            built += 1
+            print(f"  {key:<48} {table.num_rows:>9,} rows  {len(row_groups):>3} row groups"
+                  f"  {sum(s['bytes'] for s in sources) / 1e6:6.2f} MB -> {entries[key]['bytes'] / 1e6:5.2f} MB")
+        csv_bytes += sum(s['bytes'] for s in sources)
+        parquet_bytes += entries[key]['bytes']
+
+    manifest = {
+        'version': MANIFEST_VERSION,
+        'generated_at': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'compression': COMPRESSION,
+        'tables': entries,
+    }
+    tmp_manifest = manifest_path + '.tmp'
+    with open(tmp_manifest, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_manifest, manifest_path)
+
+    print(f"\n✓ {built} of {len(entries)} tables rebuilt in {time.perf_counter() - start:.1f}s "
+          f"({csv_bytes / 1e6:.1f} MB CSV -> {parquet_bytes / 1e6:.1f} MB Parquet)")
+    print(f"✓ Manifest: {os.path.relpath(manifest_path, REPO_ROOT)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output', default=OUTPUT_PATH, help='output directory')
+    parser.add_argument('--tables', nargs='+', help='only rebuild these tables')
+    parser.add_argument('--force', action='store_true', help='rebuild even if the sources are unchanged')
+    args = parser.parse_args()
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        sys.exit('pyarrow is required: pip install pyarrow')
+    build(os.path.abspath(args.output), only=set(args.tables or ()), force=args.force)
+
+
+if __name__ == '__main__':
+    main()
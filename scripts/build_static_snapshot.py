@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+SnowTelco Static Snapshot Builder
+=================================
+Renders every dashboard page (Executive_Summary ... architecture) into one
+self-contained demo_snapshot/index.html for presenting where the network or
+the server cannot be relied on (see dashboard/snapshot.py for what is kept).
+
+Charts are embedded as their compiled Vega-Lite specs and the stylesheet is
+inlined once; pages switch in the browser without any request. Vega,
+Vega-Lite, vega-embed and viz.js are downloaded into demo_snapshot/vendor/ on
+the first build, so run it once with a connection (or pass --vendor-dir with
+local copies).
+
+Serve the bundle with any static web server, e.g.:
+    python -m http.server --directory demo_snapshot 8000
+
+Usage:
+    python scripts/build_static_snapshot.py
+    python scripts/build_static_snapshot.py --backend duckdb --output /tmp/booth
+    python scripts/build_static_snapshot.py --pages Executive_Summary 02_CFO_Finance
+    python scripts/build_static_snapshot.py --vendor-dir ~/vega-libs --no-download
+"""
+
+import argparse
+import os
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+import streamlit.logger  # noqa: E402
+
+from dashboard import data, prefetch, registry, snapshot  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--output', default=snapshot.SNAPSHOT_PATH, help='bundle directory')
+    parser.add_argument('--backend', help=f'data backend (default: ${data.BACKEND_ENV} or {data.DEFAULT_BACKEND})')
+    parser.add_argument('--pages', nargs='+', choices=list(registry.PAGE_RENDERERS), metavar='PAGE',
+                        help='page keys to include (default: all)')
+    parser.add_argument('--vendor-dir', help='directory with local copies of the vendored scripts')
+    parser.add_argument('--no-download', action='store_true', help='do not download missing vendored scripts')
+    args = parser.parse_args()
+    # AppTest renders log the pages' deprecation notices and missing-context warnings
+    streamlit.logger.set_log_level('error')
+    if args.backend:
+        os.environ[data.BACKEND_ENV] = args.backend
+    # The Persona Hub would otherwise start warming every page in the background
+    os.environ[prefetch.PREFETCH_ENV] = '0'
+
+    def progress(page, seconds, charts):
+        print(f"  {page:<28} {seconds:6.2f}s  {charts:>3} chart(s)")
+
+    print(f"Rendering {len(args.pages or registry.PAGE_RENDERERS)} page(s) "
+          f"with the {data.get_backend().name} backend")
+    summary = snapshot.build_bundle(os.path.abspath(args.output), args.pages, vendor_dir=args.vendor_dir,
+                                    download=not args.no_download, progress=progress)
+
+    for page, error in summary['failed'].items():
+        print(f"  ✗ {page}: {error}")
+    print(f"✓ {summary['pages']} page(s), {summary['charts']} chart(s), "
+          f"{summary['bytes'] / 1024 / 1024:.1f} MB in {summary['seconds']:.1f}s -> {summary['path']}")
+    if summary['cdn_scripts']:
+        print(f"⚠ Not vendored, loaded from the CDN: {', '.join(summary['cdn_scripts'])}")
+    if summary['failed']:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,163 @@
+"""
+Columnar building blocks for the synthetic fact generators.
+
+The yearly generators used to build every row as a dict, with one
+random.choice / random.choices / random.uniform call per field and a
+timedelta per timestamp. The helpers here draw a whole batch of rows (a month
+of one table) per call from a numpy Generator and return arrays that go
+straight into a DataFrame:
+
+- choice / choice_index:  categorical sampling, optionally weighted (weights
+                          are normalised like random.choices)
+- integers / uniform:     inclusive integer ranges (random.randint) and
+                          uniform floats
+- chance / optional:      conditional columns; rows that miss the condition
+                          are empty in the CSV (nullable ints and booleans,
+                          NaN floats, '' strings)
+- lookup / uniform_by:    per-row parameters from a categorical column
+- random_dates / random_times / format_*:  datetime64 offsets inside a month
+                          and their CSV text
+- prefixed / uuid4_strings / hex_strings:  formatted identifiers
+
+Every draw comes from the Generator passed in, so a batch is reproducible
+from its seed (see generator()).
+"""
+
+import calendar
+import zlib
+
+import numpy as np
+import pandas as pd
+
+
+def generator(seed, *parts):
+    """A numpy Generator seeded from ``seed`` and any ints or strings (table name, month...)."""
+    entropy = [seed] + [zlib.crc32(p.encode('utf-8')) if isinstance(p, str) else int(p) for p in parts]
+    return np.random.default_rng(entropy)
+
+
+def month_bounds(year, month):
+    """First day of the month as datetime64[D] and its number of days."""
+    return np.datetime64(f'{year:04d}-{month:02d}-01', 'D'), calendar.monthrange(year, month)[1]
+
+
+def choice_index(rng, count, size, weights=None):
+    """Indexes into ``count`` options, uniform or with relative ``weights``."""
+    if weights is None:
+        return rng.integers(0, count, size)
+    p = np.asarray(weights, dtype=float)
+    return rng.choice(count, size=size, p=p / p.sum())
+
+
+def choice(rng, values, size, weights=None):
+    """``size`` draws from ``values`` (random.choice, or random.choices with weights)."""
+    values = np.asarray(values)
+    return values[choice_index(rng, len(values), size, weights)]
+
+
+def integers(rng, low, high, size):
+    """Integers in [low, high], both inclusive like random.randint; bounds may be arrays."""
+    return rng.integers(low, np.asarray(high) + 1, size)
+
+
+def uniform(rng, low, high, size):
+    """Floats in [low, high) like random.uniform."""
+    return rng.uniform(low, high, size)
+
+
+def chance(rng, p, size):
+    """Boolean mask, True with probability ``p`` (random.random() < p)."""
+    return rng.random(size) < p
+
+
+def optional(values, mask):
+    """``values`` where ``mask`` holds, empty elsewhere, keeping the column's type for the CSV."""
+    values = np.asarray(values)
+    mask = np.asarray(mask, dtype=bool)
+    if values.dtype.kind in 'iu':
+        return pd.arrays.IntegerArray(values.astype(np.int64), ~mask)
+    if values.dtype.kind == 'b':
+        return pd.arrays.BooleanArray(values, ~mask)
+    if values.dtype.kind == 'f':
+        return np.where(mask, values, np.nan)
+    return np.where(mask, values.astype(object), '')
+
+
+def lookup(labels, mapping, default=None):
+    """``mapping[label]`` for every label of a categorical column."""
+    mapped = pd.Series(labels).map(mapping)
+    return (mapped if default is None else mapped.fillna(default)).to_numpy()
+
+
+def uniform_by(rng, labels, ranges, default):
+    """Uniform floats whose (low, high) range depends on each row's label."""
+    low = lookup(labels, {k: r[0] for k, r in ranges.items()}, default[0]).astype(float)
+    high = lookup(labels, {k: r[1] for k, r in ranges.items()}, default[1]).astype(float)
+    return rng.uniform(low, high)
+
+
+def integers_by(rng, labels, ranges, default=(0, 0)):
+    """Inclusive integers whose (low, high) range depends on each row's label."""
+    low = lookup(labels, {k: r[0] for k, r in ranges.items()}, default[0]).astype(np.int64)
+    high = lookup(labels, {k: r[1] for k, r in ranges.items()}, default[1]).astype(np.int64)
+    return rng.integers(low, high + 1)
+
+
+def random_dates(rng, year, month, size):
+    """Uniform days of the month as datetime64[D]."""
+    start, days = month_bounds(year, month)
+    return start + rng.integers(0, days, size).astype('timedelta64[D]')
+
+
+def random_times(rng, size, hours=(0, 23)):
+    """Time of day as timedelta64[s]: hour in ``hours`` (inclusive), minute and second uniform."""
+    offset = (rng.integers(hours[0], hours[1] + 1, size) * 3600
+              + rng.integers(0, 60, size) * 60
+              + rng.integers(0, 60, size))
+    return offset.astype('timedelta64[s]')
+
+
+def seconds(values):
+    """Float or int seconds as timedelta64[us], for offsets like timedelta(seconds=...)."""
+    return np.round(np.asarray(values, dtype=float) * 1e6).astype(np.int64).astype('timedelta64[us]')
+
+
+def format_dates(values):
+    """'YYYY-MM-DD' strings."""
+    return np.datetime_as_string(np.asarray(values).astype('datetime64[D]'), unit='D')
+
+
+def format_datetimes(values, fractional=False):
+    """'YYYY-MM-DD HH:MM:SS' strings, with '.ffffff' microseconds when ``fractional``."""
+    unit = 'us' if fractional else 's'
+    text = np.datetime_as_string(np.asarray(values).astype(f'datetime64[{unit}]'), unit=unit)
+    return np.char.replace(text, 'T', ' ')
+
+
+def prefixed(prefix, numbers, width=0):
+    """``f'{prefix}{n:0{width}d}'`` for every number."""
+    text = np.asarray(numbers).astype(np.int64).astype(str)
+    if width:
+        text = np.char.zfill(text, width)
+    return np.char.add(prefix, text)
+
+
+def hex_strings(rng, size, length, upper=False):
+    """Random hex strings of ``length`` digits (``uuid4().hex[:length]``)."""
+    raw = rng.integers(0, 256, (size, (length + 1) // 2), dtype=np.uint8)
+    text = raw.tobytes().hex()
+    if upper:
+        text = text.upper()
+    width = raw.shape[1] * 2
+    return np.frombuffer(text.encode('ascii'), dtype=f'S{width}').astype(f'U{length}')
+
+
+def uuid4_strings(rng, size):
+    """Random version-4 UUIDs in canonical form, drawn from ``rng``."""
+    raw = rng.integers(0, 256, (size, 16), dtype=np.uint8)
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80
+    digits = np.frombuffer(raw.tobytes().hex().encode('ascii'), dtype='S32').astype('U32')
+    text = pd.Series(digits)
+    return (text.str[0:8] + '-' + text.str[8:12] + '-' + text.str[12:16] + '-'
+            + text.str[16:20] + '-' + text.str[20:32]).to_numpy()
@@ -0,0 +1,108 @@
+"""
+Vectorized date remapping for the regeneration scripts.
+
+Moving a fact table's dates into another period used to be a Series.apply
+with a Python lambda and a timedelta per row. The functions here take and
+return numpy datetime64 arrays (NaT stays NaT), so a remap is a handful of
+array operations whatever the table size:
+
+- scale_range:          stretch/squeeze [min, max] linearly onto a target
+                        range, at whole-unit resolution ('D' keeps dates at
+                        midnight, 's' keeps second precision)
+- with_time_of_day:     put each value's original time of day back after a
+                        date-level remap
+- shift_keep_weekday:   move everything by whole weeks so weekday patterns
+                        survive
+- shift_keep_season:    move everything by whole years so month/day (and so
+                        seasonality) survive; 29 Feb becomes 28 Feb in
+                        non-leap years
+- clamp:                pin values into [lower, upper]
+
+pandas columns go in with pd.to_datetime(df[col]).to_numpy() and come back
+with df[col] = result.
+"""
+
+import numpy as np
+
+NS = 'datetime64[ns]'
+DAY = np.timedelta64(1, 'D')
+
+
+def as_datetime64(values):
+    """``values`` (array-like, datetime/datetime64/str) as a datetime64[ns] array."""
+    return np.asarray(values, dtype=NS)
+
+
+def time_of_day(values):
+    """Time since midnight as timedelta64[ns]."""
+    values = as_datetime64(values)
+    return values - values.astype('datetime64[D]')
+
+
+def scale_range(values, target_start, target_end, unit='D'):
+    """
+    Map values linearly so their min lands on target_start and their max on
+    target_end. Offsets are counted in whole ``unit``s ('D', 'h', 'm', 's')
+    and rounded down, so with 'D' every result is a midnight.
+    """
+    values = as_datetime64(values)
+    valid = ~np.isnat(values)
+    if not valid.any():
+        return values.copy()
+    step = np.timedelta64(1, unit).astype('timedelta64[ns]')
+    target_start = np.datetime64(target_start, 'ns')
+    old_min = values[valid].min()
+    old_range = max(1, (values[valid].max() - old_min) // step)
+    target_range = (np.datetime64(target_end, 'ns') - target_start) // step
+
+    offsets = np.zeros(len(values), dtype=np.int64)
+    offsets[valid] = (values[valid] - old_min) // step
+    scaled = np.floor(offsets * target_range / old_range).astype(np.int64)
+    result = target_start + scaled * step
+    result[~valid] = np.datetime64('NaT')
+    return result
+
+
+def with_time_of_day(values, source):
+    """Dates of ``values`` with the time of day of ``source`` (same shape)."""
+    return as_datetime64(values).astype('datetime64[D]').astype(NS) + time_of_day(source)
+
+
+def shift_keep_weekday(values, target_start):
+    """
+    Shift by whole weeks so the earliest value lands on the first day at or
+    after target_start with the same weekday; times of day are unchanged.
+    """
+    values = as_datetime64(values)
+    valid = ~np.isnat(values)
+    if not valid.any():
+        return values.copy()
+    first_day = values[valid].min().astype('datetime64[D]')
+    days = (np.datetime64(target_start, 'D') - first_day) // DAY
+    weeks = -(-days // 7)
+    return values + np.timedelta64(int(weeks) * 7, 'D')
+
+
+def shift_keep_season(values, years):
+    """
+    Shift by whole calendar years, keeping month, day and time of day
+    (29 Feb falls back to 28 Feb when the target year is not a leap year).
+    """
+    values = as_datetime64(values)
+    month_start = values.astype('datetime64[M]')
+    day = values.astype('datetime64[D]') - month_start.astype('datetime64[D]')
+    new_month = month_start + np.timedelta64(12 * int(years), 'M')
+    last_day = (new_month + 1).astype('datetime64[D]') - new_month.astype('datetime64[D]') - DAY
+    result = new_month.astype('datetime64[D]').astype(NS) + np.minimum(day, last_day) + time_of_day(values)
+    result[np.isnat(values)] = np.datetime64('NaT')
+    return result
+
+
+def clamp(values, lower=None, upper=None):
+    """Values pinned into [lower, upper] (either bound optional)."""
+    values = as_datetime64(values)
+    if lower is not None:
+        values = np.where(values < np.datetime64(lower, 'ns'), np.datetime64(lower, 'ns'), values)
+    if upper is not None:
+        values = np.where(values > np.datetime64(upper, 'ns'), np.datetime64(upper, 'ns'), values)
+    return values
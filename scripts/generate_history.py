@@ -0,0 +1,907 @@
+#!/usr/bin/env python3
+"""
+SnowTelco Historical Data Generator
+===================================
+Generates synthetic fact tables for any calendar years before the 2026 base
+data, into demo_data/additional_data/<year>/csv/, so they can be loaded into
+Snowflake to provide historical context.
+
+Key Features:
+- Each year back from 2026 is 5% lower on volumes and values, a step worse on
+  network and service quality, and moves its IDs up by 10,000,000 to avoid
+  collisions (2025: x0.95 from 10M, 2024: x0.90 from 20M)
+- Work is sharded by (year, table, month) across a process pool. Every shard
+  draws from a generator seeded from (year, table, month) and its IDs are
+  allocated before anything runs, so the output is the same for any --workers
+- Shards render their own CSV text and are written as they finish, with at
+  most 2 x --workers shards in flight, so memory stays flat for any range of
+  years; files auto-split at 95MB on month boundaries
+- Seasonal patterns included
+- Columnar generation (scripts/columnar.py): a shard is built from numpy
+  arrays rather than one dict per row
+
+Usage:
+    python scripts/generate_history.py --years 2024 2025
+    python scripts/generate_history.py --years 2022-2025 --workers 8
+    python scripts/generate_history.py --years 2025 --tables invoice_fact payment_fact
+"""
+
+import argparse
+import collections
+import functools
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+import columnar
+
+# Configuration
+DEMO_DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'demo_data')
+OUTPUT_PATH = os.path.join(DEMO_DATA_PATH, 'additional_data')
+MAX_FILE_SIZE_MB = 95
+
+# The history is generated backwards from the 2026 base data
+BASE_YEAR = 2026
+MAX_YEARS_BACK = 10
+
+# UK-specific distributions
+CUSTOMER_TYPES = ['Consumer', 'SMB', 'Enterprise']
+CUSTOMER_TYPE_WEIGHTS = [0.70, 0.20, 0.10]
+
+PAYMENT_METHODS = ['Direct Debit', 'Credit Card', 'Debit Card', 'Bank Transfer', 'Cheque']
+PAYMENT_METHOD_WEIGHTS = [0.65, 0.15, 0.10, 0.08, 0.02]
+
+INVOICE_STATUS = ['Paid', 'Outstanding', 'Overdue']
+INVOICE_STATUS_WEIGHTS = [0.85, 0.10, 0.05]
+
+TICKET_PRIORITIES = ['P1', 'P2', 'P3', 'P4']
+TICKET_PRIORITY_WEIGHTS = [0.02, 0.08, 0.30, 0.60]
+
+TICKET_STATUS = ['Open', 'In Progress', 'Pending Customer', 'Resolved', 'Escalated']
+TICKET_STATUS_WEIGHTS = [0.10, 0.15, 0.10, 0.60, 0.05]
+
+CHANNELS = ['Phone', 'Email', 'Chat', 'Portal', 'Partner']
+CHANNEL_WEIGHTS = [0.35, 0.25, 0.20, 0.15, 0.05]
+
+ALARM_SEVERITIES = ['Critical', 'Major', 'Minor', 'Warning']
+ALARM_SEVERITY_WEIGHTS = [0.05, 0.15, 0.40, 0.40]
+
+
+class HistoryYear:
+    """Scaling for one history year: the further back from 2026, the smaller and less reliable the business."""
+
+    def __init__(self, year):
+        back = BASE_YEAR - year
+        if not 1 <= back <= MAX_YEARS_BACK:
+            raise ValueError(f"history years run from {BASE_YEAR - MAX_YEARS_BACK} to {BASE_YEAR - 1}, got {year}")
+        self.year = year
+        self.id_offset = 10_000_000 * back
+        # Volumes and monetary values
+        self.multiplier = round(1 - 0.05 * back, 3)
+        # Network quality
+        self.latency_factor = round(1 + 0.05 * back, 3)
+        self.packet_loss_factor = round(1.05 + 0.05 * back, 3)
+        self.availability_factor = round(1 - 0.002 * back, 3)
+        self.sla_floor = round(0.97 - 0.02 * back, 3)
+        # Operational load
+        self.alarm_factor = round(1.05 + 0.05 * back, 3)
+        self.incident_factor = round(1 + 0.05 * back, 3)
+        self.complaint_factor = round(1.05 + 0.05 * back, 3)
+        self.activation_factor = round(1.05 + 0.05 * back, 3)
+        self.fcr_rate = round(0.71 - 0.03 * back, 3)
+
+    def output_path(self, root=OUTPUT_PATH):
+        return os.path.join(root, str(self.year), 'csv')
+
+
+class Table:
+    """A fact table: its monthly row count and the builder for one month of rows."""
+
+    def __init__(self, name, rows, build):
+        self.name = name
+        # rows(hist, month) -> row count, known before any shard runs
+        self.rows = rows
+        # build(rng, hist, month, ids) -> DataFrame of the month's rows
+        self.build = build
+
+
+def get_seasonal_factor(date):
+    """Returns a seasonal multiplier (0.8 - 1.2) based on month."""
+    month = date.month
+    factors = {
+        1: 0.85,
+        2: 0.90,
+        3: 0.95,
+        4: 1.00,
+        5: 1.00,
+        6: 0.95,
+        7: 0.90,
+        8: 0.85,
+        9: 0.95,
+        10: 1.05,
+        11: 1.10,
+        12: 1.15,
+    }
+    return factors.get(month, 1.0)
+
+
+def seasonal(hist, month):
+    return get_seasonal_factor(datetime(hist.year, month, 1))
+
+
+def month_start_text(hist, month):
+    return columnar.format_dates(columnar.month_bounds(hist.year, month)[0]).item()
+
+
+def month_end_text(hist, month):
+    start, days = columnar.month_bounds(hist.year, month)
+    return columnar.format_dates(start + np.timedelta64(days - 1, 'D')).item()
+
+
+def load_dimension_keys(dim_name):
+    """Load dimension table and return list of valid keys."""
+    filepath = os.path.join(DEMO_DATA_PATH, f"{dim_name}.csv")
+    if os.path.exists(filepath):
+        df = pd.read_csv(filepath)
+        key_col = df.columns[0]
+        return df[key_col].tolist()
+    return []
+
+
+@functools.lru_cache(maxsize=None)
+def dimension_keys(dim_name, fallback):
+    """Keys of a dimension as an array, or ``fallback`` (a range) when its CSV is missing; cached per process."""
+    return np.asarray(load_dimension_keys(dim_name) or list(fallback))
+
+
+def customer_keys():
+    return dimension_keys('customer_dim', range(1, 10001))
+
+
+def subscriber_keys():
+    return dimension_keys('mobile_subscriber_dim', range(1, 30001))
+
+
+def element_ids():
+    return dimension_keys('network_element_dim', range(1, 501))
+
+
+# ---------------------------------------------------------------------------
+# Billing
+# ---------------------------------------------------------------------------
+
+def invoice_month(rng, hist, month, ids):
+    n = len(ids)
+    customer_type = columnar.choice(rng, CUSTOMER_TYPES, n, CUSTOMER_TYPE_WEIGHTS)
+    invoice_date = columnar.random_dates(rng, hist.year, month, n)
+    base_amount = columnar.uniform_by(rng, customer_type, {'Enterprise': (500, 5000), 'SMB': (100, 1000)},
+                                      default=(20, 100)) * hist.multiplier
+    tax_amount = base_amount * 0.20  # UK VAT
+    status = columnar.choice(rng, INVOICE_STATUS, n, INVOICE_STATUS_WEIGHTS)
+    paid_date = invoice_date + columnar.integers(rng, 1, 28, n).astype('timedelta64[D]')
+    return pd.DataFrame({
+        'invoice_id': ids,
+        'invoice_number': columnar.prefixed('INV', ids, 8),
+        'customer_key': columnar.choice(rng, customer_keys(), n),
+        'customer_type': customer_type,
+        'invoice_date': columnar.format_dates(invoice_date),
+        'due_date': columnar.format_dates(invoice_date + np.timedelta64(30, 'D')),
+        'amount': np.round(base_amount, 2),
+        'tax_amount': np.round(tax_amount, 2),
+        'total_amount': np.round(base_amount + tax_amount, 2),
+        'status': status,
+        'paid_date': columnar.optional(columnar.format_dates(paid_date), status == 'Paid'),
+        'payment_method': columnar.choice(rng, PAYMENT_METHODS, n, PAYMENT_METHOD_WEIGHTS),
+        'billing_period_start': month_start_text(hist, month),
+        'billing_period_end': month_end_text(hist, month),
+    })
+
+
+def payment_month(rng, hist, month, ids):
+    n = len(ids)
+    return pd.DataFrame({
+        'payment_id': ids,
+        'payment_reference': columnar.prefixed('PAY', ids, 8),
+        'invoice_id': hist.id_offset + columnar.integers(rng, 1, 400000, n),
+        'customer_key': columnar.choice(rng, customer_keys(), n),
+        'payment_date': columnar.format_dates(columnar.random_dates(rng, hist.year, month, n)),
+        'amount': np.round(columnar.uniform(rng, 20, 500, n) * hist.multiplier, 2),
+        'method_key': columnar.integers(rng, 1, 5, n),
+        'status': np.where(columnar.chance(rng, 0.98, n), 'Completed', 'Refunded'),
+        'card_last_four': columnar.optional(columnar.integers(rng, 1000, 9999, n).astype(str),
+                                            columnar.chance(rng, 0.25, n)),
+        'transaction_id': np.char.add('TXN', columnar.hex_strings(rng, n, 12, upper=True)),
+        'payment_method_key': columnar.integers(rng, 1, 5, n),
+    })
+
+
+def mobile_usage_month(rng, hist, month, ids):
+    n = len(ids)
+    factor = seasonal(hist, month)
+    return pd.DataFrame({
+        'usage_id': ids,
+        # A month has each sampled subscriber once
+        'subscriber_key': rng.choice(subscriber_keys(), size=n, replace=False),
+        'usage_month': f"{hist.year}-{month:02d}",
+        'data_used_gb': np.round(columnar.uniform(rng, 1, 50, n) * factor * hist.multiplier, 2),
+        'data_allowance_gb': columnar.choice(rng, [5, 10, 20, 50, 100], n),
+        'minutes_used': (columnar.uniform(rng, 50, 500, n) * factor).astype(np.int64),
+        'sms_sent': (columnar.uniform(rng, 10, 200, n) * factor).astype(np.int64),
+        'roaming_data_gb': np.where(columnar.chance(rng, 0.15, n), np.round(columnar.uniform(rng, 0, 2, n), 2), 0),
+        'roaming_minutes': np.where(columnar.chance(rng, 0.15, n), columnar.uniform(rng, 0, 50, n).astype(np.int64), 0),
+        'international_minutes': np.where(columnar.chance(rng, 0.10, n),
+                                          columnar.uniform(rng, 0, 30, n).astype(np.int64), 0),
+        'bill_amount': np.round(columnar.uniform(rng, 15, 80, n) * hist.multiplier, 2),
+        'payment_status': columnar.choice(rng, ['Paid', 'Pending', 'Overdue'], n, [0.85, 0.10, 0.05]),
+        'nps_score': columnar.optional(columnar.integers(rng, -100, 100, n), columnar.chance(rng, 0.3, n)),
+    })
+
+
+# ---------------------------------------------------------------------------
+# Customer service
+# ---------------------------------------------------------------------------
+
+def support_ticket_month(rng, hist, month, ids):
+    n = len(ids)
+    created = columnar.random_dates(rng, hist.year, month, n) + columnar.random_times(rng, n)
+    status = columnar.choice(rng, TICKET_STATUS, n, TICKET_STATUS_WEIGHTS)
+    resolved = status == 'Resolved'
+    resolution_mins = columnar.uniform(rng, 30, 1440, n).astype(np.int64)
+    return pd.DataFrame({
+        'ticket_id': ids,
+        'ticket_number': columnar.prefixed('TKT', ids, 8),
+        'customer_key': columnar.choice(rng, customer_keys(), n),
+        'customer_type': columnar.choice(rng, CUSTOMER_TYPES, n, CUSTOMER_TYPE_WEIGHTS),
+        'service_instance_id': columnar.optional(columnar.integers(rng, 1, 500000, n), columnar.chance(rng, 0.7, n)),
+        'category_key': columnar.integers(rng, 1, 35, n),
+        'priority': columnar.choice(rng, TICKET_PRIORITIES, n, TICKET_PRIORITY_WEIGHTS),
+        'status': status,
+        'channel': columnar.choice(rng, CHANNELS, n, CHANNEL_WEIGHTS),
+        'created_date': columnar.format_datetimes(created),
+        'resolved_date': columnar.optional(
+            columnar.format_datetimes(created + (resolution_mins * 60).astype('timedelta64[s]')), resolved),
+        'first_response_mins': columnar.uniform(rng, 5, 120, n).astype(np.int64),
+        'resolution_mins': columnar.optional(resolution_mins, resolved),
+        'csat_score': columnar.optional(columnar.integers(rng, 1, 5, n), resolved & columnar.chance(rng, 0.6, n)),
+        'agent_key': columnar.integers(rng, 1, 200, n),
+        'escalated': np.where(status == 'Escalated', 'True', 'False'),
+    })
+
+
+CALL_QUEUES = ['Sales', 'Support', 'Billing', 'Technical', 'Retention', 'Partner']
+CALL_DISPOSITIONS = ['Resolved', 'Callback', 'Transfer', 'Escalated', 'Abandoned']
+CALL_DISPOSITION_WEIGHTS = [0.55, 0.15, 0.10, 0.10, 0.10]
+
+
+def contact_center_call_month(rng, hist, month, ids):
+    n = len(ids)
+    month_start, _ = columnar.month_bounds(hist.year, month)
+    start_time = columnar.random_dates(rng, hist.year, month, n) + columnar.random_times(rng, n, hours=(8, 20))
+    wait_time_secs = columnar.uniform(rng, 30, 600, n).astype(np.int64)
+    handle_time_secs = columnar.uniform(rng, 120, 1800, n).astype(np.int64)
+    end_time = start_time + (wait_time_secs + handle_time_secs).astype('timedelta64[s]')
+    disposition = columnar.choice(rng, CALL_DISPOSITIONS, n, CALL_DISPOSITION_WEIGHTS)
+    day = (start_time.astype('datetime64[D]') - month_start).astype(np.int64) + 1
+    return pd.DataFrame({
+        'call_id': ids,
+        'customer_key': columnar.choice(rng, customer_keys(), n),
+        'customer_type': columnar.choice(rng, CUSTOMER_TYPES, n, CUSTOMER_TYPE_WEIGHTS),
+        'agent_key': columnar.choice(rng, dimension_keys('contact_center_agent_dim', range(1, 501)), n),
+        'queue': columnar.choice(rng, CALL_QUEUES, n),
+        'start_time': columnar.format_datetimes(start_time, fractional=True),
+        'end_time': columnar.format_datetimes(end_time, fractional=True),
+        'wait_time_secs': wait_time_secs,
+        'handle_time_secs': handle_time_secs,
+        'disposition': disposition,
+        'ticket_id': columnar.optional(hist.id_offset + columnar.integers(rng, 1, 200000, n),
+                                       columnar.chance(rng, 0.3, n)),
+        'transfer_count': np.where(disposition == 'Transfer', columnar.integers(rng, 0, 3, n), 0),
+        'csat_score': columnar.optional(columnar.integers(rng, 1, 5, n), columnar.chance(rng, 0.4, n)),
+        'call_recording_url': np.char.add(np.char.add(f's3://recordings/{hist.year}/{month:02d}/',
+                                                      np.char.zfill(day.astype(str), 2)),
+                                          np.char.add(np.char.add('/', ids.astype(str)), '.wav')),
+        'is_first_call_resolved': (disposition == 'Resolved') & columnar.chance(rng, hist.fcr_rate, n),
+        'callback_required': disposition == 'Callback',
+    })
+
+
+COMPLAINT_TYPES = ['Billing', 'Service', 'Network', 'Customer Service', 'Contract', 'Other']
+COMPLAINT_STATUSES = ['Open', 'Under Investigation', 'Resolved', 'Closed']
+
+
+def complaint_month(rng, hist, month, ids):
+    n = len(ids)
+    return pd.DataFrame({
+        'complaint_id': ids,
+        'customer_key': columnar.choice(rng, customer_keys(), n),
+        'complaint_date': columnar.format_dates(columnar.random_dates(rng, hist.year, month, n)),
+        'complaint_type': columnar.choice(rng, COMPLAINT_TYPES, n),
+        'status': columnar.choice(rng, COMPLAINT_STATUSES, n),
+        'resolution_days': columnar.optional(columnar.integers(rng, 1, 30, n), columnar.chance(rng, 0.7, n)),
+        'compensation_amount': np.where(columnar.chance(rng, 0.2, n), np.round(columnar.uniform(rng, 10, 100, n), 2), 0),
+        'ofcom_escalated': columnar.chance(rng, 0.02, n),
+    })
+
+
+# ---------------------------------------------------------------------------
+# Network and IT operations
+# ---------------------------------------------------------------------------
+
+def hourly_element_counts(hist, month):
+    """Elements reporting in each hour of the month (150-200, at most all of them), one row per day."""
+    _, days = columnar.month_bounds(hist.year, month)
+    # Drawn apart from the rows so the shard sizes are known up front
+    rng = columnar.generator(hist.year, 'network_performance_fact', 'counts', month)
+    return np.minimum(columnar.integers(rng, 150, 200, (days, 24)), len(element_ids()))
+
+
+def network_performance_month(rng, hist, month, ids):
+    elements = element_ids()
+    counts = hourly_element_counts(hist, month).ravel()
+    month_start, _ = columnar.month_bounds(hist.year, month)
+    # A different random subset of elements (without repeats) for every hour
+    order = rng.random((len(counts), len(elements))).argsort(axis=1)
+    taken = np.arange(len(elements)) < counts[:, None]
+    hour_index = np.repeat(np.arange(len(counts)), counts)
+    metric_datetime = month_start + (hour_index * 3600).astype('timedelta64[s]')
+    n = len(ids)
+    return pd.DataFrame({
+        'perf_id': ids,
+        'element_id': elements[order[taken]],
+        'metric_datetime': columnar.format_datetimes(metric_datetime),
+        'metric_date': columnar.format_dates(metric_datetime),
+        'metric_hour': hour_index % 24,
+        'throughput_gbps': np.round(columnar.uniform(rng, 0.5, 10, n) * hist.multiplier, 3),
+        'latency_ms': np.round(columnar.uniform(rng, 5, 50, n) * hist.latency_factor, 2),
+        'utilization_pct': np.round(columnar.uniform(rng, 20, 85, n) * seasonal(hist, month), 2),
+        'packet_loss_pct': np.round(columnar.uniform(rng, 0, 2, n) * hist.packet_loss_factor, 4),
+        'error_count': columnar.integers(rng, 0, 10, n),
+        'availability_pct': np.round(columnar.uniform(rng, 98, 100, n) * hist.availability_factor, 4),
+    })
+
+
+ALARM_TYPES = ['Hardware Failure', 'Software Error', 'Capacity Warning', 'Connectivity Loss',
+               'Performance Degradation', 'Security Alert', 'Configuration Error']
+ALARM_ROOT_CAUSES = ['Hardware', 'Software', 'Configuration', 'External', 'Unknown', 'Capacity']
+ALARM_IMPACTS = ['Service Affecting', 'Customer Impacting', 'Performance', 'None']
+# Minutes until an alarm clears, by severity
+ALARM_CLEAR_MINUTES = {'Critical': (15, 120), 'Major': (30, 240), 'Minor': (60, 480), 'Warning': (120, 720)}
+
+
+def network_alarm_month(rng, hist, month, ids):
+    n = len(ids)
+    raised_time = columnar.random_dates(rng, hist.year, month, n) + columnar.random_times(rng, n)
+    severity = columnar.choice(rng, ALARM_SEVERITIES, n, ALARM_SEVERITY_WEIGHTS)
+    clear_minutes = columnar.integers_by(rng, severity, ALARM_CLEAR_MINUTES)
+    acknowledged = columnar.chance(rng, 0.90, n)
+    return pd.DataFrame({
+        'alarm_id': ids,
+        'element_id': columnar.choice(rng, element_ids(), n),
+        'alarm_type': columnar.choice(rng, ALARM_TYPES, n),
+        'severity': severity,
+        'raised_time': columnar.format_datetimes(raised_time, fractional=True),
+        'cleared_time': columnar.format_datetimes(raised_time + (clear_minutes * 60).astype('timedelta64[s]')),
+        'acknowledged': acknowledged,
+        'acknowledged_by': columnar.optional(columnar.prefixed('Engineer_', columnar.integers(rng, 1, 50, n)),
+                                             acknowledged),
+        'ticket_id': columnar.optional(hist.id_offset + columnar.integers(rng, 1, 200000, n),
+                                       columnar.chance(rng, 0.4, n)),
+        'root_cause': columnar.choice(rng, ALARM_ROOT_CAUSES, n),
+        'impact': columnar.choice(rng, ALARM_IMPACTS, n),
+    })
+
+
+INCIDENT_TYPES = ['Outage', 'Performance', 'Security', 'Change Failure', 'Capacity', 'Integration']
+INCIDENT_STATUSES = ['Open', 'In Progress', 'Resolved', 'Closed']
+INCIDENT_STATUS_WEIGHTS = [0.05, 0.10, 0.25, 0.60]
+SLA_TARGET_MINS = {'P1': 60, 'P2': 240, 'P3': 480, 'P4': 1440}
+
+
+def it_incident_month(rng, hist, month, ids):
+    n = len(ids)
+    priority = columnar.choice(rng, TICKET_PRIORITIES, n, TICKET_PRIORITY_WEIGHTS)
+    status = columnar.choice(rng, INCIDENT_STATUSES, n, INCIDENT_STATUS_WEIGHTS)
+    created_date = columnar.random_dates(rng, hist.year, month, n)
+    sla_target_mins = columnar.lookup(priority, SLA_TARGET_MINS).astype(np.int64)
+    created_timestamp = created_date + (columnar.integers(rng, 0, 23, n) * 3600
+                                        + columnar.integers(rng, 0, 59, n) * 60).astype('timedelta64[s]')
+    assigned_timestamp = created_timestamp + (columnar.integers(rng, 5, 60, n) * 60).astype('timedelta64[s]')
+    resolved = np.isin(status, ['Resolved', 'Closed'])
+    resolution_mins = rng.uniform(30, sla_target_mins * 1.5).astype(np.int64)
+    return pd.DataFrame({
+        'incident_id': ids,
+        'incident_number': columnar.prefixed('INC', ids, 8),
+        'application_id': columnar.choice(rng, dimension_keys('it_application_dim', range(1, 101)), n),
+        'incident_type': columnar.choice(rng, INCIDENT_TYPES, n),
+        'priority': priority,
+        'status': status,
+        'created_date': columnar.format_dates(created_date),
+        'sla_target_mins': sla_target_mins,
+        'created_timestamp': columnar.format_datetimes(created_timestamp),
+        'assigned_timestamp': columnar.format_datetimes(assigned_timestamp),
+        'resolved_timestamp': columnar.optional(
+            columnar.format_datetimes(created_timestamp + (resolution_mins * 60).astype('timedelta64[s]')), resolved),
+        'sla_met': columnar.optional(resolution_mins <= sla_target_mins, resolved),
+    })
+
+
+def sla_measurement_month(rng, hist, month, ids):
+    n = len(ids)
+    target_value = columnar.uniform(rng, 95, 99.9, n)
+    actual_value = target_value * columnar.uniform(rng, hist.sla_floor, 1.02, n)
+    return pd.DataFrame({
+        'measurement_id': ids,
+        'sla_key': columnar.choice(rng, dimension_keys('sla_dim', range(1, 21)), n),
+        'measurement_date': columnar.format_dates(columnar.random_dates(rng, hist.year, month, n)),
+        'target_value': np.round(target_value, 2),
+        'actual_value': np.round(actual_value, 2),
+        'met': actual_value >= target_value,
+        'breach_minutes': np.maximum(0, (target_value - actual_value) * 10).astype(np.int64),
+    })
+
+
+# ---------------------------------------------------------------------------
+# Sales, finance and marketing
+# ---------------------------------------------------------------------------
+
+def sales_month(rng, hist, month, ids):
+    n = len(ids)
+    return pd.DataFrame({
+        'sale_id': ids,
+        'date': columnar.format_dates(columnar.random_dates(rng, hist.year, month, n)),
+        'customer_key': columnar.choice(rng, customer_keys(), n),
+        'product_key': columnar.choice(rng, dimension_keys('product_dim', range(1, 65)), n),
+        'sales_rep_key': columnar.choice(rng, dimension_keys('sales_rep_dim', range(1, 201)), n),
+        'region_key': columnar.choice(rng, dimension_keys('region_dim', range(1, 500)), n),
+        'vendor_key': columnar.choice(rng, dimension_keys('vendor_dim', range(1, 30)), n),
+        'amount': np.round(columnar.uniform(rng, 50, 2000, n) * hist.multiplier, 2),
+        'units': columnar.integers(rng, 1, 20, n),
+    })
+
+
+FINANCE_TRANSACTION_TYPES = ['Revenue', 'Cost', 'Depreciation', 'Accrual', 'Adjustment', 'Transfer']
+# Amount range by transaction type; costs are negative, other types land either side of zero
+FINANCE_AMOUNT_RANGES = {'Revenue': (100, 10000), 'Cost': (-5000, -50)}
+
+
+def finance_transaction_month(rng, hist, month, ids):
+    n = len(ids)
+    trans_type = columnar.choice(rng, FINANCE_TRANSACTION_TYPES, n)
+    amount = columnar.uniform_by(rng, trans_type, FINANCE_AMOUNT_RANGES, default=(-1000, 1000)) * hist.multiplier
+    return pd.DataFrame({
+        'transaction_id': ids,
+        'account_key': columnar.choice(rng, dimension_keys('account_dim', range(1, 51)), n),
+        'transaction_date': columnar.format_dates(columnar.random_dates(rng, hist.year, month, n)),
+        'transaction_type': trans_type,
+        'amount': np.round(amount, 2),
+        'currency': 'GBP',
+        'description': np.char.add(trans_type, ' transaction'),
+        'posted': columnar.choice(rng, [True, False], n),
+        'period': f'{hist.year}-{month:02d}',
+    })
+
+
+MARKETING_CHANNELS = ['Email', 'Social', 'PPC', 'Display', 'TV', 'Radio', 'Direct Mail']
+
+
+def marketing_campaign_month(rng, hist, month, ids):
+    n = len(ids)
+    impressions = (columnar.uniform(rng, 1000, 100000, n) * seasonal(hist, month)).astype(np.int64)
+    clicks = (impressions * columnar.uniform(rng, 0.01, 0.05, n)).astype(np.int64)
+    conversions = (clicks * columnar.uniform(rng, 0.02, 0.10, n)).astype(np.int64)
+    return pd.DataFrame({
+        'record_id': ids,
+        'campaign_key': columnar.choice(rng, dimension_keys('campaign_dim', range(1, 51)), n),
+        'campaign_date': columnar.format_dates(columnar.random_dates(rng, hist.year, month, n)),
+        'channel': columnar.choice(rng, MARKETING_CHANNELS, n),
+        'impressions': impressions,
+        'clicks': clicks,
+        'conversions': conversions,
+        'spend': np.round(columnar.uniform(rng, 100, 5000, n) * hist.multiplier, 2),
+        'revenue_attributed': np.round(conversions * columnar.uniform(rng, 50, 200, n), 2),
+    })
+
+
+def order_line_month(rng, hist, month, ids):
+    n = len(ids)
+    quantity = columnar.integers(rng, 1, 5, n)
+    unit_price = columnar.uniform(rng, 10, 200, n)
+    return pd.DataFrame({
+        'line_id': ids,
+        'order_key': columnar.choice(rng, dimension_keys('order_dim', range(1, 50001)), n),
+        'product_key': columnar.choice(rng, dimension_keys('product_dim', range(1, 65)), n),
+        'order_date': columnar.format_dates(columnar.random_dates(rng, hist.year, month, n)),
+        'quantity': quantity,
+        'unit_price': np.round(unit_price, 2),
+        'line_total': np.round(quantity * unit_price, 2),
+        'discount_amount': np.where(columnar.chance(rng, 0.2, n), np.round(columnar.uniform(rng, 0, 20, n), 2), 0),
+    })
+
+
+# ---------------------------------------------------------------------------
+# Digital, loyalty, devices and roaming
+# ---------------------------------------------------------------------------
+
+INTERACTION_TYPES = ['App Login', 'Web Login', 'Bill View', 'Payment', 'Support',
+                     'Plan Change', 'Usage Check', 'Profile Update']
+DEVICES = ['Mobile', 'Desktop', 'Tablet']
+DEVICE_WEIGHTS = [0.60, 0.30, 0.10]
+
+
+def digital_interaction_month(rng, hist, month, ids):
+    n = len(ids)
+    interaction_time = columnar.random_dates(rng, hist.year, month, n) + columnar.random_times(rng, n)
+    return pd.DataFrame({
+        'interaction_id': ids,
+        'customer_key': columnar.choice(rng, customer_keys(), n),
+        'interaction_timestamp': columnar.format_datetimes(interaction_time),
+        'interaction_type': columnar.choice(rng, INTERACTION_TYPES, n),
+        'device_type': columnar.choice(rng, DEVICES, n, DEVICE_WEIGHTS),
+        'session_duration_secs': columnar.integers(rng, 30, 1800, n),
+        'pages_viewed': columnar.integers(rng, 1, 20, n),
+        'completed': columnar.chance(rng, 0.85, n),
+    })
+
+
+LOYALTY_TRANSACTION_TYPES = ['Earn', 'Redeem', 'Bonus', 'Expire', 'Adjustment']
+LOYALTY_TRANSACTION_WEIGHTS = [0.50, 0.30, 0.10, 0.05, 0.05]
+# Points by transaction type; redemptions and expiries are negative, adjustments either way
+LOYALTY_POINT_RANGES = {'Earn': (10, 500), 'Bonus': (10, 500), 'Redeem': (-2000, -100), 'Expire': (-500, -50)}
+
+
+def loyalty_transaction_month(rng, hist, month, ids):
+    n = len(ids)
+    trans_type = columnar.choice(rng, LOYALTY_TRANSACTION_TYPES, n, LOYALTY_TRANSACTION_WEIGHTS)
+    return pd.DataFrame({
+        'transaction_id': ids,
+        'customer_key': columnar.choice(rng, customer_keys(), n),
+        'program_key': columnar.choice(rng, dimension_keys('loyalty_program_dim', range(1, 6)), n),
+        'transaction_date': columnar.format_dates(columnar.random_dates(rng, hist.year, month, n)),
+        'transaction_type': trans_type,
+        'points': columnar.integers_by(rng, trans_type, LOYALTY_POINT_RANGES, default=(-100, 100)),
+        'description': np.char.add(trans_type, ' points'),
+    })
+
+
+ACTIVATION_CHANNELS = ['Online', 'Retail Store', 'Partner', 'Telesales', 'Self-Service']
+ACTIVATION_CHANNEL_WEIGHTS = [0.30, 0.25, 0.20, 0.15, 0.10]
+ACTIVATION_STATUSES = ['Completed', 'Pending', 'Failed', 'Cancelled']
+ACTIVATION_STATUS_WEIGHTS = [0.85, 0.08, 0.04, 0.03]
+ACTIVATION_TYPES = ['New Activation', 'Replacement', 'SIM Swap', 'Upgrade', 'Port-In']
+ACTIVATION_TYPE_WEIGHTS = [0.35, 0.25, 0.20, 0.12, 0.08]
+# Hours from order to activation by channel (Partner and Telesales use the default)
+ACTIVATION_HOURS = {'Retail Store': (0.5, 4), 'Online': (12, 48), 'Self-Service': (0.25, 2)}
+
+
+def sim_activation_month(rng, hist, month, ids):
+    n = len(ids)
+    order_time = columnar.random_dates(rng, hist.year, month, n) + columnar.random_times(rng, n, hours=(8, 20))
+    channel = columnar.choice(rng, ACTIVATION_CHANNELS, n, ACTIVATION_CHANNEL_WEIGHTS)
+    status = columnar.choice(rng, ACTIVATION_STATUSES, n, ACTIVATION_STATUS_WEIGHTS)
+    completed = status == 'Completed'
+    time_to_activate = (columnar.uniform_by(rng, channel, ACTIVATION_HOURS, default=(4, 72))
+                        * hist.activation_factor)
+    activation_time = order_time + columnar.seconds(time_to_activate * 3600)
+    return pd.DataFrame({
+        'activation_id': columnar.uuid4_strings(rng, n),
+        'order_id': columnar.prefixed('ORD', hist.id_offset + ids, 6),
+        'subscriber_key': columnar.choice(rng, subscriber_keys(), n),
+        'sim_iccid': columnar.prefixed('8944', columnar.integers(rng, 10000000000000, 99999999999999, n)),
+        'order_timestamp': columnar.format_datetimes(order_time),
+        'activation_timestamp': columnar.optional(columnar.format_datetimes(activation_time), completed),
+        'activation_channel': channel,
+        'time_to_activate_hours': columnar.optional(np.round(time_to_activate, 2), completed),
+        'activation_status': status,
+        'activation_type': columnar.choice(rng, ACTIVATION_TYPES, n, ACTIVATION_TYPE_WEIGHTS),
+    })
+
+
+def roaming_usage_month(rng, hist, month, ids):
+    n = len(ids)
+    return pd.DataFrame({
+        'usage_id': ids,
+        'subscriber_key': columnar.choice(rng, subscriber_keys(), n),
+        'partner_key': columnar.choice(rng, dimension_keys('roaming_partner_dim', range(1, 101)), n),
+        'usage_date': columnar.format_dates(columnar.random_dates(rng, hist.year, month, n)),
+        'data_mb': np.round(columnar.uniform(rng, 10, 500, n), 2),
+        'voice_minutes': columnar.integers(rng, 0, 60, n),
+        'sms_count': columnar.integers(rng, 0, 20, n),
+        'wholesale_cost': np.round(columnar.uniform(rng, 1, 50, n), 2),
+        'retail_charge': np.round(columnar.uniform(rng, 2, 100, n), 2),
+    })
+
+
+def iot_usage_month(rng, hist, month, ids):
+    n = len(ids)
+    return pd.DataFrame({
+        'usage_id': ids,
+        'subscription_id': columnar.integers(rng, 1, 50000, n),
+        'usage_date': columnar.format_dates(columnar.random_dates(rng, hist.year, month, n)),
+        'data_mb': np.round(columnar.uniform(rng, 0.1, 100, n), 2),
+        'messages_sent': columnar.integers(rng, 0, 1000, n),
+        'messages_received': columnar.integers(rng, 0, 1000, n),
+        'api_calls': columnar.integers(rng, 0, 10000, n),
+    })
+
+
+# ---------------------------------------------------------------------------
+# CRM / Salesforce
+# ---------------------------------------------------------------------------
+
+CRM_TEAMS = ['Consumer', 'SMB', 'Enterprise', 'Partner']
+CRM_TERRITORIES = ['London', 'South East', 'South West', 'Midlands', 'North West', 'North East', 'Scotland', 'Wales']
+QUOTA_TYPES = ['Revenue', 'Units', 'New Business']
+REP_NAMES = [
+    'Daniel Jones', 'Sarah Smith', 'Michael Brown', 'Emma Wilson', 'James Taylor',
+    'Sophie Davies', 'Oliver Thomas', 'Charlotte Evans', 'William Roberts', 'Amelia Johnson',
+    'Harry Williams', 'Isla Thompson', 'George Jackson', 'Mia White', 'Jack Harris',
+    'Emily Martin', 'Charlie Clark', 'Ava Lewis', 'Thomas Walker', 'Grace Hall'
+]
+STAGES = ['Prospecting', 'Qualification', 'Proposal', 'Negotiation', 'Closed Won', 'Closed Lost']
+PIPELINE_PROBABILITY = {'Prospecting': 10, 'Qualification': 20, 'Proposal': 50, 'Negotiation': 75,
+                        'Closed Won': 100, 'Closed Lost': 0}
+OPPORTUNITY_PROBABILITY = {'Prospecting': 10, 'Qualification': 25, 'Proposal': 50, 'Negotiation': 75,
+                           'Closed Won': 100, 'Closed Lost': 0}
+COMPANY_SURNAMES = ['Smith', 'Jones', 'Williams', 'Brown', 'Taylor', 'Davies', 'Evans', 'Wilson', 'Thomas', 'Roberts']
+COMPANY_SUFFIXES = ['Ltd', 'Group', 'PLC', 'Solutions', 'Services', 'Associates', 'Partners', 'Holdings']
+PRODUCT_NAMES = ['Horizon Mobile', 'Cloud Connect', 'Unified Comms', 'SIP Trunks', 'SD-WAN', 'IoT Platform',
+                 'Cyber Security', '5G Enterprise']
+LEAD_SOURCES = ['Web', 'Partner Referral', 'Event', 'Cold Call', 'Inbound Call', 'Other']
+OPPORTUNITY_TYPES = ['New Customer', 'Existing Customer - Upgrade', 'Existing Customer - Replacement', 'Renewal']
+
+
+def quota_month(rng, hist, month, ids):
+    n = len(ids)
+    return pd.DataFrame({
+        'quota_id': columnar.prefixed('QTA', ids, 8),
+        'user_id': columnar.prefixed('USR', np.arange(1, n + 1), 6),
+        'rep_name': REP_NAMES,
+        'team': columnar.choice(rng, CRM_TEAMS, n),
+        'period_start': month_start_text(hist, month),
+        'period_end': month_end_text(hist, month),
+        'quota_amount': np.round(columnar.uniform(rng, 30000, 60000, n) * hist.multiplier, 2),
+        'quota_type': columnar.choice(rng, QUOTA_TYPES, n),
+        'territory': columnar.choice(rng, CRM_TERRITORIES, n),
+        'fiscal_year': hist.year,
+        'fiscal_quarter': (month - 1) // 3 + 1,
+    })
+
+
+def pipeline_snapshot_month(rng, hist, month, ids):
+    n = len(ids)
+    total_amount = columnar.uniform(rng, 2000000, 6000000, n) * hist.multiplier
+    probability = columnar.lookup(STAGES, PIPELINE_PROBABILITY).astype(float)
+    return pd.DataFrame({
+        'snapshot_id': columnar.prefixed('SNP', ids, 8),
+        'snapshot_date': f'{hist.year}-{month:02d}-02',
+        'stage_name': STAGES,
+        'opportunity_count': columnar.integers(rng, 50, 150, n),
+        'total_amount': np.round(total_amount, 2),
+        'weighted_amount': np.round(total_amount * (probability / 100), 2),
+        'avg_days_in_stage': columnar.integers(rng, 5, 60, n),
+    })
+
+
+def opportunity_month(rng, hist, month, ids):
+    n = len(ids)
+    created_date = columnar.random_dates(rng, hist.year, month, n)
+    stage = columnar.choice(rng, STAGES, n)
+    company_name = np.char.add(np.char.add(columnar.choice(rng, COMPANY_SURNAMES, n), ' '),
+                               columnar.choice(rng, COMPANY_SUFFIXES, n))
+    return pd.DataFrame({
+        'opportunity_id': columnar.prefixed('OPP', ids, 8),
+        'sale_id': columnar.optional(ids, stage == 'Closed Won'),
+        'account_id': columnar.prefixed('ACC', columnar.integers(rng, 1, 500, n), 6),
+        'opportunity_name': np.char.add(np.char.add(columnar.choice(rng, PRODUCT_NAMES, n), ' - '), company_name),
+        'stage_name': stage,
+        'amount': np.round(columnar.uniform(rng, 10000, 500000, n) * hist.multiplier, 2),
+        'probability': columnar.lookup(stage, OPPORTUNITY_PROBABILITY).astype(np.int64),
+        'close_date': columnar.format_dates(created_date + columnar.integers(rng, 30, 180, n).astype('timedelta64[D]')),
+        'created_date': columnar.format_dates(created_date),
+        'lead_source': columnar.choice(rng, LEAD_SOURCES, n),
+        'type': columnar.choice(rng, OPPORTUNITY_TYPES, n),
+        'campaign_id': columnar.optional(columnar.prefixed('CMP', columnar.integers(rng, 1, 50, n), 5),
+                                         columnar.chance(rng, 0.3, n)),
+    })
+
+
+FACT_TABLES = (
+    Table('invoice_fact', lambda hist, month: int(33000 * seasonal(hist, month)), invoice_month),
+    Table('payment_fact', lambda hist, month: int(31500 * seasonal(hist, month)), payment_month),
+    Table('mobile_usage_fact', lambda hist, month: min(33000, len(subscriber_keys())), mobile_usage_month),
+    Table('support_ticket_fact', lambda hist, month: int(16500 * (2 - seasonal(hist, month))),
+          support_ticket_month),
+    Table('network_performance_fact', lambda hist, month: int(hourly_element_counts(hist, month).sum()),
+          network_performance_month),
+    Table('contact_center_call_fact', lambda hist, month: int(83000 * (2 - seasonal(hist, month))),
+          contact_center_call_month),
+    Table('network_alarm_fact', lambda hist, month: int(42000 * hist.alarm_factor), network_alarm_month),
+    Table('it_incident_fact', lambda hist, month: int(8300 * hist.incident_factor), it_incident_month),
+    Table('sales_fact', lambda hist, month: int(4200 * seasonal(hist, month) * hist.multiplier), sales_month),
+    Table('finance_transactions', lambda hist, month: int(25000 * seasonal(hist, month) * hist.multiplier),
+          finance_transaction_month),
+    Table('marketing_campaign_fact', lambda hist, month: int(2500 * seasonal(hist, month) * hist.multiplier),
+          marketing_campaign_month),
+    Table('digital_interaction_fact', lambda hist, month: int(67000 * hist.multiplier), digital_interaction_month),
+    Table('loyalty_transaction_fact', lambda hist, month: int(33000 * seasonal(hist, month) * hist.multiplier),
+          loyalty_transaction_month),
+    Table('sim_activation_fact', lambda hist, month: int(5000 * seasonal(hist, month) * hist.multiplier),
+          sim_activation_month),
+    # Summer travel peak
+    Table('roaming_usage_fact', lambda hist, month: int(16500 * (1.5 if month in [6, 7, 8] else 1.0) * hist.multiplier),
+          roaming_usage_month),
+    Table('iot_usage_fact', lambda hist, month: int(16500 * hist.multiplier), iot_usage_month),
+    Table('sla_measurement_fact', lambda hist, month: int(33000 * hist.multiplier), sla_measurement_month),
+    Table('complaint_fact', lambda hist, month: int(4200 * hist.complaint_factor), complaint_month),
+    Table('order_line_fact', lambda hist, month: int(12500 * seasonal(hist, month) * hist.multiplier),
+          order_line_month),
+)
+
+# generate_crm_data.py also writes these for 2024-2026 with its own pipeline stages
+CRM_TABLES = (
+    Table('sf_quotas', lambda hist, month: len(REP_NAMES), quota_month),
+    Table('sf_pipeline_snapshot', lambda hist, month: len(STAGES), pipeline_snapshot_month),
+    Table('sf_opportunities', lambda hist, month: int(200 * hist.multiplier), opportunity_month),
+)
+
+TABLES = {table.name: table for table in FACT_TABLES + CRM_TABLES}
+
+
+def plan_shards(years, tables):
+    """
+    One (year, table, month, first_id, rows) shard per month of every table,
+    in output order. IDs run on across a table's months from the year's
+    ID offset, so every shard knows its IDs before any shard is built.
+    """
+    shards = []
+    for year in years:
+        hist = HistoryYear(year)
+        for name in tables:
+            table = TABLES[name]
+            next_id = hist.id_offset + 1
+            for month in range(1, 13):
+                rows = table.rows(hist, month)
+                shards.append((year, name, month, next_id, rows))
+                next_id += rows
+    return shards
+
+
+def render_shard(shard):
+    """Build one shard's rows and render them as CSV; returns (header, body bytes, rows)."""
+    year, name, month, first_id, rows = shard
+    rng = columnar.generator(year, name, month)
+    df = TABLES[name].build(rng, HistoryYear(year), month, np.arange(first_id, first_id + rows))
+    header, _, body = df.to_csv(index=False).partition('\n')
+    return header, body.encode('utf-8'), rows
+
+
+def save_shards(rendered, base_filename, output_path):
+    """
+    Write a table's rendered shards to CSV as they arrive, starting a new file
+    (between months) whenever the current one would pass 95MB.
+    """
+    os.makedirs(output_path, exist_ok=True)
+    max_bytes = MAX_FILE_SIZE_MB * 1024 * 1024
+
+    parts = []
+    f = None
+    size = 0
+    try:
+        for header, body, rows in rendered:
+            if f is None or (size and size + len(body) > max_bytes):
+                if f:
+                    f.close()
+                parts.append([os.path.join(output_path, f"{base_filename}_{len(parts) + 1}.csv"), 0])
+                f = open(parts[-1][0], 'wb')
+                f.write((header + '\n').encode('utf-8'))
+                size = 0
+            f.write(body)
+            size += len(body)
+            parts[-1][1] += rows
+    finally:
+        if f:
+            f.close()
+
+    # A table that fits in one file keeps the plain name
+    if len(parts) == 1:
+        filepath = os.path.join(output_path, f"{base_filename}.csv")
+        os.replace(parts[0][0], filepath)
+        parts[0][0] = filepath
+
+    for filepath, rows in parts:
+        print(f"  Created: {os.path.basename(filepath)} ({rows:,} rows)")
+    return [filepath for filepath, _ in parts]
+
+
+def render_in_order(shards, pool, window):
+    """
+    render_shard over ``shards`` on ``pool``, yielded in plan order. At most
+    ``window`` shards are submitted and not yet consumed, so finished CSV text
+    waiting for its turn never outgrows the window.
+    """
+    shards = iter(shards)
+    pending = collections.deque(pool.submit(render_shard, shard) for shard in itertools.islice(shards, window))
+    while pending:
+        result = pending.popleft().result()
+        # Refill before handing the result over, so workers keep busy while it is written
+        pending.extend(pool.submit(render_shard, shard) for shard in itertools.islice(shards, 1))
+        yield result
+
+
+def generate(years, tables=None, workers=None, output_root=OUTPUT_PATH):
+    """Generate ``tables`` (default: all) for every year, with ``workers`` processes (default: all cores)."""
+    tables = list(tables or TABLES)
+    shards = plan_shards(years, tables)
+    workers = workers or os.cpu_count() or 1
+
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        # Results come back in plan order: twelve months of one table after another
+        results = render_in_order(shards, pool, 2 * workers) if pool else map(render_shard, shards)
+        for year in years:
+            output_path = HistoryYear(year).output_path(output_root)
+            for name in tables:
+                print(f"\nGenerating {name}_{year}...")
+                save_shards(itertools.islice(results, 12), f"{name}_{year}", output_path)
+    finally:
+        if pool:
+            pool.shutdown(cancel_futures=True)
+
+
+def parse_years(values):
+    """'2024', '2022-2025' -> sorted list of years."""
+    years = set()
+    for value in values:
+        first, _, last = value.partition('-')
+        years.update(range(int(first), int(last or first) + 1))
+    return sorted(years)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--years', nargs='+', required=True, help='years or ranges, e.g. 2024 or 2022-2025')
+    parser.add_argument('--tables', nargs='+', choices=sorted(TABLES), metavar='TABLE',
+                        help='only generate these tables (default: all)')
+    parser.add_argument('--workers', type=int, help='worker processes (default: one per CPU)')
+    parser.add_argument('--output', default=OUTPUT_PATH, help='root directory; files go to <output>/<year>/csv')
+    args = parser.parse_args(argv)
+
+    try:
+        years = parse_years(args.years)
+        for year in years:
+            HistoryYear(year)
+    except ValueError as e:
+        parser.error(str(e))
+
+    print("=" * 60)
+    print("SnowTelco Historical Data Generator")
+    print("=" * 60)
+    print(f"\nYears: {', '.join(str(year) for year in years)}")
+    print(f"Output directory: {os.path.abspath(args.output)}")
+    print(f"Workers: {args.workers or os.cpu_count()}")
+    print(f"Max file size: {MAX_FILE_SIZE_MB} MB")
+    for year in years:
+        hist = HistoryYear(year)
+        print(f"  {year}: ID offset {hist.id_offset:,}, year multiplier {hist.multiplier}")
+
+    start_time = datetime.now()
+    generate(years, args.tables, args.workers, os.path.abspath(args.output))
+    elapsed = datetime.now() - start_time
+
+    print("\n" + "=" * 60)
+    print("GENERATION COMPLETE")
+    print("=" * 60)
+    print(f"Time elapsed: {elapsed}")
+    for year in years:
+        output_path = HistoryYear(year).output_path(os.path.abspath(args.output))
+        csv_files = [f for f in os.listdir(output_path) if f.endswith('.csv')]
+        total_size = sum(os.path.getsize(os.path.join(output_path, f)) for f in csv_files)
+        print(f"  {output_path}: {len(csv_files)} CSV files, {total_size / (1024*1024):.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -26,6 +26,8 @@ import os
 import uuid
 from pathlib import Path
 
+import date_remap
+
 # Set random seed for reproducibility
 np.random.seed(42)
 random.seed(42)
@@ -61,19 +63,12 @@ def shift_dates_to_2026(df, date_col, target_start=None, target_end=None):
     if target_end is None:
         target_end = TARGET_END_DATE
     
-    df[date_col] = pd.to_datetime(df[date_col])
-    old_min = df[date_col].min()
-    old_max = df[date_col].max()
-    old_range = (old_max - old_min).days
-    target_range = (target_end - target_start).days
-    
-    if old_range == 0:
-        old_range = 1  # Avoid division by zero
+    dates = pd.to_datetime(df[date_col])
+    old_min = dates.min()
+    old_max = dates.max()
     
-    # Scale dates proportionally to fit in target range
-    df[date_col] = df[date_col].apply(
-        lambda x: target_start + timedelta(days=int((x - old_min).days * target_range / old_range))
-    )
+    # Scale whole days proportionally to fit in target range
+    df[date_col] = date_remap.scale_range(dates.to_numpy(), target_start, target_end, unit='D')
     
     print(f"  Shifted dates from {old_min.date()}-{old_max.date()} to {target_start.date()}-{target_end.date()}")
     return df
@@ -88,30 +83,41 @@ def shift_datetime_to_2026(df, datetime_col, target_start=None, target_end=None)
     if target_end is None:
         target_end = TARGET_END_DATE
     
-    df[datetime_col] = pd.to_datetime(df[datetime_col])
-    old_min = df[datetime_col].min()
-    old_max = df[datetime_col].max()
-    old_range = (old_max - old_min).total_seconds()
-    target_range = (target_end - target_start).total_seconds()
-    
-    if old_range == 0:
-        old_range = 1
+    datetimes = pd.to_datetime(df[datetime_col]).to_numpy()
+    old_min = pd.Timestamp(np.nanmin(datetimes))
     
-    def shift_dt(x):
-        offset_ratio = (x - old_min).total_seconds() / old_range
-        new_dt = target_start + timedelta(seconds=offset_ratio * target_range)
-        # Preserve original time of day
-        return new_dt.replace(hour=x.hour, minute=x.minute, second=x.second)
-    
-    df[datetime_col] = df[datetime_col].apply(shift_dt)
+    # Scale proportionally to pick the day, then restore the original time of day
+    scaled = date_remap.scale_range(datetimes, target_start, target_end, unit='s')
+    df[datetime_col] = date_remap.with_time_of_day(scaled, datetimes)
     print(f"  Shifted datetimes from {old_min.date()} to {target_start.date()}-{target_end.date()}")
     return df
 
 
+def daily_record_counts(daily_records, n_days, max_records):
+    """
+    Records to add on each of n_days: daily_records +/-20%, at least 1 and at
+    most max_records (the template pool).
+    """
+    counts = (daily_records * np.random.uniform(0.8, 1.2, n_days)).astype(int)
+    return np.clip(counts, 1, max_records)
+
+
+def sample_templates(df, n_records):
+    """
+    Draw n_records template rows from df with replacement, in one call.
+    Returns a fresh frame (keeping df's dtypes) whose columns can be
+    overwritten with whole arrays.
+    """
+    positions = np.random.randint(0, len(df), n_records)
+    return df.iloc[positions].reset_index(drop=True)
+
+
 def extend_date_data(df, date_col, end_date, id_col=None, start_id=None, 
                      preserve_existing=True, daily_records=None):
     """
     Extend a dataframe by adding new records up to end_date.
+    Templates for the whole new range are drawn at once; dates and IDs are
+    assigned as arrays.
     """
     df[date_col] = pd.to_datetime(df[date_col])
     current_end = df[date_col].max()
@@ -133,34 +139,26 @@ def extend_date_data(df, date_col, end_date, id_col=None, start_id=None,
         total_days = (current_end - df[date_col].min()).days + 1
         daily_records = max(1, len(df) // total_days)
     
-    # Sample existing records to use as templates
-    new_records = []
-    next_id = df[id_col].max() + 1 if id_col else None
+    counts = daily_record_counts(daily_records, len(new_dates), len(df))
+    new_df = sample_templates(df, int(counts.sum()))
+    new_df[date_col] = np.repeat(new_dates.values, counts)
+    if id_col:
+        next_id = df[id_col].max() + 1
+        new_df[id_col] = np.arange(next_id, next_id + len(new_df))
     
-    for date in new_dates:
-        # Sample template records
-        n_records = max(1, int(daily_records * np.random.uniform(0.8, 1.2)))
-        templates = df.sample(n=min(n_records, len(df)), replace=True)
-        
-        for _, template in templates.iterrows():
-            record = template.copy()
-            record[date_col] = date
-            if id_col:
-                record[id_col] = next_id
-                next_id += 1
-            new_records.append(record)
-    
-    new_df = pd.DataFrame(new_records)
     result = pd.concat([df, new_df], ignore_index=True)
     result = result.sort_values(date_col).reset_index(drop=True)
     
-    print(f"  Added {len(new_records)} records, total now {len(result)}")
+    print(f"  Added {len(new_df)} records, total now {len(result)}")
     return result
 
 
 def extend_month_data(df, month_col, end_month, id_col=None, subscriber_col=None):
     """
     Extend monthly data (YYYY-MM format) to end_month.
+    Each new month repeats a random 70-90% of subscribers, each from one of
+    their own rows with +/-10% on the numeric columns. Rows are grouped by
+    subscriber once, so picking the templates is array indexing.
     """
     # Parse month format
     df_months = pd.to_datetime(df[month_col], format='%Y-%m')
@@ -180,50 +178,56 @@ def extend_month_data(df, month_col, end_month, id_col=None, subscriber_col=None
     if len(new_months) == 0:
         return df
     
-    # Get unique subscribers
-    subscribers = df[subscriber_col].unique() if subscriber_col else [None]
-    
-    new_records = []
+    # Group rows by subscriber once: the rows of subscriber i are
+    # order[starts[i]:starts[i] + sizes[i]]
+    if subscriber_col:
+        codes, subscribers = pd.factorize(df[subscriber_col])
+    else:
+        codes, subscribers = np.zeros(len(df), dtype=np.intp), [None]
+    order = np.argsort(codes, kind='stable')
+    order = order[codes[order] >= 0]
+    sizes = np.bincount(codes[codes >= 0], minlength=len(subscribers))
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]])
+    
+    # Numeric columns get +/-10% jitter (not the key columns, not booleans)
+    jitter_cols = [col for col in df.columns
+                   if col not in [id_col, month_col, subscriber_col]
+                   and pd.api.types.is_numeric_dtype(df[col]) and not pd.api.types.is_bool_dtype(df[col])]
+    
+    new_frames = []
     next_id = df[id_col].max() + 1 if id_col else None
     
     for month in new_months:
         month_str = month.strftime('%Y-%m')
         # Sample some subscribers for this month
         n_subs = int(len(subscribers) * np.random.uniform(0.7, 0.9))
-        selected_subs = np.random.choice(subscribers, size=n_subs, replace=False)
+        selected = np.random.choice(len(subscribers), size=n_subs, replace=False)
         
-        for sub in selected_subs:
-            # Get a template for this subscriber
-            if subscriber_col:
-                sub_data = df[df[subscriber_col] == sub]
-                if len(sub_data) == 0:
-                    continue
-                template = sub_data.sample(1).iloc[0].copy()
-            else:
-                template = df.sample(1).iloc[0].copy()
-            
-            template[month_col] = month_str
-            if id_col:
-                template[id_col] = next_id
-                next_id += 1
-            
-            # Slight variations in numeric columns
-            for col in template.index:
-                if col not in [id_col, month_col, subscriber_col] and pd.api.types.is_numeric_dtype(type(template[col])):
-                    if not pd.isna(template[col]):
-                        template[col] = template[col] * np.random.uniform(0.9, 1.1)
-            
-            new_records.append(template)
+        # One random template row per selected subscriber
+        picks = (np.random.random(n_subs) * sizes[selected]).astype(np.intp)
+        month_df = df.iloc[order[starts[selected] + picks]].reset_index(drop=True)
+        
+        month_df[month_col] = month_str
+        if id_col:
+            month_df[id_col] = np.arange(next_id, next_id + n_subs)
+            next_id += n_subs
+        
+        # Slight variations in numeric columns (NaN stays NaN)
+        if jitter_cols:
+            month_df[jitter_cols] = month_df[jitter_cols].astype(float) * np.random.uniform(0.9, 1.1, (n_subs, len(jitter_cols)))
+        
+        new_frames.append(month_df)
     
-    new_df = pd.DataFrame(new_records)
+    new_df = pd.concat(new_frames, ignore_index=True)
     result = pd.concat([df, new_df], ignore_index=True)
-    print(f"  Added {len(new_records)} records, total now {len(result)}")
+    print(f"  Added {len(new_df)} records, total now {len(result)}")
     return result
 
 
 def extend_datetime_data(df, datetime_col, end_date, id_col=None, daily_records=None):
     """
     Extend datetime data to end_date.
+    Like extend_date_data, with a random time of day for every new record.
     """
     df[datetime_col] = pd.to_datetime(df[datetime_col])
     current_end = df[datetime_col].max()
@@ -244,31 +248,19 @@ def extend_datetime_data(df, datetime_col, end_date, id_col=None, daily_records=
         total_days = (current_end.date() - df[datetime_col].min().date()).days + 1
         daily_records = max(1, len(df) // total_days)
     
-    new_records = []
-    next_id = df[id_col].max() + 1 if id_col else None
+    counts = daily_record_counts(daily_records, len(new_dates), len(df))
+    new_df = sample_templates(df, int(counts.sum()))
+    # Random time of day (whole seconds) on each record's day
+    seconds = np.random.randint(0, 24 * 60 * 60, len(new_df))
+    new_df[datetime_col] = np.repeat(new_dates.values, counts) + seconds.astype('timedelta64[s]')
+    if id_col:
+        next_id = df[id_col].max() + 1
+        new_df[id_col] = np.arange(next_id, next_id + len(new_df))
     
-    for date in new_dates:
-        n_records = max(1, int(daily_records * np.random.uniform(0.8, 1.2)))
-        templates = df.sample(n=min(n_records, len(df)), replace=True)
-        
-        for _, template in templates.iterrows():
-            record = template.copy()
-            # Generate random time
-            hour = np.random.randint(0, 24)
-            minute = np.random.randint(0, 60)
-            second = np.random.randint(0, 60)
-            record[datetime_col] = datetime.combine(date.date(), 
-                                                     datetime.min.time().replace(hour=hour, minute=minute, second=second))
-            if id_col:
-                record[id_col] = next_id
-                next_id += 1
-            new_records.append(record)
-    
-    new_df = pd.DataFrame(new_records)
     result = pd.concat([df, new_df], ignore_index=True)
     result = result.sort_values(datetime_col).reset_index(drop=True)
     
-    print(f"  Added {len(new_records)} records, total now {len(result)}")
+    print(f"  Added {len(new_df)} records, total now {len(result)}")
     return result
 
 
@@ -923,9 +915,9 @@ def extend_contact_center_calls():
         new_records_mask = result['call_id'] > max_id
         if new_records_mask.any():
             new_times = pd.to_datetime(result.loc[new_records_mask, 'start_time'])
-            result.loc[new_records_mask, 'call_recording_url'] = new_times.apply(
-                lambda x: f"s3://recordings/{x.year}/{x.month:02d}/{x.day:02d}/{np.random.randint(100000, 999999)}.wav"
-            )
+            recording_ids = np.random.randint(100000, 999999, size=len(new_times))
+            result.loc[new_records_mask, 'call_recording_url'] = ('s3://recordings/' + new_times.dt.strftime('%Y/%m/%d')
+                                                                  + '/' + recording_ids.astype(str) + '.wav')
         
         result.to_csv(file_path, index=False)
 
@@ -1426,10 +1418,8 @@ def fix_contact_center_dates():
         df['end_time'] = pd.to_datetime(df['start_time']) + pd.to_timedelta(df['handle_time_secs'], unit='s')
         
         # Update call recording URLs
-        df['call_recording_url'] = df.apply(
-            lambda x: f"s3://recordings/{pd.to_datetime(x['start_time']).year}/{pd.to_datetime(x['start_time']).month:02d}/{pd.to_datetime(x['start_time']).day:02d}/{x['call_id']}.wav",
-            axis=1
-        )
+        df['call_recording_url'] = ('s3://recordings/' + pd.to_datetime(df['start_time']).dt.strftime('%Y/%m/%d')
+                                    + '/' + df['call_id'].astype(str) + '.wav')
         
         # Add FCR columns (Phase 3.2)
         # 72% FCR rate target
@@ -1437,11 +1427,11 @@ def fix_contact_center_dates():
         escalated_dispositions = ['Escalated', 'Callback', 'Transfer', 'Voicemail']
         
         # FCR based on disposition and transfer count
-        df['is_first_call_resolved'] = df.apply(
-            lambda x: True if x['disposition'] in resolved_dispositions and x['transfer_count'] == 0
-                      else (False if x['disposition'] in escalated_dispositions or x['transfer_count'] > 1
-                            else np.random.random() < 0.72),
-            axis=1
+        df['is_first_call_resolved'] = np.select(
+            [df['disposition'].isin(resolved_dispositions) & (df['transfer_count'] == 0),
+             df['disposition'].isin(escalated_dispositions) | (df['transfer_count'] > 1)],
+            [True, False],
+            default=np.random.random(len(df)) < 0.72
         )
         
         df['callback_required'] = df['disposition'].isin(['Callback', 'Callback Scheduled', 'Follow-up Required'])